@@ -43,15 +43,18 @@ from backend.routes.admin import settings as admin_settings_routes
 from backend.routes.admin import instructors
 from backend.routes.admin import board_approval
 from backend.routes.webhooks import beehiiv
+from backend.routes.webhooks import strapi as strapi_webhooks
 from backend.middleware.metrics_middleware import MetricsMiddleware, get_request_id
 from backend.middleware.security_headers import SecurityHeadersMiddleware
 from backend.middleware.csrf import CSRFMiddleware
+from backend.middleware.document_cache import DocumentCacheScopeMiddleware
 from backend.observability.metrics import (
     get_metrics_handler,
     set_app_info,
     get_metrics_summary,
 )
 from backend.observability import init_sentry, capture_exception
+from backend.services.email_template_service import get_email_template_service
 import logging
 import sentry_sdk
 
@@ -125,6 +128,9 @@ if settings.CSRF_PROTECTION_ENABLED:
 # Add metrics middleware for request ID tracking and custom metrics
 app.add_middleware(MetricsMiddleware)
 
+# Fetch each cached ZeroDB document at most once per request
+app.add_middleware(DocumentCacheScopeMiddleware)
+
 # Initialize Prometheus instrumentation
 # This auto-instruments all endpoints with basic metrics
 instrumentator = Instrumentator(
@@ -257,6 +263,7 @@ app.include_router(security.router)
 app.include_router(privacy.router)
 app.include_router(resources.router)  # Training resources for students
 app.include_router(beehiiv.router)
+app.include_router(strapi_webhooks.router)  # Blog cache invalidation
 app.include_router(search_analytics.router)
 app.include_router(indexing.router)
 app.include_router(training_analytics.router)
@@ -326,6 +333,9 @@ async def startup_event():
     set_app_info(version="1.0.0", environment=settings.PYTHON_ENV)
     logger.info("Application metrics configured successfully")
 
+    # Compile email templates before the first send
+    get_email_template_service()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
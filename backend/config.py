@@ -138,6 +138,11 @@ class Settings(BaseSettings):
         description="Strapi API token for authentication (optional for public content)"
     )
 
+    STRAPI_WEBHOOK_SECRET: str = Field(
+        default="",
+        description="Secret Strapi sends as 'Authorization: Bearer <secret>' on cache webhooks (optional)"
+    )
+
     # ==========================================
     # BeeHiiv Blog Integration Configuration (Legacy)
     # ==========================================
@@ -214,6 +219,16 @@ class Settings(BaseSettings):
         description="Cloudflare Calls API token (uses CLOUDFLARE_API_TOKEN if not set)"
     )
 
+    CLOUDFLARE_STREAM_SIGNING_KEY_ID: str = Field(
+        default="",
+        description="Cloudflare Stream signing key ID for local playback token signing (optional)"
+    )
+
+    CLOUDFLARE_STREAM_SIGNING_KEY: str = Field(
+        default="",
+        description="Cloudflare Stream signing key PEM, raw or base64 as returned by the keys API (optional)"
+    )
+
     # ==========================================
     # AINative AI Registry (REQUIRED)
     # ==========================================
@@ -611,7 +626,8 @@ class Settings(BaseSettings):
         """
         return {
             "strapi_url": self.STRAPI_URL,
-            "api_token": self.STRAPI_API_TOKEN
+            "api_token": self.STRAPI_API_TOKEN,
+            "webhook_secret": self.STRAPI_WEBHOOK_SECRET
         }
 
     def get_ai_registry_config(self) -> dict:
@@ -9,6 +9,7 @@ Modules:
 - permissions: Resource-level permission checks
 - error_tracking_middleware: Automatic error context tracking
 - metrics_middleware: Request metrics and monitoring
+- document_cache: Request-scoped ZeroDB document identity map
 
 Quick Start:
     from backend.middleware.auth_middleware import CurrentUser, RoleChecker
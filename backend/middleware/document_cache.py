@@ -0,0 +1,31 @@
+"""
+Document Cache Scope Middleware for FastAPI
+
+Opens a request-scoped identity map of the ZeroDB document cache for every
+HTTP request, so a document (the current user, an event, a subscription)
+is fetched at most once per request however many services ask for it.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.services.document_cache import document_cache_scope
+
+
+class DocumentCacheScopeMiddleware:
+    """
+    ASGI middleware wrapping each HTTP request in a document cache scope
+
+    Plain ASGI rather than BaseHTTPMiddleware, so the scope also covers
+    streaming responses and background tasks of the request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with document_cache_scope():
+            await self.app(scope, receive, send)
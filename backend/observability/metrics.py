@@ -7,12 +7,15 @@ including HTTP requests, database queries, external API calls, and cache operati
 Metrics exported:
 - http_request_duration_seconds: HTTP request latency by endpoint, method, status
 - http_requests_total: Total HTTP requests by endpoint, method, status
+- http_conditional_requests_total: Public GETs validated by ETag, by endpoint and result
 - zerodb_query_duration_seconds: ZeroDB query latency by collection, operation
 - zerodb_slow_queries_total: Count of slow ZeroDB queries (> 1 second)
+- zerodb_document_cache_requests_total: Document cache lookups by collection and result
 - external_api_duration_seconds: External API call latency by service, endpoint
 - cache_operations_total: Cache operations by operation type and result
 - cache_duration_seconds: Cache operation latency
 - background_job_duration_seconds: Background job execution time by job name
+- background_job_lag_seconds: Delay from a job run's due time to its start
 """
 
 import logging
@@ -55,6 +58,12 @@ http_requests_total = Counter(
     labelnames=["method", "endpoint", "status_code"],
 )
 
+http_conditional_requests_total = Counter(
+    name="http_conditional_requests_total",
+    documentation="Public GET requests validated against the content version",
+    labelnames=["endpoint", "result"],  # result: not_modified, modified, unversioned
+)
+
 # ==========================================
 # ZeroDB Query Metrics
 # ==========================================
@@ -78,6 +87,18 @@ zerodb_query_errors_total = Counter(
     labelnames=["collection", "operation", "error_type"],
 )
 
+zerodb_document_cache_requests_total = Counter(
+    name="zerodb_document_cache_requests_total",
+    documentation="ZeroDB document cache lookups",
+    labelnames=["collection", "result"],  # result: request_hit, hit, miss
+)
+
+zerodb_document_cache_invalidations_total = Counter(
+    name="zerodb_document_cache_invalidations_total",
+    documentation="ZeroDB documents invalidated in the document cache after a write",
+    labelnames=["collection"],
+)
+
 # ==========================================
 # External API Metrics
 # ==========================================
@@ -146,6 +167,46 @@ background_job_errors_total = Counter(
     labelnames=["job_name", "error_type"],
 )
 
+background_job_lag = Histogram(
+    name="background_job_lag_seconds",
+    documentation="Delay between a scheduled job run's due time and its start",
+    labelnames=["job_name"],
+    buckets=[0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0],
+)
+
+background_job_queue_depth = Gauge(
+    name="background_job_queue_depth",
+    documentation="Job runs waiting to start (queued or awaiting retry)",
+    labelnames=["job_name"],
+)
+
+background_job_retries_total = Counter(
+    name="background_job_retries_total",
+    documentation="Total failed job runs scheduled for a retry",
+    labelnames=["job_name"],
+)
+
+# ==========================================
+# WebSocket Fan-out Metrics
+# ==========================================
+
+websocket_connections = Gauge(
+    name="websocket_connections",
+    documentation="Number of WebSocket connections open on this node",
+)
+
+websocket_frames_total = Counter(
+    name="websocket_frames_total",
+    documentation="Total WebSocket frames queued for delivery",
+    labelnames=["origin"],  # origin: local, remote
+)
+
+websocket_evictions_total = Counter(
+    name="websocket_evictions_total",
+    documentation="Total WebSocket connections evicted as slow consumers",
+    labelnames=["reason"],  # reason: queue_full, send_timeout, send_error
+)
+
 # ==========================================
 # Application Health Metrics
 # ==========================================
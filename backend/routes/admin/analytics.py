@@ -4,10 +4,17 @@ Admin Analytics Routes for WWMAA Backend
 Provides real-time analytics data for the admin dashboard.
 All endpoints require admin authentication and implement caching for performance.
 
+Dashboard reads are served from incrementally maintained aggregates
+(see services/analytics_aggregates_service.py), falling back to a full
+recomputation from source collections when aggregates are not available.
+
 Endpoints:
 - GET /api/admin/analytics - Get comprehensive platform analytics
+- DELETE /api/admin/analytics/cache - Clear analytics cache
+- POST /api/admin/analytics/reconcile - Rebuild aggregates from source data
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -22,6 +29,10 @@ from backend.services.zerodb_service import (
     ZeroDBNotFoundError
 )
 from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.analytics_aggregates_service import (
+    get_analytics_aggregates_service,
+    AnalyticsAggregatesError
+)
 from backend.middleware.auth_middleware import get_current_user
 from backend.models.schemas import User, UserRole, SubscriptionStatus, PaymentStatus
 
@@ -37,6 +48,7 @@ router = APIRouter(
 # Cache configuration
 ANALYTICS_CACHE_KEY = "admin:analytics:dashboard"
 ANALYTICS_CACHE_TTL = 300  # 5 minutes in seconds
+ANALYTICS_STALE_TTL = 60  # Serve stale data up to 1 minute while refreshing
 
 
 # ============================================================================
@@ -314,8 +326,11 @@ async def get_analytics(
     - Pending applications (applications awaiting review)
     - Monthly metrics (events and revenue this month)
 
-    Results are cached for 5 minutes to ensure fast response times.
-    Use force_refresh=true to bypass cache and get fresh data.
+    Metrics are read from materialized aggregates maintained on write, so
+    the read cost is constant regardless of data volume. If aggregates have
+    not been built yet (or Redis is degraded), results are recomputed from
+    source and cached for 5 minutes. Use force_refresh=true to bypass both
+    and recompute from source.
 
     Args:
         force_refresh: If True, bypass cache and recalculate analytics
@@ -330,13 +345,33 @@ async def get_analytics(
     cache = get_cache_service()
 
     try:
-        # Try to get from cache unless force refresh
         if not force_refresh:
-            cached_data = cache.get(ANALYTICS_CACHE_KEY)
-            if cached_data:
+            # Materialized aggregates (O(1) read)
+            snapshot = get_analytics_aggregates_service().get_snapshot()
+            if snapshot:
+                return AnalyticsResponse(**snapshot)
+
+            # Fall back to the cached full computation. Concurrent misses
+            # share one computation and stale data is served while it refreshes.
+            computed = False
+
+            async def compute() -> Dict[str, Any]:
+                nonlocal computed
+                computed = True
+                logger.info("Calculating fresh analytics (cache miss)")
+                return await calculate_analytics()
+
+            analytics_data = await cache.aget_or_compute(
+                ANALYTICS_CACHE_KEY,
+                compute,
+                ttl=ANALYTICS_CACHE_TTL,
+                stale_ttl=ANALYTICS_STALE_TTL
+            )
+            if not computed:
                 logger.info("Returning cached analytics data")
-                cached_data["cached"] = True
-                return AnalyticsResponse(**cached_data)
+                # Copy: a single-flight hit shares the leader's result object
+                analytics_data = {**analytics_data, "cached": True}
+            return AnalyticsResponse(**analytics_data)
 
         # Calculate fresh analytics
         logger.info(f"Calculating fresh analytics (force_refresh={force_refresh})")
@@ -346,7 +381,7 @@ async def get_analytics(
         cache.set(
             key=ANALYTICS_CACHE_KEY,
             value=analytics_data,
-            expiration=ANALYTICS_CACHE_TTL
+            expiration=ANALYTICS_CACHE_TTL + ANALYTICS_STALE_TTL
         )
 
         return AnalyticsResponse(**analytics_data)
@@ -408,3 +443,48 @@ async def clear_analytics_cache(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to clear cache"
         )
+
+
+@router.post(
+    "/reconcile",
+    response_model=AnalyticsResponse,
+    summary="Reconcile Analytics Aggregates",
+    description="Rebuild the materialized analytics aggregates from source collections.",
+    responses={
+        403: {
+            "description": "Not authorized - admin role required"
+        },
+        503: {
+            "description": "Aggregates store unavailable"
+        }
+    }
+)
+async def reconcile_analytics(
+    current_user: User = Depends(require_admin)
+) -> AnalyticsResponse:
+    """
+    Rebuild analytics aggregates from source data.
+
+    The reconciliation job runs this periodically; this endpoint allows an
+    admin to trigger it immediately (e.g. after a bulk import).
+
+    Args:
+        current_user: Authenticated admin user (injected by dependency)
+
+    Returns:
+        AnalyticsResponse built from the rebuilt aggregates
+
+    Raises:
+        HTTPException: 403 if not admin, 503 if aggregates cannot be rebuilt
+    """
+    try:
+        # Reconciliation scans every source collection; keep it off the event loop
+        snapshot = await asyncio.to_thread(get_analytics_aggregates_service().reconcile)
+        logger.info(f"Analytics aggregates reconciled by admin: {current_user.email}")
+        return AnalyticsResponse(**snapshot)
+    except AnalyticsAggregatesError as e:
+        logger.error(f"Error reconciling analytics aggregates: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Analytics aggregates are unavailable"
+        )
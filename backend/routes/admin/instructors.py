@@ -7,7 +7,8 @@ Provides comprehensive instructor management for admin dashboard including:
 - Assign instructors to classes
 - List and filter instructors
 
-All endpoints require admin authentication.
+All endpoints require admin authentication. Listing is served from the
+people search index once it is loaded (see services/search_index.py).
 """
 
 import logging
@@ -24,6 +25,7 @@ from backend.services.zerodb_service import (
     ZeroDBNotFoundError
 )
 from backend.middleware.auth_middleware import get_current_user
+from backend.services.search_index import PEOPLE_INDEX, get_search_index, record_person
 from backend.models.schemas import User, UserRole, Profile, InstructorPerformance
 from backend.utils.validation import (
     validate_phone_number,
@@ -426,6 +428,7 @@ async def list_instructors(
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     discipline: Optional[str] = Query(None, description="Filter by discipline"),
+    search: Optional[str] = Query(None, description="Search by email, first name, or last name"),
     current_user: User = Depends(require_admin)
 ) -> InstructorListResponse:
     """
@@ -436,6 +439,7 @@ async def list_instructors(
         page_size: Number of items per page
         is_active: Filter by active status
         discipline: Filter by martial arts discipline
+        search: Search by email, first name, or last name
         current_user: Authenticated admin user
 
     Returns:
@@ -444,6 +448,24 @@ async def list_instructors(
     Raises:
         HTTPException: 403 if not admin, 500 if database error
     """
+    index = get_search_index(PEOPLE_INDEX)
+    if index.ready:
+        result = index.search(
+            search,
+            filters={"role": UserRole.INSTRUCTOR.value, "is_active": is_active, "disciplines": discipline},
+            offset=(page - 1) * page_size,
+            limit=page_size
+        )
+        return InstructorListResponse(
+            instructors=[
+                format_instructor_response(person["user"], person.get("profile") or {})
+                for person in index.payloads(result.ids)
+            ],
+            total=result.total,
+            page=page,
+            page_size=page_size
+        )
+
     db = get_zerodb_client()
 
     try:
@@ -475,6 +497,13 @@ async def list_instructors(
             if discipline and discipline not in profile.get("disciplines", []):
                 continue
 
+            # Apply search filter if specified
+            if search:
+                search_lower = search.lower()
+                searchable = (user.get("email"), profile.get("first_name"), profile.get("last_name"))
+                if not any(value and search_lower in value.lower() for value in searchable):
+                    continue
+
             instructor_responses.append(format_instructor_response(user, profile))
 
         # Pagination
@@ -615,6 +644,7 @@ async def create_instructor(
         # Get created user and profile for response
         user = db.get_document(collection="users", document_id=user_id)
         profile = db.get_document(collection="profiles", document_id=profile_id)
+        record_person(str(user_id), user, profile)
 
         return format_instructor_response(user, profile)
 
@@ -792,6 +822,7 @@ async def update_instructor(
         # Get updated documents
         updated_user = db.get_document(collection="users", document_id=UUID(instructor_id))
         updated_profile = db.get_document(collection="profiles", document_id=profile_id)
+        record_person(instructor_id, updated_user, updated_profile)
 
         return format_instructor_response(updated_user, updated_profile)
 
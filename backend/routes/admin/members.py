@@ -16,6 +16,9 @@ Security:
 - Input validation prevents SQL injection and XSS
 - Email uniqueness is enforced
 - Role changes are validated against allowed roles
+
+Listing and search are served from the people search index once it is
+loaded (see services/search_index.py); writes update the index.
 """
 
 import logging
@@ -28,6 +31,7 @@ from pydantic import BaseModel, Field, EmailStr, field_validator
 
 from backend.middleware.auth_middleware import RoleChecker, get_current_user
 from backend.models.schemas import User, UserRole, Profile
+from backend.services.search_index import PEOPLE_INDEX, get_search_index, record_person, remove_person
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError, ZeroDBNotFoundError
 from backend.utils.security import hash_password
 from backend.utils.validation import (
@@ -368,6 +372,8 @@ async def create_member(
             filter_query={"id": str(user_id)}
         )
 
+        record_person(str(user_id), created_user, created_profile)
+
         logger.info(f"Admin {current_user['email']} created new member: {member_data.email}")
 
         return format_member_response(created_user, created_profile)
@@ -509,6 +515,9 @@ async def update_member(
             filter_query={"user_id": member_id}
         )
 
+        if updated_user:
+            record_person(member_id, updated_user, updated_profile)
+
         logger.info(f"Admin {current_user['email']} updated member: {member_id}")
 
         return format_member_response(updated_user, updated_profile)
@@ -605,6 +614,8 @@ async def delete_member(
                 detail="Failed to delete member"
             )
 
+        remove_person(member_id)
+
         logger.info(f"Admin {current_user['email']} deleted member: {member_id}")
 
         return None  # 204 No Content
@@ -672,6 +683,21 @@ async def list_members(
         if is_active is not None:
             filter_query["is_active"] = is_active
 
+        # Serve from the search index: correct totals and ranking across pages,
+        # no per-row profile lookups
+        index = get_search_index(PEOPLE_INDEX)
+        if index.ready:
+            result = index.search(search, filters=filter_query, offset=offset, limit=limit)
+            return {
+                "members": [
+                    format_member_response(person["user"], person.get("profile"))
+                    for person in index.payloads(result.ids)
+                ],
+                "total": result.total,
+                "limit": limit,
+                "offset": offset
+            }
+
         # Get users with filtering
         users = get_zerodb_client().find_many(
             collection_name="users",
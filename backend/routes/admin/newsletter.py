@@ -20,7 +20,7 @@ from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 
-from services.beehiiv_service import BeeHiivService, BeeHiivAPIError
+from services.beehiiv_service import BeeHiivService, BeeHiivAPIError, get_beehiiv_rate_limiter
 from database.zerodb import ZeroDBClient
 from models.schemas import BeeHiivConfig, NewsletterSubscriber, UserRole
 from auth.dependencies import get_current_user, require_role
@@ -99,7 +99,8 @@ async def get_beehiiv_service(db: ZeroDBClient = Depends(get_db)) -> BeeHiivServ
     config = configs[0]
     return BeeHiivService(
         api_key=config.get("api_key"),
-        publication_id=config.get("publication_id")
+        publication_id=config.get("publication_id"),
+        rate_limiter=get_beehiiv_rate_limiter()
     )
 
 
@@ -6,7 +6,9 @@ organization information, email/SMTP settings, Stripe configuration, and
 membership tier definitions.
 
 All settings are stored in the admin_settings collection with sensitive
-values encrypted at rest.
+values encrypted at rest. Reads are served from a process-local snapshot
+holding the decrypted values, rebuilt when a write bumps the settings
+version (see services/settings_snapshot.py).
 """
 
 import logging
@@ -29,6 +31,7 @@ from backend.models.request_schemas import (
     EmailTestRequest,
     AdminSettingsResponse,
 )
+from backend.services.settings_snapshot import SettingsSnapshot, get_settings_snapshot_cache
 from backend.services.zerodb_service import ZeroDBClient
 from backend.utils.encryption import encrypt_value, decrypt_value
 from backend.middleware.auth_middleware import RoleChecker
@@ -83,6 +86,49 @@ async def get_or_create_settings(db: ZeroDBClient) -> AdminSettings:
         )
 
 
+async def get_settings_snapshot(db: ZeroDBClient) -> SettingsSnapshot:
+    """
+    Get the settings with their decrypted and masked forms
+
+    Served from the process-local snapshot; the database is only read and
+    the secrets only decrypted after the settings changed.
+
+    Args:
+        db: ZeroDB client instance
+
+    Returns:
+        SettingsSnapshot: Read-only settings snapshot
+    """
+    async def build() -> SettingsSnapshot:
+        settings = await get_or_create_settings(db)
+        return SettingsSnapshot(
+            settings=settings,
+            decrypted=decrypt_settings_for_response(settings),
+            masked=mask_settings_for_response(settings)
+        )
+
+    return await get_settings_snapshot_cache().get(build)
+
+
+def save_settings(db: ZeroDBClient, settings: AdminSettings) -> None:
+    """
+    Save the settings document and bump the settings version
+
+    Args:
+        db: ZeroDB client instance
+        settings: Updated settings
+    """
+    try:
+        db.update_document(
+            collection_name="admin_settings",
+            document_id=str(settings.id),
+            updates=settings.model_dump(mode='json')
+        )
+    finally:
+        # Also after a failure: the write may have been applied
+        get_settings_snapshot_cache().bump()
+
+
 def mask_sensitive_value(value: Optional[str], show_chars: int = 4) -> Optional[str]:
     """
     Mask a sensitive value showing only the last few characters
@@ -246,10 +292,9 @@ async def get_admin_settings(
         AdminSettingsResponse: Complete settings configuration
     """
     try:
-        settings = await get_or_create_settings(db)
-        decrypted_settings = decrypt_settings_for_response(settings)
+        snapshot = await get_settings_snapshot(db)
 
-        return AdminSettingsResponse(**decrypted_settings)
+        return AdminSettingsResponse(**snapshot.decrypted)
 
     except HTTPException:
         raise
@@ -277,8 +322,7 @@ async def get_email_settings(
         dict: Email configuration with masked sensitive fields
     """
     try:
-        settings = await get_or_create_settings(db)
-        masked_settings = mask_settings_for_response(settings)
+        masked_settings = (await get_settings_snapshot(db)).masked
 
         # Return only email-related fields
         email_settings = {
@@ -323,8 +367,7 @@ async def get_stripe_settings(
         dict: Stripe configuration with masked sensitive fields
     """
     try:
-        settings = await get_or_create_settings(db)
-        masked_settings = mask_settings_for_response(settings)
+        masked_settings = (await get_settings_snapshot(db)).masked
 
         # Return only Stripe-related fields
         stripe_settings = {
@@ -379,11 +422,7 @@ async def update_organization_settings(
         settings.last_modified_by = UUID(current_user['id'])
 
         # Save to database
-        db.update_document(
-            collection_name="admin_settings",
-            document_id=str(settings.id),
-            updates=settings.model_dump(mode='json')
-        )
+        save_settings(db, settings)
 
         logger.info(f"Updated organization settings by admin {current_user['email']}")
 
@@ -446,11 +485,7 @@ async def update_email_settings(
         settings.last_modified_by = UUID(current_user['id'])
 
         # Save to database
-        db.update_document(
-            collection_name="admin_settings",
-            document_id=str(settings.id),
-            updates=settings.model_dump(mode='json')
-        )
+        save_settings(db, settings)
 
         logger.info(f"Updated email settings by admin {current_user['email']}")
 
@@ -519,11 +554,7 @@ async def update_stripe_settings(
         settings.last_modified_by = UUID(current_user['id'])
 
         # Save to database
-        db.update_document(
-            collection_name="admin_settings",
-            document_id=str(settings.id),
-            updates=settings.model_dump(mode='json')
-        )
+        save_settings(db, settings)
 
         logger.info(f"Updated Stripe settings by admin {current_user['email']}")
 
@@ -585,11 +616,7 @@ async def update_membership_tiers(
         settings.last_modified_by = UUID(current_user['id'])
 
         # Save to database
-        db.update_document(
-            collection_name="admin_settings",
-            document_id=str(settings.id),
-            updates=settings.model_dump(mode='json')
-        )
+        save_settings(db, settings)
 
         logger.info(f"Updated membership tiers by admin {current_user['email']}")
 
@@ -699,11 +726,7 @@ async def send_test_email(
             settings.last_email_test_result = "success"
             settings.last_email_test_error = None
 
-            db.update_document(
-                collection_name="admin_settings",
-                document_id=str(settings.id),
-                updates=settings.model_dump(mode='json')
-            )
+            save_settings(db, settings)
 
             logger.info(f"Test email sent successfully to {test_request.test_email}")
 
@@ -722,11 +745,7 @@ async def send_test_email(
             settings.last_email_test_result = "failed"
             settings.last_email_test_error = error_msg
 
-            db.update_document(
-                collection_name="admin_settings",
-                document_id=str(settings.id),
-                updates=settings.model_dump(mode='json')
-            )
+            save_settings(db, settings)
 
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -742,11 +761,7 @@ async def send_test_email(
             settings.last_email_test_result = "failed"
             settings.last_email_test_error = error_msg
 
-            db.update_document(
-                collection_name="admin_settings",
-                document_id=str(settings.id),
-                updates=settings.model_dump(mode='json')
-            )
+            save_settings(db, settings)
 
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -762,11 +777,7 @@ async def send_test_email(
             settings.last_email_test_result = "failed"
             settings.last_email_test_error = error_msg
 
-            db.update_document(
-                collection_name="admin_settings",
-                document_id=str(settings.id),
-                updates=settings.model_dump(mode='json')
-            )
+            save_settings(db, settings)
 
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
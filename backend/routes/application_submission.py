@@ -37,6 +37,7 @@ from backend.services.zerodb_service import (
     ZeroDBError,
     ZeroDBNotFoundError
 )
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
 from backend.services.email_service import get_email_service, EmailSendError
 from backend.config import get_settings
 from backend.middleware.auth_middleware import get_optional_user, CurrentUser, RoleChecker
@@ -657,6 +658,7 @@ async def submit_application(
             data=application_data,
             document_id=application_id
         )
+        get_analytics_aggregates_service().record_application(application_id, application_data)
 
         logger.info(f"Application created successfully: {application_id}")
 
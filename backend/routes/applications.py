@@ -38,6 +38,7 @@ from backend.models.schemas import (
     ApprovalStatus,
     UserRole
 )
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
 from backend.services.zerodb_service import get_zerodb_client
 from backend.services.email_service import get_email_service
 import logging
@@ -309,6 +310,9 @@ async def auto_approve_application(application_id: UUID, approvals_count: int) -
                     "updated_at": datetime.utcnow().isoformat()
                 }
             )
+            get_analytics_aggregates_service().record_application(
+                str(application_id), {"status": ApplicationStatus.APPROVED.value}
+            )
 
             logger.info(f"Application {application_id} auto-approved with {approvals_count} approvals")
             return True
@@ -681,6 +685,9 @@ async def approve_application(
                     "updated_at": datetime.utcnow().isoformat()
                 }
             )
+            get_analytics_aggregates_service().record_application(
+                str(application_id), {"status": ApplicationStatus.UNDER_REVIEW.value}
+            )
 
         # Count total approvals
         approvals_count = await count_approvals(application_id)
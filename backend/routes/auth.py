@@ -18,6 +18,8 @@ from passlib.context import CryptContext
 
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBValidationError, ZeroDBError
 from backend.services.email_service import get_email_service, EmailSendError
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
+from backend.services.search_index import record_person
 from backend.services.auth_service import AuthService, TokenBlacklistedError, TokenInvalidError, TokenExpiredError, TokenReuseError
 from backend.config import settings, get_settings
 from backend.middleware.rate_limit import (
@@ -383,6 +385,8 @@ async def register(request: RegisterRequest) -> RegisterResponse:
         )
 
         logger.info(f"User created successfully with ID: {user_id}")
+        get_analytics_aggregates_service().record_user(user_id, user_data, created=True)
+        record_person(user_id, user_data)
 
         # Send verification email
         try:
@@ -14,18 +14,28 @@ Endpoints:
 - GET /api/blog/tags: List all tags
 
 Features:
-- Pagination and filtering
-- Category filtering
-- Redis caching (5-minute TTL)
+- Pagination and category/tag filtering pushed down to Strapi: only the
+  requested page is fetched, and each query shape is cached separately
+- Redis caching (5-minute TTL), invalidated by the Strapi webhook
+  (routes/webhooks/strapi.py)
 - Automatic fallback to sample data if Strapi is unavailable
 - Graceful error handling
+- ETag/304, Cache-Control and Surrogate-Key headers (see services/http_cache.py)
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
-
-from backend.services.strapi_service import get_strapi_service, StrapiError
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import Optional, List, Sequence
+
+from backend.services.http_cache import (
+    BLOG_CONTENT,
+    CachePolicy,
+    PUBLIC_DOCUMENT_POLICY,
+    PUBLIC_LIST_POLICY,
+    conditional_get,
+    uncacheable
+)
+from backend.services.strapi_service import get_strapi_service, StrapiError, StrapiService
 
 
 # Configure logging
@@ -37,12 +47,36 @@ router = APIRouter(
     tags=["blog"]
 )
 
+# Without the Strapi webhook, edits are only seen once the article cache
+# expires, so blog ETags change at least once per cache TTL
+BLOG_REFRESH_INTERVAL = StrapiService.CACHE_TTL
+
+
+def blog_not_modified(
+    request: Request,
+    response: Response,
+    surrogate_keys: Sequence[str] = (),
+    policy: CachePolicy = PUBLIC_LIST_POLICY
+) -> Optional[Response]:
+    """Validate a blog GET request (see conditional_get)"""
+    return conditional_get(
+        request,
+        response,
+        collections=[BLOG_CONTENT],
+        surrogate_keys=[BLOG_CONTENT, *surrogate_keys],
+        policy=policy,
+        refresh_interval=BLOG_REFRESH_INTERVAL
+    )
+
 
 @router.get("")
 async def get_blog_articles(
+    request: Request,
+    response: Response,
     limit: int = Query(10, ge=1, le=100, description="Number of articles to fetch"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    category: Optional[str] = Query(None, description="Filter by category")
+    category: Optional[str] = Query(None, description="Filter by category"),
+    tag: Optional[str] = Query(None, description="Filter by tag")
 ):
     """
     Get blog articles (simple endpoint for frontend)
@@ -54,35 +88,29 @@ async def get_blog_articles(
         limit: Maximum number of articles to return (default: 10, max: 100)
         offset: Pagination offset (default: 0)
         category: Filter by category (optional)
+        tag: Filter by tag (optional)
 
     Returns:
         List of article objects with id, title, url, excerpt, published_at, author, image_url, and category
     """
+    not_modified = blog_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
-        logger.info(f"Fetching blog articles: limit={limit}, offset={offset}, category={category}")
+        logger.info(f"Fetching blog articles: limit={limit}, offset={offset}, category={category}, tag={tag}")
 
         strapi = get_strapi_service()
 
-        # Fetch articles from Strapi (with caching)
-        articles = strapi.fetch_articles(
-            limit=limit + offset,  # Fetch more to handle offset
+        # Fetch the requested page from Strapi (with caching)
+        articles = strapi.fetch_article_page(
+            offset=offset,
+            limit=limit,
+            category=category,
+            tag=tag,
             sort="publishedAt:desc",
             use_cache=True
-        )
-
-        # Apply category filter if provided
-        if category:
-            articles = [
-                article for article in articles
-                if article.get('category', '').lower() == category.lower()
-            ]
-
-        # Apply pagination offset
-        if offset > 0:
-            articles = articles[offset:]
-
-        # Limit results
-        articles = articles[:limit]
+        ).articles
 
         # If no articles found, return sample data as fallback
         if not articles:
@@ -146,18 +174,23 @@ async def get_blog_articles(
     except StrapiError as e:
         logger.error(f"Strapi service error: {e}", exc_info=True)
         # Return empty array on Strapi error for graceful degradation
+        uncacheable(response)
         return []
     except Exception as e:
         logger.error(f"Unexpected error fetching blog articles: {e}", exc_info=True)
         # Return empty array on any error for graceful degradation
+        uncacheable(response)
         return []
 
 
 @router.get("/posts")
 async def list_blog_posts(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Posts per page"),
     category: Optional[str] = Query(None, description="Filter by category"),
+    tag: Optional[str] = Query(None, description="Filter by tag"),
     sort_by: str = Query("publishedAt", description="Sort field (publishedAt, title)"),
     sort_order: str = Query("desc", description="Sort order (asc/desc)")
 ):
@@ -170,14 +203,19 @@ async def list_blog_posts(
         page: Page number (starts at 1)
         limit: Posts per page (max 100)
         category: Filter by category
+        tag: Filter by tag
         sort_by: Sort field (publishedAt, title)
         sort_order: Sort order (asc, desc)
 
     Returns:
         Paginated list of blog posts with metadata
     """
+    not_modified = blog_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
-        logger.info(f"Listing blog posts: page={page}, limit={limit}, category={category}")
+        logger.info(f"Listing blog posts: page={page}, limit={limit}, category={category}, tag={tag}")
 
         strapi = get_strapi_service()
 
@@ -187,28 +225,16 @@ async def list_blog_posts(
         # Calculate offset
         offset = (page - 1) * limit
 
-        # Fetch articles from Strapi (fetch more for pagination)
-        # Since Strapi doesn't support offset directly, we fetch a larger batch
-        fetch_limit = min(offset + limit, 100)
-
-        articles = strapi.fetch_articles(
-            limit=fetch_limit,
+        # Fetch the requested page and the total count from Strapi
+        article_page = strapi.fetch_article_page(
+            offset=offset,
+            limit=limit,
+            category=category,
+            tag=tag,
             sort=strapi_sort,
             use_cache=True
         )
-
-        # Apply category filter if provided
-        if category:
-            articles = [
-                article for article in articles
-                if article.get('category', '').lower() == category.lower()
-            ]
-
-        # Get total count (before pagination)
-        total = len(articles)
-
-        # Apply pagination
-        paginated_articles = articles[offset:offset + limit]
+        total = article_page.total
 
         # Calculate pagination metadata
         total_pages = (total + limit - 1) // limit if total > 0 else 1
@@ -216,7 +242,7 @@ async def list_blog_posts(
         has_prev = page > 1
 
         return {
-            "data": paginated_articles,
+            "data": article_page.articles,
             "pagination": {
                 "page": page,
                 "limit": limit,
@@ -242,7 +268,7 @@ async def list_blog_posts(
 
 
 @router.get("/posts/{slug}")
-async def get_blog_post_by_slug(slug: str):
+async def get_blog_post_by_slug(slug: str, request: Request, response: Response):
     """
     Get a single blog post by slug
 
@@ -255,6 +281,15 @@ async def get_blog_post_by_slug(slug: str):
     Raises:
         HTTPException: If post not found
     """
+    not_modified = blog_not_modified(
+        request,
+        response,
+        surrogate_keys=[f"{BLOG_CONTENT}:article:{slug}"],
+        policy=PUBLIC_DOCUMENT_POLICY
+    )
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info(f"Fetching blog post by slug: {slug}")
 
@@ -288,7 +323,7 @@ async def get_blog_post_by_slug(slug: str):
 
 
 @router.get("/categories")
-async def list_blog_categories():
+async def list_blog_categories(request: Request, response: Response):
     """
     List all blog post categories
 
@@ -297,13 +332,17 @@ async def list_blog_categories():
     Returns:
         List of category objects with post counts
     """
+    not_modified = blog_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info("Fetching blog categories")
 
         strapi = get_strapi_service()
 
-        # Fetch all articles to extract categories
-        articles = strapi.fetch_articles(limit=100, use_cache=True)
+        # Fetch the categories of up to 100 articles
+        articles = strapi.fetch_article_page(limit=100, fields=("category",), use_cache=True).articles
 
         # Extract and count categories
         category_counts = {}
@@ -343,7 +382,7 @@ async def list_blog_categories():
 
 
 @router.get("/tags")
-async def list_blog_tags():
+async def list_blog_tags(request: Request, response: Response):
     """
     List all blog post tags
 
@@ -352,6 +391,10 @@ async def list_blog_tags():
     Returns:
         List of tag objects with post counts (empty for now as Strapi doesn't have tags field)
     """
+    not_modified = blog_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info("Fetching blog tags")
 
@@ -375,6 +418,8 @@ async def list_blog_tags():
 @router.get("/posts/by-category/{category}")
 async def get_posts_by_category(
     category: str,
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100)
 ):
@@ -390,9 +435,14 @@ async def get_posts_by_category(
         Paginated list of posts in category
     """
     return await list_blog_posts(
+        request=request,
+        response=response,
         page=page,
         limit=limit,
-        category=category
+        category=category,
+        tag=None,
+        sort_by="publishedAt",
+        sort_order="desc"
     )
 
 
@@ -12,13 +12,16 @@ Features:
 - Public endpoints (no authentication required)
 - Proper error handling and logging
 - Pydantic models for data validation
+- ETag/304 and long-lived Cache-Control headers (the data only changes on deploy)
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from backend.services.http_cache import STATIC_POLICY, conditional_get, static_version
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -113,8 +116,25 @@ CERTIFICATIONS_DATA = [
 ]
 
 
+# ETag version of the certification data
+CERTIFICATIONS_VERSION = static_version(CERTIFICATIONS_DATA)
+
+
+def certifications_not_modified(request: Request, response: Response) -> Optional[Response]:
+    """Validate a certifications GET request (see conditional_get)"""
+    return conditional_get(
+        request,
+        response,
+        surrogate_keys=["certifications"],
+        policy=STATIC_POLICY,
+        static=CERTIFICATIONS_VERSION
+    )
+
+
 @router.get("", response_model=CertificationListResponse)
 async def list_certifications(
+    request: Request,
+    response: Response,
     level: Optional[str] = Query(None, description="Filter by certification level (Beginner, Intermediate, Advanced)")
 ):
     """
@@ -129,6 +149,10 @@ async def list_certifications(
     Returns:
         List of certification objects with id, name, description, requirements, duration, and level
     """
+    not_modified = certifications_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info(f"Fetching certifications list: level={level}")
 
@@ -159,7 +183,7 @@ async def list_certifications(
 
 
 @router.get("/{certification_id}", response_model=Certification)
-async def get_certification_by_id(certification_id: str):
+async def get_certification_by_id(certification_id: str, request: Request, response: Response):
     """
     Get a single certification by ID
 
@@ -172,6 +196,10 @@ async def get_certification_by_id(certification_id: str):
     Raises:
         HTTPException: If certification not found (404)
     """
+    not_modified = certifications_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info(f"Fetching certification by ID: {certification_id}")
 
@@ -203,6 +231,8 @@ async def get_certification_by_id(certification_id: str):
 
 @router.get("/search/by-name")
 async def search_certifications_by_name(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)")
 ):
     """
@@ -216,6 +246,10 @@ async def search_certifications_by_name(
     Returns:
         List of matching certifications
     """
+    not_modified = certifications_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info(f"Searching certifications by name: query='{q}'")
 
@@ -243,7 +277,7 @@ async def search_certifications_by_name(
 
 
 @router.get("/levels/list")
-async def list_certification_levels():
+async def list_certification_levels(request: Request, response: Response):
     """
     List all available certification levels
 
@@ -252,6 +286,10 @@ async def list_certification_levels():
     Returns:
         List of certification levels with counts
     """
+    not_modified = certifications_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         logger.info("Fetching certification levels")
 
@@ -66,6 +66,17 @@ class BulkEmailResponse(BaseModel):
     failed: int
     total: int
     errors: list
+    batch_id: Optional[str] = None
+
+
+class BulkEmailStatusResponse(BaseModel):
+    """Response model for bulk email delivery progress"""
+    batch_id: str
+    total: int
+    queued: int
+    sent: int
+    failed: int
+    created_at: Optional[str] = None
 
 
 class CheckInResponse(BaseModel):
@@ -227,9 +238,13 @@ async def send_bulk_email(
     - message: Email body (HTML supported)
     - status_filter: Optional filter (confirmed, waitlist, etc.)
 
+    Messages are queued and delivered in the background; poll the
+    returned batch_id for delivery progress.
+
     Returns:
-    - Send statistics (sent, failed, total)
+    - Send statistics (sent = accepted for delivery, failed, total)
     - List of errors (if any)
+    - batch_id for delivery status
     """
     try:
         logger.info(f"Sending bulk email for event {event_id} by user {current_user['email']}")
@@ -258,6 +273,42 @@ async def send_bulk_email(
         )
 
 
+@router.get(
+    "/{event_id}/attendees/bulk-email/{batch_id}",
+    response_model=BulkEmailStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Bulk Email Delivery Status (Admin)",
+    description="Get delivery progress of a queued bulk email"
+)
+async def get_bulk_email_status(
+    event_id: UUID,
+    batch_id: str,
+    current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.BOARD_MEMBER]))
+):
+    """
+    Get bulk email delivery progress (Admin/Board Member only)
+
+    Returns:
+    - Counts of queued, sent and failed messages in the batch
+    """
+    try:
+        result = get_attendee_service().get_bulk_email_status(batch_id)
+    except Exception as e:
+        logger.error(f"Unexpected error getting bulk email status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bulk email batch not found"
+        )
+
+    return result
+
+
 @router.post(
     "/{event_id}/attendees/{rsvp_id}/check-in",
     response_model=CheckInResponse,
@@ -11,6 +11,7 @@ Handles all event RSVP operations including:
 US-032: Event RSVP System
 """
 
+import asyncio
 import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status, Depends, Path
@@ -18,6 +19,7 @@ from pydantic import BaseModel, Field, EmailStr
 
 from backend.services.rsvp_service import (
     get_rsvp_service,
+    WAITLIST_ROLE_PRIORITY,
     RSVPServiceError,
     EventFullError,
     DuplicateRSVPError,
@@ -98,6 +100,7 @@ class RSVPStatusResponse(BaseModel):
     event_full: Optional[bool] = Field(None, description="Event is full")
     waitlist_available: Optional[bool] = Field(None, description="Waitlist available")
     available_spots: Optional[int] = Field(None, description="Available spots")
+    waitlist_position: Optional[int] = Field(None, description="Position on the waitlist (1 = next)")
 
 
 class AddToWaitlistRequest(BaseModel):
@@ -111,6 +114,7 @@ class AddToWaitlistResponse(BaseModel):
     """Response model for waitlist addition"""
     rsvp_id: str = Field(..., description="Waitlist entry UUID")
     status: str = Field(..., description="Status (waitlist)")
+    waitlist_position: Optional[int] = Field(None, description="Position on the waitlist (1 = next)")
     message: str = Field(..., description="Success message")
 
 
@@ -135,13 +139,11 @@ async def create_free_event_rsvp(
 
     Flow:
     1. Verify user is authenticated (members only)
-    2. Check for duplicate RSVP
-    3. Check event capacity
-    4. Create RSVP with confirmed status
-    5. Update event attendee count
-    6. Generate QR code for check-in
-    7. Send confirmation email
-    8. Return RSVP details
+    2. Reserve a seat atomically (duplicate and capacity check)
+    3. Queue the confirmed RSVP for persistence
+    4. Generate QR code for check-in
+    5. Send confirmation email
+    6. Return RSVP details
 
     Args:
         event_id: Event UUID
@@ -160,7 +162,9 @@ async def create_free_event_rsvp(
         user_id = current_user.get("user_id")
         rsvp_service = get_rsvp_service()
 
-        result = rsvp_service.create_free_event_rsvp(
+        # Off the event loop: the QR code and confirmation email are blocking
+        result = await asyncio.to_thread(
+            rsvp_service.create_free_event_rsvp,
             event_id=event_id,
             user_id=user_id,
             user_name=request.user_name,
@@ -435,9 +439,9 @@ async def add_to_waitlist(
     Flow:
     1. Verify waitlist is enabled for event
     2. Check for duplicate entry
-    3. Create waitlist RSVP entry
+    3. Queue the entry by role priority, then join time
     4. Send waitlist confirmation email
-    5. Return waitlist entry details
+    5. Return waitlist entry details and position
 
     Args:
         event_id: Event UUID
@@ -461,7 +465,8 @@ async def add_to_waitlist(
             user_id=user_id,
             user_name=request.user_name,
             user_email=request.user_email,
-            user_phone=request.user_phone
+            user_phone=request.user_phone,
+            priority=WAITLIST_ROLE_PRIORITY.get(current_user.get("role"), 0)
         )
 
         logger.info(f"Added user {user_id} to waitlist for event {event_id}")
@@ -12,8 +12,14 @@ Provides RESTful API endpoints for event management (Admin only):
 - GET /api/events/deleted/list - List deleted events (archive)
 - POST /api/events/:id/restore - Restore deleted event
 - POST /api/events/upload-image - Upload event image to ZeroDB Object Storage
+
+Public reads (GET /api/events/public, /api/events/public/:id) carry ETag,
+Cache-Control and Surrogate-Key headers and answer If-None-Match with 304
+(see services/http_cache.py).
 """
 
+import hashlib
+import json
 import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -27,13 +33,28 @@ from fastapi import (
     status,
     Depends,
     Query,
+    Request,
+    Response,
     UploadFile,
     File,
     Form
 )
 from pydantic import BaseModel, Field, field_validator, HttpUrl
 
-from backend.services.event_service import get_event_service, EventService
+from backend.services.event_service import (
+    get_event_service,
+    EventService,
+    EVENTS_CACHE_NAMESPACE,
+    PUBLIC_EVENTS_CACHE_TTL,
+    event_cache_tag
+)
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import (
+    EVENTS_CONTENT,
+    PUBLIC_DOCUMENT_POLICY,
+    PUBLIC_LIST_POLICY,
+    conditional_get
+)
 from backend.services.training_session_service import get_training_session_service, TrainingSessionService
 from backend.services.zerodb_service import (
     ZeroDBError,
@@ -177,6 +198,8 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
 
 @router.get("/public", response_model=EventListResponse)
 async def list_public_events(
+    request: Request,
+    response: Response,
     event_type: Optional[EventType] = Query(None, alias="type", description="Filter by event type"),
     location: Optional[str] = Query(None, description="Filter by location type (in_person, online)"),
     price: Optional[str] = Query(None, description="Filter by price (free, paid)"),
@@ -242,14 +265,38 @@ async def list_public_events(
         # Map sort field
         sort_field = "start_date" if sort == "date" else "price"
 
-        # Query events
-        result = event_service.list_events(
-            filters=filters,
-            limit=limit,
-            offset=offset,
-            include_deleted=False,
-            sort_by=sort_field,
-            sort_order=order
+        not_modified = conditional_get(
+            request,
+            response,
+            collections=[EVENTS_CONTENT],
+            surrogate_keys=[EVENTS_CONTENT],
+            policy=PUBLIC_LIST_POLICY
+        )
+        if not_modified is not None:
+            return not_modified
+
+        # Query events (cached per filter set; each page is tagged with the
+        # events it contains so per-event changes invalidate it)
+        query_hash = hashlib.md5(
+            json.dumps([filters, sort_field, order, limit, offset], sort_keys=True).encode()
+        ).hexdigest()
+        cache = get_cache_service()
+        result = cache.get_or_compute(
+            cache.versioned_key(EVENTS_CACHE_NAMESPACE, f"public:list:{query_hash}"),
+            lambda: event_service.list_events(
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                include_deleted=False,
+                sort_by=sort_field,
+                sort_order=order
+            ),
+            ttl=PUBLIC_EVENTS_CACHE_TTL,
+            tags=lambda page: [
+                event_cache_tag(event["id"])
+                for event in page.get("documents", [])
+                if event.get("id")
+            ]
         )
 
         # Check if there are more events
@@ -399,6 +446,8 @@ async def create_event(
 @router.get("/public/{event_id}")
 async def get_public_event(
     event_id: str,
+    request: Request,
+    response: Response,
     event_service: EventService = Depends(get_event_service),
     session_service: TrainingSessionService = Depends(get_training_session_service)
 ):
@@ -408,15 +457,12 @@ async def get_public_event(
     Returns event details for published, public events only.
     Includes associated training sessions if any.
     """
-    try:
+    def load_event() -> Optional[Dict[str, Any]]:
         event = event_service.get_event(event_id)
 
-        # Verify it's a published, public event
+        # Only published, public events are served (and cached)
         if event.get("status") != EventStatus.PUBLISHED.value or event.get("visibility") != EventVisibility.PUBLIC.value:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Event not found"
-            )
+            return None
 
         # Include training sessions for this event
         try:
@@ -431,6 +477,33 @@ async def get_public_event(
 
         return event
 
+    not_modified = conditional_get(
+        request,
+        response,
+        collections=[EVENTS_CONTENT],
+        surrogate_keys=[EVENTS_CONTENT, event_cache_tag(event_id)],
+        policy=PUBLIC_DOCUMENT_POLICY
+    )
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        cache = get_cache_service()
+        event = cache.get_or_compute(
+            cache.versioned_key(EVENTS_CACHE_NAMESPACE, f"public:event:{event_id}"),
+            load_event,
+            ttl=PUBLIC_EVENTS_CACHE_TTL,
+            tags=[event_cache_tag(event_id)]
+        )
+
+        if event is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+
+        return event
+
     except ZeroDBNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -14,6 +14,7 @@ Provides RESTful API endpoints for media asset management:
 - POST /api/media/upload-chunked/finalize - Finalize chunked upload
 """
 
+import asyncio
 import logging
 import tempfile
 import os
@@ -39,6 +40,13 @@ from backend.services.upload_service import UploadService
 from backend.services.cloudflare_stream_service import CloudflareStreamError
 from backend.services.zerodb_service import ZeroDBError
 from backend.middleware.auth_middleware import get_current_user
+from backend.utils.file_upload import (
+    MAX_DOCUMENT_SIZE,
+    MAX_IMAGE_SIZE,
+    MAX_VIDEO_SIZE,
+    StreamingUploadValidator,
+    copy_upload_to_file
+)
 from backend.models.schemas import User, UserRole, MediaType, SubscriptionTier
 
 # Import enums from temporary extension
@@ -52,6 +60,13 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/media", tags=["media"])
 
+# Size limit per media type for direct uploads (larger files use chunked upload)
+MAX_UPLOAD_SIZES = {
+    MediaType.IMAGE: MAX_IMAGE_SIZE,
+    MediaType.VIDEO: MAX_VIDEO_SIZE,
+    MediaType.DOCUMENT: MAX_DOCUMENT_SIZE,
+}
+
 
 # ============================================================================
 # Request/Response Models
@@ -170,13 +185,20 @@ async def upload_media(
         # Parse tags
         tag_list = [t.strip() for t in tags.split(",")] if tags else []
 
-        # Save uploaded file to temp
+        # Copy the upload to a temp file chunk by chunk, validating size and
+        # content on the way (never holding the whole file in memory)
+        validator = StreamingUploadValidator(
+            max_size=MAX_UPLOAD_SIZES.get(media_type_enum, MAX_VIDEO_SIZE),
+            content_type=file.content_type
+        )
         with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
             temp_file_path = temp_file.name
+            is_valid, error_message = await copy_upload_to_file(file, temp_file, validator)
 
         try:
+            if not is_valid:
+                raise ValueError(error_message)
+
             # Create media asset
             asset = await media_service.create_media_asset(
                 file_path=temp_file_path,
@@ -237,6 +259,8 @@ async def list_media(
     entity_id: Optional[str] = Query(None, description="Filter by entity ID"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    include_access_urls: bool = Query(False, description="Include signed playback URLs for ready videos"),
+    expiry_seconds: int = Query(86400, ge=300, le=604800, description="Playback URL expiry in seconds (5min - 7days)"),
     current_user: User = Depends(get_current_user),
     media_service: MediaService = Depends(get_media_service)
 ):
@@ -250,6 +274,8 @@ async def list_media(
     - entity_id: Filter by entity ID
     - limit: Maximum results (1-100)
     - offset: Pagination offset
+    - include_access_urls: Add signed playback URLs, minted in one batch
+    - expiry_seconds: Playback URL expiry when include_access_urls is set
 
     **Response:**
     - 200: List of media assets
@@ -278,6 +304,9 @@ async def list_media(
             offset=offset
         )
 
+        if include_access_urls:
+            assets = await asyncio.to_thread(media_service.attach_access_urls, assets, expiry_seconds)
+
         return {
             "total": len(assets),  # Note: This is not the total count, just returned count
             "items": assets,
@@ -467,7 +496,7 @@ async def get_access_url(
         # Get user tier (simplified)
         user_tier = SubscriptionTier.BASIC if current_user.role == UserRole.MEMBER else SubscriptionTier.PREMIUM
 
-        access_url = await media_service.generate_access_url(
+        access_url = await media_service.get_access_url(
             asset_id=asset_id,
             user_id=current_user.id,
             user_role=current_user.role,
@@ -475,10 +504,11 @@ async def get_access_url(
             expiry_seconds=expiry_seconds
         )
 
+        # Signed URLs are reused across viewers, so report the actual expiry
         return {
             "asset_id": str(asset_id),
-            "access_url": access_url,
-            "expires_in": expiry_seconds
+            "access_url": access_url.url,
+            "expires_in": access_url.expires_in
         }
 
     except PermissionError as e:
@@ -607,7 +637,9 @@ async def initiate_chunked_upload(
     try:
         upload_service = UploadService()
 
-        session = upload_service.initiate_upload(
+        # Preallocating a multi-GB file can take a moment; keep it off the event loop
+        session = await asyncio.to_thread(
+            upload_service.initiate_upload,
             file_name=request.file_name,
             file_size=request.file_size,
             user_id=str(current_user.id),
@@ -666,7 +698,9 @@ async def upload_chunk(
 
         chunk_data = await chunk.read()
 
-        progress = upload_service.upload_chunk(
+        # Write and hash off the event loop so parallel chunk uploads overlap
+        progress = await asyncio.to_thread(
+            upload_service.upload_chunk,
             upload_id=upload_id,
             chunk_index=chunk_index,
             chunk_data=chunk_data
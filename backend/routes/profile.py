@@ -17,6 +17,7 @@ from backend.services.zerodb_service import (
     ZeroDBNotFoundError,
     ZeroDBError
 )
+from backend.services.search_index import record_person
 from backend.middleware.auth_middleware import CurrentUser
 from backend.models.request_schemas import (
     ProfileUpdateRequest,
@@ -335,6 +336,7 @@ async def update_user_profile(
                 document_id=user_id
             )
             user_data = user_doc.get("data", {})
+            profile_data = None
 
             # Try to get profile data
             try:
@@ -344,12 +346,14 @@ async def update_user_profile(
                 )
                 profile_data = profile_doc.get("data", {})
 
-                # Merge profile data into user data
-                user_data.update(profile_data)
-
             except ZeroDBNotFoundError:
                 logger.debug(f"Profile not found for user {user_id} after update")
 
+            record_person(user_id, user_data, profile_data)
+
+            # Merge profile data into user data
+            user_data.update(profile_data or {})
+
             # Build response
             first_name = user_data.get("first_name", "")
             last_name = user_data.get("last_name", "")
@@ -13,17 +13,30 @@ Endpoints:
 - POST /api/resources/upload - Upload a resource file (admin/instructor only)
 - POST /api/resources/{resource_id}/track-view - Track resource view
 - POST /api/resources/{resource_id}/track-download - Track resource download
+
+Listing and search are served from the resources search index once it is
+loaded (see services/search_index.py); create/update/delete update the
+index. View/download counters in listed rows lag until the next edit or
+index rebuild.
+
+The resource list carries a private ETag (per role) and answers
+If-None-Match with 304 (see services/http_cache.py).
 """
 
+import hashlib
+import json
 import logging
 from datetime import datetime
 from typing import Optional, List
 from uuid import uuid4, UUID
 
-from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query, Request, Response
 from pydantic import BaseModel, Field, HttpUrl
 
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError, ZeroDBValidationError
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import PRIVATE_POLICY, RESOURCES_CONTENT, bump_content_version, conditional_get
+from backend.services.search_index import RESOURCES_INDEX, get_search_index, record_resource, remove_resource
 from backend.middleware.auth_middleware import CurrentUser, RoleChecker
 from backend.models.schemas import (
     ResourceCategory,
@@ -45,6 +58,17 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/resources", tags=["resources"])
 
+# Resource list query caching. Create/update/delete bump the namespace;
+# view/download counters are allowed to lag by up to the TTL.
+RESOURCES_CACHE_NAMESPACE = "resources"
+RESOURCES_CACHE_TTL = 60  # seconds
+
+
+def invalidate_resources_cache() -> None:
+    """Invalidate all cached resource queries (O(1) namespace bump) and their ETags"""
+    get_cache_service().bump_namespace(RESOURCES_CACHE_NAMESPACE)
+    bump_content_version(RESOURCES_CONTENT)
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -138,6 +162,16 @@ class FileUploadResponse(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _resource_search_text(resource: dict) -> str:
+    """Lower-cased text searched when the search index is not loaded"""
+    return " ".join([
+        resource.get("title") or "",
+        resource.get("description") or "",
+        " ".join(resource.get("tags") or []),
+        resource.get("discipline") or "",
+    ]).lower()
+
+
 def can_access_resource(user_role: str, resource_visibility: str) -> bool:
     """
     Check if user role can access resource based on visibility
@@ -234,11 +268,14 @@ def format_resource_response(resource_doc: dict) -> ResourceResponse:
     description="Get all resources that the current user can access (filtered by role and visibility)"
 )
 async def list_resources(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(CurrentUser()),
     category: Optional[ResourceCategory] = Query(None, description="Filter by category"),
     status_filter: Optional[ResourceStatus] = Query(None, alias="status", description="Filter by status"),
     featured_only: bool = Query(False, description="Show only featured resources"),
     discipline: Optional[str] = Query(None, description="Filter by discipline"),
+    search: Optional[str] = Query(None, description="Search title, description, tags and discipline"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
 ) -> ResourceListResponse:
@@ -256,6 +293,17 @@ async def list_resources(
     db_client = get_zerodb_client()
     user_role = current_user["role"]
 
+    # Visibility depends on the role only, so clients of one role share ETags
+    not_modified = conditional_get(
+        request,
+        response,
+        collections=[RESOURCES_CONTENT],
+        policy=PRIVATE_POLICY,
+        vary=[str(getattr(user_role, "value", user_role))]
+    )
+    if not_modified is not None:
+        return not_modified
+
     try:
         # Build filters
         filters = {}
@@ -281,13 +329,45 @@ async def list_resources(
             # Students can only see published resources
             filters["status"] = ResourceStatus.PUBLISHED.value
 
+        # Serve from the search index: visibility is filtered inside the index,
+        # so totals and pages are exact
+        index = get_search_index(RESOURCES_INDEX)
+        if index.ready:
+            result = index.search(
+                search,
+                filters={
+                    **filters,
+                    "visibility": [
+                        visibility.value for visibility in ResourceVisibility
+                        if can_access_resource(user_role, visibility.value)
+                    ],
+                },
+                offset=(page - 1) * page_size,
+                limit=page_size
+            )
+            return ResourceListResponse(
+                resources=[format_resource_response(doc) for doc in index.payloads(result.ids)],
+                total=result.total,
+                page=page,
+                page_size=page_size
+            )
+
         logger.info(f"Fetching resources with filters: {filters}")
 
-        # Query resources from ZeroDB
-        result = db_client.query_documents(
-            collection="resources",
-            filters=filters,
-            limit=page_size * 10,  # Get more to filter by visibility
+        # Query resources from ZeroDB (cached per filter set, shared across users)
+        query_limit = page_size * 10  # Get more to filter by visibility
+        query_hash = hashlib.md5(
+            json.dumps([filters, query_limit], sort_keys=True).encode()
+        ).hexdigest()
+        cache = get_cache_service()
+        result = cache.get_or_compute(
+            cache.versioned_key(RESOURCES_CACHE_NAMESPACE, f"query:{query_hash}"),
+            lambda: db_client.query_documents(
+                collection="resources",
+                filters=filters,
+                limit=query_limit,
+            ),
+            ttl=RESOURCES_CACHE_TTL
         )
 
         all_resources = result.get("documents", [])
@@ -299,6 +379,13 @@ async def list_resources(
             if can_access_resource(user_role, resource_visibility):
                 accessible_resources.append(resource_doc)
 
+        if search:
+            terms = search.lower().split()
+            accessible_resources = [
+                doc for doc in accessible_resources
+                if all(term in _resource_search_text(doc.get("data", {})) for term in terms)
+            ]
+
         # Sort by display_order, then by created_at (desc)
         accessible_resources.sort(
             key=lambda x: (
@@ -490,6 +577,7 @@ async def create_resource(
         )
 
         logger.info(f"Resource created successfully: {resource_id}")
+        invalidate_resources_cache()
 
         # Fetch and return the created resource
         result = db_client.query_documents(
@@ -499,6 +587,7 @@ async def create_resource(
         )
 
         resource_doc = result.get("documents", [])[0]
+        record_resource(resource_doc.get("id", resource_id), resource_doc.get("data", {}))
         return format_resource_response(resource_doc)
 
     except HTTPException:
@@ -620,6 +709,7 @@ async def update_resource(
         )
 
         logger.info(f"Resource updated successfully: {resource_id}")
+        invalidate_resources_cache()
 
         # Fetch and return updated resource
         result = db_client.query_documents(
@@ -629,6 +719,7 @@ async def update_resource(
         )
 
         resource_doc = result.get("documents", [])[0]
+        record_resource(resource_doc.get("id", resource_id), resource_doc.get("data", {}))
         return format_resource_response(resource_doc)
 
     except HTTPException:
@@ -691,6 +782,8 @@ async def delete_resource(
         )
 
         logger.info(f"Resource deleted successfully: {resource_id}")
+        invalidate_resources_cache()
+        remove_resource(resource_id)
 
     except HTTPException:
         raise
@@ -9,7 +9,10 @@ Webhook Endpoint: POST /api/webhooks/stripe
 Security:
 - Signature verification using stripe.Webhook.construct_event()
 - Idempotent processing (duplicate events are detected and rejected)
-- Fast response times (< 5 seconds) to avoid Stripe retries
+- Fast acknowledgement: verified events are queued on the WebhookQueue
+  (processed in order per customer by scripts/webhook_worker.py) and
+  acknowledged in milliseconds; events are processed inline only if the
+  queue is unavailable
 - Comprehensive logging and error handling
 
 Supported Events:
@@ -29,9 +32,11 @@ from typing import Optional
 from backend.config import settings
 from backend.services.webhook_service import (
     get_webhook_service,
+    stripe_ordering_key,
     DuplicateEventError,
     WebhookProcessingError
 )
+from backend.services.webhook_queue import get_webhook_queue, WebhookQueueError
 
 # Configure Stripe
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -54,8 +59,8 @@ async def stripe_webhook(
     """
     Stripe webhook endpoint
 
-    Receives and processes Stripe webhook events with signature verification.
-    Responds quickly (< 5 seconds) to avoid Stripe retries.
+    Verifies Stripe webhook events and queues them for processing,
+    responding within milliseconds to avoid Stripe retries.
 
     Args:
         request: FastAPI request object containing raw body
@@ -67,8 +72,6 @@ async def stripe_webhook(
     Raises:
         HTTPException: For signature verification failures or processing errors
     """
-    webhook_service = get_webhook_service()
-
     # Get raw request body for signature verification
     try:
         payload = await request.body()
@@ -117,11 +120,35 @@ async def stripe_webhook(
     event_type = event.type
     event_data = event.to_dict()
 
+    # Queue the event and acknowledge it at once
+    try:
+        queued = get_webhook_queue().enqueue(
+            source="stripe",
+            event_id=event_id,
+            event_type=event_type,
+            payload=event_data,
+            ordering_key=stripe_ordering_key(event_data)
+        )
+    except WebhookQueueError as e:
+        logger.warning(f"Webhook queue unavailable, processing event {event_id} inline: {e}")
+    else:
+        if not queued:
+            return {
+                "status": "duplicate",
+                "event_id": event_id,
+                "message": "Event already processed"
+            }
+        return {
+            "status": "queued",
+            "event_id": event_id,
+            "event_type": event_type
+        }
+
     logger.info(f"Processing webhook event: {event_type} (ID: {event_id})")
 
     # Process webhook event
     try:
-        result = webhook_service.process_webhook_event(
+        result = get_webhook_service().process_webhook_event(
             event_id=event_id,
             event_type=event_type,
             event_data=event_data
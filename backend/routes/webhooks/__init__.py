@@ -4,8 +4,10 @@ Webhook Routes Package
 This package contains webhook endpoint implementations for external services:
 - Stripe payment webhooks
 - Cloudflare Calls recording webhooks
+- Strapi content webhooks (blog cache invalidation)
 """
 
 from . import cloudflare
+from . import strapi
 
-__all__ = ["cloudflare"]
+__all__ = ["cloudflare", "strapi"]
@@ -9,7 +9,9 @@ Webhook Endpoint: POST /api/webhooks/beehiiv/post
 Security:
 - Signature verification using HMAC SHA256
 - Idempotent processing (duplicate events are detected)
-- Fast response times (< 5 seconds)
+- Fast acknowledgement: verified events are queued on the WebhookQueue
+  (processed in order per post by scripts/webhook_worker.py); events are
+  processed inline only if the queue is unavailable
 - Comprehensive logging and error handling
 
 Supported Events:
@@ -18,14 +20,20 @@ Supported Events:
 - post.deleted: Post deleted (soft delete/archive)
 """
 
+import hashlib
 import logging
 from fastapi import APIRouter, Request, HTTPException, Header
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from backend.services.blog_sync_service import (
     get_blog_sync_service,
     BlogSyncError
 )
+from backend.services.webhook_queue import (
+    get_webhook_queue,
+    WebhookEvent,
+    WebhookQueueError
+)
 
 
 # Configure logging
@@ -38,6 +46,105 @@ router = APIRouter(
 )
 
 
+def process_post_event(event_type: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a BeeHiiv post event to the blog.
+
+    Args:
+        event_type: post.published, post.updated or post.deleted
+        event_data: Post data from the webhook
+
+    Returns:
+        Response describing the outcome
+
+    Raises:
+        BlogSyncError: If syncing the post fails
+    """
+    blog_sync_service = get_blog_sync_service()
+    post_id = event_data.get('id')
+
+    if event_type == "post.published":
+        # New post published
+        article = blog_sync_service.sync_post(event_data)
+
+        logger.info(f"Post published: {article.id} (BeeHiiv ID: {post_id})")
+
+        return {
+            "status": "success",
+            "event_type": event_type,
+            "post_id": post_id,
+            "article_id": str(article.id),
+            "message": "Post synced successfully"
+        }
+
+    elif event_type == "post.updated":
+        # Post updated
+        article = blog_sync_service.sync_post(event_data)
+
+        logger.info(f"Post updated: {article.id} (BeeHiiv ID: {post_id})")
+
+        return {
+            "status": "success",
+            "event_type": event_type,
+            "post_id": post_id,
+            "article_id": str(article.id),
+            "message": "Post updated successfully"
+        }
+
+    elif event_type == "post.deleted":
+        # Post deleted - archive it
+        existing_article = blog_sync_service._get_article_by_beehiiv_id(post_id)
+
+        if existing_article:
+            blog_sync_service.delete_post(existing_article.id)
+
+            logger.info(f"Post archived: {existing_article.id} (BeeHiiv ID: {post_id})")
+
+            return {
+                "status": "success",
+                "event_type": event_type,
+                "post_id": post_id,
+                "article_id": str(existing_article.id),
+                "message": "Post archived successfully"
+            }
+        else:
+            logger.warning(f"Post to delete not found: {post_id}")
+
+            return {
+                "status": "not_found",
+                "event_type": event_type,
+                "post_id": post_id,
+                "message": "Post not found in database"
+            }
+
+    else:
+        # Unsupported event type
+        logger.warning(f"Unsupported BeeHiiv event type: {event_type}")
+
+        return {
+            "status": "ignored",
+            "event_type": event_type,
+            "post_id": post_id,
+            "message": "Event type not supported"
+        }
+
+
+def handle_queued_event(event: WebhookEvent) -> Dict[str, Any]:
+    """
+    WebhookQueue handler for BeeHiiv post events.
+
+    Args:
+        event: Queued BeeHiiv event
+
+    Returns:
+        Processing result
+
+    Raises:
+        BlogSyncError: If syncing the post fails (the queue retries it)
+    """
+    return process_post_event(event.event_type, event.payload)
+
+
 @router.post("/post")
 async def beehiiv_post_webhook(
     request: Request,
@@ -120,74 +227,32 @@ async def beehiiv_post_webhook(
             detail="Missing post ID"
         )
 
+    # Queue the event and acknowledge it at once; BeeHiiv events without
+    # an ID are identified by their body digest
+    event_id = str(webhook_data.get('uid') or webhook_data.get('id') or hashlib.sha256(payload).hexdigest()[:32])
+    try:
+        queued = get_webhook_queue().enqueue(
+            source="beehiiv",
+            event_id=event_id,
+            event_type=event_type,
+            payload=event_data,
+            ordering_key=str(post_id)
+        )
+    except WebhookQueueError as e:
+        logger.warning(f"Webhook queue unavailable, processing BeeHiiv event inline: {e}")
+    else:
+        return {
+            "status": "queued" if queued else "duplicate",
+            "event_type": event_type,
+            "post_id": post_id,
+            "event_id": event_id
+        }
+
     logger.info(f"Processing BeeHiiv webhook: {event_type} for post {post_id}")
 
     # Process webhook event based on type
     try:
-        if event_type == "post.published":
-            # New post published
-            article = blog_sync_service.sync_post(event_data)
-
-            logger.info(f"Post published: {article.id} (BeeHiiv ID: {post_id})")
-
-            return {
-                "status": "success",
-                "event_type": event_type,
-                "post_id": post_id,
-                "article_id": str(article.id),
-                "message": "Post synced successfully"
-            }
-
-        elif event_type == "post.updated":
-            # Post updated
-            article = blog_sync_service.sync_post(event_data)
-
-            logger.info(f"Post updated: {article.id} (BeeHiiv ID: {post_id})")
-
-            return {
-                "status": "success",
-                "event_type": event_type,
-                "post_id": post_id,
-                "article_id": str(article.id),
-                "message": "Post updated successfully"
-            }
-
-        elif event_type == "post.deleted":
-            # Post deleted - archive it
-            existing_article = blog_sync_service._get_article_by_beehiiv_id(post_id)
-
-            if existing_article:
-                blog_sync_service.delete_post(existing_article.id)
-
-                logger.info(f"Post archived: {existing_article.id} (BeeHiiv ID: {post_id})")
-
-                return {
-                    "status": "success",
-                    "event_type": event_type,
-                    "post_id": post_id,
-                    "article_id": str(existing_article.id),
-                    "message": "Post archived successfully"
-                }
-            else:
-                logger.warning(f"Post to delete not found: {post_id}")
-
-                return {
-                    "status": "not_found",
-                    "event_type": event_type,
-                    "post_id": post_id,
-                    "message": "Post not found in database"
-                }
-
-        else:
-            # Unsupported event type
-            logger.warning(f"Unsupported BeeHiiv event type: {event_type}")
-
-            return {
-                "status": "ignored",
-                "event_type": event_type,
-                "post_id": post_id,
-                "message": "Event type not supported"
-            }
+        return process_post_event(event_type, event_data)
 
     except BlogSyncError as e:
         # Processing error - log but return 200 OK to prevent retries
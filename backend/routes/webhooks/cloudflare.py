@@ -14,7 +14,10 @@ Webhook Endpoints:
 Security:
 - Signature verification using HMAC SHA-256
 - Timestamp validation to prevent replay attacks
-- Fast response times (< 5 seconds)
+- Fast acknowledgement: verified events are queued on the WebhookQueue
+  (processed in order per room/video by scripts/webhook_worker.py), with
+  redeliveries of the same body acknowledged as duplicates; events are
+  processed inline only if the queue is unavailable
 - Comprehensive logging and error handling
 
 Supported Events:
@@ -38,6 +41,11 @@ from uuid import UUID
 
 from backend.config import settings
 from backend.services.zerodb_service import get_zerodb_client
+from backend.services.webhook_queue import (
+    get_webhook_queue,
+    WebhookEvent,
+    WebhookQueueError
+)
 from backend.models.cloudflare_schemas import (
     WebhookRecordingReadyEvent,
     RecordingStatus,
@@ -116,6 +124,119 @@ def verify_cloudflare_signature(
         )
 
 
+def queue_cloudflare_event(
+    source: str,
+    payload: bytes,
+    payload_json: dict,
+    event_type: Optional[str],
+    ordering_key: Optional[str]
+) -> Optional[dict]:
+    """
+    Queue a verified Cloudflare event for the webhook workers.
+
+    Cloudflare events carry no ID, so the body digest identifies them.
+
+    Args:
+        source: Webhook queue source ("cloudflare_recording" or "cloudflare_stream")
+        payload: Raw webhook payload bytes
+        payload_json: Parsed payload
+        event_type: Event type (or video state)
+        ordering_key: Room or video the event belongs to
+
+    Returns:
+        Response to acknowledge with, or None if the queue is unavailable
+    """
+    event_id = hashlib.sha256(payload).hexdigest()[:32]
+    try:
+        queued = get_webhook_queue().enqueue(
+            source=source,
+            event_id=event_id,
+            event_type=event_type or "",
+            payload=payload_json,
+            ordering_key=ordering_key
+        )
+    except WebhookQueueError as e:
+        logger.warning(f"Webhook queue unavailable, processing Cloudflare event inline: {e}")
+        return None
+
+    return {
+        "status": "queued" if queued else "duplicate",
+        "event_type": event_type,
+        "event_id": event_id
+    }
+
+
+async def process_recording_event(payload_json: dict) -> None:
+    """
+    Apply a Cloudflare Calls recording event.
+
+    Args:
+        payload_json: Verified webhook payload
+    """
+    zerodb = get_zerodb_client()
+    event_type = payload_json.get("event_type")
+    recording_data = payload_json.get("data", {})
+    recording_id = recording_data.get("recording_id")
+    room_id = recording_data.get("room_id")
+
+    if event_type == "recording.ready":
+        await handle_recording_ready(
+            zerodb=zerodb,
+            recording_id=recording_id,
+            room_id=room_id,
+            recording_data=recording_data
+        )
+    elif event_type == "recording.failed":
+        await handle_recording_failed(
+            zerodb=zerodb,
+            recording_id=recording_id,
+            room_id=room_id,
+            recording_data=recording_data
+        )
+    else:
+        logger.warning(f"Unknown event type: {event_type}")
+
+
+async def process_stream_event(payload_json: dict) -> None:
+    """
+    Apply a Cloudflare Stream video event.
+
+    Args:
+        payload_json: Verified webhook payload
+    """
+    zerodb = get_zerodb_client()
+    video_id = payload_json.get("uid")
+    video_state = payload_json.get("status", {}).get("state")
+
+    if video_state == "ready":
+        await handle_stream_video_ready(
+            zerodb=zerodb,
+            video_id=video_id,
+            event_data=payload_json
+        )
+    elif video_state == "error":
+        await handle_stream_video_error(
+            zerodb=zerodb,
+            video_id=video_id,
+            event_data=payload_json
+        )
+    else:
+        logger.info(f"Stream video state: {video_state} for video {video_id}")
+
+
+async def handle_queued_event(event: WebhookEvent) -> None:
+    """
+    WebhookQueue handler for Cloudflare events.
+
+    Args:
+        event: Queued Cloudflare event
+    """
+    if event.source == "cloudflare_recording":
+        await process_recording_event(event.payload)
+    else:
+        await process_stream_event(event.payload)
+
+
 @router.post("/recording")
 async def cloudflare_recording_webhook(
     request: Request,
@@ -143,8 +264,6 @@ async def cloudflare_recording_webhook(
     Raises:
         HTTPException: For signature verification failures or processing errors
     """
-    zerodb = get_zerodb_client()
-
     # Get raw request body for signature verification
     try:
         payload = await request.body()
@@ -200,24 +319,21 @@ async def cloudflare_recording_webhook(
             detail=f"Invalid payload format: {str(e)}"
         )
 
+    # Queue the event and acknowledge it at once
+    response = queue_cloudflare_event(
+        source="cloudflare_recording",
+        payload=payload,
+        payload_json=payload_json,
+        event_type=event_type,
+        ordering_key=room_id
+    )
+    if response is not None:
+        response["recording_id"] = recording_id
+        return response
+
     # Process event based on type
     try:
-        if event_type == "recording.ready":
-            await handle_recording_ready(
-                zerodb=zerodb,
-                recording_id=recording_id,
-                room_id=room_id,
-                recording_data=recording_data
-            )
-        elif event_type == "recording.failed":
-            await handle_recording_failed(
-                zerodb=zerodb,
-                recording_id=recording_id,
-                room_id=room_id,
-                recording_data=recording_data
-            )
-        else:
-            logger.warning(f"Unknown event type: {event_type}")
+        await process_recording_event(payload_json)
 
         logger.info(f"Cloudflare webhook event {event_type} processed successfully")
 
@@ -410,8 +526,6 @@ async def cloudflare_stream_webhook(
     Raises:
         HTTPException: For signature verification failures
     """
-    zerodb = get_zerodb_client()
-
     # Get raw request body for signature verification
     try:
         payload = await request.body()
@@ -467,22 +581,21 @@ async def cloudflare_stream_webhook(
             detail=f"Invalid payload format: {str(e)}"
         )
 
+    # Queue the event and acknowledge it at once
+    response = queue_cloudflare_event(
+        source="cloudflare_stream",
+        payload=payload,
+        payload_json=payload_json,
+        event_type=video_state,
+        ordering_key=video_id
+    )
+    if response is not None:
+        response["video_id"] = video_id
+        return response
+
     # Process event based on state
     try:
-        if video_state == "ready":
-            await handle_stream_video_ready(
-                zerodb=zerodb,
-                video_id=video_id,
-                event_data=payload_json
-            )
-        elif video_state == "error":
-            await handle_stream_video_error(
-                zerodb=zerodb,
-                video_id=video_id,
-                event_data=payload_json
-            )
-        else:
-            logger.info(f"Stream video state: {video_state} for video {video_id}")
+        await process_stream_event(payload_json)
 
         logger.info(f"Cloudflare Stream webhook processed: {video_id}")
 
@@ -0,0 +1,148 @@
+"""
+Strapi Webhook Routes for WWMAA Backend
+
+Invalidates the cached blog pages and articles when content changes in
+Strapi, instead of waiting for the cache TTL.
+
+Webhook Endpoint: POST /api/webhooks/strapi
+
+Strapi setup (Settings > Webhooks):
+- URL: https://<backend>/api/webhooks/strapi
+- Header: Authorization: Bearer <STRAPI_WEBHOOK_SECRET>
+- Events: Entry create/update/delete/publish/unpublish, Media update/delete
+
+Security:
+- Shared secret compared in constant time (skipped with a warning if
+  STRAPI_WEBHOOK_SECRET is not configured)
+- Events are idempotent: processing only invalidates caches
+"""
+
+import hmac
+import json
+import logging
+from fastapi import APIRouter, Request, HTTPException, Header
+from typing import Any, Dict, Optional
+
+from backend.config import settings
+from backend.services.strapi_service import get_strapi_service
+
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(
+    prefix="/api/webhooks/strapi",
+    tags=["webhooks", "strapi"]
+)
+
+# Strapi models rendered by the blog
+BLOG_MODELS = {"article"}
+
+# Media changes can replace the featured image of any article
+MEDIA_EVENTS = {"media.update", "media.delete"}
+
+
+def verify_strapi_secret(authorization: Optional[str], secret: str) -> bool:
+    """
+    Verify the shared secret sent by Strapi.
+
+    Args:
+        authorization: Authorization header value
+        secret: Webhook secret from configuration
+
+    Returns:
+        True if the header carries the secret
+    """
+    if not authorization:
+        return False
+    token = authorization.removeprefix("Bearer ").strip()
+    return hmac.compare_digest(token.encode("utf-8"), secret.encode("utf-8"))
+
+
+def process_strapi_event(webhook_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Invalidate the blog caches affected by a Strapi event.
+
+    Article changes can move the article in or out of any cached page,
+    so every page is dropped (one namespace bump) along with the article.
+
+    Args:
+        webhook_data: Strapi webhook payload (event, model, entry)
+
+    Returns:
+        Response describing the outcome
+    """
+    event_type = webhook_data.get("event")
+    model = webhook_data.get("model")
+
+    if model not in BLOG_MODELS and event_type not in MEDIA_EVENTS:
+        logger.debug(f"Ignoring Strapi event {event_type} for model {model}")
+        return {
+            "status": "ignored",
+            "event_type": event_type,
+            "model": model
+        }
+
+    strapi = get_strapi_service()
+    slug = (webhook_data.get("entry") or {}).get("slug")
+    if slug and model in BLOG_MODELS:
+        strapi.invalidate_article(slug)
+    strapi.invalidate_all()
+
+    logger.info(f"Blog cache invalidated by Strapi event {event_type} ({model}: {slug or '-'})")
+
+    return {
+        "status": "invalidated",
+        "event_type": event_type,
+        "model": model,
+        "slug": slug
+    }
+
+
+@router.post("")
+async def strapi_webhook(
+    request: Request,
+    authorization: Optional[str] = Header(None)
+):
+    """
+    Strapi content webhook endpoint
+
+    Args:
+        request: FastAPI request object containing the event
+        authorization: Authorization header configured on the Strapi webhook
+
+    Returns:
+        Success response with 200 OK
+
+    Raises:
+        HTTPException: For authentication failures or invalid payloads
+    """
+    webhook_secret = settings.STRAPI_WEBHOOK_SECRET
+    if webhook_secret:
+        if not verify_strapi_secret(authorization, webhook_secret):
+            logger.error("Strapi webhook secret verification failed")
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid webhook secret"
+            )
+    else:
+        logger.warning("STRAPI_WEBHOOK_SECRET not configured, skipping secret verification")
+
+    try:
+        webhook_data = json.loads(await request.body())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.error(f"Invalid JSON payload: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid JSON payload"
+        )
+
+    if not isinstance(webhook_data, dict) or not webhook_data.get("event"):
+        logger.error("Missing event type in Strapi webhook payload")
+        raise HTTPException(
+            status_code=400,
+            detail="Missing event type"
+        )
+
+    return process_strapi_event(webhook_data)
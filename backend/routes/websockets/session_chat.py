@@ -13,13 +13,15 @@ Provides real-time WebSocket communication for training session chat including:
 
 import json
 import logging
-from typing import Dict, Set
+from datetime import datetime
+from typing import Optional, Set
 from uuid import UUID
 
 from fastapi import WebSocket, WebSocketDisconnect, Query, HTTPException, status
 from jose import jwt, JWTError
 
 from backend.config import settings
+from backend.services.chat_fanout_service import ChatFanoutService, get_chat_fanout_service
 from backend.services.session_chat_service import SessionChatService, SessionChatError, RateLimitError, MutedUserError
 from backend.services.zerodb_service import ZeroDBClient
 from backend.models.schemas import UserRole
@@ -33,15 +35,20 @@ class ConnectionManager:
     """
     Manages WebSocket connections for session chat
 
-    Tracks active connections per session and handles broadcasting
-    messages to all connected clients.
+    Delegates delivery to the chat fan-out service, which gives every
+    connection its own bounded send queue and relays events between
+    workers/replicas over Redis pub/sub, so participants of a session see
+    each other regardless of which node they are connected to.
     """
 
-    def __init__(self):
-        # session_id -> set of websockets
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
-        # websocket -> user_info dict
-        self.connection_info: Dict[WebSocket, dict] = {}
+    def __init__(self, fanout: Optional[ChatFanoutService] = None):
+        self._fanout = fanout
+
+    @property
+    def fanout(self) -> ChatFanoutService:
+        if self._fanout is None:
+            self._fanout = get_chat_fanout_service()
+        return self._fanout
 
     async def connect(self, websocket: WebSocket, session_id: str, user_info: dict):
         """
@@ -53,20 +60,14 @@ class ConnectionManager:
             user_info: User information dict (user_id, user_name, role)
         """
         await websocket.accept()
-
-        # Add to active connections
-        if session_id not in self.active_connections:
-            self.active_connections[session_id] = set()
-
-        self.active_connections[session_id].add(websocket)
-        self.connection_info[websocket] = user_info
+        await self.fanout.connect(websocket, session_id, user_info)
 
         logger.info(
             f"User {user_info['user_id']} ({user_info['user_name']}) "
             f"connected to session {session_id}"
         )
 
-    def disconnect(self, websocket: WebSocket, session_id: str):
+    async def disconnect(self, websocket: WebSocket, session_id: str):
         """
         Disconnect a WebSocket client from a session
 
@@ -74,19 +75,11 @@ class ConnectionManager:
             websocket: WebSocket connection
             session_id: Training session ID
         """
-        if session_id in self.active_connections:
-            self.active_connections[session_id].discard(websocket)
-
-            # Clean up empty session
-            if not self.active_connections[session_id]:
-                del self.active_connections[session_id]
-
-        # Remove connection info
-        user_info = self.connection_info.pop(websocket, None)
+        connection = await self.fanout.disconnect(websocket, session_id)
 
-        if user_info:
+        if connection:
             logger.info(
-                f"User {user_info['user_id']} ({user_info['user_name']}) "
+                f"User {connection.user_id} ({connection.user_info['user_name']}) "
                 f"disconnected from session {session_id}"
             )
 
@@ -94,30 +87,15 @@ class ConnectionManager:
         """
         Broadcast a message to all connected clients in a session
 
+        The message is serialized once and queued on every recipient;
+        this never waits on a client's network.
+
         Args:
             session_id: Training session ID
             message: Message dict to broadcast
             exclude: Set of websockets to exclude from broadcast
         """
-        if session_id not in self.active_connections:
-            return
-
-        exclude = exclude or set()
-        disconnected = set()
-
-        for websocket in self.active_connections[session_id]:
-            if websocket in exclude:
-                continue
-
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to websocket: {e}")
-                disconnected.add(websocket)
-
-        # Clean up disconnected websockets
-        for websocket in disconnected:
-            self.disconnect(websocket, session_id)
+        await self.fanout.broadcast(session_id, message, exclude=exclude)
 
     async def send_private(self, session_id: str, recipient_id: str, message: dict):
         """
@@ -128,20 +106,11 @@ class ConnectionManager:
             recipient_id: Recipient user ID
             message: Message dict to send
         """
-        if session_id not in self.active_connections:
-            return
+        await self.fanout.send_private(session_id, recipient_id, message)
 
-        for websocket in self.active_connections[session_id]:
-            user_info = self.connection_info.get(websocket)
-            if user_info and str(user_info['user_id']) == str(recipient_id):
-                try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending private message: {e}")
-
-    def get_active_users(self, session_id: str) -> list:
+    async def get_active_users(self, session_id: str) -> list:
         """
-        Get list of active users in a session
+        Get list of active users in a session across all nodes
 
         Args:
             session_id: Training session ID
@@ -149,20 +118,7 @@ class ConnectionManager:
         Returns:
             List of user info dicts
         """
-        if session_id not in self.active_connections:
-            return []
-
-        users = []
-        for websocket in self.active_connections[session_id]:
-            user_info = self.connection_info.get(websocket)
-            if user_info:
-                users.append({
-                    "user_id": str(user_info['user_id']),
-                    "user_name": user_info['user_name'],
-                    "role": user_info['role']
-                })
-
-        return users
+        return await self.fanout.get_active_users(session_id)
 
 
 # Global connection manager
@@ -385,7 +341,7 @@ async def websocket_endpoint(
                 })
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, session_id)
+        await manager.disconnect(websocket, session_id)
 
         # Broadcast user left
         await manager.broadcast(
@@ -400,7 +356,7 @@ async def websocket_endpoint(
 
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        manager.disconnect(websocket, session_id)
+        await manager.disconnect(websocket, session_id)
 
 
 # Message handlers
@@ -414,8 +370,6 @@ async def handle_chat_message(
     is_instructor: bool
 ):
     """Handle chat message"""
-    from datetime import datetime
-
     try:
         message_text = data.get("message", "").strip()
         is_private = data.get("is_private", False)
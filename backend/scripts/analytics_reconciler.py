@@ -0,0 +1,138 @@
+"""
+Analytics Aggregates Reconciliation Scheduler
+
+Periodically recomputes the admin dashboard aggregates from the source
+collections (users, subscriptions, payments, events, training_sessions,
+applications) and swaps them into Redis.
+
+Write paths keep the aggregates current incrementally; this job corrects
+any drift (missed hooks, Redis restarts, writes from paths that do not
+report to the aggregates service) and bootstraps the aggregates on a
+fresh deployment.
+
+Usage:
+    python -m backend.scripts.analytics_reconciler
+
+Environment Variables:
+    ANALYTICS_RECONCILE_INTERVAL_MINUTES: Minutes between runs (default: 15)
+
+Safety Features:
+    - Rebuilds are atomic (readers never see a partially rebuilt state)
+    - Only one run at a time across all replicas (shared Redis-backed
+      JobRunner)
+    - Graceful shutdown on SIGTERM/SIGINT
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+from datetime import datetime
+
+from backend.config import settings
+from backend.services.analytics_aggregates_service import (
+    get_analytics_aggregates_service,
+    AnalyticsAggregatesError
+)
+from backend.services.job_runner import JobRunner, get_job_runner, PRIORITY_NORMAL
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "analytics_aggregates_reconciler"
+RECONCILE_INTERVAL_MINUTES = int(os.getenv("ANALYTICS_RECONCILE_INTERVAL_MINUTES", "15"))
+
+# Set by the signal handlers to stop the job runner
+stop_event = threading.Event()
+
+
+def reconcile_aggregates():
+    """
+    Recompute analytics aggregates from source data
+
+    Errors are logged and never crash the scheduler; the next run retries.
+    """
+    logger.info("Starting analytics aggregates reconciliation...")
+    start_time = datetime.utcnow()
+
+    try:
+        snapshot = get_analytics_aggregates_service().reconcile()
+        elapsed_time = (datetime.utcnow() - start_time).total_seconds()
+        logger.info(
+            f"Analytics reconciliation completed in {elapsed_time:.2f}s: "
+            f"members={snapshot.get('total_members')}, "
+            f"active_subscriptions={snapshot.get('active_subscriptions')}, "
+            f"total_revenue={snapshot.get('total_revenue')}"
+        )
+    except AnalyticsAggregatesError as e:
+        logger.error(f"Analytics reconciliation failed: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error during analytics reconciliation: {e}")
+
+
+def register_jobs(runner: JobRunner):
+    """
+    Register the reconciliation (every ANALYTICS_RECONCILE_INTERVAL_MINUTES)
+    on a job runner
+
+    Args:
+        runner: Job runner
+    """
+    runner.register(
+        JOB_NAME,
+        reconcile_aggregates,
+        interval=RECONCILE_INTERVAL_MINUTES * 60,
+        priority=PRIORITY_NORMAL
+    )
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, shutting down gracefully...")
+    stop_event.set()
+
+
+def main():
+    """
+    Main entry point for the analytics reconciler
+
+    Runs one reconciliation immediately (bootstrapping the aggregates),
+    then every ANALYTICS_RECONCILE_INTERVAL_MINUTES.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    logger.info("Starting WWMAA Analytics Reconciler...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    runner = get_job_runner()
+    register_jobs(runner)
+
+    logger.info(f"Analytics reconciler configured to run every {RECONCILE_INTERVAL_MINUTES} minutes")
+
+    # Bootstrap aggregates on startup (skipped if a run is already waiting)
+    runner.trigger(JOB_NAME)
+
+    try:
+        runner.run_forever(stop_event)
+        logger.info("Analytics reconciler stopped")
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Analytics reconciler stopped by user")
+    except Exception as e:
+        logger.error(f"Analytics reconciler crashed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
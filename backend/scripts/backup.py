@@ -42,6 +42,10 @@ Usage Examples:
     # Restore with validation only
     python backup.py --restore users_full_20250109_120000 --validate-only
 
+    # Restore with 16 concurrent writers (re-run the same command to resume
+    # an interrupted restore; --no-resume starts over)
+    python backup.py --restore users_full_20250109_120000 --workers 16
+
     # Cleanup backups older than 30 days
     python backup.py --cleanup --days 30
 
@@ -64,6 +68,7 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.backup_service import BackupService, BackupError, RestoreError
+from services.restore_engine import DEFAULT_BATCH_SIZE, DEFAULT_RESTORE_WORKERS
 from config import settings
 
 # Configure logging
@@ -272,7 +277,10 @@ def handle_restore(args):
             collection=collection,
             backup_id=backup_id,
             merge=args.merge,
-            validate_only=args.validate_only
+            validate_only=args.validate_only,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            resume=not args.no_resume
         )
 
         # Print results
@@ -294,6 +302,10 @@ def handle_restore(args):
             print(f"Created: {result['created']}")
             print(f"Updated: {result['updated']}")
             print(f"Errors: {result['errors']}")
+            if result.get('skipped'):
+                print(f"Skipped (restored by an earlier run): {result['skipped']}")
+            print(f"Throughput: {result['documents_per_second']:,.0f} docs/s "
+                  f"in {result['duration_seconds']:.1f}s")
 
             if result['errors'] > 0:
                 print(f"\nError Details (first 10):")
@@ -485,6 +497,26 @@ def main():
         help="Only validate backup without restoring (restore only)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_RESTORE_WORKERS,
+        help=f"Concurrent batch writers (restore only, default: {DEFAULT_RESTORE_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Documents per batch (restore only, default: {DEFAULT_BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore the checkpoint of an interrupted restore and start over (restore only)"
+    )
+
     # List options
     parser.add_argument(
         "--collection",
@@ -7,6 +7,10 @@ them to ZeroDB Object Storage with proper metadata and retention policy.
 
 Features:
 - Full and incremental backups
+- Streaming NDJSON format (default): documents are written page by page
+  through an incremental gzip compressor into fixed-size parts with SHA-256
+  checksums and a manifest, so memory use does not grow with the collection
+- Collections backed up in parallel
 - Gzip compression
 - Upload to ZeroDB Object Storage
 - Retention policy (30 daily, 12 monthly backups)
@@ -15,6 +19,8 @@ Features:
 
 Usage:
     python backup_zerodb.py [--incremental] [--collections COLLECTIONS] [--dry-run]
+                            [--format {ndjson,json}] [--compress-level N]
+                            [--part-size-mb N] [--workers N]
 
 Examples:
     # Full backup of all collections
@@ -28,6 +34,12 @@ Examples:
 
     # Dry run (no upload)
     python backup_zerodb.py --dry-run
+
+    # Faster compression, 16 MB parts, 8 collections at a time
+    python backup_zerodb.py --compress-level 3 --part-size-mb 16 --workers 8
+
+    # Legacy single-file JSON format
+    python backup_zerodb.py --format json
 """
 
 import argparse
@@ -36,14 +48,23 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 # Add backend to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.zerodb_service import ZeroDBClient, ZeroDBError
+from services.backup_stream import (
+    DEFAULT_COMPRESS_LEVEL,
+    DEFAULT_PART_SIZE,
+    STREAM_FORMAT,
+    StreamingBackupWriter,
+    manifest_file_name,
+    write_manifest,
+)
 from config import settings
 
 # Configure logging
@@ -63,6 +84,8 @@ DEFAULT_COLLECTIONS = ["users", "promotions", "members", "events", "approvals"]
 RETENTION_DAILY = 30  # Keep last 30 daily backups
 RETENTION_MONTHLY = 12  # Keep last 12 monthly backups
 TEMP_DIR = "/tmp/zerodb_backups"
+STREAM_PAGE_SIZE = 500  # Documents fetched per query in the streaming format
+DEFAULT_WORKERS = 4  # Collections backed up in parallel
 
 
 class BackupManager:
@@ -187,6 +210,39 @@ class BackupManager:
         logger.info(f"Exported {len(documents)} documents from '{collection}'")
         return export_data
 
+    def iter_collection(
+        self,
+        collection: str,
+        filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream collection documents one page at a time
+
+        Args:
+            collection: Collection name
+            filters: Query filters
+
+        Yields:
+            Documents in creation order
+        """
+        offset = 0
+
+        while True:
+            result = self.client.query_documents(
+                collection=collection,
+                filters=filters,
+                limit=STREAM_PAGE_SIZE,
+                offset=offset,
+                sort={"created_at": "asc"}
+            )
+
+            batch = result.get("documents", [])
+            yield from batch
+            offset += len(batch)
+
+            if len(batch) < STREAM_PAGE_SIZE:
+                break
+
     def compress_backup(self, data: Dict[str, Any], output_path: Path) -> int:
         """
         Compress backup data to gzip file
@@ -216,13 +272,19 @@ class BackupManager:
 
         return file_size
 
-    def upload_backup(self, file_path: Path, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def upload_backup(
+        self,
+        file_path: Path,
+        metadata: Dict[str, Any],
+        content_type: str = "application/gzip"
+    ) -> Dict[str, Any]:
         """
         Upload backup file to ZeroDB Object Storage
 
         Args:
             file_path: Path to backup file
             metadata: Backup metadata
+            content_type: MIME type of the file
 
         Returns:
             Upload result from ZeroDB
@@ -235,7 +297,7 @@ class BackupManager:
                 file_path=str(file_path),
                 object_name=object_name,
                 metadata=metadata,
-                content_type="application/gzip"
+                content_type=content_type
             )
 
             logger.info(f"Backup uploaded successfully: {object_name}")
@@ -252,7 +314,8 @@ class BackupManager:
         file_name: str,
         file_size: int,
         document_count: int,
-        backup_id: str
+        backup_id: str,
+        additional_metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Save backup metadata to tracking collection
@@ -264,6 +327,7 @@ class BackupManager:
             file_size: Size of backup file in bytes
             document_count: Number of documents in backup
             backup_id: Unique backup identifier
+            additional_metadata: Optional extra fields (e.g. format and parts)
 
         Returns:
             Created metadata document
@@ -281,6 +345,9 @@ class BackupManager:
             "completed_at": datetime.utcnow().isoformat()
         }
 
+        if additional_metadata:
+            metadata.update(additional_metadata)
+
         try:
             result = self.client.create_document(
                 collection=BACKUP_METADATA_COLLECTION,
@@ -354,8 +421,10 @@ class BackupManager:
             for backup in backups:
                 if backup["backup_id"] not in keep_backup_ids:
                     try:
-                        # Delete from object storage
+                        # Delete from object storage (streaming backups also have parts)
                         self.client.delete_object(backup["file_name"])
+                        for part in backup.get("parts", []):
+                            self.client.delete_object(part["file_name"])
 
                         # Delete metadata
                         self.client.delete_document(
@@ -377,11 +446,66 @@ class BackupManager:
         except ZeroDBError as e:
             logger.error(f"Error enforcing retention policy: {e}")
 
+    def stream_collection(
+        self,
+        collection: str,
+        backup_id: str,
+        filters: Dict[str, Any],
+        dry_run: bool,
+        compress_level: int,
+        part_size: int
+    ) -> Dict[str, Any]:
+        """
+        Write a collection as compressed NDJSON parts, uploading each part as it closes
+
+        Args:
+            collection: Collection name
+            backup_id: Backup identifier (file name prefix)
+            filters: Query filters (for incremental backups)
+            dry_run: If True, parts are written locally but not uploaded
+            compress_level: gzip compression level (0-9)
+            part_size: Uncompressed bytes per part
+
+        Returns:
+            Dict with document_count and the parts' manifest entries
+        """
+        def upload_part(part):
+            if not dry_run:
+                self.upload_backup(part.path, {
+                    "collection": collection,
+                    "backup_id": backup_id,
+                    "sha256": part.sha256,
+                    "document_count": str(part.document_count)
+                })
+            part.path.unlink()
+
+        writer = StreamingBackupWriter(
+            self.temp_dir,
+            backup_id,
+            compress_level=compress_level,
+            part_size=part_size,
+            on_part=upload_part
+        )
+        with writer:
+            writer.write_many(self.iter_collection(collection, filters))
+
+        logger.info(
+            f"Streamed {writer.document_count} documents from '{collection}' "
+            f"into {len(writer.parts)} part(s)"
+        )
+        return {
+            "document_count": writer.document_count,
+            "parts": [part.to_manifest() for part in writer.parts]
+        }
+
     def backup_collection(
         self,
         collection: str,
         incremental: bool = False,
-        dry_run: bool = False
+        dry_run: bool = False,
+        streaming: bool = True,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        part_size: int = DEFAULT_PART_SIZE
     ) -> Dict[str, Any]:
         """
         Perform full backup workflow for a collection
@@ -390,6 +514,9 @@ class BackupManager:
             collection: Collection name to backup
             incremental: If True, perform incremental backup
             dry_run: If True, don't upload to object storage
+            streaming: If True, write the streaming NDJSON format; otherwise one JSON file
+            compress_level: gzip compression level for the streaming format (0-9)
+            part_size: Uncompressed bytes per part for the streaming format
 
         Returns:
             Backup result summary
@@ -413,17 +540,41 @@ class BackupManager:
                     incremental = False
                     backup_type = "full"
 
-            # Export collection data
-            export_data = self.export_collection(
-                collection=collection,
-                incremental=incremental,
-                last_backup_time=last_backup_time
-            )
+            extra_metadata = None
+            if streaming:
+                # Stream documents into compressed parts, then describe them in a manifest
+                filters = {"updated_at": {"$gte": last_backup_time}} if incremental else {}
+                streamed = self.stream_collection(
+                    collection, backup_id, filters, dry_run, compress_level, part_size
+                )
+                export_data = {"document_count": streamed["document_count"]}
+                file_name = manifest_file_name(backup_id)
+                file_path = self.temp_dir / file_name
+                file_size = write_manifest(file_path, {
+                    "backup_id": backup_id,
+                    "collection": collection,
+                    "backup_type": backup_type,
+                    "format": STREAM_FORMAT,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "last_backup_time": last_backup_time,
+                    "document_count": streamed["document_count"],
+                    "compress_level": compress_level,
+                    "parts": streamed["parts"]
+                })
+                file_size += sum(part["size"] for part in streamed["parts"])
+                extra_metadata = {"format": STREAM_FORMAT, "parts": streamed["parts"]}
+            else:
+                # Export collection data
+                export_data = self.export_collection(
+                    collection=collection,
+                    incremental=incremental,
+                    last_backup_time=last_backup_time
+                )
 
-            # Compress to file
-            file_name = f"{backup_id}.json.gz"
-            file_path = self.temp_dir / file_name
-            file_size = self.compress_backup(export_data, file_path)
+                # Compress to file
+                file_name = f"{backup_id}.json.gz"
+                file_path = self.temp_dir / file_name
+                file_size = self.compress_backup(export_data, file_path)
 
             upload_result = None
             if not dry_run:
@@ -434,7 +585,11 @@ class BackupManager:
                     "timestamp": timestamp,
                     "document_count": str(export_data["document_count"])
                 }
-                upload_result = self.upload_backup(file_path, metadata)
+                upload_result = self.upload_backup(
+                    file_path,
+                    metadata,
+                    content_type="application/json" if streaming else "application/gzip"
+                )
 
                 # Save metadata
                 self.save_backup_metadata(
@@ -443,7 +598,8 @@ class BackupManager:
                     file_name=file_name,
                     file_size=file_size,
                     document_count=export_data["document_count"],
-                    backup_id=backup_id
+                    backup_id=backup_id,
+                    additional_metadata=extra_metadata
                 )
 
                 # Enforce retention policy
@@ -457,9 +613,11 @@ class BackupManager:
                 "backup_id": backup_id,
                 "collection": collection,
                 "backup_type": backup_type,
+                "format": STREAM_FORMAT if streaming else "json",
                 "document_count": export_data["document_count"],
                 "file_size": file_size,
                 "file_name": file_name,
+                "parts": len(extra_metadata["parts"]) if extra_metadata else 1,
                 "dry_run": dry_run,
                 "upload_result": upload_result
             }
@@ -498,6 +656,36 @@ def main():
         help="Perform backup without uploading to object storage"
     )
 
+    parser.add_argument(
+        "--format",
+        choices=[STREAM_FORMAT, "json"],
+        default=STREAM_FORMAT,
+        help="Backup format: streaming NDJSON parts (default) or a single JSON file"
+    )
+
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(0, 10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar="{0-9}",
+        help=f"gzip compression level (default: {DEFAULT_COMPRESS_LEVEL})"
+    )
+
+    parser.add_argument(
+        "--part-size-mb",
+        type=int,
+        default=DEFAULT_PART_SIZE // (1024 * 1024),
+        help="Uncompressed megabytes per NDJSON part (default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Collections backed up in parallel (default: %(default)s)"
+    )
+
     args = parser.parse_args()
 
     # Determine which collections to backup
@@ -507,24 +695,35 @@ def main():
         collections = DEFAULT_COLLECTIONS
 
     logger.info(f"Starting backup for collections: {collections}")
-    logger.info(f"Incremental: {args.incremental}, Dry run: {args.dry_run}")
+    logger.info(
+        f"Incremental: {args.incremental}, Dry run: {args.dry_run}, "
+        f"Format: {args.format}, Workers: {args.workers}"
+    )
 
     backup_manager = BackupManager()
     results = []
     failed_collections = []
 
-    for collection in collections:
+    def backup_one(collection):
         try:
-            result = backup_manager.backup_collection(
+            return collection, backup_manager.backup_collection(
                 collection=collection,
                 incremental=args.incremental,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                streaming=args.format == STREAM_FORMAT,
+                compress_level=args.compress_level,
+                part_size=args.part_size_mb * 1024 * 1024
             )
-            results.append(result)
-
         except Exception as e:
             logger.error(f"Failed to backup '{collection}': {e}")
-            failed_collections.append(collection)
+            return collection, None
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        for collection, result in executor.map(backup_one, collections):
+            if result is None:
+                failed_collections.append(collection)
+            else:
+                results.append(result)
 
     # Print summary
     print("\n" + "=" * 80)
@@ -537,6 +736,7 @@ def main():
         print(f"  Backup ID: {result['backup_id']}")
         print(f"  Type: {result['backup_type']}")
         print(f"  Documents: {result['document_count']}")
+        print(f"  Format: {result['format']} ({result['parts']} part(s))")
         print(f"  File size: {result['file_size']:,} bytes")
         print(f"  File name: {result['file_name']}")
         if result['dry_run']:
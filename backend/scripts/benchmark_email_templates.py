@@ -0,0 +1,79 @@
+"""
+Email Template Rendering Micro-Benchmark
+
+Measures how long building the bodies of a bulk send takes, to check that
+bulk email to thousands of recipients is bounded by delivery I/O rather
+than string building. Compares:
+- compile: loading and compiling every template (paid once at startup)
+- render: rendering the full template for every recipient
+- bind + render: pre-rendering the shared layout and message once, then
+  filling only the recipient's name (what AttendeeService.send_bulk_email does)
+
+Usage:
+    python -m backend.scripts.benchmark_email_templates
+    python -m backend.scripts.benchmark_email_templates --recipients 10000 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from backend.services.email_template_service import EmailTemplateService
+
+TEMPLATE = "event_bulk_update"
+
+MESSAGE = """
+<p>Thank you for registering for the Spring Seminar. A few reminders before the event:</p>
+<ul>
+    <li>Doors open at 8:30 AM; warm-ups start at 9:00 AM sharp</li>
+    <li>Bring your gi, belt, water and a padlock for the lockers</li>
+    <li>Parking is available in the north lot at no charge</li>
+</ul>
+<p>If you can no longer attend, please cancel your RSVP so we can offer your spot to the waitlist.</p>
+"""
+
+
+def timed(func: Callable[[], object], repeat: int) -> List[float]:
+    """Run func ``repeat`` times and return the durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(label: str, durations: List[float], messages: int = 0) -> None:
+    best = min(durations)
+    line = f"{label:<16} best {best * 1000:9.2f} ms  median {statistics.median(durations) * 1000:9.2f} ms"
+    if messages:
+        line += f"  {best / messages * 1e6:7.2f} us/msg  {messages / best:10,.0f} msg/s"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark email template rendering")
+    parser.add_argument("--recipients", type=int, default=5000, help="Recipients per bulk send")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    recipients = [{"recipient_name": f"Member {i}"} for i in range(args.recipients)]
+    service = EmailTemplateService()
+    template = service.get(TEMPLATE)
+
+    def render_each():
+        for recipient in recipients:
+            template.render({"message": MESSAGE, **recipient})
+
+    def bind_and_render():
+        list(template.render_many({"message": MESSAGE}, recipients))
+
+    print(f"Rendering '{TEMPLATE}' for {args.recipients:,} recipients ({args.repeat} runs)\n")
+    report("compile", timed(EmailTemplateService, args.repeat))
+    report("render", timed(render_each, args.repeat), args.recipients)
+    report("bind + render", timed(bind_and_render, args.repeat), args.recipients)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Session Chat Persistence Worker
+
+Drains the chat write-behind stream: chat messages, reactions, raised
+hands and deletions buffered in Redis by SessionChatService are persisted
+to ZeroDB in batches and acknowledged once applied.
+
+Run one or more instances; they share the work through a Redis consumer
+group, and entries left unacknowledged by a crashed instance are
+reclaimed by the others.
+
+Usage:
+    python -m backend.scripts.chat_persistence_worker
+
+Safety Features:
+    - Entries are acknowledged only after they reach ZeroDB
+    - Message and raised-hand inserts are idempotent on redelivery
+    - Graceful shutdown on SIGTERM/SIGINT (finishes the current batch)
+"""
+
+import logging
+import signal
+import sys
+import threading
+
+from backend.config import settings
+from backend.services.chat_write_behind_service import get_chat_write_behind_service
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+stop_event = threading.Event()
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, finishing current batch...")
+    stop_event.set()
+
+
+def main():
+    """
+    Main entry point for the chat persistence worker
+    """
+    logger.info("Starting WWMAA Chat Persistence Worker...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    try:
+        get_chat_write_behind_service().run(stop_event)
+    except Exception as e:
+        logger.error(f"Chat persistence worker crashed: {e}")
+        sys.exit(1)
+
+    logger.info("Chat persistence worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,39 +2,52 @@
 Dunning Scheduler Script
 
 Automated scheduler for processing dunning reminders at scheduled intervals.
-Uses APScheduler to check for due dunning reminders and process them.
+Registers the dunning run on the shared Redis-backed JobRunner, which runs it
+once per schedule across all replicas, and works the job runner's queue.
 
 This script should run as a background process alongside the main FastAPI application.
-It queries the dunning_records collection for records that need processing and
-delegates to the DunningService for email sending and status updates.
+It pops due reminders from the dunning due queue (a Redis sorted set of records
+by next reminder date that DunningService maintains) in batches, and delegates
+each to the DunningService for email sending and status updates, several at a
+time. A run only touches the records that are due.
 
 Usage:
     python -m backend.scripts.dunning_scheduler
 
 Environment Variables Required:
     - All standard backend environment variables from .env file
-    - Specifically: ZERODB_API_KEY, POSTMARK_API_KEY, STRIPE_SECRET_KEY
+    - Specifically: ZERODB_API_KEY, POSTMARK_API_KEY, STRIPE_SECRET_KEY, REDIS_URL
+
+Optional Environment Variables:
+    - DUNNING_BATCH_SIZE: Reminders popped from the queue at a time (default: 50)
+    - DUNNING_CONCURRENCY: Reminders processed in parallel (default: 8)
 
 Schedule:
-    - Runs every 2 hours to check for due dunning reminders
+    - Runs every 2 hours to check for due dunning reminders (job
+      "dunning_reminders"; never two runs at once)
     - Processes all reminders that are past their scheduled time
     - Logs all processing results for monitoring
+    - Reseeds the due queue from ZeroDB on startup
 
 Safety Features:
-    - Idempotent processing (won't resend emails for same stage)
-    - Error handling and retry logic
+    - Idempotent processing: each (record, stage) reminder is claimed with an
+      idempotency key, so it is sent once even if redelivered
+    - Popped reminders are leased; a crashed run's reminders are handed out
+      again when the lease lapses
+    - Failed reminders are requeued and retried an hour later
     - Comprehensive logging
     - Graceful shutdown on SIGTERM/SIGINT
 """
 
+import asyncio
 import logging
+import os
 import signal
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
 
 from backend.config import settings
 from backend.services.dunning_service import (
@@ -43,108 +56,81 @@ from backend.services.dunning_service import (
     DunningStage,
     DunningServiceError
 )
-from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/var/log/wwmaa/dunning_scheduler.log')
-    ]
+from backend.services.dunning_due_queue import (
+    get_dunning_due_queue,
+    DunningDueQueue,
+    DunningDueQueueError,
+    CLAIM_TTL,
+    SENT
 )
+from backend.services.job_runner import JobRunner, get_job_runner, PRIORITY_NORMAL
+
 logger = logging.getLogger(__name__)
 
+JOB_NAME = "dunning_reminders"
+JOB_INTERVAL = 2 * 3600  # Seconds
+
+BATCH_SIZE = int(os.getenv("DUNNING_BATCH_SIZE", "50"))
+CONCURRENCY = int(os.getenv("DUNNING_CONCURRENCY", "8"))
+
 # Initialize services
 dunning_service: DunningService = None
-zerodb_client = None
+due_queue: DunningDueQueue = None
+
+# Set by the signal handlers to stop the job runner
+stop_event = threading.Event()
+
+
+def configure_logging():
+    """Log to stdout and the dunning scheduler log file"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('/var/log/wwmaa/dunning_scheduler.log')
+        ]
+    )
 
 
 def initialize_services():
     """
-    Initialize dunning and database services
+    Initialize dunning service and due queue
 
     This is called once at startup to create service instances.
     """
-    global dunning_service, zerodb_client
+    global dunning_service, due_queue
 
     try:
         dunning_service = get_dunning_service()
-        zerodb_client = get_zerodb_client()
+        due_queue = get_dunning_due_queue()
         logger.info("Dunning scheduler services initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
         sys.exit(1)
 
 
-def get_due_dunning_records() -> List[Dict[str, Any]]:
+def get_due_dunning_records(batch_size: int = BATCH_SIZE) -> List[Tuple[str, str]]:
     """
-    Query ZeroDB for dunning records that need processing
+    Pop the next batch of due reminders from the due queue
+
+    A reminder is due once the record's next reminder date has passed. Popped
+    reminders are leased to this run until they are completed or requeued.
 
-    A dunning record is due if:
-    - It's in one of the reminder stages (not canceled)
-    - The next reminder date has passed
-    - It hasn't already been processed for this stage
+    Args:
+        batch_size: Maximum reminders to pop
 
     Returns:
-        List of dunning records that need processing
+        List of (dunning_record_id, next_stage) tuples, oldest first
     """
     try:
-        # Query dunning_records for records in past_due subscriptions
-        # that haven't reached the canceled stage yet
-        results = zerodb_client.query(
-            collection='dunning_records',
-            query={
-                'current_stage': {
-                    '$in': [
-                        DunningStage.PAYMENT_FAILED.value,
-                        DunningStage.FIRST_REMINDER.value,
-                        DunningStage.SECOND_REMINDER.value,
-                        DunningStage.FINAL_WARNING.value
-                    ]
-                }
-            },
-            limit=100  # Process up to 100 records per run
-        )
-
-        due_records = []
-        now = datetime.utcnow()
-
-        for record in results:
-            created_at = datetime.fromisoformat(record.get('created_at'))
-            current_stage = record.get('current_stage')
-
-            # Calculate days since dunning started
-            days_past_due = (now - created_at).days
-
-            # Check if this record is due for the next stage
-            stage_enum = DunningStage(current_stage)
-            next_stage = dunning_service._get_next_stage(stage_enum)
-
-            if next_stage:
-                days_required = DunningService.DUNNING_SCHEDULE[next_stage]
-
-                if days_past_due >= days_required:
-                    # This record is due for the next stage
-                    due_records.append({
-                        'record': record,
-                        'next_stage': next_stage,
-                        'days_past_due': days_past_due
-                    })
-                    logger.info(
-                        f"Dunning record {record.get('id')} is due for "
-                        f"{next_stage.value} (days past due: {days_past_due})"
-                    )
-
-        logger.info(f"Found {len(due_records)} dunning records due for processing")
+        due_records = due_queue.pop_due(batch_size)
+        if due_records:
+            logger.info(f"Popped {len(due_records)} due dunning reminders")
         return due_records
 
-    except ZeroDBError as e:
-        logger.error(f"Database error querying dunning records: {e}")
-        return []
-    except Exception as e:
-        logger.error(f"Unexpected error querying dunning records: {e}")
+    except DunningDueQueueError as e:
+        logger.error(f"Due queue error popping dunning reminders: {e}")
         return []
 
 
@@ -197,57 +183,114 @@ async def process_dunning_reminder(
         }
 
 
+def process_due_reminder(dunning_record_id: str, stage_value: str) -> str:
+    """
+    Process one popped reminder, exactly once per (record, stage)
+
+    Runs on a worker thread with its own event loop, since the dunning
+    service does blocking I/O.
+
+    Args:
+        dunning_record_id: ID of the dunning record
+        stage_value: Dunning stage due ('' if the queue lost track of it)
+
+    Returns:
+        'succeeded', 'skipped' or 'failed'
+    """
+    try:
+        if not stage_value:
+            record = asyncio.run(dunning_service._get_dunning_record(dunning_record_id))
+            next_stage = dunning_service._get_next_stage(DunningStage(record.get('current_stage')))
+            if next_stage is None:
+                due_queue.release(dunning_record_id)
+                return 'skipped'
+            stage_value = next_stage.value
+
+        claim_state = due_queue.claim(dunning_record_id, stage_value)
+        if claim_state == SENT:
+            logger.info(
+                f"Dunning reminder {dunning_record_id} for stage {stage_value} "
+                f"already sent, skipping"
+            )
+            due_queue.release(dunning_record_id)
+            return 'skipped'
+        if claim_state is not None:
+            # Another sender holds the claim; check again once it has lapsed,
+            # in case that sender crashed before sending
+            logger.info(
+                f"Dunning reminder {dunning_record_id} for stage {stage_value} "
+                f"is being sent elsewhere, checking again later"
+            )
+            due_queue.retry(dunning_record_id, stage_value, delay=CLAIM_TTL, keep_claim=True)
+            return 'skipped'
+
+    except Exception as e:
+        logger.error(f"Failed to prepare dunning reminder {dunning_record_id}: {e}")
+        due_queue.retry(dunning_record_id, stage_value)
+        return 'failed'
+
+    result = asyncio.run(process_dunning_reminder(
+        dunning_record_id=dunning_record_id,
+        next_stage=DunningStage(stage_value)
+    ))
+
+    if result.get('skipped'):
+        # Subscription recovered; no more reminders for this record
+        due_queue.remove(dunning_record_id)
+        due_queue.complete(dunning_record_id, stage_value)
+        return 'skipped'
+    if result.get('success'):
+        due_queue.complete(dunning_record_id, stage_value)
+        return 'succeeded'
+
+    due_queue.retry(dunning_record_id, stage_value)
+    return 'failed'
+
+
 async def process_all_due_dunning_reminders():
     """
     Main processing function that runs on schedule
 
     This function:
-    1. Queries for all due dunning records
-    2. Processes each record sequentially
+    1. Pops due reminders from the due queue in batches
+    2. Processes each batch concurrently (DUNNING_CONCURRENCY at a time)
     3. Logs results for monitoring
     4. Reports summary statistics
     """
     logger.info("Starting dunning reminder processing run...")
     start_time = datetime.utcnow()
 
-    try:
-        due_records = get_due_dunning_records()
+    results = {
+        'total': 0,
+        'succeeded': 0,
+        'failed': 0,
+        'skipped': 0
+    }
 
-        if not due_records:
+    try:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=CONCURRENCY, thread_name_prefix="dunning") as executor:
+            while True:
+                due_records = get_due_dunning_records()
+                if not due_records:
+                    break
+
+                outcomes = await asyncio.gather(*[
+                    loop.run_in_executor(executor, process_due_reminder, str(record_id), stage)
+                    for record_id, stage in due_records
+                ])
+
+                results['total'] += len(outcomes)
+                for outcome in outcomes:
+                    results[outcome] += 1
+
+                if len(due_records) < BATCH_SIZE:
+                    break
+
+        if not results['total']:
             logger.info("No dunning reminders due for processing")
             return
 
-        results = {
-            'total': len(due_records),
-            'succeeded': 0,
-            'failed': 0,
-            'skipped': 0
-        }
-
-        for item in due_records:
-            record = item['record']
-            next_stage = item['next_stage']
-            dunning_record_id = record.get('id')
-
-            try:
-                result = await process_dunning_reminder(
-                    dunning_record_id=str(dunning_record_id),
-                    next_stage=next_stage
-                )
-
-                if result.get('success'):
-                    results['succeeded'] += 1
-                elif result.get('skipped'):
-                    results['skipped'] += 1
-                else:
-                    results['failed'] += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to process dunning record {dunning_record_id}: {e}"
-                )
-                results['failed'] += 1
-
         # Log summary
         elapsed_time = (datetime.utcnow() - start_time).total_seconds()
         logger.info(
@@ -264,28 +307,31 @@ async def process_all_due_dunning_reminders():
 
 def scheduled_job():
     """
-    Wrapper function for APScheduler
+    Job runner entry point: process every due dunning reminder
 
-    APScheduler requires a synchronous function, so we wrap the async
-    processing function here.
+    Runs on a job runner worker thread, with its own event loop.
     """
-    import asyncio
+    global dunning_service, due_queue
 
     logger.info("Dunning scheduler job triggered")
 
-    try:
-        # Create event loop if needed
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+    # Errors here fail the run, which the job runner retries
+    if dunning_service is None:
+        dunning_service = get_dunning_service()
+    if due_queue is None:
+        due_queue = get_dunning_due_queue()
 
-        # Run the async processing function
-        loop.run_until_complete(process_all_due_dunning_reminders())
+    asyncio.run(process_all_due_dunning_reminders())
 
-    except Exception as e:
-        logger.error(f"Error in scheduled job: {e}")
+
+def register_jobs(runner: JobRunner):
+    """
+    Register the dunning run (every 2 hours) on a job runner
+
+    Args:
+        runner: Job runner
+    """
+    runner.register(JOB_NAME, scheduled_job, interval=JOB_INTERVAL, priority=PRIORITY_NORMAL)
 
 
 def shutdown_handler(signum, frame):
@@ -297,29 +343,17 @@ def shutdown_handler(signum, frame):
         frame: Current stack frame
     """
     logger.info(f"Received signal {signum}, shutting down gracefully...")
-    scheduler.shutdown(wait=True)
-    logger.info("Dunning scheduler stopped")
-    sys.exit(0)
-
-
-# Create scheduler instance
-scheduler = BlockingScheduler(
-    timezone='UTC',
-    job_defaults={
-        'coalesce': True,  # Combine missed runs into one
-        'max_instances': 1,  # Only one instance at a time
-        'misfire_grace_time': 300  # Allow 5 minutes grace for missed runs
-    }
-)
+    stop_event.set()
 
 
 def main():
     """
     Main entry point for dunning scheduler
 
-    Sets up signal handlers, initializes services, configures scheduler,
-    and starts the blocking scheduler loop.
+    Sets up signal handlers, initializes services, registers the job and
+    runs the job runner until a shutdown signal.
     """
+    configure_logging()
     logger.info("Starting WWMAA Dunning Scheduler...")
     logger.info(f"Environment: {settings.PYTHON_ENV}")
     logger.info(f"Grace period: {dunning_service.grace_period_days if dunning_service else 14} days")
@@ -331,25 +365,28 @@ def main():
     # Initialize services
     initialize_services()
 
+    # Restore reminders the due queue may have lost (e.g. a Redis restart)
+    try:
+        asyncio.run(dunning_service.reseed_due_queue())
+    except DunningServiceError as e:
+        logger.error(f"Failed to reseed dunning due queue: {e}")
+
     # Add scheduled job - runs every 2 hours
-    scheduler.add_job(
-        func=scheduled_job,
-        trigger=IntervalTrigger(hours=2),
-        id='dunning_reminder_processor',
-        name='Process Due Dunning Reminders',
-        replace_existing=True
-    )
+    runner = get_job_runner()
+    register_jobs(runner)
 
     logger.info("Dunning scheduler configured to run every 2 hours")
 
-    # Run immediately on startup (optional - can be disabled)
-    logger.info("Running initial dunning check...")
-    scheduled_job()
+    # Run immediately on startup (optional - can be disabled); skipped if a
+    # run is already waiting
+    logger.info("Queueing initial dunning check...")
+    runner.trigger(JOB_NAME)
 
-    # Start scheduler (blocking)
+    # Run the job runner (blocking)
     try:
         logger.info("Dunning scheduler started successfully")
-        scheduler.start()
+        runner.run_forever(stop_event)
+        logger.info("Dunning scheduler stopped")
     except (KeyboardInterrupt, SystemExit):
         logger.info("Dunning scheduler stopped by user")
     except Exception as e:
@@ -0,0 +1,92 @@
+"""
+Outbound Email Queue Worker
+
+Delivers email queued in Redis by EmailQueueService (bulk event emails,
+board notifications and other queued sends) to Postmark, up to 500
+messages per batch request.
+
+Run one or more instances, each with one or more worker threads; they
+share the work through a Redis consumer group, and entries left
+unacknowledged by a crashed instance are reclaimed by the others.
+
+Usage:
+    python -m backend.scripts.email_queue_worker [--workers N]
+
+Safety Features:
+    - Messages already marked sent are never resent on redelivery
+    - Failed messages are retried with exponential backoff
+    - Graceful shutdown on SIGTERM/SIGINT (finishes the current batch)
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+
+from backend.config import settings
+from backend.services.email_queue_service import get_email_queue_service
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+stop_event = threading.Event()
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, finishing current batches...")
+    stop_event.set()
+
+
+def main():
+    """
+    Main entry point for the email queue worker
+    """
+    parser = argparse.ArgumentParser(description="Deliver queued outbound email")
+    parser.add_argument("--workers", type=int, default=2, help="Worker threads (default: 2)")
+    args = parser.parse_args()
+
+    logger.info(f"Starting WWMAA Email Queue Worker with {args.workers} thread(s)...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    service = get_email_queue_service()
+    consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
+    threads = [
+        threading.Thread(
+            target=service.run,
+            args=(stop_event, f"{consumer_prefix}-{i}"),
+            name=f"email-worker-{i}",
+            daemon=True
+        )
+        for i in range(args.workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Wait in short intervals so signal handlers run in the main thread
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    logger.info("Email queue worker stopped")
+
+
+if __name__ == "__main__":
+    main()
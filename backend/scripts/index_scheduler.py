@@ -3,7 +3,9 @@
 Content Indexing Background Scheduler
 
 Automated scheduler for running content indexing at regular intervals.
-Uses APScheduler for reliable scheduling with graceful shutdown handling.
+Registers the run on the shared Redis-backed JobRunner (one run per interval
+across replicas, never overlapping, retried on failure) and handles graceful
+shutdown.
 
 Usage:
     python backend/scripts/index_scheduler.py
@@ -23,40 +25,36 @@ Features:
 import logging
 import signal
 import sys
-import time
+import threading
 from datetime import datetime
 from typing import Optional
 
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-    from apscheduler.triggers.interval import IntervalTrigger
-    from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
-except ImportError:
-    print("APScheduler is required. Install it with: pip install APScheduler")
-    sys.exit(1)
-
 # Add parent directory to path for imports
 sys.path.insert(0, "/Users/aideveloper/Desktop/wwmaa")
 
 from backend.config import settings
 from backend.services.indexing_service import (
     get_indexing_service,
-    ContentType,
     IndexingStatus
 )
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO if settings.is_production else logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/Users/aideveloper/Desktop/wwmaa/backend/logs/indexing_scheduler.log')
-    ]
-)
+from backend.services.job_runner import JobRunner, get_job_runner, PRIORITY_LOW
 
 logger = logging.getLogger(__name__)
 
+JOB_NAME = "incremental_indexing"
+
+
+def configure_logging():
+    """Log to stdout and the indexing scheduler log file"""
+    logging.basicConfig(
+        level=logging.INFO if settings.is_production else logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('/Users/aideveloper/Desktop/wwmaa/backend/logs/indexing_scheduler.log')
+        ]
+    )
+
 
 class IndexingScheduler:
     """
@@ -66,11 +64,17 @@ class IndexingScheduler:
     graceful shutdown on termination signals.
     """
 
-    def __init__(self):
-        """Initialize the indexing scheduler."""
+    def __init__(self, runner: Optional[JobRunner] = None):
+        """
+        Initialize the indexing scheduler.
+
+        Args:
+            runner: Job runner (defaults to the global runner)
+        """
         self.indexing_service = get_indexing_service()
-        self.scheduler = BackgroundScheduler()
+        self.runner = runner or get_job_runner()
         self.is_running = False
+        self._stop_event = threading.Event()
 
         # Get interval from settings
         self.interval_hours = settings.INDEXING_SCHEDULE_INTERVAL_HOURS
@@ -84,16 +88,6 @@ class IndexingScheduler:
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
 
-        # Add event listeners
-        self.scheduler.add_listener(
-            self._job_executed_listener,
-            EVENT_JOB_EXECUTED
-        )
-        self.scheduler.add_listener(
-            self._job_error_listener,
-            EVENT_JOB_ERROR
-        )
-
     def _signal_handler(self, signum, frame):
         """
         Handle termination signals for graceful shutdown.
@@ -104,28 +98,20 @@ class IndexingScheduler:
         """
         signal_name = signal.Signals(signum).name
         logger.info(f"Received {signal_name}, initiating graceful shutdown...")
-        self.stop()
-        sys.exit(0)
-
-    def _job_executed_listener(self, event):
-        """
-        Listener for successful job execution.
-
-        Args:
-            event: APScheduler job execution event
-        """
-        logger.info(f"Indexing job completed successfully: {event.job_id}")
+        self._stop_event.set()
 
-    def _job_error_listener(self, event):
+    def register_jobs(self, runner: Optional[JobRunner] = None):
         """
-        Listener for job errors.
+        Register the incremental indexing run on a job runner.
 
         Args:
-            event: APScheduler job error event
+            runner: Job runner (defaults to this scheduler's runner)
         """
-        logger.error(
-            f"Indexing job failed: {event.job_id}, "
-            f"exception: {event.exception}"
+        (runner or self.runner).register(
+            JOB_NAME,
+            self.run_indexing,
+            interval=int(self.interval_hours * 3600),
+            priority=PRIORITY_LOW
         )
 
     def run_indexing(self):
@@ -148,48 +134,13 @@ class IndexingScheduler:
                 return
 
             # Index each content type incrementally
-            content_types = [
-                ContentType.EVENTS,
-                ContentType.ARTICLES,
-                ContentType.TRAINING_VIDEOS,
-                ContentType.MEMBER_PROFILES
-            ]
-
-            total_indexed = 0
-            total_skipped = 0
-            total_errors = 0
-
-            for content_type in content_types:
-                logger.info(f"Indexing {content_type.value}...")
-
-                try:
-                    result = self.indexing_service.index_collection(
-                        content_type=content_type,
-                        incremental=True
-                    )
-
-                    indexed = result.get("indexed", 0)
-                    skipped = result.get("skipped", 0)
-                    errors = result.get("errors", 0)
-
-                    total_indexed += indexed
-                    total_skipped += skipped
-                    total_errors += errors
-
-                    logger.info(
-                        f"  {content_type.value}: "
-                        f"{indexed} indexed, {skipped} skipped, {errors} errors"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error indexing {content_type.value}: {e}")
-                    total_errors += 1
+            totals = self.indexing_service.index_incremental()
 
             # Log summary
             logger.info("-" * 80)
             logger.info(
                 f"Indexing run completed: "
-                f"{total_indexed} indexed, {total_skipped} skipped, {total_errors} errors"
+                f"{totals['indexed']} indexed, {totals['skipped']} skipped, {totals['errors']} errors"
             )
             logger.info("=" * 80)
 
@@ -215,31 +166,21 @@ class IndexingScheduler:
                 self.run_indexing()
 
             # Schedule recurring indexing job
-            self.scheduler.add_job(
-                func=self.run_indexing,
-                trigger=IntervalTrigger(hours=self.interval_hours),
-                id='incremental_indexing',
-                name='Incremental Content Indexing',
-                replace_existing=True,
-                max_instances=1  # Prevent overlapping runs
-            )
-
-            # Start the scheduler
-            self.scheduler.start()
+            self.register_jobs()
             self.is_running = True
 
             logger.info(
                 f"Scheduler started successfully. "
-                f"Next run in {self.interval_hours} hours"
+                f"Next run at {self.get_next_run_time()}"
             )
 
-            # Keep the script running
+            # Run jobs until a termination signal
             try:
-                while self.is_running:
-                    time.sleep(60)  # Wake up every minute to check status
+                self.runner.run_forever(self._stop_event)
             except (KeyboardInterrupt, SystemExit):
                 logger.info("Received shutdown signal")
-                self.stop()
+            self.is_running = False
+            logger.info("Scheduler stopped successfully")
 
         except Exception as e:
             logger.error(f"Error starting scheduler: {e}", exc_info=True)
@@ -255,9 +196,9 @@ class IndexingScheduler:
         logger.info("Stopping indexing scheduler...")
 
         try:
-            # Shutdown the scheduler
-            if self.scheduler.running:
-                self.scheduler.shutdown(wait=True)
+            # Shutdown the job runner
+            self._stop_event.set()
+            self.runner.shutdown(wait=True)
 
             self.is_running = False
             logger.info("Scheduler stopped successfully")
@@ -273,10 +214,7 @@ class IndexingScheduler:
             ISO format timestamp of next run or None
         """
         try:
-            job = self.scheduler.get_job('incremental_indexing')
-            if job and job.next_run_time:
-                return job.next_run_time.isoformat()
-            return None
+            return self.runner.status().get(JOB_NAME, {}).get("next_run_at")
         except Exception as e:
             logger.error(f"Error getting next run time: {e}")
             return None
@@ -285,10 +223,12 @@ class IndexingScheduler:
         """
         Trigger an immediate indexing run manually.
 
-        This can be called via API or command line.
+        This can be called via API or command line; the run goes through the
+        job runner, so it never overlaps a scheduled run.
         """
         logger.info("Manual indexing run triggered")
-        self.run_indexing()
+        self.register_jobs()
+        self.runner.trigger(JOB_NAME)
 
 
 def main():
@@ -297,6 +237,7 @@ def main():
 
     Creates and starts the IndexingScheduler.
     """
+    configure_logging()
     logger.info("=" * 80)
     logger.info("WWMAA Content Indexing Scheduler")
     logger.info("=" * 80)
@@ -0,0 +1,137 @@
+"""
+Job Runner Worker
+
+Runs every periodic backend job on the shared Redis-backed JobRunner:
+- Training sessions: room creation, reminder emails, auto-end (every 5
+  minutes) and cleanup (daily at 2 AM UTC)
+- Dunning reminders (every 2 hours)
+- Newsletter member sync (daily at 3 AM UTC)
+- Incremental content indexing (every INDEXING_SCHEDULE_INTERVAL_HOURS)
+- Analytics aggregates reconciliation (every ANALYTICS_RECONCILE_INTERVAL_MINUTES)
+- Search index rebuild (daily at 4 AM UTC) and snapshot refresh (every 15 minutes)
+- Resuming interrupted GDPR account deletions (every 15 minutes)
+
+Run one or more instances (the single-job schedulers in this directory can
+run alongside); each scheduled run happens once across all of them, runs of
+one job never overlap, and runs of a crashed instance are retried by the
+others.
+
+Usage:
+    python -m backend.scripts.job_runner
+
+Environment Variables:
+    JOB_RUNNER_WORKERS: Jobs run in parallel by this instance (default: 4)
+
+Safety Features:
+    - Failed runs are retried with exponential backoff
+    - Graceful shutdown on SIGTERM/SIGINT (finishes running jobs)
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+from typing import Optional
+
+from backend.config import settings
+from backend.services.gdpr_service import GDPRService
+from backend.services.indexing_service import get_indexing_service
+from backend.services.job_runner import JobRunner, get_job_runner, PRIORITY_LOW
+from backend.services.newsletter_sync_job import get_newsletter_sync_job
+from backend.services.search_index import rebuild_search_indexes, save_snapshots
+from backend.services.session_scheduler import get_session_scheduler
+from backend.scripts import analytics_reconciler, dunning_scheduler
+
+logger = logging.getLogger(__name__)
+
+WORKERS = int(os.getenv("JOB_RUNNER_WORKERS", "4"))
+INDEXING_JOB_NAME = "incremental_indexing"
+SEARCH_INDEX_REBUILD_JOB_NAME = "search_index_rebuild"
+SEARCH_INDEX_SNAPSHOT_JOB_NAME = "search_index_snapshot"
+SEARCH_INDEX_SNAPSHOT_INTERVAL = 900  # Seconds between snapshot refreshes
+
+stop_event = threading.Event()
+
+
+def register_all_jobs(runner: Optional[JobRunner] = None) -> JobRunner:
+    """
+    Register every periodic job on a job runner
+
+    Args:
+        runner: Job runner (defaults to the global runner)
+
+    Returns:
+        The job runner
+    """
+    runner = runner or get_job_runner()
+
+    get_session_scheduler().register_jobs(runner)
+    dunning_scheduler.register_jobs(runner)
+    get_newsletter_sync_job().register_jobs(runner)
+    runner.register(
+        INDEXING_JOB_NAME,
+        get_indexing_service().index_incremental,
+        interval=int(settings.INDEXING_SCHEDULE_INTERVAL_HOURS * 3600),
+        priority=PRIORITY_LOW
+    )
+    analytics_reconciler.register_jobs(runner)
+    GDPRService().register_jobs(runner)
+    runner.register(
+        SEARCH_INDEX_REBUILD_JOB_NAME,
+        rebuild_search_indexes,
+        daily_at="04:00",
+        priority=PRIORITY_LOW
+    )
+    runner.register(
+        SEARCH_INDEX_SNAPSHOT_JOB_NAME,
+        save_snapshots,
+        interval=SEARCH_INDEX_SNAPSHOT_INTERVAL,
+        priority=PRIORITY_LOW
+    )
+
+    return runner
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, finishing running jobs...")
+    stop_event.set()
+
+
+def main():
+    """
+    Main entry point for the job runner worker
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    logger.info("Starting WWMAA Job Runner...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+    logger.info(f"Workers: {WORKERS}")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    try:
+        runner = register_all_jobs()
+        for name, job_status in runner.status().items():
+            logger.info(f"Job {name}: next run at {job_status['next_run_at']}")
+        runner.run_forever(stop_event, workers=WORKERS)
+    except Exception as e:
+        logger.error(f"Job runner crashed: {e}")
+        sys.exit(1)
+
+    logger.info("Job runner stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Dead-Lettered Webhook Replay Tool
+
+Lists the webhook events that failed every processing attempt and queues
+them again once the cause is fixed. A replayed event goes behind the
+pending events of its ordering key and gets a fresh set of attempts.
+
+Usage:
+    python -m backend.scripts.replay_webhooks list [--limit N]
+    python -m backend.scripts.replay_webhooks replay REF [REF ...]
+    python -m backend.scripts.replay_webhooks replay --all [--source stripe]
+
+REF is the event reference shown by ``list`` ("source:event_id").
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from backend.services.webhook_queue import get_webhook_queue, WebhookQueueError
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+LIST_LIMIT = 100
+REPLAY_ALL_LIMIT = 10000
+
+
+def list_dead_letters(limit: int) -> None:
+    """
+    Print dead-lettered events, newest first
+
+    Args:
+        limit: Maximum events to print
+    """
+    events = get_webhook_queue().dead_letters(limit=limit)
+    if not events:
+        print("No dead-lettered webhook events")
+        return
+
+    for event in events:
+        print(
+            f"{event['ref']}  {event.get('event_type', '')}  "
+            f"attempts={event.get('attempts', '?')}  error={event.get('error', '')}"
+        )
+
+
+def replay(refs: List[str], replay_all: bool = False, source: Optional[str] = None) -> int:
+    """
+    Queue dead-lettered events again
+
+    Args:
+        refs: Event references to replay
+        replay_all: Replay every dead-lettered event
+        source: With replay_all, only replay events of this source
+
+    Returns:
+        Number of events replayed
+    """
+    queue = get_webhook_queue()
+    if replay_all:
+        refs = [
+            event["ref"] for event in queue.dead_letters(limit=REPLAY_ALL_LIMIT)
+            if source is None or event.get("source") == source
+        ]
+
+    replayed = 0
+    for ref in refs:
+        if queue.replay(ref):
+            replayed += 1
+        else:
+            logger.warning(f"Webhook event {ref} not found")
+
+    logger.info(f"Replayed {replayed} of {len(refs)} webhook events")
+    return replayed
+
+
+def main():
+    """
+    Main entry point for the replay tool
+    """
+    parser = argparse.ArgumentParser(description="List and replay dead-lettered webhook events")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List dead-lettered events")
+    list_parser.add_argument("--limit", type=int, default=LIST_LIMIT, help=f"Events to list (default: {LIST_LIMIT})")
+
+    replay_parser = subparsers.add_parser("replay", help="Queue dead-lettered events again")
+    replay_parser.add_argument("refs", nargs="*", help="Event references (source:event_id)")
+    replay_parser.add_argument("--all", action="store_true", help="Replay every dead-lettered event")
+    replay_parser.add_argument("--source", help="With --all, only replay events of this source")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "list":
+            list_dead_letters(args.limit)
+        else:
+            if not args.refs and not args.all:
+                parser.error("replay needs event references or --all")
+            replay(args.refs, replay_all=args.all, source=args.source)
+    except WebhookQueueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
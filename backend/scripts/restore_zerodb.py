@@ -13,6 +13,8 @@ Features:
 - Point-in-time recovery
 - Dry-run mode for safety
 - Backup validation
+- Streaming NDJSON backups, read part by part with checksum verification
+- Concurrent batch upserts by original ID, resumable from a checkpoint
 
 Usage:
     python restore_zerodb.py --list
@@ -34,6 +36,10 @@ Examples:
 
     # Validate backup without restoring
     python restore_zerodb.py --backup-id users_full_20250109_120000 --validate-only
+
+    # Restore with 16 concurrent writers; re-running after an interruption
+    # resumes from the checkpoint (--no-resume starts over)
+    python restore_zerodb.py --backup-id users_full_20250109_120000 --workers 16
 """
 
 import argparse
@@ -43,12 +49,14 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 # Add backend to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.zerodb_service import ZeroDBClient, ZeroDBError
+from services.backup_stream import STREAM_FORMAT, iter_backup_documents
+from services.restore_engine import DEFAULT_BATCH_SIZE, DEFAULT_RESTORE_WORKERS, RestoreEngine
 from config import settings
 
 # Configure logging
@@ -73,16 +81,29 @@ class RestoreManager:
     downloading from object storage, decompression, and restoration.
     """
 
-    def __init__(self, client: Optional[ZeroDBClient] = None):
+    def __init__(
+        self,
+        client: Optional[ZeroDBClient] = None,
+        workers: int = DEFAULT_RESTORE_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
         """
         Initialize RestoreManager
 
         Args:
             client: ZeroDB client instance (creates new if not provided)
+            workers: Number of batches written concurrently
+            batch_size: Documents per batch
         """
         self.client = client or ZeroDBClient()
         self.temp_dir = Path(TEMP_DIR)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.engine = RestoreEngine(
+            self.client,
+            checkpoint_dir=self.temp_dir / "checkpoints",
+            workers=workers,
+            batch_size=batch_size
+        )
         logger.info("RestoreManager initialized")
 
     def list_backups(
@@ -308,24 +329,34 @@ class RestoreManager:
     def restore_documents(
         self,
         collection: str,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         dry_run: bool = False,
-        merge: bool = False
+        merge: bool = False,
+        restore_id: Optional[str] = None,
+        total: Optional[int] = None,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Restore documents to a collection
 
+        Documents are upserted by their original IDs in concurrent batches.
+        When a restore_id is given, progress is checkpointed so running the
+        same restore again resumes where it stopped.
+
         Args:
             collection: Collection name
-            documents: List of documents to restore
+            documents: Documents to restore (any iterable, consumed lazily)
             dry_run: If True, don't actually write to database
             merge: If True, merge with existing documents; if False, replace
+            restore_id: Stable ID (e.g. backup ID) used for the checkpoint
+            total: Expected document count, for the ETA
+            resume: If False, ignore any checkpoint and restore everything
 
         Returns:
             Restore result summary
         """
         logger.info(
-            f"Restoring {len(documents)} documents to '{collection}' "
+            f"Restoring documents to '{collection}' "
             f"(dry_run={dry_run}, merge={merge})"
         )
 
@@ -334,87 +365,103 @@ class RestoreManager:
             return {
                 "status": "dry_run",
                 "collection": collection,
-                "document_count": len(documents),
+                "document_count": sum(1 for _ in documents),
                 "created": 0,
                 "updated": 0,
-                "errors": 0
+                "errors": 0,
+                "error_details": []
             }
 
-        created = 0
-        updated = 0
-        errors = 0
-        error_details = []
-
-        for i, doc in enumerate(documents, 1):
-            try:
-                doc_id = doc.get("id")
-
-                if not doc_id:
-                    logger.warning(f"Document {i} has no ID, skipping")
-                    errors += 1
-                    continue
-
-                # Check if document exists
-                try:
-                    existing_doc = self.client.get_document(
-                        collection=collection,
-                        document_id=doc_id
-                    )
-
-                    # Document exists, update it
-                    self.client.update_document(
-                        collection=collection,
-                        document_id=doc_id,
-                        data=doc,
-                        merge=merge
-                    )
-                    updated += 1
-
-                except ZeroDBError:
-                    # Document doesn't exist, create it
-                    self.client.create_document(
-                        collection=collection,
-                        data=doc,
-                        document_id=doc_id
-                    )
-                    created += 1
-
-                # Log progress every 100 documents
-                if i % 100 == 0:
-                    logger.info(
-                        f"Progress: {i}/{len(documents)} documents processed "
-                        f"(created: {created}, updated: {updated}, errors: {errors})"
-                    )
-
-            except Exception as e:
-                errors += 1
-                error_msg = f"Error restoring document {i} (ID: {doc.get('id')}): {e}"
-                logger.error(error_msg)
-                error_details.append(error_msg)
+        return self.engine.restore(
+            collection,
+            restore_id or f"{collection}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            documents,
+            total=total,
+            merge=merge,
+            resume=resume and restore_id is not None
+        )
 
-        result = {
-            "status": "completed" if errors == 0 else "completed_with_errors",
-            "collection": collection,
-            "document_count": len(documents),
-            "created": created,
-            "updated": updated,
-            "errors": errors,
-            "error_details": error_details[:10]  # Limit to first 10 errors
-        }
+    def restore_stream_backup(
+        self,
+        metadata: Dict[str, Any],
+        dry_run: bool = False,
+        validate_only: bool = False,
+        merge: bool = False,
+        resume: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Restore a streaming (NDJSON) backup part by part
 
-        logger.info(
-            f"Restore completed: {created} created, {updated} updated, "
-            f"{errors} errors"
+        Each part is downloaded, checked against its checksum and deleted
+        once its documents have been handed to the restore engine.
+
+        Args:
+            metadata: Backup metadata listing the parts
+            dry_run: If True, don't actually write to database
+            validate_only: If True, only verify the parts and count documents
+            merge: If True, merge with existing documents; if False, replace
+            resume: If False, ignore any checkpoint and restore everything
+
+        Returns:
+            Restore result summary
+        """
+        backup_id = metadata["backup_id"]
+        documents = iter_backup_documents(
+            metadata.get("parts", []),
+            lambda file_name: self.download_backup(file_name),
+            remove_parts=True
         )
 
-        return result
+        if validate_only:
+            actual_count = sum(1 for _ in documents)
+            expected_count = metadata.get("document_count", 0)
+            issues = []
+            if actual_count != expected_count:
+                issues.append(
+                    f"Document count mismatch: expected {expected_count}, "
+                    f"found {actual_count}"
+                )
+            return {
+                "status": "validated" if not issues else "failed",
+                "backup_id": backup_id,
+                "collection": metadata.get("collection"),
+                "backup_type": metadata.get("backup_type"),
+                "backup_timestamp": metadata.get("completed_at"),
+                "validation": {
+                    "valid": not issues,
+                    "issues": issues,
+                    "collection": metadata.get("collection"),
+                    "backup_type": metadata.get("backup_type"),
+                    "document_count": actual_count
+                }
+            }
+
+        restore_result = self.restore_documents(
+            collection=metadata["collection"],
+            documents=documents,
+            dry_run=dry_run,
+            merge=merge,
+            restore_id=backup_id,
+            total=metadata.get("document_count"),
+            resume=resume
+        )
+
+        return {
+            "status": restore_result["status"],
+            "backup_id": backup_id,
+            "collection": metadata["collection"],
+            "backup_type": metadata.get("backup_type"),
+            "backup_timestamp": metadata.get("completed_at"),
+            "restore": restore_result
+        }
 
     def restore_backup(
         self,
         backup_id: str,
         dry_run: bool = False,
         validate_only: bool = False,
-        merge: bool = False
+        merge: bool = False,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Perform full restore workflow for a backup
@@ -424,6 +471,7 @@ class RestoreManager:
             dry_run: If True, don't actually write to database
             validate_only: If True, only validate backup without restoring
             merge: If True, merge with existing documents; if False, replace
+            resume: If False, ignore any checkpoint and restore everything
 
         Returns:
             Restore result summary
@@ -434,6 +482,15 @@ class RestoreManager:
             # Get backup metadata
             metadata = self.get_backup_metadata(backup_id)
 
+            if metadata.get("format") == STREAM_FORMAT:
+                return self.restore_stream_backup(
+                    metadata,
+                    dry_run=dry_run,
+                    validate_only=validate_only,
+                    merge=merge,
+                    resume=resume
+                )
+
             # Download backup file
             file_path = self.download_backup(metadata["file_name"])
 
@@ -465,7 +522,10 @@ class RestoreManager:
                 collection=backup_data["collection"],
                 documents=backup_data["documents"],
                 dry_run=dry_run,
-                merge=merge
+                merge=merge,
+                restore_id=backup_id,
+                total=backup_data.get("document_count"),
+                resume=resume
             )
 
             # Cleanup temp file
@@ -579,6 +639,26 @@ def main():
         help="Merge with existing documents instead of replacing"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_RESTORE_WORKERS,
+        help=f"Concurrent batch writers (default: {DEFAULT_RESTORE_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Documents per batch (default: {DEFAULT_BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore the checkpoint of an interrupted restore and start over"
+    )
+
     parser.add_argument(
         "--collection",
         type=str,
@@ -594,7 +674,7 @@ def main():
 
     args = parser.parse_args()
 
-    restore_manager = RestoreManager()
+    restore_manager = RestoreManager(workers=args.workers, batch_size=args.batch_size)
 
     # List backups mode
     if args.list:
@@ -630,7 +710,8 @@ def main():
                 backup_id=backup["backup_id"],
                 dry_run=args.dry_run,
                 validate_only=args.validate_only,
-                merge=args.merge
+                merge=args.merge,
+                resume=not args.no_resume
             )
             results.append(result)
 
@@ -656,7 +737,8 @@ def main():
             backup_id=args.backup_id,
             dry_run=args.dry_run,
             validate_only=args.validate_only,
-            merge=args.merge
+            merge=args.merge,
+            resume=not args.no_resume
         )
 
         # Print summary
@@ -682,6 +764,10 @@ def main():
             print(f"  Created: {result['restore']['created']}")
             print(f"  Updated: {result['restore']['updated']}")
             print(f"  Errors: {result['restore']['errors']}")
+            if result['restore'].get('skipped'):
+                print(f"  Skipped (restored by an earlier run): {result['restore']['skipped']}")
+            if 'documents_per_second' in result['restore']:
+                print(f"  Throughput: {result['restore']['documents_per_second']:,.0f} docs/s")
 
             if result['restore']['error_details']:
                 print("\n  Error Details (first 10):")
@@ -0,0 +1,123 @@
+"""
+RSVP Booking Worker
+
+Drains the RSVP write-behind stream: RSVPs reserved in Redis by the booking
+engine are persisted to ZeroDB in batches, and each touched event gets its
+current_attendees set from the seat counter. Every
+RSVP_RECONCILE_INTERVAL_SECONDS the seat counters of all loaded events are
+also reconciled against ZeroDB, and every RSVP_HOLD_SWEEP_INTERVAL_SECONDS
+expired seat holds (abandoned checkouts, unpaid waitlist promotions) are
+released and the freed seats offered to the waitlist.
+
+Run one or more instances; they share the stream through a Redis consumer
+group, and entries left unacknowledged by a crashed instance are reclaimed
+by the others.
+
+Usage:
+    python -m backend.scripts.rsvp_booking_worker
+
+Environment Variables:
+    RSVP_RECONCILE_INTERVAL_SECONDS: Seconds between reconciliations (default: 300)
+    RSVP_HOLD_SWEEP_INTERVAL_SECONDS: Seconds between hold sweeps (default: 60)
+
+Safety Features:
+    - Entries are acknowledged only after they reach ZeroDB
+    - Reconciliation never overrides seats not yet persisted
+    - Graceful shutdown on SIGTERM/SIGINT (finishes the current batch)
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+
+from backend.config import settings
+from backend.services.rsvp_booking_engine import get_rsvp_booking_engine
+from backend.services.rsvp_service import get_rsvp_service
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+RECONCILE_INTERVAL_SECONDS = int(os.getenv("RSVP_RECONCILE_INTERVAL_SECONDS", "300"))
+HOLD_SWEEP_INTERVAL_SECONDS = int(os.getenv("RSVP_HOLD_SWEEP_INTERVAL_SECONDS", "60"))
+
+stop_event = threading.Event()
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, finishing current batch...")
+    stop_event.set()
+
+
+def reconcile_loop():
+    """
+    Reconcile seat counters until shutdown
+
+    Errors are logged and never stop the loop; the next run retries.
+    """
+    engine = get_rsvp_booking_engine()
+    while not stop_event.wait(RECONCILE_INTERVAL_SECONDS):
+        try:
+            engine.reconcile_all()
+        except Exception as e:
+            logger.error(f"RSVP reconciliation failed: {e}")
+
+
+def hold_sweep_loop():
+    """
+    Release expired seat holds and promote waitlists until shutdown
+
+    Errors are logged and never stop the loop; the next run retries.
+    """
+    engine = get_rsvp_booking_engine()
+    while not stop_event.wait(HOLD_SWEEP_INTERVAL_SECONDS):
+        try:
+            for event_id in engine.expire_all_holds():
+                get_rsvp_service().promote_waitlist(event_id)
+        except Exception as e:
+            logger.error(f"RSVP hold sweep failed: {e}")
+
+
+def main():
+    """
+    Main entry point for the RSVP booking worker
+    """
+    logger.info("Starting WWMAA RSVP Booking Worker...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+    logger.info(f"Reconcile interval: {RECONCILE_INTERVAL_SECONDS} seconds")
+    logger.info(f"Hold sweep interval: {HOLD_SWEEP_INTERVAL_SECONDS} seconds")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    reconciler = threading.Thread(target=reconcile_loop, name="rsvp-reconcile", daemon=True)
+    reconciler.start()
+    sweeper = threading.Thread(target=hold_sweep_loop, name="rsvp-hold-sweep", daemon=True)
+    sweeper.start()
+
+    try:
+        get_rsvp_booking_engine().run(stop_event)
+    except Exception as e:
+        logger.error(f"RSVP booking worker crashed: {e}")
+        sys.exit(1)
+
+    reconciler.join(timeout=5)
+    sweeper.join(timeout=5)
+    logger.info("RSVP booking worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Webhook Queue Worker
+
+Processes the webhook events that the Stripe, Cloudflare and BeeHiiv webhook
+routes verified and queued. Events of one ordering key (a Stripe customer,
+a Cloudflare room or video, a BeeHiiv post) are processed one at a time in
+arrival order; different keys are processed in parallel.
+
+Run one or more instances, each with one or more worker threads; they share
+the queue in Redis, and keys leased by a crashed instance are handed out
+again once the lease lapses.
+
+Usage:
+    python -m backend.scripts.webhook_worker [--workers N]
+
+Safety Features:
+    - Failed events are retried with exponential backoff, holding back the
+      later events of the same key; events that keep failing are
+      dead-lettered (see scripts/replay_webhooks.py)
+    - Graceful shutdown on SIGTERM/SIGINT (finishes the current events)
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+from typing import Dict
+
+from backend.config import settings
+from backend.services.webhook_queue import get_webhook_queue, WebhookHandler
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+stop_event = threading.Event()
+
+
+def build_handlers() -> Dict[str, WebhookHandler]:
+    """
+    Handler for each webhook queue source
+
+    Returns:
+        Dictionary mapping sources to handlers
+    """
+    from backend.routes.webhooks import beehiiv, cloudflare
+    from backend.services.webhook_service import get_webhook_service
+
+    return {
+        "stripe": get_webhook_service().handle_queued_event,
+        "cloudflare_recording": cloudflare.handle_queued_event,
+        "cloudflare_stream": cloudflare.handle_queued_event,
+        "beehiiv": beehiiv.handle_queued_event,
+    }
+
+
+def shutdown_handler(signum, frame):
+    """
+    Graceful shutdown handler for SIGTERM and SIGINT
+
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    logger.info(f"Received signal {signum}, finishing current events...")
+    stop_event.set()
+
+
+def main():
+    """
+    Main entry point for the webhook queue worker
+    """
+    parser = argparse.ArgumentParser(description="Process queued webhook events")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads (default: 4)")
+    args = parser.parse_args()
+
+    logger.info(f"Starting WWMAA Webhook Worker with {args.workers} thread(s)...")
+    logger.info(f"Environment: {settings.PYTHON_ENV}")
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    queue = get_webhook_queue()
+    handlers = build_handlers()
+    threads = [
+        threading.Thread(
+            target=queue.run,
+            args=(stop_event, handlers),
+            name=f"webhook-worker-{i}",
+            daemon=True
+        )
+        for i in range(args.workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Wait in short intervals so signal handlers run in the main thread
+    while any(thread.is_alive() for thread in threads):
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    logger.info("Webhook worker stopped")
+
+
+if __name__ == "__main__":
+    main()
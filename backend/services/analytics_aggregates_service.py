@@ -0,0 +1,831 @@
+"""
+Analytics Aggregates Service - Materialized Dashboard Counters
+
+Maintains the admin dashboard metrics incrementally in Redis so the
+dashboard can be served without scanning users, subscriptions, payments
+and events on every cache expiry.
+
+Write paths (Stripe webhooks, SubscriptionService, UserService,
+EventService, TrainingSessionService, application reviews, registration)
+call the ``record_*`` hooks as they persist documents. Every hook is idempotent, so webhook retries and duplicate
+calls never double count:
+
+- Members, active subscriptions, live training sessions and pending
+  applications are kept as Redis SETs of document IDs (SADD/SREM + SCARD)
+- Revenue is kept in integer cents, guarded by a per-payment ledger so a
+  payment is counted (and reversed on refund) exactly once
+- Monthly revenue and daily signups are time-bucketed rollups (HASH
+  fields keyed by ``YYYY-MM`` / ``YYYY-MM-DD``)
+- Published events are kept in a ZSET scored by start time, so upcoming
+  and this-month counts are a ZCOUNT
+
+``reconcile()`` periodically recomputes everything from the source
+collections and atomically swaps the rebuilt structures in, correcting
+any drift from missed hooks. While a rebuild is running, every hook also
+appends its operation to a journal in the same MULTI/EXEC as its write;
+the rebuild replays the journal over the scanned state and swaps only if
+no entry arrived since (WATCH), so writes made during the scan survive. ``get_snapshot()`` reads the dashboard in a
+single pipelined round trip, independent of data volume.
+
+While Redis is unreachable the hooks are skipped (reconciliation catches
+up) and Redis is retried after ``REDIS_RETRY_INTERVAL``, so write paths
+never wait on connection timeouts.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+import redis
+
+from backend.config import get_settings
+from backend.services.zerodb_service import get_zerodb_client, ZeroDBClient
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Get settings
+settings = get_settings()
+
+
+# Redis keys
+KEY_PREFIX = "analytics:agg"
+MEMBERS_KEY = f"{KEY_PREFIX}:members"
+ACTIVE_SUBSCRIPTIONS_KEY = f"{KEY_PREFIX}:active_subscriptions"
+PAYMENT_LEDGER_KEY = f"{KEY_PREFIX}:payment_ledger"
+TOTALS_KEY = f"{KEY_PREFIX}:totals"
+REVENUE_BY_MONTH_KEY = f"{KEY_PREFIX}:revenue_by_month"
+SIGNUPS_BY_DAY_KEY = f"{KEY_PREFIX}:signups_by_day"
+EVENTS_BY_START_KEY = f"{KEY_PREFIX}:events_by_start"
+LIVE_SESSIONS_KEY = f"{KEY_PREFIX}:live_sessions"
+PENDING_APPLICATIONS_KEY = f"{KEY_PREFIX}:pending_applications"
+REBUILD_KEY = f"{KEY_PREFIX}:rebuilding"  # Token of the running reconciliation
+JOURNAL_KEY = f"{KEY_PREFIX}:journal"  # Hook operations made during a rebuild
+
+ALL_KEYS = [
+    MEMBERS_KEY,
+    ACTIVE_SUBSCRIPTIONS_KEY,
+    LIVE_SESSIONS_KEY,
+    PENDING_APPLICATIONS_KEY,
+    PAYMENT_LEDGER_KEY,
+    TOTALS_KEY,
+    REVENUE_BY_MONTH_KEY,
+    SIGNUPS_BY_DAY_KEY,
+    EVENTS_BY_START_KEY,
+]
+
+# Window used for the "recent signups" metric
+RECENT_SIGNUP_DAYS = 30
+
+# Page size used when scanning source collections during reconciliation
+RECONCILE_PAGE_SIZE = 1000
+RECONCILE_TIMEOUT = 900  # Seconds a reconciliation may hold the rebuild marker
+RECONCILE_SWAP_ATTEMPTS = 5  # Journal replays before giving up on the swap
+
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after a connection error
+
+# Count a payment once: record it in the ledger and add it to the totals
+_COUNT_PAYMENT_SCRIPT = """
+if redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[2] .. '|' .. ARGV[3]) == 1 then
+    redis.call('HINCRBY', KEYS[2], 'revenue_cents', ARGV[2])
+    redis.call('HINCRBY', KEYS[3], ARGV[3], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Reverse a previously counted payment (refund/failure) exactly once
+_REVERSE_PAYMENT_SCRIPT = """
+local entry = redis.call('HGET', KEYS[1], ARGV[1])
+if not entry then
+    return 0
+end
+local sep = string.find(entry, '|', 1, true)
+local cents = tonumber(string.sub(entry, 1, sep - 1))
+local month = string.sub(entry, sep + 1)
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('HINCRBY', KEYS[2], 'revenue_cents', -cents)
+redis.call('HINCRBY', KEYS[3], month, -cents)
+return 1
+"""
+
+
+# Journal a hook operation while a rebuild is running
+_JOURNAL_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return 0
+"""
+
+# End a rebuild only if the caller still owns it
+_RELEASE_REBUILD_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1], KEYS[2])
+end
+return 0
+"""
+
+
+class AnalyticsAggregatesError(Exception):
+    """Base exception for analytics aggregate operations"""
+    pass
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the raw value of an Enum member (or the value unchanged)"""
+    return getattr(value, "value", value)
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO date string (or datetime) into a naive UTC datetime.
+
+    Args:
+        value: ISO format date string or datetime
+
+    Returns:
+        Parsed datetime, or None if the value cannot be parsed
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is not None:
+        parsed = (parsed - parsed.utcoffset()).replace(tzinfo=None)
+    return parsed
+
+
+def _to_cents(amount: Any) -> int:
+    """Convert a dollar amount to integer cents (None/invalid -> 0)"""
+    try:
+        return int(round(float(amount or 0) * 100))
+    except (TypeError, ValueError):
+        return 0
+
+
+def is_counted_member(user: Dict[str, Any]) -> bool:
+    """Whether a user document counts towards ``total_members``"""
+    return _enum_value(user.get("role")) == "member" and bool(user.get("is_active", False))
+
+
+def is_active_subscription(subscription: Dict[str, Any]) -> bool:
+    """Whether a subscription document counts towards ``active_subscriptions``"""
+    return _enum_value(subscription.get("status")) == "active"
+
+
+def is_succeeded_payment(payment: Dict[str, Any]) -> bool:
+    """Whether a payment document counts towards revenue"""
+    return _enum_value(payment.get("status")) == "succeeded"
+
+
+def is_listed_event(event: Dict[str, Any]) -> bool:
+    """Whether an event document counts towards the event metrics"""
+    return bool(event.get("is_published")) and not event.get("is_deleted", False)
+
+
+def is_live_session(session: Dict[str, Any]) -> bool:
+    """Whether a training session document counts towards ``active_sessions``"""
+    return _enum_value(session.get("status")) == "live"
+
+
+def is_pending_application(application: Dict[str, Any]) -> bool:
+    """Whether an application document counts towards ``pending_applications``"""
+    return _enum_value(application.get("status")) == "submitted"
+
+
+def payment_month(payment: Dict[str, Any]) -> str:
+    """Return the ``YYYY-MM`` revenue bucket for a payment document"""
+    created = (
+        _parse_date(payment.get("created_at"))
+        or _parse_date(payment.get("processed_at"))
+        or datetime.utcnow()
+    )
+    return created.strftime("%Y-%m")
+
+
+class AnalyticsAggregatesService:
+    """
+    Incrementally maintained aggregates for the admin analytics dashboard.
+
+    All write hooks are best-effort: failures are logged and never
+    propagate to the calling write path, since reconciliation corrects
+    any drift from source data.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        zerodb_client: Optional[ZeroDBClient] = None
+    ):
+        """
+        Initialize analytics aggregates service
+
+        Args:
+            redis_client: Optional Redis client (defaults to settings.REDIS_URL)
+            zerodb_client: Optional ZeroDB client used for reconciliation
+        """
+        self._redis = redis_client
+        self._db = zerodb_client
+        self._count_payment = None
+        self._reverse_payment = None
+        self._journal_script = None
+        self._release_rebuild = None
+        self._redis_retry_at = 0.0
+
+    @property
+    def redis(self) -> Optional[redis.Redis]:
+        """
+        Get or create the Redis client.
+
+        Returns:
+            Redis client, or None if Redis is unavailable (or was within
+            the last ``REDIS_RETRY_INTERVAL`` seconds)
+        """
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            try:
+                self._redis = redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+                self._redis.ping()
+            except Exception as e:
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                logger.warning(
+                    f"Redis unavailable, analytics aggregates disabled for {REDIS_RETRY_INTERVAL}s: {e}"
+                )
+                self._redis = None
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Bypass Redis for ``REDIS_RETRY_INTERVAL`` after a connection error"""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
+    @property
+    def db(self) -> ZeroDBClient:
+        """Get the ZeroDB client (lazily, only needed for reconciliation)"""
+        if self._db is None:
+            self._db = get_zerodb_client()
+        return self._db
+
+    def _scripts(self):
+        """Register Lua scripts on first use"""
+        if self._count_payment is None:
+            self._count_payment = self.redis.register_script(_COUNT_PAYMENT_SCRIPT)
+            self._reverse_payment = self.redis.register_script(_REVERSE_PAYMENT_SCRIPT)
+            self._journal_script = self.redis.register_script(_JOURNAL_SCRIPT)
+            self._release_rebuild = self.redis.register_script(_RELEASE_REBUILD_SCRIPT)
+        return self._count_payment, self._reverse_payment
+
+    def _journal(self, pipe, *operation: Any) -> None:
+        """Queue a journal append (a no-op unless a rebuild is running) on a pipeline"""
+        self._scripts()
+        self._journal_script(
+            keys=[REBUILD_KEY, JOURNAL_KEY],
+            args=[json.dumps(operation), RECONCILE_TIMEOUT],
+            client=pipe
+        )
+
+    # ------------------------------------------------------------------
+    # Write hooks
+    # ------------------------------------------------------------------
+
+    def record_user(
+        self,
+        user_id: str,
+        user: Dict[str, Any],
+        created: bool = False
+    ) -> None:
+        """
+        Sync a user document into the member set.
+
+        Args:
+            user_id: User ID
+            user: Full (merged) user document after the write
+            created: True when the user was just registered (counts a signup)
+        """
+        client = self.redis
+        if client is None or not user_id:
+            return
+
+        try:
+            pipe = client.pipeline()
+            command = "sadd" if is_counted_member(user) else "srem"
+            getattr(pipe, command)(MEMBERS_KEY, str(user_id))
+            self._journal(pipe, command, MEMBERS_KEY, str(user_id))
+
+            if created:
+                created_at = _parse_date(user.get("created_at")) or datetime.utcnow()
+                day = created_at.strftime("%Y-%m-%d")
+                pipe.hincrby(SIGNUPS_BY_DAY_KEY, day, 1)
+                self._journal(pipe, "signup", str(user_id), day)
+
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to update member aggregates for user {user_id}: {e}")
+
+    def record_subscription(self, subscription_id: str, subscription: Dict[str, Any]) -> None:
+        """
+        Sync a subscription document into the active subscription set.
+
+        Args:
+            subscription_id: Subscription ID
+            subscription: Full (merged) subscription document after the write
+        """
+        self._sync_member(
+            ACTIVE_SUBSCRIPTIONS_KEY, subscription_id, is_active_subscription(subscription), "subscription"
+        )
+
+    def record_training_session(self, session_id: str, session: Dict[str, Any]) -> None:
+        """
+        Sync a training session document into the live session set.
+
+        Args:
+            session_id: Training session ID
+            session: Full (merged) session document after the write
+        """
+        self._sync_member(LIVE_SESSIONS_KEY, session_id, is_live_session(session), "training session")
+
+    def record_application(self, application_id: str, application: Dict[str, Any]) -> None:
+        """
+        Sync an application document into the pending application set.
+
+        Args:
+            application_id: Application ID
+            application: Full (merged) application document after the write
+        """
+        self._sync_member(
+            PENDING_APPLICATIONS_KEY, application_id, is_pending_application(application), "application"
+        )
+
+    def _sync_member(self, key: str, document_id: str, counted: bool, kind: str) -> None:
+        """Add a document ID to (or remove it from) an aggregate set"""
+        client = self.redis
+        if client is None or not document_id:
+            return
+
+        try:
+            pipe = client.pipeline()
+            command = "sadd" if counted else "srem"
+            getattr(pipe, command)(key, str(document_id))
+            self._journal(pipe, command, key, str(document_id))
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to update aggregates for {kind} {document_id}: {e}")
+
+    def record_payment(self, payment_id: str, payment: Dict[str, Any]) -> None:
+        """
+        Count or reverse a payment in the revenue totals.
+
+        Succeeded payments are added once; any other status (refunded,
+        failed) reverses a previously counted amount.
+
+        Args:
+            payment_id: Payment ID
+            payment: Full (merged) payment document after the write
+        """
+        client = self.redis
+        if client is None or not payment_id:
+            return
+
+        try:
+            count_payment, reverse_payment = self._scripts()
+            keys = [PAYMENT_LEDGER_KEY, TOTALS_KEY, REVENUE_BY_MONTH_KEY]
+            pipe = client.pipeline()
+
+            if is_succeeded_payment(payment):
+                cents = _to_cents(payment.get("amount"))
+                month = payment_month(payment)
+                count_payment(keys=keys, args=[str(payment_id), cents, month], client=pipe)
+                self._journal(pipe, "payment", str(payment_id), f"{cents}|{month}")
+            else:
+                reverse_payment(keys=keys, args=[str(payment_id)], client=pipe)
+                self._journal(pipe, "refund", str(payment_id))
+
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to update revenue aggregates for payment {payment_id}: {e}")
+
+    def record_event(self, event_id: str, event: Dict[str, Any]) -> None:
+        """
+        Sync an event document into the event start-time index.
+
+        Args:
+            event_id: Event ID
+            event: Full (merged) event document after the write
+        """
+        client = self.redis
+        if client is None or not event_id:
+            return
+
+        try:
+            start = _parse_date(event.get("start_date"))
+            pipe = client.pipeline()
+            if is_listed_event(event) and start is not None:
+                pipe.zadd(EVENTS_BY_START_KEY, {str(event_id): start.timestamp()})
+                self._journal(pipe, "zadd", EVENTS_BY_START_KEY, str(event_id), start.timestamp())
+            else:
+                pipe.zrem(EVENTS_BY_START_KEY, str(event_id))
+                self._journal(pipe, "zrem", EVENTS_BY_START_KEY, str(event_id))
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to update event aggregates for event {event_id}: {e}")
+
+    def remove_event(self, event_id: str) -> None:
+        """
+        Remove a (hard-deleted) event from the event start-time index.
+
+        Args:
+            event_id: Event ID
+        """
+        client = self.redis
+        if client is None or not event_id:
+            return
+
+        try:
+            pipe = client.pipeline()
+            pipe.zrem(EVENTS_BY_START_KEY, str(event_id))
+            self._journal(pipe, "zrem", EVENTS_BY_START_KEY, str(event_id))
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to remove event {event_id} from aggregates: {e}")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_snapshot(self, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read the dashboard metrics in a single pipelined round trip.
+
+        Every operation is O(1) or O(log n) (SCARD, HGETALL on a small
+        totals hash, HMGET on fixed bucket lists, ZCOUNT).
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Analytics dictionary, or None if aggregates have not been
+            built yet (no reconciliation has run) or Redis is unavailable
+        """
+        client = self.redis
+        if client is None:
+            return None
+
+        now = now or datetime.utcnow()
+        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        signup_days = [
+            (now - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range(RECENT_SIGNUP_DAYS + 1)
+        ]
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.scard(MEMBERS_KEY)
+            pipe.scard(ACTIVE_SUBSCRIPTIONS_KEY)
+            pipe.scard(LIVE_SESSIONS_KEY)
+            pipe.scard(PENDING_APPLICATIONS_KEY)
+            pipe.hgetall(TOTALS_KEY)
+            pipe.hget(REVENUE_BY_MONTH_KEY, now.strftime("%Y-%m"))
+            pipe.hmget(SIGNUPS_BY_DAY_KEY, signup_days)
+            pipe.zcount(EVENTS_BY_START_KEY, f"({now.timestamp()}", "+inf")
+            pipe.zcount(EVENTS_BY_START_KEY, start_of_month.timestamp(), "+inf")
+            (
+                total_members,
+                active_subscriptions,
+                active_sessions,
+                pending_applications,
+                totals,
+                month_cents,
+                signup_counts,
+                upcoming_events,
+                events_this_month,
+            ) = pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            logger.error(f"Failed to read analytics aggregates: {e}")
+            return None
+
+        if not totals or "reconciled_at" not in totals:
+            return None
+
+        return {
+            "total_members": int(total_members),
+            "active_subscriptions": int(active_subscriptions),
+            "total_revenue": round(int(totals.get("revenue_cents", 0)) / 100, 2),
+            "recent_signups": sum(int(count) for count in signup_counts if count),
+            "upcoming_events": int(upcoming_events),
+            "active_sessions": int(active_sessions),
+            "pending_applications": int(pending_applications),
+            "total_events_this_month": int(events_this_month),
+            "revenue_this_month": round(int(month_cents or 0) / 100, 2),
+            "generated_at": totals["reconciled_at"],
+        }
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def _iter_documents(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through a source collection.
+
+        Args:
+            collection: Collection name
+            filters: Optional filters
+
+        Yields:
+            Documents with ``id`` and ``data`` keys
+        """
+        offset = 0
+        while True:
+            result = self.db.query_documents(
+                collection=collection,
+                filters=filters or {},
+                limit=RECONCILE_PAGE_SIZE,
+                offset=offset
+            )
+            documents = result.get("documents", [])
+            yield from documents
+
+            if len(documents) < RECONCILE_PAGE_SIZE:
+                break
+            offset += RECONCILE_PAGE_SIZE
+
+    def _scan_sources(self, now: datetime) -> Dict[str, Any]:
+        """
+        Scan the source collections into in-memory aggregate state.
+
+        Documents are keyed by ID while paging, so one seen on two pages
+        is counted once.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            State dictionary with ``sets``, ``ledger``, ``signup_days``
+            and ``events``
+        """
+        signup_cutoff = now - timedelta(days=RECENT_SIGNUP_DAYS + 1)
+        event_cutoff = now.replace(day=1) - timedelta(days=1)
+
+        members = set()
+        signup_days: Dict[str, str] = {}
+        for doc in self._iter_documents("users"):
+            user = doc.get("data", {})
+            if is_counted_member(user):
+                members.add(str(doc.get("id")))
+            created_at = _parse_date(user.get("created_at"))
+            if created_at and created_at >= signup_cutoff:
+                signup_days[str(doc.get("id"))] = created_at.strftime("%Y-%m-%d")
+
+        ledger: Dict[str, str] = {}
+        for doc in self._iter_documents("payments", {"status": "succeeded"}):
+            payment = doc.get("data", {})
+            ledger[str(doc.get("id"))] = f"{_to_cents(payment.get('amount'))}|{payment_month(payment)}"
+
+        events: Dict[str, float] = {}
+        for doc in self._iter_documents("events", {"is_published": True, "is_deleted": False}):
+            start = _parse_date(doc.get("data", {}).get("start_date"))
+            if start is not None and start >= event_cutoff:
+                events[str(doc.get("id"))] = start.timestamp()
+
+        sets = {
+            MEMBERS_KEY: members,
+            ACTIVE_SUBSCRIPTIONS_KEY: {
+                str(doc.get("id"))
+                for doc in self._iter_documents("subscriptions", {"status": "active"})
+            },
+            LIVE_SESSIONS_KEY: {
+                str(doc.get("id"))
+                for doc in self._iter_documents("training_sessions", {"status": "live"})
+            },
+            PENDING_APPLICATIONS_KEY: {
+                str(doc.get("id"))
+                for doc in self._iter_documents("applications", {"status": "submitted"})
+            },
+        }
+
+        return {"sets": sets, "ledger": ledger, "signup_days": signup_days, "events": events}
+
+    def _replay_journal(self, state: Dict[str, Any], entries: List[str], now: datetime) -> None:
+        """
+        Apply hook operations journaled during a rebuild to the scanned state.
+
+        Args:
+            state: State returned by ``_scan_sources`` (updated in place)
+            entries: JSON encoded operations, in journal order
+            now: Reference time
+        """
+        signup_cutoff = (now - timedelta(days=RECENT_SIGNUP_DAYS + 1)).strftime("%Y-%m-%d")
+        event_cutoff = (now.replace(day=1) - timedelta(days=1)).timestamp()
+
+        for entry in entries:
+            command, *args = json.loads(entry)
+            if command == "sadd" and args[0] in state["sets"]:
+                state["sets"][args[0]].add(args[1])
+            elif command == "srem" and args[0] in state["sets"]:
+                state["sets"][args[0]].discard(args[1])
+            elif command == "signup" and args[1] >= signup_cutoff:
+                state["signup_days"].setdefault(args[0], args[1])
+            elif command == "payment":
+                state["ledger"].setdefault(args[0], args[1])
+            elif command == "refund":
+                state["ledger"].pop(args[0], None)
+            elif command == "zadd":
+                if args[2] >= event_cutoff:
+                    state["events"][args[1]] = args[2]
+                else:
+                    state["events"].pop(args[1], None)
+            elif command == "zrem":
+                state["events"].pop(args[1], None)
+
+    def _stage(self, state: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """
+        Derive the Redis structures to swap in from aggregate state.
+
+        Args:
+            state: Scanned (and replayed) aggregate state
+            now: Reference time
+
+        Returns:
+            Mapping of key -> (command, values)
+        """
+        signups: Dict[str, int] = {}
+        for day in state["signup_days"].values():
+            signups[day] = signups.get(day, 0) + 1
+
+        revenue_by_month: Dict[str, int] = {}
+        revenue_cents = 0
+        for entry in state["ledger"].values():
+            cents, month = entry.split("|", 1)
+            revenue_by_month[month] = revenue_by_month.get(month, 0) + int(cents)
+            revenue_cents += int(cents)
+
+        totals = {
+            "revenue_cents": revenue_cents,
+            "reconciled_at": now.isoformat(),
+        }
+
+        staged = {key: ("sadd", list(members)) for key, members in state["sets"].items()}
+        staged.update({
+            PAYMENT_LEDGER_KEY: ("hset", state["ledger"]),
+            TOTALS_KEY: ("hset", totals),
+            REVENUE_BY_MONTH_KEY: ("hset", revenue_by_month),
+            SIGNUPS_BY_DAY_KEY: ("hset", signups),
+            EVENTS_BY_START_KEY: ("zadd", state["events"]),
+        })
+        return staged
+
+    def reconcile(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Recompute all aggregates from source collections.
+
+        A rebuild marker makes the write hooks journal their operations
+        while the source collections are scanned. The journal is replayed
+        over the scanned state, the structures are rebuilt under temporary
+        keys and swapped in with RENAME inside a MULTI/EXEC that WATCHes
+        the journal, so readers never see a partial state and hook writes
+        made during the rebuild are never lost.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Fresh analytics snapshot
+
+        Raises:
+            AnalyticsAggregatesError: If Redis is unavailable, another
+                reconciliation is running, or the rebuild fails
+        """
+        client = self.redis
+        if client is None:
+            raise AnalyticsAggregatesError("Redis is unavailable")
+
+        now = now or datetime.utcnow()
+        token = uuid4().hex
+        suffix = f":rebuild:{token}"
+
+        try:
+            self._scripts()
+            if not client.set(REBUILD_KEY, token, nx=True, ex=RECONCILE_TIMEOUT):
+                raise AnalyticsAggregatesError("Analytics reconciliation is already running")
+            # Entries left by an abandoned rebuild; new ones are pushed only
+            # after writes the scan below will see
+            client.delete(JOURNAL_KEY)
+        except AnalyticsAggregatesError:
+            raise
+        except Exception as e:
+            self._redis_failed(e)
+            raise AnalyticsAggregatesError(f"Failed to start analytics reconciliation: {e}")
+
+        try:
+            state = self._scan_sources(now)
+            applied = 0
+
+            for _ in range(RECONCILE_SWAP_ATTEMPTS):
+                entries = client.lrange(JOURNAL_KEY, applied, -1)
+                self._replay_journal(state, entries, now)
+                applied += len(entries)
+                staged = self._stage(state, now)
+
+                build = client.pipeline(transaction=False)
+                for key, (command, values) in staged.items():
+                    temp_key = key + suffix
+                    build.delete(temp_key)
+                    if not values:
+                        continue
+                    if command == "sadd":
+                        build.sadd(temp_key, *values)
+                    elif command == "hset":
+                        build.hset(temp_key, mapping=values)
+                    else:
+                        build.zadd(temp_key, values)
+                build.execute()
+
+                with client.pipeline(transaction=True) as swap:
+                    swap.watch(REBUILD_KEY, JOURNAL_KEY)
+                    if swap.get(REBUILD_KEY) != token:
+                        raise AnalyticsAggregatesError("Reconciliation exceeded RECONCILE_TIMEOUT")
+                    if swap.llen(JOURNAL_KEY) != applied:
+                        continue
+
+                    swap.multi()
+                    for key, (_, values) in staged.items():
+                        if values:
+                            swap.rename(key + suffix, key)
+                        else:
+                            swap.delete(key)
+                    swap.delete(REBUILD_KEY, JOURNAL_KEY)
+                    try:
+                        swap.execute()
+                    except redis.WatchError:
+                        continue
+                    break
+            else:
+                raise AnalyticsAggregatesError(
+                    f"Analytics aggregates kept changing over {RECONCILE_SWAP_ATTEMPTS} rebuild attempts"
+                )
+        except AnalyticsAggregatesError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to rebuild analytics aggregates: {e}")
+            raise AnalyticsAggregatesError(f"Failed to rebuild analytics aggregates: {e}")
+        finally:
+            try:
+                self._release_rebuild(keys=[REBUILD_KEY, JOURNAL_KEY], args=[token])
+                client.delete(*[key + suffix for key in ALL_KEYS])
+            except Exception as e:
+                logger.warning(f"Failed to clean up analytics rebuild {token}: {e}")
+
+        logger.info(
+            f"Analytics aggregates reconciled: {len(state['sets'][MEMBERS_KEY])} members, "
+            f"{len(state['sets'][ACTIVE_SUBSCRIPTIONS_KEY])} active subs, "
+            f"{len(state['ledger'])} payments, {len(state['events'])} events, "
+            f"{applied} journaled writes replayed"
+        )
+
+        return self.get_snapshot(now=now) or {}
+
+
+# Singleton instance
+_aggregates_service: Optional[AnalyticsAggregatesService] = None
+
+
+def get_analytics_aggregates_service() -> AnalyticsAggregatesService:
+    """
+    Get or create the analytics aggregates service singleton
+
+    Returns:
+        AnalyticsAggregatesService instance
+    """
+    global _aggregates_service
+
+    if _aggregates_service is None:
+        _aggregates_service = AnalyticsAggregatesService()
+
+    return _aggregates_service
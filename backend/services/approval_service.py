@@ -24,7 +24,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBNotFoundError, ZeroDBValidationError
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
 from backend.services.email_service import get_email_service
+from backend.services.search_index import record_person
 from backend.models.schemas import (
     ApplicationStatus,
     ApprovalStatus,
@@ -95,6 +97,7 @@ class ApprovalService:
             zerodb_client: Optional ZeroDB client instance (creates new if not provided)
         """
         self.db = zerodb_client or ZeroDBClient()
+        self.aggregates = get_analytics_aggregates_service()
         logger.info("ApprovalService initialized")
 
     def validate_approval_eligibility(
@@ -283,6 +286,7 @@ class ApprovalService:
                     merge=True
                 )
                 updated_app = update_result.get("data", {})
+                self.aggregates.record_application(application_id, {**application, **update_data})
 
                 logger.info(
                     f"Application {application_id} status updated: "
@@ -403,6 +407,7 @@ class ApprovalService:
                 update_data,
                 merge=True
             )
+            self.aggregates.record_application(application_id, {**application, **update_data})
 
             # Upgrade user role to member
             try:
@@ -413,6 +418,8 @@ class ApprovalService:
                     merge=True
                 )
                 logger.info(f"User {user_id} role upgraded to MEMBER")
+                user = self.db.get_document("users", str(user_id)).get("data", {})
+                record_person(str(user_id), {**user, "role": UserRole.MEMBER.value})
             except ZeroDBNotFoundError:
                 logger.error(f"User {user_id} not found, cannot upgrade role")
 
@@ -509,6 +516,7 @@ class ApprovalService:
             update_data,
             merge=True
         )
+        self.aggregates.record_application(application_id, update_data)
 
         # Create audit log
         self._create_audit_log(
@@ -836,6 +844,7 @@ class ApprovalService:
                 merge=True
             )
             updated_app = updated_result.get("data", {})
+            self.aggregates.record_application(application_id, {**application, **update_data})
 
             # Create rejection record in approvals collection
             rejection_approval = {
@@ -17,7 +17,10 @@ from typing import Optional, List, Dict, Any
 from uuid import UUID
 
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
-from backend.services.email_service import get_email_service, EmailSendError
+from backend.services.email_service import get_email_service
+from backend.services.email_queue_service import get_email_queue_service, EmailQueueError
+from backend.services.email_template_service import get_email_template_service
+from backend.services.rsvp_booking_engine import get_rsvp_booking_engine, RSVPBookingError
 from backend.models.schemas import RSVP, RSVPStatus, Event
 
 # Configure logging
@@ -45,6 +48,9 @@ class AttendeeService:
         """Initialize Attendee Service"""
         self.db = get_zerodb_client()
         self.email_service = get_email_service()
+        self.email_queue = get_email_queue_service()
+        self.templates = get_email_template_service()
+        self.booking = get_rsvp_booking_engine()
         logger.info("AttendeeService initialized")
 
     def get_attendees(
@@ -236,6 +242,10 @@ class AttendeeService:
         """
         Send bulk email to attendees
 
+        Messages are handed to the outbound email queue in one batch and
+        delivered by the queue workers through Postmark's batch endpoint;
+        delivery progress is available from get_bulk_email_status.
+
         Args:
             event_id: Event UUID
             subject: Email subject
@@ -244,10 +254,11 @@ class AttendeeService:
             user_email: Email of user sending (for tracking)
 
         Returns:
-            Dictionary with send results
+            Dictionary with send results (sent counts messages accepted
+            for delivery) and the queue batch_id
 
         Raises:
-            AttendeeServiceError: If sending fails
+            AttendeeServiceError: If the messages cannot be queued
         """
         try:
             # Get attendees
@@ -263,14 +274,19 @@ class AttendeeService:
                 return {
                     "sent": 0,
                     "failed": 0,
+                    "total": 0,
+                    "errors": [],
                     "message": "No attendees found matching criteria"
                 }
 
-            sent_count = 0
             failed_count = 0
             errors = []
+            messages = []
+
+            # Layout and message are rendered once; only the name varies
+            template = self.templates.get("event_bulk_update").bind({"message": message})
 
-            # Send email to each attendee
+            # Build one message per attendee
             for attendee in attendees:
                 email = attendee.get("user_email")
                 name = attendee.get("user_name", "Attendee")
@@ -281,93 +297,42 @@ class AttendeeService:
                     continue
 
                 try:
-                    # Create HTML email body
-                    html_body = f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <meta charset="UTF-8">
-                        <style>
-                            body {{
-                                font-family: Arial, sans-serif;
-                                line-height: 1.6;
-                                color: #333;
-                                max-width: 600px;
-                                margin: 0 auto;
-                                padding: 20px;
-                            }}
-                            .header {{
-                                background-color: #8B0000;
-                                color: white;
-                                padding: 20px;
-                                text-align: center;
-                                border-radius: 5px 5px 0 0;
-                            }}
-                            .content {{
-                                background-color: #f9f9f9;
-                                padding: 30px;
-                                border-radius: 0 0 5px 5px;
-                            }}
-                            .footer {{
-                                margin-top: 30px;
-                                padding-top: 20px;
-                                border-top: 1px solid #ddd;
-                                font-size: 12px;
-                                color: #666;
-                                text-align: center;
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="header">
-                            <h1>WWMAA Event Update</h1>
-                        </div>
-                        <div class="content">
-                            <h2>Hello, {name}!</h2>
-                            {message}
-                        </div>
-                        <div class="footer">
-                            <p>Women's Martial Arts Association of America</p>
-                            <p>This email was sent to event attendees.</p>
-                        </div>
-                    </body>
-                    </html>
-                    """
-
-                    # Plain text version
-                    text_body = f"Hello, {name}!\n\n{message}\n\n---\nWomen's Martial Arts Association of America"
-
-                    # Send email via Postmark
-                    self.email_service._send_email(
+                    rendered = template.render({"recipient_name": name})
+
+                    messages.append(self.email_service.build_message(
                         to_email=email,
                         subject=subject,
-                        html_body=html_body,
-                        text_body=text_body,
+                        html_body=rendered.html,
+                        text_body=rendered.text,
                         tag="event-bulk-email",
                         metadata={
                             "event_id": str(event_id),
                             "attendee_name": name,
                             "sent_by": user_email or "system"
                         }
-                    )
+                    ))
 
-                    sent_count += 1
-                    logger.info(f"Sent bulk email to {email}")
-
-                except EmailSendError as e:
-                    failed_count += 1
-                    errors.append(f"Failed to send to {email}: {str(e)}")
-                    logger.error(f"Failed to send email to {email}: {e}")
                 except Exception as e:
                     failed_count += 1
-                    errors.append(f"Error sending to {email}: {str(e)}")
-                    logger.error(f"Unexpected error sending to {email}: {e}")
+                    errors.append(f"Error preparing email to {email}: {str(e)}")
+                    logger.error(f"Unexpected error preparing email to {email}: {e}")
+
+            batch_id = None
+            if messages:
+                try:
+                    batch_id, _ = self.email_queue.enqueue_many(messages)
+                except EmailQueueError as e:
+                    logger.error(f"Failed to queue bulk email for event {event_id}: {e}")
+                    raise AttendeeServiceError(f"Bulk email failed: {e}")
+
+                logger.info(f"Queued {len(messages)} bulk emails for event {event_id} (batch {batch_id})")
 
             return {
-                "sent": sent_count,
+                "sent": len(messages),
                 "failed": failed_count,
                 "total": len(attendees),
-                "errors": errors[:10]  # Limit errors returned
+                "errors": errors[:10],  # Limit errors returned
+                "batch_id": batch_id
             }
 
         except AttendeeServiceError:
@@ -376,6 +341,19 @@ class AttendeeService:
             logger.error(f"Error sending bulk email: {e}")
             raise AttendeeServiceError(f"Bulk email failed: {e}")
 
+    def get_bulk_email_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get delivery progress of a bulk email
+
+        Args:
+            batch_id: Batch ID returned by send_bulk_email
+
+        Returns:
+            Dictionary with total, queued, sent and failed counts, or None
+            if the batch is unknown or expired
+        """
+        return self.email_queue.get_batch_status(batch_id)
+
     def check_in_attendee(
         self,
         rsvp_id: UUID,
@@ -477,6 +455,10 @@ class AttendeeService:
         """
         Promote attendees from waitlist to confirmed
 
+        Attendees are taken from the head of the waitlist queue (priority,
+        then join time) in one atomic step, even if the event is full
+        (admin override).
+
         Args:
             event_id: Event UUID
             count: Number of attendees to promote
@@ -488,62 +470,44 @@ class AttendeeService:
             AttendeeServiceError: If promotion fails
         """
         try:
-            # Get waitlist attendees (ordered by RSVP date)
-            result = self.db.query_documents(
-                collection="rsvps",
-                filters={
-                    "event_id": str(event_id),
-                    "status": RSVPStatus.WAITLIST.value
-                },
-                limit=count,
-                sort={"created_at": "asc"}  # First-come, first-served
-            )
-
-            waitlist_attendees = result.get("documents", [])
-
-            if not waitlist_attendees:
+            now = datetime.utcnow().isoformat()
+            try:
+                promoted = self.booking.promote_next(
+                    str(event_id),
+                    count=count,
+                    update={
+                        "status": RSVPStatus.CONFIRMED.value,
+                        "promoted_at": now,
+                        "updated_at": now
+                    },
+                    ignore_capacity=True
+                )
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, promoting waitlist directly: {e}")
+                return self._promote_from_waitlist_directly(event_id, count)
+
+            if not promoted:
                 return {
                     "promoted": 0,
                     "message": "No attendees on waitlist"
                 }
 
-            promoted_count = 0
             promoted_attendees = []
-
-            # Promote each attendee
-            for attendee in waitlist_attendees[:count]:
-                try:
-                    rsvp_id = attendee.get("id")
-
-                    # Update status to confirmed
-                    self.db.update_document(
-                        collection="rsvps",
-                        document_id=rsvp_id,
-                        data={
-                            "status": RSVPStatus.CONFIRMED.value,
-                            "promoted_at": datetime.utcnow().isoformat(),
-                            "updated_at": datetime.utcnow().isoformat()
-                        },
-                        merge=True
-                    )
-
-                    promoted_count += 1
-                    promoted_attendees.append({
-                        "id": rsvp_id,
-                        "name": attendee.get("user_name"),
-                        "email": attendee.get("user_email")
-                    })
-
-                    # TODO: Send notification email to promoted attendee
-                    logger.info(f"Promoted attendee {rsvp_id} from waitlist")
-
-                except Exception as e:
-                    logger.error(f"Error promoting attendee: {e}")
+            for _, rsvp_id in promoted:
+                attendee = self.booking.get_pending(rsvp_id)
+                if attendee is None:
+                    attendee = self.db.get_document("rsvps", rsvp_id).get("data", {})
+                promoted_attendees.append({
+                    "id": rsvp_id,
+                    "name": attendee.get("user_name"),
+                    "email": attendee.get("user_email")
+                })
+                logger.info(f"Promoted attendee {rsvp_id} from waitlist")
 
             return {
-                "promoted": promoted_count,
+                "promoted": len(promoted_attendees),
                 "attendees": promoted_attendees,
-                "message": f"Promoted {promoted_count} attendee(s) from waitlist"
+                "message": f"Promoted {len(promoted_attendees)} attendee(s) from waitlist"
             }
 
         except ZeroDBError as e:
@@ -553,6 +517,81 @@ class AttendeeService:
             logger.error(f"Unexpected error promoting waitlist: {e}")
             raise AttendeeServiceError(f"Unexpected error: {e}")
 
+    def _promote_from_waitlist_directly(
+        self,
+        event_id: UUID,
+        count: int
+    ) -> Dict[str, Any]:
+        """
+        Promote waitlisted attendees without the booking engine
+
+        Fallback for when Redis is unavailable.
+
+        Args:
+            event_id: Event UUID
+            count: Number of attendees to promote
+
+        Returns:
+            Dictionary with promotion results
+        """
+        # Get waitlist attendees (ordered by RSVP date)
+        result = self.db.query_documents(
+            collection="rsvps",
+            filters={
+                "event_id": str(event_id),
+                "status": RSVPStatus.WAITLIST.value
+            },
+            limit=count,
+            sort={"created_at": "asc"}  # First-come, first-served
+        )
+
+        waitlist_attendees = result.get("documents", [])
+
+        if not waitlist_attendees:
+            return {
+                "promoted": 0,
+                "message": "No attendees on waitlist"
+            }
+
+        promoted_count = 0
+        promoted_attendees = []
+
+        # Promote each attendee
+        for attendee in waitlist_attendees[:count]:
+            try:
+                rsvp_id = attendee.get("id")
+
+                # Update status to confirmed
+                self.db.update_document(
+                    collection="rsvps",
+                    document_id=rsvp_id,
+                    data={
+                        "status": RSVPStatus.CONFIRMED.value,
+                        "promoted_at": datetime.utcnow().isoformat(),
+                        "updated_at": datetime.utcnow().isoformat()
+                    },
+                    merge=True
+                )
+
+                promoted_count += 1
+                promoted_attendees.append({
+                    "id": rsvp_id,
+                    "name": attendee.get("user_name"),
+                    "email": attendee.get("user_email")
+                })
+
+                # TODO: Send notification email to promoted attendee
+                logger.info(f"Promoted attendee {rsvp_id} from waitlist")
+
+            except Exception as e:
+                logger.error(f"Error promoting attendee: {e}")
+
+        return {
+            "promoted": promoted_count,
+            "attendees": promoted_attendees,
+            "message": f"Promoted {promoted_count} attendee(s) from waitlist"
+        }
+
     def get_attendee_stats(self, event_id: UUID) -> Dict[str, Any]:
         """
         Get attendance statistics for an event
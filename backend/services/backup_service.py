@@ -7,10 +7,16 @@ and full restore capabilities with validation.
 
 Features:
 - Full and incremental backups for all 14 collections
+- Streaming NDJSON backups: documents are written page by page through an
+  incremental gzip compressor into fixed-size parts with SHA-256 checksums
+  (see backup_stream), and collections are backed up in parallel
 - Gzip compression for efficient storage
 - Upload to ZeroDB Object Storage
 - Automated retention policy (7 daily, 4 weekly, 12 monthly backups)
 - Point-in-time recovery
+- Bulk restore: documents are streamed from the backup and upserted by
+  original ID in concurrent batches, with a checkpoint so an interrupted
+  restore resumes where it stopped (see restore_engine)
 - Backup validation and integrity checks
 - Comprehensive error handling and logging
 
@@ -24,8 +30,11 @@ Usage:
 
     backup_service = BackupService()
 
-    # Backup all collections
-    result = backup_service.backup_all_collections()
+    # Backup all collections (streaming format, 4 collections at a time)
+    result = backup_service.backup_all_collections(max_workers=4)
+
+    # Streaming backup of a single collection
+    result = backup_service.stream_backup_collection("users", compress_level=6)
 
     # Backup single collection
     result = backup_service.backup_collection("users")
@@ -40,12 +49,31 @@ Usage:
 import gzip
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from uuid import uuid4
 
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBError
+from backend.services.backup_stream import (
+    DEFAULT_COMPRESS_LEVEL,
+    DEFAULT_PART_SIZE,
+    STREAM_FORMAT,
+    BackupIntegrityError,
+    BackupPart,
+    StreamingBackupWriter,
+    iter_backup_documents,
+    manifest_file_name,
+    read_manifest,
+    write_manifest,
+)
+from backend.services.restore_engine import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_RESTORE_WORKERS,
+    RestoreEngine,
+    RestoreProgress,
+)
 from backend.models.schemas import get_all_models
 from backend.config import settings
 
@@ -56,6 +84,9 @@ logger = logging.getLogger(__name__)
 BACKUP_METADATA_COLLECTION = "backup_metadata"
 BACKUP_VERSION = "1.0.0"
 TEMP_DIR = "/tmp/zerodb_backups"
+STREAM_PAGE_SIZE = 500  # Documents fetched per query when streaming a collection
+DEFAULT_BACKUP_WORKERS = 4  # Collections backed up in parallel
+RESTORE_CHECKPOINT_DIR = "restore_checkpoints"  # Under temp_dir
 
 # Retention policy constants
 RETENTION_DAILY_DAYS = 7  # Keep daily backups for 7 days
@@ -147,6 +178,45 @@ class BackupService:
             logger.warning(f"Could not retrieve last backup timestamp for '{collection}': {e}")
             return None
 
+    def iter_collection_documents(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = STREAM_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every document of a collection, one page in memory at a time
+
+        Args:
+            collection: Collection name
+            filters: Optional query filters
+            page_size: Documents fetched per query
+
+        Yields:
+            Documents in creation order
+
+        Raises:
+            ZeroDBError: If a page cannot be fetched
+        """
+        offset = 0
+
+        while True:
+            result = self.client.query_documents(
+                collection=collection,
+                filters=filters or {},
+                limit=page_size,
+                offset=offset,
+                sort={"created_at": "asc"}
+            )
+
+            batch = result.get("documents", [])
+            yield from batch
+            offset += len(batch)
+
+            # If we got fewer documents than the page size, we're done
+            if len(batch) < page_size:
+                break
+
     def export_collection_data(
         self,
         collection: str,
@@ -274,7 +344,8 @@ class BackupService:
     def upload_to_storage(
         self,
         file_path: Path,
-        metadata: Dict[str, str]
+        metadata: Dict[str, str],
+        content_type: str = "application/gzip"
     ) -> Dict[str, Any]:
         """
         Upload compressed backup file to ZeroDB Object Storage
@@ -282,6 +353,7 @@ class BackupService:
         Args:
             file_path: Path to compressed backup file
             metadata: Metadata to attach to the uploaded object
+            content_type: MIME type of the file
 
         Returns:
             Upload result from ZeroDB Object Storage API
@@ -297,7 +369,7 @@ class BackupService:
                 file_path=str(file_path),
                 object_name=object_name,
                 metadata=metadata,
-                content_type="application/gzip"
+                content_type=content_type
             )
 
             logger.info(f"Successfully uploaded backup: {object_name}")
@@ -369,6 +441,21 @@ class BackupService:
             logger.error(error_msg)
             raise BackupError(error_msg) from e
 
+    @staticmethod
+    def _backup_object_paths(backup: Dict[str, Any]) -> List[str]:
+        """
+        Object storage paths that make up a backup
+
+        Args:
+            backup: Backup metadata document
+
+        Returns:
+            Manifest or single-file path, followed by any part paths
+        """
+        paths = [backup.get("object_path", f"backups/{backup['file_name']}")]
+        paths.extend(f"backups/{part['file_name']}" for part in backup.get("parts", []))
+        return paths
+
     def apply_retention_policy(self, collection: str) -> Dict[str, Any]:
         """
         Enforce backup retention policy by deleting old backups
@@ -453,8 +540,8 @@ class BackupService:
                 if backup_id not in keep_backup_ids:
                     try:
                         # Delete from object storage
-                        object_path = backup.get("object_path", f"backups/{backup['file_name']}")
-                        self.client.delete_object(object_path)
+                        for object_path in self._backup_object_paths(backup):
+                            self.client.delete_object(object_path)
 
                         # Delete metadata document
                         self.client.delete_document(
@@ -512,25 +599,17 @@ class BackupService:
         Raises:
             BackupError: If any step of backup process fails
         """
-        backup_type = "incremental" if incremental else "full"
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        backup_id = f"{collection}_{backup_type}_{timestamp}"
 
-        logger.info(f"Starting {backup_type} backup for collection '{collection}'")
+        logger.info(
+            f"Starting {'incremental' if incremental else 'full'} backup for collection '{collection}'"
+        )
 
         try:
             # For incremental backups, get last backup timestamp
-            since_timestamp = None
-            if incremental:
-                since_timestamp = self.get_last_backup_timestamp(collection, "full")
-                if not since_timestamp:
-                    logger.warning(
-                        f"No previous full backup found for '{collection}'. "
-                        f"Performing full backup instead."
-                    )
-                    incremental = False
-                    backup_type = "full"
-                    backup_id = f"{collection}_full_{timestamp}"
+            incremental, since_timestamp = self._resolve_incremental(collection, incremental)
+            backup_type = "incremental" if incremental else "full"
+            backup_id = f"{collection}_{backup_type}_{timestamp}"
 
             # Step 1: Export collection data
             export_data = self.export_collection_data(
@@ -595,10 +674,189 @@ class BackupService:
             logger.error(error_msg)
             raise BackupError(error_msg) from e
 
+    def _resolve_incremental(
+        self,
+        collection: str,
+        incremental: bool
+    ) -> Tuple[bool, Optional[datetime]]:
+        """
+        Decide whether an incremental backup is possible
+
+        Args:
+            collection: Collection name
+            incremental: Whether an incremental backup was requested
+
+        Returns:
+            Tuple of (incremental, since_timestamp); falls back to a full backup
+            when the collection has no previous full backup
+        """
+        if not incremental:
+            return False, None
+
+        since_timestamp = self.get_last_backup_timestamp(collection, "full")
+        if not since_timestamp:
+            logger.warning(
+                f"No previous full backup found for '{collection}'. "
+                f"Performing full backup instead."
+            )
+            return False, None
+
+        return True, since_timestamp
+
+    def stream_backup_collection(
+        self,
+        collection: str,
+        incremental: bool = False,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        part_size: int = DEFAULT_PART_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Back up a collection in the streaming NDJSON format
+
+        Documents are fetched page by page and written through an incremental
+        compressor; each part is uploaded and removed locally as soon as it
+        reaches ``part_size`` uncompressed bytes, so neither memory nor disk
+        use grows with the collection. A manifest listing the parts and their
+        SHA-256 checksums is uploaded last.
+
+        Args:
+            collection: Name of collection to backup
+            incremental: If True, perform incremental backup (only changed documents)
+            compress_level: gzip compression level (0-9)
+            part_size: Uncompressed bytes per part
+
+        Returns:
+            Backup result summary with status and metadata
+
+        Raises:
+            BackupError: If any step of backup process fails
+        """
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        uploaded: List[str] = []
+
+        logger.info(
+            f"Starting streaming {'incremental' if incremental else 'full'} backup "
+            f"for collection '{collection}'"
+        )
+
+        try:
+            incremental, since_timestamp = self._resolve_incremental(collection, incremental)
+            backup_type = "incremental" if incremental else "full"
+            backup_id = f"{collection}_{backup_type}_{timestamp}"
+            filters = {"updated_at": {"$gte": since_timestamp.isoformat()}} if incremental else {}
+
+            def upload_part(part: BackupPart) -> None:
+                self.upload_to_storage(part.path, {
+                    "collection": collection,
+                    "backup_id": backup_id,
+                    "sha256": part.sha256,
+                    "document_count": str(part.document_count),
+                    "version": BACKUP_VERSION
+                })
+                uploaded.append(f"backups/{part.file_name}")
+                part.path.unlink()
+
+            # Steps 1-3: Stream documents into compressed parts, uploading each as it closes
+            writer = StreamingBackupWriter(
+                self.temp_dir,
+                backup_id,
+                compress_level=compress_level,
+                part_size=part_size,
+                on_part=upload_part
+            )
+            with writer:
+                writer.write_many(self.iter_collection_documents(collection, filters))
+            parts = [part.to_manifest() for part in writer.parts]
+
+            # Step 4: Upload the manifest
+            manifest = {
+                "backup_id": backup_id,
+                "collection": collection,
+                "backup_type": backup_type,
+                "format": STREAM_FORMAT,
+                "version": BACKUP_VERSION,
+                "timestamp": datetime.utcnow().isoformat(),
+                "since_timestamp": since_timestamp.isoformat() if since_timestamp else None,
+                "document_count": writer.document_count,
+                "compress_level": compress_level,
+                "parts": parts
+            }
+            file_name = manifest_file_name(backup_id)
+            manifest_path = self.temp_dir / file_name
+            manifest_size = write_manifest(manifest_path, manifest)
+            upload_result = self.upload_to_storage(
+                manifest_path,
+                {
+                    "collection": collection,
+                    "backup_type": backup_type,
+                    "timestamp": timestamp,
+                    "document_count": str(writer.document_count),
+                    "format": STREAM_FORMAT,
+                    "version": BACKUP_VERSION
+                },
+                content_type="application/json"
+            )
+            uploaded.append(f"backups/{file_name}")
+            manifest_path.unlink()
+
+            # Step 5: Save backup metadata
+            file_size = manifest_size + sum(part["size"] for part in parts)
+            self.save_backup_metadata(
+                backup_id=backup_id,
+                collection=collection,
+                backup_type=backup_type,
+                file_name=file_name,
+                file_size=file_size,
+                document_count=writer.document_count,
+                additional_metadata={"format": STREAM_FORMAT, "parts": parts}
+            )
+
+            # Step 6: Enforce retention policy
+            retention_result = self.apply_retention_policy(collection)
+
+            result = {
+                "status": "success",
+                "backup_id": backup_id,
+                "collection": collection,
+                "backup_type": backup_type,
+                "format": STREAM_FORMAT,
+                "timestamp": timestamp,
+                "document_count": writer.document_count,
+                "file_size": file_size,
+                "file_name": file_name,
+                "object_path": f"backups/{file_name}",
+                "parts": parts,
+                "upload_result": upload_result,
+                "retention_applied": retention_result
+            }
+
+            logger.info(
+                f"Successfully completed streaming {backup_type} backup for '{collection}': "
+                f"{backup_id} ({writer.document_count} documents in {len(parts)} part(s))"
+            )
+
+            return result
+
+        except Exception as e:
+            # Don't leave a partial backup behind in object storage
+            for object_path in uploaded:
+                try:
+                    self.client.delete_object(object_path)
+                except ZeroDBError as cleanup_error:
+                    logger.warning(f"Failed to delete partial backup object '{object_path}': {cleanup_error}")
+
+            error_msg = f"Backup failed for collection '{collection}': {e}"
+            logger.error(error_msg)
+            raise BackupError(error_msg) from e
+
     def backup_all_collections(
         self,
         incremental: bool = False,
-        exclude_collections: Optional[List[str]] = None
+        exclude_collections: Optional[List[str]] = None,
+        streaming: bool = True,
+        max_workers: int = DEFAULT_BACKUP_WORKERS,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        part_size: int = DEFAULT_PART_SIZE
     ) -> Dict[str, Any]:
         """
         Backup all ZeroDB collections
@@ -606,11 +864,18 @@ class BackupService:
         Args:
             incremental: If True, perform incremental backups where possible
             exclude_collections: Optional list of collections to exclude from backup
+            streaming: If True, use the streaming NDJSON format; otherwise one JSON file per collection
+            max_workers: Collections backed up in parallel
+            compress_level: gzip compression level for streaming backups (0-9)
+            part_size: Uncompressed bytes per part for streaming backups
 
         Returns:
             Summary of all backup operations with individual results
         """
-        logger.info(f"Starting backup of all collections (incremental={incremental})")
+        logger.info(
+            f"Starting backup of all collections (incremental={incremental}, "
+            f"streaming={streaming}, workers={max_workers})"
+        )
 
         exclude_set = set(exclude_collections or [])
         collections_to_backup = [c for c in self.collections if c not in exclude_set]
@@ -621,21 +886,36 @@ class BackupService:
 
         start_time = datetime.utcnow()
 
-        for collection in collections_to_backup:
+        def backup_one(collection: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
             try:
-                result = self.backup_collection(
-                    collection=collection,
-                    incremental=incremental
-                )
-                results.append(result)
-                successful.append(collection)
+                if streaming:
+                    result = self.stream_backup_collection(
+                        collection=collection,
+                        incremental=incremental,
+                        compress_level=compress_level,
+                        part_size=part_size
+                    )
+                else:
+                    result = self.backup_collection(
+                        collection=collection,
+                        incremental=incremental
+                    )
+                return collection, result, None
 
             except BackupError as e:
                 logger.error(f"Failed to backup collection '{collection}': {e}")
-                failed.append({
-                    "collection": collection,
-                    "error": str(e)
-                })
+                return collection, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="backup") as executor:
+            for collection, result, error in executor.map(backup_one, collections_to_backup):
+                if error is None:
+                    results.append(result)
+                    successful.append(collection)
+                else:
+                    failed.append({
+                        "collection": collection,
+                        "error": error
+                    })
 
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
@@ -647,6 +927,7 @@ class BackupService:
             "failed": len(failed),
             "duration_seconds": duration,
             "backup_type": "incremental" if incremental else "full",
+            "format": STREAM_FORMAT if streaming else "json",
             "timestamp": end_time.isoformat(),
             "successful_collections": successful,
             "failed_collections": failed,
@@ -728,6 +1009,71 @@ class BackupService:
             logger.error(error_msg)
             raise RestoreError(error_msg) from e
 
+    def iter_stream_backup(
+        self,
+        backup: Dict[str, Any],
+        backup_dir: Optional[Path] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the documents of a streaming (NDJSON) backup
+
+        Parts are fetched one at a time, verified against their checksums and
+        decompressed line by line, so only one part is on disk at once.
+
+        Args:
+            backup: Backup metadata or manifest listing the ``parts``
+            backup_dir: Local directory holding the parts (default: download
+                each part from object storage and delete it once read)
+
+        Yields:
+            Documents in backup order
+
+        Raises:
+            RestoreError: If a part cannot be downloaded, is missing or fails its checksum
+        """
+        parts = backup.get("parts", [])
+        if backup_dir is None:
+            documents = iter_backup_documents(parts, self.download_backup, remove_parts=True)
+        else:
+            documents = iter_backup_documents(parts, lambda file_name: Path(backup_dir) / file_name)
+
+        try:
+            yield from documents
+        except BackupIntegrityError as e:
+            raise RestoreError(str(e)) from e
+
+    def validate_backup_header(self, backup: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        """
+        Validate the descriptive fields of a backup (everything but its documents)
+
+        Used for streaming backups, whose documents are checked part by part
+        against their checksums while they are restored.
+
+        Args:
+            backup: Backup data, metadata or manifest
+
+        Returns:
+            Tuple of (is_valid, list_of_issues)
+        """
+        issues = []
+
+        # Check required fields
+        for field in ["collection", "backup_type", "document_count"]:
+            if field not in backup:
+                issues.append(f"Missing required field: '{field}'")
+
+        # Validate collection name exists in schema
+        collection = backup.get("collection")
+        if collection and collection not in self.collections:
+            issues.append(f"Unknown collection: '{collection}'")
+
+        # Validate backup type
+        backup_type = backup.get("backup_type")
+        if backup_type and backup_type not in ["full", "incremental"]:
+            issues.append(f"Invalid backup type: '{backup_type}'")
+
+        return len(issues) == 0, issues
+
     def validate_backup_data(self, backup_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate backup data structure and integrity
@@ -740,13 +1086,12 @@ class BackupService:
         """
         logger.debug("Validating backup data structure")
 
-        issues = []
+        _, issues = self.validate_backup_header(backup_data)
 
-        # Check required fields
-        required_fields = ["collection", "backup_type", "timestamp", "documents", "document_count"]
-        for field in required_fields:
-            if field not in backup_data:
-                issues.append(f"Missing required field: '{field}'")
+        if "timestamp" not in backup_data:
+            issues.append("Missing required field: 'timestamp'")
+        if "documents" not in backup_data:
+            issues.append("Missing required field: 'documents'")
 
         # Validate document count matches
         expected_count = backup_data.get("document_count", 0)
@@ -758,16 +1103,6 @@ class BackupService:
                 f"found {actual_count}"
             )
 
-        # Validate collection name exists in schema
-        collection = backup_data.get("collection")
-        if collection and collection not in self.collections:
-            issues.append(f"Unknown collection: '{collection}'")
-
-        # Validate backup type
-        backup_type = backup_data.get("backup_type")
-        if backup_type and backup_type not in ["full", "incremental"]:
-            issues.append(f"Invalid backup type: '{backup_type}'")
-
         # Validate documents structure
         documents = backup_data.get("documents", [])
         if documents and not isinstance(documents[0], dict):
@@ -782,21 +1117,58 @@ class BackupService:
 
         return is_valid, issues
 
+    def restore_engine(
+        self,
+        workers: int = DEFAULT_RESTORE_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_progress: Optional[Callable[[RestoreProgress], None]] = None
+    ) -> RestoreEngine:
+        """
+        Create a restore engine that keeps its checkpoints under temp_dir
+
+        Args:
+            workers: Number of batches written concurrently
+            batch_size: Documents per batch
+            on_progress: Optional progress callback
+
+        Returns:
+            RestoreEngine instance
+        """
+        return RestoreEngine(
+            self.client,
+            checkpoint_dir=self.temp_dir / RESTORE_CHECKPOINT_DIR,
+            workers=workers,
+            batch_size=batch_size,
+            on_progress=on_progress
+        )
+
     def restore_collection(
         self,
         collection: str,
         backup_id: str,
         merge: bool = False,
-        validate_only: bool = False
+        validate_only: bool = False,
+        workers: int = DEFAULT_RESTORE_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resume: bool = True,
+        on_progress: Optional[Callable[[RestoreProgress], None]] = None
     ) -> Dict[str, Any]:
         """
         Restore a collection from a specific backup
 
+        Documents are upserted by their original IDs in concurrent batches.
+        Progress is checkpointed, so running the same restore again after an
+        interruption continues where it stopped.
+
         Args:
             collection: Name of collection to restore
             backup_id: ID of backup to restore from
             merge: If True, merge with existing documents; if False, replace
             validate_only: If True, only validate backup without restoring
+            workers: Number of batches written concurrently
+            batch_size: Documents per batch
+            resume: If False, ignore any checkpoint and restore everything
+            on_progress: Optional callback with throughput and ETA after each batch
 
         Returns:
             Restore result summary
@@ -809,6 +1181,7 @@ class BackupService:
             f"(merge={merge}, validate_only={validate_only})"
         )
 
+        file_path = None
         try:
             # Step 1: Get backup metadata
             metadata = self.client.get_document(
@@ -823,18 +1196,35 @@ class BackupService:
                     f"requested '{collection}'"
                 )
 
-            # Step 2: Download backup file
-            file_name = metadata["file_name"]
-            file_path = self.download_backup(file_name)
-
-            # Step 3: Decompress backup
-            backup_data = self.decompress_backup(file_path)
+            # Steps 2-4: Open and validate the backup. Streaming backups are
+            # read part by part while restoring; single-file backups are
+            # decompressed up front
+            if metadata.get("format") == STREAM_FORMAT:
+                is_valid, issues = self.validate_backup_header(metadata)
+                if not is_valid:
+                    raise RestoreError(f"Backup validation failed: {issues}")
+
+                backup_info = metadata
+                documents = self.iter_stream_backup(metadata)
+                expected_count = metadata["document_count"]
+
+                if validate_only:
+                    actual_count = sum(1 for _ in documents)
+                    if actual_count != expected_count:
+                        raise RestoreError(
+                            f"Backup validation failed: document count mismatch: "
+                            f"expected {expected_count}, found {actual_count}"
+                        )
+            else:
+                file_path = self.download_backup(metadata["file_name"])
+                backup_info = self.decompress_backup(file_path)
 
-            # Step 4: Validate backup data
-            is_valid, issues = self.validate_backup_data(backup_data)
+                is_valid, issues = self.validate_backup_data(backup_info)
+                if not is_valid:
+                    raise RestoreError(f"Backup validation failed: {issues}")
 
-            if not is_valid:
-                raise RestoreError(f"Backup validation failed: {issues}")
+                documents = backup_info["documents"]
+                expected_count = backup_info["document_count"]
 
             if validate_only:
                 logger.info("Validation complete (validate-only mode)")
@@ -843,82 +1233,30 @@ class BackupService:
                     "backup_id": backup_id,
                     "collection": collection,
                     "valid": True,
-                    "document_count": backup_data["document_count"]
+                    "document_count": expected_count
                 }
 
             # Step 5: Restore documents
-            documents = backup_data["documents"]
-            created = 0
-            updated = 0
-            errors = 0
-            error_details = []
-
-            for i, doc in enumerate(documents, 1):
-                try:
-                    doc_id = doc.get("id")
-
-                    if not doc_id:
-                        logger.warning(f"Document {i} has no ID, skipping")
-                        errors += 1
-                        continue
-
-                    # Check if document exists
-                    try:
-                        existing_doc = self.client.get_document(
-                            collection=collection,
-                            document_id=doc_id
-                        )
-
-                        # Update existing document
-                        self.client.update_document(
-                            collection=collection,
-                            document_id=doc_id,
-                            data=doc,
-                            merge=merge
-                        )
-                        updated += 1
-
-                    except ZeroDBError:
-                        # Create new document
-                        self.client.create_document(
-                            collection=collection,
-                            data=doc,
-                            document_id=doc_id
-                        )
-                        created += 1
-
-                    # Log progress every 100 documents
-                    if i % 100 == 0:
-                        logger.info(
-                            f"Progress: {i}/{len(documents)} documents "
-                            f"(created: {created}, updated: {updated}, errors: {errors})"
-                        )
-
-                except Exception as e:
-                    errors += 1
-                    error_msg = f"Error restoring document {i} (ID: {doc.get('id')}): {e}"
-                    logger.error(error_msg)
-                    error_details.append(error_msg)
-
-            # Step 6: Cleanup temporary file
-            file_path.unlink()
+            engine = self.restore_engine(workers, batch_size, on_progress)
+            restore = engine.restore(
+                collection,
+                backup_id,
+                documents,
+                total=expected_count,
+                merge=merge,
+                resume=resume
+            )
 
             result = {
-                "status": "completed" if errors == 0 else "completed_with_errors",
+                **restore,
                 "backup_id": backup_id,
-                "collection": collection,
-                "backup_type": backup_data["backup_type"],
-                "backup_timestamp": backup_data["timestamp"],
-                "document_count": len(documents),
-                "created": created,
-                "updated": updated,
-                "errors": errors,
-                "error_details": error_details[:10]  # Limit to first 10 errors
+                "backup_type": backup_info.get("backup_type"),
+                "backup_timestamp": backup_info.get("timestamp") or backup_info.get("completed_at"),
             }
 
             logger.info(
-                f"Restore completed for '{collection}': "
-                f"{created} created, {updated} updated, {errors} errors"
+                f"Restore completed for '{collection}': {restore['created']} created, "
+                f"{restore['updated']} updated, {restore['errors']} errors"
             )
 
             return result
@@ -928,11 +1266,19 @@ class BackupService:
             logger.error(error_msg)
             raise RestoreError(error_msg) from e
 
+        finally:
+            # Step 6: Cleanup temporary file
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
+
     def restore_all_collections(
         self,
         backup_directory: str,
         merge: bool = False,
-        exclude_collections: Optional[List[str]] = None
+        exclude_collections: Optional[List[str]] = None,
+        workers: int = DEFAULT_RESTORE_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Restore all collections from a backup directory
@@ -941,6 +1287,9 @@ class BackupService:
             backup_directory: Directory containing backup files
             merge: If True, merge with existing documents; if False, replace
             exclude_collections: Optional list of collections to exclude
+            workers: Number of batches written concurrently per collection
+            batch_size: Documents per batch
+            resume: If False, ignore checkpoints of earlier runs
 
         Returns:
             Summary of all restore operations
@@ -952,29 +1301,42 @@ class BackupService:
             raise RestoreError(f"Backup directory does not exist: '{backup_directory}'")
 
         exclude_set = set(exclude_collections or [])
+        engine = self.restore_engine(workers, batch_size)
         results = []
         successful = []
         failed = []
 
         start_time = datetime.utcnow()
 
-        # Find all backup files in directory
-        backup_files = list(backup_dir.glob("*.json.gz"))
+        # Find all backup files in directory: single-file backups and the
+        # manifests of streaming backups (whose parts sit next to them)
+        backup_files = [
+            path for path in backup_dir.glob("*.json.gz")
+            if not path.name.endswith(".ndjson.gz")
+        ]
+        backup_files.extend(backup_dir.glob("*.manifest.json"))
 
         if not backup_files:
             raise RestoreError(f"No backup files found in '{backup_directory}'")
 
         for backup_file in backup_files:
+            collection = None
             try:
                 # Decompress and validate
-                backup_data = self.decompress_backup(backup_file)
-                collection = backup_data.get("collection")
+                if backup_file.name.endswith(".manifest.json"):
+                    backup_info = read_manifest(backup_file)
+                    is_valid, issues = self.validate_backup_header(backup_info)
+                    documents = self.iter_stream_backup(backup_info, backup_dir)
+                else:
+                    backup_info = self.decompress_backup(backup_file)
+                    is_valid, issues = self.validate_backup_data(backup_info)
+                    documents = backup_info.get("documents", [])
+                collection = backup_info.get("collection")
 
                 if collection in exclude_set:
                     logger.info(f"Skipping excluded collection: '{collection}'")
                     continue
 
-                is_valid, issues = self.validate_backup_data(backup_data)
                 if not is_valid:
                     logger.error(f"Invalid backup file '{backup_file.name}': {issues}")
                     failed.append({
@@ -985,58 +1347,33 @@ class BackupService:
                     continue
 
                 # Restore documents
-                documents = backup_data["documents"]
-                created = 0
-                updated = 0
-                errors = 0
-
-                for doc in documents:
-                    try:
-                        doc_id = doc.get("id")
-                        if not doc_id:
-                            errors += 1
-                            continue
-
-                        try:
-                            self.client.get_document(collection=collection, document_id=doc_id)
-                            self.client.update_document(
-                                collection=collection,
-                                document_id=doc_id,
-                                data=doc,
-                                merge=merge
-                            )
-                            updated += 1
-                        except ZeroDBError:
-                            self.client.create_document(
-                                collection=collection,
-                                data=doc,
-                                document_id=doc_id
-                            )
-                            created += 1
-
-                    except Exception as e:
-                        errors += 1
-                        logger.error(f"Error restoring document: {e}")
+                restore = engine.restore(
+                    collection,
+                    backup_info.get("backup_id") or backup_file.name.split(".")[0],
+                    documents,
+                    total=backup_info.get("document_count"),
+                    merge=merge,
+                    resume=resume
+                )
 
                 result = {
                     "collection": collection,
                     "file": backup_file.name,
-                    "document_count": len(documents),
-                    "created": created,
-                    "updated": updated,
-                    "errors": errors
+                    "document_count": restore["document_count"],
+                    "created": restore["created"],
+                    "updated": restore["updated"],
+                    "errors": restore["errors"],
+                    "skipped": restore["skipped"],
+                    "documents_per_second": restore["documents_per_second"]
                 }
 
                 results.append(result)
                 successful.append(collection)
-                logger.info(
-                    f"Restored '{collection}': {created} created, "
-                    f"{updated} updated, {errors} errors"
-                )
 
             except Exception as e:
                 logger.error(f"Failed to restore from '{backup_file.name}': {e}")
                 failed.append({
+                    "collection": collection,
                     "file": backup_file.name,
                     "error": str(e)
                 })
@@ -1139,8 +1476,8 @@ class BackupService:
                 backup_id = backup["backup_id"]
                 try:
                     # Delete from object storage
-                    object_path = backup.get("object_path", f"backups/{backup['file_name']}")
-                    self.client.delete_object(object_path)
+                    for object_path in self._backup_object_paths(backup):
+                        self.client.delete_object(object_path)
 
                     # Delete metadata
                     self.client.delete_document(
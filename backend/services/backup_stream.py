@@ -0,0 +1,318 @@
+"""
+Streaming Backup Format - NDJSON parts with incremental compression
+
+Writes a backup as one or more gzip-compressed newline-delimited JSON parts
+plus a JSON manifest, without ever holding the whole collection in memory:
+- Documents are serialized one per line as they arrive and fed through an
+  incremental compressor (``zlib.compressobj``) at a configurable level
+- A part is closed once its uncompressed size reaches ``part_size`` bytes
+  and a new one is started, so large collections split into fixed-size
+  parts that can be uploaded, verified and restored independently
+- The SHA-256 of each compressed part is computed while it is written and
+  recorded in the manifest
+
+Layout for backup ``users_full_20250109_120000``::
+
+    users_full_20250109_120000.part0001.ndjson.gz
+    users_full_20250109_120000.part0002.ndjson.gz
+    users_full_20250109_120000.manifest.json
+
+Parts are plain gzip files: ``zcat part | jq`` works for inspection.
+
+Usage:
+    with StreamingBackupWriter(directory, backup_id, compress_level=6) as writer:
+        for document in documents:
+            writer.write(document)
+    parts = writer.parts
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMAT = "ndjson"
+DEFAULT_COMPRESS_LEVEL = 6  # Level 9 costs several times the CPU for a few percent
+DEFAULT_PART_SIZE = 64 * 1024 * 1024  # Uncompressed bytes per part
+WRITE_BUFFER_SIZE = 1024 * 1024  # Serialized bytes handed to the compressor at once
+HASH_CHUNK_SIZE = 1024 * 1024
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS  # zlib stream with a gzip header and trailer
+
+
+class BackupIntegrityError(Exception):
+    """Raised when a backup part is missing or fails its checksum"""
+    pass
+
+
+class BackupPart(NamedTuple):
+    """A closed backup part"""
+    file_name: str
+    path: Path
+    sha256: str  # Of the compressed file
+    size: int  # Compressed bytes
+    uncompressed_size: int
+    document_count: int
+
+    def to_manifest(self) -> Dict[str, Any]:
+        """Manifest entry for this part (without the local path)"""
+        return {
+            "file_name": self.file_name,
+            "sha256": self.sha256,
+            "size": self.size,
+            "uncompressed_size": self.uncompressed_size,
+            "document_count": self.document_count,
+        }
+
+
+class StreamingBackupWriter:
+    """
+    Writes documents to size-capped, gzip-compressed NDJSON parts
+
+    ``on_part`` is called with each part as soon as it is closed (e.g. to
+    upload it and free the disk space before the next part is finished).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        backup_id: str,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        part_size: int = DEFAULT_PART_SIZE,
+        on_part: Optional[Callable[[BackupPart], None]] = None
+    ):
+        """
+        Initialize the writer
+
+        Args:
+            directory: Directory the parts are written to
+            backup_id: Backup ID used as the file name prefix
+            compress_level: zlib compression level (0-9)
+            part_size: Uncompressed bytes after which a part is closed
+            on_part: Optional callback for each closed part
+        """
+        if not 0 <= compress_level <= 9:
+            raise ValueError(f"compress_level must be between 0 and 9, got {compress_level}")
+        if part_size <= 0:
+            raise ValueError("part_size must be positive")
+
+        self.directory = Path(directory)
+        self.backup_id = backup_id
+        self.compress_level = compress_level
+        self.part_size = part_size
+        self.on_part = on_part
+        self.parts: List[BackupPart] = []
+        self.document_count = 0
+
+        self._file = None
+        self._path: Optional[Path] = None
+        self._compressor = None
+        self._hash = None
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._part_size = 0
+        self._part_uncompressed = 0
+        self._part_documents = 0
+
+    def __enter__(self) -> "StreamingBackupWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def part_file_name(self, number: int) -> str:
+        """File name of part ``number`` (1-based)"""
+        return f"{self.backup_id}.part{number:04d}.ndjson.gz"
+
+    def write(self, document: Dict[str, Any]) -> None:
+        """
+        Append a document
+
+        Args:
+            document: JSON-serializable document (non-JSON values are written with str())
+        """
+        line = json.dumps(document, default=str, separators=(",", ":"), ensure_ascii=False)
+        data = line.encode("utf-8") + b"\n"
+
+        if self._file is None:
+            self._open_part()
+
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self._part_uncompressed += len(data)
+        self._part_documents += 1
+        self.document_count += 1
+
+        if self._buffered >= WRITE_BUFFER_SIZE:
+            self._flush_buffer()
+        if self._part_uncompressed >= self.part_size:
+            self._close_part()
+
+    def write_many(self, documents: Iterable[Dict[str, Any]]) -> None:
+        """Append every document from an iterable"""
+        for document in documents:
+            self.write(document)
+
+    def close(self) -> List[BackupPart]:
+        """
+        Finish the last part
+
+        An empty backup still produces one (empty) part so it can be restored
+        like any other.
+
+        Returns:
+            All parts written
+        """
+        if self._file is None and not self.parts:
+            self._open_part()
+        if self._file is not None:
+            self._close_part()
+        return self.parts
+
+    def abort(self) -> None:
+        """Close and delete the part being written"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            if self._path is not None and self._path.exists():
+                self._path.unlink()
+
+    def _open_part(self) -> None:
+        self._path = self.directory / self.part_file_name(len(self.parts) + 1)
+        self._file = open(self._path, "wb")
+        self._compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, GZIP_WBITS)
+        self._hash = hashlib.sha256()
+        self._part_size = 0
+        self._part_uncompressed = 0
+        self._part_documents = 0
+
+    def _emit(self, chunk: bytes) -> None:
+        if chunk:
+            self._file.write(chunk)
+            self._hash.update(chunk)
+            self._part_size += len(chunk)
+
+    def _flush_buffer(self) -> None:
+        if self._buffer:
+            self._emit(self._compressor.compress(b"".join(self._buffer)))
+            self._buffer = []
+            self._buffered = 0
+
+    def _close_part(self) -> None:
+        self._flush_buffer()
+        self._emit(self._compressor.flush())
+        self._file.close()
+        self._file = None
+
+        part = BackupPart(
+            file_name=self._path.name,
+            path=self._path,
+            sha256=self._hash.hexdigest(),
+            size=self._part_size,
+            uncompressed_size=self._part_uncompressed,
+            document_count=self._part_documents,
+        )
+        self.parts.append(part)
+        logger.debug(
+            f"Closed backup part {part.file_name}: {part.document_count} documents, "
+            f"{part.uncompressed_size:,} -> {part.size:,} bytes"
+        )
+
+        if self.on_part is not None:
+            self.on_part(part)
+
+
+def manifest_file_name(backup_id: str) -> str:
+    """File name of the manifest of a streamed backup"""
+    return f"{backup_id}.manifest.json"
+
+
+def write_manifest(path: Path, manifest: Dict[str, Any]) -> int:
+    """
+    Write a backup manifest
+
+    Args:
+        path: Manifest path
+        manifest: Manifest contents
+
+    Returns:
+        Size of the manifest in bytes
+    """
+    data = json.dumps(manifest, indent=2, default=str).encode("utf-8")
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+def read_manifest(path: Path) -> Dict[str, Any]:
+    """Read a backup manifest"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_part_documents(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the documents of a backup part
+
+    Args:
+        path: Path to a ``.ndjson.gz`` part
+
+    Yields:
+        Documents in the order they were written
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_backup_documents(
+    parts: List[Dict[str, Any]],
+    fetch_part: Callable[[str], Path],
+    remove_parts: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the documents of a backup part by part
+
+    Each part is fetched only when the previous one has been read, and its
+    checksum is verified before any of its documents are yielded, so a whole
+    collection never has to be on disk or in memory at once.
+
+    Args:
+        parts: Manifest entries of the parts, in order
+        fetch_part: Returns the local path of a part given its file name
+            (e.g. by downloading it)
+        remove_parts: If True, delete each part once it has been read
+
+    Yields:
+        Documents in backup order
+
+    Raises:
+        BackupIntegrityError: If a part is missing or fails its checksum
+    """
+    for part in parts:
+        path = Path(fetch_part(part["file_name"]))
+        try:
+            if not path.exists():
+                raise BackupIntegrityError(f"Backup part missing: '{part['file_name']}'")
+            if file_sha256(path) != part["sha256"]:
+                raise BackupIntegrityError(f"Checksum mismatch for backup part '{part['file_name']}'")
+            yield from iter_part_documents(path)
+        finally:
+            if remove_parts:
+                path.unlink(missing_ok=True)
@@ -6,22 +6,83 @@ publications, and email list operations.
 
 API Documentation: https://developers.beehiiv.com/docs/v2/
 Rate Limit: 1000 requests/hour
+
+The hourly quota belongs to the API key, not to a process. Pass a
+BeeHiivRateLimiter (see get_beehiiv_rate_limiter) so every worker draws from
+one token bucket in Redis and a 429 pauses all of them; without one the
+service falls back to counting its own requests.
 """
 
 import os
 import time
 import logging
+from bisect import bisect_right
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
+import redis
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared rate limiter state
+RATE_LIMIT_KEY_PREFIX = "beehiiv:ratelimit:"
+RATE_LIMIT_BURST = 50  # Tokens available at once; refill keeps any hour under the quota
+RATE_LIMIT_MAX_BACKOFF = 900  # Upper bound in seconds for the pause after repeated 429s
+RATE_LIMIT_STRIKE_TTL = 600  # 429s within this many seconds escalate the pause
+
+# Refills the bucket for the time elapsed since the last call and takes
+# ARGV[4] tokens if available. Returns the seconds to wait before the tokens
+# (or the end of a 429 pause) are available; "0" means they were taken.
+TAKE_TOKENS_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+local paused_until = tonumber(redis.call('HGET', KEYS[1], 'paused_until') or '0')
+if paused_until > now then
+    return tostring(paused_until - now)
+end
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens') or ARGV[1])
+local updated = tonumber(redis.call('HGET', KEYS[1], 'updated') or ARGV[3])
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 3600)
+return tostring(wait)
+"""
+
+# Empties the bucket and pauses it until ARGV[2] (never shortening an
+# existing pause). Returns the pause end.
+PAUSE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local until_ts = tonumber(ARGV[2])
+local paused_until = tonumber(redis.call('HGET', KEYS[1], 'paused_until') or '0')
+if paused_until > until_ts then
+    until_ts = paused_until
+end
+redis.call('HSET', KEYS[1], 'tokens', '0', 'updated', tostring(now), 'paused_until', tostring(until_ts))
+redis.call('EXPIRE', KEYS[1], math.ceil(until_ts - now) + 3600)
+return tostring(until_ts)
+"""
+
 
 class BeeHiivRateLimitError(Exception):
     """Raised when API rate limit is exceeded"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BeeHiivThrottledError(BeeHiivRateLimitError):
+    """Raised when a request is held back locally because the shared request budget is spent"""
     pass
 
 
@@ -30,6 +91,88 @@ class BeeHiivAPIError(Exception):
     pass
 
 
+class BeeHiivRateLimiter:
+    """
+    Token bucket shared through Redis by every process using one BeeHiiv API key
+
+    The bucket holds at most ``burst`` tokens and refills at a rate that keeps
+    any one-hour window within ``requests_per_hour``. A 429 from BeeHiiv means
+    the estimate is off (another client, clock skew), so it empties the bucket
+    and pauses it for the Retry-After period, doubling the pause for each
+    further 429 within ``RATE_LIMIT_STRIKE_TTL`` seconds.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        name: str = "default",
+        requests_per_hour: int = 1000,
+        burst: int = RATE_LIMIT_BURST
+    ):
+        """
+        Initialize the rate limiter
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            name: Bucket name; use one per API key
+            requests_per_hour: BeeHiiv hourly quota
+            burst: Bucket capacity
+        """
+        self.redis_client = redis_client
+        self.key = f"{RATE_LIMIT_KEY_PREFIX}{name}"
+        self.strikes_key = f"{self.key}:strikes"
+        self.capacity = burst
+        self.rate = (requests_per_hour - burst) / 3600.0
+        self._take = redis_client.register_script(TAKE_TOKENS_SCRIPT)
+        self._pause = redis_client.register_script(PAUSE_SCRIPT)
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket if available
+
+        Args:
+            tokens: Number of requests about to be made
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they are available
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        wait = self._take(
+            keys=[self.key],
+            args=[self.capacity, self.rate, time.time(), tokens]
+        )
+        return float(wait)
+
+    def penalize(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429 response and pause the bucket for every worker
+
+        Args:
+            retry_after: Retry-After seconds reported by BeeHiiv
+
+        Returns:
+            Seconds the bucket is paused for
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        pipe = self.redis_client.pipeline()
+        pipe.incr(self.strikes_key)
+        pipe.expire(self.strikes_key, RATE_LIMIT_STRIKE_TTL)
+        strikes = pipe.execute()[0]
+
+        delay = min(
+            RATE_LIMIT_MAX_BACKOFF,
+            max(retry_after or 0, 1) * (2 ** (strikes - 1))
+        )
+        now = time.time()
+        paused_until = float(self._pause(keys=[self.key], args=[now, now + delay]))
+        logger.warning(f"BeeHiiv rate limited (strike {strikes}); pausing requests for {paused_until - now:.0f}s")
+        return paused_until - now
+
+
 class BeeHiivService:
     """
     BeeHiiv API Integration Service
@@ -46,7 +189,8 @@ class BeeHiivService:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        publication_id: Optional[str] = None
+        publication_id: Optional[str] = None,
+        rate_limiter: Optional[BeeHiivRateLimiter] = None
     ):
         """
         Initialize BeeHiiv service
@@ -54,6 +198,7 @@ class BeeHiivService:
         Args:
             api_key: BeeHiiv API key (defaults to BEEHIIV_API_KEY env var)
             publication_id: BeeHiiv publication ID (defaults to BEEHIIV_PUBLICATION_ID env var)
+            rate_limiter: Shared rate limiter; requests are counted per process without one
         """
         self.api_key = api_key if api_key is not None else os.getenv("BEEHIIV_API_KEY")
         self.publication_id = publication_id if publication_id is not None else os.getenv("BEEHIIV_PUBLICATION_ID")
@@ -64,7 +209,9 @@ class BeeHiivService:
         # Initialize session with retry logic
         self.session = self._create_session()
 
-        # Rate limiting tracking
+        # Rate limiting tracking (per-process fallback when no shared limiter is set
+        # or Redis is unavailable); timestamps are appended in order
+        self.rate_limiter = rate_limiter
         self._request_timestamps: List[float] = []
 
     def _create_session(self) -> requests.Session:
@@ -80,7 +227,8 @@ class BeeHiivService:
         retry_strategy = Retry(
             total=self.MAX_RETRIES,
             backoff_factor=self.BACKOFF_FACTOR,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 is not retried here: it is surfaced so the shared limiter can pause every worker
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
         )
 
@@ -101,23 +249,40 @@ class BeeHiivService:
         """
         Check and enforce rate limiting (1000 requests/hour)
 
+        Uses the shared limiter when one is configured and reachable, and the
+        per-process request window otherwise.
+
         Raises:
-            BeeHiivRateLimitError: If rate limit would be exceeded
+            BeeHiivThrottledError: If rate limit would be exceeded
         """
+        if self.rate_limiter is not None:
+            try:
+                wait_time = self.rate_limiter.try_acquire()
+            except redis.RedisError as e:
+                logger.warning(f"Shared BeeHiiv rate limiter unavailable, limiting locally: {e}")
+            else:
+                if wait_time > 0:
+                    raise BeeHiivThrottledError(
+                        f"Rate limit exceeded. Please wait {wait_time:.0f} seconds.",
+                        retry_after=wait_time
+                    )
+                return
+
         current_time = time.time()
         one_hour_ago = current_time - 3600
 
-        # Remove timestamps older than 1 hour
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if ts > one_hour_ago
-        ]
+        # Remove timestamps older than 1 hour (they are sorted, so this is a prefix)
+        expired = bisect_right(self._request_timestamps, one_hour_ago)
+        if expired:
+            del self._request_timestamps[:expired]
 
         # Check if we've hit the rate limit
         if len(self._request_timestamps) >= self.RATE_LIMIT_PER_HOUR:
-            oldest_request = min(self._request_timestamps)
+            oldest_request = self._request_timestamps[0]
             wait_time = 3600 - (current_time - oldest_request)
-            raise BeeHiivRateLimitError(
-                f"Rate limit exceeded. Please wait {wait_time:.0f} seconds."
+            raise BeeHiivThrottledError(
+                f"Rate limit exceeded. Please wait {wait_time:.0f} seconds.",
+                retry_after=wait_time
             )
 
         # Record this request
@@ -166,8 +331,14 @@ class BeeHiivService:
             # Handle rate limiting response
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 60))
+                if self.rate_limiter is not None:
+                    try:
+                        self.rate_limiter.penalize(retry_after)
+                    except redis.RedisError as e:
+                        logger.warning(f"Could not pause shared BeeHiiv rate limiter: {e}")
                 raise BeeHiivRateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds."
+                    f"Rate limit exceeded. Retry after {retry_after} seconds.",
+                    retry_after=retry_after
                 )
 
             # Raise for HTTP errors
@@ -204,7 +375,8 @@ class BeeHiivService:
         name: Optional[str] = None,
         list_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        reactivate_existing: bool = True
+        reactivate_existing: bool = True,
+        send_welcome_email: bool = True
     ) -> Dict[str, Any]:
         """
         Add a subscriber to an email list
@@ -215,6 +387,7 @@ class BeeHiivService:
             list_id: Email list ID (optional, uses default publication)
             metadata: Custom metadata for the subscriber
             reactivate_existing: Reactivate if subscriber exists and is inactive
+            send_welcome_email: Send BeeHiiv's welcome email to new subscribers
 
         Returns:
             Subscriber data
@@ -222,7 +395,7 @@ class BeeHiivService:
         data = {
             "email": email.lower().strip(),
             "reactivate_existing": reactivate_existing,
-            "send_welcome_email": True,
+            "send_welcome_email": send_welcome_email,
             "utm_source": "wwmaa_platform",
             "utm_medium": "api"
         }
@@ -512,3 +685,25 @@ class BeeHiivService:
         endpoint = f"publications/{self.publication_id}/posts/{post['data']['id']}/send_test"
 
         return self._make_request("POST", endpoint, data={"email": email})
+
+
+# Singleton instance
+_rate_limiter_instance: Optional[BeeHiivRateLimiter] = None
+
+
+def get_beehiiv_rate_limiter() -> BeeHiivRateLimiter:
+    """
+    Get the rate limiter shared by everything using the platform's BeeHiiv API key
+
+    Returns:
+        BeeHiivRateLimiter instance
+    """
+    global _rate_limiter_instance
+    if _rate_limiter_instance is None:
+        from backend.config import settings
+
+        _rate_limiter_instance = BeeHiivRateLimiter(
+            redis.from_url(settings.REDIS_URL, decode_responses=True),
+            requests_per_hour=BeeHiivService.RATE_LIMIT_PER_HOUR
+        )
+    return _rate_limiter_instance
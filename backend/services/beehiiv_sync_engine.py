@@ -0,0 +1,480 @@
+"""
+BeeHiiv Sync Engine - Diff-based, rate-aware list synchronization
+
+Brings BeeHiiv list membership (the ``lists`` custom field of each
+subscription) in line with local membership while spending as little of the
+1000 requests/hour BeeHiiv quota as possible:
+- A snapshot of BeeHiiv subscribers (email -> subscription id, status,
+  lists) is cached in Redis and refreshed by paging through the API at most
+  every ``SNAPSHOT_MAX_AGE`` seconds
+- The desired membership is diffed against the snapshot; only subscribers
+  whose managed lists actually differ produce a request
+- Changes are applied with bounded concurrency. Every request draws from the
+  token bucket BeeHiivService shares through Redis; when the bucket is empty
+  workers wait for it, and a 429 pauses all workers (see BeeHiivRateLimiter)
+- Each applied change is written through to the snapshot and counted in a
+  per-sync checkpoint. A sync that was interrupted resumes from the cached
+  snapshot instead of refreshing it, so the diff only contains the changes
+  that were not applied yet
+
+Usage:
+    engine = BeeHiivSyncEngine(beehiiv_service)
+    result = await engine.sync(
+        "newsletter_members",
+        {"member@example.com": DesiredSubscriber(lists={"members_only"})},
+        managed_lists={"members_only", "instructors"}
+    )
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from uuid import uuid4
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import track_background_job
+from backend.services.beehiiv_service import (
+    BeeHiivAPIError,
+    BeeHiivRateLimitError,
+    BeeHiivService,
+    BeeHiivThrottledError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Redis keys
+SNAPSHOT_KEY_PREFIX = "beehiiv:snapshot:"  # publication_id -> {email: subscriber json}
+CHECKPOINT_KEY_PREFIX = "beehiiv:sync:"  # sync name -> run progress
+
+SNAPSHOT_MAX_AGE = 6 * 3600  # Refresh the snapshot when older than this
+SNAPSHOT_TTL = 7 * 86400
+CHECKPOINT_TTL = 7 * 86400
+SNAPSHOT_PAGE_SIZE = 100  # BeeHiiv maximum
+
+DEFAULT_CONCURRENCY = 8
+MAX_ATTEMPTS = 4  # Attempts per change for 429s and API errors
+THROTTLE_FALLBACK_DELAY = 5.0  # Seconds to wait when a throttle gives no hint
+
+# Subscriptions BeeHiiv no longer delivers to; left alone so manual
+# unsubscribes are respected
+INACTIVE_STATUSES = {"inactive", "unsubscribed"}
+
+ACTION_SUBSCRIBE = "subscribe"
+ACTION_UPDATE = "update"
+
+
+class BeeHiivSyncError(Exception):
+    """Raised when a sync cannot be planned"""
+    pass
+
+
+class DesiredSubscriber(NamedTuple):
+    """Lists a subscriber should be on, out of the managed lists"""
+    lists: Set[str]
+    fields: Optional[Dict[str, Any]] = None  # Custom fields sent when the subscriber is created
+    ref: Optional[str] = None  # Caller's reference (e.g. user id) for reporting
+
+
+class SyncChange(NamedTuple):
+    """One request needed to bring a subscriber in line"""
+    action: str
+    email: str
+    lists: List[str]  # Complete ``lists`` custom field to set
+    subscription_id: Optional[str] = None
+    fields: Optional[Dict[str, Any]] = None
+    ref: Optional[str] = None
+
+
+class SyncResult(NamedTuple):
+    """Outcome of a sync"""
+    run_id: str
+    resumed: bool
+    unchanged: int
+    applied: List[SyncChange]
+    failed: List[Tuple[SyncChange, str]]
+
+
+def _subscriber_lists(subscriber: Dict[str, Any]) -> List[str]:
+    """Read the ``lists`` custom field from a BeeHiiv subscription (dict or name/value list form)"""
+    custom_fields = subscriber.get("custom_fields") or {}
+    if isinstance(custom_fields, list):
+        custom_fields = {f.get("name"): f.get("value") for f in custom_fields if isinstance(f, dict)}
+    lists = custom_fields.get("lists") or []
+    return [lists] if isinstance(lists, str) else list(lists)
+
+
+def diff(
+    desired: Dict[str, DesiredSubscriber],
+    snapshot: Dict[str, Dict[str, Any]],
+    managed_lists: Iterable[str]
+) -> Tuple[List[SyncChange], int]:
+    """
+    Work out the requests needed to bring BeeHiiv in line with ``desired``
+
+    Only the managed lists are compared and changed; other lists on a
+    subscription (e.g. "general") are kept. Subscribers not in ``desired``
+    are not touched.
+
+    Args:
+        desired: Email -> desired membership of the managed lists
+        snapshot: Email -> {"id", "status", "lists"} as cached from BeeHiiv
+        managed_lists: Lists this sync owns
+
+    Returns:
+        Tuple of (changes, number of subscribers already in sync)
+    """
+    managed = set(managed_lists)
+    changes = []
+    unchanged = 0
+
+    for email, target in desired.items():
+        email = email.lower().strip()
+        wanted = set(target.lists) & managed
+        current = snapshot.get(email)
+
+        if current is None:
+            if wanted:
+                changes.append(SyncChange(
+                    ACTION_SUBSCRIBE, email, sorted(wanted), None, target.fields, target.ref
+                ))
+            else:
+                unchanged += 1
+            continue
+
+        if current.get("status") in INACTIVE_STATUSES:
+            unchanged += 1
+            continue
+
+        lists = current.get("lists", [])
+        if set(lists) & managed == wanted:
+            unchanged += 1
+            continue
+
+        kept = [name for name in lists if name not in managed]
+        changes.append(SyncChange(
+            ACTION_UPDATE, email, kept + sorted(wanted), current.get("id"), None, target.ref
+        ))
+
+    return changes, unchanged
+
+
+class BeeHiivSyncEngine:
+    """
+    Applies the difference between local and BeeHiiv list membership
+
+    Request spending is governed by the BeeHiivService passed in; give it the
+    shared rate limiter (get_beehiiv_rate_limiter) so concurrent syncs and
+    workers stay within the quota together.
+    """
+
+    def __init__(
+        self,
+        beehiiv_service: BeeHiivService,
+        redis_client: Optional[redis.Redis] = None,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        """
+        Initialize the sync engine
+
+        Args:
+            beehiiv_service: BeeHiiv API client
+            redis_client: Redis client (defaults to settings.REDIS_URL)
+            concurrency: Maximum BeeHiiv requests in flight
+        """
+        self.beehiiv = beehiiv_service
+        self.redis_client = redis_client or redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.concurrency = concurrency
+        self.snapshot_key = f"{SNAPSHOT_KEY_PREFIX}{beehiiv_service.publication_id}"
+        self.snapshot_meta_key = f"{self.snapshot_key}:meta"
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def load_snapshot(self, max_age: Optional[float] = SNAPSHOT_MAX_AGE) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the cached subscriber snapshot, refreshing it when stale
+
+        Args:
+            max_age: Maximum snapshot age in seconds; None accepts any cached snapshot
+
+        Returns:
+            Email -> {"id", "status", "lists"}
+
+        Raises:
+            BeeHiivSyncError: If the snapshot has to be fetched and BeeHiiv fails
+        """
+        try:
+            refreshed_at = self.redis_client.hget(self.snapshot_meta_key, "refreshed_at")
+            fresh = refreshed_at is not None and (
+                max_age is None or time.time() - float(refreshed_at) < max_age
+            )
+            if fresh:
+                cached = self.redis_client.hgetall(self.snapshot_key)
+                return {email: json.loads(value) for email, value in cached.items()}
+        except redis.RedisError as e:
+            logger.warning(f"BeeHiiv snapshot cache unavailable, fetching from BeeHiiv: {e}")
+
+        return self.refresh_snapshot()
+
+    def refresh_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Page through every BeeHiiv subscription and replace the cached snapshot
+
+        Returns:
+            Email -> {"id", "status", "lists"}
+
+        Raises:
+            BeeHiivSyncError: If BeeHiiv fails
+        """
+        snapshot = {}
+        page = 1
+
+        while True:
+            result = self._call_with_backoff(
+                self.beehiiv.list_subscribers,
+                page=page,
+                limit=SNAPSHOT_PAGE_SIZE,
+                filters={"expand[]": "custom_fields"}
+            )
+            for subscriber in result.get("data", []):
+                email = (subscriber.get("email") or "").lower().strip()
+                if email:
+                    snapshot[email] = {
+                        "id": subscriber.get("id"),
+                        "status": subscriber.get("status"),
+                        "lists": _subscriber_lists(subscriber),
+                    }
+
+            pagination = result.get("pagination", {})
+            total_pages = result.get("total_pages")
+            has_more = pagination.get("has_more", total_pages is not None and page < total_pages)
+            if not has_more or not result.get("data"):
+                break
+            page += 1
+
+        logger.info(f"Refreshed BeeHiiv snapshot: {len(snapshot)} subscribers in {page} page(s)")
+
+        try:
+            # Build under a temporary key so readers never see a partial snapshot
+            staging_key = f"{self.snapshot_key}:{uuid4().hex}"
+            pipe = self.redis_client.pipeline()
+            items = [(email, json.dumps(value)) for email, value in snapshot.items()]
+            for start in range(0, len(items), 1000):
+                pipe.hset(staging_key, mapping=dict(items[start:start + 1000]))
+            if items:
+                pipe.rename(staging_key, self.snapshot_key)
+                pipe.expire(self.snapshot_key, SNAPSHOT_TTL)
+            else:
+                pipe.delete(self.snapshot_key)
+            pipe.hset(self.snapshot_meta_key, mapping={"refreshed_at": time.time(), "subscribers": len(items)})
+            pipe.expire(self.snapshot_meta_key, SNAPSHOT_TTL)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not cache BeeHiiv snapshot: {e}")
+
+        return snapshot
+
+    def _call_with_backoff(self, func: Callable[..., Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """Call a BeeHiiv method from a worker thread, waiting out throttling and 429s"""
+        attempts = 0
+        while True:
+            try:
+                return func(**kwargs)
+            except BeeHiivRateLimitError as e:
+                if not isinstance(e, BeeHiivThrottledError):
+                    attempts += 1
+                    if attempts >= MAX_ATTEMPTS:
+                        raise BeeHiivSyncError(f"BeeHiiv kept rate limiting: {e}")
+                time.sleep(e.retry_after or THROTTLE_FALLBACK_DELAY)
+            except BeeHiivAPIError as e:
+                raise BeeHiivSyncError(f"BeeHiiv request failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    async def sync(
+        self,
+        name: str,
+        desired: Dict[str, DesiredSubscriber],
+        managed_lists: Iterable[str],
+        prepare: Optional[Callable[[List[SyncChange]], List[SyncChange]]] = None
+    ) -> SyncResult:
+        """
+        Diff ``desired`` against BeeHiiv and apply the changes
+
+        Args:
+            name: Stable sync name; a sync interrupted under this name is resumed
+            desired: Email -> desired membership of the managed lists
+            managed_lists: Lists this sync owns
+            prepare: Optional hook that may enrich the planned changes (e.g. add
+                names to new subscribers) before anything is sent
+
+        Returns:
+            SyncResult
+
+        Raises:
+            BeeHiivSyncError: If the BeeHiiv snapshot cannot be loaded
+        """
+        checkpoint_key = f"{CHECKPOINT_KEY_PREFIX}{name}"
+        checkpoint = self._read_checkpoint(checkpoint_key)
+        resumed = checkpoint.get("status") == "running"
+        run_id = checkpoint["run_id"] if resumed else uuid4().hex
+
+        with track_background_job(f"beehiiv_sync_{name}"):
+            snapshot = await asyncio.to_thread(
+                self.load_snapshot, None if resumed else SNAPSHOT_MAX_AGE
+            )
+            changes, unchanged = diff(desired, snapshot, managed_lists)
+            if prepare and changes:
+                changes = prepare(changes)
+
+            logger.info(
+                f"BeeHiiv sync '{name}' ({'resuming ' if resumed else ''}run {run_id}): "
+                f"{len(changes)} change(s), {unchanged} already in sync"
+            )
+            self._write_checkpoint(checkpoint_key, {
+                "run_id": run_id,
+                "status": "running",
+                "planned": len(changes),
+                "unchanged": unchanged,
+                "applied": 0,
+                "failed": 0,
+                "started_at": checkpoint.get("started_at") if resumed else datetime.utcnow().isoformat(),
+            })
+
+            applied, failed = await self.apply(changes, checkpoint_key)
+
+            self._write_checkpoint(checkpoint_key, {
+                "status": "completed",
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+
+        return SyncResult(run_id, resumed, unchanged, applied, failed)
+
+    async def apply(
+        self,
+        changes: List[SyncChange],
+        checkpoint_key: Optional[str] = None
+    ) -> Tuple[List[SyncChange], List[Tuple[SyncChange, str]]]:
+        """
+        Send changes to BeeHiiv with at most ``concurrency`` requests in flight
+
+        Args:
+            changes: Changes from diff()
+            checkpoint_key: Checkpoint hash to count progress in
+
+        Returns:
+            Tuple of (applied changes, [(failed change, error)])
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        applied: List[SyncChange] = []
+        failed: List[Tuple[SyncChange, str]] = []
+
+        async def run(change: SyncChange) -> None:
+            async with semaphore:
+                subscription_id, error = await self._apply_change(change)
+            if error is None:
+                applied.append(change)
+            else:
+                failed.append((change, error))
+            await asyncio.to_thread(self._record, change, subscription_id, error, checkpoint_key)
+
+        await asyncio.gather(*(run(change) for change in changes))
+        return applied, failed
+
+    async def _apply_change(self, change: SyncChange) -> Tuple[Optional[str], Optional[str]]:
+        """Send one change, waiting out throttling; returns (subscription id, error message)"""
+        attempts = 0
+        while True:
+            try:
+                response = await asyncio.to_thread(self._send, change)
+                data = response.get("data") if isinstance(response, dict) else None
+                return change.subscription_id or (data or {}).get("id"), None
+            except BeeHiivRateLimitError as e:
+                # Waiting for the shared budget is not a failed attempt; a 429 is
+                if not isinstance(e, BeeHiivThrottledError):
+                    attempts += 1
+                    if attempts >= MAX_ATTEMPTS:
+                        return None, str(e)
+                await asyncio.sleep(e.retry_after or THROTTLE_FALLBACK_DELAY)
+            except BeeHiivAPIError as e:
+                # Transient server errors were already retried by the HTTP session
+                logger.error(f"BeeHiiv {change.action} failed for {change.email}: {e}")
+                return None, str(e)
+
+    def _send(self, change: SyncChange) -> Dict[str, Any]:
+        """Issue the BeeHiiv request for a change"""
+        if change.action == ACTION_SUBSCRIBE:
+            return self.beehiiv.add_subscriber(
+                email=change.email,
+                metadata={**(change.fields or {}), "lists": change.lists},
+                send_welcome_email=False
+            )
+        return self.beehiiv.update_subscriber(
+            change.subscription_id or change.email,
+            {"custom_fields": {"lists": change.lists}}
+        )
+
+    def _record(
+        self,
+        change: SyncChange,
+        subscription_id: Optional[str],
+        error: Optional[str],
+        checkpoint_key: Optional[str]
+    ) -> None:
+        """Write an applied change through to the snapshot and count it in the checkpoint"""
+        try:
+            pipe = self.redis_client.pipeline()
+            if error is None:
+                pipe.hset(self.snapshot_key, change.email, json.dumps({
+                    "id": subscription_id,
+                    "status": "active",
+                    "lists": change.lists,
+                }))
+            if checkpoint_key:
+                pipe.hincrby(checkpoint_key, "failed" if error else "applied", 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not record BeeHiiv sync progress for {change.email}: {e}")
+
+    def _read_checkpoint(self, checkpoint_key: str) -> Dict[str, str]:
+        """Return the checkpoint of the last sync with this name ({} if none)"""
+        try:
+            return self.redis_client.hgetall(checkpoint_key)
+        except redis.RedisError as e:
+            logger.warning(f"Could not read BeeHiiv sync checkpoint: {e}")
+            return {}
+
+    def _write_checkpoint(self, checkpoint_key: str, values: Dict[str, Any]) -> None:
+        """Update the checkpoint hash"""
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(checkpoint_key, mapping={k: v for k, v in values.items() if v is not None})
+            pipe.expire(checkpoint_key, CHECKPOINT_TTL)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not write BeeHiiv sync checkpoint: {e}")
+
+    def get_checkpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get progress of the last sync with this name
+
+        Args:
+            name: Sync name
+
+        Returns:
+            Checkpoint dict or None
+        """
+        checkpoint = self._read_checkpoint(f"{CHECKPOINT_KEY_PREFIX}{name}")
+        if not checkpoint:
+            return None
+        for field in ("planned", "unchanged", "applied", "failed"):
+            checkpoint[field] = int(checkpoint.get(field, 0))
+        return checkpoint
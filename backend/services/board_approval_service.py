@@ -33,6 +33,7 @@ from backend.models.schemas import (
     User,
     UserRole
 )
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
 from backend.services.email_service import get_email_service
 
@@ -66,6 +67,7 @@ class BoardApprovalService:
     def __init__(self):
         """Initialize board approval service"""
         self.db_client = get_zerodb_client()
+        self.aggregates = get_analytics_aggregates_service()
         logger.info("BoardApprovalService initialized")
 
     def submit_for_board_review(
@@ -460,12 +462,15 @@ class BoardApprovalService:
         """
         Send email notifications to all board members about new application.
 
+        Notifications go through the outbound email queue so submitting an
+        application does not wait on one Postmark request per board member.
+
         Args:
             application: The application being submitted
             board_member_ids: List of board member IDs to notify
         """
         try:
-            email_service = get_email_service()
+            email_service = get_email_service(queued=True)
 
             # Fetch all board members
             for board_member_id in board_member_ids:
@@ -509,7 +514,7 @@ class BoardApprovalService:
                         years_experience=application.experience_years or 0
                     )
 
-                    logger.info(f"Sent new application notification to board member {user.email}")
+                    logger.info(f"Queued new application notification to board member {user.email}")
 
                 except Exception as e:
                     logger.warning(f"Failed to send email to board member {board_member_id}: {e}")
@@ -651,6 +656,7 @@ class BoardApprovalService:
             document_id=str(application.id),
             data=application.dict(exclude={"id"})
         )
+        self.aggregates.record_application(str(application.id), application.dict())
 
     def _save_approval(self, approval: Approval):
         """Save approval to database"""
@@ -0,0 +1,195 @@
+"""
+Bulk Anonymization Executor - batched, concurrent anonymization of user records
+
+Anonymizes every record a user owns in a collection, as used by GDPR account
+deletion:
+- Records are read page by page (``page_size`` per query) off the event loop
+- Each batch is anonymized in one call to a batch transform (e.g.
+  ``utils.anonymization.anonymize_documents``) instead of record by record
+- Updates are written concurrently with at most ``concurrency`` in flight,
+  since ZeroDB has no bulk update endpoint
+- Records that already carry ``anonymized_at`` are skipped, so re-running an
+  interrupted deletion only touches the records it did not get to
+
+Usage:
+    anonymizer = BulkAnonymizer(db)
+    result = await anonymizer.run(
+        "rsvps",
+        {"user_id": user_id},
+        lambda batch: anonymize_documents(batch, AnonymizationType.RSVP, user_id)
+    )
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_CONCURRENCY = 16
+MAX_ERROR_DETAILS = 10
+
+ANONYMIZED_MARKER = "anonymized_at"
+
+BatchTransform = Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+
+class AnonymizationResult(NamedTuple):
+    """Outcome of anonymizing one collection"""
+    collection: str
+    found: int
+    anonymized: int
+    already_anonymized: int
+    failed: int
+    errors: List[str]  # First MAX_ERROR_DETAILS error messages
+
+
+class BulkAnonymizer:
+    """
+    Anonymizes a user's records in a collection in batches
+
+    The ZeroDB client is synchronous, so queries and updates run in worker
+    threads; several collections can be anonymized at once with
+    ``asyncio.gather`` without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        """
+        Initialize the executor
+
+        Args:
+            db: ZeroDB client
+            page_size: Records read per query and anonymized per batch
+            concurrency: Maximum updates in flight per collection
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        self.db = db
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+    async def run(
+        self,
+        collection: str,
+        filters: Dict[str, Any],
+        transform: BatchTransform
+    ) -> AnonymizationResult:
+        """
+        Anonymize every matching record of a collection
+
+        Args:
+            collection: Collection name
+            filters: Query selecting the user's records
+            transform: Returns the anonymized replacement of each record of a
+                batch, in order
+
+        Returns:
+            AnonymizationResult
+
+        Raises:
+            Exception: If the records cannot be read (update failures are
+                counted in the result instead)
+        """
+        documents = await self.fetch(collection, filters)
+        pending = [document for document in documents if not document.get(ANONYMIZED_MARKER)]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        anonymized = 0
+        errors: List[str] = []
+
+        for start in range(0, len(pending), self.page_size):
+            batch = pending[start:start + self.page_size]
+            replacements = transform(batch)
+
+            outcomes = await asyncio.gather(
+                *(
+                    self._update(semaphore, collection, document["id"], replacement)
+                    for document, replacement in zip(batch, replacements)
+                ),
+                return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    errors.append(str(outcome))
+                else:
+                    anonymized += 1
+
+        if errors:
+            logger.warning(f"{len(errors)} {collection} record(s) could not be anonymized: {errors[0]}")
+
+        return AnonymizationResult(
+            collection=collection,
+            found=len(documents),
+            anonymized=anonymized,
+            already_anonymized=len(documents) - len(pending),
+            failed=len(errors),
+            errors=errors[:MAX_ERROR_DETAILS],
+        )
+
+    async def fetch(self, collection: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Read every matching record, page by page
+
+        All pages are read before any record is updated: anonymizing a record
+        can change the fields it was selected by (payments lose their
+        ``user_id``), which would shift offsets under a query still in progress.
+        Records are de-duplicated by ID, and paging stops once a page adds
+        nothing new.
+
+        Args:
+            collection: Collection name
+            filters: Query selecting the records
+
+        Returns:
+            Matching records
+        """
+        documents: List[Dict[str, Any]] = []
+        seen = set()
+        offset = 0
+
+        while True:
+            result = await asyncio.to_thread(
+                self.db.query_documents,
+                collection,
+                filters=filters,
+                limit=self.page_size,
+                offset=offset
+            )
+            page = result.get("documents", [])
+
+            added = 0
+            for document in page:
+                document_id = document.get("id")
+                if document_id not in seen:
+                    seen.add(document_id)
+                    documents.append(document)
+                    added += 1
+
+            if len(page) < self.page_size or not added:
+                return documents
+            offset += len(page)
+
+    async def _update(
+        self,
+        semaphore: asyncio.Semaphore,
+        collection: str,
+        document_id: str,
+        replacement: Dict[str, Any]
+    ) -> None:
+        async with semaphore:
+            await asyncio.to_thread(
+                self.db.update_document,
+                collection,
+                document_id,
+                replacement,
+                merge=False  # Full replacement
+            )
@@ -0,0 +1,650 @@
+"""
+Chat Fan-out Service - Multi-node WebSocket delivery for session chat
+
+Delivers training-session chat events to every participant of a session,
+regardless of which worker or replica their WebSocket is connected to:
+- One Redis pub/sub channel per session; each node subscribes only to the
+  sessions it has local connections for
+- Messages are serialized once per broadcast and the same frame is handed
+  to every local recipient and published to the other nodes
+- Each connection has its own bounded send queue drained by a dedicated
+  writer task, so a slow client never delays the rest of the session
+- Slow consumers (full queue or a send that exceeds the timeout) are
+  evicted and closed with 1013 (try again later) so they can reconnect
+- Presence (active users) is kept in a per-session Redis hash so every
+  node sees the whole session; each entry names its node, and entries of
+  nodes whose heartbeat key has expired (crashed without disconnecting)
+  are dropped
+
+When Redis is unavailable the service degrades to single-node delivery.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from fastapi import WebSocket, status
+
+from backend.config import get_settings
+from backend.observability.metrics import (
+    websocket_connections,
+    websocket_evictions_total,
+    websocket_frames_total,
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Channel and presence keys
+CHANNEL_PREFIX = "session_chat:"
+PRESENCE_KEY_PREFIX = "session_chat:presence:"
+PRESENCE_TTL = 6 * 3600  # Presence hashes outlive any session; refreshed on join
+NODE_KEY_PREFIX = "session_chat:node:"
+NODE_TTL = 30  # Seconds a node counts as alive after its last heartbeat
+NODE_HEARTBEAT_SECONDS = 10  # Interval between node heartbeats
+
+# Per-connection delivery limits
+SEND_QUEUE_SIZE = 256  # Frames buffered per connection before eviction
+SEND_TIMEOUT = 5.0  # Seconds a single send may take before eviction
+
+# Listener reconnect backoff
+LISTENER_BACKOFF_INITIAL = 0.5
+LISTENER_BACKOFF_MAX = 10.0
+
+
+def serialize_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a chat event to a WebSocket text frame.
+
+    Uses the same compact encoding as Starlette's ``send_json`` so clients
+    see identical payloads.
+
+    Args:
+        message: Event dict
+
+    Returns:
+        JSON text frame
+    """
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def encode_envelope(node_id: str, recipient_id: Optional[str], frame: str) -> str:
+    """
+    Wrap a serialized frame for publishing to other nodes.
+
+    The header carries the origin node (to drop our own echoes) and an
+    optional private recipient; the frame itself is never re-encoded.
+
+    Args:
+        node_id: Publishing node ID
+        recipient_id: Recipient user ID for private messages, or None
+        frame: Serialized frame
+
+    Returns:
+        Envelope string ``"<node_id>|<recipient_id>\\n<frame>"``
+    """
+    return f"{node_id}|{recipient_id or ''}\n{frame}"
+
+
+def decode_envelope(envelope: str) -> tuple:
+    """
+    Split a published envelope into its parts.
+
+    Args:
+        envelope: Envelope produced by ``encode_envelope``
+
+    Returns:
+        Tuple of (node_id, recipient_id or None, frame)
+    """
+    header, _, frame = envelope.partition("\n")
+    node_id, _, recipient_id = header.partition("|")
+    return node_id, (recipient_id or None), frame
+
+
+class ChatConnection:
+    """
+    A local WebSocket connection with its own bounded send queue
+
+    Frames are enqueued without awaiting the network; a writer task drains
+    the queue. ``enqueue`` returns False when the queue is full, signalling
+    the owner to evict the connection.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        user_info: dict,
+        on_evict,
+        queue_size: int = SEND_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT
+    ):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.user_info = user_info
+        self.user_id = str(user_info["user_id"])
+        self.conn_id = uuid4().hex
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.send_timeout = send_timeout
+        self._on_evict = on_evict
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, frame: str) -> bool:
+        """
+        Queue a frame for delivery without blocking.
+
+        Args:
+            frame: Serialized frame
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _write_loop(self) -> None:
+        while True:
+            frame = await self.queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(frame), self.send_timeout)
+            except asyncio.TimeoutError:
+                self._on_evict(self, "send_timeout")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Send to connection {self.conn_id} failed: {e}")
+                self._on_evict(self, "send_error")
+                return
+
+    async def stop(self) -> None:
+        """Cancel the writer task, dropping any undelivered frames."""
+        if self._writer and not self._writer.done():
+            self._writer.cancel()
+            try:
+                await self._writer
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class ChatFanoutService:
+    """
+    Fans out session chat events across nodes via Redis pub/sub
+
+    Local connections are tracked per session; broadcasts are delivered to
+    local connections directly and published on the session channel for
+    the other nodes to deliver to theirs.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[aioredis.Redis] = None,
+        queue_size: int = SEND_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT
+    ):
+        """
+        Initialize the fan-out service.
+
+        Args:
+            redis_url: Redis connection URL (defaults to settings.REDIS_URL)
+            client: Pre-configured async Redis client (for testing)
+            queue_size: Per-connection send queue size
+            send_timeout: Per-send timeout in seconds
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self._redis = client
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.node_id = uuid4().hex
+
+        # session_id -> {websocket: ChatConnection}
+        self.sessions: Dict[str, Dict[WebSocket, ChatConnection]] = {}
+
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._closed = False
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Redis plumbing
+    # ------------------------------------------------------------------
+
+    def _get_redis(self) -> Optional[aioredis.Redis]:
+        if self._redis is None:
+            try:
+                self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Chat fan-out running single-node, Redis unavailable: {e}")
+                return None
+        return self._redis
+
+    @staticmethod
+    def channel(session_id: str) -> str:
+        """Pub/sub channel for a session."""
+        return f"{CHANNEL_PREFIX}{session_id}"
+
+    @staticmethod
+    def presence_key(session_id: str) -> str:
+        """Presence hash for a session."""
+        return f"{PRESENCE_KEY_PREFIX}{session_id}"
+
+    @staticmethod
+    def node_key(node_id: str) -> str:
+        """Liveness key for a node."""
+        return f"{NODE_KEY_PREFIX}{node_id}"
+
+    async def _ensure_heartbeat(self, client: aioredis.Redis) -> None:
+        """Mark this node alive and keep it alive while the service runs."""
+        if self._heartbeat is not None and not self._heartbeat.done():
+            return
+        await client.set(self.node_key(self.node_id), 1, ex=NODE_TTL)
+        self._heartbeat = asyncio.create_task(self._beat())
+
+    async def _beat(self) -> None:
+        """Refresh the node key so presence entries of this node stay visible."""
+        while not self._closed:
+            await asyncio.sleep(NODE_HEARTBEAT_SECONDS)
+            try:
+                await self._get_redis().set(self.node_key(self.node_id), 1, ex=NODE_TTL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Chat fan-out node heartbeat failed: {e}")
+
+    async def _subscribe(self, session_id: str) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            if self._pubsub is None:
+                self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(self.channel(session_id))
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+        except Exception as e:
+            logger.error(f"Failed to subscribe to session {session_id}: {e}")
+
+    async def _unsubscribe(self, session_id: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self.channel(session_id))
+        except Exception as e:
+            logger.warning(f"Failed to unsubscribe from session {session_id}: {e}")
+
+    async def _resubscribe(self) -> None:
+        channels = [self.channel(session_id) for session_id in self.sessions]
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+        self._pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+        if channels:
+            await self._pubsub.subscribe(*channels)
+
+    async def _listen(self) -> None:
+        """Relay messages published by other nodes to local connections."""
+        backoff = LISTENER_BACKOFF_INITIAL
+
+        while not self._closed:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.1)
+                    continue
+
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                backoff = LISTENER_BACKOFF_INITIAL
+                if message and message.get("type") == "message":
+                    self._handle_remote(message["channel"], message["data"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Chat fan-out listener error, reconnecting in {backoff}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, LISTENER_BACKOFF_MAX)
+                try:
+                    await self._resubscribe()
+                except Exception as resubscribe_error:
+                    logger.error(f"Chat fan-out resubscribe failed: {resubscribe_error}")
+
+    def _handle_remote(self, channel: str, envelope: str) -> None:
+        node_id, recipient_id, frame = decode_envelope(envelope)
+        if node_id == self.node_id:
+            return
+        session_id = channel[len(CHANNEL_PREFIX):]
+        self._deliver(session_id, frame, recipient_id=recipient_id, origin="remote")
+
+    async def _publish(self, session_id: str, frame: str, recipient_id: Optional[str] = None) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.publish(
+                self.channel(session_id),
+                encode_envelope(self.node_id, recipient_id, frame)
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish to session {session_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Local delivery
+    # ------------------------------------------------------------------
+
+    def _deliver(
+        self,
+        session_id: str,
+        frame: str,
+        recipient_id: Optional[str] = None,
+        exclude: Optional[Set[WebSocket]] = None,
+        origin: str = "local"
+    ) -> int:
+        """
+        Queue a frame on local connections of a session.
+
+        Returns:
+            Number of connections the frame was queued on
+        """
+        connections = self.sessions.get(session_id)
+        if not connections:
+            return 0
+
+        delivered = 0
+        for websocket, connection in list(connections.items()):
+            if exclude and websocket in exclude:
+                continue
+            if recipient_id is not None and connection.user_id != str(recipient_id):
+                continue
+            if connection.enqueue(frame):
+                delivered += 1
+            else:
+                self._evict(connection, "queue_full")
+
+        if delivered:
+            websocket_frames_total.labels(origin=origin).inc(delivered)
+        return delivered
+
+    def _evict(self, connection: ChatConnection, reason: str) -> None:
+        """Drop a slow consumer and close its socket in the background."""
+        connections = self.sessions.get(connection.session_id)
+        if not connections or connections.get(connection.websocket) is not connection:
+            return
+
+        logger.warning(
+            f"Evicting slow chat consumer {connection.user_id} from session "
+            f"{connection.session_id} ({reason})"
+        )
+        websocket_evictions_total.labels(reason=reason).inc()
+
+        task = asyncio.create_task(self._close_evicted(connection))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _close_evicted(self, connection: ChatConnection) -> None:
+        await self.disconnect(connection.websocket, connection.session_id)
+        try:
+            await connection.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def connect(self, websocket: WebSocket, session_id: str, user_info: dict) -> ChatConnection:
+        """
+        Register an accepted WebSocket with a session.
+
+        Subscribes this node to the session channel on its first local
+        connection and records presence.
+
+        Args:
+            websocket: Accepted WebSocket connection
+            session_id: Training session ID
+            user_info: User information dict (user_id, user_name, role)
+
+        Returns:
+            ChatConnection for the WebSocket
+        """
+        connection = ChatConnection(
+            websocket,
+            session_id,
+            user_info,
+            on_evict=self._evict,
+            queue_size=self.queue_size,
+            send_timeout=self.send_timeout
+        )
+        connection.start()
+
+        first_local = session_id not in self.sessions
+        self.sessions.setdefault(session_id, {})[websocket] = connection
+        websocket_connections.inc()
+
+        if first_local:
+            await self._subscribe(session_id)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await self._ensure_heartbeat(client)
+                key = self.presence_key(session_id)
+                await client.hset(key, connection.conn_id, json.dumps({
+                    "user_id": connection.user_id,
+                    "user_name": user_info.get("user_name"),
+                    "role": user_info.get("role"),
+                    "node_id": self.node_id,
+                }, default=str))
+                await client.expire(key, PRESENCE_TTL)
+            except Exception as e:
+                logger.warning(f"Failed to record presence for session {session_id}: {e}")
+
+        return connection
+
+    async def disconnect(self, websocket: WebSocket, session_id: str) -> Optional[ChatConnection]:
+        """
+        Unregister a WebSocket from a session. Safe to call more than once.
+
+        Args:
+            websocket: WebSocket connection
+            session_id: Training session ID
+
+        Returns:
+            The removed ChatConnection, or None if it was not registered
+        """
+        connections = self.sessions.get(session_id)
+        if not connections or websocket not in connections:
+            return None
+
+        connection = connections.pop(websocket)
+        websocket_connections.dec()
+        if not connections:
+            del self.sessions[session_id]
+            await self._unsubscribe(session_id)
+
+        await connection.stop()
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.hdel(self.presence_key(session_id), connection.conn_id)
+            except Exception as e:
+                logger.warning(f"Failed to clear presence for session {session_id}: {e}")
+
+        return connection
+
+    async def broadcast(
+        self,
+        session_id: str,
+        message: dict,
+        exclude: Optional[Set[WebSocket]] = None
+    ) -> int:
+        """
+        Broadcast an event to every participant of a session on all nodes.
+
+        Args:
+            session_id: Training session ID
+            message: Event dict
+            exclude: Local websockets to skip (e.g. the sender)
+
+        Returns:
+            Number of local connections the event was queued on
+        """
+        frame = serialize_message(message)
+        delivered = self._deliver(session_id, frame, exclude=exclude)
+        await self._publish(session_id, frame)
+        return delivered
+
+    async def send_private(self, session_id: str, recipient_id: str, message: dict) -> int:
+        """
+        Send an event to one user's connections in a session on all nodes.
+
+        Args:
+            session_id: Training session ID
+            recipient_id: Recipient user ID
+            message: Event dict
+
+        Returns:
+            Number of local connections the event was queued on
+        """
+        frame = serialize_message(message)
+        delivered = self._deliver(session_id, frame, recipient_id=str(recipient_id))
+        await self._publish(session_id, frame, recipient_id=str(recipient_id))
+        return delivered
+
+    def get_local_users(self, session_id: str) -> List[dict]:
+        """
+        Get users connected to a session on this node.
+
+        Args:
+            session_id: Training session ID
+
+        Returns:
+            List of user info dicts
+        """
+        return [
+            {
+                "user_id": connection.user_id,
+                "user_name": connection.user_info["user_name"],
+                "role": connection.user_info["role"],
+            }
+            for connection in self.sessions.get(session_id, {}).values()
+        ]
+
+    async def get_active_users(self, session_id: str) -> List[dict]:
+        """
+        Get users connected to a session across all nodes.
+
+        Entries recorded by nodes whose heartbeat has expired are left
+        behind by crashes; they are skipped and removed from the hash.
+        Falls back to this node's connections when Redis is unavailable.
+
+        Args:
+            session_id: Training session ID
+
+        Returns:
+            List of user info dicts (one per connection)
+        """
+        client = self._get_redis()
+        if client is None:
+            return self.get_local_users(session_id)
+        try:
+            key = self.presence_key(session_id)
+            entries = {
+                conn_id: json.loads(entry)
+                for conn_id, entry in (await client.hgetall(key)).items()
+            }
+            node_ids = sorted({
+                entry["node_id"] for entry in entries.values()
+                if entry.get("node_id") and entry["node_id"] != self.node_id
+            })
+            alive = {self.node_id}
+            if node_ids:
+                beats = await client.mget([self.node_key(node_id) for node_id in node_ids])
+                alive.update(node_id for node_id, beat in zip(node_ids, beats) if beat is not None)
+
+            stale = {
+                conn_id for conn_id, entry in entries.items()
+                if entry.get("node_id") and entry["node_id"] not in alive
+            }
+            if stale:
+                await client.hdel(key, *stale)
+
+            users = []
+            for conn_id, entry in entries.items():
+                if conn_id in stale:
+                    continue
+                entry.pop("node_id", None)
+                users.append(entry)
+            return users
+        except Exception as e:
+            logger.warning(f"Failed to read presence for session {session_id}: {e}")
+            return self.get_local_users(session_id)
+
+    async def close(self) -> None:
+        """Stop the listener and heartbeat and drop all local connections."""
+        self._closed = True
+        for task in (self._listener, self._heartbeat):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+        for session_id in list(self.sessions):
+            for websocket in list(self.sessions.get(session_id, {})):
+                await self.disconnect(websocket, session_id)
+
+        if self._heartbeat is not None and self._redis is not None:
+            try:
+                await self._redis.delete(self.node_key(self.node_id))
+            except Exception:
+                pass
+
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception:
+                pass
+
+
+# Global fan-out service instance
+_chat_fanout_service: Optional[ChatFanoutService] = None
+
+
+def get_chat_fanout_service() -> ChatFanoutService:
+    """
+    Get or create the global chat fan-out service instance.
+
+    Returns:
+        ChatFanoutService instance
+    """
+    global _chat_fanout_service
+
+    if _chat_fanout_service is None:
+        _chat_fanout_service = ChatFanoutService()
+
+    return _chat_fanout_service
@@ -0,0 +1,603 @@
+"""
+Chat Write-Behind Service - Batched persistence for session chat
+
+Takes chat writes (messages, reactions, raised hands, deletions of
+not-yet-persisted messages) off the request path:
+- Writes are appended to a durable Redis stream in one MULTI together with
+  the state readers need until the write reaches ZeroDB (pending message
+  and raised-hand documents, reaction counters, a per-session history
+  stream of recent messages)
+- A background worker reads the stream through a consumer group in
+  batches, coalesces reactions per message, applies the batch to ZeroDB
+  and acknowledges only what was applied; entries of a crashed worker are
+  reclaimed after ``CLAIM_IDLE_MS``
+- Message and raised-hand inserts are idempotent (the pending document is
+  removed once inserted, so a redelivered entry is a no-op); reaction
+  counts are at-least-once. Workers hold a short per-message lock while
+  they read, add to and write back a message's reaction counts, so
+  concurrent flushes don't overwrite each other's increments
+
+Readers combine the per-session history stream (recent messages) with
+ZeroDB (older messages); see ``SessionChatService.get_messages``.
+"""
+
+import json
+import logging
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import track_background_job
+from backend.services.zerodb_service import ZeroDBClient
+
+logger = logging.getLogger(__name__)
+
+# Durable write stream
+STREAM_KEY = "chat:wb:stream"
+CONSUMER_GROUP = "chat-persist"
+
+# Read-side state kept until the write reaches ZeroDB
+PENDING_MESSAGES_KEY = "chat:wb:messages"  # message_id -> message document
+PENDING_SESSION_KEY_PREFIX = "chat:wb:pending:"  # session_id -> set of pending message IDs
+PENDING_HANDS_KEY_PREFIX = "chat:wb:hands:"  # session_id -> {hand_id: document}
+DELETED_KEY = "chat:deleted"  # message_id -> {deleted_at, deleted_by}
+REACTIONS_KEY_PREFIX = "chat:reactions:"  # message_id -> {emoji: count}
+HISTORY_KEY_PREFIX = "chat:history:"  # session_id -> stream of recent messages
+
+HISTORY_MAXLEN = 500  # Recent messages kept per session (approximate)
+HISTORY_TTL = 86400  # Seconds history and overlays outlive the last write
+
+# Flush worker
+FLUSH_BATCH_SIZE = 200
+FLUSH_BLOCK_MS = 1000
+FLUSH_CONCURRENCY = 8  # Parallel ZeroDB writes within a batch
+CLAIM_IDLE_MS = 60000  # Reclaim entries unacknowledged for this long
+REACTION_LOCK_KEY_PREFIX = "chat:wb:reaction_lock:"  # message_id -> token of the flushing worker
+REACTION_LOCK_TTL = 30  # Seconds a reaction flush may hold a message's lock
+
+# Delete a lock only if the caller still owns it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ChatWriteBehindError(Exception):
+    """Raised when a chat write cannot be buffered"""
+    pass
+
+
+class ChatWriteBehindService:
+    """
+    Buffers chat writes in Redis and flushes them to ZeroDB in batches
+
+    Append methods raise ChatWriteBehindError when Redis is unavailable so
+    callers can fall back to a synchronous ZeroDB write. Read methods
+    degrade to empty results.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        db_client: Optional[ZeroDBClient] = None
+    ):
+        """
+        Initialize the write-behind service.
+
+        Args:
+            redis_client: Redis client (created from settings.REDIS_URL if omitted)
+            db_client: ZeroDB client used by the flush worker
+        """
+        self.redis_client = redis_client or redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self._db = db_client
+        self._group_ready = False
+        self._release_lock_script = None
+
+    @property
+    def db(self) -> ZeroDBClient:
+        if self._db is None:
+            self._db = ZeroDBClient()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # Append (request path)
+    # ------------------------------------------------------------------
+
+    def append_message(self, message_data: Dict[str, Any]) -> None:
+        """
+        Buffer a new chat message.
+
+        Args:
+            message_data: JSON-serializable message document (with id)
+
+        Raises:
+            ChatWriteBehindError: If the message cannot be buffered
+        """
+        message_id = str(message_data["id"])
+        history_key = f"{HISTORY_KEY_PREFIX}{message_data['session_id']}"
+        pending_key = f"{PENDING_SESSION_KEY_PREFIX}{message_data['session_id']}"
+        document = json.dumps(message_data, default=str)
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hset(PENDING_MESSAGES_KEY, message_id, document)
+            pipe.sadd(pending_key, message_id)
+            pipe.expire(pending_key, HISTORY_TTL)
+            pipe.xadd(history_key, {"id": message_id, "data": document}, maxlen=HISTORY_MAXLEN, approximate=True)
+            pipe.expire(history_key, HISTORY_TTL)
+            pipe.xadd(STREAM_KEY, {"op": "message", "id": message_id})
+            pipe.execute()
+        except redis.RedisError as e:
+            raise ChatWriteBehindError(f"Failed to buffer message {message_id}: {e}")
+
+    def append_reaction(self, message_id: str, reaction: str) -> None:
+        """
+        Buffer a reaction increment.
+
+        Args:
+            message_id: Message ID
+            reaction: Emoji reaction
+
+        Raises:
+            ChatWriteBehindError: If the reaction cannot be buffered
+        """
+        reactions_key = f"{REACTIONS_KEY_PREFIX}{message_id}"
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hincrby(reactions_key, reaction, 1)
+            pipe.expire(reactions_key, HISTORY_TTL)
+            pipe.xadd(STREAM_KEY, {"op": "reaction", "id": str(message_id), "reaction": reaction})
+            pipe.execute()
+        except redis.RedisError as e:
+            raise ChatWriteBehindError(f"Failed to buffer reaction on {message_id}: {e}")
+
+    def append_delete(self, message_id: str, deleted_by: str, deleted_at: str) -> None:
+        """
+        Buffer the deletion of a message that has not reached ZeroDB yet.
+
+        The delete entry follows the message's insert in the stream, so the
+        worker always applies it after the insert.
+
+        Args:
+            message_id: Message ID
+            deleted_by: Moderator user ID
+            deleted_at: Deletion timestamp (ISO format)
+
+        Raises:
+            ChatWriteBehindError: If the deletion cannot be buffered
+        """
+        try:
+            self.redis_client.xadd(STREAM_KEY, {
+                "op": "delete",
+                "id": str(message_id),
+                "deleted_by": str(deleted_by),
+                "deleted_at": deleted_at,
+            })
+        except redis.RedisError as e:
+            raise ChatWriteBehindError(f"Failed to buffer deletion of {message_id}: {e}")
+
+    def mark_deleted(self, message_id: str, deleted_by: str, deleted_at: str) -> None:
+        """
+        Hide a message from buffered reads immediately.
+
+        Args:
+            message_id: Message ID
+            deleted_by: Moderator user ID
+            deleted_at: Deletion timestamp (ISO format)
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hset(DELETED_KEY, str(message_id), json.dumps({
+                "deleted_by": str(deleted_by),
+                "deleted_at": deleted_at,
+            }))
+            pipe.expire(DELETED_KEY, HISTORY_TTL)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to mark message {message_id} deleted in history: {e}")
+
+    def append_raised_hand(self, hand_data: Dict[str, Any]) -> None:
+        """
+        Buffer a new raised hand.
+
+        Args:
+            hand_data: JSON-serializable raised hand document (with id)
+
+        Raises:
+            ChatWriteBehindError: If the raised hand cannot be buffered
+        """
+        hand_id = str(hand_data["id"])
+        session_id = str(hand_data["session_id"])
+        hands_key = f"{PENDING_HANDS_KEY_PREFIX}{session_id}"
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hset(hands_key, hand_id, json.dumps(hand_data, default=str))
+            pipe.expire(hands_key, HISTORY_TTL)
+            pipe.xadd(STREAM_KEY, {"op": "hand", "id": hand_id, "session_id": session_id})
+            pipe.execute()
+        except redis.RedisError as e:
+            raise ChatWriteBehindError(f"Failed to buffer raised hand {hand_id}: {e}")
+
+    def update_pending_hand(self, hand_data: Dict[str, Any]) -> bool:
+        """
+        Update a raised hand that has not reached ZeroDB yet.
+
+        The worker persists whatever state the hand is in when it flushes.
+
+        Args:
+            hand_data: Updated raised hand document
+
+        Returns:
+            True if the hand was still pending and was updated
+        """
+        hands_key = f"{PENDING_HANDS_KEY_PREFIX}{hand_data['session_id']}"
+        try:
+            if not self.redis_client.hexists(hands_key, str(hand_data["id"])):
+                return False
+            self.redis_client.hset(hands_key, str(hand_data["id"]), json.dumps(hand_data, default=str))
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Failed to update pending raised hand {hand_data['id']}: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_pending_message(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a message that has not reached ZeroDB yet.
+
+        Args:
+            message_id: Message ID
+
+        Returns:
+            Message document, or None if not pending (or Redis is unavailable)
+        """
+        try:
+            document = self.redis_client.hget(PENDING_MESSAGES_KEY, str(message_id))
+            return json.loads(document) if document else None
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read pending message {message_id}: {e}")
+            return None
+
+    def get_pending_messages(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a session's messages that have not reached ZeroDB yet.
+
+        Args:
+            session_id: Training session ID
+
+        Returns:
+            Message documents with reactions and deletions applied, oldest first
+        """
+        try:
+            message_ids = self.redis_client.smembers(f"{PENDING_SESSION_KEY_PREFIX}{session_id}")
+            documents = self.redis_client.hmget(PENDING_MESSAGES_KEY, list(message_ids)) if message_ids else []
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read pending messages for session {session_id}: {e}")
+            return []
+
+        # IDs of messages persisted since the index was read have no document
+        messages = [json.loads(doc) for doc in documents if doc]
+        messages.sort(key=lambda doc: doc.get("timestamp") or "")
+        return self._apply_overlays(messages)
+
+    def get_recent_messages(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a session's recent messages from its history stream.
+
+        Includes messages not yet persisted; reactions and deletions made
+        since a message was written are applied.
+
+        Args:
+            session_id: Training session ID
+
+        Returns:
+            Up to ~HISTORY_MAXLEN message documents, oldest first
+        """
+        try:
+            entries = self.redis_client.xrange(f"{HISTORY_KEY_PREFIX}{session_id}")
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read chat history for session {session_id}: {e}")
+            return []
+
+        return self._apply_overlays([json.loads(fields["data"]) for _, fields in entries])
+
+    def get_pending_hands(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a session's raised hands that have not reached ZeroDB yet.
+
+        Args:
+            session_id: Training session ID
+
+        Returns:
+            Raised hand documents
+        """
+        try:
+            return [
+                json.loads(doc)
+                for doc in self.redis_client.hvals(f"{PENDING_HANDS_KEY_PREFIX}{session_id}")
+            ]
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read pending raised hands for session {session_id}: {e}")
+            return []
+
+    def _apply_overlays(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not messages:
+            return messages
+
+        ids = [str(msg["id"]) for msg in messages]
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hmget(DELETED_KEY, ids)
+            for message_id in ids:
+                pipe.hgetall(f"{REACTIONS_KEY_PREFIX}{message_id}")
+            deleted, *reactions = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read chat overlays: {e}")
+            return messages
+
+        for msg, deletion, counts in zip(messages, deleted, reactions):
+            if deletion:
+                msg.update(json.loads(deletion), is_deleted=True)
+            if counts:
+                merged = dict(msg.get("reactions") or {})
+                for emoji, count in counts.items():
+                    merged[emoji] = merged.get(emoji, 0) + int(count)
+                msg["reactions"] = merged
+        return messages
+
+    # ------------------------------------------------------------------
+    # Flush worker
+    # ------------------------------------------------------------------
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.redis_client.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def flush(self, consumer: str, block_ms: Optional[int] = None) -> int:
+        """
+        Persist one batch of buffered writes to ZeroDB.
+
+        Reclaims entries abandoned by crashed consumers first, then reads
+        new entries (blocking up to ``block_ms`` when there are none).
+
+        Args:
+            consumer: Consumer name, unique per worker
+            block_ms: Milliseconds to wait for new entries (None = don't block)
+
+        Returns:
+            Number of entries acknowledged
+        """
+        self._ensure_group()
+
+        _, entries, *_ = self.redis_client.xautoclaim(
+            STREAM_KEY, CONSUMER_GROUP, consumer,
+            min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=FLUSH_BATCH_SIZE
+        )
+        if not entries:
+            response = self.redis_client.xreadgroup(
+                CONSUMER_GROUP, consumer, {STREAM_KEY: ">"},
+                count=FLUSH_BATCH_SIZE, block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+        if not entries:
+            return 0
+
+        with track_background_job("chat_write_behind_flush"):
+            acked = self._apply(entries)
+
+        if acked:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.xack(STREAM_KEY, CONSUMER_GROUP, *acked)
+            pipe.xdel(STREAM_KEY, *acked)
+            pipe.execute()
+
+        logger.info(f"Flushed {len(acked)}/{len(entries)} buffered chat writes")
+        return len(acked)
+
+    def _apply(self, entries: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+        """Apply a batch to ZeroDB; returns the entry IDs that may be acked."""
+        acked: List[str] = []
+        messages: List[Tuple[str, str]] = []
+        reactions: Dict[str, List[Tuple[str, str]]] = {}
+        deletes: List[Tuple[str, Dict[str, str]]] = []
+        hands: List[Tuple[str, Dict[str, str]]] = []
+
+        for entry_id, fields in entries:
+            op = fields.get("op")
+            if op == "message":
+                messages.append((entry_id, fields["id"]))
+            elif op == "reaction":
+                reactions.setdefault(fields["id"], []).append((entry_id, fields["reaction"]))
+            elif op == "delete":
+                deletes.append((entry_id, fields))
+            elif op == "hand":
+                hands.append((entry_id, fields))
+            else:
+                logger.warning(f"Dropping unknown chat write-behind entry {entry_id}: {fields}")
+                acked.append(entry_id)
+
+        # Inserts first: reactions and deletes in the same batch refer to them
+        acked.extend(self._flush_messages(messages))
+        acked.extend(self._flush_hands(hands))
+        acked.extend(self._flush_reactions(reactions))
+        acked.extend(self._flush_deletes(deletes))
+        return acked
+
+    def _run_concurrently(self, func, items: list) -> List[Any]:
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(FLUSH_CONCURRENCY, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def _flush_messages(self, messages: List[Tuple[str, str]]) -> List[str]:
+        if not messages:
+            return []
+
+        documents = self.redis_client.hmget(PENDING_MESSAGES_KEY, [message_id for _, message_id in messages])
+
+        def insert(item) -> Optional[str]:
+            (entry_id, message_id), document = item
+            if document is None:
+                return entry_id  # Already persisted (redelivery)
+            try:
+                message_data = json.loads(document)
+                self.db.insert_one("session_chat_messages", message_data)
+                pipe = self.redis_client.pipeline(transaction=True)
+                pipe.hdel(PENDING_MESSAGES_KEY, message_id)
+                pipe.srem(f"{PENDING_SESSION_KEY_PREFIX}{message_data.get('session_id')}", message_id)
+                pipe.execute()
+                return entry_id
+            except Exception as e:
+                logger.error(f"Failed to persist chat message {message_id}: {e}")
+                return None
+
+        return [entry_id for entry_id in self._run_concurrently(insert, list(zip(messages, documents))) if entry_id]
+
+    def _flush_hands(self, hands: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+        def insert(item) -> Optional[str]:
+            entry_id, fields = item
+            hands_key = f"{PENDING_HANDS_KEY_PREFIX}{fields['session_id']}"
+            try:
+                document = self.redis_client.hget(hands_key, fields["id"])
+                if document is None:
+                    return entry_id  # Already persisted (redelivery)
+                self.db.insert_one("session_raised_hands", json.loads(document))
+                self.redis_client.hdel(hands_key, fields["id"])
+                return entry_id
+            except Exception as e:
+                logger.error(f"Failed to persist raised hand {fields['id']}: {e}")
+                return None
+
+        return [entry_id for entry_id in self._run_concurrently(insert, hands) if entry_id]
+
+    def _flush_reactions(self, reactions: Dict[str, List[Tuple[str, str]]]) -> List[str]:
+        def apply(item) -> List[str]:
+            message_id, increments = item
+            entry_ids = [entry_id for entry_id, _ in increments]
+            token = None
+            try:
+                if self.redis_client.hexists(PENDING_MESSAGES_KEY, message_id):
+                    return []  # Insert not applied yet; retry after it is
+
+                token = self._acquire_reaction_lock(message_id)
+                if token is None:
+                    return []  # Another worker is flushing this message; retry after it is
+
+                message_data = self.db.find_by_id("session_chat_messages", message_id)
+                if not message_data:
+                    logger.warning(f"Dropping reactions on missing chat message {message_id}")
+                    return entry_ids
+
+                counts = dict(message_data.get("reactions") or {})
+                for _, reaction in increments:
+                    counts[reaction] = counts.get(reaction, 0) + 1
+                self.db.update_one("session_chat_messages", message_id, {"reactions": counts})
+                return entry_ids
+            except Exception as e:
+                logger.error(f"Failed to persist reactions on chat message {message_id}: {e}")
+                return []
+            finally:
+                if token:
+                    self._release_reaction_lock(message_id, token)
+
+        return [
+            entry_id
+            for entry_ids in self._run_concurrently(apply, list(reactions.items()))
+            for entry_id in entry_ids
+        ]
+
+    def _acquire_reaction_lock(self, message_id: str) -> Optional[str]:
+        """Take a message's reaction lock; returns its token, or None if held."""
+        token = uuid4().hex
+        acquired = self.redis_client.set(
+            f"{REACTION_LOCK_KEY_PREFIX}{message_id}", token, nx=True, ex=REACTION_LOCK_TTL
+        )
+        return token if acquired else None
+
+    def _release_reaction_lock(self, message_id: str, token: str) -> None:
+        """Release a message's reaction lock if we still own it"""
+        try:
+            if self._release_lock_script is None:
+                self._release_lock_script = self.redis_client.register_script(_RELEASE_LOCK_SCRIPT)
+            self._release_lock_script(keys=[f"{REACTION_LOCK_KEY_PREFIX}{message_id}"], args=[token])
+        except redis.RedisError as e:
+            logger.warning(f"Failed to release reaction lock of chat message {message_id}: {e}")
+
+    def _flush_deletes(self, deletes: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+        acked = []
+        for entry_id, fields in deletes:
+            try:
+                if self.redis_client.hexists(PENDING_MESSAGES_KEY, fields["id"]):
+                    continue  # Insert not applied yet; retry after it is
+                self.db.update_one("session_chat_messages", fields["id"], {
+                    "is_deleted": True,
+                    "deleted_at": fields["deleted_at"],
+                    "deleted_by": fields["deleted_by"],
+                })
+                acked.append(entry_id)
+            except Exception as e:
+                logger.error(f"Failed to persist deletion of chat message {fields['id']}: {e}")
+        return acked
+
+    def run(self, stop_event: threading.Event, consumer: Optional[str] = None) -> None:
+        """
+        Flush continuously until ``stop_event`` is set.
+
+        Args:
+            stop_event: Event that stops the loop after the current batch
+            consumer: Consumer name (defaults to hostname plus a random suffix)
+        """
+        consumer = consumer or f"{socket.gethostname()}-{uuid4().hex[:8]}"
+        logger.info(f"Chat write-behind worker {consumer} started")
+
+        while not stop_event.is_set():
+            try:
+                self.flush(consumer, block_ms=FLUSH_BLOCK_MS)
+            except redis.RedisError as e:
+                logger.error(f"Chat write-behind flush failed: {e}")
+                self._group_ready = False
+                stop_event.wait(1.0)
+            except Exception as e:
+                logger.error(f"Unexpected error flushing chat writes: {e}")
+                stop_event.wait(1.0)
+
+        logger.info(f"Chat write-behind worker {consumer} stopped")
+
+
+# Global write-behind service instance
+_chat_write_behind_service: Optional[ChatWriteBehindService] = None
+
+
+def get_chat_write_behind_service() -> ChatWriteBehindService:
+    """
+    Get or create the global chat write-behind service instance.
+
+    Returns:
+        ChatWriteBehindService instance
+    """
+    global _chat_write_behind_service
+
+    if _chat_write_behind_service is None:
+        _chat_write_behind_service = ChatWriteBehindService()
+
+    return _chat_write_behind_service
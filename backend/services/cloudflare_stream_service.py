@@ -4,18 +4,27 @@ Cloudflare Stream Service for WWMAA Backend
 Provides integration with Cloudflare Stream API for video on demand (VOD).
 Supports video upload, signed URL generation, and video management.
 
+Playback tokens are signed locally (RS256 JWT with the signing key created
+via the Stream keys API) when CLOUDFLARE_STREAM_SIGNING_KEY is configured,
+so no API round trip is needed per page view; otherwise they are requested
+from the token endpoint. Either way tokens are reused through the signed
+URL cache until they near expiry.
+
 API Documentation: https://developers.cloudflare.com/stream/
 """
 
+import base64
+import binascii
 import logging
 import requests
 import hmac
 import hashlib
 import time
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List
+import jwt
+from cryptography.hazmat.primitives import serialization
 from backend.config import settings
+from backend.services.signed_url_cache import SignedUrl, SignedUrlCache, get_signed_url_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,6 +40,12 @@ class StreamAPIError(CloudflareStreamError):
     pass
 
 
+# Playback tokens
+TOKEN_ALGORITHM = "RS256"  # The only algorithm Stream accepts for self-signed tokens
+TOKEN_NOT_BEFORE_SKEW = 60  # Seconds nbf is backdated to tolerate clock drift
+SIGNED_URL_ASSET_PREFIX = "stream:"
+
+
 class CloudflareStreamService:
     """
     Service for interacting with Cloudflare Stream API
@@ -45,7 +60,10 @@ class CloudflareStreamService:
     def __init__(
         self,
         account_id: Optional[str] = None,
-        api_token: Optional[str] = None
+        api_token: Optional[str] = None,
+        signing_key_id: Optional[str] = None,
+        signing_key: Optional[str] = None,
+        url_cache: Optional[SignedUrlCache] = None
     ):
         """
         Initialize Cloudflare Stream Service
@@ -53,6 +71,13 @@ class CloudflareStreamService:
         Args:
             account_id: Cloudflare account ID (defaults to settings.CLOUDFLARE_ACCOUNT_ID)
             api_token: Cloudflare API token (defaults to settings.CLOUDFLARE_API_TOKEN)
+            signing_key_id: Stream signing key ID (defaults to settings.CLOUDFLARE_STREAM_SIGNING_KEY_ID)
+            signing_key: Stream signing key PEM, raw or base64-encoded
+                (defaults to settings.CLOUDFLARE_STREAM_SIGNING_KEY)
+            url_cache: Signed URL cache (defaults to the global cache)
+
+        Raises:
+            CloudflareStreamError: If credentials are missing or the signing key is invalid
         """
         self.account_id = account_id or settings.CLOUDFLARE_ACCOUNT_ID
         self.api_token = api_token or settings.CLOUDFLARE_API_TOKEN
@@ -60,6 +85,15 @@ class CloudflareStreamService:
         if not self.account_id or not self.api_token:
             raise CloudflareStreamError("Cloudflare account ID and API token are required")
 
+        self.signing_key_id = signing_key_id or getattr(settings, "CLOUDFLARE_STREAM_SIGNING_KEY_ID", "")
+        self._signing_key = self._load_signing_key(
+            signing_key or getattr(settings, "CLOUDFLARE_STREAM_SIGNING_KEY", "")
+        )
+        if self._signing_key is not None and not self.signing_key_id:
+            raise CloudflareStreamError("CLOUDFLARE_STREAM_SIGNING_KEY_ID is required with a signing key")
+
+        self.url_cache = url_cache or get_signed_url_cache()
+
         self.base_url = f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/stream"
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
@@ -68,6 +102,35 @@ class CloudflareStreamService:
 
         logger.info(f"CloudflareStreamService initialized for account {self.account_id}")
 
+    @staticmethod
+    def _load_signing_key(key: Optional[str]) -> Optional[Any]:
+        """
+        Parse a Stream signing key once, so tokens are signed without re-parsing
+
+        Args:
+            key: PEM private key, raw or base64-encoded (the keys API returns it base64-encoded)
+
+        Returns:
+            Private key object, or None if no key is configured
+
+        Raises:
+            CloudflareStreamError: If the key cannot be parsed
+        """
+        if not key:
+            return None
+
+        pem = key.strip().encode("utf-8")
+        if not pem.startswith(b"-----BEGIN"):
+            try:
+                pem = base64.b64decode(pem, validate=True)
+            except binascii.Error:
+                raise CloudflareStreamError("Invalid Cloudflare Stream signing key encoding")
+
+        try:
+            return serialization.load_pem_private_key(pem, password=None)
+        except ValueError as e:
+            raise CloudflareStreamError(f"Invalid Cloudflare Stream signing key: {e}")
+
     def _make_request(
         self,
         method: str,
@@ -231,6 +294,7 @@ class CloudflareStreamService:
 
         try:
             self._make_request("DELETE", video_id)
+            self.url_cache.invalidate(SIGNED_URL_ASSET_PREFIX + video_id)
             logger.info(f"Video {video_id} deleted successfully")
             return True
 
@@ -238,6 +302,106 @@ class CloudflareStreamService:
             logger.error(f"Failed to delete video: {e}")
             return False
 
+    def generate_signed_token(
+        self,
+        video_id: str,
+        expiry_seconds: int = 86400,
+        download_allowed: bool = False
+    ) -> str:
+        """
+        Get a playback token for a video that requires signed URLs
+
+        Tokens are reused from the signed URL cache while they have enough
+        validity left, and refreshed in the background before they expire.
+
+        Args:
+            video_id: Cloudflare Stream video ID
+            expiry_seconds: Token lifetime in seconds
+            download_allowed: Whether the token allows downloading the video
+
+        Returns:
+            Signed playback token
+
+        Raises:
+            StreamAPIError: If the token has to be requested and the request fails
+        """
+        return self.get_playback_tokens([video_id], expiry_seconds, download_allowed)[video_id].url
+
+    def get_playback_tokens(
+        self,
+        video_ids: List[str],
+        expiry_seconds: int = 86400,
+        download_allowed: bool = False
+    ) -> Dict[str, SignedUrl]:
+        """
+        Get playback tokens for several videos at once (e.g. for a listing)
+
+        Cached tokens are looked up together and the missing ones minted in
+        one pass.
+
+        Args:
+            video_ids: Cloudflare Stream video IDs
+            expiry_seconds: Requested token lifetime in seconds
+            download_allowed: Whether the tokens allow downloading
+
+        Returns:
+            Dictionary mapping video IDs to SignedUrl, whose ``url`` is the
+            token and ``expires_at`` its actual expiry
+
+        Raises:
+            StreamAPIError: If a token has to be requested and the request fails
+        """
+        def mint(assets: List[str], ttl: int) -> Dict[str, str]:
+            return {
+                asset: self._mint_token(asset[len(SIGNED_URL_ASSET_PREFIX):], ttl, download_allowed)
+                for asset in assets
+            }
+
+        signed = self.url_cache.get_or_mint_many(
+            [SIGNED_URL_ASSET_PREFIX + video_id for video_id in video_ids],
+            expiry_seconds,
+            mint,
+            audience="playback",
+            permissions="download" if download_allowed else "view"
+        )
+
+        return {
+            asset[len(SIGNED_URL_ASSET_PREFIX):]: token
+            for asset, token in signed.items()
+        }
+
+    def _mint_token(self, video_id: str, expiry_seconds: int, download_allowed: bool) -> str:
+        """Sign a playback token locally, or request one if no signing key is configured"""
+        if self._signing_key is None:
+            logger.info(f"Requesting playback token for video {video_id}")
+            result = self._make_request(
+                "POST",
+                f"{video_id}/token",
+                data={
+                    "exp": int(time.time()) + expiry_seconds,
+                    "downloadable": download_allowed
+                }
+            )
+            token = result.get("token")
+            if not token:
+                raise StreamAPIError(f"No token returned for video {video_id}")
+            return token
+
+        now = int(time.time())
+        payload = {
+            "sub": video_id,
+            "kid": self.signing_key_id,
+            "exp": now + expiry_seconds,
+            "nbf": now - TOKEN_NOT_BEFORE_SKEW,
+            "downloadable": download_allowed
+        }
+        return jwt.encode(
+            payload,
+            self._signing_key,
+            algorithm=TOKEN_ALGORITHM,
+            headers={"kid": self.signing_key_id}
+        )
+
     def generate_signed_url(
         self,
         video_id: str,
@@ -247,44 +411,26 @@ class CloudflareStreamService:
         """
         Generate a signed URL for secure video playback
 
-        Note: This is a simplified implementation. For production, you should:
-        1. Store signing keys in Cloudflare Stream dashboard
-        2. Use proper HMAC-SHA256 signing with your key
-        3. Follow Cloudflare's exact signing specification
-
         Args:
             video_id: Cloudflare Stream video ID
             expiry_hours: URL expiry in hours
             download_allowed: Whether to allow video download
 
         Returns:
-            Signed video playback URL
+            Signed HLS manifest URL (the token takes the place of the video ID)
 
         Raises:
             StreamAPIError: If URL generation fails
         """
         logger.info(f"Generating signed URL for video {video_id}")
 
-        # Calculate expiry timestamp
-        expiry_timestamp = int((datetime.utcnow() + timedelta(hours=expiry_hours)).timestamp())
-
-        # Base playback URL
-        base_url = f"https://customer-{self.account_id}.cloudflarestream.com/{video_id}/manifest/video.m3u8"
-
-        # Build query parameters for signed URL
-        params = {
-            "exp": expiry_timestamp,
-            "download": "1" if download_allowed else "0"
-        }
-
-        # In production, sign these params with HMAC-SHA256
-        # For now, returning the base URL with params
-        # You need to configure signing keys in Cloudflare dashboard
-        signed_url = f"{base_url}?{urlencode(params)}"
-
-        logger.info(f"Signed URL generated for video {video_id}")
+        token = self.generate_signed_token(
+            video_id,
+            expiry_seconds=expiry_hours * 3600,
+            download_allowed=download_allowed
+        )
 
-        return signed_url
+        return f"https://customer-{self.account_id}.cloudflarestream.com/{token}/manifest/video.m3u8"
 
     def generate_embed_code(
         self,
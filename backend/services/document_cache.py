@@ -0,0 +1,334 @@
+"""
+Document Cache - read-through cache for hot ZeroDB documents
+
+Documents such as the current user, ``events/<id>`` and
+``subscriptions/<id>`` are fetched with ``get_document`` several times per
+request and again on every request. Caching is opt-in per collection: only
+collections with a TTL in ``ttls`` are cached, everything else is fetched
+as before.
+- Request tier: an identity map opened by ``document_cache_scope()`` (the
+  DocumentCacheScopeMiddleware opens one per HTTP request); a document is
+  fetched at most once per scope and every lookup returns the same object
+- Shared tier: one Redis key per document shared by all workers, or an
+  in-process LRU when Redis is not configured or unreachable; entries
+  expire after the collection's TTL
+- ``update_document`` and ``delete_document`` invalidate the document in
+  every tier. Invalidation leaves a short-lived tombstone, so a read that
+  started before the write cannot put the old version back
+
+Redis is an accelerator only: when it is unreachable the cache falls back
+to the in-process tier and retries Redis after ``REDIS_RETRY_INTERVAL``.
+
+Usage:
+    cache = get_document_cache()
+    user = cache.get_or_fetch("users", user_id, lambda: fetch_user(user_id))
+    cache.invalidate("users", user_id)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import (
+    zerodb_document_cache_invalidations_total,
+    zerodb_document_cache_requests_total,
+)
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "zerodb:doc:"  # collection:document_id -> JSON document
+TOMBSTONE = ""  # Value left by invalidate(); never served
+TOMBSTONE_TTL = 15  # Seconds; longer than a ZeroDB request with retries
+DEFAULT_MAX_ENTRIES = 5000
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after an error
+
+# Collections cached by default, with their TTL in seconds
+DEFAULT_COLLECTION_TTLS: Dict[str, int] = {
+    "users": 60,
+    "profiles": 60,
+    "events": 30,
+    "subscriptions": 30,
+    "training_sessions": 30,
+}
+
+# Lookup results (metric label values)
+RESULT_REQUEST_HIT = "request_hit"
+RESULT_HIT = "hit"
+RESULT_MISS = "miss"
+
+DocumentKey = Tuple[str, str]  # (collection, document_id)
+Fetcher = Callable[[], Dict[str, Any]]
+
+_request_documents: ContextVar[Optional[Dict[DocumentKey, Dict[str, Any]]]] = ContextVar(
+    "zerodb_request_documents",
+    default=None
+)
+
+
+@contextmanager
+def document_cache_scope() -> Iterator[None]:
+    """
+    Open a request-scoped identity map for cached documents
+
+    Lookups inside the scope (including threads and tasks started from it)
+    share one map; nested scopes reuse the outer one.
+    """
+    if _request_documents.get() is not None:
+        yield
+        return
+
+    token = _request_documents.set({})
+    try:
+        yield
+    finally:
+        _request_documents.reset(token)
+
+
+class DocumentCache:
+    """
+    Per-collection read-through cache of ZeroDB documents
+
+    Thread-safe. Cached documents are stored as JSON, so callers get their
+    own copy except within one request scope, where they share the
+    identity-mapped object.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            redis_client: Redis client shared by all workers (optional)
+            ttls: Seconds to cache documents of each collection; collections
+                left out are not cached (defaults to DEFAULT_COLLECTION_TTLS)
+            max_entries: Size of the in-process LRU
+        """
+        ttls = DEFAULT_COLLECTION_TTLS if ttls is None else ttls
+        if any(ttl <= 0 for ttl in ttls.values()):
+            raise ValueError("Collection TTLs must be positive")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.redis_client = redis_client
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+
+        self._local: "OrderedDict[DocumentKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_retry_at = 0.0
+        self.stats = {RESULT_REQUEST_HIT: 0, RESULT_HIT: 0, RESULT_MISS: 0, "invalidations": 0, "errors": 0}
+
+    def enabled(self, collection: str) -> bool:
+        """
+        Check whether documents of a collection are cached
+
+        Args:
+            collection: Name of the collection
+
+        Returns:
+            True if the collection has a TTL
+        """
+        return collection in self.ttls
+
+    def get_or_fetch(self, collection: str, document_id: str, fetch: Fetcher) -> Dict[str, Any]:
+        """
+        Return a cached document, fetching and caching it on a miss
+
+        Args:
+            collection: Name of the collection
+            document_id: ID of the document
+            fetch: Fetches the document from ZeroDB
+
+        Returns:
+            Document data
+
+        Raises:
+            Exception: Whatever ``fetch`` raises on a miss (errors such as
+                not found are not cached)
+        """
+        if not self.enabled(collection):
+            return fetch()
+
+        key = (collection, str(document_id))
+        request_documents = _request_documents.get()
+        if request_documents is not None and key in request_documents:
+            self._record(collection, RESULT_REQUEST_HIT)
+            return request_documents[key]
+
+        document = self._lookup(key)
+        if document is not None:
+            self._record(collection, RESULT_HIT)
+        else:
+            self._record(collection, RESULT_MISS)
+            document = fetch()
+            self._store(key, document)
+
+        if request_documents is not None:
+            request_documents[key] = document
+        return document
+
+    def invalidate(self, collection: str, document_id: str) -> None:
+        """
+        Drop a document from every tier after it was written
+
+        Args:
+            collection: Name of the collection
+            document_id: ID of the document
+        """
+        if not self.enabled(collection):
+            return
+
+        key = (collection, str(document_id))
+        request_documents = _request_documents.get()
+        if request_documents is not None:
+            request_documents.pop(key, None)
+
+        with self._lock:
+            self._local[key] = (time.monotonic() + TOMBSTONE_TTL, TOMBSTONE)
+            self._local.move_to_end(key)
+            self._trim()
+            self.stats["invalidations"] += 1
+        zerodb_document_cache_invalidations_total.labels(collection=collection).inc()
+
+        client = self._redis()
+        if client is not None:
+            try:
+                client.set(self._redis_key(key), TOMBSTONE, ex=TOMBSTONE_TTL)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier"""
+        with self._lock:
+            self._local.clear()
+
+    def _lookup(self, key: DocumentKey) -> Optional[Dict[str, Any]]:
+        client = self._redis()
+        if client is not None:
+            try:
+                value = client.get(self._redis_key(key))
+            except redis.RedisError as e:
+                self._redis_failed(e)
+            else:
+                return self._decode(value)
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._local.move_to_end(key)
+        return self._decode(entry[1])
+
+    def _store(self, key: DocumentKey, document: Dict[str, Any]) -> None:
+        try:
+            value = json.dumps(document)
+        except (TypeError, ValueError):
+            return
+        ttl = self.ttls[key[0]]
+
+        client = self._redis()
+        if client is not None:
+            try:
+                # NX: never overwrite the tombstone of a write made meanwhile
+                client.set(self._redis_key(key), value, ex=ttl, nx=True)
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None and entry[0] > now:
+                return
+            self._local[key] = (now + ttl, value)
+            self._local.move_to_end(key)
+            self._trim()
+
+    def _trim(self) -> None:
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _decode(value: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _redis_key(key: DocumentKey) -> str:
+        return f"{KEY_PREFIX}{key[0]}:{key[1]}"
+
+    def _record(self, collection: str, result: str) -> None:
+        zerodb_document_cache_requests_total.labels(collection=collection, result=result).inc()
+        with self._lock:
+            self.stats[result] += 1
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if self.redis_client is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self.redis_client
+
+    def _redis_failed(self, error: Exception) -> None:
+        with self._lock:
+            self.stats["errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Document cache bypassing Redis for {REDIS_RETRY_INTERVAL}s: {error}")
+
+
+def _configured_ttls() -> Dict[str, int]:
+    """
+    Collection TTLs from ZERODB_DOCUMENT_CACHE_TTLS (a JSON object such as
+    ``{"users": 60}``; ``{}`` disables the cache), else the defaults
+    """
+    raw = os.getenv("ZERODB_DOCUMENT_CACHE_TTLS")
+    if not raw:
+        return DEFAULT_COLLECTION_TTLS
+    try:
+        return {collection: int(ttl) for collection, ttl in json.loads(raw).items()}
+    except (ValueError, TypeError, AttributeError):
+        logger.warning("Ignoring invalid ZERODB_DOCUMENT_CACHE_TTLS; using the defaults")
+        return DEFAULT_COLLECTION_TTLS
+
+
+# Global cache instance
+_document_cache_instance: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """
+    Get or create the global DocumentCache instance
+
+    Returns:
+        DocumentCache instance backed by settings.REDIS_URL
+    """
+    global _document_cache_instance
+
+    if _document_cache_instance is None:
+        _document_cache_instance = DocumentCache(
+            redis_client=redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            ),
+            ttls=_configured_ttls()
+        )
+
+    return _document_cache_instance
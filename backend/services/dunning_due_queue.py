@@ -0,0 +1,308 @@
+"""
+Dunning Due Queue - time-ordered queue of pending dunning reminders
+
+Replaces scanning every dunning record on each scheduler run:
+- Each dunning record with a reminder ahead of it has one entry in a Redis
+  sorted set scored by its ``next_reminder_date``; the stage due next is
+  kept alongside in a hash. DunningService maintains the entry whenever it
+  creates a record or moves it to a new stage
+- The scheduler pops only due entries, oldest first, in batches. Popping
+  moves them to an in-flight set with a lease, atomically, so concurrent
+  schedulers never get the same reminder; entries whose lease lapses (a
+  crashed scheduler) are handed out again
+- Each (record, stage) reminder is claimed with an idempotency key before
+  it is sent, so a reminder redelivered after a crash, or retried by an
+  admin at the same time, is sent once. A claim lapses before the lease
+  does, so a reminder handed out again after a crash can be claimed
+
+A run costs O(due) Redis and ZeroDB work instead of O(records in dunning).
+ZeroDB keeps ``next_reminder_date`` on every record, so the queue can be
+rebuilt with ``DunningService.reseed_due_queue`` if Redis loses it.
+
+Usage:
+    queue = get_dunning_due_queue()
+    for record_id, stage in queue.pop_due(batch_size=50):
+        state = queue.claim(record_id, stage)
+        if state is None:
+            ...  # send the reminder
+            queue.complete(record_id, stage)
+        elif state == SENDING:
+            queue.retry(record_id, stage, delay=CLAIM_TTL, keep_claim=True)
+        else:
+            queue.release(record_id)
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+import redis
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+DUE_KEY = "dunning:due"  # Sorted set of record_id scored by next reminder (unix time)
+STAGE_KEY = "dunning:due:stage"  # record_id -> stage due next
+INFLIGHT_KEY = "dunning:inflight"  # Sorted set of record_id scored by lease expiry
+IDEMPOTENCY_KEY_PREFIX = "dunning:sent:"  # record_id:stage -> claim marker
+
+LEASE_SECONDS = 15 * 60  # In-flight entries are handed out again after this long
+CLAIM_TTL = 10 * 60  # Seconds a claim blocks other senders while in progress (< LEASE_SECONDS)
+SENT_TTL = 30 * 86400  # Seconds a sent reminder stays marked (longer than dunning lasts)
+RETRY_DELAY = 60 * 60  # Seconds before a failed reminder is retried
+
+# Idempotency marker states
+SENDING = "sending"
+SENT = "sent"
+
+# Requeue entries whose lease lapsed, then move up to ARGV[2] due entries
+# in flight; returns record_id, stage pairs in due order
+POP_DUE_SCRIPT = """
+local lapsed = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, record_id in ipairs(lapsed) do
+    redis.call('ZREM', KEYS[2], record_id)
+    redis.call('ZADD', KEYS[1], 'NX', ARGV[1], record_id)
+end
+
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local popped = {}
+for _, record_id in ipairs(due) do
+    redis.call('ZREM', KEYS[1], record_id)
+    redis.call('ZADD', KEYS[2], ARGV[1] + ARGV[3], record_id)
+    table.insert(popped, record_id)
+    table.insert(popped, redis.call('HGET', KEYS[3], record_id) or '')
+end
+return popped
+"""
+
+
+class DunningDueQueueError(Exception):
+    """Raised when the due queue cannot reach Redis"""
+    pass
+
+
+def _timestamp(value: datetime) -> float:
+    """Unix time of a naive UTC (or aware) datetime"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class DunningDueQueue:
+    """
+    Redis sorted set of dunning reminders by due time
+
+    Thread-safe; all state lives in Redis.
+    """
+
+    def __init__(self, redis_client: redis.Redis, lease_seconds: int = LEASE_SECONDS):
+        """
+        Initialize the queue
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            lease_seconds: Seconds a popped entry stays in flight before it
+                is handed out again
+        """
+        self.redis_client = redis_client
+        self.lease_seconds = lease_seconds
+        self._pop_due = redis_client.register_script(POP_DUE_SCRIPT)
+
+    def schedule(
+        self,
+        record_id: str,
+        stage: str,
+        due_at: datetime,
+        replace: bool = True
+    ) -> None:
+        """
+        Schedule a record's next reminder, replacing any earlier schedule
+
+        Args:
+            record_id: Dunning record ID
+            stage: Dunning stage due next
+            due_at: When the reminder is due (naive UTC)
+            replace: Replace an existing entry (False keeps it, for reseeding)
+
+        Raises:
+            DunningDueQueueError: If Redis is unavailable
+        """
+        try:
+            if not replace and self.redis_client.zscore(DUE_KEY, record_id) is not None:
+                return
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.zadd(DUE_KEY, {record_id: _timestamp(due_at)})
+            pipe.hset(STAGE_KEY, record_id, stage)
+            pipe.execute()
+        except redis.RedisError as e:
+            raise DunningDueQueueError(f"Failed to schedule dunning record {record_id}: {e}")
+
+    def remove(self, record_id: str) -> None:
+        """
+        Drop a record from the queue (no reminders left)
+
+        Args:
+            record_id: Dunning record ID
+
+        Raises:
+            DunningDueQueueError: If Redis is unavailable
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.zrem(DUE_KEY, record_id)
+            pipe.hdel(STAGE_KEY, record_id)
+            pipe.execute()
+        except redis.RedisError as e:
+            raise DunningDueQueueError(f"Failed to unschedule dunning record {record_id}: {e}")
+
+    def pop_due(self, batch_size: int, now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """
+        Take up to ``batch_size`` due reminders, oldest first
+
+        Popped reminders are in flight until ``complete`` or ``retry``;
+        if neither is called within the lease they are handed out again.
+
+        Args:
+            batch_size: Maximum reminders to take
+            now: Unix time to compare due times against (defaults to now)
+
+        Returns:
+            List of (record_id, stage) tuples; stage is '' if unknown
+
+        Raises:
+            DunningDueQueueError: If Redis is unavailable
+        """
+        now = time.time() if now is None else now
+        try:
+            popped = self._pop_due(
+                keys=[DUE_KEY, INFLIGHT_KEY, STAGE_KEY],
+                args=[now, batch_size, self.lease_seconds]
+            )
+        except redis.RedisError as e:
+            raise DunningDueQueueError(f"Failed to pop due dunning reminders: {e}")
+        return list(zip(popped[::2], popped[1::2]))
+
+    def claim(self, record_id: str, stage: str) -> Optional[str]:
+        """
+        Claim the idempotency key of a reminder before sending it
+
+        Args:
+            record_id: Dunning record ID
+            stage: Dunning stage
+
+        Returns:
+            None if the caller now holds the claim, otherwise the state of
+            the existing marker: SENDING (another sender holds the claim)
+            or SENT
+
+        Raises:
+            DunningDueQueueError: If Redis is unavailable
+        """
+        key = self._idempotency_key(record_id, stage)
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.set(key, SENDING, nx=True, ex=CLAIM_TTL)
+            pipe.get(key)
+            claimed, state = pipe.execute()
+        except redis.RedisError as e:
+            raise DunningDueQueueError(f"Failed to claim dunning reminder {record_id}: {e}")
+        return None if claimed else state
+
+    def complete(self, record_id: str, stage: str) -> None:
+        """
+        Mark a reminder sent and take it out of flight
+
+        Args:
+            record_id: Dunning record ID
+            stage: Dunning stage sent
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.set(self._idempotency_key(record_id, stage), SENT, ex=SENT_TTL)
+            pipe.zrem(INFLIGHT_KEY, record_id)
+            pipe.execute()
+        except redis.RedisError as e:
+            # The idempotency claim still blocks a resend until it lapses
+            logger.warning(f"Failed to complete dunning reminder {record_id}: {e}")
+
+    def release(self, record_id: str) -> None:
+        """
+        Take a reminder out of flight without marking it sent (e.g. skipped)
+
+        Args:
+            record_id: Dunning record ID
+        """
+        try:
+            self.redis_client.zrem(INFLIGHT_KEY, record_id)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to release dunning reminder {record_id}: {e}")
+
+    def retry(
+        self,
+        record_id: str,
+        stage: str,
+        delay: int = RETRY_DELAY,
+        keep_claim: bool = False
+    ) -> None:
+        """
+        Put a failed reminder back in the queue after ``delay`` seconds
+
+        A schedule set while processing (the record moved on) is kept.
+
+        Args:
+            record_id: Dunning record ID
+            stage: Dunning stage that failed
+            delay: Seconds until the retry is due
+            keep_claim: Leave the idempotency key alone (it is held by
+                another sender)
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            if not keep_claim:
+                pipe.delete(self._idempotency_key(record_id, stage))
+            pipe.zadd(DUE_KEY, {record_id: time.time() + delay}, nx=True)
+            pipe.hsetnx(STAGE_KEY, record_id, stage)
+            pipe.zrem(INFLIGHT_KEY, record_id)
+            pipe.execute()
+        except redis.RedisError as e:
+            # The in-flight lease hands the reminder out again when it lapses
+            logger.warning(f"Failed to requeue dunning reminder {record_id}: {e}")
+
+    def size(self) -> int:
+        """
+        Number of scheduled reminders (due or not)
+
+        Raises:
+            DunningDueQueueError: If Redis is unavailable
+        """
+        try:
+            return int(self.redis_client.zcard(DUE_KEY))
+        except redis.RedisError as e:
+            raise DunningDueQueueError(f"Failed to read dunning queue size: {e}")
+
+    @staticmethod
+    def _idempotency_key(record_id: str, stage: str) -> str:
+        return f"{IDEMPOTENCY_KEY_PREFIX}{record_id}:{stage}"
+
+
+# Global queue instance
+_dunning_due_queue_instance: Optional[DunningDueQueue] = None
+
+
+def get_dunning_due_queue() -> DunningDueQueue:
+    """
+    Get or create the global DunningDueQueue instance
+
+    Returns:
+        DunningDueQueue backed by settings.REDIS_URL
+    """
+    global _dunning_due_queue_instance
+
+    if _dunning_due_queue_instance is None:
+        _dunning_due_queue_instance = DunningDueQueue(
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+        )
+
+    return _dunning_due_queue_instance
@@ -12,6 +12,8 @@ Architecture:
 - Integrates with Stripe Smart Retries as primary mechanism
 - Custom dunning for member communication and status management
 - Uses APScheduler for automated retry scheduling
+- Keeps each record's next reminder in a Redis due queue, so the
+  scheduler only touches records that are due
 - Logs all events to ZeroDB audit_logs
 """
 
@@ -24,6 +26,11 @@ from enum import Enum
 from backend.config import settings
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBError
 from backend.services.email_service import EmailService, EmailServiceError
+from backend.services.dunning_due_queue import (
+    DunningDueQueue,
+    DunningDueQueueError,
+    get_dunning_due_queue
+)
 from backend.models.schemas import (
     SubscriptionStatus,
     UserRole,
@@ -73,7 +80,8 @@ class DunningService:
         self,
         zerodb_client: Optional[ZeroDBClient] = None,
         email_service: Optional[EmailService] = None,
-        grace_period_days: int = 14
+        grace_period_days: int = 14,
+        due_queue: Optional[DunningDueQueue] = None
     ):
         """
         Initialize Dunning Service
@@ -82,10 +90,12 @@ class DunningService:
             zerodb_client: ZeroDB client instance
             email_service: Email service instance
             grace_period_days: Grace period before cancellation (default: 14)
+            due_queue: Queue of upcoming reminders (default: Redis-backed)
         """
         self.db = zerodb_client or ZeroDBClient()
         self.email = email_service or EmailService()
         self.grace_period_days = grace_period_days
+        self.due_queue = due_queue or get_dunning_due_queue()
 
         logger.info(
             f"DunningService initialized with grace period: {grace_period_days} days"
@@ -303,7 +313,8 @@ class DunningService:
                 metadata={
                     'last_reminder_sent': datetime.utcnow().isoformat(),
                     'reminder_count': dunning_record.get('reminder_count', 0) + 1
-                }
+                },
+                base_date=dunning_record.get('created_at')
             )
 
             # Log audit event
@@ -394,7 +405,8 @@ class DunningService:
                 metadata={
                     'canceled_at': datetime.utcnow().isoformat(),
                     'final_status': 'canceled'
-                }
+                },
+                base_date=dunning_record.get('created_at')
             )
 
             # Log audit events
@@ -506,6 +518,68 @@ class DunningService:
             logger.error(f"Error fetching accounts in dunning: {e}")
             raise DunningServiceError(f"Error fetching accounts: {e}")
 
+    async def reseed_due_queue(self, page_size: int = 500) -> int:
+        """
+        Rebuild the due queue from dunning records in ZeroDB
+
+        Adds every active record's next reminder that is missing from the
+        queue; scheduled entries are kept. Run at scheduler startup, so a
+        Redis restart or a failed queue update never strands a record.
+
+        Args:
+            page_size: Records read per ZeroDB query
+
+        Returns:
+            Number of active records seen
+
+        Raises:
+            DunningServiceError: If the records cannot be read
+        """
+        active_stages = [
+            stage.value for stage in self.DUNNING_SCHEDULE
+            if self._get_next_stage(stage) is not None
+        ]
+        seen = 0
+        offset = 0
+
+        try:
+            while True:
+                records = self.db.query(
+                    collection='dunning_records',
+                    query={'current_stage': {'$in': active_stages}},
+                    limit=page_size,
+                    offset=offset
+                )
+
+                for record in records:
+                    stage = DunningStage(record.get('current_stage'))
+                    next_reminder_date = record.get('next_reminder_date')
+                    due_at = (
+                        datetime.fromisoformat(next_reminder_date) if next_reminder_date
+                        else self._calculate_next_reminder_date(stage, base_date=record.get('created_at'))
+                    )
+                    self.due_queue.schedule(
+                        str(record.get('id')),
+                        self._get_next_stage(stage).value,
+                        due_at,
+                        replace=False
+                    )
+                    seen += 1
+
+                if len(records) < page_size:
+                    break
+                offset += len(records)
+
+        except DunningDueQueueError as e:
+            logger.error(f"Dunning due queue unavailable while reseeding: {e}")
+            raise DunningServiceError(f"Due queue unavailable: {e}")
+        except Exception as e:
+            logger.error(f"Error reseeding dunning due queue: {e}")
+            raise DunningServiceError(f"Error reseeding due queue: {e}")
+
+        logger.info(f"Reseeded dunning due queue from {seen} active records")
+        return seen
+
     # ========================================================================
     # Private Helper Methods
     # ========================================================================
@@ -601,8 +675,14 @@ class DunningService:
         stripe_invoice_id: str,
         metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Create dunning record in ZeroDB"""
+        """Create dunning record in ZeroDB and schedule its next reminder"""
         try:
+            now = datetime.utcnow().isoformat()
+            next_stage = self._get_next_stage(stage)
+            next_reminder_date = (
+                self._calculate_next_reminder_date(stage, base_date=now) if next_stage else None
+            )
+
             record_data = {
                 'subscription_id': str(subscription_id),
                 'user_id': str(user_id),
@@ -610,8 +690,9 @@ class DunningService:
                 'amount_due': amount_due,
                 'currency': currency,
                 'stripe_invoice_id': stripe_invoice_id,
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat(),
+                'created_at': now,
+                'updated_at': now,
+                'next_reminder_date': next_reminder_date.isoformat() if next_reminder_date else None,
                 'reminder_count': 0,
                 'metadata': metadata or {}
             }
@@ -621,6 +702,8 @@ class DunningService:
                 data=record_data
             )
 
+            self._schedule_next_reminder(str(result.get('id')), next_stage, next_reminder_date)
+
             logger.info(f"Created dunning record: {result.get('id')}")
             return result
         except Exception as e:
@@ -645,18 +728,35 @@ class DunningService:
         self,
         dunning_record_id: str,
         stage: DunningStage,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        base_date: Optional[str] = None
     ) -> None:
-        """Update dunning record"""
+        """Update dunning record and reschedule its next reminder
+
+        base_date is the record's created_at, which the reminder schedule
+        counts from; the record is read if it is not given.
+        """
         try:
+            record = None
+            if base_date is None:
+                record = await self._get_dunning_record(dunning_record_id)
+                base_date = (record or {}).get('created_at')
+
+            next_stage = self._get_next_stage(stage)
+            next_reminder_date = (
+                self._calculate_next_reminder_date(stage, base_date=base_date) if next_stage else None
+            )
+
             update_data = {
                 'current_stage': stage.value,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': datetime.utcnow().isoformat(),
+                'next_reminder_date': next_reminder_date.isoformat() if next_reminder_date else None
             }
 
             if metadata:
                 # Merge with existing metadata
-                record = await self._get_dunning_record(dunning_record_id)
+                if record is None:
+                    record = await self._get_dunning_record(dunning_record_id)
                 existing_metadata = record.get('metadata', {})
                 existing_metadata.update(metadata)
                 update_data['metadata'] = existing_metadata
@@ -670,6 +770,8 @@ class DunningService:
                 data=update_data
             )
 
+            self._schedule_next_reminder(str(dunning_record_id), next_stage, next_reminder_date)
+
             logger.info(
                 f"Updated dunning record {dunning_record_id} to stage {stage.value}"
             )
@@ -677,6 +779,22 @@ class DunningService:
             logger.error(f"Error updating dunning record: {e}")
             raise
 
+    def _schedule_next_reminder(
+        self,
+        dunning_record_id: str,
+        next_stage: Optional[DunningStage],
+        next_reminder_date: Optional[datetime]
+    ) -> None:
+        """Put a record's next reminder in the due queue (or take it out)"""
+        try:
+            if next_stage and next_reminder_date:
+                self.due_queue.schedule(dunning_record_id, next_stage.value, next_reminder_date)
+            else:
+                self.due_queue.remove(dunning_record_id)
+        except DunningDueQueueError as e:
+            # The record keeps next_reminder_date; reseed_due_queue restores it
+            logger.warning(f"Dunning due queue not updated for record {dunning_record_id}: {e}")
+
     async def _send_dunning_email(
         self,
         user: Dict[str, Any],
@@ -0,0 +1,411 @@
+"""
+Email Queue Service - Durable outbound email queue with Postmark batching
+
+Moves email delivery off the request path:
+- Producers (bulk event emails, board notifications, any queued
+  EmailService) store each Postmark message under ``email:msg:{id}`` with
+  its delivery status and append its ID to a durable Redis stream; bulk
+  producers do this for thousands of messages in a few pipelined round
+  trips
+- Workers read the stream through a consumer group and deliver up to 500
+  messages per request to Postmark's batch endpoint over a pooled HTTP
+  connection, recording the per-message result
+- Failed messages are retried with exponential backoff through a sorted
+  set of due times, up to ``MAX_ATTEMPTS``; errors Postmark reports as
+  permanent (invalid or inactive recipient) fail immediately
+- Entries of a crashed worker are reclaimed after ``CLAIM_IDLE_MS``; a
+  message already marked sent is never resent, so delivery is at-least-once
+  only for a crash between the Postmark call and the status update
+
+Messages enqueued together share a batch ID whose sent/failed counters can
+be polled with ``get_batch_status``.
+"""
+
+import json
+import logging
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import track_background_job
+from backend.services.email_service import (
+    EmailService,
+    EmailSendError,
+    POSTMARK_BATCH_LIMIT,
+    get_email_service,
+)
+
+logger = logging.getLogger(__name__)
+
+# Durable send stream
+STREAM_KEY = "email:outbound"
+CONSUMER_GROUP = "email-senders"
+
+MESSAGE_KEY_PREFIX = "email:msg:"  # message_id -> {payload, status, attempts, ...}
+BATCH_KEY_PREFIX = "email:batch:"  # batch_id -> {total, queued, sent, failed}
+RETRY_KEY = "email:retry"  # sorted set of message_id scored by due time
+
+STATUS_TTL = 7 * 86400  # Seconds message and batch status are kept
+
+# Delivery statuses
+STATUS_QUEUED = "queued"
+STATUS_RETRYING = "retrying"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+# Worker
+READ_BLOCK_MS = 1000
+CLAIM_IDLE_MS = 5 * 60 * 1000  # Reclaim entries unacknowledged for this long
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 30  # Seconds; doubles with every attempt
+
+# Postmark error codes that will not succeed on retry
+# (300: invalid email request, 406: inactive recipient)
+PERMANENT_ERROR_CODES = {300, 406}
+
+# Move due retries back onto the stream atomically so concurrent workers
+# never requeue the same message twice
+PROMOTE_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, message_id in ipairs(due) do
+    redis.call('ZREM', KEYS[1], message_id)
+    redis.call('XADD', KEYS[2], '*', 'id', message_id)
+end
+return #due
+"""
+
+
+class EmailQueueError(Exception):
+    """Raised when messages cannot be enqueued"""
+    pass
+
+
+class EmailQueueService:
+    """
+    Queues outbound email in Redis and delivers it in Postmark batches
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        email_service: Optional[EmailService] = None
+    ):
+        """
+        Initialize the email queue service.
+
+        Args:
+            redis_client: Redis client (created from settings.REDIS_URL if omitted)
+            email_service: Non-queued EmailService used by workers to send batches
+        """
+        self.redis_client = redis_client or redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self._email_service = email_service
+        self._group_ready = False
+        self._promote_due = self.redis_client.register_script(PROMOTE_DUE_SCRIPT)
+
+    @property
+    def email_service(self) -> EmailService:
+        if self._email_service is None:
+            self._email_service = get_email_service()
+        return self._email_service
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, message: Dict[str, Any], batch_id: Optional[str] = None) -> str:
+        """
+        Queue a single Postmark message.
+
+        Args:
+            message: Postmark message dict (see EmailService.build_message)
+            batch_id: Optional batch the message belongs to
+
+        Returns:
+            Message ID for status lookups
+
+        Raises:
+            EmailQueueError: If the message cannot be queued
+        """
+        _, message_ids = self.enqueue_many([message], batch_id=batch_id)
+        return message_ids[0]
+
+    def enqueue_many(
+        self,
+        messages: List[Dict[str, Any]],
+        batch_id: Optional[str] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Queue many Postmark messages under one batch ID.
+
+        Messages are written in pipelined chunks of the Postmark batch size,
+        so queueing thousands of messages takes a handful of round trips.
+
+        Args:
+            messages: Postmark message dicts
+            batch_id: Batch ID (generated if omitted)
+
+        Returns:
+            Tuple of (batch_id, message IDs in input order)
+
+        Raises:
+            EmailQueueError: If the messages cannot be queued
+        """
+        batch_id = batch_id or uuid4().hex
+        queued_at = datetime.utcnow().isoformat()
+        batch_key = f"{BATCH_KEY_PREFIX}{batch_id}"
+        message_ids: List[str] = []
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hincrby(batch_key, "total", len(messages))
+            pipe.hincrby(batch_key, "queued", len(messages))
+            pipe.hsetnx(batch_key, "created_at", queued_at)
+            pipe.expire(batch_key, STATUS_TTL)
+            pipe.execute()
+
+            for start in range(0, len(messages), POSTMARK_BATCH_LIMIT):
+                pipe = self.redis_client.pipeline(transaction=False)
+                for message in messages[start:start + POSTMARK_BATCH_LIMIT]:
+                    message_id = uuid4().hex
+                    message_key = f"{MESSAGE_KEY_PREFIX}{message_id}"
+                    pipe.hset(message_key, mapping={
+                        "payload": json.dumps(message, default=str),
+                        "status": STATUS_QUEUED,
+                        "attempts": 0,
+                        "batch_id": batch_id,
+                        "queued_at": queued_at,
+                    })
+                    pipe.expire(message_key, STATUS_TTL)
+                    pipe.xadd(STREAM_KEY, {"id": message_id})
+                    message_ids.append(message_id)
+                pipe.execute()
+        except redis.RedisError as e:
+            raise EmailQueueError(f"Failed to queue {len(messages)} emails: {e}")
+
+        logger.info(f"Queued {len(messages)} emails in batch {batch_id}")
+        return batch_id, message_ids
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get_status(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the delivery status of a queued message.
+
+        Args:
+            message_id: Message ID returned by enqueue
+
+        Returns:
+            Status dict (status, attempts, error, postmark_message_id,
+            batch_id, ...) or None if unknown or expired
+        """
+        record = self.redis_client.hgetall(f"{MESSAGE_KEY_PREFIX}{message_id}")
+        if not record:
+            return None
+
+        record.pop("payload", None)
+        record["attempts"] = int(record.get("attempts", 0))
+        return record
+
+    def get_batch_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get delivery counters of a batch.
+
+        Args:
+            batch_id: Batch ID returned by enqueue_many
+
+        Returns:
+            Dict with total, queued, sent and failed counts, or None if unknown
+        """
+        record = self.redis_client.hgetall(f"{BATCH_KEY_PREFIX}{batch_id}")
+        if not record:
+            return None
+
+        status = {
+            key: int(record.get(key, 0))
+            for key in ("total", "queued", "sent", "failed")
+        }
+        status["batch_id"] = batch_id
+        status["created_at"] = record.get("created_at")
+        return status
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.redis_client.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def process_batch(self, consumer: str, block_ms: Optional[int] = None) -> int:
+        """
+        Deliver one batch of queued messages.
+
+        Requeues due retries, reclaims entries abandoned by crashed workers,
+        then reads new entries (blocking up to ``block_ms`` when there are
+        none) and sends them in a single Postmark batch request.
+
+        Args:
+            consumer: Consumer name, unique per worker
+            block_ms: Milliseconds to wait for new entries (None = don't block)
+
+        Returns:
+            Number of messages delivered
+        """
+        self._ensure_group()
+        self._promote_due(keys=[RETRY_KEY, STREAM_KEY], args=[time.time(), POSTMARK_BATCH_LIMIT])
+
+        _, entries, *_ = self.redis_client.xautoclaim(
+            STREAM_KEY, CONSUMER_GROUP, consumer,
+            min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=POSTMARK_BATCH_LIMIT
+        )
+        if not entries:
+            response = self.redis_client.xreadgroup(
+                CONSUMER_GROUP, consumer, {STREAM_KEY: ">"},
+                count=POSTMARK_BATCH_LIMIT, block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+        if not entries:
+            return 0
+
+        with track_background_job("email_queue_batch"):
+            sent = self._deliver([fields["id"] for _, fields in entries])
+
+        entry_ids = [entry_id for entry_id, _ in entries]
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.xack(STREAM_KEY, CONSUMER_GROUP, *entry_ids)
+        pipe.xdel(STREAM_KEY, *entry_ids)
+        pipe.execute()
+
+        logger.info(f"Delivered {sent}/{len(entries)} queued emails")
+        return sent
+
+    def _deliver(self, message_ids: List[str]) -> int:
+        """Send queued messages in one Postmark batch and record the results."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipe.hgetall(f"{MESSAGE_KEY_PREFIX}{message_id}")
+        records = pipe.execute()
+
+        batch: List[Tuple[str, Dict[str, str]]] = []
+        for message_id, record in zip(message_ids, records):
+            # Expired, or already delivered before a redelivery
+            if not record or record.get("status") in (STATUS_SENT, STATUS_FAILED):
+                continue
+            batch.append((message_id, record))
+
+        if not batch:
+            return 0
+
+        try:
+            results = self.email_service.send_batch([json.loads(record["payload"]) for _, record in batch])
+        except EmailSendError as e:
+            logger.error(f"Postmark batch of {len(batch)} emails failed: {e}")
+            results = [{"ErrorCode": None, "Message": str(e)}] * len(batch)
+
+        if len(results) < len(batch):
+            # Messages without a result were not confirmed; retry them
+            logger.error(f"Postmark returned {len(results)} results for a batch of {len(batch)} emails")
+            results = list(results) + [
+                {"ErrorCode": None, "Message": "No result returned by Postmark"}
+            ] * (len(batch) - len(results))
+
+        sent = 0
+        sent_at = datetime.utcnow().isoformat()
+        pipe = self.redis_client.pipeline(transaction=False)
+        for (message_id, record), result in zip(batch, results):
+            message_key = f"{MESSAGE_KEY_PREFIX}{message_id}"
+            batch_key = f"{BATCH_KEY_PREFIX}{record['batch_id']}"
+            attempts = int(record.get("attempts", 0)) + 1
+            error_code = result.get("ErrorCode")
+
+            if error_code == 0:
+                pipe.hset(message_key, mapping={
+                    "status": STATUS_SENT,
+                    "attempts": attempts,
+                    "postmark_message_id": result.get("MessageID", ""),
+                    "sent_at": sent_at,
+                })
+                pipe.hincrby(batch_key, "queued", -1)
+                pipe.hincrby(batch_key, "sent", 1)
+                sent += 1
+                continue
+
+            error = result.get("Message") or "Unknown error"
+            if error_code in PERMANENT_ERROR_CODES or attempts >= MAX_ATTEMPTS:
+                pipe.hset(message_key, mapping={
+                    "status": STATUS_FAILED,
+                    "attempts": attempts,
+                    "error": error,
+                })
+                pipe.hincrby(batch_key, "queued", -1)
+                pipe.hincrby(batch_key, "failed", 1)
+                logger.warning(f"Email {message_id} failed after {attempts} attempt(s): {error}")
+            else:
+                pipe.hset(message_key, mapping={
+                    "status": STATUS_RETRYING,
+                    "attempts": attempts,
+                    "error": error,
+                })
+                pipe.zadd(RETRY_KEY, {message_id: time.time() + RETRY_BASE_DELAY * 2 ** (attempts - 1)})
+        pipe.execute()
+
+        return sent
+
+    def run(self, stop_event: threading.Event, consumer: Optional[str] = None) -> None:
+        """
+        Deliver queued email continuously until ``stop_event`` is set.
+
+        Args:
+            stop_event: Event that stops the loop after the current batch
+            consumer: Consumer name (defaults to hostname plus a random suffix)
+        """
+        consumer = consumer or f"{socket.gethostname()}-{uuid4().hex[:8]}"
+        logger.info(f"Email queue worker {consumer} started")
+
+        while not stop_event.is_set():
+            try:
+                self.process_batch(consumer, block_ms=READ_BLOCK_MS)
+            except redis.RedisError as e:
+                logger.error(f"Email queue batch failed: {e}")
+                self._group_ready = False
+                stop_event.wait(1.0)
+            except Exception as e:
+                logger.error(f"Unexpected error delivering queued email: {e}")
+                stop_event.wait(1.0)
+
+        logger.info(f"Email queue worker {consumer} stopped")
+
+
+# Global email queue service instance
+_email_queue_service: Optional[EmailQueueService] = None
+
+
+def get_email_queue_service() -> EmailQueueService:
+    """
+    Get or create the global email queue service instance.
+
+    Returns:
+        EmailQueueService instance
+    """
+    global _email_queue_service
+
+    if _email_queue_service is None:
+        _email_queue_service = EmailQueueService()
+
+    return _email_queue_service
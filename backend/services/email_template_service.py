@@ -0,0 +1,515 @@
+"""
+Email Template Service - Precompiled, cached email template rendering
+
+Renders email bodies from the Mustache templates in
+``backend/templates/email`` and ``backend/templates/emails``:
+- Every template is read, its layout and partials resolved, and compiled
+  once when the service is created (at application startup); rendering is
+  a walk over prebuilt closures with no parsing or file access
+- The plain-text body is compiled from the same source: the resolved HTML
+  template is converted to text at compile time with its tags kept, so
+  both bodies always carry the same content
+- ``bind()`` pre-renders everything that depends only on shared values
+  (layout, event details, the message of a bulk send) into literal text,
+  leaving per-recipient values as the only holes to fill per message
+
+Supported Mustache syntax: ``{{name}}`` (HTML-escaped), ``{{{name}}}`` and
+``{{& name}}`` (raw HTML), dotted names, ``{{.}}``, sections
+``{{#name}}...{{/name}}`` (truthy values, dicts and lists), inverted
+sections ``{{^name}}...{{/name}}``, comments, partials ``{{> name}}`` and
+layout inheritance ``{{< layout}}{{$block}}...{{/block}}{{/layout}}``.
+"""
+
+import html
+import logging
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_DIRS = (
+    BACKEND_DIR / "templates" / "email",
+    BACKEND_DIR / "templates" / "emails",
+)
+
+# Tags: {{{raw}}} or {{<sigil> name}}
+TAG_RE = re.compile(
+    r"\{\{\{\s*(?P<raw>[\w./-]+)\s*\}\}\}"
+    r"|\{\{(?P<sigil>[#^/>!&$<]?)\s*(?P<name>[^}]*?)\s*\}\}"
+)
+PARENT_RE = re.compile(r"\{\{<\s*([\w./-]+)\s*\}\}(.*?)\{\{/\s*\1\s*\}\}", re.S)
+BLOCK_RE = re.compile(r"\{\{\$\s*(\w+)\s*\}\}(.*?)\{\{/\s*\1\s*\}\}", re.S)
+PARTIAL_RE = re.compile(r"\{\{>\s*([\w./-]+)\s*\}\}")
+
+# Tags removed together with their line when they stand alone on it
+STANDALONE_SIGILS = {"#", "^", "/", "!"}
+
+_BLANK_LINES_RE = re.compile(r"\n[ \t]*(?:\n[ \t]*){2,}")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+(?=\n)")
+_EMPTY_LINK_RE = re.compile(r" \(\)")
+_MISSING = object()
+
+# Parsed template nodes: literal text, a variable, or a section
+Var = Tuple[str, Tuple[str, ...], bool]  # ("var", path, escape)
+Section = Tuple[str, Tuple[str, ...], list, bool]  # ("section", path, children, inverted)
+Node = Union[str, Var, Section]
+
+
+class EmailTemplateError(Exception):
+    """Raised when an email template is missing or malformed"""
+    pass
+
+
+class RenderedEmail(NamedTuple):
+    """HTML and plain-text bodies of a rendered email"""
+    html: str
+    text: str
+
+
+# ----------------------------------------------------------------------
+# HTML to text
+# ----------------------------------------------------------------------
+
+class _TextConverter(HTMLParser):
+    """Collects readable text from HTML (links kept as ``label (url)``)"""
+
+    SKIP = {"head", "style", "script", "title"}
+    BLOCK = {"p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "table", "blockquote"}
+    LINE = {"tr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+        self._links: List[Tuple[str, int]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skip += 1
+        elif tag in self.BLOCK:
+            self.parts.append("\n\n")
+        elif tag == "li":
+            self.parts.append("\n- ")
+        elif tag == "tr":
+            self.parts.append("\n")
+        elif tag == "br":
+            self.parts.append("\n")
+        elif tag == "hr":
+            self.parts.append("\n---\n")
+        elif tag == "a":
+            self._links.append((dict(attrs).get("href") or "", len(self.parts)))
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP:
+            self._skip = max(0, self._skip - 1)
+        elif tag in self.BLOCK:
+            self.parts.append("\n\n")
+        elif tag in self.LINE:
+            self.parts.append("\n")
+        elif tag == "a" and self._links:
+            href, start = self._links.pop()
+            label = "".join(self.parts[start:]).strip()
+            target = href[len("mailto:"):] if href.startswith("mailto:") else href
+            if target and target not in label:
+                self.parts.append(f" ({target})")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(re.sub(r"\s+", " ", data))
+
+    def text(self) -> str:
+        lines = (line.strip() for line in "".join(self.parts).split("\n"))
+        text = "\n".join(lines)
+        return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def html_to_text(markup: str) -> str:
+    """
+    Convert HTML to readable plain text.
+
+    Args:
+        markup: HTML document or fragment
+
+    Returns:
+        Plain text with paragraphs, list items and link targets preserved
+    """
+    converter = _TextConverter()
+    converter.feed(markup)
+    converter.close()
+    return converter.text()
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+def _path(name: str) -> Tuple[str, ...]:
+    return (".",) if name == "." else tuple(name.split("."))
+
+
+def _parse(source: str, name: str) -> List[Node]:
+    """Parse resolved template source into a node tree."""
+    root: List[Node] = []
+    stack: List[Tuple[str, Tuple[str, ...], List[Node], bool]] = []
+    nodes = root
+    pos = 0
+
+    for match in TAG_RE.finditer(source):
+        start, end = match.span()
+        if start < pos:
+            continue
+        sigil = match.group("sigil") or ""
+        raw = match.group("raw")
+
+        # Standalone section/comment tags take their whole line with them
+        if raw is None and sigil in STANDALONE_SIGILS:
+            line_start = source.rfind("\n", 0, start) + 1
+            line_end = source.find("\n", end)
+            line_end = len(source) if line_end == -1 else line_end
+            if (
+                line_start >= pos
+                and not source[line_start:start].strip()
+                and not source[end:line_end].strip()
+            ):
+                start, end = line_start, min(line_end + 1, len(source))
+
+        if source[pos:start]:
+            nodes.append(source[pos:start])
+        pos = end
+
+        if raw is not None:
+            nodes.append(("var", _path(raw), False))
+        elif sigil == "!":
+            continue
+        elif sigil in ("", "&"):
+            nodes.append(("var", _path(match.group("name")), sigil == ""))
+        elif sigil in ("#", "^"):
+            stack.append((match.group("name"), _path(match.group("name")), nodes, sigil == "^"))
+            nodes = []
+        elif sigil == "/":
+            if not stack or stack[-1][0] != match.group("name"):
+                raise EmailTemplateError(f"Unexpected {{{{/{match.group('name')}}}}} in template {name}")
+            section_name, path, parent, inverted = stack.pop()
+            parent.append(("section", path, nodes, inverted))
+            nodes = parent
+        else:
+            raise EmailTemplateError(f"Unresolved tag {match.group(0)} in template {name}")
+
+    if stack:
+        raise EmailTemplateError(f"Unclosed section {stack[-1][0]} in template {name}")
+    if source[pos:]:
+        nodes.append(source[pos:])
+    return root
+
+
+def _merge_literals(nodes: Iterable[Node]) -> List[Node]:
+    merged: List[Node] = []
+    for node in nodes:
+        if isinstance(node, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += node
+        elif not (isinstance(node, str) and not node):
+            merged.append(node)
+    return merged
+
+
+# ----------------------------------------------------------------------
+# Rendering
+# ----------------------------------------------------------------------
+
+def _lookup(stack: Sequence[Any], path: Tuple[str, ...]) -> Any:
+    """Resolve a name against the context stack (innermost first)."""
+    if path == (".",):
+        return stack[-1] if stack else _MISSING
+
+    for frame in reversed(stack):
+        if isinstance(frame, dict) and path[0] in frame:
+            value = frame[path[0]]
+            break
+    else:
+        return _MISSING
+
+    for key in path[1:]:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, (list, tuple))
+
+
+def _section_frames(value: Any) -> List[Any]:
+    """Context frames a (non-inverted) section renders with."""
+    if _is_list(value):
+        return list(value)
+    return [value] if value else []
+
+
+Renderer = Callable[[List[Any]], str]
+
+
+def _finish_text(text: str) -> str:
+    """Tidy a rendered text body (empty links, blank runs left by sections)."""
+    text = _EMPTY_LINK_RE.sub("", _TRAILING_SPACE_RE.sub("", text))
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def _compile(nodes: List[Node], text_mode: bool) -> Renderer:
+    """Compile a node tree into a render function over a context stack."""
+    parts: List[Union[str, Renderer]] = []
+
+    for node in nodes:
+        if isinstance(node, str):
+            parts.append(node)
+        elif node[0] == "var":
+            parts.append(_compile_var(node[1], node[2], text_mode))
+        else:
+            parts.append(_compile_section(node[1], _compile(node[2], text_mode), node[3]))
+
+    if not parts:
+        return lambda stack: ""
+    if len(parts) == 1 and isinstance(parts[0], str):
+        literal = parts[0]
+        return lambda stack: literal
+
+    def render(stack: List[Any]) -> str:
+        return "".join([part if isinstance(part, str) else part(stack) for part in parts])
+
+    return render
+
+
+def _compile_var(path: Tuple[str, ...], escape: bool, text_mode: bool) -> Renderer:
+    def render(stack: List[Any]) -> str:
+        value = _lookup(stack, path)
+        if value is None or value is _MISSING:
+            return ""
+        value = str(value)
+        if text_mode:
+            # Raw variables carry HTML; the text body wants its text
+            return value if escape else html_to_text(value)
+        return html.escape(value) if escape else value
+
+    return render
+
+
+def _compile_section(path: Tuple[str, ...], body: Renderer, inverted: bool) -> Renderer:
+    def render(stack: List[Any]) -> str:
+        value = _lookup(stack, path)
+        if value is _MISSING:
+            value = None
+        if inverted:
+            return "" if value else body(stack)
+        return "".join([body(stack + [frame]) for frame in _section_frames(value)])
+
+    return render
+
+
+def _bind(nodes: List[Node], stack: List[Any], text_mode: bool) -> List[Node]:
+    """Pre-render every node that resolves against ``stack`` into text."""
+    bound: List[Node] = []
+
+    for node in nodes:
+        if isinstance(node, str):
+            bound.append(node)
+            continue
+
+        value = _lookup(stack, node[1])
+        if value is _MISSING:
+            if node[0] == "var":
+                bound.append(node)
+            else:
+                bound.append(("section", node[1], _bind(node[2], stack, text_mode), node[3]))
+        elif node[0] == "var":
+            bound.append(_compile([node], text_mode)(stack))
+        elif node[3]:
+            if not value:
+                bound.extend(_bind(node[2], stack, text_mode))
+        else:
+            for frame in _section_frames(value):
+                bound.extend(_bind(node[2], stack + [frame], text_mode))
+
+    return _merge_literals(bound)
+
+
+class EmailTemplate:
+    """A compiled email template rendering HTML and plain-text bodies"""
+
+    def __init__(self, name: str, html_nodes: List[Node], text_nodes: List[Node]):
+        self.name = name
+        self._html_nodes = html_nodes
+        self._text_nodes = text_nodes
+        self._render_html = _compile(html_nodes, text_mode=False)
+        self._render_text = _compile(text_nodes, text_mode=True)
+
+    def render(self, context: Optional[Dict[str, Any]] = None) -> RenderedEmail:
+        """
+        Render the template.
+
+        Args:
+            context: Template values
+
+        Returns:
+            RenderedEmail with HTML and plain-text bodies
+        """
+        stack = [context or {}]
+        return RenderedEmail(
+            html=self._render_html(stack),
+            text=_finish_text(self._render_text(stack))
+        )
+
+    def bind(self, context: Dict[str, Any]) -> "EmailTemplate":
+        """
+        Pre-render the parts of the template that depend only on ``context``.
+
+        Use for bulk sends: bind the values shared by every recipient once,
+        then render the bound template per recipient. Per-recipient names
+        must not also appear in ``context``.
+
+        Args:
+            context: Values shared by every message
+
+        Returns:
+            New EmailTemplate with only the unbound names left to render
+        """
+        return EmailTemplate(
+            self.name,
+            _bind(self._html_nodes, [context], text_mode=False),
+            _bind(self._text_nodes, [context], text_mode=True)
+        )
+
+    def render_many(
+        self,
+        shared: Dict[str, Any],
+        recipients: Iterable[Dict[str, Any]]
+    ) -> Iterator[RenderedEmail]:
+        """
+        Render one message per recipient, pre-rendering shared values once.
+
+        Args:
+            shared: Values shared by every message
+            recipients: Per-recipient values
+
+        Yields:
+            RenderedEmail per recipient, in order
+        """
+        bound = self.bind(shared)
+        for recipient in recipients:
+            yield bound.render(recipient)
+
+
+class EmailTemplateService:
+    """
+    Loads and compiles every email template once and serves them from memory
+    """
+
+    def __init__(self, template_dirs: Sequence[Path] = TEMPLATE_DIRS):
+        """
+        Load and compile all templates.
+
+        Templates are named by their path relative to their template
+        directory, without the ``.html`` suffix (e.g. ``gdpr/export_ready``).
+
+        Args:
+            template_dirs: Directories searched for ``*.html`` templates
+
+        Raises:
+            EmailTemplateError: If a template is malformed or two templates
+                share a name
+        """
+        self._sources: Dict[str, str] = {}
+        for directory in template_dirs:
+            for path in sorted(Path(directory).rglob("*.html")):
+                name = path.relative_to(directory).with_suffix("").as_posix()
+                if name in self._sources:
+                    raise EmailTemplateError(f"Duplicate email template name: {name}")
+                self._sources[name] = path.read_text(encoding="utf-8")
+
+        self._templates: Dict[str, EmailTemplate] = {
+            name: self._compile(name) for name in self._sources
+        }
+        logger.info(f"Compiled {len(self._templates)} email templates")
+
+    def _resolve(self, name: str, seen: Tuple[str, ...] = ()) -> str:
+        """Expand layouts and partials into a single template source."""
+        if name in seen:
+            raise EmailTemplateError(f"Recursive email template include: {' -> '.join(seen + (name,))}")
+        if name not in self._sources:
+            raise EmailTemplateError(f"Email template not found: {name}")
+        seen = seen + (name,)
+
+        def extend(match: re.Match) -> str:
+            blocks = {block.group(1): block.group(2) for block in BLOCK_RE.finditer(match.group(2))}
+            layout = self._resolve(match.group(1), seen)
+            return BLOCK_RE.sub(
+                lambda block: blocks.get(block.group(1), block.group(0)),
+                layout
+            )
+
+        source = PARENT_RE.sub(extend, self._sources[name])
+        return PARTIAL_RE.sub(lambda match: self._resolve(match.group(1), seen), source)
+
+    def _compile(self, name: str) -> EmailTemplate:
+        # Blocks not overridden by a child fall back to their default content
+        source = BLOCK_RE.sub(lambda block: block.group(2), self._resolve(name))
+        return EmailTemplate(
+            name,
+            _merge_literals(_parse(source, name)),
+            _merge_literals(_parse(html_to_text(source), name))
+        )
+
+    def get(self, name: str) -> EmailTemplate:
+        """
+        Get a compiled template.
+
+        Args:
+            name: Template name (e.g. ``verification`` or ``gdpr/export_ready``)
+
+        Returns:
+            EmailTemplate
+
+        Raises:
+            EmailTemplateError: If no template has that name
+        """
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise EmailTemplateError(f"Email template not found: {name}")
+
+    def render(self, name: str, context: Optional[Dict[str, Any]] = None) -> RenderedEmail:
+        """
+        Render a template by name.
+
+        Args:
+            name: Template name
+            context: Template values
+
+        Returns:
+            RenderedEmail with HTML and plain-text bodies
+
+        Raises:
+            EmailTemplateError: If no template has that name
+        """
+        return self.get(name).render(context)
+
+
+# Global email template service instance
+_email_template_service: Optional[EmailTemplateService] = None
+
+
+def get_email_template_service() -> EmailTemplateService:
+    """
+    Get or create the global email template service instance.
+
+    Returns:
+        EmailTemplateService instance
+    """
+    global _email_template_service
+
+    if _email_template_service is None:
+        _email_template_service = EmailTemplateService()
+
+    return _email_template_service
@@ -22,11 +22,34 @@ from backend.services.zerodb_service import (
     ZeroDBNotFoundError,
     ZeroDBValidationError
 )
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
+from backend.services.http_cache import EVENTS_CONTENT, bump_content_version
+from backend.services.instrumented_cache_service import get_cache_service
 from backend.models.schemas import Event, EventStatus, EventType, EventVisibility
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Public event caching (see routes/events.py). Event mutations bump the
+# namespace; changes scoped to one event (RSVP counts, training sessions)
+# invalidate that event's tag, which every cached page containing it carries.
+# Both also bump the events content version, which public ETags are built from.
+EVENTS_CACHE_NAMESPACE = "events"
+PUBLIC_EVENTS_CACHE_TTL = 60  # seconds
+
+
+def event_cache_tag(event_id: str) -> str:
+    """
+    Cache tag carried by every cached entry that includes an event
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        Tag name
+    """
+    return f"event:{event_id}"
+
 
 class EventService:
     """
@@ -43,8 +66,15 @@ class EventService:
     def __init__(self):
         """Initialize Event Service with ZeroDB client"""
         self.db = get_zerodb_client()
+        self.aggregates = get_analytics_aggregates_service()
+        self.cache = get_cache_service()
         self.collection = "events"
 
+    def _invalidate_cache(self) -> None:
+        """Invalidate all cached public event lists and details (O(1))"""
+        self.cache.bump_namespace(EVENTS_CACHE_NAMESPACE)
+        bump_content_version(EVENTS_CONTENT)
+
     def create_event(
         self,
         event_data: Dict[str, Any],
@@ -102,6 +132,9 @@ class EventService:
                 data=event_data
             )
 
+            self.aggregates.record_event(result.get("id"), event_data)
+            self._invalidate_cache()
+
             logger.info(f"Event created successfully with ID: {result.get('id')}")
             return result
 
@@ -265,6 +298,14 @@ class EventService:
                 merge=True
             )
 
+            self.aggregates.record_event(event_id, {**existing_event, **event_data})
+            self._invalidate_cache()
+
+            if "max_attendees" in event_data:
+                self._promote_waitlist_on_capacity_change(
+                    event_id, existing_event.get("max_attendees"), event_data["max_attendees"]
+                )
+
             logger.info(f"Event updated successfully: {event_id}")
             return result
 
@@ -274,6 +315,31 @@ class EventService:
             logger.error(f"Failed to update event: {e}")
             raise ZeroDBError(f"Failed to update event: {e}")
 
+    def _promote_waitlist_on_capacity_change(
+        self,
+        event_id: str,
+        old_capacity: Optional[int],
+        new_capacity: Optional[int]
+    ) -> None:
+        """
+        Fill seats added by a capacity increase from the waitlist
+
+        Args:
+            event_id: Event ID
+            old_capacity: Previous max_attendees (None = unlimited)
+            new_capacity: New max_attendees (None = unlimited)
+        """
+        if old_capacity is None or (new_capacity is not None and new_capacity <= old_capacity):
+            return
+
+        # Imported here: the RSVP service depends on this module
+        from backend.services.rsvp_service import get_rsvp_service
+
+        try:
+            get_rsvp_service().promote_waitlist(event_id)
+        except Exception as e:
+            logger.error(f"Failed to promote waitlist of event {event_id} after capacity change: {e}")
+
     def delete_event(
         self,
         event_id: str,
@@ -306,6 +372,7 @@ class EventService:
                     collection=self.collection,
                     document_id=event_id
                 )
+                self.aggregates.remove_event(event_id)
             else:
                 # Soft delete
                 logger.info(f"Soft deleting event: {event_id}")
@@ -321,6 +388,9 @@ class EventService:
                     },
                     merge=True
                 )
+                self.aggregates.remove_event(event_id)
+
+            self._invalidate_cache()
 
             logger.info(f"Event deleted successfully: {event_id}")
             return result
@@ -372,6 +442,9 @@ class EventService:
                 merge=True
             )
 
+            self.aggregates.record_event(event_id, {**event, "is_deleted": False})
+            self._invalidate_cache()
+
             logger.info(f"Event restored successfully: {event_id}")
             return result
 
@@ -487,6 +560,9 @@ class EventService:
                 merge=True
             )
 
+            self.aggregates.record_event(event_id, {**event, **update_data})
+            self._invalidate_cache()
+
             logger.info(f"Event publish status toggled successfully: {event_id}")
             return result
 
@@ -6,8 +6,10 @@ Provides GDPR-compliant functionality for users to exercise their data rights:
 2. Data Deletion (Article 17): Right to erasure ("Right to be Forgotten")
 
 Data Export:
-- Collects all user data from ZeroDB collections
-- Formats as structured JSON with descriptions
+- Collects all user data from ZeroDB collections concurrently, paging
+  through each collection's filtered query
+- Streams records into a ZIP archive with one JSON file per collection
+  plus the cover letter
 - Provides secure temporary download links (24-hour expiry)
 - Sends email notifications when ready
 
@@ -15,6 +17,8 @@ Data Deletion:
 - Password confirmation required
 - Asynchronous background processing
 - Soft delete with anonymization
+- Independent collections anonymized concurrently, in batches, with
+  per-step progress saved so an interrupted deletion can be resumed
 - Selective retention for legal compliance (payments: 7 years, audit logs: 1 year)
 - Stripe subscription cancellation
 - Email confirmation before logout
@@ -35,18 +39,25 @@ import json
 import uuid
 import asyncio
 import hashlib
+import shutil
+import tempfile
+import zipfile
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Dict, List, Any, NamedTuple, Optional
 from passlib.context import CryptContext
 import stripe
 
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBError
+from backend.services.bulk_anonymizer import AnonymizationResult, BatchTransform, BulkAnonymizer
 from backend.services.email_service import EmailService
+from backend.services.email_template_service import get_email_template_service
+from backend.services.job_runner import JobRunner, PRIORITY_NORMAL
+from backend.services.search_index import record_person
 from backend.config import get_settings
 from backend.utils.anonymization import (
     anonymize_user_id,
     anonymize_email,
-    anonymize_document,
+    anonymize_documents,
     anonymize_user_reference,
     create_anonymization_audit_log,
     should_retain_resource,
@@ -64,6 +75,8 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # Configure Stripe
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+DELETION_RESUME_JOB_NAME = "gdpr_deletion_resume"
+
 
 class GDPRServiceError(Exception):
     """Base exception for GDPR service errors"""
@@ -90,6 +103,14 @@ class DeletionInProgressError(GDPRServiceError):
     pass
 
 
+class ExportedCollection(NamedTuple):
+    """One collection's part of a data export, spooled to a temporary file"""
+    collection: str
+    record_count: int
+    file: BinaryIO  # JSON document for the collection
+    error: Optional[str]
+
+
 class GDPRService:
     """
     GDPR Compliance Service for Data Export
@@ -98,8 +119,8 @@ class GDPRService:
     in a machine-readable format (JSON) as required by GDPR Article 20.
 
     Features:
-    - Collects data from all ZeroDB collections
-    - Generates structured JSON export with descriptions
+    - Collects data from all ZeroDB collections concurrently
+    - Generates a ZIP archive of structured JSON files with descriptions
     - Creates temporary download links (24-hour expiry)
     - Sends email notifications when export is ready
     - Includes human-readable cover letter
@@ -120,6 +141,22 @@ class GDPRService:
     # Export expiry time (24 hours)
     EXPORT_EXPIRY_HOURS = 24
 
+    # Records fetched per query while exporting a collection
+    EXPORT_PAGE_SIZE = 500
+
+    # Bytes a collection (or the archive) is buffered in memory before
+    # spilling to a temporary file on disk
+    EXPORT_SPOOL_BYTES = 1024 * 1024
+    EXPORT_ARCHIVE_SPOOL_BYTES = 8 * 1024 * 1024
+
+    # Records anonymized per batch and updates in flight per collection
+    # during account deletion
+    DELETION_BATCH_SIZE = 500
+    DELETION_UPDATE_CONCURRENCY = 16
+
+    # Minutes without progress after which a deletion is considered interrupted
+    DELETION_STALE_MINUTES = 15
+
     def __init__(
         self,
         db_client: Optional[ZeroDBClient] = None,
@@ -134,14 +171,26 @@ class GDPRService:
         """
         self.db = db_client or ZeroDBClient()
         self.email_service = email_service or EmailService()
+        self.anonymizer = BulkAnonymizer(
+            self.db,
+            page_size=self.DELETION_BATCH_SIZE,
+            concurrency=self.DELETION_UPDATE_CONCURRENCY
+        )
+        # Running deletion tasks by user ID (also keeps them from being garbage collected)
+        self._deletion_tasks: Dict[str, asyncio.Task] = {}
         logger.info("GDPRService initialized")
 
     async def export_user_data(self, user_id: str, user_email: str) -> Dict[str, Any]:
         """
         Export all user data from ZeroDB collections
 
-        Collects data from all collections and generates a comprehensive
-        JSON export file with human-readable structure and descriptions.
+        Collects every collection concurrently; each collector pages through
+        its filtered query and streams the cleaned records into its own
+        spooled temporary file. As collections finish, their files are added
+        to a ZIP archive (one JSON file per collection plus the cover letter
+        and export metadata), which is then uploaded. Export time therefore
+        tracks the slowest collection, and memory stays flat however much
+        data the user has.
 
         Args:
             user_id: User ID to export data for
@@ -161,59 +210,61 @@ class GDPRService:
             export_date = datetime.utcnow()
             expiry_date = export_date + timedelta(hours=self.EXPORT_EXPIRY_HOURS)
 
-            # Collect data from all collections
-            export_data = {
-                "export_metadata": {
-                    "export_id": export_id,
-                    "export_date": export_date.isoformat(),
-                    "expiry_date": expiry_date.isoformat(),
-                    "user_id": user_id,
-                    "format_version": "1.0",
-                    "gdpr_article": "Article 20 - Right to data portability"
-                },
-                "cover_letter": self._generate_cover_letter(user_email, export_date, expiry_date),
-                "data": {}
+            export_metadata = {
+                "export_id": export_id,
+                "export_date": export_date.isoformat(),
+                "expiry_date": expiry_date.isoformat(),
+                "user_id": user_id,
+                "format_version": "2.0",
+                "gdpr_article": "Article 20 - Right to data portability"
             }
+            cover_letter = self._generate_cover_letter(user_email, export_date, expiry_date)
 
-            # Collect data from each collection
-            for collection_name, description in self.COLLECTIONS.items():
-                try:
-                    collection_data = await self._collect_collection_data(
-                        collection_name,
-                        user_id
-                    )
-                    export_data["data"][collection_name] = {
-                        "description": description,
-                        "record_count": len(collection_data),
-                        "records": collection_data
-                    }
-                    logger.info(
-                        f"Collected {len(collection_data)} records from {collection_name}"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to collect data from {collection_name}: {str(e)}"
-                    )
-                    export_data["data"][collection_name] = {
-                        "description": description,
-                        "record_count": 0,
-                        "records": [],
-                        "error": f"Failed to retrieve: {str(e)}"
-                    }
-
-            # Convert to JSON
-            export_json = json.dumps(export_data, indent=2, default=str)
-
-            # Store export file in ZeroDB Object Storage
-            file_name = f"data_export_{export_id}.json"
-            object_key = f"gdpr_exports/{user_id}/{file_name}"
-
-            # Upload to object storage with 24-hour TTL
-            upload_result = await self._store_export_file(
-                object_key,
-                export_json,
-                expiry_date
-            )
+            object_key = self._export_object_key(user_id, export_id)
+            record_counts = {}
+            errors = {}
+
+            # Collect data from all collections concurrently
+            tasks = [
+                asyncio.create_task(self._export_collection(collection_name, description, user_id))
+                for collection_name, description in self.COLLECTIONS.items()
+            ]
+            archive = tempfile.SpooledTemporaryFile(max_size=self.EXPORT_ARCHIVE_SPOOL_BYTES)
+
+            try:
+                with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+                    zip_file.writestr("cover_letter.json", json.dumps(cover_letter, indent=2))
+
+                    # Add each collection as soon as it is complete
+                    for next_collection in asyncio.as_completed(tasks):
+                        exported = await next_collection
+                        record_counts[exported.collection] = exported.record_count
+                        if exported.error:
+                            errors[exported.collection] = exported.error
+                        await asyncio.to_thread(self._add_to_archive, zip_file, exported)
+                        logger.info(
+                            f"Collected {exported.record_count} records from {exported.collection}"
+                        )
+
+                    zip_file.writestr("export_metadata.json", json.dumps({
+                        **export_metadata,
+                        "record_counts": record_counts,
+                        "errors": errors
+                    }, indent=2))
+
+                file_size = archive.tell()
+                archive.seek(0)
+
+                # Upload to object storage with 24-hour TTL
+                await self._store_export_file(object_key, archive, expiry_date)
+
+            finally:
+                archive.close()
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled() and task.exception() is None:
+                        task.result().file.close()
 
             # Generate signed download URL
             download_url = await self._generate_download_url(
@@ -238,9 +289,9 @@ class GDPRService:
                 "status": "completed",
                 "download_url": download_url,
                 "expiry_date": expiry_date.isoformat(),
-                "file_size_bytes": len(export_json),
+                "file_size_bytes": file_size,
                 "record_counts": {
-                    collection: export_data["data"][collection]["record_count"]
+                    collection: record_counts.get(collection, 0)
                     for collection in self.COLLECTIONS.keys()
                 }
             }
@@ -249,39 +300,100 @@ class GDPRService:
             logger.error(f"Data export failed for user {user_id}: {str(e)}", exc_info=True)
             raise DataExportError(f"Failed to export user data: {str(e)}")
 
-    async def _collect_collection_data(
+    def _export_object_key(self, user_id: str, export_id: str) -> str:
+        """Object storage key of an export archive"""
+        return f"gdpr_exports/{user_id}/data_export_{export_id}.zip"
+
+    async def _export_collection(
         self,
         collection_name: str,
+        description: str,
         user_id: str
-    ) -> List[Dict[str, Any]]:
+    ) -> ExportedCollection:
         """
-        Collect all data for a user from a specific collection
+        Stream all of a user's records from one collection into a spooled file
+
+        Pages through the collection's filtered query and writes the cleaned
+        records as a JSON document, one page at a time, so only a single page
+        is ever held in memory.
 
         Args:
             collection_name: Name of the collection
+            description: Human-readable description of the collection
             user_id: User ID to filter by
 
         Returns:
-            List of documents from the collection
+            ExportedCollection whose file holds the collection's JSON document
         """
-        # Build filter query based on collection
         filter_query = self._build_filter_query(collection_name, user_id)
+        spool = tempfile.SpooledTemporaryFile(max_size=self.EXPORT_SPOOL_BYTES)
+        header = (
+            f'{{\n  "collection": {json.dumps(collection_name)},\n'
+            f'  "description": {json.dumps(description)},\n  "records": ['
+        ).encode("utf-8")
+        spool.write(header)
+
+        record_count = 0
+        error = None
+        offset = 0
 
         try:
-            # Query the collection
-            result = self.db.find(
-                collection=collection_name,
-                filter_query=filter_query,
-                limit=10000  # High limit to capture all data
-            )
+            while True:
+                documents = await asyncio.to_thread(
+                    self._fetch_export_page,
+                    collection_name,
+                    filter_query,
+                    offset
+                )
+                for record in self._clean_sensitive_data(documents, collection_name):
+                    separator = b",\n    " if record_count else b"\n    "
+                    spool.write(separator + json.dumps(record, default=str).encode("utf-8"))
+                    record_count += 1
 
-            # Clean sensitive data from records
-            cleaned_data = self._clean_sensitive_data(
-                result.get("documents", []),
-                collection_name
-            )
+                if len(documents) < self.EXPORT_PAGE_SIZE:
+                    break
+                offset += self.EXPORT_PAGE_SIZE
+
+        except Exception as e:
+            logger.warning(f"Failed to collect data from {collection_name}: {str(e)}")
+            error = f"Failed to retrieve: {str(e)}"
+            record_count = 0
+            spool.seek(0)
+            spool.truncate()
+            spool.write(header)
 
-            return cleaned_data
+        footer = f'\n  ],\n  "record_count": {record_count}'
+        if error:
+            footer += f',\n  "error": {json.dumps(error)}'
+        spool.write((footer + "\n}\n").encode("utf-8"))
+
+        return ExportedCollection(collection_name, record_count, spool, error)
+
+    def _fetch_export_page(
+        self,
+        collection_name: str,
+        filter_query: Dict[str, Any],
+        offset: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of a user's records from a collection
+
+        Args:
+            collection_name: Name of the collection
+            filter_query: Filter selecting the user's records
+            offset: Number of records to skip
+
+        Returns:
+            Documents on the page (empty if the collection does not exist)
+        """
+        try:
+            result = self.db.query_documents(
+                collection=collection_name,
+                filters=filter_query,
+                limit=self.EXPORT_PAGE_SIZE,
+                offset=offset
+            )
+            return result.get("documents", [])
 
         except ZeroDBError as e:
             # If collection doesn't exist, return empty list
@@ -290,6 +402,14 @@ class GDPRService:
                 return []
             raise
 
+    @staticmethod
+    def _add_to_archive(zip_file: zipfile.ZipFile, exported: ExportedCollection) -> None:
+        """Copy a collected collection into the export archive and release its file"""
+        exported.file.seek(0)
+        with zip_file.open(f"{exported.collection}.json", "w") as entry:
+            shutil.copyfileobj(exported.file, entry)
+        exported.file.close()
+
     def _build_filter_query(self, collection_name: str, user_id: str) -> Dict[str, Any]:
         """
         Build filter query for each collection type
@@ -387,7 +507,7 @@ class GDPRService:
         return {
             "title": "Your Personal Data Export from WWMAA",
             "introduction": (
-                "This file contains all personal data we have collected about you "
+                "This archive contains all personal data we have collected about you "
                 "as a user of the World Wide Martial Arts Association (WWMAA) platform. "
                 "This export is provided in compliance with GDPR Article 20 "
                 "(Right to data portability) and Article 15 (Right of access)."
@@ -402,8 +522,9 @@ class GDPRService:
                 "and activity logs."
             ),
             "format_notice": (
-                "The data is provided in JSON format, which is machine-readable and "
-                "can be processed by most modern programming languages and tools."
+                "The data is provided as a ZIP archive containing one JSON file per "
+                "category of data. JSON is machine-readable and can be processed by "
+                "most modern programming languages and tools."
             ),
             "privacy_notice": (
                 "This file contains your personal data. Please keep it secure and "
@@ -418,15 +539,15 @@ class GDPRService:
     async def _store_export_file(
         self,
         object_key: str,
-        content: str,
+        archive: BinaryIO,
         expiry_date: datetime
     ) -> Dict[str, Any]:
         """
-        Store export file in ZeroDB Object Storage with TTL
+        Store export archive in ZeroDB Object Storage with TTL
 
         Args:
             object_key: Object storage key
-            content: File content (JSON string)
+            archive: Open export archive, positioned at its start
             expiry_date: When file should expire
 
         Returns:
@@ -436,11 +557,12 @@ class GDPRService:
             # Calculate TTL in seconds
             ttl_seconds = int((expiry_date - datetime.utcnow()).total_seconds())
 
-            # Upload to object storage using the new method
-            result = self.db.upload_object_from_bytes(
+            # Upload straight from the (possibly on-disk) archive file
+            result = await asyncio.to_thread(
+                self.db.upload_object_from_file,
                 key=object_key,
-                content=content.encode('utf-8'),
-                content_type="application/json",
+                file_obj=archive,
+                content_type="application/zip",
                 metadata={
                     "purpose": "gdpr_export",
                     "expiry_date": expiry_date.isoformat()
@@ -538,109 +660,17 @@ class GDPRService:
             # Format expiry date for display
             expiry_display = expiry_date.strftime("%B %d, %Y at %H:%M UTC")
 
-            # HTML email body
-            html_body = f"""
-            <html>
-                <head>
-                    <style>
-                        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                        .header {{ background-color: #1a1a1a; color: white; padding: 20px; text-align: center; }}
-                        .content {{ background-color: #f9f9f9; padding: 30px; border-radius: 5px; margin-top: 20px; }}
-                        .button {{
-                            display: inline-block;
-                            background-color: #007bff;
-                            color: white;
-                            padding: 12px 30px;
-                            text-decoration: none;
-                            border-radius: 5px;
-                            margin: 20px 0;
-                        }}
-                        .warning {{
-                            background-color: #fff3cd;
-                            border-left: 4px solid #ffc107;
-                            padding: 15px;
-                            margin: 20px 0;
-                        }}
-                        .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; font-size: 12px; }}
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <div class="header">
-                            <h1>Your Data Export is Ready</h1>
-                        </div>
-                        <div class="content">
-                            <p>Hello,</p>
-                            <p>Your personal data export from WWMAA is ready for download.</p>
-
-                            <p>This export contains all your personal data we have collected, including:</p>
-                            <ul>
-                                <li>Profile information</li>
-                                <li>Membership application history</li>
-                                <li>Subscription and payment records</li>
-                                <li>Event RSVPs and training attendance</li>
-                                <li>Search history and activity logs</li>
-                            </ul>
-
-                            <div style="text-align: center;">
-                                <a href="{download_url}" class="button">Download Your Data</a>
-                            </div>
-
-                            <div class="warning">
-                                <strong>Important:</strong> This download link will expire on {expiry_display}.
-                                Please download your data before this time. The file contains sensitive personal
-                                information - keep it secure and do not share it with others.
-                            </div>
-
-                            <p>The data is provided in JSON format, which is machine-readable and can be
-                            processed by most modern programming languages and tools.</p>
-
-                            <p>If you did not request this export, please contact us immediately at
-                            <a href="mailto:privacy@wwmaa.com">privacy@wwmaa.com</a>.</p>
-
-                            <p>This export is provided in compliance with GDPR Article 20 (Right to data portability)
-                            and Article 15 (Right of access by the data subject).</p>
-                        </div>
-                        <div class="footer">
-                            <p>World Wide Martial Arts Association (WWMAA)<br>
-                            For questions about your data privacy rights, contact: privacy@wwmaa.com</p>
-                        </div>
-                    </div>
-                </body>
-            </html>
-            """
-
-            # Plain text version
-            text_body = f"""
-Your Data Export is Ready
-
-Hello,
-
-Your personal data export from WWMAA is ready for download.
-
-Download your data here: {download_url}
-
-IMPORTANT: This link will expire on {expiry_display}. Please download your data before this time.
-
-This export contains all your personal data including profile information, membership applications,
-subscriptions, payments, event RSVPs, and activity logs.
-
-The file contains sensitive personal information - keep it secure and do not share it with others.
-
-If you did not request this export, please contact us immediately at privacy@wwmaa.com.
-
----
-World Wide Martial Arts Association (WWMAA)
-For questions about your data privacy rights, contact: privacy@wwmaa.com
-            """
+            rendered = get_email_template_service().render("gdpr/export_ready", {
+                "download_url": download_url,
+                "expiry_date": expiry_display
+            })
 
             # Send email
             self.email_service._send_email(
                 to_email=user_email,
                 subject="Your WWMAA Data Export is Ready",
-                html_body=html_body,
-                text_body=text_body,
+                html_body=rendered.html,
+                text_body=rendered.text,
                 tag="gdpr_export"
             )
 
@@ -663,7 +693,7 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         """
         try:
             # Check if export file exists in object storage
-            object_key = f"gdpr_exports/{user_id}/data_export_{export_id}.json"
+            object_key = self._export_object_key(user_id, export_id)
 
             # Check if object exists
             # Note: This is a placeholder - actual implementation depends on API
@@ -699,7 +729,7 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
             True if deleted successfully
         """
         try:
-            object_key = f"gdpr_exports/{user_id}/data_export_{export_id}.json"
+            object_key = self._export_object_key(user_id, export_id)
 
             # Delete from object storage
             self.db.delete_object_by_key(key=object_key)
@@ -827,9 +857,7 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
             )
 
             # Start asynchronous deletion process
-            asyncio.create_task(
-                self._execute_account_deletion_async(user_id, user)
-            )
+            self._start_account_deletion(user_id, user)
 
             return {
                 "success": True,
@@ -847,24 +875,147 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
             logger.error(f"Error initiating account deletion: {e}")
             raise GDPRServiceError(f"Failed to initiate account deletion: {str(e)}")
 
+    def _start_account_deletion(
+        self,
+        user_id: str,
+        user: Dict[str, Any],
+        completed_steps: Optional[List[str]] = None
+    ) -> None:
+        """Run the deletion of an account as a background task."""
+        task = asyncio.create_task(
+            self._execute_account_deletion_async(user_id, user, completed_steps)
+        )
+        self._deletion_tasks[user_id] = task
+        task.add_done_callback(lambda _: self._deletion_tasks.pop(user_id, None))
+
+    async def resume_account_deletion(self, user_id: str) -> Dict[str, Any]:
+        """
+        Resume an account deletion that was interrupted (e.g. by a restart).
+
+        Steps recorded as completed on the user document are skipped, and
+        records already anonymized are left alone.
+
+        Args:
+            user_id: ID of user whose deletion is resumed
+
+        Returns:
+            Dict with deletion job status
+
+        Raises:
+            GDPRServiceError: If no deletion is in progress for the user
+        """
+        user_result = await asyncio.to_thread(self.db.get_document, "users", user_id)
+        user = user_result.get("data") or {}
+
+        if user.get("status") != "deletion_in_progress":
+            raise GDPRServiceError(f"No account deletion in progress for user {user_id}")
+
+        completed_steps = user.get("deletion_completed_steps") or []
+        if user_id not in self._deletion_tasks:
+            logger.info(
+                f"Resuming account deletion for user {user_id} "
+                f"({len(completed_steps)} step(s) already completed)"
+            )
+            self._start_account_deletion(user_id, user, completed_steps)
+
+        return {
+            "success": True,
+            "user_id": user_id,
+            "status": "deletion_in_progress",
+            "completed_steps": completed_steps
+        }
+
+    async def resume_interrupted_deletions(self, limit: int = 100) -> List[str]:
+        """
+        Resume every account deletion that has made no progress recently.
+
+        Intended to be run periodically; deletions that are still running make
+        progress well within DELETION_STALE_MINUTES and are not touched.
+
+        Args:
+            limit: Maximum number of deletions to resume
+
+        Returns:
+            IDs of users whose deletion was resumed
+        """
+        result = await asyncio.to_thread(
+            self.db.query_documents,
+            "users",
+            filters={"status": "deletion_in_progress"},
+            limit=limit
+        )
+        cutoff = (datetime.utcnow() - timedelta(minutes=self.DELETION_STALE_MINUTES)).isoformat()
+
+        resumed = []
+        for user in result.get("documents", []):
+            user_id = user.get("id")
+            last_progress = user.get("deletion_progress_at") or user.get("deletion_initiated_at") or ""
+            if not user_id or user_id in self._deletion_tasks or last_progress > cutoff:
+                continue
+            try:
+                await self.resume_account_deletion(user_id)
+                resumed.append(user_id)
+            except Exception as e:
+                logger.error(f"Error resuming account deletion for user {user_id}: {e}")
+
+        return resumed
+
+    async def run_deletion_resume_job(self) -> List[str]:
+        """
+        Resume interrupted account deletions and wait for them to finish.
+
+        Job runs execute in their own event loop, so the resumed deletion
+        tasks are awaited before the run returns.
+
+        Returns:
+            IDs of users whose deletion was resumed
+        """
+        resumed = await self.resume_interrupted_deletions()
+        tasks = [self._deletion_tasks[user_id] for user_id in resumed if user_id in self._deletion_tasks]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if resumed:
+            logger.info(f"Resumed {len(resumed)} interrupted account deletion(s)")
+        return resumed
+
+    def register_jobs(self, runner: JobRunner) -> None:
+        """
+        Register the interrupted deletion check (every DELETION_STALE_MINUTES)
+        on a job runner
+
+        Args:
+            runner: Job runner
+        """
+        runner.register(
+            DELETION_RESUME_JOB_NAME,
+            self.run_deletion_resume_job,
+            interval=self.DELETION_STALE_MINUTES * 60,
+            priority=PRIORITY_NORMAL
+        )
+
     async def _execute_account_deletion_async(
         self,
         user_id: str,
-        user: Dict[str, Any]
+        user: Dict[str, Any],
+        completed_steps: Optional[List[str]] = None
     ) -> None:
         """
         Execute the complete account deletion process asynchronously.
 
         This background task handles all deletion and anonymization operations:
-        1. Cancel Stripe subscription
-        2. Delete/anonymize user data
-        3. Anonymize related resources
-        4. Send confirmation email
-        5. Update audit logs
+        1. Cancel Stripe subscription and anonymize related resources
+           (concurrently, as they touch independent collections)
+        2. Soft delete and anonymize the user account
+        3. Invalidate tokens and send confirmation email
+        4. Update audit logs
+
+        Each completed step is recorded on the user document, so a deletion
+        resumed with ``completed_steps`` picks up where it stopped.
 
         Args:
             user_id: ID of user to delete
             user: User document
+            completed_steps: Steps already completed by an earlier run
         """
         try:
             logger.info(f"Starting asynchronous deletion for user {user_id}")
@@ -872,168 +1023,49 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
             deletion_results = {
                 "user_id": user_id,
                 "started_at": datetime.utcnow().isoformat(),
+                "resumed": bool(completed_steps),
                 "steps": []
             }
+            completed = set(completed_steps or [])
+            progress_lock = asyncio.Lock()
 
-            # Step 1: Cancel Stripe subscription
-            try:
-                stripe_result = await self._cancel_stripe_subscription(user_id, user)
-                deletion_results["steps"].append({
-                    "step": "cancel_subscription",
-                    "success": stripe_result.get("success", False),
-                    "details": stripe_result
-                })
-            except Exception as e:
-                logger.error(f"Error canceling Stripe subscription: {e}")
-                deletion_results["steps"].append({
-                    "step": "cancel_subscription",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 2: Anonymize user profile
-            try:
-                profile_result = await self._anonymize_user_profile(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_profile",
-                    "success": profile_result.get("success", False),
-                    "details": profile_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing profile: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_profile",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 3: Anonymize application history
-            try:
-                application_result = await self._anonymize_applications(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_applications",
-                    "success": application_result.get("success", False),
-                    "details": application_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing applications: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_applications",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 4: Anonymize search queries
-            try:
-                search_result = await self._anonymize_search_queries(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_search_queries",
-                    "success": search_result.get("success", False),
-                    "details": search_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing search queries: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_search_queries",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 5: Anonymize training attendance
-            try:
-                attendance_result = await self._anonymize_training_attendance(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_training_attendance",
-                    "success": attendance_result.get("success", False),
-                    "details": attendance_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing training attendance: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_training_attendance",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 6: Anonymize event RSVPs
-            try:
-                rsvp_result = await self._anonymize_rsvps(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_rsvps",
-                    "success": rsvp_result.get("success", False),
-                    "details": rsvp_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing RSVPs: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_rsvps",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 7: Anonymize payments (retain for 7 years)
-            try:
-                payment_result = await self._anonymize_payment_records(user_id)
-                deletion_results["steps"].append({
-                    "step": "anonymize_payments",
-                    "success": payment_result.get("success", False),
-                    "details": payment_result
-                })
-            except Exception as e:
-                logger.error(f"Error anonymizing payments: {e}")
-                deletion_results["steps"].append({
-                    "step": "anonymize_payments",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 8: Soft delete user account
-            try:
-                user_result = await self._soft_delete_user(user_id, user)
-                deletion_results["steps"].append({
-                    "step": "soft_delete_user",
-                    "success": user_result.get("success", False),
-                    "details": user_result
-                })
-            except Exception as e:
-                logger.error(f"Error soft deleting user: {e}")
-                deletion_results["steps"].append({
-                    "step": "soft_delete_user",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 9: Invalidate all JWT tokens
-            try:
-                token_result = await self._invalidate_user_tokens(user_id)
-                deletion_results["steps"].append({
-                    "step": "invalidate_tokens",
-                    "success": token_result.get("success", False),
-                    "details": token_result
-                })
-            except Exception as e:
-                logger.error(f"Error invalidating tokens: {e}")
-                deletion_results["steps"].append({
-                    "step": "invalidate_tokens",
-                    "success": False,
-                    "error": str(e)
-                })
-
-            # Step 10: Send confirmation email
-            try:
-                email_result = await self._send_deletion_confirmation_email(user)
-                deletion_results["steps"].append({
-                    "step": "send_confirmation_email",
-                    "success": email_result.get("success", False),
-                    "details": email_result
-                })
-            except Exception as e:
-                logger.error(f"Error sending confirmation email: {e}")
-                deletion_results["steps"].append({
-                    "step": "send_confirmation_email",
-                    "success": False,
-                    "error": str(e)
-                })
+            async def run_step(step: str, run) -> Dict[str, Any]:
+                if step in completed:
+                    return {"step": step, "success": True, "skipped": True}
+                try:
+                    result = await run()
+                except Exception as e:
+                    logger.error(f"Error in account deletion step {step}: {e}")
+                    return {"step": step, "success": False, "error": str(e)}
+
+                success = result.get("success", False)
+                if success:
+                    # Serialized so a slower write never records an older set
+                    async with progress_lock:
+                        completed.add(step)
+                        await self._save_deletion_progress(user_id, completed)
+                return {"step": step, "success": success, "details": result}
+
+            # Steps 1-7: subscriptions and the user's records in independent
+            # collections (payments are retained for 7 years, anonymized)
+            deletion_results["steps"].extend(await asyncio.gather(
+                run_step("cancel_subscription", lambda: self._cancel_stripe_subscription(user_id, user)),
+                run_step("anonymize_profile", lambda: self._anonymize_user_profile(user_id)),
+                run_step("anonymize_applications", lambda: self._anonymize_applications(user_id)),
+                run_step("anonymize_search_queries", lambda: self._anonymize_search_queries(user_id)),
+                run_step("anonymize_training_attendance", lambda: self._anonymize_training_attendance(user_id)),
+                run_step("anonymize_rsvps", lambda: self._anonymize_rsvps(user_id)),
+                run_step("anonymize_payments", lambda: self._anonymize_payment_records(user_id)),
+            ))
+
+            # Steps 8-10: soft delete the account, invalidate all JWT tokens
+            # and send the confirmation email, in order
+            for step, run in (
+                ("soft_delete_user", lambda: self._soft_delete_user(user_id, user)),
+                ("invalidate_tokens", lambda: self._invalidate_user_tokens(user_id)),
+                ("send_confirmation_email", lambda: self._send_deletion_confirmation_email(user)),
+            ):
+                deletion_results["steps"].append(await run_step(step, run))
 
             deletion_results["completed_at"] = datetime.utcnow().isoformat()
             deletion_results["success"] = all(
@@ -1064,6 +1096,23 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
                 metadata={"error": str(e), "success": False}
             )
 
+    async def _save_deletion_progress(self, user_id: str, completed: set) -> None:
+        """Record the completed deletion steps on the user document."""
+        try:
+            await asyncio.to_thread(
+                self.db.update_document,
+                "users",
+                user_id,
+                {
+                    "deletion_completed_steps": sorted(completed),
+                    "deletion_progress_at": datetime.utcnow().isoformat()
+                },
+                merge=True
+            )
+        except Exception as e:
+            # The steps are idempotent; a resumed deletion just repeats them
+            logger.warning(f"Could not save deletion progress for user {user_id}: {e}")
+
     async def _cancel_stripe_subscription(
         self,
         user_id: str,
@@ -1140,70 +1189,63 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
                 "error": str(e)
             }
 
-    async def _anonymize_user_profile(self, user_id: str) -> Dict[str, Any]:
+    async def _anonymize_collection(
+        self,
+        collection: str,
+        user_id: str,
+        transform: BatchTransform,
+        count_key: str,
+        description: str
+    ) -> Dict[str, Any]:
         """
-        Anonymize user profile data.
+        Anonymize all of a user's records in a collection in batches.
 
         Args:
+            collection: Collection name
             user_id: User ID
+            transform: Anonymizes a batch of records
+            count_key: Result key for the number of records anonymized
+            description: Plural description of the records, for messages
 
         Returns:
             Dict with anonymization status
         """
         try:
-            # Query for user profiles
-            profiles_result = self.db.query_documents(
-                "profiles",
-                filters={"user_id": user_id},
-                limit=10
+            result: AnonymizationResult = await self.anonymizer.run(
+                collection,
+                {"user_id": user_id},
+                transform
             )
-
-            profiles = profiles_result.get("documents", [])
-
-            if not profiles:
-                return {
-                    "success": True,
-                    "message": "No profiles found",
-                    "profiles_anonymized": 0
-                }
-
-            anonymized_count = 0
-
-            for profile in profiles:
-                # Anonymize profile
-                anonymized_profile = anonymize_document(
-                    profile,
-                    AnonymizationType.PROFILE,
-                    user_id
-                )
-
-                # Update in database
-                self.db.update_document(
-                    "profiles",
-                    profile["id"],
-                    anonymized_profile,
-                    merge=False  # Full replacement
-                )
-
-                anonymized_count += 1
-
-            logger.info(f"Anonymized {anonymized_count} profile(s) for user {user_id}")
-
-            return {
-                "success": True,
-                "profiles_anonymized": anonymized_count
-            }
-
         except Exception as e:
-            logger.error(f"Error anonymizing profiles: {e}")
+            logger.error(f"Error anonymizing {description}: {e}")
             return {
                 "success": False,
                 "error": str(e)
             }
 
-    async def _anonymize_applications(self, user_id: str) -> Dict[str, Any]:
+        if not result.found:
+            return {
+                "success": True,
+                "message": f"No {description} found",
+                count_key: 0
+            }
+
+        logger.info(f"Anonymized {result.anonymized} {description} for user {user_id}")
+
+        status = {
+            "success": result.failed == 0,
+            count_key: result.anonymized
+        }
+        if result.already_anonymized:
+            status["already_anonymized"] = result.already_anonymized
+        if result.failed:
+            status["failed"] = result.failed
+            status["error"] = result.errors[0]
+        return status
+
+    async def _anonymize_user_profile(self, user_id: str) -> Dict[str, Any]:
         """
-        Anonymize membership application history.
+        Anonymize user profile data.
 
         Args:
             user_id: User ID
@@ -1211,56 +1253,31 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         Returns:
             Dict with anonymization status
         """
-        try:
-            # Query for applications
-            applications_result = self.db.query_documents(
-                "applications",
-                filters={"user_id": user_id},
-                limit=100
-            )
-
-            applications = applications_result.get("documents", [])
-
-            if not applications:
-                return {
-                    "success": True,
-                    "message": "No applications found",
-                    "applications_anonymized": 0
-                }
-
-            anonymized_count = 0
-
-            for application in applications:
-                # Anonymize application
-                anonymized_app = anonymize_document(
-                    application,
-                    AnonymizationType.APPLICATION,
-                    user_id
-                )
-
-                # Update in database
-                self.db.update_document(
-                    "applications",
-                    application["id"],
-                    anonymized_app,
-                    merge=False
-                )
-
-                anonymized_count += 1
+        return await self._anonymize_collection(
+            "profiles",
+            user_id,
+            lambda batch: anonymize_documents(batch, AnonymizationType.PROFILE, user_id),
+            "profiles_anonymized",
+            "profiles"
+        )
 
-            logger.info(f"Anonymized {anonymized_count} application(s) for user {user_id}")
+    async def _anonymize_applications(self, user_id: str) -> Dict[str, Any]:
+        """
+        Anonymize membership application history.
 
-            return {
-                "success": True,
-                "applications_anonymized": anonymized_count
-            }
+        Args:
+            user_id: User ID
 
-        except Exception as e:
-            logger.error(f"Error anonymizing applications: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        Returns:
+            Dict with anonymization status
+        """
+        return await self._anonymize_collection(
+            "applications",
+            user_id,
+            lambda batch: anonymize_documents(batch, AnonymizationType.APPLICATION, user_id),
+            "applications_anonymized",
+            "applications"
+        )
 
     async def _anonymize_search_queries(self, user_id: str) -> Dict[str, Any]:
         """
@@ -1272,56 +1289,13 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         Returns:
             Dict with anonymization status
         """
-        try:
-            # Query for search queries
-            queries_result = self.db.query_documents(
-                "search_queries",
-                filters={"user_id": user_id},
-                limit=1000
-            )
-
-            queries = queries_result.get("documents", [])
-
-            if not queries:
-                return {
-                    "success": True,
-                    "message": "No search queries found",
-                    "queries_anonymized": 0
-                }
-
-            anonymized_count = 0
-
-            for query in queries:
-                # Anonymize search query
-                anonymized_query = anonymize_document(
-                    query,
-                    AnonymizationType.SEARCH_QUERY,
-                    user_id
-                )
-
-                # Update in database
-                self.db.update_document(
-                    "search_queries",
-                    query["id"],
-                    anonymized_query,
-                    merge=False
-                )
-
-                anonymized_count += 1
-
-            logger.info(f"Anonymized {anonymized_count} search quer(ies) for user {user_id}")
-
-            return {
-                "success": True,
-                "queries_anonymized": anonymized_count
-            }
-
-        except Exception as e:
-            logger.error(f"Error anonymizing search queries: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return await self._anonymize_collection(
+            "search_queries",
+            user_id,
+            lambda batch: anonymize_documents(batch, AnonymizationType.SEARCH_QUERY, user_id),
+            "queries_anonymized",
+            "search queries"
+        )
 
     async def _anonymize_training_attendance(self, user_id: str) -> Dict[str, Any]:
         """
@@ -1333,56 +1307,13 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         Returns:
             Dict with anonymization status
         """
-        try:
-            # Query for attendance records
-            attendance_result = self.db.query_documents(
-                "session_attendance",
-                filters={"user_id": user_id},
-                limit=1000
-            )
-
-            attendance_records = attendance_result.get("documents", [])
-
-            if not attendance_records:
-                return {
-                    "success": True,
-                    "message": "No attendance records found",
-                    "records_anonymized": 0
-                }
-
-            anonymized_count = 0
-
-            for record in attendance_records:
-                # Anonymize attendance record
-                anonymized_record = anonymize_document(
-                    record,
-                    AnonymizationType.TRAINING_ATTENDANCE,
-                    user_id
-                )
-
-                # Update in database
-                self.db.update_document(
-                    "session_attendance",
-                    record["id"],
-                    anonymized_record,
-                    merge=False
-                )
-
-                anonymized_count += 1
-
-            logger.info(f"Anonymized {anonymized_count} attendance record(s) for user {user_id}")
-
-            return {
-                "success": True,
-                "records_anonymized": anonymized_count
-            }
-
-        except Exception as e:
-            logger.error(f"Error anonymizing attendance records: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return await self._anonymize_collection(
+            "session_attendance",
+            user_id,
+            lambda batch: anonymize_documents(batch, AnonymizationType.TRAINING_ATTENDANCE, user_id),
+            "records_anonymized",
+            "attendance records"
+        )
 
     async def _anonymize_rsvps(self, user_id: str) -> Dict[str, Any]:
         """
@@ -1394,56 +1325,13 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         Returns:
             Dict with anonymization status
         """
-        try:
-            # Query for RSVPs
-            rsvps_result = self.db.query_documents(
-                "rsvps",
-                filters={"user_id": user_id},
-                limit=1000
-            )
-
-            rsvps = rsvps_result.get("documents", [])
-
-            if not rsvps:
-                return {
-                    "success": True,
-                    "message": "No RSVPs found",
-                    "rsvps_anonymized": 0
-                }
-
-            anonymized_count = 0
-
-            for rsvp in rsvps:
-                # Anonymize RSVP
-                anonymized_rsvp = anonymize_document(
-                    rsvp,
-                    AnonymizationType.RSVP,
-                    user_id
-                )
-
-                # Update in database
-                self.db.update_document(
-                    "rsvps",
-                    rsvp["id"],
-                    anonymized_rsvp,
-                    merge=False
-                )
-
-                anonymized_count += 1
-
-            logger.info(f"Anonymized {anonymized_count} RSVP(s) for user {user_id}")
-
-            return {
-                "success": True,
-                "rsvps_anonymized": anonymized_count
-            }
-
-        except Exception as e:
-            logger.error(f"Error anonymizing RSVPs: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return await self._anonymize_collection(
+            "rsvps",
+            user_id,
+            lambda batch: anonymize_documents(batch, AnonymizationType.RSVP, user_id),
+            "rsvps_anonymized",
+            "RSVPs"
+        )
 
     async def _anonymize_payment_records(self, user_id: str) -> Dict[str, Any]:
         """
@@ -1455,71 +1343,45 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
         Returns:
             Dict with anonymization status
         """
-        try:
-            # Query for payments
-            payments_result = self.db.query_documents(
-                "payments",
-                filters={"user_id": user_id},
-                limit=1000
-            )
-
-            payments = payments_result.get("documents", [])
-
-            if not payments:
-                return {
-                    "success": True,
-                    "message": "No payment records found",
-                    "payments_anonymized": 0
-                }
-
-            anonymized_count = 0
-            retention_days = get_retention_period_days("payments")
-            retention_until = (datetime.utcnow() + timedelta(days=retention_days)).isoformat()
-
-            for payment in payments:
-                # Anonymize payment but keep financial data
-                anonymized_payment = {
-                    **payment,
-                    "user_id": f"deleted_user_{hashlib.sha256(user_id.encode()).hexdigest()[:8]}",
-                    "email": anonymize_email(user_id),
-                    "anonymized_at": datetime.utcnow().isoformat(),
-                    "retention_until": retention_until,
-                    "retention_reason": "legal_compliance_7_years"
-                }
-
-                # Remove PII but keep financial data
-                pii_fields = ["name", "billing_address", "phone"]
-                for field in pii_fields:
-                    if field in anonymized_payment:
-                        anonymized_payment[field] = "[REDACTED]"
-
-                # Update in database
-                self.db.update_document(
-                    "payments",
-                    payment["id"],
-                    anonymized_payment,
-                    merge=False
-                )
-
-                anonymized_count += 1
-
-            logger.info(
-                f"Anonymized {anonymized_count} payment record(s) for user {user_id} "
-                f"(retention until {retention_until})"
-            )
-
-            return {
-                "success": True,
-                "payments_anonymized": anonymized_count,
-                "retention_until": retention_until
-            }
-
-        except Exception as e:
-            logger.error(f"Error anonymizing payment records: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        retention_days = get_retention_period_days("payments")
+        retention_until = (datetime.utcnow() + timedelta(days=retention_days)).isoformat()
+
+        result = await self._anonymize_collection(
+            "payments",
+            user_id,
+            lambda batch: self._anonymize_payment_batch(batch, user_id, retention_until),
+            "payments_anonymized",
+            "payment records"
+        )
+        if result.get("payments_anonymized"):
+            result["retention_until"] = retention_until
+        return result
+
+    @staticmethod
+    def _anonymize_payment_batch(
+        payments: List[Dict[str, Any]],
+        user_id: str,
+        retention_until: str
+    ) -> List[Dict[str, Any]]:
+        """Anonymize payments but keep financial data."""
+        anonymized_fields = {
+            "user_id": f"deleted_user_{hashlib.sha256(user_id.encode()).hexdigest()[:8]}",
+            "email": anonymize_email(user_id),
+            "anonymized_at": datetime.utcnow().isoformat(),
+            "retention_until": retention_until,
+            "retention_reason": "legal_compliance_7_years"
+        }
+        # Remove PII but keep financial data
+        pii_fields = ["name", "billing_address", "phone"]
+
+        anonymized_payments = []
+        for payment in payments:
+            anonymized_payment = {**payment, **anonymized_fields}
+            for field in pii_fields:
+                if field in anonymized_payment:
+                    anonymized_payment[field] = "[REDACTED]"
+            anonymized_payments.append(anonymized_payment)
+        return anonymized_payments
 
     async def _soft_delete_user(
         self,
@@ -1570,6 +1432,10 @@ For questions about your data privacy rights, contact: privacy@wwmaa.com
 
             logger.info(f"Soft deleted and anonymized user {user_id}")
 
+            # Drop the original name and email from admin search; the empty
+            # profile keeps the previously indexed profile names from surviving
+            record_person(user_id, anonymized_user, profile={})
+
             return {
                 "success": True,
                 "user_id": user_id,
@@ -0,0 +1,315 @@
+"""
+HTTP Cache - conditional GET and shared-cache headers for public reads
+
+Public read endpoints (events, blog, certifications, resources) rebuilt and
+re-serialized their whole body on every hit. Each collection now has a
+change counter in Redis (``VERSION_KEY_PREFIX``), bumped by every write
+after the server-side caches were invalidated. Routes call
+``conditional_get`` before doing any work:
+- The strong ETag is a hash of the route path, the query parameters, the
+  collection versions and any per-caller inputs (``vary``), so it is known
+  without loading the content
+- A matching ``If-None-Match`` is answered with 304 at the cost of one
+  Redis read, without touching ZeroDB or Strapi
+- ``Cache-Control`` lets browsers and the CDN keep the response, and
+  ``Surrogate-Key`` tags it (collection, document) so the CDN can purge by
+  tag when content changes
+
+Content without write notifications passes a ``refresh_interval``: the
+current interval number is part of the ETag, bounding how long a validator
+outlives a change. Content fixed at deploy time passes
+``static=static_version(data)`` instead of collections.
+
+Redis is an accelerator only: when it is unreachable no ETag is emitted
+(every request gets a full response) and Redis is retried after
+``REDIS_RETRY_INTERVAL``.
+
+Usage:
+    not_modified = conditional_get(request, response, collections=[EVENTS_CONTENT],
+                                   surrogate_keys=["events"])
+    if not_modified is not None:
+        return not_modified
+    ...                                  # build the body as before
+    bump_content_version(EVENTS_CONTENT)  # after a write
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+import redis
+from fastapi import Request, Response
+
+from backend.config import settings
+from backend.observability.metrics import http_conditional_requests_total
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "content:version:"  # collection -> change counter
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after an error
+ETAG_FORMAT = "1"  # Part of every ETag; bump when response formats change
+
+# Collections with content versions
+EVENTS_CONTENT = "events"
+BLOG_CONTENT = "blog"
+RESOURCES_CONTENT = "resources"
+
+# Conditional request results (metric label values)
+RESULT_NOT_MODIFIED = "not_modified"
+RESULT_MODIFIED = "modified"
+RESULT_UNVERSIONED = "unversioned"
+
+
+class CachePolicy(NamedTuple):
+    """Cache-Control directives of a response"""
+    max_age: int  # Seconds browsers reuse the response without revalidating
+    s_maxage: int = 0  # Seconds shared caches (CDN) reuse it; ignored if private
+    stale_while_revalidate: int = 0
+    private: bool = False  # Per-user content: browsers only
+
+    def header(self) -> str:
+        """
+        Build the Cache-Control header value
+
+        Returns:
+            Cache-Control directives
+        """
+        if self.private:
+            return f"private, max-age={self.max_age}"
+        directives = [f"public, max-age={self.max_age}", f"s-maxage={self.s_maxage}"]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+# Listings change more often than single documents; the CDN keeps both
+# longer than browsers because it is purged by Surrogate-Key
+PUBLIC_LIST_POLICY = CachePolicy(max_age=0, s_maxage=60, stale_while_revalidate=30)
+PUBLIC_DOCUMENT_POLICY = CachePolicy(max_age=60, s_maxage=300, stale_while_revalidate=60)
+STATIC_POLICY = CachePolicy(max_age=3600, s_maxage=86400)
+PRIVATE_POLICY = CachePolicy(max_age=0, private=True)
+
+
+class ContentVersions:
+    """
+    Collection change counters shared by all workers
+
+    Thread-safe; every read and bump is a single Redis command.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        """
+        Initialize the counters
+
+        Args:
+            redis_client: Redis client holding the counters (optional)
+        """
+        self.redis_client = redis_client
+        self._redis_retry_at = 0.0
+
+    def get(self, collections: Sequence[str]) -> Optional[List[int]]:
+        """
+        Read the current version of collections
+
+        Args:
+            collections: Collection names
+
+        Returns:
+            Versions in the given order (0 before the first bump), or None
+            when Redis is unavailable
+        """
+        client = self._redis()
+        if client is None:
+            return None
+        if not collections:
+            return []
+        try:
+            values = client.mget([VERSION_KEY_PREFIX + name for name in collections])
+            return [int(value or 0) for value in values]
+        except (redis.RedisError, ValueError) as e:
+            self._redis_failed(e)
+            return None
+
+    def bump(self, *collections: str) -> None:
+        """
+        Record that collections changed, invalidating their ETags
+
+        Args:
+            *collections: Collection names
+        """
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for name in collections:
+                pipe.incr(VERSION_KEY_PREFIX + name)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if self.redis_client is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self.redis_client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Content versions bypassing Redis for {REDIS_RETRY_INTERVAL}s: {error}")
+
+
+def bump_content_version(*collections: str) -> None:
+    """
+    Invalidate the ETags of changed collections; best-effort, never raises
+
+    Call after the server-side caches were invalidated, so a request that
+    sees the new version also sees the new content.
+
+    Args:
+        *collections: Collection names (EVENTS_CONTENT, ...)
+    """
+    try:
+        get_content_versions().bump(*collections)
+    except Exception as e:
+        logger.error(f"Failed to bump content version of {list(collections)}: {e}")
+
+
+def static_version(data) -> str:
+    """
+    Version of content fixed at deploy time
+
+    Args:
+        data: JSON-serializable content
+
+    Returns:
+        Short hash of the content
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison)
+
+    Args:
+        if_none_match: Header value (None if absent)
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    collections: Sequence[str] = (),
+    surrogate_keys: Iterable[str] = (),
+    policy: CachePolicy = PUBLIC_LIST_POLICY,
+    vary: Sequence[str] = (),
+    static: Optional[str] = None,
+    refresh_interval: Optional[int] = None
+) -> Optional[Response]:
+    """
+    Validate a GET request against the content version
+
+    Sets ETag, Cache-Control and Surrogate-Key on ``response`` (the route's
+    injected response). Error responses raised afterwards do not carry them.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers the route returns
+        collections: Collections the response is built from
+        surrogate_keys: CDN purge tags of the response
+        policy: Cache-Control directives
+        vary: Per-caller inputs of the response not in the URL (e.g. role)
+        static: Version of content fixed at deploy time
+        refresh_interval: Seconds after which the ETag changes even
+            without a version bump (content without write notifications)
+
+    Returns:
+        A 304 response to return as-is if the client's copy is current,
+        otherwise None (build and return the full response)
+    """
+    endpoint = getattr(request.scope.get("route"), "path", request.url.path)
+    headers = {"Cache-Control": policy.header()}
+    keys = " ".join(dict.fromkeys(surrogate_keys))
+    if keys:
+        headers["Surrogate-Key"] = keys
+
+    versions = get_content_versions().get(collections) if collections else []
+    if versions is None:
+        http_conditional_requests_total.labels(endpoint=endpoint, result=RESULT_UNVERSIONED).inc()
+        response.headers.update(headers)
+        return None
+
+    validator = [
+        ETAG_FORMAT,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        dict(zip(collections, versions)),
+        list(vary),
+        static,
+        int(time.time() // refresh_interval) if refresh_interval else None,
+    ]
+    headers["ETag"] = '"' + hashlib.sha256(json.dumps(validator).encode()).hexdigest()[:32] + '"'
+
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        http_conditional_requests_total.labels(endpoint=endpoint, result=RESULT_NOT_MODIFIED).inc()
+        return Response(status_code=304, headers=headers)
+
+    http_conditional_requests_total.labels(endpoint=endpoint, result=RESULT_MODIFIED).inc()
+    response.headers.update(headers)
+    return None
+
+
+def uncacheable(response: Response) -> None:
+    """
+    Drop the validator and caching headers set by ``conditional_get``
+
+    For degraded responses (fallback content served with 200 when a
+    backend failed), which must not be cached or revalidated.
+
+    Args:
+        response: Response whose headers the route returns
+    """
+    for header in ("ETag", "Surrogate-Key"):
+        if header in response.headers:
+            del response.headers[header]
+    response.headers["Cache-Control"] = "no-store"
+
+
+# Global counters instance
+_content_versions_instance: Optional[ContentVersions] = None
+
+
+def get_content_versions() -> ContentVersions:
+    """
+    Get or create the global ContentVersions instance
+
+    Returns:
+        ContentVersions instance backed by settings.REDIS_URL
+    """
+    global _content_versions_instance
+
+    if _content_versions_instance is None:
+        _content_versions_instance = ContentVersions(
+            redis_client=redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+        )
+
+    return _content_versions_instance
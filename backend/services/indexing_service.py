@@ -33,6 +33,8 @@ except ImportError:
 
 from backend.config import settings
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.query_search_service import SEARCH_CACHE_NAMESPACE
 from backend.utils.text_chunking import chunk_text, count_tokens
 
 # Configure logging
@@ -55,6 +57,15 @@ class IndexingStatus(str, Enum):
     FAILED = "failed"
 
 
+# Content types indexed by the scheduled incremental run
+SCHEDULED_CONTENT_TYPES = [
+    ContentType.EVENTS,
+    ContentType.ARTICLES,
+    ContentType.TRAINING_VIDEOS,
+    ContentType.MEMBER_PROFILES,
+]
+
+
 class IndexingService:
     """
     Service for indexing content into ZeroDB with OpenAI embeddings.
@@ -72,6 +83,7 @@ class IndexingService:
     def __init__(self):
         """Initialize the indexing service."""
         self.zerodb = get_zerodb_client()
+        self.cache = get_cache_service()
         self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
         self.embedding_model = settings.OPENAI_EMBEDDING_MODEL
         self.batch_size = settings.INDEXING_BATCH_SIZE
@@ -618,6 +630,10 @@ class IndexingService:
 
             self._stats["last_indexed_at"] = datetime.now(timezone.utc).isoformat()
             self._status = IndexingStatus.COMPLETED
+
+            # Cached search answers may cite stale content
+            if results["indexed"]:
+                self.cache.bump_namespace(SEARCH_CACHE_NAMESPACE)
             self._current_operation = None
 
             logger.info(
@@ -639,6 +655,37 @@ class IndexingService:
                 "error": str(e)
             }
 
+    def index_incremental(self, content_types: Optional[List[ContentType]] = None) -> Dict[str, Any]:
+        """
+        Incrementally index the scheduled content types.
+
+        Args:
+            content_types: Content types to index (SCHEDULED_CONTENT_TYPES if None)
+
+        Returns:
+            Dictionary with indexed, skipped and errors totals
+        """
+        if content_types is None:
+            content_types = SCHEDULED_CONTENT_TYPES
+
+        totals = {"indexed": 0, "skipped": 0, "errors": 0}
+        for content_type in content_types:
+            logger.info(f"Indexing {content_type.value}...")
+
+            try:
+                result = self.index_collection(content_type=content_type, incremental=True)
+                for key in totals:
+                    totals[key] += result.get(key, 0)
+            except Exception as e:
+                logger.error(f"Error indexing {content_type.value}: {e}")
+                totals["errors"] += 1
+
+        logger.info(
+            f"Incremental indexing completed: "
+            f"{totals['indexed']} indexed, {totals['skipped']} skipped, {totals['errors']} errors"
+        )
+        return totals
+
     def reindex_all(self, content_types: Optional[List[ContentType]] = None) -> Dict[str, Any]:
         """
         Perform full reindex of all or specified content types.
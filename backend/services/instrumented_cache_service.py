@@ -3,11 +3,33 @@ Instrumented Redis Cache Service with Performance Metrics
 
 Provides a Redis cache wrapper with automatic performance tracking,
 hit/miss rate monitoring, and Prometheus metrics.
+
+Also provides stampede-safe memoization for expensive computations
+(``get_or_compute`` / ``aget_or_compute``):
+- Single-flight: concurrent misses on the same key wait on one in-flight
+  computation, within a process (shared future) and across processes
+  (short Redis lock, other workers poll for the value)
+- Stale-while-revalidate: entries stay readable for ``stale_ttl`` seconds
+  past their fresh TTL while one background refresh recomputes them
+- TTL jitter: fresh TTLs are randomized so keys written together do not
+  all expire together
+
+Invalidation without keyspace scans:
+- Namespace versions: ``versioned_key(namespace, key)`` embeds a per-namespace
+  version counter in the key; ``bump_namespace`` invalidates every key in
+  the namespace with a single INCR (old keys age out via their TTL)
+- Tags: ``set(..., tags=[...])`` registers the key in one Redis set per tag;
+  ``invalidate_tags`` deletes exactly the registered keys
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Optional, Union
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from uuid import uuid4
 import redis
 
 from backend.config import get_settings
@@ -16,6 +38,87 @@ from backend.observability.metrics import track_cache_operation, update_cache_hi
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Memoization defaults
+DEFAULT_TTL_JITTER = 0.1  # +/-10% of the fresh TTL
+DEFAULT_LOCK_TTL = 30  # seconds a recompute lock is held at most
+DEFAULT_LOCK_WAIT = 10.0  # seconds a waiter polls for another worker's result
+LOCK_POLL_INTERVAL = 0.05  # initial poll interval (doubles up to 0.5s)
+LOCK_KEY_PREFIX = "lock:"
+
+# Invalidation keys
+NAMESPACE_VERSION_PREFIX = "cache:ns:"
+TAG_KEY_PREFIX = "cache:tag:"
+TAG_SET_TTL = 86400  # Minimum lifetime of a tag set (outlives its members)
+TAG_SET_PRUNE_SIZE = 256  # Tag sets larger than this drop expired members on write
+TAG_SET_PRUNE_SAMPLE = 20  # Members checked per tagged write of a large set
+
+# Release a lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Drop members whose key no longer exists from tag sets over the size
+# threshold, checking a random sample per set. Each tagged write adds one
+# member and removes expired ones in proportion, so a hot tag's set stays
+# close to its live keys.
+# KEYS: tag sets; ARGV: size threshold, sample size
+_PRUNE_TAG_SETS_SCRIPT = """
+local removed = 0
+for _, tag in ipairs(KEYS) do
+    if redis.call('SCARD', tag) > tonumber(ARGV[1]) then
+        for _, member in ipairs(redis.call('SRANDMEMBER', tag, tonumber(ARGV[2]))) do
+            if redis.call('EXISTS', member) == 0 then
+                removed = removed + redis.call('SREM', tag, member)
+            end
+        end
+    end
+end
+return removed
+"""
+
+# Delete every key registered under the given tag sets, then the sets.
+# Atomic, so a key tagged concurrently is either deleted or survives in
+# a fresh tag set.
+_INVALIDATE_TAGS_SCRIPT = """
+local deleted = 0
+for _, tag in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag)
+    for i = 1, #members, 500 do
+        deleted = deleted + redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', tag)
+end
+return deleted
+"""
+
+
+def jittered_ttl(ttl: int, jitter: float = DEFAULT_TTL_JITTER) -> int:
+    """
+    Randomize a TTL to spread out expiry of keys written together.
+
+    Args:
+        ttl: Base TTL in seconds
+        jitter: Maximum relative deviation (0.1 = +/-10%)
+
+    Returns:
+        Jittered TTL in seconds (at least 1)
+    """
+    if not jitter:
+        return ttl
+    return max(1, int(round(ttl * (1 + random.uniform(-jitter, jitter)))))
+
+
+class _Flight:
+    """An in-process computation shared by concurrent callers of one key"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
 
 class InstrumentedCacheService:
     """
@@ -27,15 +130,29 @@ class InstrumentedCacheService:
     - Cache errors
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[redis.Redis] = None,
+    ):
         """
         Initialize instrumented cache service.
 
         Args:
             redis_url: Redis connection URL (defaults to settings.REDIS_URL)
+            client: Existing Redis client to wrap (optional)
         """
         self.redis_url = redis_url or settings.REDIS_URL
-        self._client: Optional[redis.Redis] = None
+        self._client: Optional[redis.Redis] = client
+        self._release_lock_script = None
+        self._invalidate_tags_script = None
+        self._prune_tag_sets_script = None
+
+        # In-flight computations for single-flight coalescing
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._async_flights: Dict[str, asyncio.Future] = {}
+        self._background_tasks: set = set()
 
     @property
     def client(self) -> redis.Redis:
@@ -103,6 +220,7 @@ class InstrumentedCacheService:
         key: str,
         value: Any,
         expiration: Optional[int] = None,
+        tags: Optional[list[str]] = None,
     ) -> bool:
         """
         Set value in cache.
@@ -111,6 +229,7 @@ class InstrumentedCacheService:
             key: Cache key
             value: Value to cache
             expiration: Expiration time in seconds (optional)
+            tags: Tags to register the key under for ``invalidate_tags`` (optional)
 
         Returns:
             True if successful, False otherwise
@@ -121,7 +240,9 @@ class InstrumentedCacheService:
                 if not isinstance(value, str):
                     value = json.dumps(value)
 
-                if expiration:
+                if tags:
+                    result = self._set_tagged(key, value, expiration, tags)
+                elif expiration:
                     result = self.client.setex(key, expiration, value)
                 else:
                     result = self.client.set(key, value)
@@ -270,6 +391,9 @@ class InstrumentedCacheService:
         """
         Clear all keys matching a pattern.
 
+        Scans the whole keyspace (O(total keys)); prefer ``bump_namespace``
+        or ``invalidate_tags`` for routine invalidation.
+
         Args:
             pattern: Key pattern (e.g., "user:*")
 
@@ -293,6 +417,125 @@ class InstrumentedCacheService:
                 logger.error(f"Cache clear_pattern error for pattern {pattern}: {e}")
                 return 0
 
+    def _set_tagged(
+        self,
+        key: str,
+        value: str,
+        expiration: Optional[int],
+        tags: list[str],
+    ) -> bool:
+        """
+        Write a value and register it in its tag sets in one round trip
+
+        Large tag sets are pruned of expired members in the same round trip,
+        so tags that are written often but rarely invalidated stay bounded.
+        """
+        if self._prune_tag_sets_script is None:
+            self._prune_tag_sets_script = self.client.register_script(_PRUNE_TAG_SETS_SCRIPT)
+
+        pipe = self.client.pipeline(transaction=False)
+        if expiration:
+            pipe.setex(key, expiration, value)
+        else:
+            pipe.set(key, value)
+        tag_keys = [TAG_KEY_PREFIX + tag for tag in tags]
+        for tag_key in tag_keys:
+            pipe.sadd(tag_key, key)
+            if expiration:
+                pipe.expire(tag_key, max(expiration, TAG_SET_TTL))
+        self._prune_tag_sets_script(
+            keys=tag_keys, args=[TAG_SET_PRUNE_SIZE, TAG_SET_PRUNE_SAMPLE], client=pipe
+        )
+        return bool(pipe.execute()[0])
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every cached key registered under any of the given tags.
+
+        Cost is proportional to the number of tagged keys, not the keyspace.
+
+        Args:
+            *tags: Tags to invalidate (e.g., "event:123", "user:abc")
+
+        Returns:
+            Number of keys deleted
+        """
+        if not tags:
+            return 0
+
+        with track_cache_operation("invalidate_tags") as track_result:
+            try:
+                if self._invalidate_tags_script is None:
+                    self._invalidate_tags_script = self.client.register_script(
+                        _INVALIDATE_TAGS_SCRIPT
+                    )
+                deleted = self._invalidate_tags_script(
+                    keys=[TAG_KEY_PREFIX + tag for tag in tags]
+                )
+                track_result("success")
+                logger.info(f"Cache invalidated tags {list(tags)}: {deleted} keys deleted")
+                return int(deleted or 0)
+
+            except Exception as e:
+                track_result("error")
+                logger.error(f"Cache invalidate_tags error for tags {list(tags)}: {e}")
+                return 0
+
+    def namespace_version(self, namespace: str) -> int:
+        """
+        Get the current version of a cache namespace.
+
+        Args:
+            namespace: Namespace name (e.g., "events", "blog")
+
+        Returns:
+            Current version (0 if never bumped or on error)
+        """
+        try:
+            version = self.client.get(NAMESPACE_VERSION_PREFIX + namespace)
+            return int(version) if version else 0
+        except Exception as e:
+            logger.error(f"Cache namespace version error for {namespace}: {e}")
+            return 0
+
+    def versioned_key(self, namespace: str, key: str) -> str:
+        """
+        Build a cache key that embeds the namespace's current version.
+
+        Args:
+            namespace: Namespace name (e.g., "events")
+            key: Key within the namespace
+
+        Returns:
+            Key of the form "<namespace>:v<version>:<key>"
+        """
+        return f"{namespace}:v{self.namespace_version(namespace)}:{key}"
+
+    def bump_namespace(self, namespace: str) -> int:
+        """
+        Invalidate every key in a namespace in O(1).
+
+        Keys built with ``versioned_key`` before the bump are no longer read
+        and expire on their own TTL.
+
+        Args:
+            namespace: Namespace name
+
+        Returns:
+            New namespace version (0 on error)
+        """
+        with track_cache_operation("bump_namespace") as track_result:
+            try:
+                version = self.client.incr(NAMESPACE_VERSION_PREFIX + namespace)
+                track_result("success")
+                logger.info(f"Cache namespace {namespace} bumped to v{version}")
+                return version
+
+            except Exception as e:
+                track_result("error")
+                logger.error(f"Cache bump_namespace error for {namespace}: {e}")
+                return 0
+
     def increment(self, key: str, amount: int = 1) -> Optional[int]:
         """
         Increment a counter in cache.
@@ -315,6 +558,344 @@ class InstrumentedCacheService:
                 logger.error(f"Cache increment error for key {key}: {e}")
                 return None
 
+    # ------------------------------------------------------------------
+    # Stampede-safe memoization
+    # ------------------------------------------------------------------
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int = 0,
+        jitter: float = DEFAULT_TTL_JITTER,
+        lock_ttl: int = DEFAULT_LOCK_TTL,
+        wait_timeout: float = DEFAULT_LOCK_WAIT,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> Any:
+        """
+        Return a cached value, computing it at most once across concurrent callers.
+
+        Entries are stored as plain values (readable with ``get``) with a
+        physical TTL of ``jittered(ttl) + stale_ttl``; once less than
+        ``stale_ttl`` remains the entry is stale, is still served, and one
+        caller refreshes it in a background thread.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+            ttl: Fresh TTL in seconds
+            stale_ttl: Seconds a stale value may be served while refreshing
+            jitter: Relative TTL jitter (0 disables)
+            lock_ttl: Maximum seconds a recompute lock is held
+            wait_timeout: Seconds to wait for another worker's computation
+            tags: Tags to register the entry under (see ``invalidate_tags``),
+                or a function deriving them from the computed value
+
+        Returns:
+            Cached or freshly computed value (None results are not cached)
+        """
+        with track_cache_operation("get_or_compute") as track_result:
+            state, value = self._read_with_freshness(key, stale_ttl)
+            track_result(state)
+
+            if state == "hit":
+                return value
+
+            if state == "stale":
+                token = self._acquire_lock(key, lock_ttl)
+                if token:
+                    thread = threading.Thread(
+                        target=self._refresh,
+                        args=(key, compute, ttl, stale_ttl, jitter, token, tags),
+                        daemon=True,
+                    )
+                    thread.start()
+                return value
+
+        return self._single_flight(
+            key,
+            lambda: self._compute_with_lock(
+                key, compute, ttl, stale_ttl, jitter, lock_ttl, wait_timeout, tags
+            ),
+            wait_timeout,
+        )
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int = 0,
+        jitter: float = DEFAULT_TTL_JITTER,
+        lock_ttl: int = DEFAULT_LOCK_TTL,
+        wait_timeout: float = DEFAULT_LOCK_WAIT,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> Any:
+        """
+        Async variant of ``get_or_compute`` for coroutine computations.
+
+        In-process waiters share an ``asyncio.Future``; stale refreshes run
+        as background tasks on the current event loop.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine function producing the value
+            ttl: Fresh TTL in seconds
+            stale_ttl: Seconds a stale value may be served while refreshing
+            jitter: Relative TTL jitter (0 disables)
+            lock_ttl: Maximum seconds a recompute lock is held
+            wait_timeout: Seconds to wait for another worker's computation
+            tags: Tags to register the entry under (see ``invalidate_tags``),
+                or a function deriving them from the computed value
+
+        Returns:
+            Cached or freshly computed value (None results are not cached)
+        """
+        with track_cache_operation("get_or_compute") as track_result:
+            state, value = self._read_with_freshness(key, stale_ttl)
+            track_result(state)
+
+            if state == "hit":
+                return value
+
+            if state == "stale":
+                token = self._acquire_lock(key, lock_ttl)
+                if token:
+                    task = asyncio.get_running_loop().create_task(
+                        self._arefresh(key, compute, ttl, stale_ttl, jitter, token, tags)
+                    )
+                    self._background_tasks.add(task)
+                    task.add_done_callback(self._background_tasks.discard)
+                return value
+
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            return await asyncio.shield(flight)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = flight
+        try:
+            value = await self._acompute_with_lock(
+                key, compute, ttl, stale_ttl, jitter, lock_ttl, wait_timeout, tags
+            )
+            flight.set_result(value)
+            return value
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark the exception retrieved if nobody was waiting on it
+            flight.exception()
+            raise
+        finally:
+            self._async_flights.pop(key, None)
+
+    def _read_with_freshness(self, key: str, stale_ttl: int) -> tuple:
+        """
+        Read a key and classify it as hit, stale or miss.
+
+        Returns:
+            Tuple of (state, value); state is "hit", "stale", "miss" or "error"
+        """
+        try:
+            raw = self.client.get(key)
+            if raw is None:
+                return "miss", None
+
+            value = self._decode(raw)
+
+            if stale_ttl:
+                remaining_ms = self.client.pttl(key)
+                if isinstance(remaining_ms, int) and 0 <= remaining_ms < stale_ttl * 1000:
+                    return "stale", value
+
+            return "hit", value
+
+        except Exception as e:
+            logger.error(f"Cache read error for key {key}: {e}")
+            return "error", None
+
+    @staticmethod
+    def _decode(raw: Any) -> Any:
+        """Decode a cached JSON value (falling back to the raw string)"""
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return raw
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        stale_ttl: int,
+        jitter: float,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> None:
+        """Store a computed value with a jittered fresh TTL plus the stale window"""
+        if value is not None:
+            if callable(tags):
+                tags = tags(value)
+            self.set(key, value, expiration=jittered_ttl(ttl, jitter) + stale_ttl, tags=tags)
+
+    def _acquire_lock(self, key: str, lock_ttl: int) -> Optional[str]:
+        """
+        Try to take the cross-process recompute lock for a key.
+
+        Returns:
+            Lock token if acquired, None if another worker holds it, or
+            "" if Redis is unavailable (caller should compute unlocked)
+        """
+        token = uuid4().hex
+        try:
+            acquired = self.client.set(
+                LOCK_KEY_PREFIX + key, token, nx=True, px=lock_ttl * 1000
+            )
+            return token if acquired else None
+        except Exception as e:
+            logger.error(f"Cache lock error for key {key}: {e}")
+            return ""
+
+    def _release_lock(self, key: str, token: str) -> None:
+        """Release a recompute lock if we still own it"""
+        if not token:
+            return
+        try:
+            if self._release_lock_script is None:
+                self._release_lock_script = self.client.register_script(_RELEASE_LOCK_SCRIPT)
+            self._release_lock_script(keys=[LOCK_KEY_PREFIX + key], args=[token])
+        except Exception as e:
+            logger.error(f"Cache unlock error for key {key}: {e}")
+
+    def _single_flight(self, key: str, fn: Callable[[], Any], wait_timeout: float) -> Any:
+        """Run fn once for concurrent in-process callers of the same key"""
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            if flight.event.wait(wait_timeout):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            # Leader is taking too long; compute independently
+            return fn()
+
+        try:
+            flight.value = fn()
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def _compute_with_lock(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        jitter: float,
+        lock_ttl: int,
+        wait_timeout: float,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> Any:
+        """Compute under the cross-process lock, or wait for the lock holder"""
+        token = self._acquire_lock(key, lock_ttl)
+
+        if token is None:
+            deadline = time.monotonic() + wait_timeout
+            interval = LOCK_POLL_INTERVAL
+            while time.monotonic() < deadline:
+                time.sleep(interval)
+                state, value = self._read_with_freshness(key, 0)
+                if state == "hit":
+                    return value
+                interval = min(interval * 2, 0.5)
+            logger.warning(f"Timed out waiting for cache computation of {key}")
+
+        try:
+            value = compute()
+            self._store(key, value, ttl, stale_ttl, jitter, tags)
+            return value
+        finally:
+            if token:
+                self._release_lock(key, token)
+
+    async def _acompute_with_lock(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        jitter: float,
+        lock_ttl: int,
+        wait_timeout: float,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> Any:
+        """Async variant of ``_compute_with_lock``"""
+        token = self._acquire_lock(key, lock_ttl)
+
+        if token is None:
+            deadline = time.monotonic() + wait_timeout
+            interval = LOCK_POLL_INTERVAL
+            while time.monotonic() < deadline:
+                await asyncio.sleep(interval)
+                state, value = self._read_with_freshness(key, 0)
+                if state == "hit":
+                    return value
+                interval = min(interval * 2, 0.5)
+            logger.warning(f"Timed out waiting for cache computation of {key}")
+
+        try:
+            value = await compute()
+            self._store(key, value, ttl, stale_ttl, jitter, tags)
+            return value
+        finally:
+            if token:
+                self._release_lock(key, token)
+
+    def _refresh(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        jitter: float,
+        token: str,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> None:
+        """Background refresh of a stale entry (lock already held)"""
+        try:
+            self._store(key, compute(), ttl, stale_ttl, jitter, tags)
+        except Exception as e:
+            logger.error(f"Background cache refresh failed for key {key}: {e}")
+        finally:
+            self._release_lock(key, token)
+
+    async def _arefresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        jitter: float,
+        token: str,
+        tags: Optional[Union[list[str], Callable[[Any], list[str]]]] = None,
+    ) -> None:
+        """Async background refresh of a stale entry (lock already held)"""
+        try:
+            self._store(key, await compute(), ttl, stale_ttl, jitter, tags)
+        except Exception as e:
+            logger.error(f"Background cache refresh failed for key {key}: {e}")
+        finally:
+            self._release_lock(key, token)
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
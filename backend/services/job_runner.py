@@ -0,0 +1,573 @@
+"""
+Job Runner - Redis-backed scheduler and worker pool for periodic jobs
+
+Replaces the in-process APScheduler instances, which ran every job once per
+replica. Any number of processes can run the same jobs; each scheduled run
+still happens once:
+- Every job's next due time lives in one Redis sorted set. Each process
+  ticks through the due jobs and enqueues a run with a compare-and-set on
+  that due time, so exactly one process enqueues each occurrence (no
+  leader needed). Missed occurrences are coalesced into one run
+- Runs wait in a per-job queue ordered by job priority, then due time;
+  workers pop the best run among the jobs they know, in one script
+- A job never runs twice at once: a popped run is leased while it runs and
+  the lease is renewed by a heartbeat. Runs of a crashed worker are
+  retried once the lease lapses
+- Failed runs are retried with exponential backoff up to the job's
+  ``max_attempts``, then recorded in a capped failed-runs list
+- Run state (job, due time, attempts, status, error) is a Redis hash kept
+  for ``RUN_TTL``
+
+Metrics: background_job_lag_seconds (due to start), background_job_queue_depth
+and background_job_retries_total, next to the duration, run and error
+metrics of ``track_background_job``.
+
+Usage:
+    runner = get_job_runner()
+    runner.register("cleanup_sessions", cleanup, daily_at="02:00", priority=PRIORITY_LOW)
+    runner.register("send_reminders", send, interval=300, priority=PRIORITY_HIGH)
+    runner.start(workers=4)
+"""
+
+import asyncio
+import logging
+import math
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import (
+    background_job_lag,
+    background_job_queue_depth,
+    background_job_retries_total,
+    track_background_job,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_KEY = "jobs:schedule"  # Sorted set of job name by next due time (unix seconds)
+READY_KEY_PREFIX = "jobs:ready:"  # job -> sorted set of run_id by priority score
+DELAYED_KEY_PREFIX = "jobs:delayed:"  # job -> sorted set of run_id by retry due time
+RUNNING_KEY_PREFIX = "jobs:running:"  # job -> sorted set of run_id by lease expiry
+RUN_KEY_PREFIX = "jobs:run:"  # run_id -> {job, due_at, attempts, status, ...}
+FAILED_KEY = "jobs:failed"  # Latest run_ids that exhausted their attempts
+
+RUN_TTL = 7 * 86400  # Seconds run state is kept
+FAILED_HISTORY = 100
+
+LEASE_SECONDS = 60  # Runs of a worker silent for this long are retried
+HEARTBEAT_SECONDS = 20
+TICK_SECONDS = 5  # How often each process looks for due jobs
+POLL_SECONDS = 1  # How long an idle worker waits before polling again
+REDIS_RETRY_INTERVAL = 10  # Seconds to back off after a Redis error
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 60  # Seconds before the first retry; doubles every attempt
+
+# Priorities (higher runs first)
+PRIORITY_LOW = 1
+PRIORITY_NORMAL = 5
+PRIORITY_HIGH = 9
+PRIORITY_WEIGHT = 10 ** 13  # Milliseconds; larger than any due timestamp
+
+# Run statuses
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_RETRYING = "retrying"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+# KEYS: schedule, ready, delayed, running, run
+# ARGV: job, expected due ('' = manual trigger), next due, run_id, ready score,
+#       now, run ttl
+# Returns 1 if a run was enqueued; 0 if another process took this occurrence
+# or the job already has a run waiting
+ENQUEUE_SCRIPT = """
+if ARGV[2] ~= '' then
+    local due = redis.call('ZSCORE', KEYS[1], ARGV[1])
+    if not due or tonumber(due) ~= tonumber(ARGV[2]) then
+        return 0
+    end
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+end
+if redis.call('ZCARD', KEYS[2]) + redis.call('ZCARD', KEYS[3]) > 0 then
+    return 0
+end
+redis.call('HSET', KEYS[5], 'job', ARGV[1], 'due_at', ARGV[2] ~= '' and ARGV[2] or ARGV[6],
+    'enqueued_at', ARGV[6], 'attempts', 0, 'status', 'queued')
+redis.call('EXPIRE', KEYS[5], ARGV[7])
+redis.call('ZADD', KEYS[2], ARGV[5], ARGV[4])
+return 1
+"""
+
+# KEYS: ready, delayed, running of each job the worker runs
+# ARGV: now, lease, then the priority of each job
+# Retries lapsed leases and due retries, then leases the best run of a job
+# that is not already running; returns {run_id, job index} or nil
+POP_SCRIPT = """
+local now, lease = tonumber(ARGV[1]), tonumber(ARGV[2])
+local best, best_score, best_job
+
+for job = 0, #KEYS / 3 - 1 do
+    local ready, delayed, running = KEYS[3 * job + 1], KEYS[3 * job + 2], KEYS[3 * job + 3]
+    local weight = -tonumber(ARGV[3 + job]) * """ + str(PRIORITY_WEIGHT) + """
+
+    for _, run_id in ipairs(redis.call('ZRANGEBYSCORE', running, '-inf', now)) do
+        redis.call('ZREM', running, run_id)
+        redis.call('ZADD', delayed, now, run_id)
+    end
+    local due = redis.call('ZRANGEBYSCORE', delayed, '-inf', now, 'WITHSCORES')
+    for i = 1, #due, 2 do
+        redis.call('ZREM', delayed, due[i])
+        redis.call('ZADD', ready, weight + math.floor(tonumber(due[i + 1]) * 1000), due[i])
+    end
+
+    if redis.call('ZCARD', running) == 0 then
+        local head = redis.call('ZRANGE', ready, 0, 0, 'WITHSCORES')
+        if #head > 0 and (not best_score or tonumber(head[2]) < best_score) then
+            best, best_score, best_job = head[1], tonumber(head[2]), job
+        end
+    end
+end
+
+if not best then
+    return false
+end
+redis.call('ZREM', KEYS[3 * best_job + 1], best)
+redis.call('ZADD', KEYS[3 * best_job + 3], now + lease, best)
+return {best, best_job}
+"""
+
+
+class JobRunnerError(Exception):
+    """Raised for invalid job definitions"""
+    pass
+
+
+class Job(NamedTuple):
+    """A registered periodic job"""
+    name: str
+    func: Callable[[], Any]  # Sync or async, no arguments
+    interval: Optional[int]  # Seconds between runs
+    daily_at: Optional[Tuple[int, int]]  # (hour, minute) UTC
+    priority: int
+    max_attempts: int
+    retry_delay: int
+
+    def next_due(self, after: float) -> int:
+        """First due time (unix seconds) strictly after ``after``"""
+        if self.interval:
+            return int(math.floor(after)) + self.interval
+        hour, minute = self.daily_at
+        now = datetime.fromtimestamp(after, tz=timezone.utc)
+        due = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if due.timestamp() <= after:
+            due += timedelta(days=1)
+        return int(due.timestamp())
+
+
+def ready_score(priority: int, due_at: float) -> int:
+    """Queue score of a run (lower runs first): priority, then due time"""
+    return -priority * PRIORITY_WEIGHT + int(due_at * 1000)
+
+
+class JobRunner:
+    """
+    Distributed periodic job scheduler and worker pool
+
+    Every process registers the jobs it can run and calls ``start``; the
+    processes share the schedule and queues in Redis.
+    """
+
+    def __init__(self, redis_client: redis.Redis, lease_seconds: int = LEASE_SECONDS):
+        """
+        Initialize the runner
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            lease_seconds: Seconds a run stays leased without a heartbeat
+        """
+        self.redis_client = redis_client
+        self.lease_seconds = lease_seconds
+        self.jobs: Dict[str, Job] = {}
+        self.consumer = f"{socket.gethostname()}-{uuid4().hex[:8]}"
+
+        self._enqueue = redis_client.register_script(ENQUEUE_SCRIPT)
+        self._pop = redis_client.register_script(POP_SCRIPT)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: Optional[int] = None,
+        daily_at: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: int = DEFAULT_RETRY_DELAY
+    ) -> Job:
+        """
+        Register a periodic job (replacing one of the same name)
+
+        The first run is due one interval from now (or at the next daily
+        time); a schedule already in Redis is kept unless it is later.
+
+        Args:
+            name: Unique job name
+            func: Function (or coroutine function) run without arguments
+            interval: Seconds between runs
+            daily_at: Daily run time as "HH:MM" UTC (instead of interval)
+            priority: Higher priorities run first when workers are busy
+            max_attempts: Runs of a failing job before it is given up
+            retry_delay: Seconds before the first retry (doubles each time)
+
+        Returns:
+            Job
+
+        Raises:
+            JobRunnerError: If the schedule is invalid
+        """
+        if (interval is None) == (daily_at is None):
+            raise JobRunnerError(f"Job {name} needs either an interval or a daily time")
+        if interval is not None and interval <= 0:
+            raise JobRunnerError(f"Job {name} interval must be positive")
+
+        run_at = None
+        if daily_at is not None:
+            try:
+                hour, minute = (int(part) for part in daily_at.split(":"))
+            except ValueError:
+                hour, minute = -1, -1
+            if not (0 <= hour < 24 and 0 <= minute < 60):
+                raise JobRunnerError(f"Job {name} daily time must be HH:MM, got {daily_at!r}")
+            run_at = (hour, minute)
+
+        job = Job(
+            name=name,
+            func=func,
+            interval=int(interval) if interval is not None else None,
+            daily_at=run_at,
+            priority=priority,
+            max_attempts=max(1, max_attempts),
+            retry_delay=retry_delay
+        )
+        self.jobs[name] = job
+
+        try:
+            self.redis_client.zadd(SCHEDULE_KEY, {name: job.next_due(time.time())}, lt=True)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to schedule job {name} (will retry on the next tick): {e}")
+
+        logger.info(f"Registered job {name} (priority {priority})")
+        return job
+
+    def trigger(self, name: str) -> bool:
+        """
+        Run a registered job as soon as a worker is free
+
+        Args:
+            name: Job name
+
+        Returns:
+            False if the job already has a run waiting
+
+        Raises:
+            JobRunnerError: If the job is not registered
+        """
+        job = self.jobs.get(name)
+        if job is None:
+            raise JobRunnerError(f"Unknown job: {name}")
+        return self._enqueue_run(job, expected_due=None, next_due=None)
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def start(self, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Start the scheduler tick and ``workers`` worker threads (non-blocking)
+
+        Args:
+            workers: Worker threads in this process
+        """
+        if self._threads:
+            logger.warning("Job runner already started")
+            return
+
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._tick_loop, name="job-scheduler", daemon=True)]
+        self._threads += [
+            threading.Thread(target=self._work_loop, name=f"job-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        logger.info(f"Job runner {self.consumer} started with {workers} workers for {len(self.jobs)} jobs")
+
+    def run_forever(self, stop_event: threading.Event, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Start the runner and block until ``stop_event`` is set
+
+        Args:
+            stop_event: Set to shut down (running jobs are finished)
+            workers: Worker threads in this process
+        """
+        self.start(workers)
+        stop_event.wait()
+        self.shutdown(wait=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop scheduling and working; running jobs finish first if ``wait``
+
+        Args:
+            wait: Wait for running jobs to complete
+        """
+        self._stop.set()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+        logger.info(f"Job runner {self.consumer} stopped")
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """
+        Enqueue a run of every registered job that is due
+
+        Args:
+            now: Unix time (defaults to now)
+
+        Returns:
+            Number of runs this process enqueued
+        """
+        now = time.time() if now is None else now
+        due = self.redis_client.zrangebyscore(SCHEDULE_KEY, "-inf", now, withscores=True)
+
+        enqueued = 0
+        for name, due_at in due:
+            job = self.jobs.get(name)
+            if job is None:
+                continue  # Registered by other processes only
+            next_due = job.next_due(max(now, due_at))
+            if self._enqueue_run(job, expected_due=int(due_at), next_due=next_due, now=now):
+                enqueued += 1
+
+        for name, job in self.jobs.items():
+            if self.redis_client.zscore(SCHEDULE_KEY, name) is None:
+                self.redis_client.zadd(SCHEDULE_KEY, {name: job.next_due(now)}, nx=True)  # Redis lost it
+            background_job_queue_depth.labels(job_name=name).set(
+                self.redis_client.zcard(READY_KEY_PREFIX + name)
+                + self.redis_client.zcard(DELAYED_KEY_PREFIX + name)
+            )
+        return enqueued
+
+    def run_next(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        Pop and run the best waiting run of a registered job
+
+        Args:
+            now: Unix time (defaults to now)
+
+        Returns:
+            Run status (succeeded, retrying or failed), or None if no run
+            was waiting
+        """
+        if not self.jobs:
+            return None
+        names = list(self.jobs)
+        keys = []
+        for name in names:
+            keys += [READY_KEY_PREFIX + name, DELAYED_KEY_PREFIX + name, RUNNING_KEY_PREFIX + name]
+
+        now = time.time() if now is None else now
+        popped = self._pop(
+            keys=keys,
+            args=[now, self.lease_seconds] + [self.jobs[name].priority for name in names]
+        )
+        if not popped:
+            return None
+
+        run_id, job = popped[0], self.jobs[names[int(popped[1])]]
+        return self._execute(job, run_id)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Schedule and queue state of every registered job
+
+        Returns:
+            Dictionary mapping job names to next_run_at (ISO), queued,
+            retrying and running counts
+        """
+        result = {}
+        for name in self.jobs:
+            next_due = self.redis_client.zscore(SCHEDULE_KEY, name)
+            result[name] = {
+                "next_run_at": (
+                    datetime.fromtimestamp(next_due, tz=timezone.utc).isoformat() if next_due else None
+                ),
+                "queued": self.redis_client.zcard(READY_KEY_PREFIX + name),
+                "retrying": self.redis_client.zcard(DELAYED_KEY_PREFIX + name),
+                "running": self.redis_client.zcard(RUNNING_KEY_PREFIX + name),
+            }
+        return result
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _enqueue_run(
+        self,
+        job: Job,
+        expected_due: Optional[int],
+        next_due: Optional[int],
+        now: Optional[float] = None
+    ) -> bool:
+        now = time.time() if now is None else now
+        run_id = uuid4().hex
+        due_at = now if expected_due is None else expected_due
+        enqueued = self._enqueue(
+            keys=[
+                SCHEDULE_KEY,
+                READY_KEY_PREFIX + job.name,
+                DELAYED_KEY_PREFIX + job.name,
+                RUNNING_KEY_PREFIX + job.name,
+                RUN_KEY_PREFIX + run_id,
+            ],
+            args=[
+                job.name,
+                "" if expected_due is None else expected_due,
+                "" if next_due is None else next_due,
+                run_id,
+                ready_score(job.priority, due_at),
+                now,
+                RUN_TTL,
+            ]
+        )
+        if enqueued:
+            logger.debug(f"Enqueued run {run_id} of job {job.name}")
+        return bool(enqueued)
+
+    def _execute(self, job: Job, run_id: str) -> str:
+        run_key = RUN_KEY_PREFIX + run_id
+        started_at = time.time()
+        attempts = int(self.redis_client.hincrby(run_key, "attempts", 1))
+        due_at = self.redis_client.hget(run_key, "due_at")
+        self.redis_client.hset(run_key, mapping={
+            "status": STATUS_RUNNING,
+            "started_at": started_at,
+            "worker": self.consumer,
+        })
+        if due_at and attempts == 1:
+            background_job_lag.labels(job_name=job.name).observe(max(0.0, started_at - float(due_at)))
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job.name, run_id, done), name=f"job-heartbeat-{job.name}", daemon=True
+        )
+        heartbeat.start()
+
+        error = None
+        try:
+            with track_background_job(job.name):
+                if asyncio.iscoroutinefunction(job.func):
+                    asyncio.run(job.func())
+                else:
+                    job.func()
+        except Exception as e:
+            error = e
+        finally:
+            done.set()
+            heartbeat.join()
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.zrem(RUNNING_KEY_PREFIX + job.name, run_id)
+        if error is None:
+            status = STATUS_SUCCEEDED
+            logger.info(f"Job {job.name} run {run_id} succeeded in {time.time() - started_at:.2f}s")
+        elif attempts < job.max_attempts:
+            status = STATUS_RETRYING
+            delay = job.retry_delay * 2 ** (attempts - 1)
+            pipe.zadd(DELAYED_KEY_PREFIX + job.name, {run_id: time.time() + delay})
+            background_job_retries_total.labels(job_name=job.name).inc()
+            logger.warning(f"Job {job.name} run {run_id} failed (attempt {attempts}), retrying in {delay}s: {error}")
+        else:
+            status = STATUS_FAILED
+            pipe.lpush(FAILED_KEY, run_id)
+            pipe.ltrim(FAILED_KEY, 0, FAILED_HISTORY - 1)
+            logger.error(f"Job {job.name} run {run_id} failed after {attempts} attempts: {error}")
+
+        pipe.hset(run_key, mapping={
+            "status": status,
+            "finished_at": time.time(),
+            "error": "" if error is None else str(error),
+        })
+        pipe.expire(run_key, RUN_TTL)
+        pipe.execute()
+        return status
+
+    def _heartbeat(self, name: str, run_id: str, done: threading.Event) -> None:
+        while not done.wait(HEARTBEAT_SECONDS):
+            try:
+                renewed = self.redis_client.zadd(
+                    RUNNING_KEY_PREFIX + name, {run_id: time.time() + self.lease_seconds}, xx=True, ch=True
+                )
+                if not renewed:
+                    logger.warning(f"Job {name} run {run_id} lost its lease")
+            except redis.RedisError as e:
+                logger.warning(f"Failed to renew lease of job {name} run {run_id}: {e}")
+
+    def _tick_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+                wait = TICK_SECONDS
+            except redis.RedisError as e:
+                logger.error(f"Job scheduler tick failed: {e}")
+                wait = REDIS_RETRY_INTERVAL
+            self._stop.wait(wait)
+
+    def _work_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.run_next() is None:
+                    self._stop.wait(POLL_SECONDS)
+            except redis.RedisError as e:
+                logger.error(f"Job worker failed to reach Redis: {e}")
+                self._stop.wait(REDIS_RETRY_INTERVAL)
+            except Exception as e:
+                logger.error(f"Job worker error: {e}")
+                self._stop.wait(POLL_SECONDS)
+
+
+# Global job runner instance
+_job_runner_instance: Optional[JobRunner] = None
+
+
+def get_job_runner() -> JobRunner:
+    """
+    Get or create the global JobRunner instance
+
+    Returns:
+        JobRunner backed by settings.REDIS_URL
+    """
+    global _job_runner_instance
+
+    if _job_runner_instance is None:
+        _job_runner_instance = JobRunner(
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+        )
+
+    return _job_runner_instance
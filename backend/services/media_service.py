@@ -6,6 +6,7 @@ integrating with Cloudflare Stream for videos and ZeroDB for metadata storage.
 """
 
 import logging
+import time
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 from datetime import datetime
@@ -13,6 +14,7 @@ from pathlib import Path
 
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBError
 from backend.services.cloudflare_stream_service import CloudflareStreamService, CloudflareStreamError
+from backend.services.signed_url_cache import SignedUrl
 from backend.models.schemas import (
     MediaAsset,
     MediaType,
@@ -181,11 +183,12 @@ class MediaService:
                 # Upload to ZeroDB Object Storage
                 logger.info(f"Uploading file to ZeroDB Object Storage: {title}")
 
+                # Streamed from disk; the file is never read into memory
                 with open(file_path, 'rb') as f:
                     object_key = f"media/{asset_data['id']}/{file_path_obj.name}"
-                    upload_result = self.db.upload_object(
-                        object_key=object_key,
-                        file_data=f.read(),
+                    upload_result = self.db.upload_object_from_file(
+                        key=object_key,
+                        file_obj=f,
                         content_type=mime_type
                     )
 
@@ -446,6 +449,38 @@ class MediaService:
         Returns:
             Signed URL for access
 
+        Raises:
+            PermissionError: If user doesn't have access
+            ValueError: If asset not found or not a video
+        """
+        access_url = await self.get_access_url(asset_id, user_id, user_role, user_tier, expiry_seconds)
+        return access_url.url
+
+    async def get_access_url(
+        self,
+        asset_id: UUID,
+        user_id: UUID,
+        user_role: UserRole,
+        user_tier: SubscriptionTier,
+        expiry_seconds: int = 86400
+    ) -> SignedUrl:
+        """
+        Get a signed URL for media access together with its actual expiry
+
+        Signed URLs are shared between viewers of an asset and reused while
+        they have enough validity left, so the URL may expire before
+        ``expiry_seconds`` (but never after).
+
+        Args:
+            asset_id: Media asset ID
+            user_id: User requesting access
+            user_role: User's role
+            user_tier: User's subscription tier
+            expiry_seconds: Requested URL lifetime in seconds
+
+        Returns:
+            SignedUrl
+
         Raises:
             PermissionError: If user doesn't have access
             ValueError: If asset not found or not a video
@@ -458,20 +493,13 @@ class MediaService:
 
         # Only generate signed URLs for videos
         if asset["media_type"] != MediaType.VIDEO.value:
-            return asset.get("url", "")
+            return SignedUrl(url=asset.get("url", ""), expires_at=time.time() + expiry_seconds)
 
         if not asset.get("stream_video_id"):
             raise ValueError(f"Video ID not found for asset: {asset_id}")
 
-        # Generate signed token
-        token = self.stream.generate_signed_url(
-            video_id=asset["stream_video_id"],
-            expiry_seconds=expiry_seconds,
-            user_id=user_id
-        )
-
-        # Build signed URL
-        signed_url = f"https://customer-{self.stream.account_id}.cloudflarestream.com/{asset['stream_video_id']}/iframe?token={token}"
+        video_id = asset["stream_video_id"]
+        token = self.stream.get_playback_tokens([video_id], expiry_seconds)[video_id]
 
         # Increment view count
         asset["view_count"] = asset.get("view_count", 0) + 1
@@ -481,7 +509,48 @@ class MediaService:
             asset
         )
 
-        return signed_url
+        return SignedUrl(url=self._iframe_url(video_id, token.url), expires_at=token.expires_at)
+
+    def attach_access_urls(
+        self,
+        assets: List[Dict[str, Any]],
+        expiry_seconds: int = 86400
+    ) -> List[Dict[str, Any]]:
+        """
+        Add signed playback URLs to a page of assets the user can access
+
+        All tokens are looked up and minted in one batch rather than one
+        request per asset. View counts are not incremented.
+
+        Args:
+            assets: Assets already filtered by access control
+            expiry_seconds: Requested URL lifetime in seconds
+
+        Returns:
+            The same assets, videos with ``access_url`` and ``access_url_expires_in`` set
+        """
+        video_ids = [
+            asset["stream_video_id"] for asset in assets
+            if asset.get("media_type") == MediaType.VIDEO.value
+            and asset.get("stream_video_id")
+            and asset.get("status") == MediaAssetStatus.READY.value
+        ]
+        if not video_ids:
+            return assets
+
+        tokens = self.stream.get_playback_tokens(video_ids, expiry_seconds)
+
+        for asset in assets:
+            token = tokens.get(asset.get("stream_video_id"))
+            if token is not None and asset.get("media_type") == MediaType.VIDEO.value:
+                asset["access_url"] = self._iframe_url(asset["stream_video_id"], token.url)
+                asset["access_url_expires_in"] = token.expires_in
+
+        return assets
+
+    def _iframe_url(self, video_id: str, token: str) -> str:
+        """Build the signed iframe player URL of a video"""
+        return f"https://customer-{self.stream.account_id}.cloudflarestream.com/{video_id}/iframe?token={token}"
 
     async def upload_captions(
         self,
@@ -8,18 +8,28 @@ This service implements daily sync between ZeroDB members and BeeHiiv lists:
 - Detects and reports discrepancies
 - Logs all sync operations
 
-Scheduled to run daily at 3 AM via APScheduler
+Only members whose BeeHiiv lists differ from what they should be cost a
+request: the desired lists are diffed against a cached BeeHiiv snapshot and
+applied concurrently within the shared BeeHiiv rate limit by
+BeeHiivSyncEngine, which also resumes an interrupted sync.
+
+Scheduled to run daily at 3 AM UTC on the shared Redis-backed JobRunner
 """
 
 import logging
-import asyncio
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from backend.config import settings
 from backend.services.zerodb_service import ZeroDBClient
-from backend.services.newsletter_service import get_newsletter_service
+from backend.services.job_runner import JobRunner, get_job_runner, PRIORITY_NORMAL
+from backend.services.newsletter_service import BEEHIIV_LISTS
+from backend.services.beehiiv_service import BeeHiivService, get_beehiiv_rate_limiter
+from backend.services.beehiiv_sync_engine import (
+    ACTION_SUBSCRIBE,
+    BeeHiivSyncEngine,
+    DesiredSubscriber,
+    SyncChange,
+)
 from backend.models.schemas import (
     UserRole,
     SubscriptionStatus,
@@ -29,6 +39,12 @@ from backend.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+SYNC_NAME = "newsletter_members"
+JOB_NAME = "newsletter_sync_job"
+
+# Lists owned by the member sync; other lists (e.g. general) are never changed
+MANAGED_LISTS = {BEEHIIV_LISTS["members_only"], BEEHIIV_LISTS["instructors"]}
+
 
 class NewsletterSyncJobError(Exception):
     """Base exception for newsletter sync job errors"""
@@ -42,16 +58,27 @@ class NewsletterSyncJob:
     Ensures consistency between ZeroDB member database and BeeHiiv newsletter lists
     """
 
-    def __init__(self, zerodb_client: Optional[ZeroDBClient] = None):
+    def __init__(
+        self,
+        zerodb_client: Optional[ZeroDBClient] = None,
+        sync_engine: Optional[BeeHiivSyncEngine] = None
+    ):
         """
         Initialize Newsletter Sync Job
 
         Args:
             zerodb_client: Optional ZeroDB client instance
+            sync_engine: Optional BeeHiiv sync engine
         """
         self.db = zerodb_client or ZeroDBClient()
-        self.newsletter_service = get_newsletter_service()
-        self.scheduler = None
+        self.sync_engine = sync_engine or BeeHiivSyncEngine(
+            BeeHiivService(
+                api_key=settings.BEEHIIV_API_KEY,
+                publication_id=settings.BEEHIIV_PUBLICATION_ID,
+                rate_limiter=get_beehiiv_rate_limiter()
+            )
+        )
+        self.runner: Optional[JobRunner] = None
         logger.info("NewsletterSyncJob initialized")
 
     async def run_sync(self) -> Dict[str, Any]:
@@ -71,8 +98,10 @@ class NewsletterSyncJob:
             "sync_started_at": sync_start.isoformat(),
             "members_processed": 0,
             "members_synced": 0,
+            "members_unchanged": 0,
             "instructors_synced": 0,
             "canceled_members_removed": 0,
+            "resumed": False,
             "errors": [],
             "discrepancies": [],
             "sync_duration_seconds": 0
@@ -83,23 +112,26 @@ class NewsletterSyncJob:
             active_members = self._get_active_members()
             logger.info(f"Found {len(active_members)} active members to sync")
 
-            # 2. Sync each active member
-            for member in active_members:
-                results["members_processed"] += 1
+            results["members_processed"] = len(active_members)
 
-                try:
-                    await self._sync_member(member, results)
-                except Exception as e:
-                    logger.error(f"Error syncing member {member.get('id')}: {e}")
-                    results["errors"].append({
-                        "member_id": member.get("id"),
-                        "email": member.get("email"),
-                        "error": str(e)
-                    })
+            # 2. Work out the lists every active and canceled member should be on
+            desired = self._build_desired_lists(active_members)
+            canceled = self._get_canceled_member_emails(set(desired))
+            for email, user_id in canceled.items():
+                desired[email] = DesiredSubscriber(lists=set(), ref=user_id)
 
-            # 3. Remove canceled members from member lists
-            canceled_result = await self._remove_canceled_members(results)
-            results["canceled_members_removed"] = canceled_result
+            # 3. Send only the differences to BeeHiiv
+            members_by_email = {
+                member["email"].lower().strip(): member
+                for member in active_members if member.get("email")
+            }
+            sync_result = await self.sync_engine.sync(
+                SYNC_NAME,
+                desired,
+                MANAGED_LISTS,
+                prepare=lambda changes: self._add_profile_names(changes, members_by_email)
+            )
+            self._apply_sync_result(sync_result, canceled, results)
 
             # 4. Calculate duration
             sync_end = datetime.utcnow()
@@ -138,91 +170,168 @@ class NewsletterSyncJob:
             results["error"] = str(e)
             raise NewsletterSyncJobError(f"Newsletter sync failed: {str(e)}")
 
-    async def _sync_member(
+    def _build_desired_lists(
         self,
-        member: Dict[str, Any],
-        results: Dict[str, Any]
-    ) -> None:
+        active_members: List[Dict[str, Any]]
+    ) -> Dict[str, DesiredSubscriber]:
         """
-        Sync individual member to newsletter lists
+        Work out the member lists each active member should be on
+
+        Active members belong on Members Only, lifetime (instructor tier)
+        members also on Instructors, minus any list the member unsubscribed from.
 
         Args:
-            member: Member data with user and subscription info
-            results: Results dict to update
-        """
-        user_id = str(member.get("user_id"))
-        email = member.get("email")
-        tier = member.get("tier", "basic")
+            active_members: Members from _get_active_members
 
-        try:
-            # Auto-subscribe member
-            sync_result = await self.newsletter_service.auto_subscribe_member(
-                user_id=user_id,
-                tier=tier
+        Returns:
+            Email -> desired lists
+        """
+        unsubscribed = self._get_unsubscribed_lists()
+        desired = {}
+
+        for member in active_members:
+            email = (member.get("email") or "").lower().strip()
+            if not email:
+                continue
+
+            user_id = str(member.get("user_id"))
+            lists = {BEEHIIV_LISTS["members_only"]}
+            if member.get("tier") in ["lifetime", SubscriptionTier.LIFETIME]:
+                lists.add(BEEHIIV_LISTS["instructors"])
+
+            desired[email] = DesiredSubscriber(
+                lists=lists - unsubscribed.get(user_id, set()),
+                ref=user_id
             )
 
-            # Update results
-            if sync_result.get("subscribed_lists"):
-                results["members_synced"] += 1
-
-                if "instructors" in sync_result.get("subscribed_lists", []):
-                    results["instructors_synced"] += 1
+        return desired
 
-            # Log skipped members
-            if sync_result.get("skipped_lists"):
-                logger.debug(
-                    f"Member {user_id} skipped lists: {sync_result['skipped_lists']}"
-                )
+    def _get_unsubscribed_lists(self) -> Dict[str, set]:
+        """
+        Load every member's manual list unsubscribes in one query
 
+        Returns:
+            User ID -> set of list names the user unsubscribed from
+        """
+        try:
+            result = self.db.query_documents(
+                "user_newsletter_preferences",
+                filters={},
+                limit=10000
+            )
         except Exception as e:
-            logger.error(f"Error syncing member {user_id}: {e}")
-            raise
+            logger.warning(f"Error loading newsletter preferences: {e}")
+            return {}
 
-    async def _remove_canceled_members(
-        self,
-        results: Dict[str, Any]
-    ) -> int:
+        return {
+            str(pref.get("user_id")): set(pref.get("unsubscribed_lists", []))
+            for pref in result.get("documents", [])
+            if pref.get("unsubscribed_lists")
+        }
+
+    def _get_canceled_member_emails(self, active_emails: set) -> Dict[str, str]:
         """
-        Remove canceled members from member lists
+        Get emails of canceled members that should come off the member lists
+
+        Members who canceled one subscription but still have an active one
+        are left out.
 
         Args:
-            results: Results dict to update
+            active_emails: Emails of active members
 
         Returns:
-            Number of canceled members removed
+            Email -> user ID
         """
         try:
-            # Get all canceled subscriptions
             canceled_subs = self.db.query_documents(
                 "subscriptions",
                 filters={"status": SubscriptionStatus.CANCELED},
                 limit=1000
             )
+        except Exception as e:
+            logger.error(f"Error getting canceled members: {e}")
+            return {}
 
-            canceled_count = 0
-            canceled_docs = canceled_subs.get("documents", [])
+        canceled = {}
+        for sub in canceled_subs.get("documents", []):
+            user_id = str(sub.get("user_id"))
+            try:
+                user = self.db.get_document("users", user_id).get("data", {})
+            except Exception as e:
+                logger.warning(f"Error getting user data for {user_id}: {e}")
+                continue
 
-            for sub in canceled_docs:
-                user_id = str(sub.get("user_id"))
+            email = (user.get("email") or "").lower().strip()
+            if email and email not in active_emails:
+                canceled[email] = user_id
 
-                try:
-                    # Remove from member lists
-                    await self.newsletter_service.handle_subscription_canceled(user_id)
-                    canceled_count += 1
+        return canceled
+
+    def _add_profile_names(
+        self,
+        changes: List[SyncChange],
+        members_by_email: Dict[str, Dict[str, Any]]
+    ) -> List[SyncChange]:
+        """
+        Add first and last names to members about to be created in BeeHiiv
+
+        Profiles are only loaded for new subscribers, not for every member.
 
+        Args:
+            changes: Planned changes
+            members_by_email: Active members by email
+
+        Returns:
+            Changes with names filled in
+        """
+        prepared = []
+        for change in changes:
+            member = members_by_email.get(change.email)
+            if change.action == ACTION_SUBSCRIBE and member and member.get("profile_id"):
+                try:
+                    profile = self.db.get_document("profiles", str(member["profile_id"])).get("data", {})
+                    fields = {
+                        key: profile[key] for key in ("first_name", "last_name") if profile.get(key)
+                    }
+                    change = change._replace(fields={**(change.fields or {}), **fields})
                 except Exception as e:
-                    logger.error(f"Error removing canceled member {user_id}: {e}")
-                    results["errors"].append({
-                        "user_id": user_id,
-                        "action": "remove_canceled",
-                        "error": str(e)
-                    })
+                    logger.debug(f"No profile for {change.email}: {e}")
+            prepared.append(change)
+        return prepared
 
-            return canceled_count
+    def _apply_sync_result(
+        self,
+        sync_result,
+        canceled: Dict[str, str],
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Fold the engine's SyncResult into the job results
 
-        except Exception as e:
-            logger.error(f"Error removing canceled members: {e}")
-            return 0
+        Args:
+            sync_result: SyncResult from BeeHiivSyncEngine.sync
+            canceled: Canceled member emails
+            results: Results dict to update
+        """
+        results["resumed"] = sync_result.resumed
+        results["members_unchanged"] = sync_result.unchanged
+
+        for change in sync_result.applied:
+            if change.email in canceled:
+                results["canceled_members_removed"] += 1
+                continue
+
+            results["members_synced"] += 1
+            if BEEHIIV_LISTS["instructors"] in change.lists:
+                results["instructors_synced"] += 1
+
+        for change, error in sync_result.failed:
+            results["errors"].append({
+                "member_id": change.ref,
+                "email": change.email,
+                "action": "remove_canceled" if change.email in canceled else change.action,
+                "error": error
+            })
 
     def _get_active_members(self) -> List[Dict[str, Any]]:
         """
@@ -260,6 +369,7 @@ class NewsletterSyncJob:
                     member_data = {
                         "user_id": user_id,
                         "email": user.get("email"),
+                        "profile_id": user.get("profile_id"),
                         "role": user.get("role"),
                         "tier": sub.get("tier"),
                         "subscription_id": sub.get("id"),
@@ -293,6 +403,8 @@ class NewsletterSyncJob:
         logger.info(f"Duration: {results.get('sync_duration_seconds', 0):.2f}s")
         logger.info(f"Members Processed: {results.get('members_processed', 0)}")
         logger.info(f"Members Synced: {results.get('members_synced', 0)}")
+        logger.info(f"Members Unchanged: {results.get('members_unchanged', 0)}")
+        logger.info(f"Resumed: {results.get('resumed', False)}")
         logger.info(f"Instructors Synced: {results.get('instructors_synced', 0)}")
         logger.info(f"Canceled Removed: {results.get('canceled_members_removed', 0)}")
         logger.info(f"Errors: {len(results.get('errors', []))}")
@@ -351,43 +463,45 @@ class NewsletterSyncJob:
         except Exception as e:
             logger.error(f"Failed to create audit log: {e}")
 
-    def start_scheduler(self, run_immediately: bool = False):
+    def register_jobs(self, runner: JobRunner) -> None:
+        """
+        Register the daily sync (3 AM UTC) on a job runner
+
+        Args:
+            runner: Job runner
+        """
+        runner.register(JOB_NAME, self.run_sync, daily_at="03:00", priority=PRIORITY_NORMAL)
+
+    def start_scheduler(self, run_immediately: bool = False, runner: Optional[JobRunner] = None):
         """
         Start the sync job scheduler
 
-        Schedules job to run daily at 3 AM
+        Registers the daily 3 AM sync and starts the job runner in this
+        process
 
         Args:
             run_immediately: Whether to run sync immediately on start
+            runner: Job runner (defaults to the global runner)
         """
-        if self.scheduler is not None:
+        if self.runner is not None:
             logger.warning("Scheduler already started")
             return
 
-        self.scheduler = AsyncIOScheduler()
-
-        # Schedule daily sync at 3 AM
-        self.scheduler.add_job(
-            self.run_sync,
-            CronTrigger(hour=3, minute=0),
-            id="newsletter_sync_job",
-            name="Daily Newsletter Sync",
-            replace_existing=True
-        )
-
-        self.scheduler.start()
+        self.runner = runner or get_job_runner()
+        self.register_jobs(self.runner)
+        self.runner.start()
         logger.info("Newsletter sync scheduler started (runs daily at 3 AM)")
 
         # Run immediately if requested
         if run_immediately:
             logger.info("Running newsletter sync immediately")
-            asyncio.create_task(self.run_sync())
+            self.runner.trigger(JOB_NAME)
 
     def stop_scheduler(self):
         """Stop the sync job scheduler"""
-        if self.scheduler is not None:
-            self.scheduler.shutdown(wait=False)
-            self.scheduler = None
+        if self.runner is not None:
+            self.runner.shutdown(wait=False)
+            self.runner = None
             logger.info("Newsletter sync scheduler stopped")
 
     async def get_last_sync_status(self) -> Optional[Dict[str, Any]]:
@@ -4,7 +4,7 @@ Query Search Service for WWMAA Backend
 Implements comprehensive search functionality with 11-step query processing pipeline:
 1. Normalize query (lowercase, trim)
 2. Check rate limit (IP-based)
-3. Check cache (5-minute TTL in Redis)
+3. Check cache (5-minute TTL in Redis, single-flight on miss)
 4. Generate query embedding (OpenAI)
 5. ZeroDB vector search (top 10 results)
 6. Send context to AI Registry
@@ -32,7 +32,6 @@ Dependencies:
 
 import logging
 import hashlib
-import json
 import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -43,6 +42,7 @@ from backend.services.embedding_service import get_embedding_service, EmbeddingE
 from backend.services.vector_search_service import get_vector_search_service, VectorSearchError
 from backend.services.ai_registry_service import get_ai_registry_service, AIRegistryError
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
+from backend.services.instrumented_cache_service import InstrumentedCacheService
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -50,6 +50,9 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+# Cache namespace for search results; bumped when indexed content changes
+SEARCH_CACHE_NAMESPACE = "search"
+
 # OpenTelemetry imports (gracefully handle if not available)
 try:
     from backend.observability.tracing_utils import with_span, add_span_attributes, set_span_error, add_user_context
@@ -94,13 +97,16 @@ class QuerySearchService:
                 retry_on_timeout=True
             )
             self.redis_client.ping()
+            self.cache = InstrumentedCacheService(client=self.redis_client)
             logger.info("QuerySearchService initialized with Redis caching")
         except Exception as e:
             logger.warning(f"Redis unavailable, search caching disabled: {e}")
             self.redis_client = None
+            self.cache = None
 
         # Configuration
         self.cache_ttl = 300  # 5 minutes
+        self.cache_stale_ttl = 60  # Serve stale answers up to 1 minute while refreshing
         self.top_k_results = 10
         self.timeout_seconds = 10
 
@@ -156,168 +162,52 @@ class QuerySearchService:
             logger.info("[Step 2/11] Rate limit check (handled by middleware)")
             step_2_time = time.time()
 
-            # Step 3: Check cache
-            if not bypass_cache:
+            # Step 3: Check cache (steps 4-9 run only on a miss, once per key
+            # across concurrent requests; stale results are served while a
+            # single background refresh recomputes them)
+            if not bypass_cache and self.cache:
                 logger.info("[Step 3/11] Checking cache")
+                computed = False
+
+                def compute() -> Dict[str, Any]:
+                    nonlocal computed
+                    computed = True
+                    logger.debug("Cache miss - proceeding with search")
+                    result = self._execute_search(query, normalized_query, pipeline_start)
+                    logger.info("[Step 9/11] Caching result")
+                    return result
+
+                cache_key = self.cache.versioned_key(
+                    SEARCH_CACHE_NAMESPACE, self._generate_cache_key(normalized_query)
+                )
                 if _tracing_available:
                     with with_span("search.cache_check", attributes={"step": 3}) as span:
-                        cached_result = self._get_cached_result(normalized_query)
-                        add_span_attributes(**{"cache_hit": cached_result is not None})
-                else:
-                    cached_result = self._get_cached_result(normalized_query)
-
-                if cached_result:
-                    logger.info("Cache hit - returning cached result")
-                    cached_result["cached"] = True
-                    cached_result["latency_ms"] = int((time.time() - pipeline_start) * 1000)
-                    return cached_result
-                logger.debug("Cache miss - proceeding with search")
-            else:
-                logger.info("[Step 3/11] Bypassing cache")
-            step_3_time = time.time()
-
-            # Step 4: Generate query embedding
-            logger.info("[Step 4/11] Generating query embedding")
-            try:
-                if _tracing_available:
-                    with with_span("search.generate_embedding", attributes={"step": 4, "query": normalized_query}) as span:
-                        query_embedding = self.embedding_service.generate_embedding(
-                            text=normalized_query,
-                            use_cache=True
+                        response = self.cache.get_or_compute(
+                            cache_key,
+                            compute,
+                            ttl=self.cache_ttl,
+                            stale_ttl=self.cache_stale_ttl
                         )
-                        add_span_attributes(**{
-                            "embedding_dimensions": len(query_embedding),
-                            "model": "text-embedding-3-small"
-                        })
+                        add_span_attributes(**{"cache_hit": not computed})
                 else:
-                    query_embedding = self.embedding_service.generate_embedding(
-                        text=normalized_query,
-                        use_cache=True
+                    response = self.cache.get_or_compute(
+                        cache_key,
+                        compute,
+                        ttl=self.cache_ttl,
+                        stale_ttl=self.cache_stale_ttl
                     )
-                logger.info(f"Query embedding generated (dimension: {len(query_embedding)})")
-            except EmbeddingError as e:
-                logger.error(f"Embedding generation failed: {e}")
-                raise QuerySearchError(f"Failed to generate query embedding: {e}")
-            step_4_time = time.time()
-            logger.debug(f"Step 4 completed in {int((step_4_time - step_3_time) * 1000)}ms")
-
-            # Step 5: ZeroDB vector search
-            logger.info(f"[Step 5/11] Performing vector search (top_k={self.top_k_results})")
-            try:
-                if _tracing_available:
-                    with with_span("search.vector_search", attributes={
-                        "step": 5,
-                        "top_k": self.top_k_results,
-                        "embedding_dimension": len(query_embedding)
-                    }) as span:
-                        search_results = self.vector_search_service.search_martial_arts_content(
-                            query_vector=query_embedding,
-                            top_k=self.top_k_results,
-                            content_types=None  # Search all types
-                        )
-                        add_span_attributes(**{"result_count": len(search_results)})
-                else:
-                    search_results = self.vector_search_service.search_martial_arts_content(
-                        query_vector=query_embedding,
-                        top_k=self.top_k_results,
-                        content_types=None  # Search all types
-                    )
-                logger.info(f"Vector search returned {len(search_results)} results")
-            except VectorSearchError as e:
-                logger.error(f"Vector search failed: {e}")
-                raise QuerySearchError(f"Vector search failed: {e}")
-            step_5_time = time.time()
-            logger.debug(f"Step 5 completed in {int((step_5_time - step_4_time) * 1000)}ms")
-
-            # Step 6 & 7: Send context to AI Registry and get LLM answer
-            logger.info("[Step 6-7/11] Generating AI answer with context")
-            try:
-                if _tracing_available:
-                    with with_span("search.generate_answer", attributes={
-                        "step": 6,
-                        "model": "gpt-4o-mini",
-                        "context_count": len(search_results)
-                    }) as span:
-                        ai_response = self.ai_registry_service.generate_answer(
-                            query=query,  # Use original query, not normalized
-                            context=search_results,
-                            model="gpt-4o-mini",
-                            temperature=0.7,
-                            max_tokens=1000
-                        )
-                        answer = ai_response["answer"]
-                        add_span_attributes(**{
-                            "tokens_used": ai_response.get('tokens_used', 0),
-                            "answer_length": len(answer)
-                        })
-                else:
-                    ai_response = self.ai_registry_service.generate_answer(
-                        query=query,  # Use original query, not normalized
-                        context=search_results,
-                        model="gpt-4o-mini",
-                        temperature=0.7,
-                        max_tokens=1000
-                    )
-                    answer = ai_response["answer"]
-                logger.info(f"AI answer generated (tokens: {ai_response.get('tokens_used', 0)})")
-            except AIRegistryError as e:
-                logger.error(f"AI answer generation failed: {e}")
-                # Fall back to a basic response if AI fails
-                answer = self._generate_fallback_answer(search_results)
-                logger.warning("Using fallback answer due to AI error")
-            step_7_time = time.time()
-            logger.debug(f"Steps 6-7 completed in {int((step_7_time - step_5_time) * 1000)}ms")
-
-            # Step 8: Attach relevant media
-            logger.info("[Step 8/11] Attaching relevant media")
-            if _tracing_available:
-                with with_span("search.attach_media", attributes={"step": 8}) as span:
-                    media = self._attach_media(search_results)
-                    add_span_attributes(**{
-                        "videos_count": len(media.get('videos', [])),
-                        "images_count": len(media.get('images', []))
-                    })
-            else:
-                media = self._attach_media(search_results)
-            logger.info(
-                f"Attached {len(media.get('videos', []))} videos, "
-                f"{len(media.get('images', []))} images"
-            )
-            step_8_time = time.time()
-            logger.debug(f"Step 8 completed in {int((step_8_time - step_7_time) * 1000)}ms")
-
-            # Generate sources from search results
-            sources = self._format_sources(search_results)
-
-            # Generate related queries (non-blocking, use empty list on error)
-            try:
-                related_queries = self.ai_registry_service.generate_related_queries(
-                    query=query,
-                    count=3
-                )
-            except Exception as e:
-                logger.warning(f"Failed to generate related queries: {e}")
-                related_queries = []
-
-            # Build response
-            response = {
-                "answer": answer,
-                "sources": sources,
-                "media": media,
-                "related_queries": related_queries,
-                "latency_ms": int((time.time() - pipeline_start) * 1000),
-                "cached": False
-            }
 
-            # Step 9: Cache result
-            if not bypass_cache:
-                logger.info("[Step 9/11] Caching result")
-                if _tracing_available:
-                    with with_span("search.cache_write", attributes={"step": 9}) as span:
-                        self._cache_result(normalized_query, response)
-                else:
-                    self._cache_result(normalized_query, response)
+                if not computed:
+                    logger.info("Cache hit - returning cached result")
+                    # Copy: a single-flight hit shares the leader's response object
+                    return {
+                        **response,
+                        "cached": True,
+                        "latency_ms": int((time.time() - pipeline_start) * 1000)
+                    }
             else:
+                logger.info("[Step 3/11] Bypassing cache")
+                response = self._execute_search(query, normalized_query, pipeline_start)
                 logger.info("[Step 9/11] Skipping cache (bypass enabled)")
             step_9_time = time.time()
 
@@ -382,6 +272,163 @@ class QuerySearchService:
                 except Exception as log_error:
                     logger.error(f"Failed to log error query: {log_error}")
 
+    def _execute_search(
+        self,
+        query: str,
+        normalized_query: str,
+        pipeline_start: float
+    ) -> Dict[str, Any]:
+        """
+        Run the uncached part of the pipeline (steps 4-8) and build the response.
+
+        Args:
+            query: Original user query (sent to the LLM)
+            normalized_query: Normalized query (used for embedding)
+            pipeline_start: Pipeline start timestamp (for latency_ms)
+
+        Returns:
+            Search response with answer, sources, media, related_queries, latency_ms
+
+        Raises:
+            QuerySearchError: If embedding generation or vector search fails
+        """
+        step_3_time = time.time()
+
+        # Step 4: Generate query embedding
+        logger.info("[Step 4/11] Generating query embedding")
+        try:
+            if _tracing_available:
+                with with_span("search.generate_embedding", attributes={"step": 4, "query": normalized_query}):
+                    query_embedding = self.embedding_service.generate_embedding(
+                        text=normalized_query,
+                        use_cache=True
+                    )
+                    add_span_attributes(**{
+                        "embedding_dimensions": len(query_embedding),
+                        "model": "text-embedding-3-small"
+                    })
+            else:
+                query_embedding = self.embedding_service.generate_embedding(
+                    text=normalized_query,
+                    use_cache=True
+                )
+            logger.info(f"Query embedding generated (dimension: {len(query_embedding)})")
+        except EmbeddingError as e:
+            logger.error(f"Embedding generation failed: {e}")
+            raise QuerySearchError(f"Failed to generate query embedding: {e}")
+        step_4_time = time.time()
+        logger.debug(f"Step 4 completed in {int((step_4_time - step_3_time) * 1000)}ms")
+
+        # Step 5: ZeroDB vector search
+        logger.info(f"[Step 5/11] Performing vector search (top_k={self.top_k_results})")
+        try:
+            if _tracing_available:
+                with with_span("search.vector_search", attributes={
+                    "step": 5,
+                    "top_k": self.top_k_results,
+                    "embedding_dimension": len(query_embedding)
+                }):
+                    search_results = self.vector_search_service.search_martial_arts_content(
+                        query_vector=query_embedding,
+                        top_k=self.top_k_results,
+                        content_types=None  # Search all types
+                    )
+                    add_span_attributes(**{"result_count": len(search_results)})
+            else:
+                search_results = self.vector_search_service.search_martial_arts_content(
+                    query_vector=query_embedding,
+                    top_k=self.top_k_results,
+                    content_types=None  # Search all types
+                )
+            logger.info(f"Vector search returned {len(search_results)} results")
+        except VectorSearchError as e:
+            logger.error(f"Vector search failed: {e}")
+            raise QuerySearchError(f"Vector search failed: {e}")
+        step_5_time = time.time()
+        logger.debug(f"Step 5 completed in {int((step_5_time - step_4_time) * 1000)}ms")
+
+        # Step 6 & 7: Send context to AI Registry and get LLM answer
+        logger.info("[Step 6-7/11] Generating AI answer with context")
+        try:
+            if _tracing_available:
+                with with_span("search.generate_answer", attributes={
+                    "step": 6,
+                    "model": "gpt-4o-mini",
+                    "context_count": len(search_results)
+                }):
+                    ai_response = self.ai_registry_service.generate_answer(
+                        query=query,  # Use original query, not normalized
+                        context=search_results,
+                        model="gpt-4o-mini",
+                        temperature=0.7,
+                        max_tokens=1000
+                    )
+                    answer = ai_response["answer"]
+                    add_span_attributes(**{
+                        "tokens_used": ai_response.get('tokens_used', 0),
+                        "answer_length": len(answer)
+                    })
+            else:
+                ai_response = self.ai_registry_service.generate_answer(
+                    query=query,  # Use original query, not normalized
+                    context=search_results,
+                    model="gpt-4o-mini",
+                    temperature=0.7,
+                    max_tokens=1000
+                )
+                answer = ai_response["answer"]
+            logger.info(f"AI answer generated (tokens: {ai_response.get('tokens_used', 0)})")
+        except AIRegistryError as e:
+            logger.error(f"AI answer generation failed: {e}")
+            # Fall back to a basic response if AI fails
+            answer = self._generate_fallback_answer(search_results)
+            logger.warning("Using fallback answer due to AI error")
+        step_7_time = time.time()
+        logger.debug(f"Steps 6-7 completed in {int((step_7_time - step_5_time) * 1000)}ms")
+
+        # Step 8: Attach relevant media
+        logger.info("[Step 8/11] Attaching relevant media")
+        if _tracing_available:
+            with with_span("search.attach_media", attributes={"step": 8}):
+                media = self._attach_media(search_results)
+                add_span_attributes(**{
+                    "videos_count": len(media.get('videos', [])),
+                    "images_count": len(media.get('images', []))
+                })
+        else:
+            media = self._attach_media(search_results)
+        logger.info(
+            f"Attached {len(media.get('videos', []))} videos, "
+            f"{len(media.get('images', []))} images"
+        )
+        step_8_time = time.time()
+        logger.debug(f"Step 8 completed in {int((step_8_time - step_7_time) * 1000)}ms")
+
+        # Generate sources from search results
+        sources = self._format_sources(search_results)
+
+        # Generate related queries (non-blocking, use empty list on error)
+        try:
+            related_queries = self.ai_registry_service.generate_related_queries(
+                query=query,
+                count=3
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate related queries: {e}")
+            related_queries = []
+
+        # Build response
+        response = {
+            "answer": answer,
+            "sources": sources,
+            "media": media,
+            "related_queries": related_queries,
+            "latency_ms": int((time.time() - pipeline_start) * 1000),
+            "cached": False
+        }
+
+        return response
+
     def _normalize_query(self, query: str) -> str:
         """
         Normalize query string.
@@ -408,59 +455,6 @@ class QuerySearchService:
 
         return normalized
 
-    def _get_cached_result(self, normalized_query: str) -> Optional[Dict[str, Any]]:
-        """
-        Retrieve cached search result.
-
-        Args:
-            normalized_query: Normalized query string
-
-        Returns:
-            Cached result or None if not found
-        """
-        if not self.redis_client:
-            return None
-
-        try:
-            cache_key = self._generate_cache_key(normalized_query)
-            cached_data = self.redis_client.get(cache_key)
-
-            if cached_data:
-                result = json.loads(cached_data)
-                logger.debug(f"Retrieved cached result for query: '{normalized_query[:50]}...'")
-                return result
-
-        except Exception as e:
-            logger.warning(f"Failed to retrieve cached result: {e}")
-
-        return None
-
-    def _cache_result(self, normalized_query: str, result: Dict[str, Any]):
-        """
-        Cache search result.
-
-        Args:
-            normalized_query: Normalized query string
-            result: Search result to cache
-        """
-        if not self.redis_client:
-            return
-
-        try:
-            cache_key = self._generate_cache_key(normalized_query)
-            cached_data = json.dumps(result)
-
-            self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                cached_data
-            )
-
-            logger.debug(f"Cached result for query: '{normalized_query[:50]}...'")
-
-        except Exception as e:
-            logger.warning(f"Failed to cache result: {e}")
-
     def _generate_cache_key(self, normalized_query: str) -> str:
         """
         Generate Redis cache key for query.
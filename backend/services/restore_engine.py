@@ -0,0 +1,402 @@
+"""
+Bulk Restore Engine - concurrent, resumable restore of backup documents
+
+Restores a stream of backup documents into a ZeroDB collection:
+- Documents are consumed lazily (e.g. straight from a decompressing part
+  reader) and grouped into fixed-size batches numbered in backup order
+- Each batch costs one ``$in`` lookup to find which original IDs already
+  exist, then upserts every document by its original ID, so replaying a
+  batch is idempotent
+- A bounded pool of writer threads processes batches concurrently; at most
+  ``2 * workers`` batches are held in memory at once
+- Completed batches are recorded in a JSON checkpoint file after each batch,
+  so an interrupted restore skips them when run again. Batches with failed
+  writes are not marked complete and are retried by the next run
+- Throughput and ETA are logged periodically and passed to ``on_progress``
+
+The engine only needs the ZeroDB client interface (query_documents,
+create_document, update_document), so it is shared by BackupService and
+scripts/restore_zerodb.py.
+
+Usage:
+    engine = RestoreEngine(client, checkpoint_dir="/tmp/zerodb_restores/checkpoints")
+    result = engine.restore("users", backup_id, documents, total=metadata["document_count"])
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESTORE_WORKERS = 8  # Concurrent batch writers
+DEFAULT_BATCH_SIZE = 200  # Documents per batch (and per existence lookup)
+WRITE_ATTEMPTS = 3  # Attempts per document write before it counts as an error
+RETRY_DELAY = 0.5  # Seconds before the first retry; doubles per attempt
+PROGRESS_LOG_INTERVAL = 10.0  # Seconds between progress log lines
+MAX_ERROR_DETAILS = 10
+
+
+class RestoreProgress(NamedTuple):
+    """Snapshot of a running restore"""
+    collection: str
+    processed: int  # Documents handled, including ones skipped from the checkpoint
+    total: Optional[int]
+    elapsed_seconds: float
+    documents_per_second: float  # Documents written per second in this run
+    eta_seconds: Optional[float]
+
+
+class BatchResult(NamedTuple):
+    """Outcome of writing one batch"""
+    number: int
+    size: int
+    created: int
+    updated: int
+    errors: int
+    error_details: List[str]
+    complete: bool  # False if a write failed and the batch should be retried
+
+
+class RestoreCheckpoint:
+    """
+    Completed-batch record of one restore, persisted as a JSON file
+
+    Completed batches are stored as a contiguous watermark plus the set of
+    batches completed beyond it, so the file stays small however large the
+    collection is.
+    """
+
+    def __init__(self, path: Path, batch_size: int):
+        """
+        Initialize the checkpoint, loading it from ``path`` if it exists
+
+        Args:
+            path: Checkpoint file path
+            batch_size: Batch size of a new checkpoint (an existing checkpoint
+                keeps the batch size it was created with, so batch numbers match)
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.completed_through = -1
+        self.completed: Set[int] = set()
+        self.documents = 0
+        self.created = 0
+        self.updated = 0
+        self.resumed = False
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable restore checkpoint '{self.path}': {e}")
+            else:
+                self.batch_size = data["batch_size"]
+                self.completed_through = data["completed_through"]
+                self.completed = set(data["completed"])
+                self.documents = data["documents"]
+                self.created = data["created"]
+                self.updated = data["updated"]
+                self.resumed = True
+
+    def is_done(self, number: int) -> bool:
+        """Whether batch ``number`` was completed by an earlier run"""
+        return number <= self.completed_through or number in self.completed
+
+    def mark_done(self, result: BatchResult) -> None:
+        """Record a completed batch"""
+        self.completed.add(result.number)
+        while self.completed_through + 1 in self.completed:
+            self.completed_through += 1
+            self.completed.discard(self.completed_through)
+        self.documents += result.size
+        self.created += result.created
+        self.updated += result.updated
+
+    def save(self) -> None:
+        """Write the checkpoint atomically"""
+        data = {
+            "batch_size": self.batch_size,
+            "completed_through": self.completed_through,
+            "completed": sorted(self.completed),
+            "documents": self.documents,
+            "created": self.created,
+            "updated": self.updated,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def delete(self) -> None:
+        """Remove the checkpoint file"""
+        self.path.unlink(missing_ok=True)
+
+
+def iter_batches(documents: Iterable[Dict[str, Any]], size: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """Group documents into numbered batches of ``size``"""
+    batch = []
+    number = 0
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= size:
+            yield number, batch
+            number += 1
+            batch = []
+    if batch:
+        yield number, batch
+
+
+class RestoreEngine:
+    """
+    Restores documents with concurrent, idempotent, checkpointed batch writes
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        checkpoint_dir: Path,
+        workers: int = DEFAULT_RESTORE_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        retry_delay: float = RETRY_DELAY,
+        on_progress: Optional[Callable[[RestoreProgress], None]] = None
+    ):
+        """
+        Initialize the engine
+
+        Args:
+            client: ZeroDB client
+            checkpoint_dir: Directory checkpoint files are kept in
+            workers: Number of batches written concurrently
+            batch_size: Documents per batch
+            retry_delay: Seconds before the first retry of a failed write
+            on_progress: Optional callback invoked after every batch
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.client = client
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.on_progress = on_progress
+
+    def checkpoint_path(self, collection: str, restore_id: str) -> Path:
+        """Checkpoint file of restoring ``restore_id`` into ``collection``"""
+        return self.checkpoint_dir / f"{restore_id}__{collection}.checkpoint.json"
+
+    def restore(
+        self,
+        collection: str,
+        restore_id: str,
+        documents: Iterable[Dict[str, Any]],
+        total: Optional[int] = None,
+        merge: bool = False,
+        resume: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Restore documents into a collection
+
+        Args:
+            collection: Target collection
+            restore_id: Stable ID of what is being restored (e.g. the backup ID),
+                used to find the checkpoint of an interrupted run
+            documents: Documents in backup order (consumed lazily)
+            total: Expected document count, for the ETA
+            merge: If True, merge into existing documents; if False, replace
+            resume: If False, discard any checkpoint and start over
+
+        Returns:
+            Restore result summary
+        """
+        path = self.checkpoint_path(collection, restore_id)
+        if not resume:
+            path.unlink(missing_ok=True)
+        checkpoint = RestoreCheckpoint(path, self.batch_size)
+
+        if checkpoint.resumed:
+            logger.info(
+                f"Resuming restore of '{collection}' from checkpoint: "
+                f"{checkpoint.documents:,} documents already restored"
+            )
+
+        created = updated = errors = written = 0
+        skipped = checkpoint.documents
+        error_details: List[str] = []
+        start = time.monotonic()
+        last_log = start
+
+        def progress() -> RestoreProgress:
+            elapsed = time.monotonic() - start
+            rate = written / elapsed if elapsed > 0 else 0.0
+            processed = skipped + written
+            eta = None
+            if total is not None and rate > 0:
+                eta = max(total - processed, 0) / rate
+            return RestoreProgress(collection, processed, total, elapsed, rate, eta)
+
+        def record(result: BatchResult) -> None:
+            nonlocal created, updated, errors, written, last_log
+            created += result.created
+            updated += result.updated
+            errors += result.errors
+            written += result.size
+            error_details.extend(result.error_details[:max(MAX_ERROR_DETAILS - len(error_details), 0)])
+
+            if result.complete:
+                checkpoint.mark_done(result)
+                checkpoint.save()
+
+            snapshot = progress()
+            if self.on_progress is not None:
+                self.on_progress(snapshot)
+            now = time.monotonic()
+            if now - last_log >= PROGRESS_LOG_INTERVAL:
+                last_log = now
+                logger.info(format_progress(snapshot))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            try:
+                for number, batch in iter_batches(documents, checkpoint.batch_size):
+                    if checkpoint.is_done(number):
+                        continue
+                    pending.add(executor.submit(self._write_batch, collection, number, batch, merge))
+                    if len(pending) >= self.workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future.result())
+            finally:
+                # Checkpoint batches already in flight even if reading the
+                # backup failed, so the next run does not redo them
+                for future in wait(pending).done:
+                    record(future.result())
+
+        final = progress()
+        incomplete = errors > 0
+        if incomplete:
+            logger.warning(
+                f"Restore of '{collection}' finished with {errors} errors; "
+                f"checkpoint kept at '{path}' so a re-run retries the failed batches"
+            )
+        else:
+            checkpoint.delete()
+
+        result = {
+            "status": "completed" if not incomplete else "completed_with_errors",
+            "collection": collection,
+            "document_count": final.processed,
+            "created": created,
+            "updated": updated,
+            "errors": errors,
+            "error_details": error_details,
+            "skipped": skipped,
+            "resumed": checkpoint.resumed,
+            "duration_seconds": final.elapsed_seconds,
+            "documents_per_second": final.documents_per_second,
+        }
+
+        logger.info(
+            f"Restore of '{collection}' finished: {created} created, {updated} updated, "
+            f"{errors} errors, {skipped} skipped from checkpoint "
+            f"({final.documents_per_second:,.0f} docs/s)"
+        )
+
+        return result
+
+    def _write_batch(
+        self,
+        collection: str,
+        number: int,
+        batch: List[Dict[str, Any]],
+        merge: bool
+    ) -> BatchResult:
+        """Upsert one batch of documents by their original IDs"""
+        created = updated = errors = 0
+        error_details = []
+        complete = True
+
+        ids = [doc.get("id") for doc in batch if doc.get("id")]
+        try:
+            existing = self._existing_ids(collection, ids)
+        except Exception as e:
+            message = f"Batch {number}: existence lookup failed: {e}"
+            logger.error(message)
+            return BatchResult(number, len(batch), 0, 0, len(batch), [message], False)
+
+        for doc in batch:
+            doc_id = doc.get("id")
+            if not doc_id:
+                # Permanent: retrying the batch cannot fix it
+                errors += 1
+                error_details.append(f"Batch {number}: document has no ID, skipped")
+                continue
+
+            try:
+                if doc_id in existing:
+                    self._with_retries(
+                        self.client.update_document,
+                        collection=collection,
+                        document_id=doc_id,
+                        data=doc,
+                        merge=merge
+                    )
+                    updated += 1
+                else:
+                    self._with_retries(
+                        self.client.create_document,
+                        collection=collection,
+                        data=doc,
+                        document_id=doc_id
+                    )
+                    created += 1
+            except Exception as e:
+                errors += 1
+                complete = False
+                message = f"Error restoring document (ID: {doc_id}): {e}"
+                logger.error(message)
+                error_details.append(message)
+
+        return BatchResult(number, len(batch), created, updated, errors, error_details, complete)
+
+    def _existing_ids(self, collection: str, ids: List[str]) -> Set[str]:
+        """IDs among ``ids`` that already exist in the collection"""
+        if not ids:
+            return set()
+        result = self._with_retries(
+            self.client.query_documents,
+            collection=collection,
+            filters={"id": {"$in": ids}},
+            limit=len(ids)
+        )
+        return {doc.get("id") for doc in result.get("documents", [])}
+
+    def _with_retries(self, func: Callable[..., Any], **kwargs) -> Any:
+        """Call ``func``, retrying failures with exponential backoff"""
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                return func(**kwargs)
+            except Exception:
+                if attempt == WRITE_ATTEMPTS - 1:
+                    raise
+                time.sleep(self.retry_delay * 2 ** attempt)
+
+
+def format_progress(progress: RestoreProgress) -> str:
+    """One-line progress summary with throughput and ETA"""
+    line = f"Restoring '{progress.collection}': {progress.processed:,}"
+    if progress.total:
+        line += f"/{progress.total:,} ({progress.processed / progress.total:.0%})"
+    line += f" documents, {progress.documents_per_second:,.0f} docs/s"
+    if progress.eta_seconds is not None:
+        line += f", ETA {progress.eta_seconds:,.0f}s"
+    return line
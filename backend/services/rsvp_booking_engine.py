@@ -0,0 +1,1176 @@
+"""
+RSVP Booking Engine - contention-safe seat reservations
+
+Takes RSVP bookings off the ZeroDB read-modify-write path, so a popular
+event opening for registration cannot be overbooked:
+- Each event has a small Redis state (capacity, seats taken) and a
+  per-user hash (``user_id -> status:rsvp_id``); one Lua script checks for
+  a duplicate, checks capacity, takes the seat and queues the RSVP document
+  for persistence, so concurrent bookings are serialized by Redis
+- Documents reach ZeroDB through a write-behind stream drained by
+  ``scripts/rsvp_booking_worker.py``, which also writes the event's
+  ``current_attendees`` from the counter once the batch is applied
+- The waitlist is a sorted set ordered by priority, then join time:
+  promotion pops the head and takes its seat in one script (in bulk when
+  capacity grows), and a member's position is a ZRANK
+- Paid checkouts hold a seat until the checkout expires; expired holds
+  are released lazily by every script and by the worker's periodic sweep
+- The state of an event is loaded from ZeroDB on its first booking and
+  reconciled periodically; a reconciliation is only applied when no
+  booking happened while ZeroDB was being read and every booking has been
+  persisted, so it can never undo a seat taken in Redis
+
+Methods raise RSVPBookingError when Redis is unavailable so callers can
+fall back to booking directly against ZeroDB.
+
+Usage:
+    engine = get_rsvp_booking_engine()
+    reservation = engine.reserve(event_id, user_id, rsvp_data, event=event)
+    if reservation.outcome == FULL:
+        ...
+"""
+
+import json
+import logging
+import socket
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+import redis
+
+from backend.config import settings
+from backend.observability.metrics import track_background_job
+from backend.services.event_service import event_cache_tag
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import EVENTS_CONTENT, bump_content_version
+from backend.services.zerodb_service import ZeroDBClient
+
+logger = logging.getLogger(__name__)
+
+# Per-event state
+STATE_KEY_PREFIX = "rsvp:event:"  # event_id -> {capacity, booked, seq, unflushed}
+USERS_KEY_SUFFIX = ":users"  # user_id -> "status:rsvp_id"
+WAITLIST_KEY_SUFFIX = ":waitlist"  # Sorted set of user_id by waitlist score
+HOLDS_KEY_SUFFIX = ":holds"  # Sorted set of user_id by hold expiry (unix time)
+EVENTS_KEY = "rsvp:events"  # Events with loaded state, for reconciliation
+STATE_TTL = 7 * 86400  # Seconds state outlives the last booking
+
+# Durable write stream
+STREAM_KEY = "rsvp:wb:stream"
+CONSUMER_GROUP = "rsvp-persist"
+PENDING_KEY = "rsvp:wb:pending"  # rsvp_id -> RSVP document not yet inserted
+
+# Flush worker
+FLUSH_BATCH_SIZE = 200
+FLUSH_BLOCK_MS = 1000
+CLAIM_IDLE_MS = 60000  # Reclaim entries unacknowledged for this long
+
+LOAD_PAGE_SIZE = 500
+REDIS_RETRY_INTERVAL = 10  # Seconds to bypass Redis after an error
+
+UNLIMITED = -1
+
+# Waitlist order: higher priority first, then earlier join time
+PRIORITY_WEIGHT = 10 ** 13  # Milliseconds; larger than any join timestamp
+MAX_WAITLIST_PRIORITY = 100
+MAX_BULK_PROMOTION = 500  # Waitlist entries promoted per script call
+
+# Reservation modes
+MODE_BOOK = "book"  # New RSVP, capacity checked
+MODE_FORCE = "force"  # New RSVP already paid for, capacity not checked
+MODE_PROMOTE = "promote"  # Waitlisted RSVP confirmed, capacity checked
+MODE_HOLD = "hold"  # Seat held for a checkout, capacity checked
+
+# Outcomes
+RESERVED = "reserved"
+DUPLICATE = "duplicate"
+FULL = "full"
+NOT_WAITLISTED = "not_waitlisted"
+RELEASED = "released"
+NOT_FOUND = "not_found"
+NOT_LOADED = "not_loaded"
+
+CONFIRMED_STATUS = "confirmed"
+PENDING_STATUS = "pending"  # Seat held, payment outstanding
+WAITLIST_STATUS = "waitlist"
+INACTIVE_STATUSES = ("canceled", "declined")
+
+# Every script below works on the keys
+#   KEYS: state, users, waitlist, holds, stream, pending
+# and takes the same leading arguments
+#   ARGV: now, event_id, ttl, update document for lapsed holds
+# Seats are taken by confirmed RSVPs and by holds (status pending).
+
+# Releases holds that expired by ARGV[1]; a lapsed hold on a waitlisted
+# RSVP (a paid waitlist promotion) marks that RSVP declined
+EXPIRE_HOLDS_LUA = """
+local function expire_holds()
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[4], '-inf', ARGV[1])
+    for _, user_id in ipairs(expired) do
+        redis.call('ZREM', KEYS[4], user_id)
+        local entry = redis.call('HGET', KEYS[2], user_id)
+        if entry and string.sub(entry, 1, 8) == 'pending:' then
+            redis.call('HDEL', KEYS[2], user_id)
+            if redis.call('HINCRBY', KEYS[1], 'booked', -1) < 0 then
+                redis.call('HSET', KEYS[1], 'booked', 0)
+            end
+            redis.call('HINCRBY', KEYS[1], 'seq', 1)
+            local rsvp_id = string.sub(entry, 9)
+            if rsvp_id ~= '' then
+                redis.call('HINCRBY', KEYS[1], 'unflushed', 1)
+                redis.call('XADD', KEYS[5], '*', 'op', 'update', 'event_id', ARGV[2], 'id', rsvp_id, 'data', ARGV[4])
+            end
+        end
+    end
+    return #expired
+end
+
+local function touch()
+    for i = 1, 4 do
+        redis.call('EXPIRE', KEYS[i], ARGV[3])
+    end
+end
+"""
+
+# ARGV[5..]: mode, user_id, rsvp_id, status, document, capacity ('' = unchanged),
+#            score (waitlist score, or hold expiry)
+RESERVE_SCRIPT = EXPIRE_HOLDS_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {'not_loaded', 0, ''}
+end
+if ARGV[10] ~= '' then
+    redis.call('HSET', KEYS[1], 'capacity', ARGV[10])
+end
+expire_holds()
+
+local mode, user_id, status, score = ARGV[5], ARGV[6], ARGV[8], ARGV[11]
+local booked = tonumber(redis.call('HGET', KEYS[1], 'booked') or '0')
+local capacity = tonumber(redis.call('HGET', KEYS[1], 'capacity') or '-1')
+local existing = redis.call('HGET', KEYS[2], user_id)
+local prev_status, prev_id = nil, ''
+if existing then
+    local sep = string.find(existing, ':', 1, true)
+    prev_status, prev_id = string.sub(existing, 1, sep - 1), string.sub(existing, sep + 1)
+end
+
+local rsvp_id = ARGV[7]
+local persisted = false  -- RSVP already has a document to update
+if mode == 'promote' then
+    if prev_status ~= 'waitlist' then
+        return {'not_waitlisted', booked, existing or ''}
+    end
+    rsvp_id, persisted = prev_id, true
+elseif mode == 'hold' then
+    if prev_status == 'pending' then
+        local expires = redis.call('ZSCORE', KEYS[4], user_id)
+        if not expires or tonumber(score) > tonumber(expires) then
+            redis.call('ZADD', KEYS[4], score, user_id)
+        end
+        touch()
+        return {'reserved', booked, prev_id}
+    elseif existing and prev_status ~= 'waitlist' then
+        return {'duplicate', booked, existing}
+    end
+    rsvp_id = prev_id
+elseif mode == 'force' then
+    if prev_status == 'confirmed' then
+        return {'duplicate', booked, existing}
+    end
+    if prev_id ~= '' then
+        rsvp_id, persisted = prev_id, true
+    end
+elseif existing then
+    return {'duplicate', booked, existing}
+end
+
+local takes_seat = status == 'confirmed' or status == 'pending'
+local held = prev_status == 'pending'
+if takes_seat and not held and mode ~= 'force' and capacity >= 0 and booked >= capacity then
+    return {'full', booked, existing or ''}
+end
+if takes_seat and not held then
+    booked = redis.call('HINCRBY', KEYS[1], 'booked', 1)
+end
+
+if prev_status == 'waitlist' then
+    redis.call('ZREM', KEYS[3], user_id)
+elseif held then
+    redis.call('ZREM', KEYS[4], user_id)
+end
+if status == 'waitlist' then
+    redis.call('ZADD', KEYS[3], score, user_id)
+elseif status == 'pending' then
+    redis.call('ZADD', KEYS[4], score, user_id)
+end
+
+redis.call('HSET', KEYS[2], user_id, status .. ':' .. rsvp_id)
+redis.call('HINCRBY', KEYS[1], 'seq', 1)
+
+if mode ~= 'hold' then
+    redis.call('HINCRBY', KEYS[1], 'unflushed', 1)
+    if persisted then
+        redis.call('XADD', KEYS[5], '*', 'op', 'update', 'event_id', ARGV[2], 'id', rsvp_id, 'data', ARGV[9])
+    else
+        redis.call('HSET', KEYS[6], rsvp_id, ARGV[9])
+        redis.call('XADD', KEYS[5], '*', 'op', 'create', 'event_id', ARGV[2], 'id', rsvp_id)
+    end
+end
+
+touch()
+return {'reserved', booked, rsvp_id}
+"""
+
+# ARGV[5..]: count, status ('confirmed' or 'pending'), hold expiry, update document,
+#            ignore capacity ('1' or '0'), capacity ('' = unchanged)
+# Returns user_id, rsvp_id pairs of the promoted RSVPs, in queue order, or
+# {'not_loaded'} if the event has no state
+PROMOTE_SCRIPT = EXPIRE_HOLDS_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {'not_loaded'}
+end
+if ARGV[10] ~= '' then
+    redis.call('HSET', KEYS[1], 'capacity', ARGV[10])
+end
+expire_holds()
+
+local count, status = tonumber(ARGV[5]), ARGV[6]
+local booked = tonumber(redis.call('HGET', KEYS[1], 'booked') or '0')
+local capacity = tonumber(redis.call('HGET', KEYS[1], 'capacity') or '-1')
+local promoted = {}
+
+while #promoted < 2 * count do
+    if ARGV[9] ~= '1' and capacity >= 0 and booked >= capacity then
+        break
+    end
+    local popped = redis.call('ZPOPMIN', KEYS[3])
+    if #popped == 0 then
+        break
+    end
+    local user_id = popped[1]
+    local entry = redis.call('HGET', KEYS[2], user_id)
+    if entry and string.sub(entry, 1, 9) == 'waitlist:' then
+        local rsvp_id = string.sub(entry, 10)
+        redis.call('HSET', KEYS[2], user_id, status .. ':' .. rsvp_id)
+        booked = redis.call('HINCRBY', KEYS[1], 'booked', 1)
+        redis.call('HINCRBY', KEYS[1], 'seq', 1)
+        if status == 'pending' then
+            redis.call('ZADD', KEYS[4], ARGV[7], user_id)
+        else
+            redis.call('HINCRBY', KEYS[1], 'unflushed', 1)
+            redis.call('XADD', KEYS[5], '*', 'op', 'update', 'event_id', ARGV[2], 'id', rsvp_id, 'data', ARGV[8])
+        end
+        table.insert(promoted, user_id)
+        table.insert(promoted, rsvp_id)
+    end
+end
+
+touch()
+return promoted
+"""
+
+# ARGV[5..]: user_id, rsvp_id, update document
+RELEASE_SCRIPT = EXPIRE_HOLDS_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {'not_loaded', 0}
+end
+expire_holds()
+
+local user_id = ARGV[5]
+local booked = tonumber(redis.call('HGET', KEYS[1], 'booked') or '0')
+local existing = redis.call('HGET', KEYS[2], user_id)
+if not existing then
+    return {'not_found', booked}
+end
+
+local sep = string.find(existing, ':', 1, true)
+local status = string.sub(existing, 1, sep - 1)
+if string.sub(existing, sep + 1) ~= ARGV[6] then
+    return {'not_found', booked}
+end
+
+redis.call('HDEL', KEYS[2], user_id)
+redis.call('ZREM', KEYS[3], user_id)
+redis.call('ZREM', KEYS[4], user_id)
+if (status == 'confirmed' or status == 'pending') and booked > 0 then
+    booked = redis.call('HINCRBY', KEYS[1], 'booked', -1)
+end
+redis.call('HINCRBY', KEYS[1], 'seq', 1)
+if ARGV[6] ~= '' then
+    redis.call('HINCRBY', KEYS[1], 'unflushed', 1)
+    redis.call('XADD', KEYS[5], '*', 'op', 'update', 'event_id', ARGV[2], 'id', ARGV[6], 'data', ARGV[7])
+end
+
+touch()
+return {'released', booked}
+"""
+
+# Returns the number of holds released, or -1 if the event has no state
+EXPIRE_SCRIPT = EXPIRE_HOLDS_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+return expire_holds()
+"""
+
+# Rebuilds users and waitlist from ARGV[8..] (user_id, entry, waitlist score
+# or '' triples). Holds are not in ZeroDB, so live ones are carried over.
+REBUILD_LUA = """
+local function rebuild(capacity, booked)
+    local holds = redis.call('ZRANGE', KEYS[4], 0, -1)
+    local held = {}
+    for _, user_id in ipairs(holds) do
+        held[user_id] = redis.call('HGET', KEYS[2], user_id)
+    end
+
+    redis.call('DEL', KEYS[2], KEYS[3])
+    for i = 8, #ARGV, 3 do
+        redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+        if ARGV[i + 2] ~= '' then
+            redis.call('ZADD', KEYS[3], ARGV[i + 2], ARGV[i])
+        end
+    end
+
+    for _, user_id in ipairs(holds) do
+        local entry = held[user_id]
+        local current = redis.call('HGET', KEYS[2], user_id)
+        if entry and string.sub(entry, 1, 8) == 'pending:'
+                and not (current and string.sub(current, 1, 10) == 'confirmed:') then
+            redis.call('HSET', KEYS[2], user_id, entry)
+            redis.call('ZREM', KEYS[3], user_id)
+            booked = booked + 1
+        else
+            redis.call('ZREM', KEYS[4], user_id)
+        end
+    end
+
+    redis.call('HSET', KEYS[1], 'capacity', capacity, 'booked', booked)
+    return booked
+end
+"""
+
+# ARGV[5..]: events set key, capacity, booked, then rebuild triples
+LOAD_SCRIPT = EXPIRE_HOLDS_LUA + REBUILD_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('DEL', KEYS[4])
+rebuild(ARGV[6], tonumber(ARGV[7]))
+redis.call('HSET', KEYS[1], 'seq', 0, 'unflushed', 0)
+redis.call('SADD', ARGV[5], ARGV[2])
+touch()
+return 1
+"""
+
+# ARGV[5..]: expected seq, capacity, booked, then rebuild triples
+# Returns the rebuilt seat count, or -1 if skipped
+RECONCILE_SCRIPT = EXPIRE_HOLDS_LUA + REBUILD_LUA + """
+local state = redis.call('HMGET', KEYS[1], 'seq', 'unflushed')
+if not state[1] or state[1] ~= ARGV[5] or tonumber(state[2] or '0') ~= 0 then
+    return -1
+end
+local booked = rebuild(ARGV[6], tonumber(ARGV[7]))
+touch()
+return booked
+"""
+
+# KEYS: state
+# ARGV: number of entries persisted
+# Returns the seat count, or -1 if the state has expired
+FLUSHED_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local unflushed = redis.call('HINCRBY', KEYS[1], 'unflushed', -tonumber(ARGV[1]))
+if unflushed < 0 then
+    redis.call('HSET', KEYS[1], 'unflushed', 0)
+end
+return tonumber(redis.call('HGET', KEYS[1], 'booked') or '0')
+"""
+
+
+class RSVPBookingError(Exception):
+    """Raised when the booking engine cannot reach Redis"""
+    pass
+
+
+class Reservation(NamedTuple):
+    """Outcome of a reservation attempt"""
+    outcome: str  # RESERVED, DUPLICATE, FULL or NOT_WAITLISTED
+    rsvp_id: Optional[str]  # Reserved RSVP, or the user's existing RSVP
+    status: Optional[str]  # Status of that RSVP
+    booked: int  # Seats taken (confirmed or held) after the attempt
+
+
+class Snapshot(NamedTuple):
+    """RSVP state of an event as read from ZeroDB"""
+    capacity: int
+    booked: int
+    users: Dict[str, str]  # user_id -> "status:rsvp_id"
+    waitlist: Dict[str, float]  # user_id -> waitlist score
+    current_attendees: Optional[int]
+
+    def triples(self) -> List[Any]:
+        """Users as the (user_id, entry, score) arguments of the rebuild scripts"""
+        args: List[Any] = []
+        for user_id, entry in self.users.items():
+            args.extend((user_id, entry, self.waitlist.get(user_id, "")))
+        return args
+
+
+def waitlist_score(priority: int = 0, joined_at: Optional[float] = None) -> int:
+    """
+    Sort key of a waitlist entry (lower is promoted first)
+
+    Args:
+        priority: Higher priorities are promoted first (0 to MAX_WAITLIST_PRIORITY)
+        joined_at: Unix time the member joined the waitlist (defaults to now)
+
+    Returns:
+        Score, exact as a Redis double for any priority in range
+    """
+    priority = max(0, min(int(priority or 0), MAX_WAITLIST_PRIORITY))
+    joined_ms = int((time.time() if joined_at is None else joined_at) * 1000)
+    return -priority * PRIORITY_WEIGHT + joined_ms
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)  # Stored as naive UTC
+    return parsed.timestamp()
+
+
+def _capacity(event: Dict[str, Any]) -> int:
+    max_attendees = event.get("max_attendees")
+    return UNLIMITED if max_attendees is None else int(max_attendees)
+
+
+def _document(document: Dict[str, Any]) -> Dict[str, Any]:
+    # ZeroDB wraps documents in "data" in some responses
+    return document.get("data") or document
+
+
+def _parse_entry(value: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    if not value:
+        return None, None
+    status, _, rsvp_id = value.partition(":")
+    return status, rsvp_id
+
+
+class RSVPBookingEngine:
+    """
+    Reserves event seats atomically in Redis and persists RSVPs behind
+
+    Thread-safe; one instance is shared by request handlers and workers.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        db_client: Optional[ZeroDBClient] = None
+    ):
+        """
+        Initialize the booking engine.
+
+        Args:
+            redis_client: Redis client (created from settings.REDIS_URL if omitted)
+            db_client: ZeroDB client used to load state and persist RSVPs
+        """
+        self.redis_client = redis_client or redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=2
+        )
+        self._db = db_client
+        self._reserve = self.redis_client.register_script(RESERVE_SCRIPT)
+        self._promote = self.redis_client.register_script(PROMOTE_SCRIPT)
+        self._release = self.redis_client.register_script(RELEASE_SCRIPT)
+        self._expire = self.redis_client.register_script(EXPIRE_SCRIPT)
+        self._load = self.redis_client.register_script(LOAD_SCRIPT)
+        self._reconcile = self.redis_client.register_script(RECONCILE_SCRIPT)
+        self._flushed = self.redis_client.register_script(FLUSHED_SCRIPT)
+        self._group_ready = False
+        self._redis_retry_at = 0.0
+
+    @property
+    def db(self) -> ZeroDBClient:
+        if self._db is None:
+            self._db = ZeroDBClient()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # Bookings (request path)
+    # ------------------------------------------------------------------
+
+    def reserve(
+        self,
+        event_id: str,
+        user_id: str,
+        rsvp_data: Dict[str, Any],
+        event: Optional[Dict[str, Any]] = None,
+        mode: str = MODE_BOOK,
+        priority: int = 0,
+        hold_until: Optional[float] = None
+    ) -> Reservation:
+        """
+        Reserve a seat (or a waitlist entry) for a user.
+
+        RSVPs with status ``confirmed`` take a seat; ``waitlist`` RSVPs join
+        the waitlist queue. The RSVP document is queued for persistence in
+        the same script, so a reservation is never lost once this returns
+        RESERVED.
+
+        Modes:
+        - MODE_BOOK: new RSVP, rejected as FULL when no seat is free
+        - MODE_FORCE: paid RSVP; takes over the user's hold or waitlist
+          entry (updating that RSVP) and is never rejected as FULL
+        - MODE_PROMOTE: confirms the user's waitlisted RSVP if a seat is free
+        - MODE_HOLD: holds a seat until ``hold_until`` (see ``hold``)
+
+        Args:
+            event_id: Event ID
+            user_id: User ID
+            rsvp_data: JSON-serializable RSVP document (with id and status);
+                for MODE_PROMOTE, the fields to update on the waitlisted RSVP
+            event: Event document, used to refresh the capacity (optional)
+            mode: Reservation mode
+            priority: Waitlist priority, for waitlist RSVPs
+            hold_until: Unix time a MODE_HOLD hold expires
+
+        Returns:
+            Reservation
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        status = rsvp_data.get("status", CONFIRMED_STATUS)
+        if mode == MODE_HOLD:
+            status, score = PENDING_STATUS, hold_until
+        elif status == WAITLIST_STATUS:
+            score = waitlist_score(priority)
+        else:
+            score = ""
+
+        args = [
+            mode,
+            str(user_id),
+            str(rsvp_data.get("id", "")),
+            status,
+            json.dumps(rsvp_data, default=str),
+            "" if event is None else _capacity(event),
+            score,
+        ]
+
+        result = self._run(self._reserve, event_id, args)
+        if result[0] == NOT_LOADED:
+            self.ensure_loaded(event_id, event)
+            result = self._run(self._reserve, event_id, args)
+            if result[0] == NOT_LOADED:
+                raise RSVPBookingError(f"RSVP state of event {event_id} expired while booking")
+
+        outcome, booked, entry = result[0], int(result[1]), result[2]
+        if outcome == RESERVED:
+            return Reservation(outcome, entry, status, booked)
+
+        existing_status, rsvp_id = _parse_entry(entry)
+        return Reservation(outcome, rsvp_id, existing_status, booked)
+
+    def hold(
+        self,
+        event_id: str,
+        user_id: str,
+        hold_until: float,
+        event: Optional[Dict[str, Any]] = None
+    ) -> Reservation:
+        """
+        Hold a seat for a user while they pay.
+
+        The hold counts toward capacity until ``hold_until``, then lapses on
+        its own. Holding again extends the user's hold; a waitlisted user's
+        hold takes them off the queue. The payment is turned into an RSVP
+        with ``reserve(..., mode=MODE_FORCE)``.
+
+        Args:
+            event_id: Event ID
+            user_id: User ID
+            hold_until: Unix time the hold expires
+            event: Event document, used to refresh the capacity (optional)
+
+        Returns:
+            Reservation (RESERVED, FULL or DUPLICATE)
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        return self.reserve(event_id, user_id, {}, event=event, mode=MODE_HOLD, hold_until=hold_until)
+
+    def promote_next(
+        self,
+        event_id: str,
+        count: int = 1,
+        update: Optional[Dict[str, Any]] = None,
+        hold_until: Optional[float] = None,
+        ignore_capacity: bool = False,
+        event: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Promote the head of the waitlist, taking a seat per member.
+
+        Pops and promotes in one script, so concurrent promotions never hand
+        out the same seat or skip a member. Members are confirmed (the
+        update is queued for their RSVP) or, with ``hold_until``, given a
+        held seat to pay for.
+
+        Args:
+            event_id: Event ID
+            count: Maximum members to promote (capped at MAX_BULK_PROMOTION)
+            update: Fields to update on each confirmed RSVP
+            hold_until: Unix time held seats expire (holds instead of confirming)
+            ignore_capacity: Promote even when the event is full (admin override)
+            event: Event document, used to refresh the capacity (optional)
+
+        Returns:
+            (user_id, rsvp_id) of each promoted member, in queue order
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        args = [
+            min(count, MAX_BULK_PROMOTION),
+            CONFIRMED_STATUS if hold_until is None else PENDING_STATUS,
+            hold_until or "",
+            json.dumps(update or {}, default=str),
+            "1" if ignore_capacity else "0",
+            "" if event is None else _capacity(event),
+        ]
+        result = self._run(self._promote, event_id, args)
+        if result == [NOT_LOADED]:
+            self.ensure_loaded(event_id, event)
+            result = self._run(self._promote, event_id, args)
+            if result == [NOT_LOADED]:
+                raise RSVPBookingError(f"RSVP state of event {event_id} expired while promoting")
+        return list(zip(result[::2], result[1::2]))
+
+    def release(
+        self,
+        event_id: str,
+        user_id: str,
+        rsvp_id: str,
+        update: Dict[str, Any]
+    ) -> str:
+        """
+        Give up a user's RSVP, hold or waitlist entry (and its seat).
+
+        The update (e.g. the canceled status) is queued for persistence
+        behind the RSVP's insert, so it applies even to an RSVP that has not
+        reached ZeroDB yet.
+
+        Args:
+            event_id: Event ID
+            user_id: User ID
+            rsvp_id: RSVP ID ('' for a checkout hold; a superseded RSVP of the
+                user is not released)
+            update: Fields to update on the RSVP document
+
+        Returns:
+            RELEASED, NOT_FOUND (the user holds no such RSVP; nothing queued)
+            or NOT_LOADED (the event has no state; nothing queued)
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        result = self._run(self._release, event_id, [
+            str(user_id),
+            str(rsvp_id),
+            json.dumps(update, default=str),
+        ])
+        return result[0]
+
+    def expire_holds(self, event_id: str) -> int:
+        """
+        Release the event's expired holds now.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Number of holds released (-1 if the event has no state)
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        return int(self._run(self._expire, event_id, []))
+
+    def waitlist_position(self, event_id: str, user_id: str) -> Optional[int]:
+        """
+        Get a member's 1-based waitlist position (O(log n)).
+
+        Args:
+            event_id: Event ID
+            user_id: User ID
+
+        Returns:
+            Position, or None if not on the waitlist (or Redis is unavailable)
+        """
+        try:
+            rank = self.redis_client.zrank(self._key(event_id, WAITLIST_KEY_SUFFIX), str(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read waitlist position of user {user_id} for event {event_id}: {e}")
+            return None
+        return None if rank is None else rank + 1
+
+    def lookup(self, event_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's RSVP for an event without querying ZeroDB.
+
+        Args:
+            event_id: Event ID
+            user_id: User ID
+
+        Returns:
+            Dict with has_rsvp, rsvp_id and status, or None if the event has
+            no state (or Redis is unavailable)
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.exists(self._key(event_id))
+            pipe.hget(self._key(event_id, USERS_KEY_SUFFIX), str(user_id))
+            loaded, entry = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to look up RSVP of user {user_id} for event {event_id}: {e}")
+            return None
+
+        if not loaded:
+            return None
+        status, rsvp_id = _parse_entry(entry)
+        return {"has_rsvp": entry is not None, "rsvp_id": rsvp_id, "status": status}
+
+    def availability(self, event_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the number of seats taken (confirmed or held) and capacity of an event.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            (booked, capacity) with capacity UNLIMITED if there is no limit,
+            or None if the event has no state (or Redis is unavailable)
+        """
+        try:
+            booked, capacity = self.redis_client.hmget(self._key(event_id), ["booked", "capacity"])
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read RSVP availability of event {event_id}: {e}")
+            return None
+
+        if booked is None:
+            return None
+        return int(booked), int(capacity if capacity is not None else UNLIMITED)
+
+    def get_pending(self, rsvp_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an RSVP that has not reached ZeroDB yet.
+
+        Args:
+            rsvp_id: RSVP ID
+
+        Returns:
+            RSVP document, or None if not pending (or Redis is unavailable)
+        """
+        try:
+            document = self.redis_client.hget(PENDING_KEY, str(rsvp_id))
+            return json.loads(document) if document else None
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read pending RSVP {rsvp_id}: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # State loading and reconciliation
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self, event_id: str, event: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Load an event's RSVP state from ZeroDB unless it is already loaded.
+
+        Concurrent loads are harmless: the first one to finish wins.
+
+        Args:
+            event_id: Event ID
+            event: Event document (read from ZeroDB if omitted)
+
+        Returns:
+            True if this call loaded the state
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+            ZeroDBError: If the RSVPs cannot be read
+        """
+        snapshot = self.read_snapshot(event_id, event)
+        loaded = self._run(
+            self._load,
+            event_id,
+            [EVENTS_KEY, snapshot.capacity, snapshot.booked] + snapshot.triples()
+        )
+        if loaded:
+            logger.info(
+                f"Loaded RSVP state of event {event_id}: {snapshot.booked} booked, "
+                f"{len(snapshot.waitlist)} waitlisted, capacity {snapshot.capacity}"
+            )
+        return bool(loaded)
+
+    def read_snapshot(self, event_id: str, event: Optional[Dict[str, Any]] = None) -> Snapshot:
+        """
+        Read an event's RSVP state from ZeroDB, page by page.
+
+        Args:
+            event_id: Event ID
+            event: Event document (read from ZeroDB if omitted)
+
+        Returns:
+            Snapshot
+        """
+        if event is None:
+            event = _document(self.db.get_document("events", event_id))
+
+        rsvps: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        while True:
+            result = self.db.query_documents(
+                collection="rsvps",
+                filters={"event_id": event_id},
+                limit=LOAD_PAGE_SIZE,
+                offset=offset
+            )
+            page = [_document(document) for document in result.get("documents", [])]
+            added = 0
+            for rsvp in page:
+                if rsvp.get("id") and rsvp["id"] not in rsvps:
+                    rsvps[rsvp["id"]] = rsvp
+                    added += 1
+            if len(page) < LOAD_PAGE_SIZE or not added:
+                break
+            offset += len(page)
+
+        users: Dict[str, str] = {}
+        waitlist: Dict[str, float] = {}
+        # Oldest first, so a user's latest active RSVP wins
+        for rsvp in sorted(rsvps.values(), key=lambda doc: doc.get("created_at") or ""):
+            status = rsvp.get("status")
+            if not rsvp.get("user_id") or status in INACTIVE_STATUSES:
+                continue
+            user_id = str(rsvp["user_id"])
+            users[user_id] = f"{status}:{rsvp['id']}"
+            waitlist.pop(user_id, None)
+            if status == WAITLIST_STATUS:
+                waitlist[user_id] = waitlist_score(
+                    rsvp.get("waitlist_priority", 0),
+                    _timestamp(rsvp.get("created_at")) or 0
+                )
+
+        return Snapshot(
+            capacity=_capacity(event),
+            booked=sum(1 for entry in users.values() if entry.startswith(CONFIRMED_STATUS + ":")),
+            users=users,
+            waitlist=waitlist,
+            current_attendees=event.get("current_attendees"),
+        )
+
+    def reconcile(self, event_id: str) -> bool:
+        """
+        Rebuild an event's RSVP state from ZeroDB and fix its attendee count.
+
+        Live seat holds are kept (they are not in ZeroDB). Skipped while
+        bookings are still being persisted, or when a booking happens while
+        ZeroDB is being read; the next run retries.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            True if the state was rebuilt
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        state_key = self._key(event_id)
+        try:
+            seq, unflushed = self.redis_client.hmget(state_key, ["seq", "unflushed"])
+        except redis.RedisError as e:
+            raise RSVPBookingError(f"Failed to read RSVP state of event {event_id}: {e}")
+
+        if seq is None:
+            self.redis_client.srem(EVENTS_KEY, str(event_id))  # State expired
+            return False
+        if int(unflushed or 0):
+            return False
+
+        snapshot = self.read_snapshot(event_id)
+        booked = int(self._run(
+            self._reconcile,
+            event_id,
+            [seq, snapshot.capacity, snapshot.booked] + snapshot.triples()
+        ))
+        if booked < 0:
+            return False
+
+        if snapshot.current_attendees != booked:
+            logger.warning(
+                f"Event {event_id} attendee count drifted: "
+                f"{snapshot.current_attendees} recorded, {booked} taken"
+            )
+            self._write_attendee_count(event_id, booked)
+        return True
+
+    def expire_all_holds(self) -> List[str]:
+        """
+        Release expired holds of every event with loaded state.
+
+        Returns:
+            IDs of the events that had holds released (seats to re-offer)
+
+        Raises:
+            RSVPBookingError: If Redis is unavailable
+        """
+        try:
+            event_ids = sorted(self.redis_client.smembers(EVENTS_KEY))
+        except redis.RedisError as e:
+            raise RSVPBookingError(f"Failed to list events with RSVP state: {e}")
+
+        released = [event_id for event_id in event_ids if self.expire_holds(event_id) > 0]
+        if released:
+            logger.info(f"Released expired seat holds of {len(released)} event(s)")
+        return released
+
+    def reconcile_all(self) -> Dict[str, int]:
+        """
+        Reconcile every event with loaded state.
+
+        Returns:
+            Dict with reconciled, skipped and failed counts
+        """
+        with track_background_job("rsvp_reconcile"):
+            try:
+                event_ids = sorted(self.redis_client.smembers(EVENTS_KEY))
+            except redis.RedisError as e:
+                raise RSVPBookingError(f"Failed to list events with RSVP state: {e}")
+
+            counts = {"reconciled": 0, "skipped": 0, "failed": 0}
+            for event_id in event_ids:
+                try:
+                    counts["reconciled" if self.reconcile(event_id) else "skipped"] += 1
+                except Exception as e:
+                    counts["failed"] += 1
+                    logger.error(f"Failed to reconcile RSVP state of event {event_id}: {e}")
+
+        logger.info(
+            f"Reconciled RSVP state of {counts['reconciled']}/{len(event_ids)} events "
+            f"({counts['skipped']} skipped, {counts['failed']} failed)"
+        )
+        return counts
+
+    # ------------------------------------------------------------------
+    # Flush worker
+    # ------------------------------------------------------------------
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.redis_client.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def flush(self, consumer: str, block_ms: Optional[int] = None) -> int:
+        """
+        Persist one batch of queued RSVP writes to ZeroDB.
+
+        Inserts run before updates, and entries are applied in stream order,
+        so an update never reaches ZeroDB before the RSVP it updates. Each
+        touched event then gets its ``current_attendees`` set from the seat
+        counter.
+
+        Args:
+            consumer: Consumer name, unique per worker
+            block_ms: Milliseconds to wait for new entries (None = don't block)
+
+        Returns:
+            Number of entries acknowledged
+        """
+        self._ensure_group()
+
+        _, entries, *_ = self.redis_client.xautoclaim(
+            STREAM_KEY, CONSUMER_GROUP, consumer,
+            min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=FLUSH_BATCH_SIZE
+        )
+        if not entries:
+            response = self.redis_client.xreadgroup(
+                CONSUMER_GROUP, consumer, {STREAM_KEY: ">"},
+                count=FLUSH_BATCH_SIZE, block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+        if not entries:
+            return 0
+
+        with track_background_job("rsvp_booking_flush"):
+            acked = self._apply(entries)
+            if acked:
+                fields_by_id = dict(entries)
+                applied = Counter(fields_by_id[entry_id].get("event_id") for entry_id in acked)
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.xack(STREAM_KEY, CONSUMER_GROUP, *acked)
+                pipe.xdel(STREAM_KEY, *acked)
+                pipe.execute()
+                self._sync_attendee_counts(applied)
+
+        logger.info(f"Flushed {len(acked)}/{len(entries)} queued RSVP writes")
+        return len(acked)
+
+    def _apply(self, entries: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+        """Apply a batch to ZeroDB; returns the entry IDs that may be acked."""
+        acked: List[str] = []
+        failed: set = set()  # RSVPs whose earlier entry failed; later ones wait
+
+        creates = [(entry_id, fields) for entry_id, fields in entries if fields.get("op") == "create"]
+        documents = self.redis_client.hmget(PENDING_KEY, [fields["id"] for _, fields in creates]) if creates else []
+        for (entry_id, fields), document in zip(creates, documents):
+            if document is None:
+                acked.append(entry_id)  # Already inserted (redelivery)
+                continue
+            try:
+                self.db.create_document("rsvps", json.loads(document))
+                self.redis_client.hdel(PENDING_KEY, fields["id"])
+                acked.append(entry_id)
+            except Exception as e:
+                failed.add(fields["id"])
+                logger.error(f"Failed to persist RSVP {fields['id']}: {e}")
+
+        updates = []
+        for entry_id, fields in entries:
+            op = fields.get("op")
+            if op == "update":
+                updates.append((entry_id, fields))
+            elif op != "create":
+                logger.warning(f"Dropping unknown RSVP write-behind entry {entry_id}: {fields}")
+                acked.append(entry_id)
+
+        # An insert left over from an earlier batch has to land first
+        still_pending = self.redis_client.hmget(PENDING_KEY, [fields["id"] for _, fields in updates]) if updates else []
+        for (entry_id, fields), pending in zip(updates, still_pending):
+            if pending is not None or fields["id"] in failed:
+                failed.add(fields["id"])
+                continue
+            try:
+                update = json.loads(fields["data"])
+                update.pop("id", None)  # Paid RSVPs taking over a waitlisted one keep its ID
+                self.db.update_document("rsvps", fields["id"], update, merge=True)
+                acked.append(entry_id)
+            except Exception as e:
+                failed.add(fields["id"])
+                logger.error(f"Failed to persist update of RSVP {fields['id']}: {e}")
+
+        return acked
+
+    def _sync_attendee_counts(self, applied: Counter) -> None:
+        for event_id, count in applied.items():
+            if not event_id:
+                continue
+            try:
+                booked = int(self._flushed(keys=[self._key(event_id)], args=[count]))
+                if booked >= 0:
+                    self._write_attendee_count(event_id, booked)
+            except Exception as e:
+                # The next flush or reconciliation writes the count
+                logger.error(f"Failed to update attendee count of event {event_id}: {e}")
+
+    def _write_attendee_count(self, event_id: str, booked: int) -> None:
+        self.db.update_document("events", event_id, {"current_attendees": booked}, merge=True)
+        get_cache_service().invalidate_tags(event_cache_tag(event_id))
+        bump_content_version(EVENTS_CONTENT)
+
+    def run(self, stop_event: threading.Event, consumer: Optional[str] = None) -> None:
+        """
+        Flush continuously until ``stop_event`` is set.
+
+        Args:
+            stop_event: Event that stops the loop after the current batch
+            consumer: Consumer name (defaults to hostname plus a random suffix)
+        """
+        consumer = consumer or f"{socket.gethostname()}-{uuid4().hex[:8]}"
+        logger.info(f"RSVP booking worker {consumer} started")
+
+        while not stop_event.is_set():
+            try:
+                self.flush(consumer, block_ms=FLUSH_BLOCK_MS)
+            except redis.RedisError as e:
+                logger.error(f"RSVP booking flush failed: {e}")
+                self._group_ready = False
+                stop_event.wait(1.0)
+            except Exception as e:
+                logger.error(f"Unexpected error flushing RSVP writes: {e}")
+                stop_event.wait(1.0)
+
+        logger.info(f"RSVP booking worker {consumer} stopped")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(event_id: str, suffix: str = "") -> str:
+        return f"{STATE_KEY_PREFIX}{event_id}{suffix}"
+
+    def _run(self, script, event_id: str, args: List[Any]) -> Any:
+        """Run an event script with its common keys and leading arguments."""
+        if time.monotonic() < self._redis_retry_at:
+            raise RSVPBookingError("Redis unavailable (retrying shortly)")
+
+        keys = [
+            self._key(event_id),
+            self._key(event_id, USERS_KEY_SUFFIX),
+            self._key(event_id, WAITLIST_KEY_SUFFIX),
+            self._key(event_id, HOLDS_KEY_SUFFIX),
+            STREAM_KEY,
+            PENDING_KEY,
+        ]
+        lapsed = json.dumps({
+            "status": "declined",
+            "hold_expired": True,
+            "updated_at": datetime.utcnow().isoformat(),
+        })
+        try:
+            return script(keys=keys, args=[time.time(), str(event_id), STATE_TTL, lapsed] + args)
+        except redis.RedisError as e:
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            raise RSVPBookingError(f"RSVP booking state unavailable: {e}")
+
+
+# Global booking engine instance
+_rsvp_booking_engine: Optional[RSVPBookingEngine] = None
+
+
+def get_rsvp_booking_engine() -> RSVPBookingEngine:
+    """
+    Get or create the global RSVP booking engine instance.
+
+    Returns:
+        RSVPBookingEngine instance
+    """
+    global _rsvp_booking_engine
+
+    if _rsvp_booking_engine is None:
+        _rsvp_booking_engine = RSVPBookingEngine()
+
+    return _rsvp_booking_engine
@@ -17,9 +17,14 @@ Business Rules:
 - Cancellation policy: Full refund if >24 hours before event
 - Duplicate prevention: One RSVP per user per event
 - QR codes: Generated for check-in at events
+
+Seats are reserved atomically through the RSVP booking engine (Redis), which
+persists RSVPs to ZeroDB asynchronously; when Redis is unavailable bookings
+fall back to ZeroDB directly.
 """
 
 import logging
+import time
 import qrcode
 import io
 import base64
@@ -31,10 +36,34 @@ from backend.config import settings
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError, ZeroDBNotFoundError
 from backend.services.stripe_service import get_stripe_service, CheckoutSessionError
 from backend.services.email_service import get_email_service
+from backend.services.event_service import event_cache_tag
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import EVENTS_CONTENT, bump_content_version
+from backend.services.rsvp_booking_engine import (
+    get_rsvp_booking_engine,
+    RSVPBookingError,
+    MAX_BULK_PROMOTION,
+    DUPLICATE,
+    FULL,
+    RELEASED,
+    NOT_LOADED,
+    UNLIMITED
+)
 from backend.models.schemas import RSVPStatus, PaymentStatus
 
 logger = logging.getLogger(__name__)
 
+PAID_WAITLIST_HOLD_HOURS = 24  # How long a promoted member of a paid event has to pay
+CHECKOUT_HOLD_SECONDS = 1800  # Seat held while a checkout session is open (Stripe's minimum expiry)
+
+# Waitlist priority by user role (higher is served first, then join time)
+WAITLIST_ROLE_PRIORITY = {
+    "member": 1,
+    "instructor": 1,
+    "board_member": 1,
+    "admin": 1,
+}
+
 
 class RSVPServiceError(Exception):
     """Base exception for RSVP service errors"""
@@ -75,6 +104,8 @@ class RSVPService:
         self.db = get_zerodb_client()
         self.stripe_service = get_stripe_service()
         self.email_service = get_email_service()
+        self.cache = get_cache_service()
+        self.booking = get_rsvp_booking_engine()
         logger.info("RSVPService initialized")
 
     def check_event_capacity(self, event_id: str) -> Dict[str, Any]:
@@ -107,6 +138,12 @@ class RSVPService:
             current_attendees = event.get("current_attendees", 0)
             waitlist_enabled = event.get("waitlist_enabled", False)
 
+            # Seat counter is ahead of current_attendees until bookings are persisted
+            availability = self.booking.availability(event_id)
+            if availability is not None:
+                current_attendees, capacity = availability
+                max_attendees = None if capacity == UNLIMITED else capacity
+
             # If no max_attendees set, unlimited capacity
             if max_attendees is None:
                 return {
@@ -155,6 +192,11 @@ class RSVPService:
             RSVPServiceError: If check fails
         """
         try:
+            # Booking engine knows RSVPs not yet persisted
+            booked = self.booking.lookup(event_id, user_id)
+            if booked is not None:
+                return booked
+
             # Query for existing RSVP
             result = self.db.query_documents(
                 collection="rsvps",
@@ -259,26 +301,13 @@ class RSVPService:
             RSVPServiceError: For other errors
         """
         try:
-            # Check for duplicate RSVP
-            duplicate_check = self.check_duplicate_rsvp(event_id, user_id)
-            if duplicate_check["has_rsvp"]:
-                raise DuplicateRSVPError(
-                    f"User {user_id} already has an RSVP for event {event_id} "
-                    f"with status {duplicate_check['status']}"
-                )
-
-            # Check event capacity
-            capacity_check = self.check_event_capacity(event_id)
-            if not capacity_check["has_capacity"]:
-                raise EventFullError(
-                    f"Event {event_id} is at full capacity "
-                    f"({capacity_check['max_attendees']} attendees)"
-                )
-
             # Get event details
             event_result = self.db.get_document("events", event_id)
             event = event_result.get("data", {})
 
+            if not event:
+                raise RSVPServiceError(f"Event {event_id} not found")
+
             # Verify event is free
             registration_fee = event.get("registration_fee", 0)
             if registration_fee and registration_fee > 0:
@@ -307,18 +336,26 @@ class RSVPService:
                 "updated_at": now.isoformat()
             }
 
-            result = self.db.create_document("rsvps", rsvp_data)
+            # Reserve the seat atomically; the RSVP is persisted behind
+            try:
+                reservation = self.booking.reserve(event_id, user_id, rsvp_data, event=event)
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, booking RSVP {rsvp_id} directly: {e}")
+                self._create_rsvp_directly(event_id, user_id, rsvp_data)
+            else:
+                if reservation.outcome == DUPLICATE:
+                    raise DuplicateRSVPError(
+                        f"User {user_id} already has an RSVP for event {event_id} "
+                        f"with status {reservation.status}"
+                    )
+                if reservation.outcome == FULL:
+                    raise EventFullError(
+                        f"Event {event_id} is at full capacity "
+                        f"({event.get('max_attendees')} attendees)"
+                    )
 
             logger.info(f"Created free event RSVP {rsvp_id} for user {user_id}, event {event_id}")
 
-            # Update event attendee count
-            self.db.update_document(
-                "events",
-                event_id,
-                {"current_attendees": capacity_check["current_attendees"] + 1},
-                merge=True
-            )
-
             # Generate QR code
             qr_code = self.generate_qr_code(rsvp_id, event_id, user_id)
 
@@ -358,6 +395,63 @@ class RSVPService:
             logger.error(f"Unexpected error creating RSVP: {e}")
             raise RSVPServiceError(f"Unexpected error: {str(e)}")
 
+    def _create_rsvp_directly(self, event_id: str, user_id: str, rsvp_data: Dict[str, Any]) -> None:
+        """
+        Create a confirmed RSVP in ZeroDB without the booking engine
+
+        Fallback for when Redis is unavailable. Capacity is checked with a
+        read-modify-write of current_attendees, which is not safe against
+        concurrent bookings.
+
+        Args:
+            event_id: Event UUID
+            user_id: User UUID
+            rsvp_data: RSVP document
+
+        Raises:
+            EventFullError: If event is at capacity
+            DuplicateRSVPError: If user already has RSVP
+        """
+        duplicate_check = self.check_duplicate_rsvp(event_id, user_id)
+        if duplicate_check["has_rsvp"]:
+            raise DuplicateRSVPError(
+                f"User {user_id} already has an RSVP for event {event_id} "
+                f"with status {duplicate_check['status']}"
+            )
+
+        capacity_check = self.check_event_capacity(event_id)
+        if not capacity_check["has_capacity"]:
+            raise EventFullError(
+                f"Event {event_id} is at full capacity "
+                f"({capacity_check['max_attendees']} attendees)"
+            )
+
+        self.db.create_document("rsvps", rsvp_data)
+
+        self.db.update_document(
+            "events",
+            event_id,
+            {"current_attendees": capacity_check["current_attendees"] + 1},
+            merge=True
+        )
+        self.cache.invalidate_tags(event_cache_tag(event_id))
+        bump_content_version(EVENTS_CONTENT)
+
+    def _get_rsvp(self, rsvp_id: str) -> Dict[str, Any]:
+        """
+        Get an RSVP, including one the booking engine has not persisted yet
+
+        Args:
+            rsvp_id: RSVP UUID
+
+        Returns:
+            RSVP data (empty if not found)
+        """
+        pending = self.booking.get_pending(rsvp_id)
+        if pending is not None:
+            return pending
+        return self.db.get_document("rsvps", rsvp_id).get("data", {})
+
     def create_paid_event_checkout(
         self,
         event_id: str,
@@ -369,7 +463,11 @@ class RSVPService:
         """
         Create Stripe checkout session for paid event RSVP
 
-        RSVP is created after successful payment via webhook
+        RSVP is created after successful payment via webhook. A seat is
+        held for the user while the session is open, so a full event cannot
+        be oversold by concurrent checkouts; the hold lapses on its own if
+        the user never pays. Members promoted from a paid event's waitlist
+        already hold a seat and can check out even when the event is full.
 
         Args:
             event_id: Event UUID
@@ -390,20 +488,6 @@ class RSVPService:
             RSVPServiceError: For other errors
         """
         try:
-            # Check for duplicate RSVP
-            duplicate_check = self.check_duplicate_rsvp(event_id, user_id)
-            if duplicate_check["has_rsvp"]:
-                raise DuplicateRSVPError(
-                    f"User {user_id} already has an RSVP for event {event_id}"
-                )
-
-            # Check event capacity
-            capacity_check = self.check_event_capacity(event_id)
-            if not capacity_check["has_capacity"]:
-                raise EventFullError(
-                    f"Event {event_id} is at full capacity"
-                )
-
             # Get event details
             event_result = self.db.get_document("events", event_id)
             event = event_result.get("data", {})
@@ -414,6 +498,23 @@ class RSVPService:
                     "This is a free event. Use create_free_event_rsvp instead."
                 )
 
+            # Hold a seat for the checkout
+            hold_until = time.time() + CHECKOUT_HOLD_SECONDS
+            try:
+                reservation = self.booking.hold(event_id, user_id, hold_until, event=event)
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, checking capacity directly: {e}")
+                self._check_checkout_allowed(event_id, user_id)
+            else:
+                if reservation.outcome == DUPLICATE:
+                    raise DuplicateRSVPError(
+                        f"User {user_id} already has an RSVP for event {event_id}"
+                    )
+                if reservation.outcome == FULL:
+                    raise EventFullError(
+                        f"Event {event_id} is at full capacity"
+                    )
+
             # Convert fee to cents
             amount_cents = int(registration_fee * 100)
 
@@ -453,7 +554,7 @@ class RSVPService:
                     "user_id": user_id,
                 },
                 payment_method_types=["card"],
-                expires_at=int((datetime.utcnow().timestamp()) + 1800),  # 30 minutes
+                expires_at=int(hold_until),  # Session closes when the seat hold lapses
             )
 
             logger.info(
@@ -479,6 +580,32 @@ class RSVPService:
             logger.error(f"Unexpected error creating paid event checkout: {e}")
             raise RSVPServiceError(f"Unexpected error: {str(e)}")
 
+    def _check_checkout_allowed(self, event_id: str, user_id: str) -> None:
+        """
+        Check a checkout against ZeroDB (without holding a seat)
+
+        Args:
+            event_id: Event UUID
+            user_id: User UUID
+
+        Raises:
+            DuplicateRSVPError: If user already has RSVP
+            EventFullError: If event is at capacity
+        """
+        # Check for duplicate RSVP
+        duplicate_check = self.check_duplicate_rsvp(event_id, user_id)
+        if duplicate_check["has_rsvp"]:
+            raise DuplicateRSVPError(
+                f"User {user_id} already has an RSVP for event {event_id}"
+            )
+
+        # Check event capacity
+        capacity_check = self.check_event_capacity(event_id)
+        if not capacity_check["has_capacity"]:
+            raise EventFullError(
+                f"Event {event_id} is at full capacity"
+            )
+
     def cancel_rsvp(
         self,
         rsvp_id: str,
@@ -510,8 +637,7 @@ class RSVPService:
         """
         try:
             # Get RSVP details
-            rsvp_result = self.db.get_document("rsvps", rsvp_id)
-            rsvp = rsvp_result.get("data", {})
+            rsvp = self._get_rsvp(rsvp_id)
 
             if not rsvp:
                 raise RSVPServiceError(f"RSVP {rsvp_id} not found")
@@ -585,28 +711,34 @@ class RSVPService:
                     logger.error(f"Error issuing refund: {e}")
                     # Continue with cancellation even if refund fails
 
-            # Update RSVP status
-            self.db.update_document(
-                "rsvps",
-                rsvp_id,
-                {
-                    "status": RSVPStatus.CANCELED.value,
-                    "canceled_at": now.isoformat(),
-                    "cancellation_reason": reason,
-                    "updated_at": now.isoformat()
-                },
-                merge=True
-            )
+            # Release the seat; the status update is persisted behind
+            cancellation = {
+                "status": RSVPStatus.CANCELED.value,
+                "canceled_at": now.isoformat(),
+                "cancellation_reason": reason,
+                "updated_at": now.isoformat()
+            }
+            try:
+                released = self.booking.release(event_id, user_id, rsvp_id, cancellation)
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, canceling RSVP {rsvp_id} directly: {e}")
+                released = NOT_LOADED
+
+            if released != RELEASED:
+                self.db.update_document("rsvps", rsvp_id, cancellation, merge=True)
 
-            # Update event attendee count
+            # Update event attendee count (the booking engine owns it once loaded)
             current_attendees = event.get("current_attendees", 0)
-            if current_attendees > 0:
+            if released == NOT_LOADED and current_attendees > 0 \
+                    and rsvp.get("status") == RSVPStatus.CONFIRMED.value:
                 self.db.update_document(
                     "events",
                     event_id,
                     {"current_attendees": current_attendees - 1},
                     merge=True
                 )
+                self.cache.invalidate_tags(event_cache_tag(event_id))
+                bump_content_version(EVENTS_CONTENT)
 
             # Send cancellation confirmation email
             try:
@@ -656,20 +788,25 @@ class RSVPService:
         user_id: str,
         user_name: str,
         user_email: str,
-        user_phone: Optional[str] = None
+        user_phone: Optional[str] = None,
+        priority: int = 0
     ) -> Dict[str, Any]:
         """
         Add user to event waitlist
 
+        The waitlist is served by priority, then by join time.
+
         Args:
             event_id: Event UUID
             user_id: User UUID
             user_name: User's full name
             user_email: User's email address
             user_phone: User's phone number (optional)
+            priority: Waitlist priority, higher first (e.g. for premium members)
 
         Returns:
-            Waitlist entry data
+            Waitlist entry data, including the 1-based waitlist position
+            (None when it cannot be determined)
 
         Raises:
             RSVPServiceError: If waitlist add fails
@@ -702,6 +839,7 @@ class RSVPService:
                 "user_phone": user_phone,
                 "rsvp_date": now.isoformat(),
                 "status": RSVPStatus.WAITLIST.value,
+                "waitlist_priority": priority,
                 "payment_id": None,
                 "payment_status": None,
                 "check_in_status": False,
@@ -710,7 +848,16 @@ class RSVPService:
                 "updated_at": now.isoformat()
             }
 
-            result = self.db.create_document("rsvps", rsvp_data)
+            try:
+                reservation = self.booking.reserve(event_id, user_id, rsvp_data, event=event, priority=priority)
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, adding RSVP {rsvp_id} directly: {e}")
+                self.db.create_document("rsvps", rsvp_data)
+            else:
+                if reservation.outcome == DUPLICATE:
+                    raise DuplicateRSVPError(
+                        f"User already has an entry for this event with status {reservation.status}"
+                    )
 
             logger.info(f"Added user {user_id} to waitlist for event {event_id}")
 
@@ -728,6 +875,7 @@ class RSVPService:
             return {
                 "rsvp_id": rsvp_id,
                 "status": RSVPStatus.WAITLIST.value,
+                "waitlist_position": self.booking.waitlist_position(event_id, user_id),
                 "message": "You've been added to the waitlist. We'll notify you if a spot opens up."
             }
 
@@ -768,10 +916,9 @@ class RSVPService:
                 }
 
             # Get full RSVP details
-            rsvp_result = self.db.get_document("rsvps", duplicate_check["rsvp_id"])
-            rsvp = rsvp_result.get("data", {})
+            rsvp = self._get_rsvp(duplicate_check["rsvp_id"])
 
-            return {
+            status = {
                 "has_rsvp": True,
                 "rsvp_id": duplicate_check["rsvp_id"],
                 "status": rsvp.get("status"),
@@ -779,110 +926,196 @@ class RSVPService:
                 "payment_status": rsvp.get("payment_status"),
                 "check_in_status": rsvp.get("check_in_status")
             }
+            if rsvp.get("status") == RSVPStatus.WAITLIST.value:
+                status["waitlist_position"] = self.booking.waitlist_position(event_id, user_id)
+            return status
 
         except Exception as e:
             logger.error(f"Error getting RSVP status: {e}")
             raise RSVPServiceError(f"Failed to get RSVP status: {str(e)}")
 
-    def _promote_from_waitlist(self, event_id: str) -> None:
+    def promote_waitlist(self, event_id: str, count: Optional[int] = None) -> int:
         """
-        Promote first person from waitlist to confirmed when spot opens
+        Promote members from the head of the waitlist into free seats
+
+        Free events confirm promoted members right away. Paid events hold a
+        seat for each promoted member for PAID_WAITLIST_HOLD_HOURS and ask
+        them to pay; a lapsed hold declines their RSVP and the seat is
+        re-offered by the booking worker.
 
         Args:
             event_id: Event UUID
+            count: Maximum members to promote (default: as many as there
+                are free seats)
+
+        Returns:
+            Number of members promoted
         """
         try:
-            # Check if there's capacity
-            capacity_check = self.check_event_capacity(event_id)
-            if not capacity_check["has_capacity"]:
-                return
-
-            # Find first waitlist entry
-            result = self.db.query_documents(
-                collection="rsvps",
-                filters={
-                    "event_id": event_id,
-                    "status": RSVPStatus.WAITLIST.value
-                },
-                limit=1,
-                order_by="created_at"
-            )
-
-            waitlist_entries = result.get("documents", [])
-            if not waitlist_entries:
-                return
-
-            waitlist_rsvp = waitlist_entries[0].get("data", {})
-            rsvp_id = waitlist_rsvp.get("id")
-
-            # Get event details
             event_result = self.db.get_document("events", event_id)
             event = event_result.get("data", {})
 
-            # Check if event is paid
             registration_fee = event.get("registration_fee", 0)
+            paid = bool(registration_fee and registration_fee > 0)
+            now = datetime.utcnow()
 
-            if registration_fee and registration_fee > 0:
-                # For paid events, send notification to complete payment
-                try:
-                    self.email_service.send_waitlist_spot_available_paid(
-                        email=waitlist_rsvp.get("user_email"),
-                        user_name=waitlist_rsvp.get("user_name"),
-                        event_title=event.get("title"),
-                        event_date=event.get("start_datetime"),
-                        event_id=event_id,
-                        registration_fee=registration_fee
-                    )
-                    logger.info(f"Notified waitlist user {waitlist_rsvp.get('user_id')} - payment required")
-                except Exception as e:
-                    logger.error(f"Failed to send waitlist promotion email: {e}")
-            else:
-                # For free events, automatically confirm
-                self.db.update_document(
-                    "rsvps",
-                    rsvp_id,
-                    {
+            try:
+                promoted = self.booking.promote_next(
+                    event_id,
+                    count=count or MAX_BULK_PROMOTION,
+                    update={
                         "status": RSVPStatus.CONFIRMED.value,
-                        "updated_at": datetime.utcnow().isoformat()
+                        "promoted_at": now.isoformat(),
+                        "updated_at": now.isoformat()
                     },
-                    merge=True
-                )
-
-                # Update event count
-                self.db.update_document(
-                    "events",
-                    event_id,
-                    {"current_attendees": capacity_check["current_attendees"] + 1},
-                    merge=True
+                    hold_until=time.time() + PAID_WAITLIST_HOLD_HOURS * 3600 if paid else None,
+                    event=event
                 )
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, promoting waitlist of event {event_id} directly: {e}")
+                return self._promote_from_waitlist_directly(event_id, event)
 
-                # Generate QR code
-                qr_code = self.generate_qr_code(
-                    rsvp_id,
-                    event_id,
-                    waitlist_rsvp.get("user_id")
-                )
+            for user_id, rsvp_id in promoted:
+                waitlist_rsvp = self._get_rsvp(rsvp_id)
+                if paid:
+                    self._notify_paid_waitlist_spot(event_id, event, waitlist_rsvp)
+                else:
+                    self._notify_waitlist_confirmed(event_id, event, rsvp_id, user_id, waitlist_rsvp)
 
-                # Send confirmation email
-                try:
-                    self.email_service.send_free_event_rsvp_confirmation(
-                        email=waitlist_rsvp.get("user_email"),
-                        user_name=waitlist_rsvp.get("user_name"),
-                        event_title=event.get("title"),
-                        event_date=event.get("start_datetime"),
-                        event_location=event.get("location_name"),
-                        event_address=event.get("address"),
-                        qr_code=qr_code,
-                        rsvp_id=rsvp_id,
-                        from_waitlist=True
-                    )
-                    logger.info(f"Promoted user {waitlist_rsvp.get('user_id')} from waitlist")
-                except Exception as e:
-                    logger.error(f"Failed to send waitlist promotion email: {e}")
+            if promoted:
+                logger.info(f"Promoted {len(promoted)} member(s) from waitlist of event {event_id}")
+            return len(promoted)
 
         except Exception as e:
             logger.error(f"Error promoting from waitlist: {e}")
             # Don't raise - this is a background operation
+            return 0
+
+    def _promote_from_waitlist(self, event_id: str) -> None:
+        """
+        Promote the next waitlisted member when a spot opens
+
+        Args:
+            event_id: Event UUID
+        """
+        self.promote_waitlist(event_id, count=1)
+
+    def _promote_from_waitlist_directly(self, event_id: str, event: Dict[str, Any]) -> int:
+        """
+        Promote the first waitlisted member without the booking engine
+
+        Fallback for when Redis is unavailable.
+
+        Args:
+            event_id: Event UUID
+            event: Event data
+
+        Returns:
+            Number of members promoted (0 or 1)
+        """
+        # Check if there's capacity
+        capacity_check = self.check_event_capacity(event_id)
+        if not capacity_check["has_capacity"]:
+            return 0
+
+        # Find first waitlist entry
+        result = self.db.query_documents(
+            collection="rsvps",
+            filters={
+                "event_id": event_id,
+                "status": RSVPStatus.WAITLIST.value
+            },
+            limit=1,
+            order_by="created_at"
+        )
+
+        waitlist_entries = result.get("documents", [])
+        if not waitlist_entries:
+            return 0
+
+        waitlist_rsvp = waitlist_entries[0].get("data", {})
+        rsvp_id = waitlist_rsvp.get("id")
+
+        # Check if event is paid
+        registration_fee = event.get("registration_fee", 0)
+
+        if registration_fee and registration_fee > 0:
+            # For paid events, send notification to complete payment
+            self._notify_paid_waitlist_spot(event_id, event, waitlist_rsvp)
+            return 1
+
+        # For free events, automatically confirm
+        self.db.update_document(
+            "rsvps",
+            rsvp_id,
+            {
+                "status": RSVPStatus.CONFIRMED.value,
+                "updated_at": datetime.utcnow().isoformat()
+            },
+            merge=True
+        )
+
+        # Update event count
+        self.db.update_document(
+            "events",
+            event_id,
+            {"current_attendees": capacity_check["current_attendees"] + 1},
+            merge=True
+        )
+        self.cache.invalidate_tags(event_cache_tag(event_id))
+        bump_content_version(EVENTS_CONTENT)
+
+        self._notify_waitlist_confirmed(event_id, event, rsvp_id, waitlist_rsvp.get("user_id"), waitlist_rsvp)
+        return 1
+
+    def _notify_paid_waitlist_spot(
+        self,
+        event_id: str,
+        event: Dict[str, Any],
+        waitlist_rsvp: Dict[str, Any]
+    ) -> None:
+        """Ask a promoted member of a paid event's waitlist to pay"""
+        try:
+            self.email_service.send_waitlist_spot_available_paid(
+                email=waitlist_rsvp.get("user_email"),
+                user_name=waitlist_rsvp.get("user_name"),
+                event_title=event.get("title"),
+                event_date=event.get("start_datetime"),
+                event_id=event_id,
+                registration_fee=event.get("registration_fee")
+            )
+            logger.info(f"Notified waitlist user {waitlist_rsvp.get('user_id')} - payment required")
+        except Exception as e:
+            logger.error(f"Failed to send waitlist promotion email: {e}")
+
+    def _notify_waitlist_confirmed(
+        self,
+        event_id: str,
+        event: Dict[str, Any],
+        rsvp_id: str,
+        user_id: str,
+        waitlist_rsvp: Dict[str, Any]
+    ) -> None:
+        """Send a promoted member of a free event's waitlist their confirmation"""
+        # Generate QR code
+        qr_code = self.generate_qr_code(rsvp_id, event_id, user_id)
+
+        # Send confirmation email
+        try:
+            self.email_service.send_free_event_rsvp_confirmation(
+                email=waitlist_rsvp.get("user_email"),
+                user_name=waitlist_rsvp.get("user_name"),
+                event_title=event.get("title"),
+                event_date=event.get("start_datetime"),
+                event_location=event.get("location_name"),
+                event_address=event.get("address"),
+                qr_code=qr_code,
+                rsvp_id=rsvp_id,
+                from_waitlist=True
+            )
+            logger.info(f"Promoted user {user_id} from waitlist")
+        except Exception as e:
+            logger.error(f"Failed to send waitlist promotion email: {e}")
 
 
 # Global RSVP service instance (singleton pattern)
@@ -0,0 +1,814 @@
+"""
+Search Index - in-memory n-gram/prefix index for admin lookups
+
+Admin member search used to filter one fetched page in Python (results
+were wrong past the first page), instructor listing loaded every
+instructor to paginate in memory, and resource listing filtered a capped
+query result. Each process now keeps an in-memory index per document type
+that answers "which IDs match, in which order, how many" without touching
+ZeroDB:
+- Trigram postings answer substring queries of 3+ characters, token
+  prefix postings answer 1-2 character queries; every candidate is
+  verified against the stored text, so results are exact
+- Ranking: exact token > token prefix > substring per query term (all
+  terms must match), then the index's sort key
+- Attribute filters (equality, any-of, list membership) and offset/limit
+  pagination with an exact total
+- Each entry carries a small payload (what a list row renders), so list
+  pages need no per-row lookups
+
+Keeping indexes current across workers:
+- Write paths call the ``record_*``/``remove_*`` hooks, which apply the
+  change locally and append it to a Redis stream (``CHANGES_KEY_PREFIX``);
+  other workers replay the stream at most once per ``SYNC_INTERVAL``
+- ``rebuild_search_indexes`` rebuilds from ZeroDB (daily, on the job
+  runner) and stores a compressed snapshot in Redis; ``save_snapshots``
+  refreshes the snapshot in between, so a starting worker loads the
+  snapshot and replays only recent changes
+- An index is ``ready`` once it was loaded or rebuilt; routes fall back to
+  querying ZeroDB until then, and whenever Redis is unreachable at start
+
+Usage:
+    index = get_search_index(PEOPLE_INDEX)
+    result = index.search("jo smi", filters={"role": "instructor"}, offset=0, limit=20)
+    rows = index.payloads(result.ids)
+"""
+
+import base64
+import heapq
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import redis
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+PEOPLE_INDEX = "people"  # Users with their profiles (admin members and instructors)
+RESOURCES_INDEX = "resources"  # Training resources
+
+SNAPSHOT_KEY_PREFIX = "search:snapshot:"  # index -> base64(zlib(JSON snapshot))
+CHANGES_KEY_PREFIX = "search:changes:"  # index -> stream of upserts/removals
+CHANGES_MAXLEN = 100000  # Approximate stream length kept between snapshots
+SYNC_INTERVAL = 1.0  # Seconds between reads of the change stream
+SYNC_BATCH = 1000  # Stream entries read per round trip
+STALE_AFTER = 300  # Seconds idle after which trimmed changes force a snapshot reload
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after an error
+SNAPSHOT_VERSION = 1
+
+NGRAM = 3
+PREFIX_LENGTHS = (1, 2)  # Token prefixes indexed for queries shorter than NGRAM
+MAX_CACHED_VIEWS = 32  # Filtered orderings kept between writes
+REBUILD_PAGE_SIZE = 500
+
+SCORE_EXACT = 3
+SCORE_PREFIX = 2
+SCORE_SUBSTRING = 1
+
+OP_UPSERT = "upsert"
+OP_REMOVE = "remove"
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+class IndexEntry(NamedTuple):
+    """One searchable document"""
+    doc_id: str
+    fields: Tuple[str, ...]  # Searchable text values
+    attrs: Dict[str, Any]  # Filterable values; a list matches any of its items
+    sort_key: Tuple[float, ...]  # Ascending order among equally ranked matches
+    payload: Optional[Dict[str, Any]] = None  # Returned by payloads()
+
+
+class SearchResult(NamedTuple):
+    """One page of matching document IDs"""
+    ids: List[str]
+    total: int
+
+
+class _Stored(NamedTuple):
+    doc_id: str
+    text: str  # Lowercased fields joined by newlines
+    attrs: Dict[str, Any]
+    sort_key: Tuple[float, ...]
+    payload: Optional[str]  # JSON
+
+
+def normalize(text: Any) -> str:
+    """Lowercase a value for indexing and matching"""
+    return str(text).casefold().strip() if text is not None else ""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _stream_id(value: str) -> Tuple[int, int]:
+    """Comparable form of a Redis stream entry ID"""
+    milliseconds, _, sequence = value.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+def _timestamp(value: Any) -> float:
+    """Seconds since the epoch of a datetime or ISO string (0 when unknown)"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+class SearchIndex:
+    """
+    In-memory n-gram/prefix index of one document type, shared via Redis
+
+    Thread-safe. Documents get a new internal number on every upsert;
+    numbers of replaced and removed documents are skipped at query time
+    and dropped by compaction.
+    """
+
+    def __init__(self, name: str, redis_client: Optional[redis.Redis] = None):
+        """
+        Initialize an empty index
+
+        Args:
+            name: Index name (PEOPLE_INDEX, RESOURCES_INDEX, ...)
+            redis_client: Redis client for the change stream and snapshot (optional)
+        """
+        self.name = name
+        self.redis_client = redis_client
+        self.snapshot_key = SNAPSHOT_KEY_PREFIX + name
+        self.changes_key = CHANGES_KEY_PREFIX + name
+
+        self._lock = threading.RLock()
+        self._reset()
+        self.ready = False
+        self._last_id = "0-0"  # Last change stream entry applied
+        self._own_changes: set = set()  # Stream IDs published by this process
+        self._synced_at = 0.0
+        self._load_attempted_at = None
+        self._redis_retry_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        limit: int = 20
+    ) -> SearchResult:
+        """
+        Return one page of matching document IDs, best matches first
+
+        Args:
+            query: Search text; every whitespace-separated term must match
+                (None or blank lists all documents in sort order)
+            filters: Attribute filters; a list/tuple/set value matches any
+                of its items, None values are ignored
+            offset: Number of matches to skip
+            limit: Maximum number of IDs to return
+
+        Returns:
+            SearchResult with the page of IDs and the total match count
+        """
+        self.sync()
+        terms = normalize(query).split() if query else []
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+
+        with self._lock:
+            if not terms:
+                order = self._filtered_order(filters)
+                return SearchResult(
+                    ids=[self._entries[number].doc_id for number in order[offset:offset + limit]],
+                    total=len(order)
+                )
+
+            matches = []
+            for number in self._candidates(terms):
+                stored = self._entries[number]
+                if stored is None or not self._matches_filters(stored.attrs, filters):
+                    continue
+                score = self._score(stored.text, terms)
+                if score:
+                    matches.append((-score, stored.sort_key, number))
+
+            page = heapq.nsmallest(offset + limit, matches)[offset:]
+            return SearchResult(ids=[self._entries[number].doc_id for _, _, number in page], total=len(matches))
+
+    def payloads(self, doc_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Return the payloads of indexed documents, in the given order
+
+        Args:
+            doc_ids: Document IDs (unknown IDs are skipped)
+
+        Returns:
+            List of payload dictionaries (copies)
+        """
+        with self._lock:
+            values = [
+                self._entries[self._numbers[doc_id]].payload
+                for doc_id in doc_ids
+                if doc_id in self._numbers
+            ]
+        return [json.loads(value) if value else {} for value in values]
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the payload of one indexed document
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            Payload dictionary, or None if the document is not indexed
+        """
+        payloads = self.payloads([doc_id])
+        return payloads[0] if payloads else None
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, entry: IndexEntry) -> None:
+        """
+        Index a document and publish the change to other workers
+
+        Args:
+            entry: Document to index (replaces any earlier version)
+        """
+        entry = self._normalize_entry(entry)
+        with self._lock:
+            self._apply_upsert(entry)
+        self._publish(OP_UPSERT, self._encode_entry(entry))
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Remove a document and publish the change to other workers
+
+        Args:
+            doc_id: Document ID
+        """
+        with self._lock:
+            self._apply_remove(str(doc_id))
+        self._publish(OP_REMOVE, json.dumps(str(doc_id)))
+
+    def rebuild(self, entries: Iterable[IndexEntry]) -> int:
+        """
+        Replace the index with freshly loaded documents and save a snapshot
+
+        Changes published while the documents were loaded are replayed
+        afterwards, so none are lost.
+
+        Args:
+            entries: Every document of the index
+
+        Returns:
+            Number of indexed documents
+        """
+        start_id = self._stream_head()
+        entries = [self._normalize_entry(entry) for entry in entries]
+
+        with self._lock:
+            self._reset()
+            self._own_changes.clear()  # Replayed below like any other change
+            for entry in entries:
+                self._apply_upsert(entry)
+            if start_id is not None:
+                self._last_id = start_id
+            self.ready = True
+            self._synced_at = 0.0
+
+        self.sync(force=True)
+        self.save_snapshot()
+        logger.info(f"Rebuilt search index '{self.name}' with {len(self)} documents")
+        return len(self)
+
+    # ------------------------------------------------------------------
+    # Sharing between workers
+    # ------------------------------------------------------------------
+
+    def sync(self, force: bool = False) -> None:
+        """
+        Load the snapshot if needed and replay changes of other workers
+
+        Args:
+            force: Read the change stream even if it was read recently
+        """
+        now = time.monotonic()
+        if not force and now - self._synced_at < SYNC_INTERVAL:
+            return
+
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            if self.ready and self._synced_at and now - self._synced_at > STALE_AFTER:
+                # Idle for long: changes may have been trimmed from the stream
+                oldest = client.xrange(self.changes_key, min="-", max="+", count=1)
+                if oldest and _stream_id(oldest[0][0]) > _stream_id(self._last_id):
+                    self.ready = False
+                    self._load_attempted_at = None
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return
+
+        if not self.ready and not self._load_snapshot(client, now):
+            return
+
+        try:
+            while True:
+                changes = client.xrange(self.changes_key, min=f"({self._last_id}", max="+", count=SYNC_BATCH)
+                with self._lock:
+                    for stream_id, change in changes:
+                        self._apply_change(stream_id, change)
+                if len(changes) < SYNC_BATCH:
+                    break
+            self._synced_at = now
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def save_snapshot(self) -> bool:
+        """
+        Store this process's index as the shared snapshot
+
+        Returns:
+            True if the snapshot was stored
+        """
+        client = self._redis()
+        if client is None or not self.ready:
+            return False
+
+        with self._lock:
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "stream_id": self._last_id,
+                "entries": [
+                    [stored.doc_id, stored.text, stored.attrs, list(stored.sort_key), stored.payload]
+                    for stored in self._entries
+                    if stored is not None
+                ],
+            }
+        blob = base64.b64encode(zlib.compress(json.dumps(snapshot, default=_json_default).encode())).decode()
+
+        try:
+            client.set(self.snapshot_key, blob)
+            return True
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return False
+
+    def _load_snapshot(self, client: redis.Redis, now: float) -> bool:
+        """Replace the index with the shared snapshot; False if there is none"""
+        if self._load_attempted_at is not None and now - self._load_attempted_at < REDIS_RETRY_INTERVAL:
+            return self.ready
+        self._load_attempted_at = now
+
+        try:
+            blob = client.get(self.snapshot_key)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return False
+        if not blob:
+            return self.ready
+
+        try:
+            snapshot = json.loads(zlib.decompress(base64.b64decode(blob)))
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {snapshot.get('version')}")
+        except (ValueError, TypeError, zlib.error) as e:
+            logger.warning(f"Ignoring unreadable snapshot of search index '{self.name}': {e}")
+            return self.ready
+
+        with self._lock:
+            self._reset()
+            self._own_changes.clear()
+            for doc_id, text, attrs, sort_key, payload in snapshot["entries"]:
+                self._apply_upsert(_Stored(doc_id, text, attrs, tuple(sort_key), payload))
+            self._last_id = snapshot["stream_id"]
+            self.ready = True
+        logger.info(f"Loaded search index '{self.name}' snapshot with {len(self)} documents")
+        return True
+
+    def _publish(self, op: str, data: str) -> None:
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            stream_id = client.xadd(
+                self.changes_key,
+                {"op": op, "data": data},
+                maxlen=CHANGES_MAXLEN,
+                approximate=True
+            )
+            with self._lock:
+                self._own_changes.add(stream_id)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def _stream_head(self) -> Optional[str]:
+        """ID of the newest change stream entry ("0-0" if empty), or None without Redis"""
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            newest = client.xrevrange(self.changes_key, count=1)
+            return newest[0][0] if newest else "0-0"
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+
+    def _apply_change(self, stream_id: str, change: Dict[str, str]) -> None:
+        self._last_id = stream_id
+        if stream_id in self._own_changes:
+            self._own_changes.discard(stream_id)
+            return
+        try:
+            if change["op"] == OP_UPSERT:
+                self._apply_upsert(self._decode_entry(change["data"]))
+            elif change["op"] == OP_REMOVE:
+                self._apply_remove(json.loads(change["data"]))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Skipping malformed change {stream_id} of search index '{self.name}': {e}")
+
+    @staticmethod
+    def _encode_entry(stored: _Stored) -> str:
+        return json.dumps(
+            [stored.doc_id, stored.text, stored.attrs, list(stored.sort_key), stored.payload],
+            default=_json_default
+        )
+
+    @staticmethod
+    def _decode_entry(data: str) -> _Stored:
+        doc_id, text, attrs, sort_key, payload = json.loads(data)
+        return _Stored(doc_id, text, attrs, tuple(sort_key), payload)
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if self.redis_client is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self.redis_client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Search index '{self.name}' bypassing Redis for {REDIS_RETRY_INTERVAL}s: {error}")
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold the lock)
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._entries: List[Optional[_Stored]] = []
+        self._numbers: Dict[str, int] = {}  # doc_id -> current number
+        self._grams: Dict[str, array] = {}  # trigram -> numbers
+        self._prefixes: Dict[str, array] = {}  # token prefix -> numbers
+        self._dead = 0
+        self._order: Optional[List[int]] = None  # Live numbers by sort key
+        self._views: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    @staticmethod
+    def _normalize_entry(entry: IndexEntry) -> _Stored:
+        return _Stored(
+            doc_id=str(entry.doc_id),
+            text="\n".join(normalize(value) for value in entry.fields if value),
+            attrs=entry.attrs,
+            sort_key=tuple(entry.sort_key),
+            payload=json.dumps(entry.payload, default=_json_default) if entry.payload is not None else None
+        )
+
+    def _apply_upsert(self, stored: _Stored) -> None:
+        self._apply_remove(stored.doc_id)
+
+        number = len(self._entries)
+        self._entries.append(stored)
+        self._numbers[stored.doc_id] = number
+
+        grams = set()
+        prefixes = set()
+        for value in stored.text.split("\n"):
+            grams.update(value[i:i + NGRAM] for i in range(len(value) - NGRAM + 1))
+            for token in _TOKEN_RE.findall(value):
+                prefixes.update(token[:length] for length in PREFIX_LENGTHS)
+        for gram in grams:
+            self._grams.setdefault(gram, array("I")).append(number)
+        for prefix in prefixes:
+            self._prefixes.setdefault(prefix, array("I")).append(number)
+
+        self._changed()
+
+    def _apply_remove(self, doc_id: str) -> None:
+        number = self._numbers.pop(doc_id, None)
+        if number is None:
+            return
+        self._entries[number] = None
+        self._dead += 1
+        self._changed()
+
+        if self._dead > max(1000, len(self._numbers)):
+            self._compact()
+
+    def _compact(self) -> None:
+        live = [stored for stored in self._entries if stored is not None]
+        self._reset()
+        for stored in live:
+            self._apply_upsert(stored)
+
+    def _changed(self) -> None:
+        self._order = None
+        self._views.clear()
+
+    def _filtered_order(self, filters: Dict[str, Any]) -> List[int]:
+        if self._order is None:
+            self._order = sorted(self._numbers.values(), key=lambda number: (self._entries[number].sort_key, number))
+        if not filters:
+            return self._order
+
+        key = json.dumps(sorted(filters.items()), default=_json_default)
+        view = self._views.get(key)
+        if view is None:
+            view = [number for number in self._order if self._matches_filters(self._entries[number].attrs, filters)]
+            self._views[key] = view
+            while len(self._views) > MAX_CACHED_VIEWS:
+                self._views.popitem(last=False)
+        return view
+
+    def _candidates(self, terms: List[str]) -> Iterator[int]:
+        """Numbers that may match every term (verified by _score)"""
+        postings = []
+        for term in terms:
+            if len(term) >= NGRAM:
+                keys = {term[i:i + NGRAM] for i in range(len(term) - NGRAM + 1)}
+                lists = [self._grams.get(key) for key in keys]
+            else:
+                lists = [self._prefixes.get(term)]
+            if any(posting is None for posting in lists):
+                return iter(())
+            postings.extend(lists)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:3]:  # Intersecting the rarest lists is enough; _score verifies
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return iter(candidates)
+
+    @staticmethod
+    def _score(text: str, terms: List[str]) -> int:
+        tokens = _TOKEN_RE.findall(text)
+        token_set = set(tokens)
+        score = 0
+        for term in terms:
+            if term in token_set:
+                score += SCORE_EXACT
+            elif any(token.startswith(term) for token in tokens):
+                score += SCORE_PREFIX
+            elif len(term) >= NGRAM and term in text:
+                score += SCORE_SUBSTRING
+            else:
+                return 0
+        return score
+
+    @staticmethod
+    def _matches_filters(attrs: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        for field, wanted in filters.items():
+            allowed = wanted if isinstance(wanted, (list, tuple, set, frozenset)) else (wanted,)
+            value = attrs.get(field)
+            if isinstance(value, list):
+                if not any(item in allowed for item in value):
+                    return False
+            elif value not in allowed:
+                return False
+        return True
+
+
+# ============================================================================
+# DOCUMENT TYPES
+# ============================================================================
+
+# User and profile fields kept in people payloads (what list rows render)
+PERSON_USER_FIELDS = ("id", "email", "role", "is_active", "is_verified", "created_at", "updated_at", "last_login")
+PERSON_PROFILE_FIELDS = (
+    "first_name", "last_name", "phone", "city", "state", "disciplines",
+    "instructor_certifications", "schools_affiliated", "member_since"
+)
+INSTRUCTOR_PROFILE_FIELDS = ("bio",)  # Kept for instructors only
+
+
+def person_entry(user_id: str, user: Dict[str, Any], profile: Optional[Dict[str, Any]] = None) -> IndexEntry:
+    """
+    Build the people index entry of a user
+
+    Args:
+        user_id: User ID
+        user: User document
+        profile: Profile document (names fall back to the user document)
+
+    Returns:
+        IndexEntry with the user and profile fields list rows need
+    """
+    role = user.get("role")
+    role = getattr(role, "value", role)
+    profile = profile or {}
+
+    profile_fields = PERSON_PROFILE_FIELDS + (INSTRUCTOR_PROFILE_FIELDS if role == "instructor" else ())
+    payload_profile = {field: profile.get(field, user.get(field)) for field in profile_fields}
+    payload_user = {field: user.get(field) for field in PERSON_USER_FIELDS}
+    payload_user["id"] = str(user_id)
+    payload_user["role"] = role
+
+    return IndexEntry(
+        doc_id=str(user_id),
+        fields=(user.get("email"), payload_profile["first_name"], payload_profile["last_name"]),
+        attrs={
+            "role": role,
+            "is_active": user.get("is_active", True),
+            "disciplines": list(payload_profile.get("disciplines") or []),
+        },
+        sort_key=(-_timestamp(user.get("created_at")),),  # Newest first
+        payload={"user": payload_user, "profile": payload_profile}
+    )
+
+
+def resource_entry(resource_id: str, resource: Dict[str, Any]) -> IndexEntry:
+    """
+    Build the resources index entry of a resource
+
+    Args:
+        resource_id: Resource ID
+        resource: Resource data
+
+    Returns:
+        IndexEntry whose payload is the resource document ({id, data})
+    """
+    def value(field: str) -> Any:
+        item = resource.get(field)
+        return getattr(item, "value", item)
+
+    return IndexEntry(
+        doc_id=str(resource_id),
+        fields=(resource.get("title"), resource.get("description"), " ".join(resource.get("tags") or []), resource.get("discipline")),
+        attrs={
+            "category": value("category"),
+            "status": value("status"),
+            "visibility": value("visibility"),
+            "discipline": resource.get("discipline"),
+            "is_featured": bool(resource.get("is_featured", False)),
+        },
+        sort_key=(resource.get("display_order") or 0, -_timestamp(resource.get("created_at"))),
+        payload={"id": str(resource_id), "data": resource}
+    )
+
+
+# ============================================================================
+# WRITE HOOKS
+# ============================================================================
+
+def record_person(user_id: str, user: Dict[str, Any], profile: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Index a user after a write; best-effort, never raises
+
+    Args:
+        user_id: User ID
+        user: Full (merged) user document after the write
+        profile: Profile document; None keeps the indexed profile fields
+    """
+    try:
+        index = get_search_index(PEOPLE_INDEX)
+        if profile is None:
+            profile = (index.get(str(user_id)) or {}).get("profile")
+        index.upsert(person_entry(user_id, user, profile))
+    except Exception as e:
+        logger.error(f"Failed to update search index for user {user_id}: {e}")
+
+
+def remove_person(user_id: str) -> None:
+    """Remove a deleted user from the people index; best-effort, never raises"""
+    try:
+        get_search_index(PEOPLE_INDEX).remove(str(user_id))
+    except Exception as e:
+        logger.error(f"Failed to remove user {user_id} from search index: {e}")
+
+
+def record_resource(resource_id: str, resource: Dict[str, Any]) -> None:
+    """
+    Index a resource after a write; best-effort, never raises
+
+    Args:
+        resource_id: Resource ID
+        resource: Full resource data after the write
+    """
+    try:
+        get_search_index(RESOURCES_INDEX).upsert(resource_entry(resource_id, resource))
+    except Exception as e:
+        logger.error(f"Failed to update search index for resource {resource_id}: {e}")
+
+
+def remove_resource(resource_id: str) -> None:
+    """Remove a deleted resource from the resources index; best-effort, never raises"""
+    try:
+        get_search_index(RESOURCES_INDEX).remove(str(resource_id))
+    except Exception as e:
+        logger.error(f"Failed to remove resource {resource_id} from search index: {e}")
+
+
+# ============================================================================
+# REBUILDING
+# ============================================================================
+
+def _iter_documents(db, collection: str) -> Iterator[Dict[str, Any]]:
+    """Page through a collection, yielding documents with ``id`` and ``data``"""
+    offset = 0
+    while True:
+        result = db.query_documents(collection=collection, filters={}, limit=REBUILD_PAGE_SIZE, offset=offset)
+        documents = result.get("documents", [])
+        yield from documents
+        if len(documents) < REBUILD_PAGE_SIZE:
+            break
+        offset += REBUILD_PAGE_SIZE
+
+
+def rebuild_search_indexes(db=None) -> Dict[str, int]:
+    """
+    Rebuild every search index from ZeroDB and store the snapshots
+
+    Args:
+        db: ZeroDB client (defaults to the global client)
+
+    Returns:
+        Dictionary mapping index names to document counts
+    """
+    if db is None:
+        from backend.services.zerodb_service import get_zerodb_client
+        db = get_zerodb_client()
+
+    profiles = {
+        str(document.get("data", {}).get("user_id")): document.get("data", {})
+        for document in _iter_documents(db, "profiles")
+    }
+    people = get_search_index(PEOPLE_INDEX).rebuild(
+        person_entry(document["id"], document.get("data", {}), profiles.get(str(document["id"])))
+        for document in _iter_documents(db, "users")
+    )
+    resources = get_search_index(RESOURCES_INDEX).rebuild(
+        resource_entry(document["id"], document.get("data", {}))
+        for document in _iter_documents(db, "resources")
+    )
+    return {PEOPLE_INDEX: people, RESOURCES_INDEX: resources}
+
+
+def save_snapshots() -> None:
+    """Refresh the shared snapshot of every ready index, shortening replays at start"""
+    for name in (PEOPLE_INDEX, RESOURCES_INDEX):
+        index = get_search_index(name)
+        index.sync(force=True)
+        index.save_snapshot()
+
+
+# Global index instances
+_search_indexes: Dict[str, SearchIndex] = {}
+_search_indexes_lock = threading.Lock()
+
+
+def get_search_index(name: str) -> SearchIndex:
+    """
+    Get or create the global SearchIndex of a document type
+
+    Args:
+        name: Index name (PEOPLE_INDEX or RESOURCES_INDEX)
+
+    Returns:
+        SearchIndex instance backed by settings.REDIS_URL
+    """
+    with _search_indexes_lock:
+        if name not in _search_indexes:
+            _search_indexes[name] = SearchIndex(
+                name,
+                redis_client=redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_connect_timeout=1,
+                    socket_timeout=5
+                )
+            )
+        return _search_indexes[name]
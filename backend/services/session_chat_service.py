@@ -11,6 +11,11 @@ Provides chat functionality for live training sessions including:
 - Rate limiting
 - Chat export
 - Typing indicators
+
+Messages, reactions and raised hands are written behind: they are buffered
+in a durable Redis stream and persisted to ZeroDB in batches by the chat
+persistence worker (see chat_write_behind_service), falling back to a
+synchronous write when Redis is unavailable.
 """
 
 import csv
@@ -32,6 +37,10 @@ from backend.models.schemas import (
     ReactionType,
     UserRole
 )
+from backend.services.chat_write_behind_service import (
+    ChatWriteBehindService,
+    ChatWriteBehindError
+)
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBError
 
 
@@ -42,6 +51,13 @@ logger = logging.getLogger(__name__)
 profanity.load_censor_words()
 
 
+def _timestamp_key(value: Any) -> str:
+    """Sort key for timestamps stored either as datetimes or ISO strings"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or ""
+
+
 class SessionChatError(Exception):
     """Base exception for session chat operations"""
     pass
@@ -80,6 +96,7 @@ class SessionChatService:
         """
         self.db = db_client or ZeroDBClient()
         self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.write_buffer = ChatWriteBehindService(redis_client=self.redis_client, db_client=self.db)
 
         # Rate limiting configuration
         self.message_rate_limit = 5  # messages
@@ -289,9 +306,13 @@ class SessionChatService:
                 timestamp=datetime.utcnow()
             )
 
-            # Store in database
+            # Buffer for batched persistence (synchronous write if Redis is down)
             message_data = chat_message.model_dump(mode='json')
-            result = self.db.insert_one("session_chat_messages", message_data)
+            try:
+                self.write_buffer.append_message(message_data)
+            except ChatWriteBehindError as e:
+                logger.warning(f"{e}; writing message directly")
+                self.db.insert_one("session_chat_messages", message_data)
 
             logger.info(
                 f"Message sent in session {session_id} by user {user_id}. "
@@ -317,6 +338,9 @@ class SessionChatService:
         """
         Get chat messages for a session
 
+        Recent messages (including ones not yet persisted) come from the
+        session's history stream; only older messages are read from ZeroDB.
+
         Args:
             session_id: Training session ID
             user_id: Current user ID (for filtering private messages)
@@ -328,6 +352,15 @@ class SessionChatService:
             List of SessionChatMessage objects
         """
         try:
+            recent = self._merge_pending(
+                self.write_buffer.get_recent_messages(str(session_id)),
+                self.write_buffer.get_pending_messages(str(session_id))
+            )
+            recent = [
+                msg for msg in recent
+                if self._is_visible(msg, user_id, is_instructor)
+            ]
+
             # Build query
             query: Dict[str, Any] = {
                 "session_id": str(session_id),
@@ -345,6 +378,10 @@ class SessionChatService:
                     {"is_private": True, "recipient_id": str(user_id)}
                 ]
 
+            # Older history lives in ZeroDB
+            if recent:
+                query["timestamp"] = {"$lt": recent[0]["timestamp"]}
+
             # Query database
             messages_data = self.db.find(
                 "session_chat_messages",
@@ -354,6 +391,20 @@ class SessionChatService:
                 sort={"timestamp": 1}  # Oldest first
             )
 
+            # Continue the page into recent history
+            if recent and len(messages_data) < limit:
+                if messages_data or offset == 0:
+                    older_count = offset + len(messages_data)
+                else:
+                    older_count = len(self.db.find(
+                        "session_chat_messages",
+                        query,
+                        limit=offset,
+                        sort={"timestamp": 1}
+                    ))
+                start = max(0, offset - older_count)
+                messages_data = list(messages_data) + recent[start:start + limit - len(messages_data)]
+
             messages = [SessionChatMessage(**msg) for msg in messages_data]
 
             logger.info(f"Retrieved {len(messages)} messages for session {session_id}")
@@ -364,6 +415,27 @@ class SessionChatService:
             logger.error(f"Error retrieving messages: {e}")
             raise SessionChatError(f"Failed to retrieve messages: {e}")
 
+    @staticmethod
+    def _merge_pending(
+        messages: List[Dict[str, Any]],
+        pending: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Add pending messages missing from a message list, keeping timestamp order"""
+        known = {str(msg.get("id")) for msg in messages}
+        missing = [msg for msg in pending if str(msg.get("id")) not in known]
+        if not missing:
+            return messages
+        return sorted(messages + missing, key=lambda msg: _timestamp_key(msg.get("timestamp")))
+
+    @staticmethod
+    def _is_visible(message: Dict[str, Any], user_id: UUID, is_instructor: bool) -> bool:
+        """Whether a buffered message is visible to a user"""
+        if message.get("is_deleted"):
+            return False
+        if is_instructor or not message.get("is_private"):
+            return True
+        return str(user_id) in (str(message.get("user_id")), str(message.get("recipient_id")))
+
     def delete_message(
         self,
         message_id: UUID,
@@ -396,13 +468,24 @@ class SessionChatService:
                 "deleted_by": str(deleted_by)
             }
 
-            self.db.update_one("session_chat_messages", str(message_id), update_data)
+            # Hide from recent history right away
+            self.write_buffer.mark_deleted(
+                str(message_id), update_data["deleted_by"], update_data["deleted_at"]
+            )
+
+            if self.write_buffer.get_pending_message(str(message_id)):
+                # Not persisted yet: delete after the buffered insert
+                self.write_buffer.append_delete(
+                    str(message_id), update_data["deleted_by"], update_data["deleted_at"]
+                )
+            else:
+                self.db.update_one("session_chat_messages", str(message_id), update_data)
 
             logger.info(f"Message {message_id} deleted by user {deleted_by}")
 
             return True
 
-        except ZeroDBError as e:
+        except (ZeroDBError, ChatWriteBehindError) as e:
             logger.error(f"Error deleting message: {e}")
             raise SessionChatError(f"Failed to delete message: {e}")
 
@@ -538,20 +621,23 @@ class SessionChatService:
             # Check rate limit
             self._check_rate_limit(user_id, "reaction", is_instructor)
 
-            # Get current message
-            message_data = self.db.find_by_id("session_chat_messages", str(message_id))
+            # Message may still be buffered
+            message_data = (
+                self.write_buffer.get_pending_message(str(message_id))
+                or self.db.find_by_id("session_chat_messages", str(message_id))
+            )
             if not message_data:
                 raise SessionChatError("Message not found")
 
-            message = SessionChatMessage(**message_data)
-
-            # Update reactions
-            reactions = message.reactions or {}
-            reactions[reaction] = reactions.get(reaction, 0) + 1
-
-            # Update in database
-            update_data = {"reactions": reactions}
-            self.db.update_one("session_chat_messages", str(message_id), update_data)
+            # Buffer the increment (synchronous update if Redis is down)
+            try:
+                self.write_buffer.append_reaction(str(message_id), reaction)
+            except ChatWriteBehindError as e:
+                logger.warning(f"{e}; updating reactions directly")
+                message = SessionChatMessage(**message_data)
+                reactions = message.reactions or {}
+                reactions[reaction] = reactions.get(reaction, 0) + 1
+                self.db.update_one("session_chat_messages", str(message_id), {"reactions": reactions})
 
             logger.info(f"Reaction {reaction} added to message {message_id} by user {user_id}")
 
@@ -592,6 +678,11 @@ class SessionChatService:
             }
 
             existing = self.db.find("session_raised_hands", query, limit=1)
+            if not existing:
+                existing = [
+                    hand for hand in self.write_buffer.get_pending_hands(str(session_id))
+                    if hand.get("user_id") == str(user_id) and hand.get("is_active")
+                ]
 
             if existing:
                 # Hand already raised
@@ -605,9 +696,13 @@ class SessionChatService:
                 is_active=True
             )
 
-            # Store in database
+            # Buffer for batched persistence (synchronous write if Redis is down)
             hand_data = raised_hand.model_dump(mode='json')
-            self.db.insert_one("session_raised_hands", hand_data)
+            try:
+                self.write_buffer.append_raised_hand(hand_data)
+            except ChatWriteBehindError as e:
+                logger.warning(f"{e}; writing raised hand directly")
+                self.db.insert_one("session_raised_hands", hand_data)
 
             logger.info(f"User {user_id} raised hand in session {session_id}")
 
@@ -658,6 +753,15 @@ class SessionChatService:
 
                 self.db.update_one("session_raised_hands", hand_data["id"], update_data)
 
+            # Lower hands that are not persisted yet
+            for hand_data in self.write_buffer.get_pending_hands(str(session_id)):
+                if hand_data.get("user_id") != str(user_id) or not hand_data.get("is_active"):
+                    continue
+                hand_data.update(is_active=False, lowered_at=datetime.utcnow().isoformat())
+                if acknowledged_by:
+                    hand_data["acknowledged_by"] = str(acknowledged_by)
+                self.write_buffer.update_pending_hand(hand_data)
+
             logger.info(f"User {user_id} lowered hand in session {session_id}")
 
             return True
@@ -691,6 +795,18 @@ class SessionChatService:
                 sort={"raised_at": 1}  # Oldest first
             )
 
+            # Include hands that are not persisted yet
+            known = {str(hand.get("id")) for hand in hands_data}
+            pending = [
+                hand for hand in self.write_buffer.get_pending_hands(str(session_id))
+                if hand.get("is_active") and str(hand.get("id")) not in known
+            ]
+            if pending:
+                hands_data = sorted(
+                    list(hands_data) + pending,
+                    key=lambda hand: _timestamp_key(hand.get("raised_at"))
+                )
+
             hands = [SessionRaisedHand(**hand) for hand in hands_data]
 
             return hands
@@ -803,12 +919,17 @@ class SessionChatService:
             if not include_private:
                 query["is_private"] = False
 
-            # Get all messages
+            # Get all messages, including ones not persisted yet
             messages_data = self.db.find(
                 "session_chat_messages",
                 query,
                 sort={"timestamp": 1}
             )
+            pending = [
+                msg for msg in self.write_buffer.get_pending_messages(str(session_id))
+                if not msg.get("is_deleted") and (include_private or not msg.get("is_private"))
+            ]
+            messages_data = self._merge_pending(list(messages_data), pending)
 
             if format == "json":
                 return json.dumps(messages_data, indent=2, default=str)
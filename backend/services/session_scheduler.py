@@ -7,17 +7,14 @@ Provides background scheduling for training session lifecycle management:
 - Auto-end sessions 30 minutes after scheduled end time if still live
 - Clean up ended sessions after 7 days
 
-Uses APScheduler for cron job management.
+Jobs run on the shared Redis-backed JobRunner, so each runs once per
+schedule however many replicas start the scheduler.
 """
 
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
-
 from backend.services.training_session_service import get_training_session_service
 from backend.services.cloudflare_calls_service import (
     get_cloudflare_calls_service,
@@ -25,6 +22,12 @@ from backend.services.cloudflare_calls_service import (
 )
 from backend.services.email_service import get_email_service
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
+from backend.services.job_runner import (
+    JobRunner,
+    get_job_runner,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+)
 from backend.models.schemas import SessionStatus
 
 # Configure logging
@@ -48,9 +51,14 @@ class SessionScheduler:
         scheduler.shutdown()
     """
 
-    def __init__(self):
-        """Initialize Session Scheduler"""
-        self.scheduler = BackgroundScheduler()
+    def __init__(self, runner: Optional[JobRunner] = None):
+        """
+        Initialize Session Scheduler
+
+        Args:
+            runner: Job runner (defaults to the global runner)
+        """
+        self.runner = runner or get_job_runner()
         self.session_service = get_training_session_service()
         self.cloudflare = get_cloudflare_calls_service()
         self.email_service = get_email_service()
@@ -58,55 +66,59 @@ class SessionScheduler:
 
         logger.info("SessionScheduler initialized")
 
-    def start(self):
+    def register_jobs(self, runner: Optional[JobRunner] = None):
         """
-        Start the background scheduler
+        Register the session jobs on a job runner
 
-        Configures and starts all scheduled jobs:
         - Room creation check: Every 5 minutes
         - Email reminders: Every 5 minutes
         - Auto-end sessions: Every 5 minutes
-        - Cleanup: Daily at 2 AM
+        - Cleanup: Daily at 2 AM UTC
+
+        Args:
+            runner: Job runner (defaults to this scheduler's runner)
+        """
+        runner = runner or self.runner
+
+        # Job 1: Create rooms 1 hour before session start
+        runner.register(
+            "create_rooms",
+            self._create_rooms_for_upcoming_sessions,
+            interval=5 * 60,
+            priority=PRIORITY_HIGH
+        )
+
+        # Job 2: Send reminder emails
+        runner.register(
+            "send_reminders",
+            self._send_reminder_emails,
+            interval=5 * 60,
+            priority=PRIORITY_HIGH
+        )
+
+        # Job 3: Auto-end sessions that ran over time
+        runner.register(
+            "auto_end_sessions",
+            self._auto_end_overdue_sessions,
+            interval=5 * 60,
+            priority=PRIORITY_HIGH
+        )
+
+        # Job 4: Clean up ended sessions (daily at 2 AM)
+        runner.register(
+            "cleanup_sessions",
+            self._cleanup_old_sessions,
+            daily_at="02:00",
+            priority=PRIORITY_LOW
+        )
+
+    def start(self):
+        """
+        Register the session jobs and start the job runner in this process
         """
         try:
-            # Job 1: Create rooms 1 hour before session start
-            self.scheduler.add_job(
-                func=self._create_rooms_for_upcoming_sessions,
-                trigger=IntervalTrigger(minutes=5),
-                id="create_rooms",
-                name="Create Cloudflare rooms for upcoming sessions",
-                replace_existing=True
-            )
-
-            # Job 2: Send reminder emails
-            self.scheduler.add_job(
-                func=self._send_reminder_emails,
-                trigger=IntervalTrigger(minutes=5),
-                id="send_reminders",
-                name="Send session reminder emails",
-                replace_existing=True
-            )
-
-            # Job 3: Auto-end sessions that ran over time
-            self.scheduler.add_job(
-                func=self._auto_end_overdue_sessions,
-                trigger=IntervalTrigger(minutes=5),
-                id="auto_end_sessions",
-                name="Auto-end overdue sessions",
-                replace_existing=True
-            )
-
-            # Job 4: Clean up ended sessions (daily at 2 AM)
-            self.scheduler.add_job(
-                func=self._cleanup_old_sessions,
-                trigger=CronTrigger(hour=2, minute=0),
-                id="cleanup_sessions",
-                name="Clean up old ended sessions",
-                replace_existing=True
-            )
-
-            # Start scheduler
-            self.scheduler.start()
+            self.register_jobs()
+            self.runner.start()
             logger.info("SessionScheduler started successfully")
 
         except Exception as e:
@@ -115,15 +127,14 @@ class SessionScheduler:
 
     def shutdown(self, wait: bool = True):
         """
-        Shutdown the scheduler gracefully
+        Shutdown the job runner gracefully
 
         Args:
             wait: Whether to wait for running jobs to complete
         """
         try:
-            if self.scheduler.running:
-                self.scheduler.shutdown(wait=wait)
-                logger.info("SessionScheduler shutdown successfully")
+            self.runner.shutdown(wait=wait)
+            logger.info("SessionScheduler shutdown successfully")
         except Exception as e:
             logger.error(f"Error shutting down SessionScheduler: {e}")
 
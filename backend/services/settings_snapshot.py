@@ -0,0 +1,194 @@
+"""
+Settings Snapshot - process-local admin settings, refreshed by version
+
+Admin settings change a few times a year but were read from ZeroDB and
+Fernet-decrypted on every request. Each process now keeps one snapshot
+holding the settings together with their decrypted and masked response
+forms:
+- A version counter in Redis (``VERSION_KEY``) is bumped by every write
+  (the PATCH endpoints); the snapshot is rebuilt when the counter moved
+- The counter is read at most once per ``check_interval``, so a settings
+  read is a dictionary lookup with no cryptography or database access
+- A bump also drops this process's snapshot at once; other workers pick
+  up the change on their next version check
+
+Redis is an accelerator only: when it is unreachable a snapshot is trusted
+for ``MAX_AGE_WITHOUT_REDIS`` seconds and then rebuilt.
+
+Usage:
+    cache = get_settings_snapshot_cache()
+    snapshot = await cache.get(build)   # build() loads and decrypts
+    snapshot.decrypted["stripe_secret_key"]
+    cache.bump()                        # after writing settings
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+import redis
+
+from backend.config import settings
+from backend.models.schemas import AdminSettings
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "admin_settings:version"
+VERSION_CHECK_INTERVAL = 1.0  # Seconds between reads of the version counter
+MAX_AGE_WITHOUT_REDIS = 30.0  # Seconds a snapshot is trusted while Redis is unreachable
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after an error
+
+
+class SettingsSnapshot(NamedTuple):
+    """Admin settings with their response forms, built once per version"""
+    settings: AdminSettings
+    decrypted: Dict[str, Any]  # Sensitive fields decrypted
+    masked: Dict[str, Any]  # Sensitive fields masked
+
+
+SnapshotBuilder = Callable[[], Awaitable[SettingsSnapshot]]
+
+
+class SettingsSnapshotCache:
+    """
+    Process-local admin settings snapshot keyed by a Redis version counter
+
+    Callers must treat the snapshot as read-only; it is shared by every
+    request of the process.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        check_interval: float = VERSION_CHECK_INTERVAL
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            redis_client: Redis client holding the version counter (optional)
+            check_interval: Seconds between reads of the version counter
+        """
+        self.redis_client = redis_client
+        self.check_interval = check_interval
+
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._version: Optional[str] = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._generation = 0  # Bumped locally; a build started before a bump is discarded
+        self._lock = threading.Lock()
+        self._redis_retry_at = 0.0
+        self.stats = {"hits": 0, "builds": 0, "errors": 0}
+
+    async def get(self, build: SnapshotBuilder) -> SettingsSnapshot:
+        """
+        Return the current snapshot, rebuilding it if the settings changed
+
+        Args:
+            build: Loads the settings and builds a snapshot
+
+        Returns:
+            SettingsSnapshot
+
+        Raises:
+            Exception: Whatever ``build`` raises when a rebuild is needed
+        """
+        now = time.monotonic()
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.check_interval:
+                self.stats["hits"] += 1
+                return snapshot
+            generation = self._generation
+
+        version = self._read_version()
+        with self._lock:
+            if self._snapshot is not None and self._generation == generation and self._fresh(version, now):
+                self._checked_at = now
+                self.stats["hits"] += 1
+                return self._snapshot
+
+        snapshot = await build()
+
+        with self._lock:
+            self.stats["builds"] += 1
+            if self._generation == generation:
+                self._snapshot = snapshot
+                self._version = version
+                self._built_at = now
+                self._checked_at = now
+        return snapshot
+
+    def bump(self) -> None:
+        """
+        Record that the settings were written
+
+        Drops this process's snapshot and bumps the shared version counter
+        so other workers rebuild theirs.
+        """
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.incr(VERSION_KEY)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def _fresh(self, version: Optional[str], now: float) -> bool:
+        if version is None:
+            return now - self._built_at < MAX_AGE_WITHOUT_REDIS
+        return version == self._version
+
+    def _read_version(self) -> Optional[str]:
+        """Current version counter ("0" before the first bump), or None without Redis"""
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            return str(client.get(VERSION_KEY) or "0")
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if self.redis_client is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self.redis_client
+
+    def _redis_failed(self, error: Exception) -> None:
+        with self._lock:
+            self.stats["errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Settings snapshot bypassing Redis for {REDIS_RETRY_INTERVAL}s: {error}")
+
+
+# Global cache instance
+_settings_snapshot_cache_instance: Optional[SettingsSnapshotCache] = None
+
+
+def get_settings_snapshot_cache() -> SettingsSnapshotCache:
+    """
+    Get or create the global SettingsSnapshotCache instance
+
+    Returns:
+        SettingsSnapshotCache instance backed by settings.REDIS_URL
+    """
+    global _settings_snapshot_cache_instance
+
+    if _settings_snapshot_cache_instance is None:
+        _settings_snapshot_cache_instance = SettingsSnapshotCache(
+            redis_client=redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+        )
+
+    return _settings_snapshot_cache_instance
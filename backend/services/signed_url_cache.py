@@ -0,0 +1,393 @@
+"""
+Signed URL Cache - reuse signed URLs while they have validity left
+
+Minting a signed URL can cost a remote call (ZeroDB object storage, or
+Cloudflare Stream when no local signing key is configured), yet one URL
+can be handed to every viewer of an asset until it nears expiry. URLs are
+cached per (asset, audience, permissions):
+- A cached URL is returned while at least ``min_validity`` of the
+  requested lifetime is left, and never when it would outlive the
+  requested lifetime
+- Once less than ``refresh_at`` of the lifetime is left the cached URL is
+  still returned, and a replacement is minted in the background (one
+  refresh per URL at a time)
+- Two tiers: an in-process LRU, and optionally one Redis hash per asset
+  shared by all workers, so ``invalidate(asset)`` is a single DEL
+- ``get_or_mint_many`` serves list endpoints: one Redis round trip for all
+  lookups and one batch mint call for all misses
+
+Redis is an accelerator only: when it is unreachable the cache falls back
+to the in-process tier and retries Redis after ``REDIS_RETRY_INTERVAL``.
+
+Usage:
+    cache = get_signed_url_cache()
+    signed = cache.get_or_mint(
+        f"stream:{video_id}",
+        ttl=3600,
+        mint=lambda ttl: stream.sign(video_id, ttl),
+    )
+    signed.url, signed.expires_in
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import redis
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "signed_url:"
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MIN_VALIDITY = 0.25  # Fraction of the requested lifetime a cached URL must have left
+DEFAULT_REFRESH_AT = 0.5  # Refresh in the background below this fraction
+REFRESH_WORKERS = 4
+REDIS_RETRY_INTERVAL = 30  # Seconds to bypass Redis after an error
+CLOCK_SLACK = 5  # Seconds a cached URL may exceed the requested lifetime
+
+DEFAULT_AUDIENCE = "default"
+DEFAULT_PERMISSIONS = "read"
+
+CacheKey = Tuple[str, str, str]  # (asset, audience, permissions)
+Minter = Callable[[int], str]
+BatchMinter = Callable[[List[str], int], Dict[str, str]]
+
+
+class SignedUrl(NamedTuple):
+    """A signed URL and when it stops working"""
+    url: str
+    expires_at: float  # Unix timestamp
+
+    @property
+    def expires_in(self) -> int:
+        """Seconds of validity left"""
+        return max(0, int(self.expires_at - time.time()))
+
+
+class SignedUrlCache:
+    """
+    Two-tier cache of signed URLs with early background refresh
+
+    Thread-safe; callers on the event loop can use it directly since hits
+    never block on the network beyond one Redis round trip.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        min_validity: float = DEFAULT_MIN_VALIDITY,
+        refresh_at: float = DEFAULT_REFRESH_AT
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            redis_client: Redis client shared by all workers (optional)
+            max_entries: Size of the in-process LRU
+            min_validity: Fraction of the requested lifetime a cached URL
+                must still have to be returned
+            refresh_at: Fraction of the requested lifetime below which a
+                returned URL is refreshed in the background
+        """
+        if not 0 < min_validity < refresh_at <= 1:
+            raise ValueError("Expected 0 < min_validity < refresh_at <= 1")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.redis_client = redis_client
+        self.max_entries = max_entries
+        self.min_validity = min_validity
+        self.refresh_at = refresh_at
+
+        self._local: "OrderedDict[CacheKey, SignedUrl]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._redis_retry_at = 0.0
+        self.stats = {"hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    def get_or_mint(
+        self,
+        asset: str,
+        ttl: int,
+        mint: Minter,
+        audience: str = DEFAULT_AUDIENCE,
+        permissions: str = DEFAULT_PERMISSIONS
+    ) -> SignedUrl:
+        """
+        Return a cached signed URL for an asset, minting one if needed
+
+        Args:
+            asset: Asset identifier (e.g. ``stream:<video_id>``)
+            ttl: Requested lifetime in seconds
+            mint: Returns a new URL valid for the given number of seconds
+            audience: Who the URL is for (e.g. an access level)
+            permissions: What the URL allows (e.g. ``read``, ``download``)
+
+        Returns:
+            SignedUrl
+
+        Raises:
+            Exception: Whatever ``mint`` raises on a miss
+        """
+        return self.get_or_mint_many(
+            [asset],
+            ttl,
+            lambda assets, seconds: {asset: mint(seconds)},
+            audience=audience,
+            permissions=permissions
+        )[asset]
+
+    def get_or_mint_many(
+        self,
+        assets: List[str],
+        ttl: int,
+        mint_many: BatchMinter,
+        audience: str = DEFAULT_AUDIENCE,
+        permissions: str = DEFAULT_PERMISSIONS
+    ) -> Dict[str, SignedUrl]:
+        """
+        Return signed URLs for several assets, minting the misses in one call
+
+        Args:
+            assets: Asset identifiers
+            ttl: Requested lifetime in seconds
+            mint_many: Returns ``{asset: url}`` for a list of assets; assets
+                it leaves out are left out of the result
+            audience: Who the URLs are for
+            permissions: What the URLs allow
+
+        Returns:
+            Dictionary mapping assets to SignedUrl
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        keys = {asset: (asset, audience, permissions) for asset in dict.fromkeys(assets)}
+        cached = self._lookup(list(keys.values()))
+        now = time.time()
+
+        result: Dict[str, SignedUrl] = {}
+        missing: List[str] = []
+        stale: List[str] = []
+
+        for asset, key in keys.items():
+            signed = cached.get(key)
+            if signed is not None and self._usable(signed, ttl, now):
+                result[asset] = signed
+                if signed.expires_at - now < ttl * self.refresh_at:
+                    stale.append(asset)
+            else:
+                missing.append(asset)
+
+        self._count("hits", len(result))
+        self._count("misses", len(missing))
+
+        if missing:
+            result.update(self._mint(missing, ttl, mint_many, audience, permissions))
+        if stale:
+            self._schedule_refresh(stale, ttl, mint_many, audience, permissions)
+
+        return result
+
+    def invalidate(self, asset: str) -> None:
+        """
+        Drop every cached URL of an asset (all audiences and permissions)
+
+        Args:
+            asset: Asset identifier
+        """
+        with self._lock:
+            for key in [key for key in self._local if key[0] == asset]:
+                del self._local[key]
+
+        client = self._redis()
+        if client is not None:
+            try:
+                client.delete(KEY_PREFIX + asset)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier"""
+        with self._lock:
+            self._local.clear()
+
+    def _usable(self, signed: SignedUrl, ttl: int, now: float) -> bool:
+        remaining = signed.expires_at - now
+        return ttl * self.min_validity <= remaining <= ttl + CLOCK_SLACK
+
+    def _mint(
+        self,
+        assets: List[str],
+        ttl: int,
+        mint_many: BatchMinter,
+        audience: str,
+        permissions: str
+    ) -> Dict[str, SignedUrl]:
+        minted_at = time.time()  # Before the call, so expiry is never overstated
+        urls = mint_many(assets, ttl)
+
+        minted = {
+            asset: SignedUrl(url=url, expires_at=minted_at + ttl)
+            for asset, url in urls.items()
+            if url
+        }
+        self._store({(asset, audience, permissions): signed for asset, signed in minted.items()}, ttl)
+        return minted
+
+    def _schedule_refresh(
+        self,
+        assets: List[str],
+        ttl: int,
+        mint_many: BatchMinter,
+        audience: str,
+        permissions: str
+    ) -> None:
+        with self._lock:
+            pending = [asset for asset in assets if (asset, audience, permissions) not in self._refreshing]
+            if not pending:
+                return
+            self._refreshing.update((asset, audience, permissions) for asset in pending)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS,
+                    thread_name_prefix="signed-url-refresh"
+                )
+
+        self._executor.submit(self._refresh, pending, ttl, mint_many, audience, permissions)
+
+    def _refresh(
+        self,
+        assets: List[str],
+        ttl: int,
+        mint_many: BatchMinter,
+        audience: str,
+        permissions: str
+    ) -> None:
+        try:
+            self._mint(assets, ttl, mint_many, audience, permissions)
+            self._count("refreshes", len(assets))
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Background refresh of {len(assets)} signed URL(s) failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.difference_update((asset, audience, permissions) for asset in assets)
+
+    def _lookup(self, keys: List[CacheKey]) -> Dict[CacheKey, SignedUrl]:
+        found: Dict[CacheKey, SignedUrl] = {}
+        with self._lock:
+            for key in keys:
+                signed = self._local.get(key)
+                if signed is not None:
+                    self._local.move_to_end(key)
+                    found[key] = signed
+
+        # A local entry may predate another worker's refresh; it is still
+        # served as long as it is usable, so Redis is only read on local misses
+        absent = [key for key in keys if key not in found]
+        client = self._redis() if absent else None
+        if client is None:
+            return found
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for asset, audience, permissions in absent:
+                pipe.hget(KEY_PREFIX + asset, f"{audience}|{permissions}")
+            values = pipe.execute()
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return found
+
+        shared = {}
+        for key, value in zip(absent, values):
+            if value:
+                try:
+                    data = json.loads(value)
+                    shared[key] = SignedUrl(url=data["url"], expires_at=float(data["expires_at"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+        self._put_local(shared)
+        found.update(shared)
+        return found
+
+    def _store(self, entries: Dict[CacheKey, SignedUrl], ttl: int) -> None:
+        if not entries:
+            return
+        self._put_local(entries)
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for (asset, audience, permissions), signed in entries.items():
+                hash_key = KEY_PREFIX + asset
+                pipe.hset(
+                    hash_key,
+                    f"{audience}|{permissions}",
+                    json.dumps({"url": signed.url, "expires_at": signed.expires_at})
+                )
+                pipe.expire(hash_key, math.ceil(ttl))
+            pipe.execute()
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def _put_local(self, entries: Dict[CacheKey, SignedUrl]) -> None:
+        with self._lock:
+            for key, signed in entries.items():
+                self._local[key] = signed
+                self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _redis(self) -> Optional[redis.Redis]:
+        if self.redis_client is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self.redis_client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._count("errors")
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Signed URL cache bypassing Redis for {REDIS_RETRY_INTERVAL}s: {error}")
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        if amount:
+            with self._lock:
+                self.stats[stat] += amount
+
+
+# Global cache instance
+_signed_url_cache_instance: Optional[SignedUrlCache] = None
+
+
+def get_signed_url_cache() -> SignedUrlCache:
+    """
+    Get or create the global SignedUrlCache instance
+
+    Returns:
+        SignedUrlCache instance backed by settings.REDIS_URL
+    """
+    global _signed_url_cache_instance
+
+    if _signed_url_cache_instance is None:
+        _signed_url_cache_instance = SignedUrlCache(
+            redis_client=redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+        )
+
+    return _signed_url_cache_instance
@@ -7,19 +7,26 @@ error handling with retry logic, and Redis caching.
 
 Features:
 - Fetch articles from Strapi REST API
-- Transform Strapi response to Article model
+- Pagination, category/tag filters and field selection pushed down to
+  the Strapi query, with one cached page per query shape
+- Conditional refreshes (If-None-Match/If-Modified-Since) against Strapi
+- Transform Strapi response to Article model, once per article version
 - API token authentication
 - Exponential backoff retry logic
-- Redis caching with 5-minute TTL
+- Redis caching with 5-minute TTL, single-flight misses and
+  stale-while-revalidate refresh
 - Connection pooling
 - Comprehensive error handling
 
 Strapi API Documentation: https://docs.strapi.io/dev-docs/api/rest
 """
 
+import hashlib
 import logging
 import json
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 from datetime import datetime
 from urllib.parse import urljoin
 
@@ -29,6 +36,7 @@ from urllib3.util.retry import Retry
 
 from backend.config import settings
 from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import BLOG_CONTENT, bump_content_version
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -59,12 +67,19 @@ class StrapiValidationError(StrapiError):
     pass
 
 
+class ArticlePage(NamedTuple):
+    """One page of transformed articles"""
+    articles: List[Dict[str, Any]]
+    total: int  # Articles matching the query across all pages
+
+
 class StrapiService:
     """
     Strapi CMS Integration Service
 
     Provides methods for:
     - Fetching articles from Strapi API
+    - Fetching filtered pages of articles, cached per query shape
     - Transforming Strapi responses to Article model
     - API token authentication
     - Automatic retry with exponential backoff
@@ -74,8 +89,17 @@ class StrapiService:
     """
 
     # Cache configuration
+    CACHE_NAMESPACE = "blog"
     CACHE_KEY_PREFIX = "strapi:articles"
     CACHE_TTL = 300  # 5 minutes in seconds
+    CACHE_STALE_TTL = 60  # Serve stale articles up to 1 minute while refreshing
+    CACHE_VALIDATOR_TTL = 86400  # Keep Strapi validators a day for conditional refreshes
+    TRANSFORM_CACHE_SIZE = 1000  # Transformed article versions kept per process
+
+    # Attributes requested from Strapi instead of populate="*"; list pages
+    # leave out the article body
+    SUMMARY_FIELDS = ("title", "slug", "excerpt", "author", "category", "publishedAt", "updatedAt")
+    ARTICLE_FIELDS = SUMMARY_FIELDS + ("content",)
 
     def __init__(
         self,
@@ -104,6 +128,11 @@ class StrapiService:
         # Initialize cache service
         self.cache = get_cache_service()
 
+        # Transformed articles by (id, updatedAt, attributes); refreshes run
+        # in background threads
+        self._transformed: OrderedDict = OrderedDict()
+        self._transformed_lock = threading.Lock()
+
         # Validate configuration
         if not self.strapi_url:
             raise StrapiError("STRAPI_URL is required")
@@ -234,114 +263,243 @@ class StrapiService:
             logger.error(f"Request error: {e}")
             raise StrapiError(f"Request failed: {e}")
 
-    def _get_from_cache(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+    def fetch_articles(
+        self,
+        limit: int = 50,
+        sort: str = "publishedAt:desc",
+        populate: Optional[str] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
         """
-        Get data from Redis cache
+        Fetch articles from Strapi API
 
         Args:
-            cache_key: Cache key to retrieve
+            limit: Maximum number of articles to fetch (default: 50)
+            sort: Sort order (default: "publishedAt:desc")
+            populate: Relations to populate (default: None, selects
+                ARTICLE_FIELDS and the featured image URL)
+            use_cache: Whether to use Redis cache (default: True)
 
         Returns:
-            Cached data or None if not found or on error
+            List of transformed article dictionaries
+
+        Raises:
+            StrapiError: If fetch fails
         """
-        try:
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"Cache hit: {cache_key}")
-                return cached_data
-            logger.debug(f"Cache miss: {cache_key}")
-            return None
-        except Exception as e:
-            logger.warning(f"Cache retrieval error for key {cache_key}: {e}")
-            return None
+        if not use_cache:
+            return self._fetch_articles_from_api(limit, sort, populate)
+
+        # Generate cache key (versioned by the blog namespace)
+        cache_key = self.cache.versioned_key(
+            self.CACHE_NAMESPACE, f"{self.CACHE_KEY_PREFIX}:list:{limit}:{sort}"
+        )
+
+        # Concurrent misses share one Strapi request; empty results are not cached
+        articles = self.cache.get_or_compute(
+            cache_key,
+            lambda: self._fetch_articles_from_api(limit, sort, populate) or None,
+            ttl=self.CACHE_TTL,
+            stale_ttl=self.CACHE_STALE_TTL
+        )
+        return articles or []
 
-    def _set_in_cache(self, cache_key: str, data: List[Dict[str, Any]]) -> bool:
+    def _fetch_articles_from_api(
+        self,
+        limit: int,
+        sort: str,
+        populate: Optional[str]
+    ) -> List[Dict[str, Any]]:
         """
-        Store data in Redis cache with TTL
+        Fetch and transform articles from the Strapi API (uncached)
 
         Args:
-            cache_key: Cache key to store under
-            data: Data to cache
+            limit: Maximum number of articles to fetch
+            sort: Sort order
+            populate: Relations to populate (None selects ARTICLE_FIELDS)
 
         Returns:
-            True if successful, False otherwise
+            List of transformed article dictionaries
+
+        Raises:
+            StrapiError: If fetch fails
         """
         try:
-            success = self.cache.set(cache_key, data, expiration=self.CACHE_TTL)
-            if success:
-                logger.debug(f"Cached data with key: {cache_key} (TTL: {self.CACHE_TTL}s)")
-            return success
+            url = self._build_url("api", "articles")
+
+            params = {
+                "sort": sort,
+                "pagination[limit]": limit,
+                **self._selection_params(self.ARTICLE_FIELDS, populate)
+            }
+
+            logger.info(f"Fetching articles from Strapi: {url}")
+            response = self.session.get(
+                url,
+                headers=self.headers,
+                params=params,
+                timeout=self.timeout
+            )
+
+            result = self._handle_response(response)
+
+            # Extract articles from Strapi response
+            strapi_articles = result.get("data", [])
+            logger.info(f"Fetched {len(strapi_articles)} articles from Strapi")
+
+            # Transform to our Article model format
+            return [self._transform_once(article) for article in strapi_articles]
+
+        except StrapiError:
+            raise
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Connection error: {e}")
+            raise StrapiConnectionError(f"Failed to connect to Strapi: {e}")
+        except requests.exceptions.Timeout as e:
+            logger.error(f"Timeout error: {e}")
+            raise StrapiConnectionError(f"Request timed out: {e}")
         except Exception as e:
-            logger.warning(f"Cache storage error for key {cache_key}: {e}")
-            return False
+            logger.error(f"Unexpected error fetching articles: {e}")
+            raise StrapiError(f"Failed to fetch articles: {e}")
 
-    def fetch_articles(
+    def fetch_article_page(
         self,
-        limit: int = 50,
+        offset: int = 0,
+        limit: int = 10,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
         sort: str = "publishedAt:desc",
-        populate: str = "*",
+        fields: Sequence[str] = SUMMARY_FIELDS,
         use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> ArticlePage:
         """
-        Fetch articles from Strapi API
+        Fetch one page of articles, filtered and paginated by Strapi
+
+        Only the requested page is downloaded and transformed. Pages are
+        cached per query shape (offset, limit, filters, sort, fields) in the
+        blog namespace, so invalidate_all() drops all of them.
 
         Args:
-            limit: Maximum number of articles to fetch (default: 50)
+            offset: Number of matching articles to skip (default: 0)
+            limit: Page size (default: 10)
+            category: Only articles in this category, case-insensitive (optional)
+            tag: Only articles with this tag, case-insensitive (optional)
             sort: Sort order (default: "publishedAt:desc")
-            populate: Fields to populate (default: "*")
+            fields: Article attributes to load (default: SUMMARY_FIELDS);
+                articles have no "content" unless it is selected
             use_cache: Whether to use Redis cache (default: True)
 
         Returns:
-            List of transformed article dictionaries
+            ArticlePage with the transformed articles and the number of
+            matching articles
 
         Raises:
             StrapiError: If fetch fails
         """
-        # Generate cache key
-        cache_key = f"{self.CACHE_KEY_PREFIX}:list:{limit}:{sort}"
+        params = {
+            "sort": sort,
+            "pagination[start]": offset,
+            "pagination[limit]": limit,
+            "pagination[withCount]": "true",
+            **self._selection_params(fields)
+        }
+        if category:
+            params["filters[category][$eqi]"] = category
+        if tag:
+            # Tags are a JSON array of strings; match a whole element
+            params["filters[tags][$containsi]"] = json.dumps(tag)
+
+        if not use_cache:
+            page = self._fetch_page_from_api(params, fields)
+        else:
+            # Generate cache key (versioned by the blog namespace)
+            shape = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+            cache_key = self.cache.versioned_key(
+                self.CACHE_NAMESPACE, f"{self.CACHE_KEY_PREFIX}:page:{shape}"
+            )
+
+            # Concurrent misses share one Strapi request; queries without
+            # matches are not cached
+            page = self.cache.get_or_compute(
+                cache_key,
+                lambda: self._fetch_page_from_api(params, fields, validator_key=f"{cache_key}:validators"),
+                ttl=self.CACHE_TTL,
+                stale_ttl=self.CACHE_STALE_TTL
+            )
+
+        if not page:
+            return ArticlePage(articles=[], total=0)
+        return ArticlePage(articles=page["articles"], total=page["total"])
+
+    def _fetch_page_from_api(
+        self,
+        params: Dict[str, Any],
+        fields: Sequence[str],
+        validator_key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and transform a page of articles from the Strapi API
 
-        # Try cache first if enabled
-        if use_cache:
-            cached_articles = self._get_from_cache(cache_key)
-            if cached_articles is not None:
-                logger.info(f"Returning {len(cached_articles)} articles from cache")
-                return cached_articles
+        With a validator_key, the page is kept with Strapi's ETag and
+        Last-Modified (when Strapi sends them) and the next fetch is a
+        conditional request: a 304 reuses the kept page without downloading
+        or transforming it again.
 
-        # Fetch from Strapi API
+        Args:
+            params: Strapi query parameters
+            fields: Article attributes selected by the query
+            validator_key: Cache key of the page's validators (optional)
+
+        Returns:
+            Dictionary with "articles" and "total", or None if no article matches
+
+        Raises:
+            StrapiError: If fetch fails
+        """
         try:
             url = self._build_url("api", "articles")
 
-            params = {
-                "populate": populate,
-                "sort": sort,
-                "pagination[limit]": limit
-            }
+            headers = dict(self.headers)
+            stored = self.cache.get(validator_key) if validator_key else None
+            if stored:
+                if stored.get("etag"):
+                    headers["If-None-Match"] = stored["etag"]
+                if stored.get("last_modified"):
+                    headers["If-Modified-Since"] = stored["last_modified"]
 
-            logger.info(f"Fetching articles from Strapi: {url}")
+            logger.info(f"Fetching article page from Strapi: {url}")
             response = self.session.get(
                 url,
-                headers=self.headers,
+                headers=headers,
                 params=params,
                 timeout=self.timeout
             )
 
-            result = self._handle_response(response)
+            if stored and response.status_code == 304:
+                logger.debug(f"Strapi article page not modified: {validator_key}")
+                self.cache.expire(validator_key, self.CACHE_VALIDATOR_TTL)
+                return stored["page"]
 
-            # Extract articles from Strapi response
-            strapi_articles = result.get("data", [])
-            logger.info(f"Fetched {len(strapi_articles)} articles from Strapi")
+            result = self._handle_response(response)
 
             # Transform to our Article model format
-            transformed_articles = [
-                self.transform_strapi_to_article(article)
-                for article in strapi_articles
-            ]
+            articles = [self._transform_once(article) for article in result.get("data", [])]
+            if "content" not in fields:
+                for article in articles:
+                    article.pop("content", None)
+
+            pagination = result.get("meta", {}).get("pagination", {})
+            page = {"articles": articles, "total": pagination.get("total", len(articles))}
+            logger.info(f"Fetched {len(articles)} of {page['total']} articles from Strapi")
 
-            # Cache the results
-            if use_cache and transformed_articles:
-                self._set_in_cache(cache_key, transformed_articles)
+            validators = self._response_validators(response)
+            if validator_key and validators:
+                self.cache.set(
+                    validator_key,
+                    {**validators, "page": page},
+                    expiration=self.CACHE_VALIDATOR_TTL
+                )
 
-            return transformed_articles
+            return page if page["total"] or articles else None
 
         except StrapiError:
             raise
@@ -352,13 +510,40 @@ class StrapiService:
             logger.error(f"Timeout error: {e}")
             raise StrapiConnectionError(f"Request timed out: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error fetching articles: {e}")
+            logger.error(f"Unexpected error fetching article page: {e}")
             raise StrapiError(f"Failed to fetch articles: {e}")
 
+    def _selection_params(self, fields: Sequence[str], populate: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the Strapi parameters selecting what a query returns
+
+        Args:
+            fields: Article attributes to return
+            populate: Legacy populate value; replaces the field selection
+
+        Returns:
+            Query parameters
+        """
+        if populate:
+            return {"populate": populate}
+
+        params = {f"fields[{index}]": field for index, field in enumerate(fields)}
+        params["populate[featured_image][fields][0]"] = "url"
+        return params
+
+    @staticmethod
+    def _response_validators(response: requests.Response) -> Dict[str, str]:
+        """ETag and Last-Modified sent by Strapi, if any"""
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        return {name: value for name, value in validators.items() if isinstance(value, str)}
+
     def fetch_article_by_slug(
         self,
         slug: str,
-        populate: str = "*",
+        populate: Optional[str] = None,
         use_cache: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
@@ -366,7 +551,8 @@ class StrapiService:
 
         Args:
             slug: Article slug
-            populate: Fields to populate (default: "*")
+            populate: Relations to populate (default: None, selects
+                ARTICLE_FIELDS and the featured image URL)
             use_cache: Whether to use Redis cache (default: True)
 
         Returns:
@@ -375,23 +561,47 @@ class StrapiService:
         Raises:
             StrapiError: If fetch fails
         """
-        # Generate cache key
-        cache_key = f"{self.CACHE_KEY_PREFIX}:slug:{slug}"
+        if not use_cache:
+            return self._fetch_article_from_api(slug, populate)
+
+        # Generate cache key (versioned by the blog namespace)
+        cache_key = self.cache.versioned_key(
+            self.CACHE_NAMESPACE, f"{self.CACHE_KEY_PREFIX}:slug:{slug}"
+        )
+
+        # Concurrent misses share one Strapi request; missing articles are not cached
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._fetch_article_from_api(slug, populate),
+            ttl=self.CACHE_TTL,
+            stale_ttl=self.CACHE_STALE_TTL,
+            tags=[self._article_tag(slug)]
+        )
+
+    def _fetch_article_from_api(
+        self,
+        slug: str,
+        populate: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and transform a single article by slug from the Strapi API (uncached)
 
-        # Try cache first if enabled
-        if use_cache:
-            cached_article = self.cache.get(cache_key)
-            if cached_article:
-                logger.info(f"Returning article from cache: {slug}")
-                return cached_article
+        Args:
+            slug: Article slug
+            populate: Relations to populate (None selects ARTICLE_FIELDS)
+
+        Returns:
+            Transformed article dictionary or None if not found
 
-        # Fetch from Strapi API
+        Raises:
+            StrapiError: If fetch fails
+        """
         try:
             url = self._build_url("api", "articles")
 
             params = {
                 "filters[slug][$eq]": slug,
-                "populate": populate
+                **self._selection_params(self.ARTICLE_FIELDS, populate)
             }
 
             logger.info(f"Fetching article by slug from Strapi: {slug}")
@@ -412,13 +622,7 @@ class StrapiService:
                 return None
 
             # Transform to our Article model format
-            article = self.transform_strapi_to_article(strapi_articles[0])
-
-            # Cache the result
-            if use_cache:
-                self.cache.set(cache_key, article, expiration=self.CACHE_TTL)
-
-            return article
+            return self._transform_once(strapi_articles[0])
 
         except StrapiNotFoundError:
             return None
@@ -540,10 +744,66 @@ class StrapiService:
                 "category": ""
             }
 
+    def _transform_once(self, strapi_article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform a Strapi article, reusing the result for the same version
+
+        Articles are identified by id, updatedAt and the selected attributes;
+        articles without updatedAt are transformed every time.
+
+        Args:
+            strapi_article: Strapi article data with id and attributes
+
+        Returns:
+            Transformed article dictionary (a copy the caller may modify)
+        """
+        attributes = strapi_article.get("attributes") or {}
+        updated_at = attributes.get("updatedAt") if isinstance(attributes, dict) else None
+        if not updated_at:
+            return self.transform_strapi_to_article(strapi_article)
+
+        key = (str(strapi_article.get("id", "")), updated_at, tuple(sorted(attributes)))
+        with self._transformed_lock:
+            article = self._transformed.get(key)
+            if article is not None:
+                self._transformed.move_to_end(key)
+                return dict(article)
+
+        article = self.transform_strapi_to_article(strapi_article)
+        with self._transformed_lock:
+            self._transformed[key] = article
+            if len(self._transformed) > self.TRANSFORM_CACHE_SIZE:
+                self._transformed.popitem(last=False)
+        return dict(article)
+
+    def invalidate_all(self) -> int:
+        """
+        Invalidate every cached page, list and article in O(1)
+
+        Bumps the blog cache namespace version; entries cached under the
+        previous version are no longer read and expire on their own TTL.
+
+        Returns:
+            New namespace version (0 on error)
+        """
+        try:
+            version = self.cache.bump_namespace(self.CACHE_NAMESPACE)
+            bump_content_version(BLOG_CONTENT)
+            logger.info(f"Invalidated article cache (namespace version {version})")
+            return version
+        except Exception as e:
+            logger.error(f"Error invalidating cache: {e}")
+            return 0
+
     def invalidate_cache(self, cache_key_pattern: Optional[str] = None) -> int:
         """
         Invalidate cached articles
 
+        Without a pattern, invalidates the whole blog cache through
+        invalidate_all(), which deletes no keys. A pattern falls back to a
+        keyspace scan; cached keys have the form
+        "blog:v<version>:strapi:articles:...".
+
         Args:
             cache_key_pattern: Specific cache key pattern to invalidate
                              (default: None, invalidates all article cache)
@@ -552,14 +812,41 @@ class StrapiService:
             Number of cache keys deleted
         """
         try:
-            pattern = cache_key_pattern or f"{self.CACHE_KEY_PREFIX}:*"
-            deleted_count = self.cache.clear_pattern(pattern)
-            logger.info(f"Invalidated {deleted_count} cache entries matching: {pattern}")
+            if cache_key_pattern is None:
+                self.invalidate_all()
+                return 0
+
+            deleted_count = self.cache.clear_pattern(cache_key_pattern)
+            bump_content_version(BLOG_CONTENT)
+            logger.info(f"Invalidated {deleted_count} cache entries matching: {cache_key_pattern}")
             return deleted_count
         except Exception as e:
             logger.error(f"Error invalidating cache: {e}")
             return 0
 
+    def invalidate_article(self, slug: str) -> int:
+        """
+        Invalidate the cached copy of a single article
+
+        Args:
+            slug: Article slug
+
+        Returns:
+            Number of cache keys deleted
+        """
+        try:
+            deleted_count = self.cache.invalidate_tags(self._article_tag(slug))
+            bump_content_version(BLOG_CONTENT)
+            logger.info(f"Invalidated {deleted_count} cache entries for article: {slug}")
+            return deleted_count
+        except Exception as e:
+            logger.error(f"Error invalidating article cache for {slug}: {e}")
+            return 0
+
+    def _article_tag(self, slug: str) -> str:
+        """Cache tag for a single article"""
+        return f"{self.CACHE_NAMESPACE}:article:{slug}"
+
     def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on Strapi connection
@@ -137,8 +137,8 @@ def example_cache_management():
         print(f"First fetch: {len(articles)} articles (may use cache)")
 
         # Invalidate cache
-        deleted_count = strapi.invalidate_cache()
-        print(f"Invalidated {deleted_count} cache entries")
+        version = strapi.invalidate_all()
+        print(f"Invalidated article cache (namespace version {version})")
 
         # Fetch again (will hit API)
         articles = strapi.fetch_articles(limit=5)
@@ -15,6 +15,7 @@ from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
 from services.beehiiv_service import BeeHiivService, BeeHiivAPIError
+from services.beehiiv_sync_engine import BeeHiivSyncEngine, DesiredSubscriber
 from database.zerodb import ZeroDBClient
 from models.schemas import NewsletterSubscriber, NewsletterSubscriberStatus
 
@@ -28,16 +29,30 @@ class SubscriberSyncService:
     Keeps newsletter subscribers in sync between ZeroDB and BeeHiiv.
     """
 
-    def __init__(self, db: ZeroDBClient, beehiiv_service: BeeHiivService):
+    def __init__(
+        self,
+        db: ZeroDBClient,
+        beehiiv_service: BeeHiivService,
+        sync_engine: Optional[BeeHiivSyncEngine] = None
+    ):
         """
         Initialize sync service
 
         Args:
             db: ZeroDB client instance
             beehiiv_service: BeeHiiv service instance
+            sync_engine: Optional sync engine (defaults to one using beehiiv_service)
         """
         self.db = db
         self.beehiiv = beehiiv_service
+        self._sync_engine = sync_engine
+
+    @property
+    def sync_engine(self) -> BeeHiivSyncEngine:
+        """Sync engine for bulk list changes, created on first use"""
+        if self._sync_engine is None:
+            self._sync_engine = BeeHiivSyncEngine(self.beehiiv)
+        return self._sync_engine
 
     async def sync_subscriber_to_beehiiv(
         self,
@@ -295,6 +310,10 @@ class SubscriberSyncService:
         """
         Bulk sync multiple users to a specific list
 
+        Users already on the list in BeeHiiv are not sent again; the rest are
+        added concurrently within the shared BeeHiiv rate limit, and a bulk
+        sync to the same list that was interrupted resumes where it stopped.
+
         Args:
             user_emails: List of user emails
             list_id: Target list ID
@@ -302,31 +321,68 @@ class SubscriberSyncService:
         Returns:
             Bulk sync statistics
         """
+        desired = {
+            email.lower().strip(): DesiredSubscriber(lists={list_id})
+            for email in user_emails if email
+        }
+
+        result = await self.sync_engine.sync(f"bulk_list:{list_id}", desired, {list_id})
+
         stats = {
             "total": len(user_emails),
-            "success": 0,
-            "failed": 0,
-            "errors": []
+            "success": result.unchanged + len(result.applied),
+            "unchanged": result.unchanged,
+            "failed": len(result.failed),
+            "errors": [
+                {"email": change.email, "error": error}
+                for change, error in result.failed
+            ]
         }
 
-        for email in user_emails:
-            result = await self.sync_subscriber_to_beehiiv(
-                user_email=email,
-                list_id=list_id
-            )
-
-            if result.get("success"):
-                stats["success"] += 1
-            else:
-                stats["failed"] += 1
-                stats["errors"].append({
-                    "email": email,
-                    "error": result.get("error")
-                })
+        for change in result.applied:
+            await self._record_list_membership(change.email, list_id)
 
-        logger.info(f"Bulk sync completed: {stats['success']}/{stats['total']} successful")
+        logger.info(
+            f"Bulk sync completed: {stats['success']}/{stats['total']} successful "
+            f"({stats['unchanged']} already on list)"
+        )
         return stats
 
+    async def _record_list_membership(self, email: str, list_id: str) -> None:
+        """
+        Record in ZeroDB that a subscriber was added to a list
+
+        Args:
+            email: Subscriber email
+            list_id: List ID
+        """
+        existing = await self.db.find_one("newsletter_subscribers", {"email": email})
+
+        if existing:
+            list_ids = existing.get("list_ids") or []
+            await self.db.update_one(
+                "newsletter_subscribers",
+                {"email": email},
+                {
+                    "list_ids": list_ids if list_id in list_ids else list_ids + [list_id],
+                    "status": NewsletterSubscriberStatus.ACTIVE,
+                    "last_synced_at": datetime.utcnow(),
+                    "updated_at": datetime.utcnow()
+                }
+            )
+        else:
+            await self.db.insert_one("newsletter_subscribers", {
+                "id": uuid4(),
+                "email": email,
+                "list_ids": [list_id],
+                "status": NewsletterSubscriberStatus.ACTIVE,
+                "subscribed_at": datetime.utcnow(),
+                "last_synced_at": datetime.utcnow(),
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow(),
+                "metadata": {}
+            })
+
     async def sync_member_subscriptions(self):
         """
         Sync all active members to the Members Only list
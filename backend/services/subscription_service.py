@@ -20,6 +20,7 @@ from typing import Dict, Any, Optional, List
 from backend.config import settings
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBNotFoundError
 from backend.services.membership_webhook_handler import get_membership_webhook_handler
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
 from backend.models.schemas import (
     SubscriptionTier,
     SubscriptionStatus,
@@ -59,6 +60,7 @@ class SubscriptionService:
         """
         self.db = zerodb_client or ZeroDBClient()
         self.webhook_handler = get_membership_webhook_handler()
+        self.aggregates = get_analytics_aggregates_service()
         logger.info("SubscriptionService initialized")
 
     async def create_subscription(
@@ -122,6 +124,9 @@ class SubscriptionService:
                 f"Subscription created: {subscription_id} for user {user_id}, tier {tier}"
             )
 
+            # Keep dashboard aggregates current
+            self.aggregates.record_subscription(subscription_id, subscription_data)
+
             # Create audit log
             self._create_audit_log(
                 user_id=user_id,
@@ -312,6 +317,9 @@ class SubscriptionService:
             )
 
             updated_subscription = updated_result.get("data", {})
+            self.aggregates.record_subscription(
+                subscription_id, {**subscription, **update_data}
+            )
 
             logger.info(
                 f"Subscription canceled: {subscription_id} "
@@ -417,6 +425,9 @@ class SubscriptionService:
             )
 
             updated_subscription = updated_result.get("data", {})
+            self.aggregates.record_subscription(
+                subscription_id, {**subscription, **update_data}
+            )
 
             logger.info(f"Subscription reactivated: {subscription_id}")
 
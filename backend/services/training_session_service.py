@@ -24,6 +24,10 @@ from backend.services.cloudflare_calls_service import (
     get_cloudflare_calls_service,
     CloudflareCallsError
 )
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
+from backend.services.event_service import event_cache_tag
+from backend.services.instrumented_cache_service import get_cache_service
+from backend.services.http_cache import EVENTS_CONTENT, bump_content_version
 from backend.models.schemas import UserRole
 
 # Session status constants (since session_status is a string field in schema)
@@ -52,9 +56,18 @@ class TrainingSessionService:
         """Initialize Training Session Service"""
         self.db = get_zerodb_client()
         self.cloudflare = get_cloudflare_calls_service()
+        self.cache = get_cache_service()
+        self.aggregates = get_analytics_aggregates_service()
         self.collection = "training_sessions"
         self.attendance_collection = "session_attendance"
 
+    def _invalidate_event_cache(self, *event_ids: Optional[str]) -> None:
+        """Invalidate cached public event pages that embed these events' sessions"""
+        tags = [event_cache_tag(str(event_id)) for event_id in event_ids if event_id]
+        if tags:
+            self.cache.invalidate_tags(*tags)
+            bump_content_version(EVENTS_CONTENT)
+
     def create_session(
         self,
         session_data: Dict[str, Any],
@@ -178,6 +191,8 @@ class TrainingSessionService:
                 logger.warning(f"Failed to create Cloudflare room immediately: {e}")
                 logger.info("Room will be created automatically 1 hour before session start")
 
+            self._invalidate_event_cache(session_doc["event_id"])
+
             logger.info(f"Training session created successfully with ID: {session_id}")
             return result
 
@@ -284,6 +299,9 @@ class TrainingSessionService:
                 merge=True
             )
 
+            self._invalidate_event_cache(existing_session.get("event_id"), updates.get("event_id"))
+            self.aggregates.record_training_session(session_id, {**existing_session, **updates})
+
             logger.info(f"Training session updated successfully: {session_id}")
             return result
 
@@ -337,6 +355,11 @@ class TrainingSessionService:
                 merge=True
             )
 
+            self._invalidate_event_cache(session.get("event_id"))
+            self.aggregates.record_training_session(
+                session_id, {**session, "status": SessionStatus.CANCELED.value}
+            )
+
             logger.info(f"Training session canceled successfully: {session_id}")
             return result
 
@@ -478,6 +501,9 @@ class TrainingSessionService:
                 merge=True
             )
 
+            self._invalidate_event_cache(session.get("event_id"))
+            self.aggregates.record_training_session(session_id, {**session, "status": SessionStatus.LIVE.value})
+
             logger.info(f"Training session started successfully: {session_id}")
             return result
 
@@ -532,6 +558,9 @@ class TrainingSessionService:
                 merge=True
             )
 
+            self._invalidate_event_cache(session.get("event_id"))
+            self.aggregates.record_training_session(session_id, {**session, "status": SessionStatus.ENDED.value})
+
             logger.info(f"Training session ended successfully: {session_id}")
             return result
 
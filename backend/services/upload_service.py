@@ -3,17 +3,89 @@ Upload Service - Chunked File Upload Handler
 
 This service manages large file uploads with progress tracking and resumable uploads.
 Uses Redis for tracking upload state and progress.
+
+Chunks may be uploaded in parallel and in any order:
+- The temporary file is preallocated to the full size at initiation and each
+  chunk is written at its offset with ``os.pwrite``, so concurrent writers
+  never share a file position
+- Upload state is a Redis hash; a Lua script records each chunk (uploaded
+  set, SHA-256 digest, byte and chunk counters) atomically, so parallel
+  requests cannot lose updates and a retried chunk is not counted twice
+- The file hash is a SHA-256 hash tree over the chunk digests computed as
+  chunks arrive, so finalizing never re-reads the file
+
+Redis keys per upload:
+    upload:{id}           hash   session fields and counters
+    upload:{id}:chunks    set    indices of uploaded chunks
+    upload:{id}:digests   hash   chunk index -> SHA-256 hex digest
 """
 
 import os
 import hashlib
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 from uuid import uuid4
 import redis
 import json
 
+# Records an uploaded chunk. Returns {bytes_uploaded, chunks_uploaded}, or
+# nil if the session has expired. A chunk uploaded again (client retry)
+# replaces its digest but is not counted twice. Each chunk slides the TTL of
+# the session and its chunk keys, so an active upload never expires midway.
+RECORD_CHUNK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local added = redis.call('SADD', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[3], ARGV[1], ARGV[3])
+local bytes_uploaded = tonumber(redis.call('HGET', KEYS[1], 'bytes_uploaded') or '0')
+local chunks_uploaded = tonumber(redis.call('HGET', KEYS[1], 'chunks_uploaded') or '0')
+if added == 1 then
+    bytes_uploaded = redis.call('HINCRBY', KEYS[1], 'bytes_uploaded', ARGV[2])
+    chunks_uploaded = redis.call('HINCRBY', KEYS[1], 'chunks_uploaded', 1)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+return {bytes_uploaded, chunks_uploaded}
+"""
+
+# Session fields stored as integers / JSON in the Redis hash
+_INT_FIELDS = ('file_size', 'bytes_uploaded', 'chunks_uploaded', 'total_chunks', 'chunk_size')
+_JSON_FIELDS = ('metadata',)
+
+HASH_ALGORITHM = 'sha256-tree'
+
+
+def combine_chunk_digests(digests: List[str]) -> str:
+    """
+    Combine per-chunk SHA-256 digests into the root of a binary hash tree
+
+    Each level hashes adjacent pairs of the level below (an odd node out is
+    carried up unchanged) until one digest remains. A single chunk's root is
+    its own digest, i.e. the plain SHA-256 of the file.
+
+    Args:
+        digests: Hex digests of the chunks, in order
+
+    Returns:
+        Hex digest of the tree root
+    """
+    if not digests:
+        return hashlib.sha256(b"").hexdigest()
+
+    level = [bytes.fromhex(digest) for digest in digests]
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
 
 class UploadService:
     """
@@ -21,8 +93,10 @@ class UploadService:
 
     Features:
     - Chunked uploads for large files (up to 30GB)
+    - Parallel, out-of-order chunk uploads
     - Progress tracking in Redis
     - Resumable uploads
+    - Incremental hashing (no re-read on finalize)
     - Temporary file management
     """
 
@@ -52,6 +126,8 @@ class UploadService:
         self.temp_dir = Path(temp_dir or os.getenv('UPLOAD_TEMP_DIR', '/tmp/uploads'))
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+        self._record_chunk = self.redis_client.register_script(RECORD_CHUNK_SCRIPT)
+
     def initiate_upload(
         self,
         file_name: str,
@@ -92,7 +168,6 @@ class UploadService:
         # Generate upload ID
         upload_id = str(uuid4())
 
-        # Create upload session in Redis
         session_data = {
             'upload_id': upload_id,
             'file_name': file_name,
@@ -101,21 +176,19 @@ class UploadService:
             'bytes_uploaded': 0,
             'chunks_uploaded': 0,
             'total_chunks': (file_size + self.CHUNK_SIZE - 1) // self.CHUNK_SIZE,
+            'chunk_size': self.CHUNK_SIZE,
             'status': 'initiated',
             'metadata': metadata or {},
             'temp_file': str(self.temp_dir / f"{upload_id}.tmp")
         }
 
-        # Store in Redis with TTL
-        self.redis_client.setex(
-            f"upload:{upload_id}",
-            self.UPLOAD_TTL,
-            json.dumps(session_data)
-        )
+        # Create the temporary file at its full size, so chunks can be
+        # written at their offsets in any order (and a full disk fails now
+        # rather than halfway through the upload)
+        self._preallocate(Path(session_data['temp_file']), file_size)
 
-        # Create temporary file
-        temp_file = Path(session_data['temp_file'])
-        temp_file.touch()
+        # Store in Redis with TTL
+        self._save_session(upload_id, session_data, self.UPLOAD_TTL)
 
         return {
             'upload_id': upload_id,
@@ -162,43 +235,50 @@ class UploadService:
         if chunk_index < 0 or chunk_index >= total_chunks:
             raise ValueError(f"Invalid chunk index: {chunk_index}")
 
+        chunk_size = session.get('chunk_size') or self.CHUNK_SIZE
+        offset = chunk_index * chunk_size
+        expected_size = min(chunk_size, session['file_size'] - offset)
+        if len(chunk_data) != expected_size:
+            raise ValueError(
+                f"Invalid size for chunk {chunk_index}: expected {expected_size} bytes, "
+                f"got {len(chunk_data)}"
+            )
+
         # Write chunk to temp file
         temp_file = Path(session['temp_file'])
         if not temp_file.exists():
             raise ValueError(f"Temporary file not found for upload: {upload_id}")
 
-        offset = chunk_index * self.CHUNK_SIZE
-
-        with open(temp_file, 'r+b') as f:
-            f.seek(offset)
-            f.write(chunk_data)
-
-        # Update session
-        session['bytes_uploaded'] = session.get('bytes_uploaded', 0) + len(chunk_data)
-        session['chunks_uploaded'] = session.get('chunks_uploaded', 0) + 1
-
-        # Mark chunk as uploaded
-        self.redis_client.sadd(f"upload:{upload_id}:chunks", str(chunk_index))
-
-        # Update session in Redis
-        self.redis_client.setex(
-            f"upload:{upload_id}",
-            self.UPLOAD_TTL,
-            json.dumps(session)
+        self._write_at(temp_file, offset, chunk_data)
+        digest = hashlib.sha256(chunk_data).hexdigest()
+
+        # Record the chunk atomically (safe with parallel chunk uploads)
+        counters = self._record_chunk(
+            keys=[
+                f"upload:{upload_id}",
+                f"upload:{upload_id}:chunks",
+                f"upload:{upload_id}:digests"
+            ],
+            args=[chunk_index, len(chunk_data), digest, self.UPLOAD_TTL]
         )
+        if not counters:
+            raise ValueError(f"Upload session not found: {upload_id}")
+
+        bytes_uploaded, chunks_uploaded = (int(value) for value in counters)
 
         # Calculate progress
-        progress_percent = (session['bytes_uploaded'] / session['file_size']) * 100
+        progress_percent = (bytes_uploaded / session['file_size']) * 100
 
         return {
             'upload_id': upload_id,
             'chunk_index': chunk_index,
-            'bytes_uploaded': session['bytes_uploaded'],
+            'chunk_hash': digest,
+            'bytes_uploaded': bytes_uploaded,
             'total_bytes': session['file_size'],
-            'chunks_uploaded': session['chunks_uploaded'],
+            'chunks_uploaded': chunks_uploaded,
             'total_chunks': total_chunks,
             'progress_percent': round(progress_percent, 2),
-            'is_complete': session['chunks_uploaded'] >= total_chunks
+            'is_complete': chunks_uploaded >= total_chunks
         }
 
     def finalize_upload(
@@ -246,17 +326,13 @@ class UploadService:
                 f"File size mismatch: expected {expected_size}, got {actual_size}"
             )
 
-        # Calculate file hash for integrity
-        file_hash = self._calculate_file_hash(temp_file)
+        # Combine the chunk digests recorded during upload for integrity
+        file_hash = self._calculate_file_hash(upload_id, session['total_chunks'])
 
         # Update session status
-        session['status'] = 'completed'
-        session['file_hash'] = file_hash
-
-        self.redis_client.setex(
+        self.redis_client.hset(
             f"upload:{upload_id}",
-            self.UPLOAD_TTL,
-            json.dumps(session)
+            mapping={'status': 'completed', 'file_hash': file_hash}
         )
 
         return {
@@ -265,6 +341,8 @@ class UploadService:
             'file_size': session['file_size'],
             'temp_file': session['temp_file'],
             'file_hash': file_hash,
+            'hash_algorithm': HASH_ALGORITHM,
+            'chunk_size': session.get('chunk_size') or self.CHUNK_SIZE,
             'metadata': session.get('metadata', {})
         }
 
@@ -321,8 +399,11 @@ class UploadService:
             temp_file.unlink()
 
         # Delete Redis keys
-        self.redis_client.delete(f"upload:{upload_id}")
-        self.redis_client.delete(f"upload:{upload_id}:chunks")
+        self.redis_client.delete(
+            f"upload:{upload_id}",
+            f"upload:{upload_id}:chunks",
+            f"upload:{upload_id}:digests"
+        )
 
         return True
 
@@ -346,12 +427,11 @@ class UploadService:
             temp_file.unlink()
 
         # Keep session in Redis for audit trail, but mark as cleaned
-        session['temp_file_deleted'] = True
-        self.redis_client.setex(
-            f"upload:{upload_id}",
-            3600,  # Keep for 1 hour
-            json.dumps(session)
-        )
+        pipe = self.redis_client.pipeline()
+        pipe.hset(f"upload:{upload_id}", 'temp_file_deleted', 'true')
+        pipe.expire(f"upload:{upload_id}", 3600)  # Keep for 1 hour
+        pipe.delete(f"upload:{upload_id}:chunks", f"upload:{upload_id}:digests")
+        pipe.execute()
 
         return True
 
@@ -382,22 +462,71 @@ class UploadService:
 
     def _get_upload_session(self, upload_id: str) -> Optional[Dict[str, Any]]:
         """Get upload session from Redis"""
-        data = self.redis_client.get(f"upload:{upload_id}")
+        data = self.redis_client.hgetall(f"upload:{upload_id}")
         if not data:
             return None
 
-        return json.loads(data)
-
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of file"""
-        sha256_hash = hashlib.sha256()
-
-        with open(file_path, 'rb') as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        session = dict(data)
+        for field in _INT_FIELDS:
+            if field in session:
+                session[field] = int(session[field])
+        for field in _JSON_FIELDS:
+            if field in session:
+                session[field] = json.loads(session[field])
+        return session
+
+    def _save_session(self, upload_id: str, session: Dict[str, Any], ttl: int) -> None:
+        """Store a new upload session in Redis"""
+        mapping = {
+            field: json.dumps(value) if field in _JSON_FIELDS else value
+            for field, value in session.items()
+        }
+        pipe = self.redis_client.pipeline()
+        pipe.hset(f"upload:{upload_id}", mapping=mapping)
+        pipe.expire(f"upload:{upload_id}", ttl)
+        pipe.execute()
+
+    @staticmethod
+    def _preallocate(file_path: Path, size: int) -> None:
+        """Create a file of the given size, reserving disk space where supported"""
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            if size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                    return
+                except OSError:
+                    pass  # Not supported by the filesystem; fall back to a sparse file
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write_at(file_path: Path, offset: int, data: bytes) -> None:
+        """Write data at an offset without moving a shared file position"""
+        fd = os.open(file_path, os.O_WRONLY)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+        finally:
+            os.close(fd)
+
+    def _calculate_file_hash(self, upload_id: str, total_chunks: int) -> str:
+        """
+        Hash tree root of the file from the chunk digests recorded in Redis
 
-        return sha256_hash.hexdigest()
+        Raises:
+            ValueError: If a chunk digest is missing
+        """
+        digests = self.redis_client.hgetall(f"upload:{upload_id}:digests")
+        try:
+            ordered = [digests[str(index)] for index in range(total_chunks)]
+        except KeyError as e:
+            raise ValueError(f"Missing digest for chunk {e.args[0]} of upload {upload_id}")
+        return combine_chunk_digests(ordered)
 
     def cleanup_expired_uploads(self) -> int:
         """
@@ -19,6 +19,8 @@ from typing import Dict, Any, Optional
 from backend.config import settings
 from backend.services.zerodb_service import ZeroDBClient, ZeroDBNotFoundError
 from backend.services.membership_webhook_handler import get_membership_webhook_handler
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
+from backend.services.search_index import record_person
 from backend.models.schemas import UserRole, AuditAction
 
 logger = logging.getLogger(__name__)
@@ -59,6 +61,7 @@ class UserService:
         """
         self.db = zerodb_client or ZeroDBClient()
         self.webhook_handler = get_membership_webhook_handler()
+        self.aggregates = get_analytics_aggregates_service()
         logger.info("UserService initialized")
 
     async def update_user_email(
@@ -312,6 +315,8 @@ class UserService:
             )
 
             updated_user = updated_result.get("data", {})
+            self.aggregates.record_user(user_id, {**user, **update_data})
+            record_person(user_id, {**user, **update_data})
 
             logger.info(f"User deactivated: {user_id}")
 
@@ -377,6 +382,8 @@ class UserService:
             )
 
             updated_user = updated_result.get("data", {})
+            self.aggregates.record_user(user_id, {**user, **update_data})
+            record_person(user_id, {**user, **update_data})
 
             logger.info(f"User reactivated: {user_id}")
 
@@ -447,6 +454,8 @@ class UserService:
             )
 
             updated_user = updated_result.get("data", {})
+            self.aggregates.record_user(user_id, {**user, **update_data})
+            record_person(user_id, {**user, **update_data})
 
             logger.info(f"User role updated: {user_id} from {old_role} to {new_role}")
 
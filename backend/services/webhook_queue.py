@@ -0,0 +1,530 @@
+"""
+Webhook Queue - fast-ack ingestion and ordered processing of webhooks
+
+Moves webhook processing (ZeroDB writes, emails, newsletter calls) off the
+request path:
+- Routes verify the signature, then ``enqueue`` the event and return 200.
+  Enqueueing claims the event ID with SET NX in the same script, so a
+  redelivered event is acknowledged as a duplicate without being queued
+  again
+- Events are queued per ordering key (a Stripe customer, a Cloudflare
+  room, a BeeHiiv post) in FIFO lists; keys with pending events wait in a
+  ready set. A worker leases a whole key, so events of one customer are
+  processed one at a time, in arrival order, while other customers'
+  events are processed in parallel
+- A failed event is retried with exponential backoff, holding back the
+  later events of its key; after ``MAX_ATTEMPTS`` it moves to a dead-letter
+  list and the key moves on. Dead letters are replayed with
+  ``scripts/replay_webhooks.py``
+- A worker renews its lease with a heartbeat while the handler runs. Keys
+  of a crashed worker are handed out again once the lease lapses, so
+  processing is at-least-once; handlers keep their own idempotency checks.
+  Each lease carries an owner token, and a worker that lost its lease
+  leaves the key to the new owner instead of finishing or retrying it
+
+Usage:
+    queue = get_webhook_queue()
+    if queue.enqueue("stripe", event.id, event.type, payload, ordering_key=customer_id):
+        ...  # new event
+    queue.run(stop_event, handlers={"stripe": handle_stripe_event})
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import redis
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+SEEN_KEY_PREFIX = "webhooks:seen:"  # source:event_id -> idempotency marker
+EVENT_KEY_PREFIX = "webhooks:event:"  # source:event_id -> {payload, status, attempts, ...}
+ORDER_KEY_PREFIX = "webhooks:order:"  # ordering key -> list of event refs (FIFO)
+READY_KEY = "webhooks:ready"  # Sorted set of ordering keys by when they are due
+LEASED_KEY = "webhooks:leased"  # Sorted set of ordering keys by lease expiry
+LEASE_OWNERS_KEY = "webhooks:lease_owners"  # Hash of ordering key -> owner token of its lease
+DEAD_LETTER_KEY = "webhooks:dead"  # List of dead-lettered event refs, newest first
+
+IDEMPOTENCY_TTL = 7 * 86400  # Seconds an event ID is remembered (Stripe retries for 3 days)
+PROCESSED_TTL = 86400  # Seconds a processed event is kept
+
+LEASE_SECONDS = 5 * 60  # Keys of a worker silent for this long are handed out again
+HEARTBEAT_SECONDS = 20  # Seconds between lease renewals while a handler runs
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 30  # Seconds; doubles with every attempt
+POLL_INTERVAL = 0.5  # Seconds an idle worker waits before polling again
+
+# Event statuses
+STATUS_QUEUED = "queued"
+STATUS_RETRYING = "retrying"
+STATUS_PROCESSED = "processed"
+STATUS_DEAD = "dead"
+
+# KEYS: seen, event, order list, ready, leased, dead letters
+# ARGV: ref, ordering key, now, idempotency ttl, replay ('1' skips the
+#       idempotency claim and takes the event off the dead-letter list),
+#       source, event_id, event_type, payload
+# Returns 0 for a duplicate
+ENQUEUE_SCRIPT = """
+if ARGV[5] == '1' then
+    redis.call('LREM', KEYS[6], 0, ARGV[1])
+elseif not redis.call('SET', KEYS[1], ARGV[3], 'NX', 'EX', ARGV[4]) then
+    return 0
+end
+redis.call('HSET', KEYS[2], 'source', ARGV[6], 'event_id', ARGV[7], 'event_type', ARGV[8],
+    'payload', ARGV[9], 'ordering_key', ARGV[2], 'received_at', ARGV[3], 'attempts', 0,
+    'status', 'queued', 'error', '')
+redis.call('PERSIST', KEYS[2])
+redis.call('RPUSH', KEYS[3], ARGV[1])
+if not redis.call('ZSCORE', KEYS[5], ARGV[2]) then
+    redis.call('ZADD', KEYS[4], 'NX', ARGV[3], ARGV[2])
+end
+return 1
+"""
+
+# KEYS: ready, leased, lease owners
+# ARGV: now, lease, order list key prefix, owner token
+# Requeues keys whose lease lapsed, then leases the first due key with
+# events to the owner; returns {ordering key, head event ref} or nil
+CLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+for _, key in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)) do
+    redis.call('ZREM', KEYS[2], key)
+    redis.call('HDEL', KEYS[3], key)
+    redis.call('ZADD', KEYS[1], now, key)
+end
+
+while true do
+    local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, 1)
+    if #due == 0 then
+        return false
+    end
+    redis.call('ZREM', KEYS[1], due[1])
+    local ref = redis.call('LINDEX', ARGV[3] .. due[1], 0)
+    if ref then
+        redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), due[1])
+        redis.call('HSET', KEYS[3], due[1], ARGV[4])
+        return {due[1], ref}
+    end
+end
+"""
+
+# KEYS: leased, lease owners
+# ARGV: ordering key, owner token, new lease expiry
+# Extends the lease if the owner still holds it; returns 0 otherwise
+RENEW_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZADD', KEYS[1], 'XX', ARGV[3], ARGV[1])
+return 1
+"""
+
+# KEYS: ready, leased, lease owners
+# ARGV: ordering key, owner token, due time
+# Releases the key for a retry of its head event at the due time; returns
+# 0 without touching the key if the owner lost the lease
+RETRY_SCRIPT = """
+if redis.call('HGET', KEYS[3], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return 1
+"""
+
+# KEYS: order list, ready, leased, dead letters, lease owners
+# ARGV: ordering key, ref, now, dead ('1' dead-letters the event), owner token
+# Takes the finished head event off its key and releases the key; returns
+# 0 without touching the key if the owner lost the lease
+FINISH_SCRIPT = """
+if redis.call('HGET', KEYS[5], ARGV[1]) ~= ARGV[5] then
+    return 0
+end
+if redis.call('LINDEX', KEYS[1], 0) == ARGV[2] then
+    redis.call('LPOP', KEYS[1])
+end
+if ARGV[4] == '1' then
+    redis.call('LPUSH', KEYS[4], ARGV[2])
+end
+redis.call('ZREM', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[5], ARGV[1])
+if redis.call('LLEN', KEYS[1]) > 0 then
+    redis.call('ZADD', KEYS[2], 'NX', ARGV[3], ARGV[1])
+end
+return 1
+"""
+
+
+class WebhookQueueError(Exception):
+    """Raised when the webhook queue cannot reach Redis"""
+    pass
+
+
+class WebhookEvent(NamedTuple):
+    """A queued webhook event as handed to handlers"""
+    source: str
+    event_id: str
+    event_type: str
+    payload: Dict[str, Any]
+    ordering_key: str
+    attempts: int
+
+
+# Handler for the events of one source; may be a coroutine function
+WebhookHandler = Callable[[WebhookEvent], Any]
+
+
+class WebhookQueue:
+    """
+    Redis queue of verified webhook events, ordered per ordering key
+
+    Thread-safe; all state lives in Redis.
+    """
+
+    def __init__(self, redis_client: redis.Redis, lease_seconds: int = LEASE_SECONDS):
+        """
+        Initialize the queue
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            lease_seconds: Seconds a worker holds an ordering key without
+                finishing its event
+        """
+        self.redis_client = redis_client
+        self.lease_seconds = lease_seconds
+        self._enqueue = redis_client.register_script(ENQUEUE_SCRIPT)
+        self._claim = redis_client.register_script(CLAIM_SCRIPT)
+        self._renew = redis_client.register_script(RENEW_SCRIPT)
+        self._retry = redis_client.register_script(RETRY_SCRIPT)
+        self._finish = redis_client.register_script(FINISH_SCRIPT)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        source: str,
+        event_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        ordering_key: Optional[str] = None
+    ) -> bool:
+        """
+        Record a verified event and queue it for processing
+
+        Args:
+            source: Webhook source (selects the handler, e.g. "stripe")
+            event_id: Provider event ID (or a digest of the body)
+            event_type: Event type
+            payload: Event payload (JSON-serializable)
+            ordering_key: Events with the same key are processed in order
+                (defaults to the event itself)
+
+        Returns:
+            False if the event was already received
+
+        Raises:
+            WebhookQueueError: If Redis is unavailable
+        """
+        ref = self._ref(source, event_id)
+        ordering_key = f"{source}:{ordering_key}" if ordering_key else ref
+        try:
+            queued = self._enqueue(
+                keys=self._enqueue_keys(ref, ordering_key),
+                args=[
+                    ref, ordering_key, time.time(), IDEMPOTENCY_TTL, "0",
+                    source, event_id, event_type, json.dumps(payload, default=str),
+                ]
+            )
+        except redis.RedisError as e:
+            raise WebhookQueueError(f"Failed to enqueue webhook event {ref}: {e}")
+
+        if queued:
+            logger.info(f"Queued {source} webhook event {event_type} ({event_id})")
+        else:
+            logger.info(f"Duplicate {source} webhook event {event_id}, not queued")
+        return bool(queued)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def process_next(self, handlers: Dict[str, WebhookHandler], now: Optional[float] = None) -> Optional[str]:
+        """
+        Process the next event of the first due ordering key
+
+        Args:
+            handlers: Handler per webhook source
+            now: Unix time (defaults to now)
+
+        Returns:
+            Event status (processed, retrying or dead), or None if no event
+            was due or the worker lost the key's lease meanwhile
+        """
+        now = time.time() if now is None else now
+        token = uuid.uuid4().hex
+        claimed = self._claim(
+            keys=[READY_KEY, LEASED_KEY, LEASE_OWNERS_KEY],
+            args=[now, self.lease_seconds, ORDER_KEY_PREFIX, token]
+        )
+        if not claimed:
+            return None
+
+        ordering_key, ref = claimed
+        event_key = EVENT_KEY_PREFIX + ref
+        data = self.redis_client.hgetall(event_key)
+        if not data:
+            logger.warning(f"Webhook event {ref} is missing, skipping")
+            self._finish_event(ordering_key, ref, token, dead=False)
+            return None
+
+        attempts = int(self.redis_client.hincrby(event_key, "attempts", 1))
+        event = WebhookEvent(
+            source=data["source"],
+            event_id=data["event_id"],
+            event_type=data["event_type"],
+            payload=json.loads(data["payload"]),
+            ordering_key=ordering_key,
+            attempts=attempts
+        )
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(ordering_key, token, done), name="webhook-heartbeat", daemon=True
+        )
+        heartbeat.start()
+
+        error = None
+        try:
+            handler = handlers.get(event.source)
+            if handler is None:
+                raise WebhookQueueError(f"No handler for {event.source} webhooks")
+            result = handler(event)
+            if asyncio.iscoroutine(result):
+                asyncio.run(result)
+        except Exception as e:
+            error = e
+        finally:
+            done.set()
+            heartbeat.join()
+
+        if error is not None:
+            return self._fail(event, ref, token, error)
+
+        if not self._finish_event(ordering_key, ref, token, dead=False):
+            self._lease_lost(event)
+            return None
+        self.redis_client.hset(event_key, mapping={"status": STATUS_PROCESSED, "processed_at": time.time()})
+        self.redis_client.expire(event_key, PROCESSED_TTL)
+        logger.info(f"Processed {event.source} webhook event {event.event_type} ({event.event_id})")
+        return STATUS_PROCESSED
+
+    def run(self, stop_event: threading.Event, handlers: Dict[str, WebhookHandler]) -> None:
+        """
+        Process queued events continuously until ``stop_event`` is set
+
+        Args:
+            stop_event: Event that stops the loop after the current event
+            handlers: Handler per webhook source
+        """
+        logger.info("Webhook queue worker started")
+
+        while not stop_event.is_set():
+            try:
+                if self.process_next(handlers) is None:
+                    stop_event.wait(POLL_INTERVAL)
+            except redis.RedisError as e:
+                logger.error(f"Webhook queue worker failed to reach Redis: {e}")
+                stop_event.wait(5.0)
+            except Exception as e:
+                logger.error(f"Unexpected error processing webhooks: {e}")
+                stop_event.wait(1.0)
+
+        logger.info("Webhook queue worker stopped")
+
+    # ------------------------------------------------------------------
+    # Dead letters
+    # ------------------------------------------------------------------
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List dead-lettered events, newest first
+
+        Args:
+            limit: Maximum events to return
+
+        Returns:
+            List of dicts with ref, source, event_id, event_type,
+            ordering_key, attempts, error and dead_at
+
+        Raises:
+            WebhookQueueError: If Redis is unavailable
+        """
+        try:
+            refs = self.redis_client.lrange(DEAD_LETTER_KEY, 0, limit - 1)
+            events = []
+            for ref in refs:
+                data = self.redis_client.hgetall(EVENT_KEY_PREFIX + ref)
+                data.pop("payload", None)
+                events.append({"ref": ref, **data})
+            return events
+        except redis.RedisError as e:
+            raise WebhookQueueError(f"Failed to list dead-lettered webhooks: {e}")
+
+    def replay(self, ref: str) -> bool:
+        """
+        Queue a dead-lettered event again, behind its key's pending events
+
+        Args:
+            ref: Event reference ("source:event_id")
+
+        Returns:
+            False if the event is not stored
+
+        Raises:
+            WebhookQueueError: If Redis is unavailable
+        """
+        try:
+            data = self.redis_client.hgetall(EVENT_KEY_PREFIX + ref)
+            if not data:
+                return False
+            self._enqueue(
+                keys=self._enqueue_keys(ref, data["ordering_key"]),
+                args=[
+                    ref, data["ordering_key"], time.time(), IDEMPOTENCY_TTL, "1",
+                    data["source"], data["event_id"], data["event_type"], data["payload"],
+                ]
+            )
+        except redis.RedisError as e:
+            raise WebhookQueueError(f"Failed to replay webhook event {ref}: {e}")
+
+        logger.info(f"Replayed dead-lettered webhook event {ref}")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Queue sizes
+
+        Returns:
+            Dictionary with ready and leased ordering keys and dead letters
+
+        Raises:
+            WebhookQueueError: If Redis is unavailable
+        """
+        try:
+            return {
+                "ready_keys": int(self.redis_client.zcard(READY_KEY)),
+                "leased_keys": int(self.redis_client.zcard(LEASED_KEY)),
+                "dead_letters": int(self.redis_client.llen(DEAD_LETTER_KEY)),
+            }
+        except redis.RedisError as e:
+            raise WebhookQueueError(f"Failed to read webhook queue stats: {e}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _fail(self, event: WebhookEvent, ref: str, token: str, error: Exception) -> Optional[str]:
+        event_key = EVENT_KEY_PREFIX + ref
+
+        if event.attempts < MAX_ATTEMPTS:
+            delay = RETRY_BASE_DELAY * 2 ** (event.attempts - 1)
+            # The key keeps its head event, so later events of the key wait
+            released = self._retry(
+                keys=[READY_KEY, LEASED_KEY, LEASE_OWNERS_KEY],
+                args=[event.ordering_key, token, time.time() + delay]
+            )
+            if not released:
+                self._lease_lost(event)
+                return None
+            self.redis_client.hset(event_key, mapping={"status": STATUS_RETRYING, "error": str(error)})
+            logger.warning(
+                f"{event.source} webhook event {event.event_id} failed (attempt {event.attempts}), "
+                f"retrying in {delay}s: {error}"
+            )
+            return STATUS_RETRYING
+
+        if not self._finish_event(event.ordering_key, ref, token, dead=True):
+            self._lease_lost(event)
+            return None
+        self.redis_client.hset(event_key, mapping={
+            "status": STATUS_DEAD,
+            "error": str(error),
+            "dead_at": time.time(),
+        })
+        logger.error(
+            f"{event.source} webhook event {event.event_id} dead-lettered after "
+            f"{event.attempts} attempts: {error}"
+        )
+        return STATUS_DEAD
+
+    def _finish_event(self, ordering_key: str, ref: str, token: str, dead: bool) -> bool:
+        return bool(self._finish(
+            keys=[ORDER_KEY_PREFIX + ordering_key, READY_KEY, LEASED_KEY, DEAD_LETTER_KEY, LEASE_OWNERS_KEY],
+            args=[ordering_key, ref, time.time(), "1" if dead else "0", token]
+        ))
+
+    def _heartbeat(self, ordering_key: str, token: str, done: threading.Event) -> None:
+        while not done.wait(HEARTBEAT_SECONDS):
+            try:
+                renewed = self._renew(
+                    keys=[LEASED_KEY, LEASE_OWNERS_KEY],
+                    args=[ordering_key, token, time.time() + self.lease_seconds]
+                )
+                if not renewed:
+                    logger.warning(f"Webhook worker lost its lease of {ordering_key}")
+            except redis.RedisError as e:
+                logger.warning(f"Failed to renew lease of {ordering_key}: {e}")
+
+    @staticmethod
+    def _lease_lost(event: WebhookEvent) -> None:
+        # The key was handed to another worker, which processes the event again
+        logger.warning(
+            f"Lease of {event.ordering_key} lapsed while processing {event.source} webhook event "
+            f"{event.event_id}; leaving it to the new owner"
+        )
+
+    @staticmethod
+    def _enqueue_keys(ref: str, ordering_key: str) -> List[str]:
+        return [
+            SEEN_KEY_PREFIX + ref,
+            EVENT_KEY_PREFIX + ref,
+            ORDER_KEY_PREFIX + ordering_key,
+            READY_KEY,
+            LEASED_KEY,
+            DEAD_LETTER_KEY,
+        ]
+
+    @staticmethod
+    def _ref(source: str, event_id: str) -> str:
+        return f"{source}:{event_id}"
+
+
+# Global queue instance
+_webhook_queue_instance: Optional[WebhookQueue] = None
+
+
+def get_webhook_queue() -> WebhookQueue:
+    """
+    Get or create the global WebhookQueue instance
+
+    Returns:
+        WebhookQueue backed by settings.REDIS_URL
+    """
+    global _webhook_queue_instance
+
+    if _webhook_queue_instance is None:
+        _webhook_queue_instance = WebhookQueue(
+            redis.from_url(settings.REDIS_URL, decode_responses=True)
+        )
+
+    return _webhook_queue_instance
@@ -15,7 +15,8 @@ Webhook Events Handled:
 
 All webhook events are:
 1. Idempotent (event IDs tracked to prevent duplicate processing)
-2. Fast (respond within 5 seconds to avoid Stripe retries)
+2. Fast (the route queues events on the WebhookQueue and acknowledges at
+   once; workers process them in order per customer via handle_queued_event)
 3. Logged comprehensively for debugging
 4. Stored in ZeroDB for replay/audit purposes
 """
@@ -30,9 +31,13 @@ from backend.config import settings
 from backend.services.zerodb_service import get_zerodb_client, ZeroDBError
 from backend.services.email_service import get_email_service
 from backend.services.dunning_service import get_dunning_service, DunningServiceError
+from backend.services.analytics_aggregates_service import get_analytics_aggregates_service
+from backend.services.search_index import record_person
+from backend.services.webhook_queue import WebhookEvent
 from backend.models.schemas import (
     SubscriptionStatus,
     PaymentStatus,
+    RSVPStatus,
     UserRole,
     AuditAction
 )
@@ -56,6 +61,25 @@ class DuplicateEventError(WebhookServiceError):
     pass
 
 
+def stripe_ordering_key(event_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Stripe customer an event belongs to, so its events are processed in order
+
+    Args:
+        event_data: Full event data from Stripe
+
+    Returns:
+        Customer ID, or None if the event is not tied to a customer
+    """
+    obj = event_data.get("data", {}).get("object", {}) or {}
+    customer = obj.get("customer")
+    if isinstance(customer, dict):
+        customer = customer.get("id")
+    if not customer and obj.get("object") == "customer":
+        customer = obj.get("id")
+    return customer or None
+
+
 class WebhookService:
     """
     Stripe Webhook Event Processing Service
@@ -73,12 +97,16 @@ class WebhookService:
         self.db = get_zerodb_client()
         self.email_service = get_email_service()
         self.dunning_service = get_dunning_service()
+        self.aggregates = get_analytics_aggregates_service()
         logger.info("WebhookService initialized with dunning support")
 
     def _is_duplicate_event(self, event_id: str) -> bool:
         """
         Check if webhook event has already been processed (idempotency check)
 
+        Failed attempts are stored too but do not count, so a queued event
+        can be retried.
+
         Args:
             event_id: Stripe event ID
 
@@ -89,7 +117,7 @@ class WebhookService:
             # Query webhook_events collection for this event ID
             result = self.db.query_documents(
                 collection="webhook_events",
-                filters={"stripe_event_id": event_id},
+                filters={"stripe_event_id": event_id, "processing_status": "processed"},
                 limit=1
             )
 
@@ -293,6 +321,29 @@ class WebhookService:
 
             raise WebhookProcessingError(error_msg)
 
+    def handle_queued_event(self, event: WebhookEvent) -> Dict[str, Any]:
+        """
+        WebhookQueue handler for Stripe events
+
+        Args:
+            event: Queued Stripe event
+
+        Returns:
+            Processing result
+
+        Raises:
+            WebhookProcessingError: If processing fails (the queue retries it)
+        """
+        try:
+            return self.process_webhook_event(
+                event_id=event.event_id,
+                event_type=event.event_type,
+                event_data=event.payload
+            )
+        except DuplicateEventError as e:
+            logger.warning(f"Duplicate event {event.event_id}: {e}")
+            return {"status": "duplicate"}
+
     def _handle_checkout_completed(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle checkout.session.completed event
@@ -390,6 +441,13 @@ class WebhookService:
 
         logger.info(f"Upgraded user {user_id} role to 'member'")
 
+        # Keep dashboard aggregates current
+        self.aggregates.record_subscription(subscription.get("id"), subscription_data)
+        self.aggregates.record_user(
+            user_id, {**user.get("data", {}), "role": UserRole.MEMBER.value}
+        )
+        record_person(user_id, {**user.get("data", {}), "role": UserRole.MEMBER.value})
+
         # Update Stripe customer ID if not already set
         if not user.get("data", {}).get("stripe_customer_id"):
             self.db.update_document(
@@ -493,6 +551,7 @@ class WebhookService:
         )
 
         logger.info(f"Created payment record {payment.get('id')} for user {user_id}")
+        self.aggregates.record_payment(payment.get("id"), payment_data)
 
         # Create audit log
         self._create_audit_log(
@@ -738,6 +797,9 @@ class WebhookService:
         )
 
         logger.info(f"Updated subscription {subscription_uuid} with new status: {new_status}")
+        self.aggregates.record_subscription(
+            subscription_uuid, {**zerodb_subscription.get("data", {}), **update_data}
+        )
 
         # Create audit log
         self._create_audit_log(
@@ -808,6 +870,9 @@ class WebhookService:
             )
 
             logger.info(f"Updated subscription {subscription_uuid} status to 'canceled'")
+            self.aggregates.record_subscription(
+                subscription_uuid, {"status": SubscriptionStatus.CANCELED.value}
+            )
         else:
             subscription_uuid = None
             logger.warning(f"Subscription not found for Stripe subscription {stripe_subscription_id}")
@@ -822,6 +887,10 @@ class WebhookService:
             )
 
             logger.info(f"Downgraded user {user_id} role from 'member' to 'public'")
+            self.aggregates.record_user(
+                user_id, {**user.get("data", {}), "role": UserRole.PUBLIC.value}
+            )
+            record_person(user_id, {**user.get("data", {}), "role": UserRole.PUBLIC.value})
 
         # Create audit log
         self._create_audit_log(
@@ -935,6 +1004,9 @@ class WebhookService:
                 data=refund_data,
                 merge=True
             )
+            self.aggregates.record_payment(
+                payment_id, {**payment.get("data", {}), **refund_data}
+            )
 
         logger.info(f"Updated payment record {payment_id} with refund information")
 
@@ -1075,6 +1147,9 @@ class WebhookService:
             logger.info(
                 f"Updated subscription {zerodb_subscription_id} with new end date: {new_end_date.isoformat()}"
             )
+            self.aggregates.record_subscription(
+                zerodb_subscription_id, {**subscription, **update_data}
+            )
 
             # Create payment record for renewal
             payment_data = {
@@ -1101,6 +1176,7 @@ class WebhookService:
             payment_id = payment_result.get("id")
 
             logger.info(f"Created payment record {payment_id} for renewal")
+            self.aggregates.record_payment(payment_id, payment_data)
 
             # Send renewal confirmation email
             try:
@@ -1153,8 +1229,9 @@ class WebhookService:
 
         Actions:
         1. Extract event and user info from session metadata
-        2. Create RSVP record in ZeroDB with confirmed status
-        3. Create payment record for transaction history
+        2. Take the seat through the booking engine (confirmed RSVP)
+        3. Create payment record for transaction history, only for a new
+           reservation so a redelivered event is not recorded twice
         4. Update event attendee count
         5. Generate QR code for check-in
         6. Send ticket/confirmation email with QR code
@@ -1195,12 +1272,14 @@ class WebhookService:
             if not user:
                 raise WebhookProcessingError(f"User {user_id} not found")
 
-            # Check for duplicate RSVP (idempotency)
+            # Check for duplicate RSVP (idempotency); a waitlisted RSVP is
+            # converted by this payment (paid waitlist promotion)
             existing_rsvp_result = self.db.query_documents(
                 collection="rsvps",
                 filters={
                     "event_id": event_id,
-                    "user_id": user_id
+                    "user_id": user_id,
+                    "status": RSVPStatus.CONFIRMED.value
                 },
                 limit=1
             )
@@ -1215,8 +1294,10 @@ class WebhookService:
                     "message": "RSVP already exists"
                 }
 
-            # Create payment record
+            # The payment is recorded only once the seat is taken, so a
+            # redelivered event that finds the seat held adds no payment
             now = datetime.utcnow()
+            payment_id = str(uuid4())
             payment_data = {
                 "user_id": user_id,
                 "amount": amount_total,
@@ -1234,13 +1315,9 @@ class WebhookService:
                 }
             }
 
-            payment_result = self.db.create_document("payments", payment_data)
-            payment_id = payment_result.get("id")
-
-            logger.info(f"Created payment record {payment_id} for event RSVP")
-
             # Create RSVP record
             rsvp_data = {
+                "id": str(uuid4()),
                 "event_id": event_id,
                 "user_id": user_id,
                 "user_name": f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or session.get("customer_email"),
@@ -1256,23 +1333,53 @@ class WebhookService:
                 "updated_at": now.isoformat()
             }
 
-            rsvp_result = self.db.create_document("rsvps", rsvp_data)
-            rsvp_id = rsvp_result.get("id")
+            # Take the seat through the booking engine; the seat is paid for,
+            # so capacity is not checked again
+            from backend.services.rsvp_service import get_rsvp_service
+            from backend.services.rsvp_booking_engine import RSVPBookingError, MODE_FORCE, DUPLICATE
+            rsvp_service = get_rsvp_service()
 
-            logger.info(f"Created RSVP {rsvp_id} for user {user_id}, event {event_id}")
+            try:
+                reservation = rsvp_service.booking.reserve(
+                    event_id, user_id, rsvp_data, event=event, mode=MODE_FORCE
+                )
+            except RSVPBookingError as e:
+                logger.warning(f"Booking engine unavailable, creating paid RSVP directly: {e}")
+                reservation = None
+            else:
+                if reservation.outcome == DUPLICATE:
+                    logger.warning(f"RSVP already exists for user {user_id}, event {event_id}")
+                    return {
+                        "status": "success",
+                        "action": "event_rsvp_payment",
+                        "rsvp_id": reservation.rsvp_id,
+                        "message": "RSVP already exists"
+                    }
 
-            # Update event attendee count
-            current_attendees = event.get("current_attendees", 0)
-            self.db.update_document(
-                "events",
-                event_id,
-                {"current_attendees": current_attendees + 1},
-                merge=True
-            )
+            # Create payment record
+            self.db.create_document("payments", payment_data, document_id=payment_id)
+
+            logger.info(f"Created payment record {payment_id} for event RSVP")
+            self.aggregates.record_payment(payment_id, payment_data)
+
+            if reservation is None:
+                rsvp_result = self.db.create_document("rsvps", rsvp_data)
+                rsvp_id = rsvp_result.get("id") or rsvp_data["id"]
+
+                # Update event attendee count
+                current_attendees = event.get("current_attendees", 0)
+                self.db.update_document(
+                    "events",
+                    event_id,
+                    {"current_attendees": current_attendees + 1},
+                    merge=True
+                )
+            else:
+                rsvp_id = reservation.rsvp_id
+
+            logger.info(f"Created RSVP {rsvp_id} for user {user_id}, event {event_id}")
 
             # Generate QR code for check-in
-            from backend.services.rsvp_service import get_rsvp_service
-            rsvp_service = get_rsvp_service()
             qr_code = rsvp_service.generate_qr_code(rsvp_id, event_id, user_id)
 
             # Send ticket/confirmation email with QR code
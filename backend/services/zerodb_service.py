@@ -9,11 +9,27 @@ OpenTelemetry Instrumentation:
 - All ZeroDB operations are traced with custom spans
 - Span names follow pattern: zerodb.{operation}
 - Attributes include: collection_name, document_id, operation_type, filter_query
+
+Object Storage Transfers:
+- Uploads stream the multipart/form-data body from the file (MultipartFormStream)
+  instead of building it in memory, so memory use does not grow with file size
+- Downloads stream to disk or to the caller (stream_object) in STREAM_CHUNK_SIZE pieces
+- Signed URLs are reused from the signed URL cache while they have enough
+  validity left, instead of one signing request per page view
+
+Document Cache:
+- get_document reads hot collections (users, events, subscriptions, ...)
+  through the document cache: once per request, then from Redis until the
+  collection's TTL lapses
+- update_document and delete_document invalidate the written document
 """
 
+import json
 import logging
+import os
 import time
-from typing import Any, Dict, List, Optional, Union
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 from urllib.parse import urljoin
 
 import requests
@@ -21,6 +37,8 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from backend.config import settings
+from backend.services.document_cache import DocumentCache, get_document_cache
+from backend.services.signed_url_cache import SignedUrlCache, get_signed_url_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -63,6 +81,103 @@ class ZeroDBValidationError(ZeroDBError):
     pass
 
 
+STREAM_CHUNK_SIZE = 1024 * 1024  # Bytes per read when streaming object downloads
+
+
+class MultipartFormStream:
+    """
+    A multipart/form-data request body read lazily from an open file
+
+    ``requests`` encodes ``files=`` uploads into a single bytes object, so a
+    500MB recording costs 500MB of worker memory. This body yields the form
+    fields, then the file as it is read, then the closing boundary; the HTTP
+    client pulls it in small blocks. ``len()`` is the exact body size, so the
+    request is sent with a Content-Length, and ``seek(0)`` rewinds it so
+    retries resend the whole body.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_name: str,
+        file_obj: BinaryIO,
+        content_type: str,
+        file_field: str = "file"
+    ):
+        """
+        Initialize the body
+
+        Args:
+            fields: Text form fields sent before the file
+            file_name: File name of the file part
+            file_obj: Readable, seekable binary file, read from its current position
+            content_type: MIME type of the file part
+            file_field: Form field name of the file part
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self._file = file_obj
+        self._file_start = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        self._file_size = file_obj.tell() - self._file_start
+        file_obj.seek(self._file_start)
+
+        head = []
+        for name, value in fields.items():
+            head.append(
+                f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f'{value}\r\n'
+            )
+        head.append(
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{file_name}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        )
+        self._head = "".join(head).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._length = len(self._head) + self._file_size + len(self._tail)
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Rewind to the start of the body (the only supported seek)"""
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("MultipartFormStream can only be rewound to the start")
+        self._file.seek(self._file_start)
+        self._position = 0
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes of the body (all remaining if negative)"""
+        if size is None or size < 0:
+            size = self._length - self._position
+
+        pieces = []
+        file_end = len(self._head) + self._file_size
+        while size > 0 and self._position < self._length:
+            position = self._position
+            if position < len(self._head):
+                piece = self._head[position:position + size]
+            elif position < file_end:
+                piece = self._file.read(min(size, file_end - position))
+                if not piece:
+                    raise OSError("File was truncated while it was being uploaded")
+            else:
+                offset = position - file_end
+                piece = self._tail[offset:offset + size]
+            pieces.append(piece)
+            self._position += len(piece)
+            size -= len(piece)
+        return b"".join(pieces)
+
+
 class ZeroDBClient:
     """
     ZeroDB API Client Wrapper
@@ -86,7 +201,9 @@ class ZeroDBClient:
         timeout: int = 10,
         max_retries: int = 3,
         pool_connections: int = 10,
-        pool_maxsize: int = 10
+        pool_maxsize: int = 10,
+        url_cache: Optional[SignedUrlCache] = None,
+        document_cache: Optional[DocumentCache] = None
     ):
         """
         Initialize ZeroDB client with project-based API support
@@ -101,6 +218,8 @@ class ZeroDBClient:
             max_retries: Maximum number of retries for failed requests (default: 3)
             pool_connections: Number of connection pool connections (default: 10)
             pool_maxsize: Maximum size of connection pool (default: 10)
+            url_cache: Signed URL cache (defaults to the global cache)
+            document_cache: Document cache (defaults to the global cache)
         """
         self.api_key = api_key or settings.ZERODB_API_KEY
         self.base_url = (base_url or str(settings.ZERODB_API_BASE_URL)).rstrip('/')
@@ -110,6 +229,8 @@ class ZeroDBClient:
         self.timeout = timeout
         self._jwt_token = None
         self._jwt_token_expiry = None
+        self.url_cache = url_cache or get_signed_url_cache()
+        self.document_cache = document_cache or get_document_cache()
 
         if not self.base_url:
             raise ZeroDBConnectionError("ZERODB_API_BASE_URL is required")
@@ -456,6 +577,8 @@ class ZeroDBClient:
         """
         Get a document by ID from a collection
 
+        Documents of cached collections are served from the document cache.
+
         Args:
             collection: Name of the collection
             document_id: ID of the document to retrieve
@@ -467,6 +590,14 @@ class ZeroDBClient:
             ZeroDBNotFoundError: If document doesn't exist
             ZeroDBError: If retrieval fails
         """
+        return self.document_cache.get_or_fetch(
+            collection,
+            document_id,
+            lambda: self._fetch_document(collection, document_id)
+        )
+
+    def _fetch_document(self, collection: str, document_id: str) -> Dict[str, Any]:
+        """Fetch a document from ZeroDB, bypassing the document cache"""
         url = self._build_url("collections", collection, "documents", document_id)
 
         logger.info(f"Fetching document '{document_id}' from collection '{collection}'")
@@ -696,11 +827,23 @@ class ZeroDBClient:
             ZeroDBValidationError: If data is invalid
             ZeroDBError: If update fails
         """
-        # Use project-based API if project_id is configured
-        if self.project_id:
-            return self._update_row(collection, document_id, data, merge)
-
-        # Legacy collection-based API
+        try:
+            # Use project-based API if project_id is configured
+            if self.project_id:
+                return self._update_row(collection, document_id, data, merge)
+            return self._update_document_impl(collection, document_id, data, merge)
+        finally:
+            # Also after a failure: the write may have been applied
+            self.document_cache.invalidate(collection, document_id)
+
+    def _update_document_impl(
+        self,
+        collection: str,
+        document_id: str,
+        data: Dict[str, Any],
+        merge: bool
+    ) -> Dict[str, Any]:
+        """Update a document using the legacy collection-based API"""
         url = self._build_url("collections", collection, "documents", document_id)
 
         payload = {
@@ -836,13 +979,16 @@ class ZeroDBClient:
         url = self._build_url("collections", collection, "documents", document_id)
 
         logger.info(f"Deleting document '{document_id}' from collection '{collection}'")
-        response = self.session.delete(
-            url,
-            headers=self.headers,
-            timeout=self.timeout
-        )
+        try:
+            response = self.session.delete(
+                url,
+                headers=self.headers,
+                timeout=self.timeout
+            )
+            result = self._handle_response(response)
+        finally:
+            self.document_cache.invalidate(collection, document_id)
 
-        result = self._handle_response(response)
         logger.info(f"Document '{document_id}' deleted successfully")
         return result
 
@@ -1110,7 +1256,6 @@ class ZeroDBClient:
             ZeroDBError: If upload fails
             FileNotFoundError: If file doesn't exist
         """
-        import os
         import mimetypes
 
         if not os.path.exists(file_path):
@@ -1125,30 +1270,13 @@ class ZeroDBClient:
 
         url = self._build_url("storage", "upload")
 
-        # Prepare multipart form data
-        files = {
-            "file": (object_name, open(file_path, "rb"), content_type)
-        }
-
         data = {}
         if metadata:
             data["metadata"] = str(metadata)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
-
         logger.info(f"Uploading object '{object_name}' from '{file_path}'")
-        response = self.session.post(
-            url,
-            files=files,
-            data=data,
-            headers=headers,
-            timeout=self.timeout * 3  # Longer timeout for uploads
-        )
-
-        # Close the file
-        files["file"][1].close()
+        with open(file_path, "rb") as f:
+            response = self._post_multipart(url, data, object_name, f, content_type)
 
         result = self._handle_response(response)
         logger.info(f"Object '{object_name}' uploaded successfully")
@@ -1162,6 +1290,10 @@ class ZeroDBClient:
         """
         Download a file from ZeroDB object storage
 
+        With ``save_path`` the object is streamed to disk in STREAM_CHUNK_SIZE
+        pieces; without it the whole object is returned in memory (use
+        ``stream_object`` for large objects).
+
         Args:
             object_name: Name of the object to download
             save_path: Optional path to save the file (if not provided, returns bytes)
@@ -1173,15 +1305,62 @@ class ZeroDBClient:
             ZeroDBNotFoundError: If object doesn't exist
             ZeroDBError: If download fails
         """
+        logger.info(f"Downloading object '{object_name}'")
+        response = self._open_object_stream(object_name)
+
+        try:
+            if save_path:
+                size = self._save_response(response, save_path)
+                logger.info(f"Object '{object_name}' saved to '{save_path}' ({size} bytes)")
+                return save_path
+
+            content = response.content
+        finally:
+            response.close()
+
+        logger.info(f"Object '{object_name}' downloaded successfully ({len(content)} bytes)")
+        return content
+
+    def stream_object(
+        self,
+        object_name: str,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Stream an object from ZeroDB object storage without buffering it
+
+        The request is made (and errors raised) before this returns, so the
+        iterator can be handed straight to a ``StreamingResponse``.
+
+        Args:
+            object_name: Name of the object to download
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Iterator over the object's bytes; it closes the connection when
+            exhausted or closed
+
+        Raises:
+            ZeroDBNotFoundError: If object doesn't exist
+            ZeroDBError: If download fails
+        """
+        logger.info(f"Streaming object '{object_name}'")
+        response = self._open_object_stream(object_name)
+        return self._iter_response(response, chunk_size)
+
+    def _open_object_stream(self, object_name: str) -> requests.Response:
+        """Start downloading an object, raising if the storage API refuses"""
         url = self._build_url("storage", "download", object_name)
 
-        logger.info(f"Downloading object '{object_name}'")
-        response = self.session.get(
-            url,
-            headers=self.headers,
-            timeout=self.timeout * 3,  # Longer timeout for downloads
-            stream=True
-        )
+        try:
+            response = self.session.get(
+                url,
+                headers=self.headers,
+                timeout=self.timeout * 3,  # Longer timeout for downloads
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            raise ZeroDBConnectionError(f"Download of '{object_name}' failed: {e}")
 
         # Check for errors but don't try to parse JSON
         if not response.ok:
@@ -1190,22 +1369,51 @@ class ZeroDBClient:
                 error_message = error_data.get("detail") or error_data.get("message") or "Download failed"
             except ValueError:
                 error_message = response.text or "Download failed"
+            finally:
+                response.close()
 
             if response.status_code == 404:
                 raise ZeroDBNotFoundError(f"Object not found: {object_name}")
             else:
                 raise ZeroDBError(f"Download failed ({response.status_code}): {error_message}")
 
-        content = response.content
-        logger.info(f"Object '{object_name}' downloaded successfully ({len(content)} bytes)")
+        return response
 
-        if save_path:
-            with open(save_path, "wb") as f:
-                f.write(content)
-            logger.info(f"Object saved to '{save_path}'")
-            return save_path
+    @staticmethod
+    def _iter_response(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+        except requests.exceptions.RequestException as e:
+            raise ZeroDBConnectionError(f"Download interrupted: {e}")
+        finally:
+            response.close()
 
-        return content
+    def _save_response(self, response: requests.Response, save_path: str) -> int:
+        """
+        Write a streamed response to a file
+
+        The body goes to a temporary file next to ``save_path`` that replaces
+        it only once complete, so an interrupted download never leaves a
+        truncated file behind.
+
+        Returns:
+            Bytes written
+        """
+        partial_path = f"{save_path}.part"
+        size = 0
+        try:
+            with open(partial_path, "wb") as f:
+                for chunk in self._iter_response(response, STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(partial_path, save_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.unlink(partial_path)
+            raise
+        return size
 
     def delete_object(
         self,
@@ -1304,59 +1512,116 @@ class ZeroDBClient:
         Raises:
             ZeroDBError: If upload fails
         """
-        url = self._build_url("storage", "upload")
-
         import io
 
-        # Create file-like object from bytes
-        file_obj = io.BytesIO(content)
+        return self.upload_object_from_file(
+            key=key,
+            file_obj=io.BytesIO(content),
+            content_type=content_type,
+            metadata=metadata,
+            ttl=ttl
+        )
 
-        # Prepare multipart form data
-        files = {
-            "file": (key.split("/")[-1], file_obj, content_type)
-        }
+    def upload_object_from_file(
+        self,
+        key: str,
+        file_obj: BinaryIO,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+        ttl: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Upload the contents of an open binary file to ZeroDB object storage
+
+        The file is read from its current position, so callers can upload a
+        temporary file they have just written without loading it into memory
+        first.
+
+        Args:
+            key: Object storage key (path)
+            file_obj: Readable binary file object
+            content_type: MIME type of the content
+            metadata: Optional metadata for the object
+            ttl: Time-to-live in seconds (for automatic expiry)
+
+        Returns:
+            Upload confirmation with object URL and metadata
+
+        Raises:
+            ZeroDBError: If upload fails
+        """
+        url = self._build_url("storage", "upload")
 
         data = {
             "path": key  # Include path to store in specific location
         }
 
         if metadata:
-            import json
             data["metadata"] = json.dumps(metadata)
 
         if ttl:
             data["ttl"] = str(ttl)
 
+        logger.info(f"Uploading object to key '{key}' (ttl={ttl})")
+        response = self._post_multipart(url, data, key.split("/")[-1], file_obj, content_type)
+
+        result = self._handle_response(response)
+        logger.info(f"Object uploaded successfully to '{key}'")
+        return result
+
+    def _post_multipart(
+        self,
+        url: str,
+        fields: Dict[str, str],
+        file_name: str,
+        file_obj: BinaryIO,
+        content_type: str
+    ) -> requests.Response:
+        """
+        POST a file as multipart/form-data, streaming it from ``file_obj``
+
+        Args:
+            url: Upload URL
+            fields: Text form fields
+            file_name: File name of the file part
+            file_obj: Readable, seekable binary file
+            content_type: MIME type of the file
+
+        Returns:
+            The response
+        """
+        body = MultipartFormStream(fields, file_name, file_obj, content_type)
         headers = {
-            "Authorization": f"Bearer {self.api_key}"
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": body.content_type
         }
 
-        logger.info(f"Uploading object to key '{key}' ({len(content)} bytes, ttl={ttl})")
-        response = self.session.post(
+        return self.session.post(
             url,
-            files=files,
-            data=data,
+            data=body,
             headers=headers,
             timeout=self.timeout * 3  # Longer timeout for uploads
         )
 
-        result = self._handle_response(response)
-        logger.info(f"Object uploaded successfully to '{key}'")
-        return result
-
     def generate_signed_url(
         self,
         key: str,
         expiry_seconds: int = 3600,
-        method: str = "GET"
+        method: str = "GET",
+        audience: str = "default"
     ) -> str:
         """
         Generate a signed URL for secure access to an object
 
+        A cached URL for the same key, audience and method is returned while
+        it has enough validity left, so the URL may expire before
+        ``expiry_seconds`` (but never after).
+
         Args:
             key: Object storage key
             expiry_seconds: How long the URL should be valid (in seconds)
             method: HTTP method (GET, PUT, DELETE)
+            audience: Who the URL is handed to (URLs are not shared across audiences)
 
         Returns:
             Signed URL string
@@ -1364,6 +1629,17 @@ class ZeroDBClient:
         Raises:
             ZeroDBError: If URL generation fails
         """
+        signed = self.url_cache.get_or_mint(
+            f"zerodb:{key}",
+            expiry_seconds,
+            lambda ttl: self._mint_signed_url(key, ttl, method),
+            audience=audience,
+            permissions=method
+        )
+        return signed.url
+
+    def _mint_signed_url(self, key: str, expiry_seconds: int, method: str) -> str:
+        """Request a new signed URL from the storage API"""
         url = self._build_url("storage", "signed-url")
 
         payload = {
@@ -1442,6 +1718,7 @@ class ZeroDBClient:
         )
 
         result = self._handle_response(response)
+        self.url_cache.invalidate(f"zerodb:{key}")
         logger.info(f"Object at '{key}' deleted successfully")
         return result
 
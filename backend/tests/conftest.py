@@ -203,6 +203,23 @@ def mock_redis_client(mocker) -> Mock:
     return mock_redis
 
 
+@pytest.fixture
+def lua_redis_client():
+    """
+    Provides an in-memory Redis (fakeredis with Lua) for script tests.
+
+    Services that keep their invariants in Lua scripts are tested against
+    this client so the real scripts run, not a Python copy of them.
+
+    Usage:
+        def test_reserve(lua_redis_client):
+            engine = RSVPBookingEngine(redis_client=lua_redis_client)
+    """
+    import fakeredis
+
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
 @pytest.fixture
 def mock_email_service(mocker) -> Mock:
     """
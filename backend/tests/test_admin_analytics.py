@@ -10,9 +10,10 @@ Tests the /api/admin/analytics endpoint for:
 """
 
 import pytest
+import threading
 from datetime import datetime, timedelta
 from uuid import uuid4
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from fastapi import HTTPException, status
 from freezegun import freeze_time
 
@@ -21,10 +22,12 @@ from backend.routes.admin.analytics import (
     calculate_analytics,
     get_analytics,
     clear_analytics_cache,
+    reconcile_analytics,
     require_admin,
     AnalyticsResponse,
     ANALYTICS_CACHE_KEY,
     ANALYTICS_CACHE_TTL,
+    ANALYTICS_STALE_TTL,
 )
 from backend.models.schemas import User, UserRole
 
@@ -289,15 +292,31 @@ async def test_calculate_analytics_revenue_calculation(mock_get_db):
 # CACHING TESTS
 # ============================================================================
 
+def _memoizing_cache(cached_value):
+    """Mock cache whose aget_or_compute returns cached_value or computes on miss"""
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = cached_value
+
+    async def aget_or_compute(key, compute, ttl, stale_ttl=0, **kwargs):
+        value = mock_cache.get(key)
+        if value is not None:
+            return value
+        value = await compute()
+        mock_cache.set(key=key, value=value, expiration=ttl + stale_ttl)
+        return value
+
+    mock_cache.aget_or_compute = AsyncMock(side_effect=aget_or_compute)
+    return mock_cache
+
+
 @pytest.mark.asyncio
 @patch('backend.routes.admin.analytics.get_cache_service')
 @patch('backend.routes.admin.analytics.calculate_analytics')
 async def test_get_analytics_returns_cached_data(mock_calculate, mock_get_cache, mock_admin_user, sample_analytics_data):
     """Test that cached data is returned when available"""
     # Setup mocks
-    mock_cache = MagicMock()
+    mock_cache = _memoizing_cache(sample_analytics_data)
     mock_get_cache.return_value = mock_cache
-    mock_cache.get.return_value = sample_analytics_data
 
     result = await get_analytics(force_refresh=False, current_user=mock_admin_user)
 
@@ -310,6 +329,7 @@ async def test_get_analytics_returns_cached_data(mock_calculate, mock_get_cache,
     # Verify response has cached=True
     assert result.cached is True
     assert result.total_members == 145
+    assert sample_analytics_data["cached"] is False  # Shared result left unchanged
 
 
 @pytest.mark.asyncio
@@ -318,15 +338,17 @@ async def test_get_analytics_returns_cached_data(mock_calculate, mock_get_cache,
 async def test_get_analytics_calculates_when_cache_miss(mock_calculate, mock_get_cache, mock_admin_user, sample_analytics_data):
     """Test that analytics are calculated when cache is empty"""
     # Setup mocks
-    mock_cache = MagicMock()
+    mock_cache = _memoizing_cache(None)  # Cache miss
     mock_get_cache.return_value = mock_cache
-    mock_cache.get.return_value = None  # Cache miss
     mock_calculate.return_value = sample_analytics_data
 
     result = await get_analytics(force_refresh=False, current_user=mock_admin_user)
 
-    # Verify cache was checked
+    # Verify cache was checked through the single-flight memoizer
     mock_cache.get.assert_called_once_with(ANALYTICS_CACHE_KEY)
+    mock_cache.aget_or_compute.assert_awaited_once()
+    assert mock_cache.aget_or_compute.call_args.kwargs["ttl"] == ANALYTICS_CACHE_TTL
+    assert mock_cache.aget_or_compute.call_args.kwargs["stale_ttl"] == ANALYTICS_STALE_TTL
 
     # Verify calculate_analytics WAS called
     mock_calculate.assert_called_once()
@@ -335,8 +357,9 @@ async def test_get_analytics_calculates_when_cache_miss(mock_calculate, mock_get
     mock_cache.set.assert_called_once_with(
         key=ANALYTICS_CACHE_KEY,
         value=sample_analytics_data,
-        expiration=ANALYTICS_CACHE_TTL
+        expiration=ANALYTICS_CACHE_TTL + ANALYTICS_STALE_TTL
     )
+    assert result.cached is False
 
     assert result.total_members == 145
 
@@ -380,6 +403,25 @@ async def test_clear_analytics_cache_success(mock_get_cache, mock_admin_user):
     assert "cleared_at" in result
 
 
+@pytest.mark.asyncio
+@patch('backend.routes.admin.analytics.get_analytics_aggregates_service')
+async def test_reconcile_analytics_runs_off_event_loop(mock_get_aggregates, mock_admin_user, sample_analytics_data):
+    """Test the blocking reconciliation runs in a worker thread"""
+    loop_thread = threading.get_ident()
+    reconcile_threads = []
+
+    def reconcile():
+        reconcile_threads.append(threading.get_ident())
+        return sample_analytics_data
+
+    mock_get_aggregates.return_value.reconcile.side_effect = reconcile
+
+    result = await reconcile_analytics(current_user=mock_admin_user)
+
+    assert reconcile_threads and reconcile_threads[0] != loop_thread
+    assert result.total_members == sample_analytics_data["total_members"]
+
+
 # ============================================================================
 # EDGE CASES AND ERROR HANDLING
 # ============================================================================
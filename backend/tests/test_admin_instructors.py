@@ -118,6 +118,7 @@ async def test_list_instructors_success(mock_admin_user, mock_instructor_user, m
             page_size=20,
             is_active=None,
             discipline=None,
+            search=None,
             current_user=mock_admin_user
         )
 
@@ -142,6 +143,7 @@ async def test_list_instructors_with_discipline_filter(mock_admin_user, mock_ins
             page_size=20,
             is_active=None,
             discipline="Karate",
+            search=None,
             current_user=mock_admin_user
         )
 
@@ -188,6 +190,7 @@ async def test_list_instructors_pagination(mock_admin_user, mock_db_client):
             page_size=20,
             is_active=None,
             discipline=None,
+            search=None,
             current_user=mock_admin_user
         )
 
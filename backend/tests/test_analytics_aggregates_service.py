@@ -0,0 +1,413 @@
+"""
+Unit Tests for Analytics Aggregates Service
+
+Tests the materialized dashboard aggregates including:
+- Idempotent write hooks (members, subscriptions, payments, events,
+  training sessions, applications)
+- O(1) snapshot reads
+- Reconciliation from source collections, including writes journaled
+  while a rebuild is running (against fakeredis with Lua)
+- Graceful degradation when Redis is unavailable
+"""
+
+import pytest
+import redis
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from backend.services import analytics_aggregates_service as aggregates
+from backend.services.analytics_aggregates_service import (
+    AnalyticsAggregatesService,
+    AnalyticsAggregatesError,
+    MEMBERS_KEY,
+    ACTIVE_SUBSCRIPTIONS_KEY,
+    EVENTS_BY_START_KEY,
+    LIVE_SESSIONS_KEY,
+    PENDING_APPLICATIONS_KEY,
+    REVENUE_BY_MONTH_KEY,
+    SIGNUPS_BY_DAY_KEY,
+    TOTALS_KEY,
+    REBUILD_KEY,
+    JOURNAL_KEY,
+    is_counted_member,
+    payment_month,
+)
+from backend.models.schemas import SubscriptionStatus
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client with pipeline support"""
+    client = MagicMock()
+    pipe = MagicMock()
+    client.pipeline.return_value = pipe
+    return client
+
+
+@pytest.fixture
+def mock_db():
+    """Mock ZeroDB client"""
+    return MagicMock()
+
+
+@pytest.fixture
+def service(mock_redis, mock_db):
+    """AnalyticsAggregatesService with mocked dependencies"""
+    return AnalyticsAggregatesService(redis_client=mock_redis, zerodb_client=mock_db)
+
+
+@pytest.fixture
+def lua_service(lua_redis_client, mock_db):
+    """AnalyticsAggregatesService on an in-memory Redis that runs its Lua scripts"""
+    return AnalyticsAggregatesService(redis_client=lua_redis_client, zerodb_client=mock_db)
+
+
+def source_query(data):
+    """Build a query_documents side effect serving ``data`` on the first page"""
+    def query(collection, filters=None, limit=10, offset=0):
+        return {"documents": data.get(collection, []) if offset == 0 else []}
+    return query
+
+
+class TestWriteHooks:
+    """Test incremental write hooks"""
+
+    def test_record_member_adds_to_set(self, service, mock_redis):
+        service.record_user("user-1", {"role": "member", "is_active": True})
+
+        pipe = mock_redis.pipeline.return_value
+        pipe.sadd.assert_called_once_with(MEMBERS_KEY, "user-1")
+        pipe.hincrby.assert_not_called()
+        pipe.execute.assert_called_once()
+
+    def test_record_inactive_member_removes_from_set(self, service, mock_redis):
+        service.record_user("user-1", {"role": "member", "is_active": False})
+
+        mock_redis.pipeline.return_value.srem.assert_called_once_with(MEMBERS_KEY, "user-1")
+
+    def test_record_created_user_counts_signup_bucket(self, service, mock_redis):
+        service.record_user(
+            "user-1",
+            {"role": "public", "is_active": True, "created_at": "2025-03-04T10:00:00"},
+            created=True
+        )
+
+        mock_redis.pipeline.return_value.hincrby.assert_called_once_with(
+            SIGNUPS_BY_DAY_KEY, "2025-03-04", 1
+        )
+
+    def test_record_subscription_uses_status_enum(self, service, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        service.record_subscription("sub-1", {"status": SubscriptionStatus.ACTIVE})
+        pipe.sadd.assert_called_once_with(ACTIVE_SUBSCRIPTIONS_KEY, "sub-1")
+
+        service.record_subscription("sub-1", {"status": SubscriptionStatus.CANCELED})
+        pipe.srem.assert_called_once_with(ACTIVE_SUBSCRIPTIONS_KEY, "sub-1")
+
+    def test_record_succeeded_payment_counts_cents(self, service, mock_redis):
+        count_script = MagicMock()
+        reverse_script = MagicMock()
+        mock_redis.register_script.side_effect = [count_script, reverse_script, MagicMock(), MagicMock()]
+
+        service.record_payment(
+            "pay-1",
+            {"status": "succeeded", "amount": 49.99, "processed_at": "2025-02-10T00:00:00"}
+        )
+
+        count_script.assert_called_once()
+        assert count_script.call_args.kwargs["args"] == ["pay-1", 4999, "2025-02"]
+        reverse_script.assert_not_called()
+
+    def test_record_refunded_payment_reverses(self, service, mock_redis):
+        count_script = MagicMock()
+        reverse_script = MagicMock()
+        mock_redis.register_script.side_effect = [count_script, reverse_script, MagicMock(), MagicMock()]
+
+        service.record_payment("pay-1", {"status": "refunded", "amount": 49.99})
+
+        reverse_script.assert_called_once()
+        assert reverse_script.call_args.kwargs["args"] == ["pay-1"]
+        count_script.assert_not_called()
+
+    def test_record_published_event_indexed_by_start(self, service, mock_redis):
+        service.record_event(
+            "evt-1",
+            {"is_published": True, "is_deleted": False, "start_date": "2030-01-01T00:00:00"}
+        )
+
+        mock_redis.pipeline.return_value.zadd.assert_called_once_with(
+            EVENTS_BY_START_KEY, {"evt-1": datetime(2030, 1, 1).timestamp()}
+        )
+
+    def test_record_unpublished_event_removed(self, service, mock_redis):
+        service.record_event("evt-1", {"is_published": False, "start_date": "2030-01-01"})
+        mock_redis.pipeline.return_value.zrem.assert_called_once_with(EVENTS_BY_START_KEY, "evt-1")
+
+    def test_record_live_session_added_to_set(self, service, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        service.record_training_session("session-1", {"status": "live"})
+        pipe.sadd.assert_called_once_with(LIVE_SESSIONS_KEY, "session-1")
+
+        service.record_training_session("session-1", {"status": "ended"})
+        pipe.srem.assert_called_once_with(LIVE_SESSIONS_KEY, "session-1")
+
+    def test_record_application_tracks_submitted_only(self, service, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        service.record_application("app-1", {"status": "submitted"})
+        pipe.sadd.assert_called_once_with(PENDING_APPLICATIONS_KEY, "app-1")
+
+        service.record_application("app-1", {"status": "under_review"})
+        pipe.srem.assert_called_once_with(PENDING_APPLICATIONS_KEY, "app-1")
+
+    def test_hook_errors_do_not_propagate(self, service, mock_redis):
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("connection reset")
+
+        # Should not raise
+        service.record_subscription("sub-1", {"status": "active"})
+
+    def test_hooks_noop_without_redis(self, mock_db):
+        service = AnalyticsAggregatesService(zerodb_client=mock_db)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "backend.services.analytics_aggregates_service.redis.from_url",
+                MagicMock(side_effect=Exception("unavailable"))
+            )
+            service.record_user("user-1", {"role": "member", "is_active": True})
+            assert service.get_snapshot() is None
+
+
+    def test_unreachable_redis_retried_after_interval(self, mock_db):
+        service = AnalyticsAggregatesService(zerodb_client=mock_db)
+        from_url = MagicMock(side_effect=redis.ConnectionError("unavailable"))
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("backend.services.analytics_aggregates_service.redis.from_url", from_url)
+            service.record_user("user-1", {"role": "member", "is_active": True})
+            service.record_payment("pay-1", {"status": "succeeded", "amount": 10})
+            assert from_url.call_count == 1  # No reconnect per write
+
+            service._redis_retry_at = 0.0  # Retry interval elapsed
+            service.record_user("user-1", {"role": "member", "is_active": True})
+            assert from_url.call_count == 2
+
+    def test_connection_error_bypasses_redis(self, service, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = redis.ConnectionError("connection reset")
+
+        service.record_subscription("sub-1", {"status": "active"})
+        service.record_subscription("sub-2", {"status": "active"})
+
+        pipe.execute.assert_called_once()
+
+    def test_hooks_journal_only_during_rebuild(self, lua_service, lua_redis_client):
+        lua_service.record_subscription("sub-1", {"status": "active"})
+        assert lua_redis_client.llen(JOURNAL_KEY) == 0
+
+        lua_redis_client.set(REBUILD_KEY, "token")
+        lua_service.record_subscription("sub-2", {"status": "active"})
+        lua_service.record_payment("pay-1", {"status": "succeeded", "amount": 10, "created_at": "2025-01-02"})
+
+        assert lua_redis_client.smembers(ACTIVE_SUBSCRIPTIONS_KEY) == {"sub-1", "sub-2"}
+        assert lua_redis_client.lrange(JOURNAL_KEY, 0, -1) == [
+            f'["sadd", "{ACTIVE_SUBSCRIPTIONS_KEY}", "sub-2"]',
+            '["payment", "pay-1", "1000|2025-01"]',
+        ]
+
+
+class TestSnapshot:
+    """Test O(1) snapshot reads"""
+
+    def test_snapshot_none_before_reconciliation(self, service, mock_redis):
+        mock_redis.pipeline.return_value.execute.return_value = [0, 0, 0, 0, {}, None, [], 0, 0]
+        assert service.get_snapshot() is None
+
+    def test_snapshot_assembles_metrics(self, service, mock_redis):
+        mock_redis.pipeline.return_value.execute.return_value = [
+            145,
+            89,
+            2,
+            5,
+            {
+                "revenue_cents": "1245050",
+                "reconciled_at": "2025-01-14T10:30:00",
+            },
+            "234000",
+            ["3", None, "20"],
+            12,
+            8,
+        ]
+
+        snapshot = service.get_snapshot(now=datetime(2025, 1, 14, 12, 0, 0))
+
+        assert snapshot["total_members"] == 145
+        assert snapshot["active_subscriptions"] == 89
+        assert snapshot["total_revenue"] == 12450.50
+        assert snapshot["revenue_this_month"] == 2340.00
+        assert snapshot["recent_signups"] == 23
+        assert snapshot["upcoming_events"] == 12
+        assert snapshot["total_events_this_month"] == 8
+        assert snapshot["active_sessions"] == 2
+        assert snapshot["pending_applications"] == 5
+
+    def test_snapshot_reads_fixed_signup_window(self, service, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [0, 0, 0, 0, {}, None, [], 0, 0]
+
+        service.get_snapshot(now=datetime(2025, 1, 31))
+
+        _, days = pipe.hmget.call_args.args
+        assert len(days) == 31
+        assert days[0] == "2025-01-31"
+        assert days[-1] == "2025-01-01"
+
+
+class TestReconcile:
+    """Test reconciliation from source collections"""
+
+    def test_reconcile_rebuilds_and_swaps(self, lua_service, lua_redis_client, mock_db):
+        mock_db.query_documents.side_effect = source_query({
+            "users": [
+                {"id": "u1", "data": {"role": "member", "is_active": True, "created_at": "2025-01-10T00:00:00"}},
+                {"id": "u2", "data": {"role": "public", "is_active": True, "created_at": "2024-01-10T00:00:00"}},
+            ],
+            "subscriptions": [{"id": "s1", "data": {"status": "active"}}],
+            "payments": [
+                {"id": "p1", "data": {"status": "succeeded", "amount": 100, "created_at": "2025-01-02T00:00:00"}},
+                {"id": "p2", "data": {"status": "succeeded", "amount": 50.5, "created_at": "2024-12-02T00:00:00"}},
+            ],
+            "events": [{"id": "e1", "data": {"start_date": "2025-02-01T00:00:00"}}],
+            "training_sessions": [{"id": "t1", "data": {"status": "live"}}],
+            "applications": [{"id": "a1", "data": {"status": "submitted"}}],
+        })
+        lua_redis_client.sadd(MEMBERS_KEY, "stale-user")
+
+        snapshot = lua_service.reconcile(now=datetime(2025, 1, 15))
+
+        assert lua_redis_client.smembers(MEMBERS_KEY) == {"u1"}
+        assert lua_redis_client.smembers(ACTIVE_SUBSCRIPTIONS_KEY) == {"s1"}
+        assert lua_redis_client.smembers(LIVE_SESSIONS_KEY) == {"t1"}
+        assert lua_redis_client.smembers(PENDING_APPLICATIONS_KEY) == {"a1"}
+        assert lua_redis_client.hget(TOTALS_KEY, "revenue_cents") == "15050"
+        assert lua_redis_client.zrange(EVENTS_BY_START_KEY, 0, -1) == ["e1"]
+        assert not lua_redis_client.exists(REBUILD_KEY, JOURNAL_KEY)
+        assert not lua_redis_client.keys("*:rebuild:*")
+        assert snapshot["total_members"] == 1
+        assert snapshot["total_revenue"] == 150.50
+
+    def test_reconcile_counts_documents_repeated_across_pages_once(
+        self, lua_service, lua_redis_client, mock_db, monkeypatch
+    ):
+        monkeypatch.setattr(aggregates, "RECONCILE_PAGE_SIZE", 2)
+        p1 = {"id": "p1", "data": {"status": "succeeded", "amount": 100, "created_at": "2025-01-02T00:00:00"}}
+        p2 = {"id": "p2", "data": {"status": "succeeded", "amount": 20, "created_at": "2025-01-03T00:00:00"}}
+        u1 = {"id": "u1", "data": {"role": "member", "is_active": True, "created_at": "2025-01-10T00:00:00"}}
+        u2 = {"id": "u2", "data": {"role": "member", "is_active": True, "created_at": "2025-01-11T00:00:00"}}
+        pages = {
+            # p1 and u1 shift onto the second page while paging
+            "payments": [[p1, p2], [p1]],
+            "users": [[u1, u2], [u1]],
+        }
+
+        def query(collection, filters=None, limit=10, offset=0):
+            collection_pages = pages.get(collection, [])
+            page = offset // limit
+            return {"documents": collection_pages[page] if page < len(collection_pages) else []}
+
+        mock_db.query_documents.side_effect = query
+
+        lua_service.reconcile(now=datetime(2025, 1, 15))
+
+        assert lua_redis_client.hget(TOTALS_KEY, "revenue_cents") == "12000"
+        assert lua_redis_client.hgetall(REVENUE_BY_MONTH_KEY) == {"2025-01": "12000"}
+        assert lua_redis_client.hgetall(SIGNUPS_BY_DAY_KEY) == {"2025-01-10": "1", "2025-01-11": "1"}
+
+    def test_reconcile_keeps_writes_made_during_scan(self, lua_service, lua_redis_client, mock_db):
+        data = {
+            "users": [{"id": "u1", "data": {"role": "member", "is_active": True}}],
+            "payments": [
+                {"id": "p1", "data": {"status": "succeeded", "amount": 100, "created_at": "2025-01-02T00:00:00"}},
+            ],
+            "subscriptions": [{"id": "s1", "data": {"status": "active"}}],
+        }
+        scan = source_query(data)
+
+        def query(collection, filters=None, limit=10, offset=0):
+            result = scan(collection, filters, limit, offset)
+            if collection == "subscriptions" and offset == 0:
+                # Hooks fire after their collection was scanned
+                lua_service.record_user("u1", {"role": "member", "is_active": False})
+                lua_service.record_payment("p1", {"status": "refunded", "amount": 100})
+                lua_service.record_subscription("s2", {"status": "active"})
+            return result
+
+        mock_db.query_documents.side_effect = query
+
+        lua_service.reconcile(now=datetime(2025, 1, 15))
+
+        assert lua_redis_client.smembers(MEMBERS_KEY) == set()
+        assert lua_redis_client.smembers(ACTIVE_SUBSCRIPTIONS_KEY) == {"s1", "s2"}
+        assert lua_redis_client.hget(TOTALS_KEY, "revenue_cents") == "0"
+        assert not lua_redis_client.exists(JOURNAL_KEY)
+
+    def test_reconcile_replays_writes_made_before_swap(self, lua_service, lua_redis_client, mock_db, monkeypatch):
+        mock_db.query_documents.side_effect = source_query({
+            "subscriptions": [{"id": "s1", "data": {"status": "active"}}],
+        })
+        reads = []
+        lrange = lua_redis_client.lrange
+
+        def lrange_then_write(*args):
+            entries = lrange(*args)
+            reads.append(entries)
+            if len(reads) == 1:
+                # Lands after the journal was read, before the swap
+                lua_service.record_subscription("s2", {"status": "active"})
+            return entries
+
+        monkeypatch.setattr(lua_redis_client, "lrange", lrange_then_write)
+
+        lua_service.reconcile(now=datetime(2025, 1, 15))
+
+        assert len(reads) == 2
+        assert lua_redis_client.smembers(ACTIVE_SUBSCRIPTIONS_KEY) == {"s1", "s2"}
+
+    def test_concurrent_reconcile_rejected(self, lua_service, lua_redis_client, mock_db):
+        lua_redis_client.set(REBUILD_KEY, "other-worker")
+
+        with pytest.raises(AnalyticsAggregatesError, match="already running"):
+            lua_service.reconcile()
+
+        assert lua_redis_client.get(REBUILD_KEY) == "other-worker"
+        mock_db.query_documents.assert_not_called()
+
+    def test_failed_reconcile_ends_rebuild(self, lua_service, lua_redis_client, mock_db):
+        mock_db.query_documents.side_effect = Exception("ZeroDB unavailable")
+
+        with pytest.raises(AnalyticsAggregatesError):
+            lua_service.reconcile()
+
+        assert not lua_redis_client.exists(REBUILD_KEY)
+        lua_service.record_subscription("s1", {"status": "active"})
+        assert not lua_redis_client.exists(JOURNAL_KEY)
+
+    def test_reconcile_without_redis_raises(self, mock_db):
+        service = AnalyticsAggregatesService(zerodb_client=mock_db)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "backend.services.analytics_aggregates_service.redis.from_url",
+                MagicMock(side_effect=Exception("unavailable"))
+            )
+            with pytest.raises(AnalyticsAggregatesError):
+                service.reconcile()
+
+
+def test_is_counted_member():
+    assert is_counted_member({"role": "member", "is_active": True})
+    assert not is_counted_member({"role": "admin", "is_active": True})
+    assert not is_counted_member({"role": "member"})
+
+
+def test_payment_month_prefers_created_at():
+    assert payment_month({"created_at": "2025-05-01T00:00:00Z", "processed_at": "2025-06-01"}) == "2025-05"
+    assert payment_month({"processed_at": "2025-06-01T00:00:00"}) == "2025-06"
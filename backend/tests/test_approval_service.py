@@ -682,6 +682,23 @@ class TestAutoApproveApplication:
         assert len(user_update_calls) > 0
         assert user_update_calls[0][0][2]["role"] == UserRole.MEMBER
 
+    def test_auto_approve_reindexes_user(
+        self,
+        approval_service,
+        mock_zerodb_client,
+        sample_application
+    ):
+        """Test auto-approve refreshes the user's role in admin search"""
+        mock_zerodb_client.get_document.return_value = {"data": sample_application}
+        mock_zerodb_client.update_document.return_value = {"data": {}}
+
+        with patch("backend.services.approval_service.record_person") as record_person:
+            approval_service.auto_approve_application(sample_application["id"])
+
+        user_id, user = record_person.call_args.args
+        assert user_id == str(sample_application["user_id"])
+        assert user["role"] == UserRole.MEMBER.value
+
     def test_auto_approve_creates_audit_log(
         self,
         approval_service,
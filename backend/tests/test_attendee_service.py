@@ -21,6 +21,7 @@ from backend.services.attendee_service import (
     AttendeeServiceError,
     get_attendee_service
 )
+from backend.services.rsvp_booking_engine import RSVPBookingError
 from backend.models.schemas import RSVPStatus
 
 
@@ -31,10 +32,16 @@ class TestAttendeeService:
     def attendee_service(self):
         """Create AttendeeService instance with mocked dependencies"""
         with patch("backend.services.attendee_service.get_zerodb_client") as mock_db, \
-             patch("backend.services.attendee_service.get_email_service") as mock_email:
+             patch("backend.services.attendee_service.get_email_service") as mock_email, \
+             patch("backend.services.attendee_service.get_email_queue_service") as mock_queue, \
+             patch("backend.services.attendee_service.get_rsvp_booking_engine") as mock_booking:
+            # Booking engine unavailable: waitlist promotion takes the ZeroDB path
+            mock_booking.return_value.promote_next.side_effect = RSVPBookingError("Redis down")
             service = AttendeeService()
             service.db = mock_db.return_value
             service.email_service = mock_email.return_value
+            service.email_queue = mock_queue.return_value
+            service.email_queue.enqueue_many.return_value = ("batch-123", [])
             yield service
 
     @pytest.fixture
@@ -227,8 +234,6 @@ class TestAttendeeService:
             "total": len(sample_attendees)
         })
 
-        attendee_service.email_service._send_email = Mock(return_value={"MessageID": "test-123"})
-
         result = attendee_service.send_bulk_email(
             event_id=sample_event_id,
             subject="Test Event Update",
@@ -238,7 +243,12 @@ class TestAttendeeService:
         assert result["sent"] == 3
         assert result["failed"] == 0
         assert result["total"] == 3
-        assert attendee_service.email_service._send_email.call_count == 3
+        assert result["batch_id"] == "batch-123"
+        assert attendee_service.email_service.build_message.call_count == 3
+        # All messages are queued in a single batch
+        attendee_service.email_queue.enqueue_many.assert_called_once()
+        assert len(attendee_service.email_queue.enqueue_many.call_args.args[0]) == 3
+        attendee_service.email_service._send_email.assert_not_called()
 
     def test_send_bulk_email_with_filter(self, attendee_service, sample_event_id, sample_attendees):
         """Test sending bulk email with status filter"""
@@ -249,8 +259,6 @@ class TestAttendeeService:
             "total": len(confirmed)
         })
 
-        attendee_service.email_service._send_email = Mock(return_value={"MessageID": "test-123"})
-
         result = attendee_service.send_bulk_email(
             event_id=sample_event_id,
             subject="Confirmed Only",
@@ -260,7 +268,7 @@ class TestAttendeeService:
 
         assert result["sent"] == 2
         assert result["failed"] == 0
-        assert attendee_service.email_service._send_email.call_count == 2
+        assert len(attendee_service.email_queue.enqueue_many.call_args.args[0]) == 2
 
     def test_send_bulk_email_no_attendees(self, attendee_service, sample_event_id):
         """Test bulk email with no attendees"""
@@ -277,23 +285,24 @@ class TestAttendeeService:
 
         assert result["sent"] == 0
         assert result["failed"] == 0
+        assert result["total"] == 0
+        assert result["errors"] == []
         assert "No attendees found" in result["message"]
+        attendee_service.email_queue.enqueue_many.assert_not_called()
 
     def test_send_bulk_email_partial_failure(self, attendee_service, sample_event_id, sample_attendees):
-        """Test bulk email with some failures"""
-        from backend.services.email_service import EmailSendError
-
+        """Test bulk email with some messages failing to build"""
         attendee_service.get_attendees = Mock(return_value={
             "attendees": sample_attendees,
             "total": len(sample_attendees)
         })
 
-        # First call succeeds, second fails, third succeeds
-        attendee_service.email_service._send_email = Mock(
+        # First message builds, second fails, third builds
+        attendee_service.email_service.build_message = Mock(
             side_effect=[
-                {"MessageID": "test-1"},
-                EmailSendError("Send failed"),
-                {"MessageID": "test-3"}
+                {"To": "a@example.com"},
+                ValueError("Invalid message"),
+                {"To": "c@example.com"}
             ]
         )
 
@@ -306,6 +315,7 @@ class TestAttendeeService:
         assert result["sent"] == 2
         assert result["failed"] == 1
         assert len(result["errors"]) == 1
+        assert len(attendee_service.email_queue.enqueue_many.call_args.args[0]) == 2
 
     # ========================================================================
     # CHECK-IN TESTS
@@ -691,8 +701,6 @@ class TestAttendeeService:
             "total": 2
         })
 
-        attendee_service.email_service._send_email = Mock(return_value={"MessageID": "test-123"})
-
         result = attendee_service.send_bulk_email(
             event_id=sample_event_id,
             subject="Test",
@@ -704,28 +712,23 @@ class TestAttendeeService:
         assert len(result["errors"]) == 1
         assert "No email for attendee" in result["errors"][0]
 
-    def test_send_bulk_email_all_emails_fail(self, attendee_service, sample_event_id, sample_attendees):
-        """Test bulk email when all email sends fail"""
-        from backend.services.email_service import EmailSendError
+    def test_send_bulk_email_queue_unavailable(self, attendee_service, sample_event_id, sample_attendees):
+        """Test bulk email when the email queue cannot accept messages"""
+        from backend.services.email_queue_service import EmailQueueError
 
         attendee_service.get_attendees = Mock(return_value={
             "attendees": sample_attendees,
             "total": len(sample_attendees)
         })
 
-        attendee_service.email_service._send_email = Mock(
-            side_effect=EmailSendError("Email service unavailable")
-        )
-
-        result = attendee_service.send_bulk_email(
-            event_id=sample_event_id,
-            subject="Test",
-            message="Test message"
-        )
+        attendee_service.email_queue.enqueue_many.side_effect = EmailQueueError("Redis unavailable")
 
-        assert result["sent"] == 0
-        assert result["failed"] == 3
-        assert len(result["errors"]) > 0
+        with pytest.raises(AttendeeServiceError, match="Redis unavailable"):
+            attendee_service.send_bulk_email(
+                event_id=sample_event_id,
+                subject="Test",
+                message="Test message"
+            )
 
     def test_send_bulk_email_generic_exception(self, attendee_service, sample_event_id, sample_attendees):
         """Test bulk email with generic exception during send"""
@@ -734,8 +737,7 @@ class TestAttendeeService:
             "total": len(sample_attendees)
         })
 
-        # Generic exception (not EmailSendError)
-        attendee_service.email_service._send_email = Mock(
+        attendee_service.email_service.build_message = Mock(
             side_effect=RuntimeError("Unexpected error")
         )
 
@@ -748,11 +750,10 @@ class TestAttendeeService:
         assert result["sent"] == 0
         assert result["failed"] == 3
         assert any("Unexpected error" in err for err in result["errors"])
+        attendee_service.email_queue.enqueue_many.assert_not_called()
 
     def test_send_bulk_email_error_limit(self, attendee_service, sample_event_id):
         """Test that bulk email limits errors returned to 10"""
-        from backend.services.email_service import EmailSendError
-
         # Create 15 attendees to test error limiting
         many_attendees = [
             {
@@ -769,8 +770,8 @@ class TestAttendeeService:
             "total": 15
         })
 
-        attendee_service.email_service._send_email = Mock(
-            side_effect=EmailSendError("Failed")
+        attendee_service.email_service.build_message = Mock(
+            side_effect=ValueError("Failed")
         )
 
         result = attendee_service.send_bulk_email(
@@ -782,6 +783,17 @@ class TestAttendeeService:
         assert result["failed"] == 15
         assert len(result["errors"]) == 10  # Limited to 10
 
+    def test_get_bulk_email_status(self, attendee_service):
+        """Test bulk email delivery status comes from the email queue"""
+        attendee_service.email_queue.get_batch_status.return_value = {
+            "batch_id": "batch-123", "total": 3, "queued": 1, "sent": 2, "failed": 0
+        }
+
+        result = attendee_service.get_bulk_email_status("batch-123")
+
+        assert result["sent"] == 2
+        attendee_service.email_queue.get_batch_status.assert_called_once_with("batch-123")
+
     def test_send_bulk_email_get_attendees_error(self, attendee_service, sample_event_id):
         """Test bulk email when get_attendees raises error"""
         attendee_service.get_attendees = Mock(
@@ -957,7 +969,8 @@ class TestAttendeeServiceSingleton:
     def test_get_attendee_service_singleton(self):
         """Test that get_attendee_service returns same instance"""
         with patch("backend.services.attendee_service.get_zerodb_client"), \
-             patch("backend.services.attendee_service.get_email_service"):
+             patch("backend.services.attendee_service.get_email_service"), \
+             patch("backend.services.attendee_service.get_email_queue_service"):
 
             service1 = get_attendee_service()
             service2 = get_attendee_service()
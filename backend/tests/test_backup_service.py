@@ -29,7 +29,7 @@ from backend.services.backup_service import (
     BACKUP_METADATA_COLLECTION,
     BACKUP_VERSION
 )
-from backend.services.zerodb_service import ZeroDBError, ZeroDBNotFoundError
+from backend.services.zerodb_service import ZeroDBError
 
 
 class TestBackupServiceInitialization:
@@ -625,17 +625,7 @@ class TestRestoreCollection:
     def test_restore_collection_create_documents(self, mock_service):
         """Test restore creating new documents"""
         # Mock documents don't exist
-        mock_service.client.get_document.side_effect = [
-            # First call for backup metadata
-            {
-                "backup_id": "users_full_20250109_120000",
-                "collection": "users",
-                "file_name": "users_full_20250109_120000.json.gz"
-            },
-            # Subsequent calls for checking document existence
-            ZeroDBNotFoundError("Not found"),
-            ZeroDBNotFoundError("Not found")
-        ]
+        mock_service.client.query_documents.return_value = {"documents": []}
 
         mock_service.client.create_document.return_value = {"id": "created"}
 
@@ -651,18 +641,10 @@ class TestRestoreCollection:
 
     def test_restore_collection_update_documents(self, mock_service):
         """Test restore updating existing documents"""
-        # Mock metadata retrieval first, then document existence checks
-        mock_service.client.get_document.side_effect = [
-            # First call for backup metadata
-            {
-                "backup_id": "users_full_20250109_120000",
-                "collection": "users",
-                "file_name": "users_full_20250109_120000.json.gz"
-            },
-            # Next calls for checking document existence
-            {"id": "existing"},
-            {"id": "existing"}
-        ]
+        # Mock both documents existing (one batched lookup)
+        mock_service.client.query_documents.return_value = {
+            "documents": [{"id": "user_1"}, {"id": "user_2"}]
+        }
         mock_service.client.update_document.return_value = {"id": "updated"}
 
         result = mock_service.restore_collection(
@@ -673,20 +655,17 @@ class TestRestoreCollection:
         assert mock_service.client.update_document.call_count == 2
         assert result["updated"] == 2
         assert result["created"] == 0
+        mock_service.client.query_documents.assert_called_once_with(
+            collection="users",
+            filters={"id": {"$in": ["user_1", "user_2"]}},
+            limit=2
+        )
 
     def test_restore_collection_merge_mode(self, mock_service):
         """Test restore with merge mode enabled"""
-        mock_service.client.get_document.side_effect = [
-            # First call for backup metadata
-            {
-                "backup_id": "users_full_20250109_120000",
-                "collection": "users",
-                "file_name": "users_full_20250109_120000.json.gz"
-            },
-            # Next calls for checking document existence
-            {"id": "existing"},
-            {"id": "existing"}
-        ]
+        mock_service.client.query_documents.return_value = {
+            "documents": [{"id": "user_1"}, {"id": "user_2"}]
+        }
         mock_service.client.update_document.return_value = {"id": "updated"}
 
         result = mock_service.restore_collection(
@@ -992,3 +971,136 @@ class TestEdgeCases:
 
         assert result["document_count"] == 1
         assert len(result["documents"][0]["data"]) == 1000000
+
+
+class TestStreamingBackup:
+    """Test streaming NDJSON backups and restoring them"""
+
+    @pytest.fixture
+    def storage(self):
+        """In-memory object storage"""
+        return {}
+
+    @pytest.fixture
+    def mock_service(self, tmp_path, storage):
+        """BackupService whose uploads and downloads go to in-memory storage"""
+        mock_client = Mock()
+        service = BackupService(client=mock_client, temp_dir=str(tmp_path))
+
+        def upload(file_path, object_name, metadata, content_type):
+            storage[object_name] = Path(file_path).read_bytes()
+            return {"object_id": object_name}
+
+        def download(object_name, save_path):
+            Path(save_path).write_bytes(storage[object_name])
+
+        def query(collection, filters=None, limit=100, offset=0, sort=None):
+            if collection == BACKUP_METADATA_COLLECTION or (filters and "id" in filters):
+                return {"documents": []}
+            docs = [{"id": f"user_{i}", "name": f"User {i}"} for i in range(1200)]
+            return {"documents": docs[offset:offset + limit]}
+
+        mock_client.upload_object.side_effect = upload
+        mock_client.download_object.side_effect = download
+        mock_client.query_documents.side_effect = query
+        mock_client.create_document.return_value = {"id": "metadata_123"}
+
+        return service
+
+    def test_stream_backup_uploads_parts_and_manifest(self, mock_service, storage, tmp_path):
+        result = mock_service.stream_backup_collection("users", part_size=20000)
+
+        assert result["status"] == "success"
+        assert result["format"] == "ndjson"
+        assert result["document_count"] == 1200
+        assert len(result["parts"]) > 1
+        assert result["file_name"].endswith(".manifest.json")
+
+        # Every part and the manifest were uploaded; nothing is left locally
+        assert set(storage) == {f"backups/{p['file_name']}" for p in result["parts"]} | {result["object_path"]}
+        assert list(tmp_path.iterdir()) == []
+
+        manifest = json.loads(storage[result["object_path"]])
+        assert manifest["parts"] == result["parts"]
+
+        # Pages were fetched, not the whole collection at once
+        page_calls = [c for c in mock_service.client.query_documents.call_args_list
+                      if c.kwargs["collection"] == "users"]
+        assert len(page_calls) == 3
+
+        metadata = mock_service.client.create_document.call_args.kwargs["data"]
+        assert metadata["format"] == "ndjson"
+        assert metadata["parts"] == result["parts"]
+
+    def test_stream_backup_removes_uploaded_parts_on_failure(self, mock_service, storage):
+        mock_service.client.create_document.side_effect = ZeroDBError("metadata write failed")
+
+        with pytest.raises(BackupError):
+            mock_service.stream_backup_collection("users", part_size=20000)
+
+        deleted = {c.args[0] for c in mock_service.client.delete_object.call_args_list}
+        assert deleted == set(storage)
+
+    def test_restore_streamed_backup(self, mock_service):
+        backup = mock_service.stream_backup_collection("users", part_size=20000)
+        metadata = mock_service.client.create_document.call_args.kwargs["data"]
+        mock_service.client.get_document.return_value = metadata
+
+        result = mock_service.restore_collection("users", backup["backup_id"], validate_only=True)
+
+        assert result["status"] == "validated"
+        assert result["document_count"] == 1200
+
+    def test_restore_streamed_backup_writes_documents(self, mock_service, tmp_path):
+        backup = mock_service.stream_backup_collection("users", part_size=20000)
+        metadata = mock_service.client.create_document.call_args.kwargs["data"]
+        mock_service.client.get_document.return_value = metadata
+        mock_service.client.create_document.reset_mock()
+
+        result = mock_service.restore_collection("users", backup["backup_id"], batch_size=100)
+
+        assert result["status"] == "completed"
+        assert result["created"] == 1200
+        assert result["backup_type"] == "full"
+        assert mock_service.client.create_document.call_count == 1200
+        # Parts were deleted as they were read
+        assert not any(tmp_path.glob("*.ndjson.gz"))
+
+    def test_restore_rejects_corrupted_part(self, mock_service, storage):
+        backup = mock_service.stream_backup_collection("users", part_size=20000)
+        metadata = mock_service.client.create_document.call_args.kwargs["data"]
+        mock_service.client.get_document.return_value = metadata
+        first_part = f"backups/{backup['parts'][0]['file_name']}"
+        storage[first_part] = storage[first_part][:-8] + b"\x00" * 8
+
+        with pytest.raises(RestoreError, match="Checksum mismatch"):
+            mock_service.restore_collection("users", backup["backup_id"], validate_only=True)
+
+    def test_retention_deletes_every_part(self, mock_service):
+        old = (datetime.utcnow() - timedelta(days=400)).isoformat()
+        mock_service.client.query_documents.side_effect = None
+        mock_service.client.query_documents.return_value = {"documents": [{
+            "backup_id": "users_full_old",
+            "file_name": "users_full_old.manifest.json",
+            "completed_at": old,
+            "parts": [{"file_name": "users_full_old.part0001.ndjson.gz"},
+                      {"file_name": "users_full_old.part0002.ndjson.gz"}]
+        }]}
+
+        mock_service.apply_retention_policy("users")
+
+        deleted = [c.args[0] for c in mock_service.client.delete_object.call_args_list]
+        assert deleted == [
+            "backups/users_full_old.manifest.json",
+            "backups/users_full_old.part0001.ndjson.gz",
+            "backups/users_full_old.part0002.ndjson.gz",
+        ]
+
+    def test_backup_all_collections_in_parallel(self, mock_service):
+        mock_service.collections = ["users", "events", "profiles"]
+
+        result = mock_service.backup_all_collections(max_workers=3, compress_level=1)
+
+        assert result["format"] == "ndjson"
+        assert result["successful_collections"] == ["users", "events", "profiles"]
+        assert all(r["format"] == "ndjson" for r in result["results"])
@@ -0,0 +1,125 @@
+"""
+Unit Tests for the Streaming Backup Format
+
+Tests the NDJSON part writer and reader including:
+- Round trip of documents through compressed parts
+- Splitting into parts by uncompressed size
+- Per-part SHA-256 checksums matching the written files
+- Empty backups, aborted writes and argument validation
+"""
+
+import gzip
+import hashlib
+
+import pytest
+
+from backend.services.backup_stream import (
+    StreamingBackupWriter,
+    file_sha256,
+    iter_part_documents,
+    manifest_file_name,
+    read_manifest,
+    write_manifest,
+)
+
+
+def documents(count):
+    return [{"id": f"doc_{i}", "name": f"Document {i}", "tags": ["a", "b"]} for i in range(count)]
+
+
+class TestStreamingBackupWriter:
+    """Test writing NDJSON parts"""
+
+    def test_round_trip(self, tmp_path):
+        docs = documents(50)
+
+        with StreamingBackupWriter(tmp_path, "users_full_1") as writer:
+            writer.write_many(docs)
+
+        assert writer.document_count == 50
+        assert len(writer.parts) == 1
+        part = writer.parts[0]
+        assert part.file_name == "users_full_1.part0001.ndjson.gz"
+        assert list(iter_part_documents(part.path)) == docs
+
+    def test_parts_are_plain_gzip_ndjson(self, tmp_path):
+        with StreamingBackupWriter(tmp_path, "b") as writer:
+            writer.write({"id": "1", "created_at": object.__class__})  # Non-JSON values use str()
+
+        lines = gzip.open(writer.parts[0].path, "rt").read().splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith('{"id":"1"')
+
+    def test_splits_into_fixed_size_parts(self, tmp_path):
+        docs = documents(200)
+
+        with StreamingBackupWriter(tmp_path, "b", part_size=2000) as writer:
+            writer.write_many(docs)
+
+        assert len(writer.parts) > 1
+        assert all(part.uncompressed_size >= 2000 for part in writer.parts[:-1])
+        assert sum(part.document_count for part in writer.parts) == 200
+        restored = [doc for part in writer.parts for doc in iter_part_documents(part.path)]
+        assert restored == docs
+
+    def test_checksums_match_files(self, tmp_path):
+        with StreamingBackupWriter(tmp_path, "b", part_size=1500) as writer:
+            writer.write_many(documents(100))
+
+        for part in writer.parts:
+            assert part.sha256 == file_sha256(part.path)
+            assert part.sha256 == hashlib.sha256(part.path.read_bytes()).hexdigest()
+            assert part.size == part.path.stat().st_size
+
+    def test_on_part_called_as_parts_close(self, tmp_path):
+        closed = []
+
+        with StreamingBackupWriter(tmp_path, "b", part_size=1500, on_part=closed.append) as writer:
+            writer.write_many(documents(100))
+            parts_before_close = len(closed)
+
+        assert parts_before_close >= 1
+        assert closed == writer.parts
+
+    def test_empty_backup_has_one_empty_part(self, tmp_path):
+        with StreamingBackupWriter(tmp_path, "b") as writer:
+            pass
+
+        assert len(writer.parts) == 1
+        assert writer.parts[0].document_count == 0
+        assert list(iter_part_documents(writer.parts[0].path)) == []
+
+    def test_abort_removes_partial_part(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with StreamingBackupWriter(tmp_path, "b") as writer:
+                writer.write({"id": "1"})
+                raise RuntimeError("export failed")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_lower_level_trades_size_for_speed(self, tmp_path):
+        docs = documents(500)
+        sizes = {}
+        for level in (1, 9):
+            with StreamingBackupWriter(tmp_path, f"level{level}", compress_level=level) as writer:
+                writer.write_many(docs)
+            sizes[level] = writer.parts[0].size
+
+        assert sizes[9] <= sizes[1]
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            StreamingBackupWriter(tmp_path, "b", compress_level=10)
+        with pytest.raises(ValueError):
+            StreamingBackupWriter(tmp_path, "b", part_size=0)
+
+
+def test_manifest_round_trip(tmp_path):
+    path = tmp_path / manifest_file_name("users_full_1")
+    manifest = {"backup_id": "users_full_1", "parts": [{"file_name": "p1", "sha256": "abc"}]}
+
+    size = write_manifest(path, manifest)
+
+    assert path.name == "users_full_1.manifest.json"
+    assert size == path.stat().st_size
+    assert read_manifest(path) == manifest
@@ -9,11 +9,14 @@ import pytest
 import os
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
+import redis
 import requests
 
 from services.beehiiv_service import (
     BeeHiivService,
+    BeeHiivRateLimiter,
     BeeHiivRateLimitError,
+    BeeHiivThrottledError,
     BeeHiivAPIError
 )
 
@@ -635,3 +638,69 @@ def test_max_retries_constant(beehiiv_service):
 def test_backoff_factor_constant(beehiiv_service):
     """Test backoff factor constant"""
     assert beehiiv_service.BACKOFF_FACTOR == 2
+
+
+# ============================================================================
+# SHARED RATE LIMITER TESTS
+# ============================================================================
+
+def test_shared_limiter_throttles_requests():
+    """Test requests are held back when the shared bucket is empty"""
+    limiter = Mock()
+    limiter.try_acquire.return_value = 12.5
+    service = BeeHiivService(api_key="test", publication_id="pub_test", rate_limiter=limiter)
+
+    with pytest.raises(BeeHiivThrottledError) as exc_info:
+        service._check_rate_limit()
+
+    assert exc_info.value.retry_after == 12.5
+    assert service._request_timestamps == []
+
+
+def test_shared_limiter_falls_back_to_local_window():
+    """Test the per-process window is used when Redis is unavailable"""
+    limiter = Mock()
+    limiter.try_acquire.side_effect = redis.ConnectionError("down")
+    service = BeeHiivService(api_key="test", publication_id="pub_test", rate_limiter=limiter)
+
+    service._check_rate_limit()
+
+    assert len(service._request_timestamps) == 1
+
+
+def test_429_pauses_shared_limiter():
+    """Test a 429 response pauses every worker sharing the limiter"""
+    limiter = Mock()
+    limiter.try_acquire.return_value = 0.0
+    service = BeeHiivService(api_key="test", publication_id="pub_test", rate_limiter=limiter)
+
+    with patch.object(service.session, 'request') as mock_request:
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "30"}
+        mock_request.return_value = mock_response
+
+        with pytest.raises(BeeHiivRateLimitError) as exc_info:
+            service._make_request("GET", "/test")
+
+    assert not isinstance(exc_info.value, BeeHiivThrottledError)
+    limiter.penalize.assert_called_once_with(30)
+
+
+def test_limiter_penalty_escalates():
+    """Test repeated 429s double the shared pause"""
+    client = MagicMock()
+    client.pipeline.return_value.execute.return_value = [3, True]
+    limiter = BeeHiivRateLimiter(client)
+    limiter._pause = Mock(side_effect=lambda keys, args: str(args[1]))
+
+    paused_for = limiter.penalize(retry_after=10)
+
+    assert paused_for == pytest.approx(40, abs=1)
+
+
+def test_limiter_refill_rate_keeps_hour_within_quota():
+    """Test burst plus one hour of refill never exceeds the hourly quota"""
+    limiter = BeeHiivRateLimiter(MagicMock(), requests_per_hour=1000, burst=50)
+
+    assert limiter.capacity + limiter.rate * 3600 == pytest.approx(1000)
@@ -0,0 +1,215 @@
+"""
+Unit Tests for the BeeHiiv Sync Engine
+
+Tests diff-based list synchronization including:
+- Diffing desired list membership against the BeeHiiv snapshot
+- Snapshot caching, refresh by pagination and write-through of applied changes
+- Waiting out shared-budget throttling without failing changes
+- Giving up on changes BeeHiiv keeps rate limiting
+- Resuming an interrupted sync from the cached snapshot
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.beehiiv_service import (
+    BeeHiivAPIError,
+    BeeHiivRateLimitError,
+    BeeHiivThrottledError,
+)
+from backend.services.beehiiv_sync_engine import (
+    ACTION_SUBSCRIBE,
+    ACTION_UPDATE,
+    CHECKPOINT_KEY_PREFIX,
+    MAX_ATTEMPTS,
+    SNAPSHOT_KEY_PREFIX,
+    BeeHiivSyncEngine,
+    DesiredSubscriber,
+    diff,
+)
+
+MANAGED = {"members_only", "instructors"}
+SNAPSHOT_KEY = f"{SNAPSHOT_KEY_PREFIX}pub_test"
+
+
+@pytest.fixture
+def mock_beehiiv():
+    """Mock BeeHiivService"""
+    beehiiv = MagicMock()
+    beehiiv.publication_id = "pub_test"
+    beehiiv.add_subscriber.return_value = {"data": {"id": "sub_new"}}
+    beehiiv.update_subscriber.return_value = {"data": {}}
+    return beehiiv
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client holding a fresh cached snapshot and no checkpoint"""
+    client = MagicMock()
+    client.hget.return_value = str(time.time())
+    client.hgetall.side_effect = lambda key: {} if key.startswith(CHECKPOINT_KEY_PREFIX) else {
+        "kept@example.com": json.dumps({"id": "sub_1", "status": "active", "lists": ["members_only"]}),
+    }
+    return client
+
+
+@pytest.fixture
+def engine(mock_beehiiv, mock_redis):
+    """Sync engine with mocked dependencies"""
+    return BeeHiivSyncEngine(mock_beehiiv, redis_client=mock_redis, concurrency=2)
+
+
+class TestDiff:
+    """Test change planning"""
+
+    def test_only_real_changes_planned(self):
+        snapshot = {
+            "same@example.com": {"id": "s1", "status": "active", "lists": ["general", "members_only"]},
+            "upgrade@example.com": {"id": "s2", "status": "active", "lists": ["general", "members_only"]},
+        }
+        desired = {
+            "same@example.com": DesiredSubscriber(lists={"members_only"}),
+            "Upgrade@Example.com": DesiredSubscriber(lists={"members_only", "instructors"}),
+            "new@example.com": DesiredSubscriber(lists={"members_only"}, fields={"first_name": "Ann"}),
+        }
+
+        changes, unchanged = diff(desired, snapshot, MANAGED)
+
+        assert unchanged == 1
+        by_email = {change.email: change for change in changes}
+        assert by_email["upgrade@example.com"].action == ACTION_UPDATE
+        assert by_email["upgrade@example.com"].lists == ["general", "instructors", "members_only"]
+        assert by_email["upgrade@example.com"].subscription_id == "s2"
+        assert by_email["new@example.com"].action == ACTION_SUBSCRIBE
+        assert by_email["new@example.com"].fields == {"first_name": "Ann"}
+
+    def test_removal_keeps_unmanaged_lists(self):
+        snapshot = {"gone@example.com": {"id": "s1", "status": "active", "lists": ["general", "members_only"]}}
+
+        changes, _ = diff({"gone@example.com": DesiredSubscriber(lists=set())}, snapshot, MANAGED)
+
+        assert changes[0].lists == ["general"]
+
+    def test_absent_subscriber_with_no_lists_is_not_created(self):
+        changes, unchanged = diff({"gone@example.com": DesiredSubscriber(lists=set())}, {}, MANAGED)
+
+        assert changes == []
+        assert unchanged == 1
+
+    def test_unsubscribed_in_beehiiv_left_alone(self):
+        snapshot = {"optout@example.com": {"id": "s1", "status": "inactive", "lists": []}}
+
+        changes, _ = diff({"optout@example.com": DesiredSubscriber(lists={"members_only"})}, snapshot, MANAGED)
+
+        assert changes == []
+
+
+class TestSync:
+    """Test applying changes"""
+
+    @pytest.mark.asyncio
+    async def test_applies_changes_and_writes_through(self, engine, mock_beehiiv, mock_redis):
+        desired = {
+            "kept@example.com": DesiredSubscriber(lists={"members_only"}),
+            "new@example.com": DesiredSubscriber(lists={"members_only"}),
+        }
+
+        result = await engine.sync("members", desired, MANAGED)
+
+        assert result.unchanged == 1
+        assert [change.email for change in result.applied] == ["new@example.com"]
+        mock_beehiiv.list_subscribers.assert_not_called()  # Cached snapshot is fresh
+        mock_beehiiv.add_subscriber.assert_called_once_with(
+            email="new@example.com", metadata={"lists": ["members_only"]}, send_welcome_email=False
+        )
+
+        pipe = mock_redis.pipeline.return_value
+        key, email, value = pipe.hset.call_args_list[1].args
+        assert (key, email) == (SNAPSHOT_KEY, "new@example.com")
+        assert json.loads(value)["id"] == "sub_new"
+        pipe.hincrby.assert_called_with(f"{CHECKPOINT_KEY_PREFIX}members", "applied", 1)
+
+    @pytest.mark.asyncio
+    async def test_throttling_waits_without_failing(self, engine, mock_beehiiv):
+        mock_beehiiv.add_subscriber.side_effect = (
+            [BeeHiivThrottledError("budget spent", retry_after=0.001)] * (MAX_ATTEMPTS + 2)
+            + [{"data": {"id": "sub_new"}}]
+        )
+
+        result = await engine.sync("members", {"new@example.com": DesiredSubscriber(lists={"members_only"})}, MANAGED)
+
+        assert len(result.applied) == 1
+        assert result.failed == []
+
+    @pytest.mark.asyncio
+    async def test_repeated_429_fails_change(self, engine, mock_beehiiv):
+        mock_beehiiv.update_subscriber.side_effect = BeeHiivRateLimitError("429", retry_after=0.001)
+
+        result = await engine.sync("members", {"kept@example.com": DesiredSubscriber(lists=set())}, MANAGED)
+
+        assert mock_beehiiv.update_subscriber.call_count == MAX_ATTEMPTS
+        assert result.applied == []
+        assert result.failed[0][0].email == "kept@example.com"
+
+    @pytest.mark.asyncio
+    async def test_api_error_fails_change_once(self, engine, mock_beehiiv):
+        mock_beehiiv.add_subscriber.side_effect = BeeHiivAPIError("BeeHiiv API error: 400")
+
+        result = await engine.sync("members", {"new@example.com": DesiredSubscriber(lists={"members_only"})}, MANAGED)
+
+        assert mock_beehiiv.add_subscriber.call_count == 1
+        assert "400" in result.failed[0][1]
+
+    @pytest.mark.asyncio
+    async def test_interrupted_sync_resumes_from_cached_snapshot(self, engine, mock_beehiiv, mock_redis):
+        mock_redis.hget.return_value = str(time.time() - 7 * 86400)  # Stale
+        mock_redis.hgetall.side_effect = lambda key: (
+            {"run_id": "run-1", "status": "running", "started_at": "2024-01-01T00:00:00"}
+            if key.startswith(CHECKPOINT_KEY_PREFIX) else {}
+        )
+
+        result = await engine.sync("members", {}, MANAGED)
+
+        assert result.resumed is True
+        assert result.run_id == "run-1"
+        mock_beehiiv.list_subscribers.assert_not_called()
+
+
+class TestSnapshot:
+    """Test snapshot refresh"""
+
+    def test_refresh_pages_through_subscribers(self, engine, mock_beehiiv, mock_redis):
+        mock_beehiiv.list_subscribers.side_effect = [
+            {
+                "data": [{"id": "s1", "email": "A@example.com", "status": "active",
+                          "custom_fields": [{"name": "lists", "value": ["members_only"]}]}],
+                "pagination": {"has_more": True},
+            },
+            {
+                "data": [{"id": "s2", "email": "b@example.com", "status": "active",
+                          "custom_fields": {"lists": ["general"]}}],
+                "pagination": {"has_more": False},
+            },
+        ]
+
+        snapshot = engine.refresh_snapshot()
+
+        assert snapshot == {
+            "a@example.com": {"id": "s1", "status": "active", "lists": ["members_only"]},
+            "b@example.com": {"id": "s2", "status": "active", "lists": ["general"]},
+        }
+        assert mock_beehiiv.list_subscribers.call_count == 2
+        pipe = mock_redis.pipeline.return_value
+        staging_key = pipe.rename.call_args.args[0]
+        assert staging_key.startswith(SNAPSHOT_KEY)
+        assert pipe.rename.call_args.args[1] == SNAPSHOT_KEY
+
+    def test_stale_snapshot_refreshed(self, engine, mock_beehiiv, mock_redis):
+        mock_redis.hget.return_value = str(time.time() - 7 * 86400)
+        mock_beehiiv.list_subscribers.return_value = {"data": [], "pagination": {"has_more": False}}
+
+        assert engine.load_snapshot() == {}
+        mock_beehiiv.list_subscribers.assert_called_once()
@@ -0,0 +1,286 @@
+"""
+Unit Tests for Chat Fan-out Service
+
+Tests multi-node session chat delivery including:
+- Serialize-once broadcast to local connections and the session channel
+- Excluded senders and private recipients
+- Relay of frames published by other nodes (own echoes dropped)
+- Bounded per-connection queues with slow-consumer eviction
+- Channel subscription on first/last local connection
+- Presence entries of crashed nodes dropped once their heartbeat expires
+- Single-node degradation without Redis
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.services.chat_fanout_service import (
+    ChatFanoutService,
+    CHANNEL_PREFIX,
+    NODE_KEY_PREFIX,
+    NODE_TTL,
+    PRESENCE_KEY_PREFIX,
+    decode_envelope,
+    encode_envelope,
+    serialize_message,
+)
+
+
+class FakeWebSocket:
+    """WebSocket double recording sent frames"""
+
+    def __init__(self, delay: float = 0.0):
+        self.sent = []
+        self.delay = delay
+        self.close = AsyncMock()
+
+    async def send_text(self, frame):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(frame)
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock async Redis client with pub/sub"""
+    client = MagicMock()
+    client.publish = AsyncMock(return_value=1)
+    client.hset = AsyncMock()
+    client.hdel = AsyncMock()
+    client.hgetall = AsyncMock(return_value={})
+    client.mget = AsyncMock(return_value=[])
+    client.set = AsyncMock()
+    client.delete = AsyncMock()
+    client.expire = AsyncMock()
+    client.close = AsyncMock()
+
+    pubsub = MagicMock()
+    pubsub.subscribed = False
+    pubsub.subscribe = AsyncMock()
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.get_message = AsyncMock(return_value=None)
+    pubsub.close = AsyncMock()
+    client.pubsub.return_value = pubsub
+    return client
+
+
+@pytest.fixture
+async def service(mock_redis):
+    """ChatFanoutService with a mocked Redis client"""
+    svc = ChatFanoutService(client=mock_redis, queue_size=4, send_timeout=0.2)
+    yield svc
+    await svc.close()
+
+
+def user(user_id, name="User"):
+    return {"user_id": user_id, "user_name": name, "role": "member"}
+
+
+async def drain():
+    """Let writer tasks run"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestBroadcast:
+    """Test local delivery and publishing"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, service, mock_redis):
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for i, ws in enumerate(sockets):
+            await service.connect(ws, "s1", user(f"u{i}"))
+
+        with patch(
+            "backend.services.chat_fanout_service.serialize_message",
+            wraps=serialize_message
+        ) as serialize:
+            delivered = await service.broadcast("s1", {"type": "chat_message", "message": "hi"})
+            await drain()
+
+        assert delivered == 3
+        serialize.assert_called_once()
+        frame = serialize_message({"type": "chat_message", "message": "hi"})
+        assert all(ws.sent == [frame] for ws in sockets)
+
+        channel, envelope = mock_redis.publish.call_args.args
+        assert channel == CHANNEL_PREFIX + "s1"
+        assert decode_envelope(envelope) == (service.node_id, None, frame)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_respects_exclude(self, service):
+        sender, other = FakeWebSocket(), FakeWebSocket()
+        await service.connect(sender, "s1", user("u1"))
+        await service.connect(other, "s1", user("u2"))
+
+        await service.broadcast("s1", {"type": "user_joined"}, exclude={sender})
+        await drain()
+
+        assert sender.sent == []
+        assert len(other.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_private_targets_recipient(self, service, mock_redis):
+        alice, bob = FakeWebSocket(), FakeWebSocket()
+        await service.connect(alice, "s1", user("alice"))
+        await service.connect(bob, "s1", user("bob"))
+
+        await service.send_private("s1", "bob", {"type": "private_message"})
+        await drain()
+
+        assert alice.sent == []
+        assert len(bob.sent) == 1
+        _, envelope = mock_redis.publish.call_args.args
+        assert decode_envelope(envelope)[1] == "bob"
+
+
+class TestRemoteRelay:
+    """Test frames arriving from other nodes"""
+
+    @pytest.mark.asyncio
+    async def test_remote_frame_delivered_locally(self, service):
+        ws = FakeWebSocket()
+        await service.connect(ws, "s1", user("u1"))
+
+        service._handle_remote(CHANNEL_PREFIX + "s1", encode_envelope("other-node", None, '{"a":1}'))
+        await drain()
+
+        assert ws.sent == ['{"a":1}']
+
+    @pytest.mark.asyncio
+    async def test_own_echo_dropped(self, service):
+        ws = FakeWebSocket()
+        await service.connect(ws, "s1", user("u1"))
+
+        service._handle_remote(CHANNEL_PREFIX + "s1", encode_envelope(service.node_id, None, '{"a":1}'))
+        await drain()
+
+        assert ws.sent == []
+
+    @pytest.mark.asyncio
+    async def test_remote_private_frame_filtered_by_recipient(self, service):
+        alice, bob = FakeWebSocket(), FakeWebSocket()
+        await service.connect(alice, "s1", user("alice"))
+        await service.connect(bob, "s1", user("bob"))
+
+        service._handle_remote(CHANNEL_PREFIX + "s1", encode_envelope("other-node", "alice", "{}"))
+        await drain()
+
+        assert alice.sent == ["{}"]
+        assert bob.sent == []
+
+
+class TestSlowConsumers:
+    """Test bounded queues and eviction"""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_evicts_without_delaying_others(self, service):
+        slow, fast = FakeWebSocket(delay=10), FakeWebSocket()
+        await service.connect(slow, "s1", user("slow"))
+        await service.connect(fast, "s1", user("fast"))
+
+        for i in range(6):
+            await service.broadcast("s1", {"n": i})
+            await drain()
+        await asyncio.sleep(0.05)
+
+        assert len(fast.sent) == 6
+        assert slow not in service.sessions["s1"]
+        slow.close.assert_awaited_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_evicts(self, service):
+        slow = FakeWebSocket(delay=1)
+        await service.connect(slow, "s1", user("slow"))
+
+        await service.broadcast("s1", {"n": 1})
+        await asyncio.sleep(0.3)
+        await drain()
+
+        assert "s1" not in service.sessions
+        slow.close.assert_awaited_once_with(code=1013)
+
+
+class TestConnections:
+    """Test subscription and presence bookkeeping"""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_on_first_and_unsubscribes_on_last(self, service, mock_redis):
+        pubsub = mock_redis.pubsub.return_value
+        first, second = FakeWebSocket(), FakeWebSocket()
+
+        await service.connect(first, "s1", user("u1"))
+        await service.connect(second, "s1", user("u2"))
+        pubsub.subscribe.assert_awaited_once_with(CHANNEL_PREFIX + "s1")
+
+        await service.disconnect(first, "s1")
+        pubsub.unsubscribe.assert_not_awaited()
+        await service.disconnect(second, "s1")
+        pubsub.unsubscribe.assert_awaited_once_with(CHANNEL_PREFIX + "s1")
+
+        # Idempotent
+        assert await service.disconnect(second, "s1") is None
+
+    @pytest.mark.asyncio
+    async def test_presence_recorded_across_nodes(self, service, mock_redis):
+        connection = await service.connect(FakeWebSocket(), "s1", user("u1", "Ann"))
+
+        key, field, value = mock_redis.hset.call_args.args
+        assert key == PRESENCE_KEY_PREFIX + "s1"
+        assert field == connection.conn_id
+        assert json.loads(value)["user_name"] == "Ann"
+
+        assert json.loads(value)["node_id"] == service.node_id
+        mock_redis.set.assert_awaited_once_with(NODE_KEY_PREFIX + service.node_id, 1, ex=NODE_TTL)
+
+        remote = dict(user("u9", "Remote"), node_id="n2")
+        mock_redis.hgetall.return_value = {field: value, "c9": json.dumps(remote)}
+        mock_redis.mget.return_value = ["1"]
+        users = await service.get_active_users("s1")
+        assert users == [user("u1", "Ann"), user("u9", "Remote")]
+        mock_redis.hdel.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_presence_of_crashed_node_dropped(self, service, mock_redis):
+        crashed = dict(user("u9", "Gone"), node_id="n2")
+        live = dict(user("u1", "Ann"), node_id="n3")
+        mock_redis.hgetall.return_value = {"c1": json.dumps(live), "c9": json.dumps(crashed)}
+        mock_redis.mget.return_value = [None, "1"]
+
+        users = await service.get_active_users("s1")
+
+        assert users == [user("u1", "Ann")]
+        mock_redis.mget.assert_awaited_once_with([NODE_KEY_PREFIX + "n2", NODE_KEY_PREFIX + "n3"])
+        mock_redis.hdel.assert_awaited_once_with(PRESENCE_KEY_PREFIX + "s1", "c9")
+
+    @pytest.mark.asyncio
+    async def test_close_stops_heartbeat_and_clears_node_key(self, mock_redis):
+        service = ChatFanoutService(client=mock_redis)
+        await service.connect(FakeWebSocket(), "s1", user("u1"))
+        heartbeat = service._heartbeat
+
+        await service.close()
+
+        assert heartbeat.done()
+        mock_redis.delete.assert_awaited_once_with(NODE_KEY_PREFIX + service.node_id)
+
+    @pytest.mark.asyncio
+    async def test_single_node_without_redis(self):
+        service = ChatFanoutService(redis_url="redis://unreachable:6379")
+        with patch(
+            "backend.services.chat_fanout_service.aioredis.from_url",
+            side_effect=Exception("unavailable")
+        ):
+            ws = FakeWebSocket()
+            await service.connect(ws, "s1", user("u1", "Ann"))
+            await service.broadcast("s1", {"type": "chat_message"})
+            await drain()
+
+            assert len(ws.sent) == 1
+            assert await service.get_active_users("s1") == [
+                {"user_id": "u1", "user_name": "Ann", "role": "member"}
+            ]
+            await service.close()
@@ -0,0 +1,231 @@
+"""
+Unit Tests for Chat Write-Behind Service
+
+Tests batched persistence of session chat writes including:
+- Atomic buffering of messages (pending document, history, write stream)
+- Batch flush with acknowledgement of applied entries only
+- Idempotent redelivery of already persisted inserts
+- Reaction coalescing per message, one worker per message at a time
+- Per-session index of pending messages
+- Deferral of reactions/deletes until the message insert is applied
+- Reclaiming entries abandoned by crashed workers
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from backend.services.chat_write_behind_service import (
+    ChatWriteBehindService,
+    ChatWriteBehindError,
+    CONSUMER_GROUP,
+    HISTORY_KEY_PREFIX,
+    PENDING_MESSAGES_KEY,
+    PENDING_SESSION_KEY_PREFIX,
+    REACTION_LOCK_KEY_PREFIX,
+    STREAM_KEY,
+)
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client with stream support"""
+    client = MagicMock()
+    client.xautoclaim.return_value = ["0-0", [], []]
+    client.xreadgroup.return_value = []
+    client.hmget.return_value = []
+    client.hget.return_value = None
+    client.hexists.return_value = False
+    return client
+
+
+@pytest.fixture
+def mock_db():
+    """Mock ZeroDB client"""
+    return MagicMock()
+
+
+@pytest.fixture
+def service(mock_redis, mock_db):
+    """ChatWriteBehindService with mocked dependencies"""
+    return ChatWriteBehindService(redis_client=mock_redis, db_client=mock_db)
+
+
+def deliver(mock_redis, *entries):
+    mock_redis.xreadgroup.return_value = [[STREAM_KEY, list(entries)]]
+
+
+class TestAppend:
+    """Test request-path buffering"""
+
+    def test_append_message_is_atomic(self, service, mock_redis):
+        service.append_message({"id": "m1", "session_id": "s1", "message": "hi"})
+
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        pipe = mock_redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        assert pipe.hset.call_args.args[:2] == (PENDING_MESSAGES_KEY, "m1")
+        pipe.sadd.assert_called_once_with(PENDING_SESSION_KEY_PREFIX + "s1", "m1")
+        streams = [c.args[0] for c in pipe.xadd.call_args_list]
+        assert streams == [HISTORY_KEY_PREFIX + "s1", STREAM_KEY]
+        pipe.execute.assert_called_once()
+
+    def test_append_raises_when_redis_down(self, service, mock_redis):
+        mock_redis.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+
+        with pytest.raises(ChatWriteBehindError):
+            service.append_message({"id": "m1", "session_id": "s1"})
+
+
+class TestFlush:
+    """Test the batch flush worker"""
+
+    def test_flush_persists_messages_and_acks(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "message", "id": "m1"}), ("2-0", {"op": "message", "id": "m2"}))
+        mock_redis.hmget.return_value = [json.dumps({"id": "m1"}), json.dumps({"id": "m2"})]
+
+        assert service.flush("worker-1") == 2
+
+        inserted = sorted(c.args[1]["id"] for c in mock_db.insert_one.call_args_list)
+        assert inserted == ["m1", "m2"]
+        pipe = mock_redis.pipeline.return_value
+        stream, group, *acked = pipe.xack.call_args.args
+        assert (stream, group) == (STREAM_KEY, CONSUMER_GROUP)
+        assert sorted(acked) == ["1-0", "2-0"]
+        pipe.xdel.assert_called_once()
+
+    def test_persisted_message_leaves_session_index(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "message", "id": "m1"}))
+        mock_redis.hmget.return_value = [json.dumps({"id": "m1", "session_id": "s1"})]
+
+        assert service.flush("worker-1") == 1
+
+        pipe = mock_redis.pipeline.return_value
+        pipe.hdel.assert_called_once_with(PENDING_MESSAGES_KEY, "m1")
+        pipe.srem.assert_called_once_with(PENDING_SESSION_KEY_PREFIX + "s1", "m1")
+
+    def test_redelivered_message_not_inserted_twice(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "message", "id": "m1"}))
+        mock_redis.hmget.return_value = [None]  # Already persisted
+
+        assert service.flush("worker-1") == 1
+        mock_db.insert_one.assert_not_called()
+
+    def test_failed_insert_not_acked(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "message", "id": "m1"}))
+        mock_redis.hmget.return_value = [json.dumps({"id": "m1"})]
+        mock_db.insert_one.side_effect = Exception("ZeroDB unavailable")
+
+        assert service.flush("worker-1") == 0
+        mock_redis.pipeline.return_value.xack.assert_not_called()
+        mock_redis.hdel.assert_not_called()
+
+    def test_reactions_coalesced_per_message(self, service, mock_redis, mock_db):
+        deliver(
+            mock_redis,
+            ("1-0", {"op": "reaction", "id": "m1", "reaction": "👍"}),
+            ("2-0", {"op": "reaction", "id": "m1", "reaction": "👍"}),
+            ("3-0", {"op": "reaction", "id": "m1", "reaction": "🔥"}),
+        )
+        mock_db.find_by_id.return_value = {"id": "m1", "reactions": {"👍": 1}}
+
+        assert service.flush("worker-1") == 3
+
+        mock_db.find_by_id.assert_called_once()
+        mock_db.update_one.assert_called_once_with(
+            "session_chat_messages", "m1", {"reactions": {"👍": 3, "🔥": 1}}
+        )
+
+    def test_reactions_flushed_under_message_lock(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "reaction", "id": "m1", "reaction": "👍"}))
+        mock_db.find_by_id.return_value = {"id": "m1", "reactions": {}}
+
+        assert service.flush("worker-1") == 1
+
+        lock_key, token = mock_redis.set.call_args.args
+        assert lock_key == REACTION_LOCK_KEY_PREFIX + "m1"
+        assert mock_redis.set.call_args.kwargs["nx"] is True
+        release = mock_redis.register_script.return_value
+        release.assert_called_once_with(keys=[lock_key], args=[token])
+
+    def test_reactions_wait_for_concurrent_flush(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "reaction", "id": "m1", "reaction": "👍"}))
+        mock_redis.set.return_value = None  # Another worker holds the lock
+
+        assert service.flush("worker-1") == 0
+        mock_db.find_by_id.assert_not_called()
+        mock_db.update_one.assert_not_called()
+
+    def test_reaction_waits_for_pending_insert(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {"op": "reaction", "id": "m1", "reaction": "👍"}))
+        mock_redis.hexists.return_value = True  # Insert not applied yet
+
+        assert service.flush("worker-1") == 0
+        mock_db.update_one.assert_not_called()
+
+    def test_delete_applied_after_insert(self, service, mock_redis, mock_db):
+        deliver(mock_redis, ("1-0", {
+            "op": "delete", "id": "m1", "deleted_by": "u1", "deleted_at": "2025-01-01T00:00:00"
+        }))
+
+        assert service.flush("worker-1") == 1
+        update = mock_db.update_one.call_args.args[2]
+        assert update["is_deleted"] is True
+        assert update["deleted_by"] == "u1"
+
+    def test_abandoned_entries_reclaimed_first(self, service, mock_redis, mock_db):
+        mock_redis.xautoclaim.return_value = ["0-0", [("1-0", {"op": "message", "id": "m1"})], []]
+        mock_redis.hmget.return_value = [json.dumps({"id": "m1"})]
+
+        assert service.flush("worker-2") == 1
+        mock_redis.xreadgroup.assert_not_called()
+
+    def test_empty_flush(self, service, mock_redis, mock_db):
+        assert service.flush("worker-1", block_ms=10) == 0
+        mock_redis.xreadgroup.assert_called_once_with(
+            CONSUMER_GROUP, "worker-1", {STREAM_KEY: ">"}, count=200, block=10
+        )
+
+
+class TestReads:
+    """Test read-side overlays"""
+
+    def test_recent_messages_apply_reactions_and_deletions(self, service, mock_redis):
+        mock_redis.xrange.return_value = [
+            ("1-0", {"id": "m1", "data": json.dumps({"id": "m1", "reactions": {}})}),
+            ("2-0", {"id": "m2", "data": json.dumps({"id": "m2", "reactions": {}})}),
+        ]
+        mock_redis.pipeline.return_value.execute.return_value = [
+            [None, json.dumps({"deleted_by": "u1", "deleted_at": "x"})],
+            {"👏": "2"},
+            {},
+        ]
+
+        messages = service.get_recent_messages("s1")
+
+        assert messages[0]["reactions"] == {"👏": 2}
+        assert messages[1]["is_deleted"] is True
+
+    def test_pending_messages_read_from_session_index(self, service, mock_redis):
+        mock_redis.smembers.return_value = {"m1", "m2", "m3"}
+        mock_redis.hmget.return_value = [
+            json.dumps({"id": "m2", "timestamp": "2025-01-01T00:00:02"}),
+            None,  # Persisted since the index was read
+            json.dumps({"id": "m1", "timestamp": "2025-01-01T00:00:01"}),
+        ]
+        mock_redis.pipeline.return_value.execute.return_value = [[None, None], {}, {}]
+
+        messages = service.get_pending_messages("s1")
+
+        assert [msg["id"] for msg in messages] == ["m1", "m2"]
+        mock_redis.smembers.assert_called_once_with(PENDING_SESSION_KEY_PREFIX + "s1")
+        mock_redis.hvals.assert_not_called()
+
+    def test_reads_degrade_without_redis(self, service, mock_redis):
+        mock_redis.xrange.side_effect = redis.ConnectionError("down")
+        mock_redis.smembers.side_effect = redis.ConnectionError("down")
+
+        assert service.get_recent_messages("s1") == []
+        assert service.get_pending_messages("s1") == []
@@ -0,0 +1,218 @@
+"""
+Unit Tests for the Document Cache
+
+Tests cached ZeroDB document reads including:
+- Opt-in per collection, with per-collection TTLs
+- The request-scoped identity map
+- The shared Redis tier, and the in-process fallback when Redis fails
+- Invalidation on writes, including writes racing a read
+- ZeroDBClient reads and writes going through the cache
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+import requests
+
+from backend.services.document_cache import (
+    KEY_PREFIX,
+    TOMBSTONE,
+    DocumentCache,
+    document_cache_scope,
+)
+from backend.services.zerodb_service import ZeroDBClient
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis string commands the cache uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+
+def counting_fetcher(document):
+    fetches = []
+
+    def fetch():
+        fetches.append(True)
+        return dict(document)
+
+    return fetch, fetches
+
+
+@pytest.fixture
+def cache():
+    """In-process cache without Redis"""
+    return DocumentCache(ttls={"users": 60})
+
+
+class TestDocumentCache:
+    """Test reads, scopes and invalidation"""
+
+    def test_caches_enabled_collection(self, cache):
+        fetch, fetches = counting_fetcher({"id": "u1"})
+
+        first = cache.get_or_fetch("users", "u1", fetch)
+        second = cache.get_or_fetch("users", "u1", fetch)
+
+        assert first == second == {"id": "u1"}
+        assert first is not second  # Callers get their own copy outside a scope
+        assert len(fetches) == 1
+        assert cache.stats["hit"] == 1 and cache.stats["miss"] == 1
+
+    def test_other_collections_not_cached(self, cache):
+        fetch, fetches = counting_fetcher({"id": "p1"})
+
+        cache.get_or_fetch("payments", "p1", fetch)
+        cache.get_or_fetch("payments", "p1", fetch)
+
+        assert len(fetches) == 2
+
+    def test_errors_not_cached(self, cache):
+        fetch = MagicMock(side_effect=[LookupError("missing"), {"id": "u1"}])
+
+        with pytest.raises(LookupError):
+            cache.get_or_fetch("users", "u1", fetch)
+
+        assert cache.get_or_fetch("users", "u1", fetch) == {"id": "u1"}
+
+    def test_entry_expires_after_ttl(self, cache):
+        fetch, fetches = counting_fetcher({"id": "u1"})
+        cache.get_or_fetch("users", "u1", fetch)
+
+        with patch("backend.services.document_cache.time.monotonic", return_value=10 ** 9):
+            cache.get_or_fetch("users", "u1", fetch)
+
+        assert len(fetches) == 2
+
+    def test_scope_returns_same_object(self, cache):
+        fetch, fetches = counting_fetcher({"id": "u1"})
+
+        with document_cache_scope():
+            first = cache.get_or_fetch("users", "u1", fetch)
+            with document_cache_scope():
+                second = cache.get_or_fetch("users", "u1", fetch)
+
+        assert first is second
+        assert len(fetches) == 1
+        assert cache.stats["request_hit"] == 1
+
+    def test_invalidate_refetches(self, cache):
+        fetch = MagicMock(side_effect=[{"name": "old"}, {"name": "new"}])
+
+        with document_cache_scope():
+            cache.get_or_fetch("users", "u1", fetch)
+            cache.invalidate("users", "u1")
+
+            assert cache.get_or_fetch("users", "u1", fetch) == {"name": "new"}
+
+    def test_read_racing_a_write_not_cached(self, cache):
+        def fetch_then_written():
+            cache.invalidate("users", "u1")  # Written while the read was in flight
+            return {"name": "old"}
+
+        cache.get_or_fetch("users", "u1", fetch_then_written)
+        fetch, fetches = counting_fetcher({"name": "new"})
+
+        assert cache.get_or_fetch("users", "u1", fetch) == {"name": "new"}
+        assert len(fetches) == 1
+
+    def test_invalid_ttl(self):
+        with pytest.raises(ValueError):
+            DocumentCache(ttls={"users": 0})
+
+
+class TestSharedTier:
+    """Test the Redis tier"""
+
+    def test_reads_document_cached_by_another_worker(self):
+        client = FakeRedis()
+        DocumentCache(redis_client=client, ttls={"users": 60}).get_or_fetch("users", "u1", lambda: {"id": "u1"})
+        fetch, fetches = counting_fetcher({"id": "u1"})
+
+        document = DocumentCache(redis_client=client, ttls={"users": 60}).get_or_fetch("users", "u1", fetch)
+
+        assert document == {"id": "u1"}
+        assert fetches == []
+        assert client.ttls[KEY_PREFIX + "users:u1"] == 60
+
+    def test_invalidation_seen_by_every_worker(self):
+        client = FakeRedis()
+        client.values[KEY_PREFIX + "users:u1"] = json.dumps({"name": "old"})
+
+        DocumentCache(redis_client=client, ttls={"users": 60}).invalidate("users", "u1")
+        document = DocumentCache(redis_client=client, ttls={"users": 60}).get_or_fetch(
+            "users", "u1", lambda: {"name": "new"}
+        )
+
+        assert document == {"name": "new"}
+        assert client.values[KEY_PREFIX + "users:u1"] == TOMBSTONE
+
+    def test_redis_failure_falls_back_to_local(self):
+        client = MagicMock()
+        client.get.side_effect = redis.ConnectionError("down")
+        cache = DocumentCache(redis_client=client, ttls={"users": 60})
+        fetch, fetches = counting_fetcher({"id": "u1"})
+
+        cache.get_or_fetch("users", "u1", fetch)
+        cache.get_or_fetch("users", "u1", fetch)
+
+        assert len(fetches) == 1
+        assert client.get.call_count == 1  # Redis bypassed after the error
+
+
+class TestZeroDBClientCache:
+    """Test ZeroDBClient reads and writes through the cache"""
+
+    @pytest.fixture
+    def client(self, cache):
+        with patch.object(ZeroDBClient, "_authenticate"):
+            client = ZeroDBClient(
+                api_key="test_key",
+                base_url="https://api.test.com",
+                project_id="",
+                url_cache=MagicMock(),
+                document_cache=cache
+            )
+        # Legacy collection API: an empty project_id falls back to settings.ZERODB_PROJECT_ID
+        client.project_id = None
+        client.session = MagicMock()
+        client.session.get.return_value = MagicMock(status_code=200, json=lambda: {"id": "u1"})
+        client.session.put.return_value = MagicMock(status_code=200, json=lambda: {"id": "u1"})
+        client.session.delete.return_value = MagicMock(status_code=200, json=lambda: {"deleted": True})
+        return client
+
+    def test_get_document_cached(self, client):
+        assert client.get_document("users", "u1") == client.get_document("users", "u1")
+
+        assert client.session.get.call_count == 1
+
+    def test_update_invalidates(self, client):
+        client.get_document("users", "u1")
+        client.update_document("users", "u1", {"name": "new"}, merge=False)
+        client.get_document("users", "u1")
+
+        assert client.session.get.call_count == 2
+
+    def test_failed_delete_still_invalidates(self, client):
+        client.get_document("users", "u1")
+        client.session.delete.side_effect = requests.exceptions.Timeout("interrupted")
+
+        with pytest.raises(requests.exceptions.Timeout):
+            client.delete_document("users", "u1")
+        client.get_document("users", "u1")
+
+        assert client.session.get.call_count == 2
@@ -0,0 +1,263 @@
+"""
+Unit Tests for the Dunning Due Queue
+
+Tests the indexed dunning schedule including:
+- Popping only due reminders, oldest first, in batches
+- Leases handing out reminders of a crashed run again
+- Idempotency keys, retries and removal
+- The scheduler acting on the idempotency marker state
+- DunningService keeping the queue in step with dunning records
+- Reseeding the queue from ZeroDB
+
+Queue tests run against fakeredis[lua], so the pop script is exercised as
+Redis runs it.
+"""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from backend.scripts import dunning_scheduler
+from backend.services.dunning_due_queue import (
+    CLAIM_TTL,
+    DUE_KEY,
+    INFLIGHT_KEY,
+    LEASE_SECONDS,
+    SENDING,
+    SENT,
+    STAGE_KEY,
+    DunningDueQueue,
+    DunningDueQueueError,
+)
+from backend.services.dunning_service import DunningService, DunningStage
+
+
+@pytest.fixture
+def redis_client(lua_redis_client):
+    return lua_redis_client
+
+
+@pytest.fixture
+def queue(redis_client):
+    return DunningDueQueue(redis_client)
+
+
+def ago(days=0, hours=0):
+    return datetime.utcnow() - timedelta(days=days, hours=hours)
+
+
+class TestDunningDueQueue:
+    """Test the due queue"""
+
+    def test_pops_only_due_reminders_oldest_first(self, queue):
+        queue.schedule("late", "second_reminder", ago(days=2))
+        queue.schedule("later", "first_reminder", ago(hours=1))
+        queue.schedule("future", "first_reminder", ago(days=-1))
+
+        assert queue.pop_due(batch_size=10) == [("late", "second_reminder"), ("later", "first_reminder")]
+        assert queue.pop_due(batch_size=10) == []
+        assert queue.size() == 1
+
+    def test_batches(self, queue):
+        for i in range(5):
+            queue.schedule(f"record-{i}", "first_reminder", ago(hours=5 - i))
+
+        first = queue.pop_due(batch_size=2)
+        second = queue.pop_due(batch_size=2)
+
+        assert [record_id for record_id, _ in first + second] == ["record-0", "record-1", "record-2", "record-3"]
+
+    def test_rescheduling_replaces_entry(self, queue, redis_client):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.schedule("record-1", "second_reminder", ago(days=-4))
+
+        assert queue.pop_due(batch_size=10) == []
+        assert redis_client.hget(STAGE_KEY, "record-1") == "second_reminder"
+
+    def test_lapsed_lease_hands_reminder_out_again(self, queue):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.pop_due(batch_size=10)
+
+        assert queue.pop_due(batch_size=10) == []
+        assert queue.pop_due(batch_size=10, now=time.time() + queue.lease_seconds + 1) == [
+            ("record-1", "first_reminder")
+        ]
+
+    def test_completed_reminder_not_handed_out_again(self, queue, redis_client):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.pop_due(batch_size=10)
+
+        assert queue.claim("record-1", "first_reminder") is None
+        queue.complete("record-1", "first_reminder")
+
+        assert redis_client.zcard(INFLIGHT_KEY) == 0
+        assert queue.claim("record-1", "first_reminder") == SENT
+        assert queue.pop_due(batch_size=10, now=time.time() + queue.lease_seconds + 1) == []
+
+    def test_retry_requeues_and_releases_claim(self, queue, redis_client):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.pop_due(batch_size=10)
+        queue.claim("record-1", "first_reminder")
+
+        queue.retry("record-1", "first_reminder", delay=60)
+
+        assert redis_client.zcard(INFLIGHT_KEY) == 0
+        assert queue.pop_due(batch_size=10) == []
+        assert queue.pop_due(batch_size=10, now=time.time() + 61) == [("record-1", "first_reminder")]
+        assert queue.claim("record-1", "first_reminder") is None
+
+    def test_claim_reports_sender_in_progress(self, queue):
+        assert queue.claim("record-1", "first_reminder") is None
+        assert queue.claim("record-1", "first_reminder") == SENDING
+
+    def test_retry_can_keep_another_senders_claim(self, queue):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.pop_due(batch_size=10)
+        queue.claim("record-1", "first_reminder")
+
+        queue.retry("record-1", "first_reminder", delay=60, keep_claim=True)
+
+        assert queue.claim("record-1", "first_reminder") == SENDING
+
+    def test_claim_lapses_before_lease(self):
+        # A reminder handed out again after a crash must be claimable
+        assert CLAIM_TTL < LEASE_SECONDS
+
+    def test_retry_keeps_newer_schedule(self, queue, redis_client):
+        queue.schedule("record-1", "first_reminder", ago(hours=1))
+        queue.pop_due(batch_size=10)
+        queue.schedule("record-1", "second_reminder", ago(days=-4))
+
+        queue.retry("record-1", "first_reminder", delay=60)
+
+        assert redis_client.hget(STAGE_KEY, "record-1") == "second_reminder"
+        assert redis_client.zscore(DUE_KEY, "record-1") > time.time() + 3 * 86400
+
+    def test_redis_unavailable(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        queue = DunningDueQueue(client)
+
+        with pytest.raises(DunningDueQueueError):
+            queue.pop_due(batch_size=10)
+        with pytest.raises(DunningDueQueueError):
+            queue.schedule("record-1", "first_reminder", ago())
+
+
+class TestDunningServiceScheduling:
+    """Test DunningService keeping the due queue in step"""
+
+    @pytest.fixture
+    def service(self):
+        db = MagicMock()
+        db.create.return_value = {"id": "record-1"}
+        return DunningService(zerodb_client=db, email_service=MagicMock(), due_queue=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_new_record_scheduled_for_first_reminder(self, service):
+        await service._create_dunning_record(
+            subscription_id="sub-1",
+            user_id="user-1",
+            stage=DunningStage.PAYMENT_FAILED,
+            amount_due=29.0,
+            currency="USD",
+            stripe_invoice_id="in_1"
+        )
+
+        record_id, stage, due_at = service.due_queue.schedule.call_args.args
+        assert (record_id, stage) == ("record-1", DunningStage.FIRST_REMINDER.value)
+        assert timedelta(days=2, hours=23) < due_at - datetime.utcnow() <= timedelta(days=3)
+        assert service.db.create.call_args.kwargs["data"]["next_reminder_date"] == due_at.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_stage_change_reschedules_from_creation_date(self, service):
+        created_at = ago(days=3).isoformat()
+
+        await service._update_dunning_record("record-1", DunningStage.FIRST_REMINDER, base_date=created_at)
+
+        service.due_queue.schedule.assert_called_once_with(
+            "record-1",
+            DunningStage.SECOND_REMINDER.value,
+            datetime.fromisoformat(created_at) + timedelta(days=7)
+        )
+
+    @pytest.mark.asyncio
+    async def test_canceled_record_leaves_queue(self, service):
+        await service._update_dunning_record("record-1", DunningStage.CANCELED, base_date=ago(days=14).isoformat())
+
+        service.due_queue.remove.assert_called_once_with("record-1")
+        assert service.db.update.call_args.kwargs["data"]["next_reminder_date"] is None
+
+    @pytest.mark.asyncio
+    async def test_queue_failure_does_not_fail_dunning(self, service):
+        service.due_queue.schedule.side_effect = DunningDueQueueError("down")
+
+        await service._update_dunning_record("record-1", DunningStage.FIRST_REMINDER, base_date=ago().isoformat())
+
+        service.db.update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reseed_keeps_existing_entries(self, service):
+        due_at = ago(days=1)
+        service.db.query.return_value = [
+            {"id": "record-1", "current_stage": "first_reminder", "next_reminder_date": due_at.isoformat()},
+            {"id": "record-2", "current_stage": "payment_failed", "created_at": ago(days=1).isoformat()},
+        ]
+
+        assert await service.reseed_due_queue(page_size=10) == 2
+
+        first, second = service.due_queue.schedule.call_args_list
+        assert first.args == ("record-1", "second_reminder", due_at)
+        assert first.kwargs == {"replace": False}
+        assert second.args[1] == "first_reminder"
+        stages = service.db.query.call_args.kwargs["query"]["current_stage"]["$in"]
+        assert "canceled" not in stages
+
+
+class TestSchedulerClaims:
+    """Test the scheduler acting on the claim state of a popped reminder"""
+
+    @pytest.fixture
+    def due_queue(self):
+        due_queue = MagicMock()
+        with patch.object(dunning_scheduler, "due_queue", due_queue):
+            yield due_queue
+
+    @pytest.fixture
+    def send(self):
+        with patch.object(dunning_scheduler, "process_dunning_reminder") as send:
+            yield send
+
+    def test_claimed_reminder_sent_and_completed(self, due_queue, send):
+        due_queue.claim.return_value = None
+
+        async def sent(**kwargs):
+            return {"success": True}
+        send.side_effect = sent
+
+        assert dunning_scheduler.process_due_reminder("record-1", "first_reminder") == "succeeded"
+        due_queue.complete.assert_called_once_with("record-1", "first_reminder")
+
+    def test_sent_reminder_released(self, due_queue, send):
+        due_queue.claim.return_value = SENT
+
+        assert dunning_scheduler.process_due_reminder("record-1", "first_reminder") == "skipped"
+
+        due_queue.release.assert_called_once_with("record-1")
+        due_queue.retry.assert_not_called()
+        send.assert_not_called()
+
+    def test_reminder_being_sent_checked_again_later(self, due_queue, send):
+        due_queue.claim.return_value = SENDING
+
+        assert dunning_scheduler.process_due_reminder("record-1", "first_reminder") == "skipped"
+
+        due_queue.retry.assert_called_once_with(
+            "record-1", "first_reminder", delay=CLAIM_TTL, keep_claim=True
+        )
+        due_queue.release.assert_not_called()
+        send.assert_not_called()
@@ -0,0 +1,218 @@
+"""
+Unit Tests for Email Queue Service
+
+Tests the outbound email queue including:
+- Pipelined enqueueing with per-message status and batch counters
+- Delivery through one Postmark batch request per stream read
+- Per-message results: sent, retried with backoff, permanently failed
+- Whole-batch request failures scheduled for retry
+- Redelivered messages already sent are not resent
+- Batch status lookups
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from backend.services.email_queue_service import (
+    EmailQueueService,
+    EmailQueueError,
+    BATCH_KEY_PREFIX,
+    CONSUMER_GROUP,
+    MAX_ATTEMPTS,
+    MESSAGE_KEY_PREFIX,
+    RETRY_KEY,
+    STATUS_FAILED,
+    STATUS_RETRYING,
+    STATUS_SENT,
+    STREAM_KEY,
+)
+from backend.services.email_service import EmailSendError
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client with stream support"""
+    client = MagicMock()
+    client.xautoclaim.return_value = ["0-0", [], []]
+    client.xreadgroup.return_value = []
+    return client
+
+
+@pytest.fixture
+def mock_email():
+    """Mock non-queued EmailService"""
+    return MagicMock()
+
+
+@pytest.fixture
+def service(mock_redis, mock_email):
+    """EmailQueueService with mocked dependencies"""
+    return EmailQueueService(redis_client=mock_redis, email_service=mock_email)
+
+
+def record(attempts=0, status="queued"):
+    return {
+        "payload": json.dumps({"To": "user@example.com"}),
+        "status": status,
+        "attempts": str(attempts),
+        "batch_id": "b1",
+    }
+
+
+def deliver(mock_redis, records):
+    """Make the stream return one entry per record and HGETALL return the records"""
+    entries = [(f"{i}-0", {"id": f"m{i}"}) for i in range(len(records))]
+    mock_redis.xreadgroup.return_value = [[STREAM_KEY, entries]]
+    mock_redis.pipeline.return_value.execute.return_value = records
+
+
+def hset_mappings(mock_redis):
+    pipe = mock_redis.pipeline.return_value
+    return {c.args[0]: c.kwargs["mapping"] for c in pipe.hset.call_args_list}
+
+
+class TestEnqueue:
+    """Test producers"""
+
+    def test_enqueue_many_pipelines_messages(self, service, mock_redis):
+        batch_id, message_ids = service.enqueue_many([{"To": "a@x.com"}, {"To": "b@x.com"}])
+
+        assert len(message_ids) == 2
+        pipe = mock_redis.pipeline.return_value
+        # Batch counters, then one pipeline for the messages
+        assert mock_redis.pipeline.call_count == 2
+        assert pipe.xadd.call_count == 2
+        assert all(c.args[0] == STREAM_KEY for c in pipe.xadd.call_args_list)
+        pipe.hincrby.assert_any_call(f"{BATCH_KEY_PREFIX}{batch_id}", "total", 2)
+
+        mapping = hset_mappings(mock_redis)[f"{MESSAGE_KEY_PREFIX}{message_ids[0]}"]
+        assert json.loads(mapping["payload"]) == {"To": "a@x.com"}
+        assert mapping["batch_id"] == batch_id
+
+    def test_enqueue_many_chunks_by_batch_limit(self, service, mock_redis):
+        service.enqueue_many([{"To": "a@x.com"}] * 1200)
+
+        # Batch counters plus three chunks of at most 500 messages
+        assert mock_redis.pipeline.call_count == 4
+
+    def test_enqueue_raises_when_redis_down(self, service, mock_redis):
+        mock_redis.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+
+        with pytest.raises(EmailQueueError):
+            service.enqueue({"To": "a@x.com"})
+
+
+class TestProcessBatch:
+    """Test the delivery worker"""
+
+    def test_delivers_batch_and_acks(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record(), record()])
+        mock_email.send_batch.return_value = [
+            {"ErrorCode": 0, "MessageID": "pm-1"},
+            {"ErrorCode": 0, "MessageID": "pm-2"},
+        ]
+
+        assert service.process_batch("worker-1") == 2
+
+        mock_email.send_batch.assert_called_once_with([{"To": "user@example.com"}] * 2)
+        assert hset_mappings(mock_redis)[f"{MESSAGE_KEY_PREFIX}m0"]["status"] == STATUS_SENT
+        pipe = mock_redis.pipeline.return_value
+        stream, group, *acked = pipe.xack.call_args.args
+        assert (stream, group) == (STREAM_KEY, CONSUMER_GROUP)
+        assert acked == ["0-0", "1-0"]
+
+    def test_transient_error_scheduled_for_retry(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record()])
+        mock_email.send_batch.return_value = [{"ErrorCode": 429, "Message": "Rate limited"}]
+
+        assert service.process_batch("worker-1") == 0
+
+        assert hset_mappings(mock_redis)[f"{MESSAGE_KEY_PREFIX}m0"]["status"] == STATUS_RETRYING
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.zadd.call_args.args[0] == RETRY_KEY
+        pipe.xack.assert_called_once()
+
+    def test_missing_results_scheduled_for_retry(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record(), record()])
+        mock_email.send_batch.return_value = [{"ErrorCode": 0, "MessageID": "pm-1"}]
+
+        assert service.process_batch("worker-1") == 1
+
+        mappings = hset_mappings(mock_redis)
+        assert mappings[f"{MESSAGE_KEY_PREFIX}m0"]["status"] == STATUS_SENT
+        assert mappings[f"{MESSAGE_KEY_PREFIX}m1"]["status"] == STATUS_RETRYING
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.zadd.call_args.args[0] == RETRY_KEY
+
+    def test_permanent_error_fails_immediately(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record()])
+        mock_email.send_batch.return_value = [{"ErrorCode": 406, "Message": "Inactive recipient"}]
+
+        service.process_batch("worker-1")
+
+        assert hset_mappings(mock_redis)[f"{MESSAGE_KEY_PREFIX}m0"]["status"] == STATUS_FAILED
+        pipe = mock_redis.pipeline.return_value
+        pipe.zadd.assert_not_called()
+        pipe.hincrby.assert_any_call(f"{BATCH_KEY_PREFIX}b1", "failed", 1)
+
+    def test_gives_up_after_max_attempts(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record(attempts=MAX_ATTEMPTS - 1)])
+        mock_email.send_batch.side_effect = EmailSendError("Postmark unavailable")
+
+        service.process_batch("worker-1")
+
+        mapping = hset_mappings(mock_redis)[f"{MESSAGE_KEY_PREFIX}m0"]
+        assert mapping["status"] == STATUS_FAILED
+        assert "Postmark unavailable" in mapping["error"]
+
+    def test_already_sent_message_not_resent(self, service, mock_redis, mock_email):
+        deliver(mock_redis, [record(status=STATUS_SENT), {}])
+
+        assert service.process_batch("worker-1") == 0
+
+        mock_email.send_batch.assert_not_called()
+        mock_redis.pipeline.return_value.xack.assert_called_once()
+
+    def test_abandoned_entries_reclaimed_first(self, service, mock_redis, mock_email):
+        mock_redis.xautoclaim.return_value = ["0-0", [("1-0", {"id": "m1"})], []]
+        mock_redis.pipeline.return_value.execute.return_value = [record()]
+        mock_email.send_batch.return_value = [{"ErrorCode": 0, "MessageID": "pm-1"}]
+
+        assert service.process_batch("worker-2") == 1
+        mock_redis.xreadgroup.assert_not_called()
+
+    def test_empty_read(self, service, mock_redis, mock_email):
+        assert service.process_batch("worker-1", block_ms=10) == 0
+        mock_redis.xreadgroup.assert_called_once_with(
+            CONSUMER_GROUP, "worker-1", {STREAM_KEY: ">"}, count=500, block=10
+        )
+        mock_email.send_batch.assert_not_called()
+
+
+class TestStatus:
+    """Test status lookups"""
+
+    def test_batch_status(self, service, mock_redis):
+        mock_redis.hgetall.return_value = {"total": "3", "queued": "1", "sent": "2", "created_at": "x"}
+
+        status = service.get_batch_status("b1")
+
+        assert status == {
+            "batch_id": "b1", "total": 3, "queued": 1, "sent": 2, "failed": 0, "created_at": "x"
+        }
+
+    def test_message_status_hides_payload(self, service, mock_redis):
+        mock_redis.hgetall.return_value = record(attempts=2, status=STATUS_RETRYING)
+
+        status = service.get_status("m1")
+
+        assert status["attempts"] == 2
+        assert "payload" not in status
+
+    def test_unknown_batch(self, service, mock_redis):
+        mock_redis.hgetall.return_value = {}
+
+        assert service.get_batch_status("missing") is None
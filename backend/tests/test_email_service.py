@@ -8,6 +8,7 @@ verification emails, welcome emails, and error handling.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
+from datetime import datetime
 
 from backend.services.email_service import (
     EmailService,
@@ -32,8 +33,8 @@ def email_service():
 
 @pytest.fixture
 def mock_requests_post():
-    """Mock requests.post for email API calls"""
-    with patch('backend.services.email_service.requests.post') as mock:
+    """Mock pooled session POSTs for email API calls"""
+    with patch('backend.services.email_service.requests.Session.post') as mock:
         yield mock
 
 
@@ -316,6 +317,89 @@ class TestPasswordResetEmail:
         assert "reset-password?token=unique-reset-token" in payload["HtmlBody"]
 
 
+# ============================================================================
+# APPLICATION AND PAYMENT EMAIL TESTS
+# ============================================================================
+
+class TestApplicationEmails:
+    """Test application decision emails rendered from templates"""
+
+    @pytest.fixture
+    def ok_response(self, mock_requests_post):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"MessageID": "test-id"}
+        mock_requests_post.return_value = mock_response
+        return mock_requests_post
+
+    def test_rejection_email_escapes_reason(self, email_service, ok_response):
+        """Test rejection reason is included and HTML-escaped"""
+        email_service.send_application_rejection_email(
+            email="user@example.com",
+            user_name="Jane Doe",
+            rejection_reason="Missing <b>references</b>",
+            reapplication_date=datetime(2026, 11, 1)
+        )
+
+        payload = ok_response.call_args.kwargs["json"]
+        assert payload["Subject"] == "WWMAA Membership Application Decision"
+        assert payload["Tag"] == "application-rejection"
+        assert "Missing &lt;b&gt;references&lt;/b&gt;" in payload["HtmlBody"]
+        assert "starting on <strong>November 01, 2026</strong>" in payload["HtmlBody"]
+        assert "Recommendations for Future Applications" not in payload["HtmlBody"]
+        assert "Missing <b>references</b>" in payload["TextBody"]
+
+    @pytest.mark.parametrize("allow_reapplication,expected", [
+        (True, "You are welcome to reapply for membership at any time."),
+        (False, "Unfortunately, you are not eligible to reapply for membership at this time.")
+    ])
+    def test_rejection_email_reapplication_text(
+        self,
+        email_service,
+        ok_response,
+        allow_reapplication,
+        expected
+    ):
+        """Test the reapplication paragraph matches the decision"""
+        email_service.send_application_rejection_email(
+            email="user@example.com",
+            user_name="Jane Doe",
+            allow_reapplication=allow_reapplication
+        )
+
+        payload = ok_response.call_args.kwargs["json"]
+        assert expected in payload["TextBody"]
+        assert "Reason for Decision" not in payload["TextBody"]
+
+    def test_payment_failed_email_formats_amount(self, email_service, ok_response):
+        """Test payment failed email shows the amount and billing link"""
+        email_service.send_payment_failed_email(
+            email="user@example.com",
+            user_name="Jane Doe",
+            amount=49.5,
+            currency="GBP"
+        )
+
+        payload = ok_response.call_args.kwargs["json"]
+        assert payload["Tag"] == "payment-failed"
+        assert "£49.50 GBP" in payload["HtmlBody"]
+        assert "/dashboard/billing" in payload["TextBody"]
+
+    def test_recording_ready_email_optional_parts(self, email_service, ok_response):
+        """Test recording email omits the duration and link when not given"""
+        email_service.send_recording_ready_email_participant(
+            email="user@example.com",
+            participant_name="Jane Doe",
+            session_title="Kata Basics",
+            session_date="2026-01-15"
+        )
+
+        payload = ok_response.call_args.kwargs["json"]
+        assert payload["Subject"] == "Session Recording Available: Kata Basics"
+        assert "minutes" not in payload["TextBody"]
+        assert "Watch Recording" not in payload["HtmlBody"]
+
+
 # ============================================================================
 # SINGLETON TESTS
 # ============================================================================
@@ -401,3 +485,82 @@ class TestEmailServiceErrorHandling:
                 token="test-token",
                 user_name="Test User"
             )
+
+
+# ============================================================================
+# BATCH AND QUEUED SENDING TESTS
+# ============================================================================
+
+class TestBatchSending:
+    """Test Postmark batch sending and queued mode"""
+
+    def test_send_batch_posts_to_batch_endpoint(self, email_service, mock_requests_post):
+        """Test send_batch sends all messages in one request"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {"ErrorCode": 0, "MessageID": "m1"},
+            {"ErrorCode": 406, "Message": "Inactive recipient"},
+        ]
+        mock_requests_post.return_value = mock_response
+        messages = [
+            email_service.build_message("a@example.com", "Hi", "<p>Hi</p>"),
+            email_service.build_message("b@example.com", "Hi", "<p>Hi</p>"),
+        ]
+
+        results = email_service.send_batch(messages)
+
+        assert [r["ErrorCode"] for r in results] == [0, 406]
+        mock_requests_post.assert_called_once()
+        assert mock_requests_post.call_args.args[0] == "https://api.postmarkapp.com/email/batch"
+        assert mock_requests_post.call_args.kwargs["json"] == messages
+
+    def test_send_batch_rejects_oversized_batch(self, email_service, mock_requests_post):
+        """Test send_batch enforces the Postmark batch limit"""
+        with pytest.raises(ValueError):
+            email_service.send_batch([{}] * 501)
+
+        mock_requests_post.assert_not_called()
+
+    def test_send_batch_request_error(self, email_service, mock_requests_post):
+        """Test send_batch raises EmailSendError when the request fails"""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.text = "Too many requests"
+        mock_response.json.return_value = {"Message": "Rate limited"}
+        mock_requests_post.return_value = mock_response
+
+        with pytest.raises(EmailSendError, match="Rate limited"):
+            email_service.send_batch([email_service.build_message("a@example.com", "Hi", "<p>Hi</p>")])
+
+    def test_queued_service_enqueues_instead_of_sending(self, mock_requests_post):
+        """Test a queued service hands messages to the email queue"""
+        service = EmailService(api_key="test-key", from_email="test@wwmaa.com", queued=True)
+
+        with patch('backend.services.email_queue_service.get_email_queue_service') as mock_queue:
+            mock_queue.return_value.enqueue.return_value = "queue-1"
+            result = service.send_verification_email(
+                email="user@example.com",
+                token="test-token",
+                user_name="Test User"
+            )
+
+        assert result == {"QueueID": "queue-1"}
+        payload = mock_queue.return_value.enqueue.call_args.args[0]
+        assert payload["To"] == "user@example.com"
+        mock_requests_post.assert_not_called()
+
+    @patch('backend.services.email_service.settings')
+    def test_get_email_service_queued_instance(self, mock_settings):
+        """Test get_email_service(queued=True) returns a separate queued singleton"""
+        mock_settings.POSTMARK_API_KEY = "test-key"
+        mock_settings.FROM_EMAIL = "test@test.com"
+
+        import backend.services.email_service as email_module
+        email_module._queued_email_service_instance = None
+
+        queued = get_email_service(queued=True)
+
+        assert queued.queued is True
+        assert get_email_service(queued=True) is queued
+        assert get_email_service() is not queued
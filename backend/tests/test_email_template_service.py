@@ -0,0 +1,137 @@
+"""
+Unit Tests for Email Template Service
+
+Tests precompiled email template rendering including:
+- Variable escaping, raw HTML, dotted names and sections
+- Layout inheritance and partials
+- Plain-text bodies generated from the HTML source
+- Binding shared values once for bulk sends
+- Loading the repository's template directories
+"""
+
+import pytest
+
+from backend.services.email_template_service import (
+    EmailTemplateService,
+    EmailTemplateError,
+    html_to_text,
+)
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """Build a service over templates written to a temporary directory"""
+    def make(**templates):
+        for name, source in templates.items():
+            path = tmp_path / f"{name}.html"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+        return EmailTemplateService(template_dirs=[tmp_path])
+    return make
+
+
+class TestRendering:
+    """Test Mustache rendering"""
+
+    def test_variables_are_escaped_and_raw_is_not(self, make_service):
+        service = make_service(t="<p>{{name}}</p>{{{body}}}")
+
+        rendered = service.render("t", {"name": "<Ann & Bo>", "body": "<b>hi</b>"})
+
+        assert rendered.html == "<p>&lt;Ann &amp; Bo&gt;</p><b>hi</b>"
+
+    def test_sections(self, make_service):
+        service = make_service(t=(
+            "{{#items}}<li>{{name}}</li>{{/items}}"
+            "{{#user}}{{user.name}}{{/user}}"
+            "{{^missing}}none{{/missing}}"
+        ))
+
+        rendered = service.render("t", {"items": [{"name": "a"}, {"name": "b"}], "user": {"name": "c"}})
+
+        assert rendered.html == "<li>a</li><li>b</li>cnone"
+
+    def test_standalone_section_lines_removed(self, make_service):
+        service = make_service(t="<ul>\n  {{#show}}\n  <li>x</li>\n  {{/show}}\n</ul>")
+
+        assert service.render("t", {"show": False}).html == "<ul>\n</ul>"
+
+    def test_layout_inheritance_and_partials(self, make_service):
+        service = make_service(**{
+            "layouts/base": "<h1>{{$title}}Default{{/title}}</h1>{{$body}}{{/body}}{{> partials/footer}}",
+            "partials/footer": "<p>Footer</p>",
+            "page": "{{<layouts/base}}{{$body}}<p>Hi {{name}}</p>{{/body}}{{/layouts/base}}",
+        })
+
+        assert service.render("page", {"name": "Ann"}).html == "<h1>Default</h1><p>Hi Ann</p><p>Footer</p>"
+
+    def test_missing_template(self, make_service):
+        service = make_service(t="x")
+
+        with pytest.raises(EmailTemplateError):
+            service.render("nope")
+
+    def test_unclosed_section_rejected_at_load(self, make_service):
+        with pytest.raises(EmailTemplateError, match="Unclosed section"):
+            make_service(t="{{#a}}x")
+
+
+class TestTextBodies:
+    """Test plain-text generation from the HTML source"""
+
+    def test_text_body_from_same_source(self, make_service):
+        service = make_service(t=(
+            "<html><head><style>p {}</style></head><body>"
+            "<h2>Hello, {{name}}</h2><p>Visit <a href=\"{{url}}\">the site</a></p>"
+            "<ul><li>One</li><li>Two</li></ul>{{{body}}}</body></html>"
+        ))
+
+        rendered = service.render("t", {"name": "A & B", "url": "https://x.test/?a=1&b=2", "body": "<p>Raw <b>html</b></p>"})
+
+        assert rendered.text == (
+            "Hello, A & B\n\nVisit the site (https://x.test/?a=1&b=2)\n\n- One\n- Two\n\nRaw html"
+        )
+
+    def test_html_to_text_skips_duplicate_link_targets(self):
+        assert html_to_text('<p><a href="mailto:a@x.test">a@x.test</a></p>') == "a@x.test"
+
+
+class TestBind:
+    """Test pre-rendering of shared values"""
+
+    def test_bind_leaves_only_recipient_holes(self, make_service):
+        service = make_service(t="<h1>{{title}}</h1>{{#show}}<p>{{{message}}}</p>{{/show}}<p>Hi {{name}}</p>")
+        template = service.get("t")
+
+        bound = template.bind({"title": "News", "show": True, "message": "<b>x</b>"})
+
+        assert sum(1 for node in bound._html_nodes if not isinstance(node, str)) == 1
+        assert bound.render({"name": "Ann"}) == template.render(
+            {"title": "News", "show": True, "message": "<b>x</b>", "name": "Ann"}
+        )
+
+    def test_render_many(self, make_service):
+        service = make_service(t="{{greeting}}, {{name}}")
+
+        rendered = list(service.get("t").render_many({"greeting": "Hi"}, [{"name": "A"}, {"name": "B"}]))
+
+        assert [r.html for r in rendered] == ["Hi, A", "Hi, B"]
+
+
+class TestRepositoryTemplates:
+    """Test the shipped templates compile and render"""
+
+    def test_all_templates_compile(self):
+        service = EmailTemplateService()
+
+        assert "verification" in service._templates
+        assert "gdpr/export_ready" in service._templates
+
+    def test_bulk_update_template(self):
+        rendered = EmailTemplateService().render(
+            "event_bulk_update", {"recipient_name": "Ann", "message": "<p>See you there</p>"}
+        )
+
+        assert "<h2>Hello, Ann!</h2>" in rendered.html
+        assert "See you there" in rendered.text
+        assert "This email was sent to event attendees." in rendered.text
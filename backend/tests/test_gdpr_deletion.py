@@ -11,12 +11,16 @@ Test Coverage:
 - Retention policy enforcement
 - Stripe subscription cancellation
 - Background job execution
+- Batched, concurrent anonymization and resumable progress
 - Audit logging
 - Error handling and edge cases
 
 Target: 80%+ code coverage
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
@@ -34,6 +38,7 @@ from backend.utils.anonymization import (
     anonymize_user_id,
     anonymize_email,
     anonymize_document,
+    anonymize_documents,
     should_anonymize_field,
     get_retention_period_days,
     should_retain_resource,
@@ -450,7 +455,8 @@ class TestGDPRDeletionService:
     @pytest.mark.asyncio
     async def test_soft_delete_user(self, gdpr_service, sample_user, mock_zerodb_client):
         """Test user soft deletion and anonymization"""
-        result = await gdpr_service._soft_delete_user("user_123", sample_user)
+        with patch("backend.services.gdpr_service.record_person") as record_person:
+            result = await gdpr_service._soft_delete_user("user_123", sample_user)
 
         assert result["success"] is True
         assert result["user_id"] == "user_123"
@@ -470,6 +476,9 @@ class TestGDPRDeletionService:
         # Role should be preserved for audit
         assert anonymized_user["role"] == sample_user["role"]
 
+        # Admin search only sees the anonymized account
+        record_person.assert_called_once_with("user_123", anonymized_user, profile={})
+
     @pytest.mark.asyncio
     async def test_send_deletion_confirmation_email(
         self,
@@ -671,6 +680,186 @@ class TestGDPRDeletionPerformance:
         assert mock_zerodb_client.update_document.call_count == 1000
 
 
+class TestBulkAnonymization:
+    """Test batched, concurrent and resumable anonymization"""
+
+    def test_anonymize_documents_matches_anonymize_document(self, sample_profile):
+        """Test that batch anonymization produces the same records"""
+        documents = [sample_profile, {**sample_profile, "id": "profile_456", "status": "active"}, {}]
+
+        batch = anonymize_documents(documents, AnonymizationType.PROFILE, "user_123")
+
+        for document, anonymized in zip(documents, batch):
+            expected = anonymize_document(document, AnonymizationType.PROFILE, "user_123")
+            if expected:
+                expected.pop("anonymized_at")
+                assert anonymized.pop("anonymized_at")
+            assert anonymized == expected
+
+    @pytest.mark.asyncio
+    async def test_anonymize_pages_through_records(self, gdpr_service, mock_zerodb_client):
+        """Test that every page of records is anonymized"""
+        gdpr_service.anonymizer.page_size = 2
+        records = [{"id": f"rsvp_{i}", "user_id": "user_123", "name": "John"} for i in range(5)]
+        mock_zerodb_client.query_documents.side_effect = (
+            lambda collection, filters, limit, offset: {"documents": records[offset:offset + limit]}
+        )
+
+        result = await gdpr_service._anonymize_rsvps("user_123")
+
+        assert result == {"success": True, "rsvps_anonymized": 5}
+        updated = {call[0][1]: call[0][2] for call in mock_zerodb_client.update_document.call_args_list}
+        assert sorted(updated) == [record["id"] for record in records]
+        assert all(record["name"] == "[REDACTED]" for record in updated.values())
+
+    @pytest.mark.asyncio
+    async def test_already_anonymized_records_skipped(self, gdpr_service, mock_zerodb_client):
+        """Test that a re-run only updates records not yet anonymized"""
+        mock_zerodb_client.query_documents.return_value = {"documents": [
+            {"id": "q_1", "user_id": "user_123", "query": "karate", "anonymized_at": "2024-01-01T00:00:00"},
+            {"id": "q_2", "user_id": "user_123", "query": "judo"},
+        ]}
+
+        result = await gdpr_service._anonymize_search_queries("user_123")
+
+        assert result["queries_anonymized"] == 1
+        assert result["already_anonymized"] == 1
+        mock_zerodb_client.update_document.assert_called_once()
+        assert mock_zerodb_client.update_document.call_args[0][1] == "q_2"
+
+    @pytest.mark.asyncio
+    async def test_failed_updates_reported(self, gdpr_service, mock_zerodb_client):
+        """Test that failed updates fail the step without stopping the others"""
+        mock_zerodb_client.query_documents.return_value = {"documents": [
+            {"id": f"a_{i}", "user_id": "user_123"} for i in range(3)
+        ]}
+        mock_zerodb_client.update_document.side_effect = [None, Exception("timeout"), None]
+
+        result = await gdpr_service._anonymize_applications("user_123")
+
+        assert result["success"] is False
+        assert result["applications_anonymized"] == 2
+        assert result["failed"] == 1
+        assert "timeout" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_collection_steps_run_concurrently(self, gdpr_service, sample_user):
+        """Test that independent collections are anonymized at the same time"""
+        async def slow_step(*args):
+            await asyncio.sleep(0.2)
+            return {"success": True}
+
+        steps = [
+            "_cancel_stripe_subscription", "_anonymize_user_profile", "_anonymize_applications",
+            "_anonymize_search_queries", "_anonymize_training_attendance", "_anonymize_rsvps",
+            "_anonymize_payment_records",
+        ]
+        for step in steps:
+            setattr(gdpr_service, step, AsyncMock(side_effect=slow_step))
+        gdpr_service._invalidate_user_tokens = AsyncMock(return_value={"success": True})
+        gdpr_service._send_deletion_confirmation_email = AsyncMock(return_value={"success": True})
+
+        start = time.perf_counter()
+        await gdpr_service._execute_account_deletion_async("user_123", sample_user)
+
+        assert time.perf_counter() - start < 0.2 * len(steps) / 2
+
+    @pytest.mark.asyncio
+    async def test_progress_saved_and_resumed(self, gdpr_service, mock_zerodb_client, sample_user):
+        """Test that completed steps are recorded and skipped when resuming"""
+        gdpr_service._invalidate_user_tokens = AsyncMock(return_value={"success": True})
+        gdpr_service._send_deletion_confirmation_email = AsyncMock(return_value={"success": True})
+        gdpr_service._anonymize_user_profile = AsyncMock(return_value={"success": True})
+
+        with patch("stripe.Subscription.cancel"):
+            await gdpr_service._execute_account_deletion_async(
+                "user_123",
+                sample_user,
+                completed_steps=["anonymize_profile", "cancel_subscription"]
+            )
+
+        gdpr_service._anonymize_user_profile.assert_not_called()
+        progress = [
+            call[0][2]["deletion_completed_steps"]
+            for call in mock_zerodb_client.update_document.call_args_list
+            if "deletion_completed_steps" in call[0][2]
+        ]
+        assert "anonymize_profile" in progress[0]
+        assert "send_confirmation_email" in progress[-1]
+        audit_data = mock_zerodb_client.create_document.call_args[0][1]
+        assert audit_data["metadata"]["resumed"] is True
+
+    @pytest.mark.asyncio
+    @patch("asyncio.create_task")
+    async def test_resume_account_deletion(self, mock_create_task, gdpr_service, mock_zerodb_client, sample_user):
+        """Test resuming an interrupted deletion from the recorded progress"""
+        mock_zerodb_client.get_document.return_value = {"data": {
+            **sample_user,
+            "status": "deletion_in_progress",
+            "deletion_completed_steps": ["anonymize_profile"]
+        }}
+
+        with patch.object(gdpr_service, "_execute_account_deletion_async", Mock()) as mock_execute:
+            result = await gdpr_service.resume_account_deletion("user_123")
+
+        assert result["completed_steps"] == ["anonymize_profile"]
+        mock_create_task.assert_called_once()
+        assert mock_execute.call_args[0][2] == ["anonymize_profile"]
+
+    @pytest.mark.asyncio
+    async def test_resume_without_deletion_in_progress(self, gdpr_service):
+        """Test that only deletions in progress can be resumed"""
+        with pytest.raises(GDPRServiceError):
+            await gdpr_service.resume_account_deletion("user_123")
+
+    @pytest.mark.asyncio
+    async def test_resume_interrupted_deletions_skips_recent(self, gdpr_service, mock_zerodb_client):
+        """Test that only deletions without recent progress are resumed"""
+        stale = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+        mock_zerodb_client.query_documents.return_value = {"documents": [
+            {"id": "user_stale", "status": "deletion_in_progress", "deletion_progress_at": stale},
+            {"id": "user_busy", "status": "deletion_in_progress",
+             "deletion_progress_at": datetime.utcnow().isoformat()},
+        ]}
+        gdpr_service.resume_account_deletion = AsyncMock()
+
+        resumed = await gdpr_service.resume_interrupted_deletions()
+
+        assert resumed == ["user_stale"]
+        gdpr_service.resume_account_deletion.assert_awaited_once_with("user_stale")
+
+    @pytest.mark.asyncio
+    async def test_deletion_resume_job_waits_for_resumed_deletions(self, gdpr_service):
+        """Test that the periodic job keeps its event loop until resumed deletions finish"""
+        finished = []
+
+        async def deletion():
+            await asyncio.sleep(0)
+            finished.append("user_stale")
+
+        async def resume():
+            gdpr_service._deletion_tasks["user_stale"] = asyncio.create_task(deletion())
+            return ["user_stale"]
+
+        gdpr_service.resume_interrupted_deletions = resume
+
+        resumed = await gdpr_service.run_deletion_resume_job()
+
+        assert resumed == ["user_stale"]
+        assert finished == ["user_stale"]
+
+    def test_deletion_resume_job_registered(self, gdpr_service):
+        """Test that interrupted deletions are checked periodically"""
+        runner = Mock()
+
+        gdpr_service.register_jobs(runner)
+
+        name, func = runner.register.call_args[0]
+        assert name == "gdpr_deletion_resume"
+        assert func == gdpr_service.run_deletion_resume_job
+        assert runner.register.call_args[1]["interval"] == gdpr_service.DELETION_STALE_MINUTES * 60
+
+
 # ============================================================================
 # TOKEN INVALIDATION TESTS
 # ============================================================================
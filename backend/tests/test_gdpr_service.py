@@ -12,7 +12,10 @@ Target: 80%+ code coverage
 """
 
 import pytest
+import io
 import json
+import time
+import zipfile
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
@@ -33,10 +36,11 @@ from backend.services.zerodb_service import ZeroDBError
 def mock_db_client():
     """Mock ZeroDB client"""
     mock = Mock()
-    mock.find = Mock(return_value={"documents": []})
+    mock.query_documents = Mock(return_value={"documents": []})
     mock.insert_one = Mock(return_value={"id": "audit_log_123"})
     mock.upload_object = Mock(return_value={"key": "test_key", "size": 1024})
     mock.upload_object_from_bytes = Mock(return_value={"key": "test_key", "size": 1024})
+    mock.upload_object_from_file = Mock(return_value={"key": "test_key", "size": 1024})
     mock.generate_signed_url = Mock(return_value="https://example.com/download/test")
     mock.get_object_metadata = Mock(return_value={
         "created_at": datetime.utcnow().isoformat(),
@@ -159,7 +163,7 @@ async def test_export_user_data_success(
 ):
     """Test successful user data export"""
     # Mock database responses
-    mock_db_client.find.return_value = {"documents": sample_profile_data}
+    mock_db_client.query_documents.return_value = {"documents": sample_profile_data}
 
     # Execute export
     result = await gdpr_service.export_user_data(
@@ -176,8 +180,8 @@ async def test_export_user_data_success(
     assert "record_counts" in result
 
     # Verify database interactions
-    assert mock_db_client.find.called
-    assert mock_db_client.upload_object_from_bytes.called
+    assert mock_db_client.query_documents.called
+    assert mock_db_client.upload_object_from_file.called
     assert mock_db_client.generate_signed_url.called
     assert mock_db_client.insert_one.called  # Audit log
 
@@ -196,7 +200,7 @@ async def test_export_user_data_with_multiple_collections(
 ):
     """Test export with data from multiple collections"""
     # Mock different responses for different collections
-    def mock_find_side_effect(collection, filter_query, limit):
+    def mock_query_side_effect(collection, filters, limit, offset):
         if collection == "profiles":
             return {"documents": sample_profile_data}
         elif collection == "applications":
@@ -206,7 +210,7 @@ async def test_export_user_data_with_multiple_collections(
         else:
             return {"documents": []}
 
-    mock_db_client.find.side_effect = mock_find_side_effect
+    mock_db_client.query_documents.side_effect = mock_query_side_effect
 
     result = await gdpr_service.export_user_data(
         user_id=sample_user_data["user_id"],
@@ -214,7 +218,7 @@ async def test_export_user_data_with_multiple_collections(
     )
 
     # Verify all collections were queried
-    assert mock_db_client.find.call_count >= len(GDPRService.COLLECTIONS)
+    assert mock_db_client.query_documents.call_count >= len(GDPRService.COLLECTIONS)
 
     # Verify record counts
     assert result["record_counts"]["profiles"] == len(sample_profile_data)
@@ -230,7 +234,7 @@ async def test_export_user_data_handles_empty_collections(
 ):
     """Test export when user has no data in some collections"""
     # Mock empty responses
-    mock_db_client.find.return_value = {"documents": []}
+    mock_db_client.query_documents.return_value = {"documents": []}
 
     result = await gdpr_service.export_user_data(
         user_id=sample_user_data["user_id"],
@@ -251,7 +255,7 @@ async def test_export_user_data_handles_collection_errors(
 ):
     """Test export handles errors from individual collections gracefully"""
     # Mock error for one collection, success for others
-    def mock_find_side_effect(collection, filter_query, limit):
+    def mock_query_side_effect(collection, filters, limit, offset):
         if collection == "profiles":
             return {"documents": sample_profile_data}
         elif collection == "payments":
@@ -259,7 +263,7 @@ async def test_export_user_data_handles_collection_errors(
         else:
             return {"documents": []}
 
-    mock_db_client.find.side_effect = mock_find_side_effect
+    mock_db_client.query_documents.side_effect = mock_query_side_effect
 
     # Should still complete export
     result = await gdpr_service.export_user_data(
@@ -272,6 +276,29 @@ async def test_export_user_data_handles_collection_errors(
     assert result["record_counts"]["profiles"] == len(sample_profile_data)
 
 
+@pytest.mark.asyncio
+async def test_export_user_data_collects_collections_concurrently(
+    gdpr_service,
+    mock_db_client,
+    sample_user_data
+):
+    """Test export time tracks the slowest collection, not the sum"""
+    def slow_query(collection, filters, limit, offset):
+        time.sleep(0.2)
+        return {"documents": []}
+
+    mock_db_client.query_documents.side_effect = slow_query
+
+    start = time.monotonic()
+    result = await gdpr_service.export_user_data(
+        user_id=sample_user_data["user_id"],
+        user_email=sample_user_data["email"]
+    )
+
+    assert result["status"] == "completed"
+    assert time.monotonic() - start < 0.2 * len(GDPRService.COLLECTIONS) / 2
+
+
 @pytest.mark.asyncio
 async def test_export_user_data_storage_failure(
     gdpr_service,
@@ -279,8 +306,8 @@ async def test_export_user_data_storage_failure(
     sample_user_data
 ):
     """Test export failure when storage fails"""
-    mock_db_client.find.return_value = {"documents": []}
-    mock_db_client.upload_object_from_bytes.side_effect = Exception("Storage error")
+    mock_db_client.query_documents.return_value = {"documents": []}
+    mock_db_client.upload_object_from_file.side_effect = Exception("Storage error")
 
     with pytest.raises(DataExportError) as exc_info:
         await gdpr_service.export_user_data(
@@ -296,40 +323,85 @@ async def test_export_user_data_storage_failure(
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_collect_collection_data(
+async def test_export_collection(
     gdpr_service,
     mock_db_client,
     sample_profile_data
 ):
     """Test collecting data from a specific collection"""
-    mock_db_client.find.return_value = {"documents": sample_profile_data}
+    mock_db_client.query_documents.return_value = {"documents": sample_profile_data}
 
-    data = await gdpr_service._collect_collection_data(
+    exported = await gdpr_service._export_collection(
         collection_name="profiles",
+        description="Profile Information",
         user_id="user_123"
     )
 
-    assert len(data) == len(sample_profile_data)
-    assert mock_db_client.find.called
-    call_args = mock_db_client.find.call_args
+    assert exported.record_count == len(sample_profile_data)
+    assert exported.error is None
+    exported.file.seek(0)
+    document = json.loads(exported.file.read())
+    assert document["description"] == "Profile Information"
+    assert document["records"] == sample_profile_data
+    assert document["record_count"] == len(sample_profile_data)
+
+    call_args = mock_db_client.query_documents.call_args
     assert call_args[1]["collection"] == "profiles"
-    assert call_args[1]["filter_query"]["user_id"] == "user_123"
+    assert call_args[1]["filters"]["user_id"] == "user_123"
+
+
+@pytest.mark.asyncio
+async def test_export_collection_pages_through_records(
+    gdpr_service,
+    mock_db_client
+):
+    """Test that large collections are fetched page by page"""
+    gdpr_service.EXPORT_PAGE_SIZE = 2
+    records = [{"id": f"rsvp_{i}", "user_id": "user_123"} for i in range(5)]
+    mock_db_client.query_documents.side_effect = (
+        lambda collection, filters, limit, offset: {"documents": records[offset:offset + limit]}
+    )
+
+    exported = await gdpr_service._export_collection("rsvps", "Event RSVPs", "user_123")
+
+    assert exported.record_count == 5
+    assert [c[1]["offset"] for c in mock_db_client.query_documents.call_args_list] == [0, 2, 4]
+    exported.file.seek(0)
+    assert json.loads(exported.file.read())["records"] == records
 
 
 @pytest.mark.asyncio
-async def test_collect_collection_data_not_found(
+async def test_export_collection_not_found(
     gdpr_service,
     mock_db_client
 ):
     """Test collecting from non-existent collection"""
-    mock_db_client.find.side_effect = ZeroDBError("Collection not found")
+    mock_db_client.query_documents.side_effect = ZeroDBError("Collection not found")
 
-    data = await gdpr_service._collect_collection_data(
+    exported = await gdpr_service._export_collection(
         collection_name="nonexistent",
+        description="Nothing",
         user_id="user_123"
     )
 
-    assert data == []
+    assert exported.record_count == 0
+    assert exported.error is None
+
+
+@pytest.mark.asyncio
+async def test_export_collection_error_recorded(
+    gdpr_service,
+    mock_db_client
+):
+    """Test that a failing collection is exported empty with its error"""
+    mock_db_client.query_documents.side_effect = ZeroDBError("Connection reset")
+
+    exported = await gdpr_service._export_collection("payments", "Payment History", "user_123")
+
+    exported.file.seek(0)
+    document = json.loads(exported.file.read())
+    assert document["records"] == []
+    assert "Connection reset" in document["error"]
 
 
 # ============================================================================
@@ -463,30 +535,31 @@ def test_generate_cover_letter(gdpr_service):
 async def test_store_export_file(gdpr_service, mock_db_client):
     """Test storing export file in object storage"""
     expiry_date = datetime.utcnow() + timedelta(hours=24)
-    content = '{"test": "data"}'
+    archive = io.BytesIO(b"PK\x05\x06" + b"\x00" * 18)
 
     result = await gdpr_service._store_export_file(
         object_key="test_key",
-        content=content,
+        archive=archive,
         expiry_date=expiry_date
     )
 
-    assert mock_db_client.upload_object_from_bytes.called
-    call_args = mock_db_client.upload_object_from_bytes.call_args
+    assert mock_db_client.upload_object_from_file.called
+    call_args = mock_db_client.upload_object_from_file.call_args
     assert call_args[1]["key"] == "test_key"
-    assert call_args[1]["content_type"] == "application/json"
+    assert call_args[1]["file_obj"] is archive
+    assert call_args[1]["content_type"] == "application/zip"
 
 
 @pytest.mark.asyncio
 async def test_store_export_file_failure(gdpr_service, mock_db_client):
     """Test handling of storage failure"""
-    mock_db_client.upload_object_from_bytes.side_effect = Exception("Storage error")
+    mock_db_client.upload_object_from_file.side_effect = Exception("Storage error")
     expiry_date = datetime.utcnow() + timedelta(hours=24)
 
     with pytest.raises(DataExportError) as exc_info:
         await gdpr_service._store_export_file(
             object_key="test_key",
-            content='{"test": "data"}',
+            archive=io.BytesIO(b""),
             expiry_date=expiry_date
         )
 
@@ -675,7 +748,7 @@ async def test_full_export_workflow(
 ):
     """Test complete export workflow end-to-end"""
     # Setup mock responses
-    def mock_find_side_effect(collection, filter_query, limit):
+    def mock_query_side_effect(collection, filters, limit, offset):
         if collection == "profiles":
             return {"documents": sample_profile_data}
         elif collection == "applications":
@@ -685,7 +758,16 @@ async def test_full_export_workflow(
         else:
             return {"documents": []}
 
-    mock_db_client.find.side_effect = mock_find_side_effect
+    mock_db_client.query_documents.side_effect = mock_query_side_effect
+
+    # Capture the archive as it is uploaded
+    uploaded = {}
+
+    def mock_upload(key, file_obj, content_type, metadata, ttl):
+        uploaded["content"] = file_obj.read()
+        return {"key": key, "size": len(uploaded["content"])}
+
+    mock_db_client.upload_object_from_file.side_effect = mock_upload
 
     # Execute export
     result = await gdpr_service.export_user_data(
@@ -700,21 +782,25 @@ async def test_full_export_workflow(
     assert result["expiry_date"]
 
     # Verify all components were called
-    assert mock_db_client.find.called  # Data collection
-    assert mock_db_client.upload_object_from_bytes.called  # File storage
+    assert mock_db_client.query_documents.called  # Data collection
+    assert mock_db_client.upload_object_from_file.called  # File storage
     assert mock_db_client.generate_signed_url.called  # URL generation
     assert mock_db_client.insert_one.called  # Audit logging
     assert mock_email_service._send_email.called  # Email notification
 
-    # Verify export file content would be valid JSON
-    upload_call_args = mock_db_client.upload_object_from_bytes.call_args
-    content = upload_call_args[1]["content"].decode('utf-8')
-    export_data = json.loads(content)
-
-    assert "export_metadata" in export_data
-    assert "cover_letter" in export_data
-    assert "data" in export_data
-    assert len(export_data["data"]) == len(GDPRService.COLLECTIONS)
+    # Verify the archive holds the cover letter, metadata and one file per collection
+    assert result["file_size_bytes"] == len(uploaded["content"])
+    with zipfile.ZipFile(io.BytesIO(uploaded["content"])) as archive:
+        names = set(archive.namelist())
+        assert names == (
+            {"cover_letter.json", "export_metadata.json"}
+            | {f"{collection}.json" for collection in GDPRService.COLLECTIONS}
+        )
+        metadata = json.loads(archive.read("export_metadata.json"))
+        assert metadata["export_id"] == result["export_id"]
+        assert metadata["record_counts"]["applications"] == len(sample_application_data)
+        payments = json.loads(archive.read("payments.json"))
+        assert payments["records"][0]["card_last4"] == "****4242"
 
 
 @pytest.mark.asyncio
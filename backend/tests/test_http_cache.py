@@ -0,0 +1,213 @@
+"""
+Unit Tests for HTTP Caching of Public Reads
+
+Tests conditional GET support including:
+- Collection content versions in Redis, and the fallback without Redis
+- ETag/If-None-Match matching and Cache-Control/Surrogate-Key headers
+- Public event, blog and certification routes answering 304 without
+  loading content, and new ETags after a write
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routes import blog as blog_routes
+from backend.routes import certifications as certifications_routes
+from backend.routes import events as events_routes
+from backend.services import http_cache
+from backend.services.event_service import get_event_service
+from backend.services.http_cache import (
+    EVENTS_CONTENT,
+    PRIVATE_POLICY,
+    PUBLIC_LIST_POLICY,
+    VERSION_KEY_PREFIX,
+    ContentVersions,
+    etag_matches,
+)
+from backend.services.strapi_service import ArticlePage, StrapiError
+from backend.services.training_session_service import get_training_session_service
+
+
+class FakeRedis:
+    """In-memory stand-in for the counter commands the versions use"""
+
+    def __init__(self):
+        self.values = {}
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+    def pipeline(self, transaction=True):
+        fake = self
+        commands = []
+
+        class Pipeline:
+            def incr(self, key):
+                commands.append(key)
+
+            def execute(self):
+                return [fake.incr(key) for key in commands]
+
+        return Pipeline()
+
+
+@pytest.fixture
+def versions():
+    versions = ContentVersions(redis_client=FakeRedis())
+    with patch.object(http_cache, "get_content_versions", return_value=versions):
+        yield versions
+
+
+class TestContentVersions:
+    """Test the collection change counters"""
+
+    def test_versions_start_at_zero_and_bump(self, versions):
+        assert versions.get(["events", "blog"]) == [0, 0]
+
+        versions.bump("events")
+
+        assert versions.get(["events", "blog"]) == [1, 0]
+        assert versions.redis_client.values[VERSION_KEY_PREFIX + "events"] == "1"
+
+    def test_unavailable_without_redis(self):
+        client = MagicMock()
+        client.mget.side_effect = redis.ConnectionError("down")
+        versions = ContentVersions(redis_client=client)
+
+        assert versions.get(["events"]) is None
+        assert versions.get(["events"]) is None
+        assert client.mget.call_count == 1  # Redis bypassed after the error
+
+    def test_bump_content_version_never_raises(self):
+        with patch.object(http_cache, "get_content_versions", side_effect=RuntimeError("boom")):
+            http_cache.bump_content_version(EVENTS_CONTENT)
+
+
+class TestHeaders:
+    """Test ETag matching and Cache-Control directives"""
+
+    @pytest.mark.parametrize("header,expected", [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('"xyz"', False),
+        ("*", True),
+    ])
+    def test_etag_matches(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
+
+    def test_cache_control(self):
+        assert PUBLIC_LIST_POLICY.header() == "public, max-age=0, s-maxage=60, stale-while-revalidate=30"
+        assert PRIVATE_POLICY.header() == "private, max-age=0"
+
+
+class TestPublicEventRoutes:
+    """Test conditional GETs of the public event routes"""
+
+    @pytest.fixture
+    def event_service(self):
+        service = MagicMock()
+        service.list_events.return_value = {"documents": [{"id": "e1", "title": "Seminar"}], "total": 1}
+        return service
+
+    @pytest.fixture
+    def client(self, event_service):
+        app = FastAPI()
+        app.include_router(events_routes.router)
+        app.dependency_overrides[get_event_service] = lambda: event_service
+        app.dependency_overrides[get_training_session_service] = lambda: MagicMock(
+            list_sessions=MagicMock(return_value={"documents": []})
+        )
+        return TestClient(app)
+
+    def test_not_modified_without_loading_events(self, client, event_service, versions):
+        first = client.get("/api/events/public?type=seminar")
+        second = client.get("/api/events/public?type=seminar", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert first.headers["Surrogate-Key"] == "events"
+        assert first.headers["Cache-Control"] == PUBLIC_LIST_POLICY.header()
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert event_service.list_events.call_count == 1
+
+    def test_etag_depends_on_query(self, client, event_service, versions):
+        first = client.get("/api/events/public?type=seminar")
+        other = client.get("/api/events/public?type=tournament", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert other.status_code == 200
+        assert other.headers["ETag"] != first.headers["ETag"]
+
+    def test_write_changes_etag(self, client, event_service, versions):
+        first = client.get("/api/events/public")
+
+        http_cache.bump_content_version(EVENTS_CONTENT)
+        second = client.get("/api/events/public", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+    def test_public_event_tagged_with_event(self, client, event_service, versions):
+        event_service.get_event.return_value = {"id": "e1", "status": "published", "visibility": "public"}
+
+        response = client.get("/api/events/public/e1")
+
+        assert response.status_code == 200
+        assert response.headers["Surrogate-Key"] == "events event:e1"
+
+    def test_no_etag_without_redis(self, client, event_service):
+        with patch.object(http_cache, "get_content_versions", return_value=ContentVersions()):
+            response = client.get("/api/events/public")
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert response.headers["Cache-Control"] == PUBLIC_LIST_POLICY.header()
+
+
+class TestBlogAndCertificationRoutes:
+    """Test the blog and certification routes"""
+
+    def test_blog_fallback_not_cached(self, versions):
+        strapi = MagicMock()
+        strapi.fetch_article_page.side_effect = StrapiError("down")
+
+        with patch.object(blog_routes, "get_strapi_service", return_value=strapi):
+            response = TestClient(blog_routes.router).get("/api/blog")
+
+        assert response.json() == []
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "ETag" not in response.headers
+
+    def test_blog_etag_rolls_over_each_refresh_interval(self, versions):
+        strapi = MagicMock()
+        strapi.fetch_article_page.return_value = ArticlePage(articles=[], total=0)
+        client = TestClient(blog_routes.router)
+
+        with patch.object(blog_routes, "get_strapi_service", return_value=strapi), \
+             patch("backend.services.http_cache.time.time", return_value=0):
+            first = client.get("/api/blog/categories")
+        with patch.object(blog_routes, "get_strapi_service", return_value=strapi), \
+             patch("backend.services.http_cache.time.time", return_value=blog_routes.BLOG_REFRESH_INTERVAL):
+            second = client.get("/api/blog/categories", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+
+    def test_certifications_validated_without_redis(self):
+        client = TestClient(certifications_routes.router)
+
+        first = client.get("/api/certifications?level=Advanced")
+        second = client.get("/api/certifications?level=Advanced", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert "max-age=3600" in second.headers["Cache-Control"]
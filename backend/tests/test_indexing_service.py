@@ -136,7 +136,15 @@ class TestIndexingService:
             yield client
 
     @pytest.fixture
-    def indexing_service(self, mock_zerodb, mock_openai):
+    def mock_cache(self):
+        """Mock cache service"""
+        with patch("backend.services.indexing_service.get_cache_service") as mock:
+            cache = Mock()
+            mock.return_value = cache
+            yield cache
+
+    @pytest.fixture
+    def indexing_service(self, mock_zerodb, mock_openai, mock_cache):
         """Create IndexingService instance with mocked dependencies"""
         service = IndexingService()
         return service
@@ -409,6 +417,8 @@ class TestIndexingService:
         assert result["total_documents"] == 2
         assert result["indexed"] > 0
         assert indexing_service._status == IndexingStatus.COMPLETED
+        # Cached search results are invalidated
+        indexing_service.cache.bump_namespace.assert_called_once_with("search")
 
     def test_get_stats(self, indexing_service, mock_zerodb):
         """Test getting indexing statistics"""
@@ -56,6 +56,8 @@ from backend.utils.file_upload import (
     validate_video_upload,
     validate_document_upload,
     validate_avatar_upload,
+    StreamingUploadValidator,
+    copy_upload_to_file,
 )
 
 from backend.utils.security import (
@@ -462,6 +464,74 @@ class TestFileUploadValidation:
         assert "large" in error.lower()
 
 
+class TestStreamingUploadValidation:
+    """Test chunk-by-chunk upload validation"""
+
+    PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 2000
+
+    def test_valid_upload_in_chunks(self):
+        """Test that the magic bytes are checked once enough bytes arrived"""
+        validator = StreamingUploadValidator(max_size=4096, content_type="image/png")
+
+        for start in range(0, len(self.PNG), 100):
+            assert validator.feed(self.PNG[start:start + 100]) == (True, "")
+        assert validator.finish() == (True, "")
+        assert validator.bytes_received == len(self.PNG)
+
+    def test_spoofed_content_rejected_on_first_chunk(self):
+        """Test that a mismatching header fails before the rest is read"""
+        validator = StreamingUploadValidator(max_size=4096, content_type="image/png")
+
+        is_valid, error = validator.feed(b'MZ' + b'\x00' * 2000)
+
+        assert not is_valid
+        assert "spoofing" in error
+
+    def test_running_size_limit(self):
+        """Test that an upload fails as soon as it exceeds the limit"""
+        validator = StreamingUploadValidator(max_size=1500, content_type="image/png")
+
+        assert validator.feed(self.PNG[:1024])[0]
+        is_valid, error = validator.feed(self.PNG[1024:])
+
+        assert not is_valid
+        assert "large" in error.lower()
+
+    def test_short_file_checked_on_finish(self):
+        """Test that files shorter than the header are checked at the end"""
+        validator = StreamingUploadValidator(max_size=4096, content_type="image/png")
+
+        assert validator.feed(b'not a png at all')[0]
+        assert not validator.finish()[0]
+
+    def test_unknown_signature_not_verified(self):
+        """Test that types without known signatures only get the size check"""
+        with patch('backend.utils.file_upload.MAGIC_AVAILABLE', False):
+            validator = StreamingUploadValidator(max_size=4096, content_type="video/mp4")
+
+        assert validator.feed(b'\x00' * 2048) == (True, "")
+        assert validator.finish() == (True, "")
+
+    @pytest.mark.asyncio
+    async def test_copy_upload_to_file_stops_at_limit(self):
+        """Test that copying stops at the chunk that exceeds the limit"""
+        upload = Mock(spec=UploadFile)
+        chunks = [self.PNG[:1024], self.PNG[1024:], b'x' * 4096, b'']
+
+        async def read(size):
+            return chunks.pop(0)
+
+        upload.read = read
+        destination = BytesIO()
+
+        is_valid, error = await copy_upload_to_file(
+            upload, destination, StreamingUploadValidator(max_size=3000, content_type="image/png")
+        )
+
+        assert not is_valid
+        assert destination.getvalue() == self.PNG
+
+
 # ============================================================================
 # SECURITY UTILITY TESTS
 # ============================================================================
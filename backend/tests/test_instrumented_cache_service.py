@@ -0,0 +1,257 @@
+"""
+Unit Tests for Instrumented Cache Service memoization
+
+Tests get_or_compute / aget_or_compute including:
+- Fresh hits skip computation
+- Misses compute once and store with jittered TTL plus stale window
+- Single-flight coalescing of concurrent misses
+- Stale-while-revalidate background refresh
+- Waiting on another worker's recompute lock
+- Graceful degradation when Redis errors
+- Namespace-version and tag-based invalidation
+
+Runs against fakeredis[lua], so the lock release script is exercised as
+Redis runs it.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.instrumented_cache_service import (
+    InstrumentedCacheService,
+    LOCK_KEY_PREFIX,
+    NAMESPACE_VERSION_PREFIX,
+    TAG_KEY_PREFIX,
+    TAG_SET_PRUNE_SAMPLE,
+    TAG_SET_PRUNE_SIZE,
+    TAG_SET_TTL,
+    _PRUNE_TAG_SETS_SCRIPT,
+    jittered_ttl,
+)
+
+
+@pytest.fixture
+def fake_redis(lua_redis_client):
+    return lua_redis_client
+
+
+@pytest.fixture
+def cache(fake_redis):
+    return InstrumentedCacheService(client=fake_redis)
+
+
+class TestGetOrCompute:
+    """Test synchronous memoization"""
+
+    def test_fresh_hit_skips_compute(self, cache, fake_redis):
+        fake_redis.setex("k", 300, json.dumps({"v": 1}))
+        compute = MagicMock()
+
+        assert cache.get_or_compute("k", compute, ttl=300, stale_ttl=60) == {"v": 1}
+        compute.assert_not_called()
+
+    def test_miss_computes_and_stores_with_stale_window(self, cache, fake_redis):
+        compute = MagicMock(return_value={"v": 2})
+
+        result = cache.get_or_compute("k", compute, ttl=100, stale_ttl=60, jitter=0)
+
+        assert result == {"v": 2}
+        compute.assert_called_once()
+        assert json.loads(fake_redis.get("k")) == {"v": 2}
+        assert 159 * 1000 < fake_redis.pttl("k") <= 160 * 1000
+        # Lock released
+        assert not fake_redis.exists(LOCK_KEY_PREFIX + "k")
+
+    def test_none_result_not_cached(self, cache, fake_redis):
+        assert cache.get_or_compute("k", lambda: None, ttl=100) is None
+        assert not fake_redis.exists("k")
+
+    def test_compute_error_propagates_and_releases_lock(self, cache, fake_redis):
+        def compute():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute("k", compute, ttl=100)
+
+        assert not fake_redis.exists(LOCK_KEY_PREFIX + "k")
+
+    def test_concurrent_misses_compute_once(self, cache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute, ttl=100)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+
+    def test_stale_value_served_while_refreshing(self, cache, fake_redis):
+        fake_redis.setex("k", 30, json.dumps("old"))  # inside the 60s stale window
+        refreshed = threading.Event()
+
+        def compute():
+            refreshed.set()
+            return "new"
+
+        assert cache.get_or_compute("k", compute, ttl=100, stale_ttl=60) == "old"
+        assert refreshed.wait(1)
+
+        deadline = time.monotonic() + 1
+        while cache.get("k") != "new" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get("k") == "new"
+
+    def test_waits_for_lock_holder(self, cache, fake_redis):
+        fake_redis.set(LOCK_KEY_PREFIX + "k", "other-worker")
+        compute = MagicMock(return_value="mine")
+
+        def other_worker():
+            time.sleep(0.1)
+            fake_redis.setex("k", 100, json.dumps("theirs"))
+
+        threading.Thread(target=other_worker).start()
+
+        assert cache.get_or_compute("k", compute, ttl=100, wait_timeout=2) == "theirs"
+        compute.assert_not_called()
+
+    def test_redis_errors_fall_back_to_compute(self):
+        client = MagicMock()
+        client.get.side_effect = Exception("connection refused")
+        client.set.side_effect = Exception("connection refused")
+        client.setex.side_effect = Exception("connection refused")
+        cache = InstrumentedCacheService(client=client)
+
+        assert cache.get_or_compute("k", lambda: "computed", ttl=100) == "computed"
+
+
+class TestAsyncGetOrCompute:
+    """Test async memoization"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self, cache, fake_redis):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"v": 1}
+
+        results = await asyncio.gather(*[
+            cache.aget_or_compute("k", compute, ttl=100) for _ in range(5)
+        ])
+
+        assert results == [{"v": 1}] * 5
+        assert len(calls) == 1
+        assert json.loads(fake_redis.get("k")) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_stale_value_refreshed_in_background(self, cache, fake_redis):
+        fake_redis.setex("k", 10, json.dumps("old"))
+
+        async def compute():
+            return "new"
+
+        assert await cache.aget_or_compute("k", compute, ttl=100, stale_ttl=60) == "old"
+        await asyncio.sleep(0.05)
+        assert cache.get("k") == "new"
+
+
+class TestInvalidation:
+    """Test namespace-version and tag-based invalidation"""
+
+    def test_bump_namespace_changes_versioned_keys(self, cache, fake_redis):
+        before = cache.versioned_key("events", "public:list:abc")
+        assert before == "events:v0:public:list:abc"
+
+        assert cache.bump_namespace("events") == 1
+
+        assert cache.versioned_key("events", "public:list:abc") == "events:v1:public:list:abc"
+        assert fake_redis.get(NAMESPACE_VERSION_PREFIX + "events") == "1"
+
+    def test_namespace_version_defaults_to_zero_on_error(self):
+        client = MagicMock()
+        client.get.side_effect = Exception("connection refused")
+        cache = InstrumentedCacheService(client=client)
+
+        assert cache.namespace_version("blog") == 0
+
+    def test_set_with_tags_registers_key(self):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [True, 1, True]
+        cache = InstrumentedCacheService(client=client)
+
+        assert cache.set("k", {"v": 1}, expiration=60, tags=["event:1"]) is True
+
+        pipe.setex.assert_called_once_with("k", 60, json.dumps({"v": 1}))
+        pipe.sadd.assert_called_once_with(TAG_KEY_PREFIX + "event:1", "k")
+        pipe.expire.assert_called_once_with(TAG_KEY_PREFIX + "event:1", TAG_SET_TTL)
+
+    def test_set_with_tags_prunes_large_tag_sets(self):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [True, 1, True, 0]
+        prune = client.register_script.return_value
+        cache = InstrumentedCacheService(client=client)
+
+        cache.set("k", {"v": 1}, expiration=60, tags=["event:1", "event:2"])
+        cache.set("k2", {"v": 2}, expiration=60, tags=["event:1"])
+
+        client.register_script.assert_called_once_with(_PRUNE_TAG_SETS_SCRIPT)
+        assert prune.call_args_list[0].kwargs == {
+            "keys": [TAG_KEY_PREFIX + "event:1", TAG_KEY_PREFIX + "event:2"],
+            "args": [TAG_SET_PRUNE_SIZE, TAG_SET_PRUNE_SAMPLE],
+            "client": pipe,
+        }
+
+    def test_invalidate_tags_runs_script_over_tag_sets(self):
+        client = MagicMock()
+        script = MagicMock(return_value=3)
+        client.register_script.return_value = script
+        cache = InstrumentedCacheService(client=client)
+
+        assert cache.invalidate_tags("event:1", "event:2") == 3
+
+        script.assert_called_once_with(
+            keys=[TAG_KEY_PREFIX + "event:1", TAG_KEY_PREFIX + "event:2"]
+        )
+        client.scan_iter.assert_not_called()
+
+    def test_get_or_compute_derives_tags_from_value(self):
+        client = MagicMock()
+        client.get.return_value = None
+        client.pipeline.return_value.execute.return_value = [True]
+        cache = InstrumentedCacheService(client=client)
+
+        cache.get_or_compute(
+            "page",
+            lambda: {"documents": [{"id": "a"}, {"id": "b"}]},
+            ttl=60,
+            tags=lambda page: [f"event:{doc['id']}" for doc in page["documents"]]
+        )
+
+        tagged = [c.args[0] for c in client.pipeline.return_value.sadd.call_args_list]
+        assert tagged == [TAG_KEY_PREFIX + "event:a", TAG_KEY_PREFIX + "event:b"]
+
+
+def test_jittered_ttl_bounds():
+    for _ in range(100):
+        assert 90 <= jittered_ttl(100, 0.1) <= 110
+    assert jittered_ttl(100, 0) == 100
+    assert jittered_ttl(1, 0.5) >= 1
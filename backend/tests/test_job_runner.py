@@ -0,0 +1,223 @@
+"""
+Unit Tests for the Job Runner
+
+Tests the Redis-backed job runner including:
+- Schedules (intervals, daily times) and the first due time
+- One enqueue per occurrence across processes, with missed runs coalesced
+- Priorities, and runs of one job never overlapping
+- Retries with backoff, failed runs and lapsed leases
+- Registration of the existing periodic jobs
+
+Runs against fakeredis[lua], so the enqueue and pop scripts are exercised
+as Redis runs them.
+"""
+
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.services.job_runner import (
+    FAILED_KEY,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    READY_KEY_PREFIX,
+    RUN_KEY_PREFIX,
+    RUNNING_KEY_PREFIX,
+    SCHEDULE_KEY,
+    STATUS_FAILED,
+    STATUS_RETRYING,
+    STATUS_SUCCEEDED,
+    JobRunner,
+    JobRunnerError,
+)
+
+
+@pytest.fixture
+def redis_client(lua_redis_client):
+    return lua_redis_client
+
+
+@pytest.fixture
+def runner(redis_client):
+    return JobRunner(redis_client)
+
+
+def make_due(redis_client, name, seconds_ago=1):
+    redis_client.zadd(SCHEDULE_KEY, {name: float(int(time.time()) - seconds_ago)})
+
+
+class TestSchedules:
+    """Test job registration and due times"""
+
+    def test_interval_job_first_due_one_interval_out(self, runner, redis_client):
+        runner.register("job", MagicMock(), interval=300)
+
+        assert 299 <= redis_client.zscore(SCHEDULE_KEY, "job") - time.time() <= 300
+
+    def test_daily_job_due_at_next_time(self, runner):
+        job = runner.register("job", MagicMock(), daily_at="02:00")
+        after = datetime(2024, 5, 1, 3, 0, tzinfo=timezone.utc).timestamp()
+
+        assert job.next_due(after) == datetime(2024, 5, 2, 2, 0, tzinfo=timezone.utc).timestamp()
+
+    def test_reregistering_keeps_earlier_schedule(self, runner, redis_client):
+        runner.register("job", MagicMock(), interval=300)
+        due = redis_client.zscore(SCHEDULE_KEY, "job")
+
+        runner.register("job", MagicMock(), interval=3600)
+
+        assert redis_client.zscore(SCHEDULE_KEY, "job") == due
+
+    @pytest.mark.parametrize("kwargs", [{}, {"interval": 60, "daily_at": "02:00"}, {"daily_at": "25:00"}, {"interval": 0}])
+    def test_invalid_schedule(self, runner, kwargs):
+        with pytest.raises(JobRunnerError):
+            runner.register("job", MagicMock(), **kwargs)
+
+
+class TestScheduling:
+    """Test enqueueing due runs"""
+
+    def test_due_job_enqueued_once_across_processes(self, runner, redis_client):
+        other = JobRunner(redis_client)
+        for process in (runner, other):
+            process.register("job", MagicMock(), interval=300)
+        make_due(redis_client, "job")
+
+        assert runner.tick() == 1
+        assert other.tick() == 0
+        assert redis_client.zcard(READY_KEY_PREFIX + "job") == 1
+
+    def test_missed_runs_coalesced(self, runner, redis_client):
+        runner.register("job", MagicMock(), interval=300)
+        make_due(redis_client, "job", seconds_ago=3000)
+
+        assert runner.tick() == 1
+        assert runner.tick() == 0
+        assert redis_client.zscore(SCHEDULE_KEY, "job") > time.time()
+
+    def test_one_waiting_run_per_job(self, runner, redis_client):
+        runner.register("job", MagicMock(), interval=300)
+        make_due(redis_client, "job")
+        runner.tick()
+        make_due(redis_client, "job")
+
+        assert runner.tick() == 0
+        assert runner.trigger("job") is False
+        assert redis_client.zcard(READY_KEY_PREFIX + "job") == 1
+
+    def test_jobs_of_other_processes_left_alone(self, runner, redis_client):
+        redis_client.zadd(SCHEDULE_KEY, {"elsewhere": 0.0})
+
+        assert runner.tick() == 0
+        assert redis_client.zscore(SCHEDULE_KEY, "elsewhere") == 0.0
+
+    def test_trigger_unknown_job(self, runner):
+        with pytest.raises(JobRunnerError):
+            runner.trigger("missing")
+
+
+class TestWorkers:
+    """Test running queued runs"""
+
+    def test_runs_job_and_records_success(self, runner, redis_client):
+        func = MagicMock()
+        runner.register("job", func, interval=300)
+        runner.trigger("job")
+
+        assert runner.run_next() == STATUS_SUCCEEDED
+        func.assert_called_once_with()
+        assert runner.run_next() is None
+        run = redis_client.hgetall(redis_client.keys(RUN_KEY_PREFIX + "*")[0])
+        assert run["status"] == STATUS_SUCCEEDED and run["attempts"] == "1"
+
+    def test_runs_async_job(self, runner):
+        calls = []
+
+        async def job():
+            calls.append(True)
+
+        runner.register("job", job, interval=300)
+        runner.trigger("job")
+
+        assert runner.run_next() == STATUS_SUCCEEDED
+        assert calls == [True]
+
+    def test_higher_priority_runs_first(self, runner):
+        order = []
+        runner.register("low", lambda: order.append("low"), interval=300, priority=PRIORITY_LOW)
+        runner.register("high", lambda: order.append("high"), interval=300, priority=PRIORITY_HIGH)
+        runner.trigger("low")
+        runner.trigger("high")
+
+        runner.run_next()
+        runner.run_next()
+
+        assert order == ["high", "low"]
+
+    def test_job_never_runs_twice_at_once(self, runner, redis_client):
+        runner.register("job", MagicMock(), interval=300)
+        redis_client.zadd(RUNNING_KEY_PREFIX + "job", {"other-run": time.time() + 60})
+        runner.trigger("job")
+
+        assert runner.run_next() is None
+
+    def test_failure_retried_with_backoff_then_failed(self, runner, redis_client):
+        func = MagicMock(side_effect=RuntimeError("boom"))
+        runner.register("job", func, interval=300, max_attempts=2, retry_delay=60)
+        runner.trigger("job")
+
+        assert runner.run_next() == STATUS_RETRYING
+        assert runner.run_next() is None
+        assert runner.run_next(now=time.time() + 61) == STATUS_FAILED
+
+        run_id = redis_client.lindex(FAILED_KEY, 0)
+        assert redis_client.hget(RUN_KEY_PREFIX + run_id, "error") == "boom"
+        assert func.call_count == 2
+
+    def test_lapsed_lease_retried(self, runner, redis_client):
+        func = MagicMock()
+        runner.register("job", func, interval=300)
+        runner.trigger("job")
+        runner._pop(keys=[READY_KEY_PREFIX + "job", "jobs:delayed:job", RUNNING_KEY_PREFIX + "job"],
+                    args=[time.time(), runner.lease_seconds, PRIORITY_LOW])  # Worker crashes
+
+        assert runner.run_next() is None
+        assert runner.run_next(now=time.time() + runner.lease_seconds + 1) == STATUS_SUCCEEDED
+        func.assert_called_once_with()
+
+
+class TestJobRegistration:
+    """Test the existing periodic jobs registering on the runner"""
+
+    def test_session_jobs(self):
+        with patch("backend.services.session_scheduler.get_training_session_service"), \
+             patch("backend.services.session_scheduler.get_cloudflare_calls_service"), \
+             patch("backend.services.session_scheduler.get_email_service"), \
+             patch("backend.services.session_scheduler.get_zerodb_client"):
+            from backend.services.session_scheduler import SessionScheduler
+
+            runner = MagicMock()
+            SessionScheduler(runner=runner).register_jobs()
+
+        jobs = {call.args[0]: call.kwargs for call in runner.register.call_args_list}
+        assert set(jobs) == {"create_rooms", "send_reminders", "auto_end_sessions", "cleanup_sessions"}
+        assert jobs["cleanup_sessions"]["daily_at"] == "02:00"
+
+    def test_all_jobs(self, runner):
+        with patch("backend.scripts.job_runner.get_session_scheduler") as session_scheduler, \
+             patch("backend.scripts.job_runner.get_newsletter_sync_job") as newsletter_sync, \
+             patch("backend.scripts.job_runner.get_indexing_service"), \
+             patch("backend.scripts.job_runner.GDPRService") as gdpr_service:
+            from backend.scripts.job_runner import register_all_jobs
+
+            register_all_jobs(runner)
+
+        session_scheduler.return_value.register_jobs.assert_called_once_with(runner)
+        newsletter_sync.return_value.register_jobs.assert_called_once_with(runner)
+        gdpr_service.return_value.register_jobs.assert_called_once_with(runner)
+        assert {
+            "dunning_reminders", "incremental_indexing", "analytics_aggregates_reconciler",
+            "search_index_rebuild", "search_index_snapshot"
+        } <= set(runner.jobs)
@@ -26,6 +26,7 @@ from backend.services.membership_webhook_handler import MembershipWebhookHandler
 from backend.services.subscription_service import SubscriptionService
 from backend.services.user_service import UserService
 from backend.services.newsletter_sync_job import NewsletterSyncJob
+from backend.services.beehiiv_sync_engine import SyncChange, SyncResult
 from backend.models.schemas import (
     SubscriptionTier,
     SubscriptionStatus,
@@ -491,9 +492,10 @@ class TestNewsletterSyncJob:
     """Test NewsletterSyncJob functionality"""
 
     async def test_run_sync_processes_active_members(self, mock_zerodb):
-        """Test that sync job processes all active members"""
+        """Test that sync job diffs active members and reports applied changes"""
         # Setup
-        job = NewsletterSyncJob(zerodb_client=mock_zerodb)
+        mock_engine = MagicMock()
+        job = NewsletterSyncJob(zerodb_client=mock_zerodb, sync_engine=mock_engine)
 
         active_member_1 = {
             "id": str(uuid4()),
@@ -513,6 +515,7 @@ class TestNewsletterSyncJob:
 
         mock_zerodb.query_documents.side_effect = [
             {"documents": [active_member_1, active_member_2]},  # Active subscriptions
+            {"documents": []},  # Newsletter preferences
             {"documents": []}  # Canceled subscriptions
         ]
 
@@ -523,21 +526,71 @@ class TestNewsletterSyncJob:
 
         mock_zerodb.create_document.return_value = {"id": str(uuid4()), "data": {}}
 
-        with patch.object(job.newsletter_service, 'auto_subscribe_member', new_callable=AsyncMock) as mock_subscribe:
-            mock_subscribe.return_value = {"subscribed_lists": ["members_only"]}
+        mock_engine.sync = AsyncMock(return_value=SyncResult(
+            run_id="run-1",
+            resumed=False,
+            unchanged=1,
+            applied=[SyncChange("subscribe", "member2@example.com", ["instructors", "members_only"])],
+            failed=[]
+        ))
 
-            # Execute
-            result = await job.run_sync()
+        # Execute
+        result = await job.run_sync()
 
         # Assert
         assert result["success"] == True
         assert result["members_processed"] == 2
-        assert mock_subscribe.call_count == 2
+        assert result["members_synced"] == 1
+        assert result["members_unchanged"] == 1
+        assert result["instructors_synced"] == 1
+
+        name, desired, managed_lists = mock_engine.sync.call_args.args
+        assert desired["member1@example.com"].lists == {"members_only"}
+        assert desired["member2@example.com"].lists == {"members_only", "instructors"}
+        assert managed_lists == {"members_only", "instructors"}
+
+    async def test_run_sync_respects_unsubscribes_and_removes_canceled(self, mock_zerodb):
+        """Test that unsubscribed lists are left out and canceled members get no member lists"""
+        # Setup
+        mock_engine = MagicMock()
+        job = NewsletterSyncJob(zerodb_client=mock_zerodb, sync_engine=mock_engine)
+        user_id = str(uuid4())
+        canceled_user_id = str(uuid4())
+
+        mock_zerodb.query_documents.side_effect = [
+            {"documents": [{"id": "sub-1", "user_id": user_id, "tier": "lifetime"}]},
+            {"documents": [{"user_id": user_id, "unsubscribed_lists": ["instructors"]}]},
+            {"documents": [{"user_id": canceled_user_id}]}
+        ]
+        mock_zerodb.get_document.side_effect = [
+            {"data": {"email": "active@example.com", "is_active": True}},
+            {"data": {"email": "Canceled@example.com"}}
+        ]
+
+        mock_engine.sync = AsyncMock(return_value=SyncResult(
+            run_id="run-1",
+            resumed=True,
+            unchanged=1,
+            applied=[SyncChange("update", "canceled@example.com", ["general"])],
+            failed=[]
+        ))
+
+        # Execute
+        result = await job.run_sync()
+
+        # Assert
+        desired = mock_engine.sync.call_args.args[1]
+        assert desired["active@example.com"].lists == {"members_only"}
+        assert desired["canceled@example.com"].lists == set()
+        assert result["canceled_members_removed"] == 1
+        assert result["members_synced"] == 0
+        assert result["resumed"] is True
 
     async def test_run_sync_handles_errors_gracefully(self, mock_zerodb):
         """Test that sync job handles errors gracefully"""
         # Setup
-        job = NewsletterSyncJob(zerodb_client=mock_zerodb)
+        mock_engine = MagicMock()
+        job = NewsletterSyncJob(zerodb_client=mock_zerodb, sync_engine=mock_engine)
 
         active_member = {
             "id": str(uuid4()),
@@ -549,6 +602,7 @@ class TestNewsletterSyncJob:
 
         mock_zerodb.query_documents.side_effect = [
             {"documents": [active_member]},
+            {"documents": []},
             {"documents": []}
         ]
 
@@ -558,16 +612,23 @@ class TestNewsletterSyncJob:
 
         mock_zerodb.create_document.return_value = {"id": str(uuid4()), "data": {}}
 
-        with patch.object(job.newsletter_service, 'auto_subscribe_member', new_callable=AsyncMock) as mock_subscribe:
-            mock_subscribe.side_effect = Exception("BeeHiiv API error")
+        change = SyncChange("subscribe", "error@example.com", ["members_only"], ref=active_member["user_id"])
+        mock_engine.sync = AsyncMock(return_value=SyncResult(
+            run_id="run-1",
+            resumed=False,
+            unchanged=0,
+            applied=[],
+            failed=[(change, "BeeHiiv API error")]
+        ))
 
-            # Execute
-            result = await job.run_sync()
+        # Execute
+        result = await job.run_sync()
 
         # Assert
         assert result["success"] == True  # Job completes despite errors
         assert len(result["errors"]) == 1
         assert "BeeHiiv API error" in result["errors"][0]["error"]
+        assert result["errors"][0]["member_id"] == active_member["user_id"]
 
 
 # ============================================================================
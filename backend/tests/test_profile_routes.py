@@ -174,6 +174,30 @@ def test_update_profile_success(auth_client, mock_db_client, mock_user, mock_aut
     assert mock_db_client.update_document.called
 
 
+@pytest.mark.asyncio
+async def test_update_profile_reindexes_user(mock_db_client, mock_user):
+    """Test a profile update refreshes the user in admin search"""
+    from backend.models.request_schemas import ProfileUpdateRequest
+    from backend.routes.profile import update_user_profile
+
+    mock_db_client.update_document.return_value = {"success": True}
+    mock_db_client.get_document.side_effect = [
+        {"data": {"id": mock_user["id"], "email": mock_user["email"], "first_name": "Jane", "role": "member"}},
+        {"data": {"first_name": "Jane", "last_name": "Smith"}},
+    ]
+
+    with patch("backend.routes.profile.record_person") as record_person:
+        await update_user_profile(
+            ProfileUpdateRequest(first_name="Jane", last_name="Smith"),
+            current_user=mock_user
+        )
+
+    user_id, user, profile = record_person.call_args.args
+    assert user_id == mock_user["id"]
+    assert user["email"] == mock_user["email"]
+    assert profile == {"first_name": "Jane", "last_name": "Smith"}
+
+
 def test_update_profile_with_emergency_contact(auth_client, mock_db_client, mock_user, mock_auth_token):
     """Test profile update with emergency contact"""
     update_data = {
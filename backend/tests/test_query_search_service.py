@@ -181,6 +181,21 @@ class TestCaching:
         assert result["cached"] is True
         assert result["answer"] == "Cached answer"
 
+    def test_shared_result_not_modified(self, search_service):
+        """Test a single-flight hit does not change the leader's response"""
+        shared = {"answer": "Shared answer", "latency_ms": 100, "cached": False}
+
+        with patch.object(search_service.cache, "get_or_compute", return_value=shared):
+            result = search_service.search_query(
+                query="test query",
+                user_id=None,
+                ip_address="127.0.0.1"
+            )
+
+        assert result["cached"] is True
+        assert result is not shared
+        assert shared == {"answer": "Shared answer", "latency_ms": 100, "cached": False}
+
     def test_cache_miss_proceeds_with_search(self, search_service, mock_redis_client):
         """Test cache miss continues with full search"""
         mock_redis_client.get.return_value = None
@@ -0,0 +1,227 @@
+"""
+Unit Tests for the Bulk Restore Engine
+
+Tests concurrent, resumable restores including:
+- Idempotent upserts by original ID with one existence lookup per batch
+- Checkpointing completed batches and resuming an interrupted restore
+- Keeping failed batches out of the checkpoint so a re-run retries them
+- Throughput and ETA reporting
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from backend.services.restore_engine import (
+    RestoreCheckpoint,
+    RestoreEngine,
+    RestoreProgress,
+    format_progress,
+    iter_batches,
+)
+
+
+def documents(count):
+    return [{"id": f"doc_{i}", "name": f"Document {i}"} for i in range(count)]
+
+
+@pytest.fixture
+def mock_client():
+    """ZeroDB client mock where no documents exist yet"""
+    client = Mock()
+    client.query_documents.return_value = {"documents": []}
+    client.create_document.return_value = {"id": "created"}
+    client.update_document.return_value = {"id": "updated"}
+    return client
+
+
+@pytest.fixture
+def engine(mock_client, tmp_path):
+    """Engine with small batches and no retry delay"""
+    return RestoreEngine(mock_client, tmp_path, workers=4, batch_size=10, retry_delay=0)
+
+
+class TestRestore:
+    """Test restoring documents"""
+
+    def test_creates_missing_and_updates_existing(self, engine, mock_client):
+        mock_client.query_documents.side_effect = lambda collection, filters, limit: {
+            "documents": [{"id": doc_id} for doc_id in filters["id"]["$in"] if doc_id.endswith("0")]
+        }
+
+        result = engine.restore("users", "backup_1", documents(25), total=25, merge=True)
+
+        assert result["status"] == "completed"
+        assert result["document_count"] == 25
+        assert result["updated"] == 3  # doc_0, doc_10, doc_20
+        assert result["created"] == 22
+        assert mock_client.query_documents.call_count == 3  # One lookup per batch
+        mock_client.create_document.assert_any_call(
+            collection="users", data={"id": "doc_1", "name": "Document 1"}, document_id="doc_1"
+        )
+        assert all(c.kwargs["merge"] is True for c in mock_client.update_document.call_args_list)
+
+    def test_consumes_documents_lazily(self, engine):
+        consumed = []
+
+        def stream():
+            for doc in documents(100):
+                consumed.append(doc["id"])
+                yield doc
+
+        result = engine.restore("users", "backup_1", stream())
+
+        assert result["created"] == 100
+        assert len(consumed) == 100
+
+    def test_writes_batches_concurrently(self, engine, mock_client):
+        active = []
+        peak = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create_document(**kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            if kwargs["document_id"] in ("doc_0", "doc_10"):
+                barrier.wait()  # Deadlocks unless two batches run at once
+            with lock:
+                active.pop()
+
+        mock_client.create_document.side_effect = create_document
+
+        result = engine.restore("users", "backup_1", documents(20))
+
+        assert result["created"] == 20
+        assert max(peak) >= 2
+
+    def test_document_without_id_counts_as_error(self, engine, mock_client):
+        result = engine.restore("users", "backup_1", [{"name": "no id"}, {"id": "doc_1"}])
+
+        assert result["errors"] == 1
+        assert result["created"] == 1
+        mock_client.create_document.assert_called_once()
+
+    def test_transient_write_failures_are_retried(self, engine, mock_client):
+        mock_client.create_document.side_effect = [Exception("timeout"), {"id": "created"}]
+
+        result = engine.restore("users", "backup_1", documents(1))
+
+        assert result["created"] == 1
+        assert result["errors"] == 0
+        assert mock_client.create_document.call_count == 2
+
+
+class TestCheckpoint:
+    """Test resuming interrupted restores"""
+
+    def test_checkpoint_removed_after_clean_restore(self, engine, tmp_path):
+        engine.restore("users", "backup_1", documents(25))
+
+        assert not engine.checkpoint_path("users", "backup_1").exists()
+
+    def test_interrupted_restore_resumes(self, engine, mock_client):
+        def interrupted():
+            yield from documents(20)
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            engine.restore("users", "backup_1", interrupted())
+
+        # The two batches read before the failure were checkpointed
+        assert engine.checkpoint_path("users", "backup_1").exists()
+        mock_client.create_document.reset_mock()
+
+        result = engine.restore("users", "backup_1", documents(25), total=25)
+
+        assert result["resumed"] is True
+        assert result["skipped"] == 20
+        assert result["created"] == 5
+        assert result["document_count"] == 25
+        assert {c.kwargs["document_id"] for c in mock_client.create_document.call_args_list} == {
+            f"doc_{i}" for i in range(20, 25)
+        }
+
+    def test_failed_batch_retried_on_next_run(self, engine, mock_client):
+        def create_document(**kwargs):
+            if kwargs["document_id"] == "doc_15":
+                raise Exception("write rejected")
+            return {"id": kwargs["document_id"]}
+
+        mock_client.create_document.side_effect = create_document
+
+        first = engine.restore("users", "backup_1", documents(30))
+
+        assert first["status"] == "completed_with_errors"
+        assert first["errors"] == 1
+        assert "doc_15" in first["error_details"][0]
+
+        mock_client.create_document.side_effect = None
+        mock_client.create_document.reset_mock()
+
+        second = engine.restore("users", "backup_1", documents(30))
+
+        assert second["status"] == "completed"
+        assert second["skipped"] == 20
+        assert mock_client.create_document.call_count == 10  # Only batch 1 again
+
+    def test_resume_false_starts_over(self, engine, mock_client):
+        checkpoint = RestoreCheckpoint(engine.checkpoint_path("users", "backup_1"), 10)
+        checkpoint.completed_through = 1
+        checkpoint.documents = 20
+        checkpoint.save()
+
+        result = engine.restore("users", "backup_1", documents(25), resume=False)
+
+        assert result["skipped"] == 0
+        assert result["created"] == 25
+
+    def test_watermark_compacts_completed_batches(self, tmp_path):
+        checkpoint = RestoreCheckpoint(tmp_path / "c.json", 10)
+        for number in (0, 2, 1, 4):
+            checkpoint.completed.add(number)
+            checkpoint.mark_done(Mock(number=number, size=10, created=10, updated=0))
+
+        assert checkpoint.completed_through == 2
+        assert checkpoint.completed == {4}
+        assert checkpoint.is_done(1) and checkpoint.is_done(4) and not checkpoint.is_done(3)
+
+        checkpoint.save()
+        reloaded = RestoreCheckpoint(tmp_path / "c.json", 50)
+        assert reloaded.batch_size == 10  # Batch numbering of the original run
+        assert reloaded.documents == 40
+        assert reloaded.resumed is True
+
+
+class TestProgress:
+    """Test throughput and ETA reporting"""
+
+    def test_progress_reported_per_batch(self, mock_client, tmp_path):
+        updates = []
+        engine = RestoreEngine(mock_client, tmp_path, workers=1, batch_size=10, on_progress=updates.append)
+
+        result = engine.restore("users", "backup_1", documents(30), total=30)
+
+        assert [update.processed for update in updates] == [10, 20, 30]
+        assert updates[-1].eta_seconds == 0
+        assert result["documents_per_second"] > 0
+
+    def test_format_progress(self):
+        line = format_progress(RestoreProgress("users", 500, 1000, 5.0, 100.0, 5.0))
+
+        assert line == "Restoring 'users': 500/1,000 (50%) documents, 100 docs/s, ETA 5s"
+
+
+def test_iter_batches_numbers_in_order():
+    batches = list(iter_batches(range(7), 3))
+
+    assert batches == [(0, [0, 1, 2]), (1, [3, 4, 5]), (2, [6])]
+
+
+def test_invalid_arguments(mock_client, tmp_path):
+    with pytest.raises(ValueError):
+        RestoreEngine(mock_client, tmp_path, workers=0)
+    with pytest.raises(ValueError):
+        RestoreEngine(mock_client, tmp_path, batch_size=0)
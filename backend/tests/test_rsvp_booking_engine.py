@@ -0,0 +1,408 @@
+"""
+Unit Tests for the RSVP Booking Engine
+
+Tests contention-safe RSVP booking including:
+- Concurrent reservations never exceeding capacity
+- Duplicate prevention, release and waitlist promotion
+- Waitlist ordering, atomic bulk promotion and seat holds
+- Loading state from ZeroDB
+- Write-behind persistence and attendee count sync
+- Guarded reconciliation
+- Fallback to direct ZeroDB booking when Redis is unavailable
+
+The booking scripts run in an in-memory Redis with Lua (fakeredis[lua]).
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from backend.services.rsvp_booking_engine import (
+    DUPLICATE,
+    FULL,
+    MODE_FORCE,
+    MODE_PROMOTE,
+    NOT_FOUND,
+    NOT_WAITLISTED,
+    PENDING_KEY,
+    RELEASED,
+    RESERVED,
+    RSVPBookingEngine,
+    RSVPBookingError,
+    Reservation,
+    STREAM_KEY,
+    waitlist_score,
+)
+
+
+EVENT_ID = "event-1"
+
+
+def rsvp(user_id, status="confirmed", rsvp_id=None):
+    return {
+        "id": rsvp_id or f"rsvp-{user_id}",
+        "event_id": EVENT_ID,
+        "user_id": user_id,
+        "status": status,
+        "created_at": "2025-01-01T00:00:00",
+    }
+
+
+def stream(redis_client):
+    """Write-behind entries not yet flushed"""
+    return [fields for _, fields in redis_client.xrange(STREAM_KEY)]
+
+
+@pytest.fixture
+def redis_client(lua_redis_client):
+    """Redis running the real booking scripts"""
+    return lua_redis_client
+
+
+@pytest.fixture
+def db():
+    client = MagicMock()
+    client.query_documents.return_value = {"documents": []}
+    client.get_document.return_value = {"data": {"id": EVENT_ID, "max_attendees": 3, "current_attendees": 0}}
+    return client
+
+
+@pytest.fixture
+def engine(redis_client, db):
+    with patch("backend.services.rsvp_booking_engine.get_cache_service"):
+        yield RSVPBookingEngine(redis_client=redis_client, db_client=db)
+
+
+def event(max_attendees):
+    return {"id": EVENT_ID, "max_attendees": max_attendees}
+
+
+class TestReservations:
+    """Test atomic seat reservations"""
+
+    def test_concurrent_bookings_never_exceed_capacity(self, engine):
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            reservations = list(pool.map(
+                lambda i: engine.reserve(EVENT_ID, f"user-{i}", rsvp(f"user-{i}"), event=event(50)),
+                range(500)
+            ))
+
+        outcomes = [reservation.outcome for reservation in reservations]
+        assert outcomes.count(RESERVED) == 50
+        assert outcomes.count(FULL) == 450
+        assert engine.availability(EVENT_ID) == (50, 50)
+
+    def test_duplicate_rejected(self, engine):
+        first = engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+        second = engine.reserve(EVENT_ID, "user-1", rsvp("user-1", rsvp_id="other"), event=event(10))
+
+        assert first == Reservation(RESERVED, "rsvp-user-1", "confirmed", 1)
+        assert second == Reservation(DUPLICATE, "rsvp-user-1", "confirmed", 1)
+
+    def test_paid_booking_skips_capacity_check(self, engine):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(1))
+
+        paid = engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(1), mode=MODE_FORCE)
+
+        assert paid.outcome == RESERVED
+        assert paid.booked == 2
+
+    def test_state_loaded_from_zerodb(self, engine, db):
+        db.query_documents.return_value = {"documents": [
+            {"data": rsvp("a")},
+            {"data": rsvp("b")},
+            {"data": rsvp("c", status="canceled")},
+            {"data": rsvp("d", status="waitlist")},
+        ]}
+
+        assert engine.reserve(EVENT_ID, "c", rsvp("c", rsvp_id="new"), event=event(3)).outcome == RESERVED
+        assert engine.reserve(EVENT_ID, "e", rsvp("e"), event=event(3)).outcome == FULL
+        assert engine.lookup(EVENT_ID, "d") == {"has_rsvp": True, "rsvp_id": "rsvp-d", "status": "waitlist"}
+        db.query_documents.assert_called_once()
+
+    def test_release_frees_seat(self, engine):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(1))
+
+        assert engine.release(EVENT_ID, "user-1", "other-rsvp", {"status": "canceled"}) == NOT_FOUND
+        assert engine.release(EVENT_ID, "user-1", "rsvp-user-1", {"status": "canceled"}) == RELEASED
+        assert engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(1)).outcome == RESERVED
+
+    def test_promote_waitlisted(self, engine):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1", status="waitlist"), event=event(1))
+
+        promoted = engine.reserve(EVENT_ID, "user-1", {"status": "confirmed"}, event=event(1), mode=MODE_PROMOTE)
+        again = engine.reserve(EVENT_ID, "user-1", {"status": "confirmed"}, event=event(1), mode=MODE_PROMOTE)
+
+        assert promoted == Reservation(RESERVED, "rsvp-user-1", "confirmed", 1)
+        assert again.outcome == NOT_WAITLISTED
+
+    def test_redis_unavailable(self, db):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+        engine = RSVPBookingEngine(redis_client=client, db_client=db)
+
+        with pytest.raises(RSVPBookingError):
+            engine.reserve(EVENT_ID, "user-1", rsvp("user-1"))
+        with pytest.raises(RSVPBookingError):
+            engine.reserve(EVENT_ID, "user-1", rsvp("user-1"))
+
+        assert client.register_script.return_value.call_count == 1  # Redis bypassed after the error
+
+
+class TestWaitlist:
+    """Test the waitlist queue and seat holds"""
+
+    def waitlist(self, engine, user_id, priority=0):
+        time.sleep(0.002)  # Distinct join times
+        return engine.reserve(EVENT_ID, user_id, rsvp(user_id, status="waitlist"), event=event(1), priority=priority)
+
+    def test_served_by_priority_then_join_time(self, engine):
+        engine.reserve(EVENT_ID, "booked", rsvp("booked"), event=event(1))
+        for user_id, priority in [("a", 0), ("b", 1), ("c", 0)]:
+            self.waitlist(engine, user_id, priority)
+
+        assert [engine.waitlist_position(EVENT_ID, user_id) for user_id in "abc"] == [2, 1, 3]
+        assert engine.waitlist_position(EVENT_ID, "booked") is None
+
+        engine.release(EVENT_ID, "booked", "rsvp-booked", {"status": "canceled"})
+        assert engine.promote_next(EVENT_ID) == [("b", "rsvp-b")]
+        assert engine.waitlist_position(EVENT_ID, "a") == 1
+
+    def test_score_orders_priority_before_join_time(self):
+        assert waitlist_score(1, joined_at=2e9) < waitlist_score(0, joined_at=1e9) < waitlist_score(0, joined_at=1e9 + 1)
+
+    def test_bulk_promotion_fills_new_seats(self, engine, redis_client):
+        engine.reserve(EVENT_ID, "booked", rsvp("booked"), event=event(1))
+        for user_id in "abc":
+            self.waitlist(engine, user_id)
+
+        promoted = engine.promote_next(EVENT_ID, count=10, update={"status": "confirmed"}, event=event(3))
+
+        assert promoted == [("a", "rsvp-a"), ("b", "rsvp-b")]
+        assert engine.availability(EVENT_ID) == (3, 3)
+        assert engine.waitlist_position(EVENT_ID, "c") == 1
+        assert stream(redis_client)[-1] == {
+            "op": "update", "event_id": EVENT_ID, "id": "rsvp-b", "data": json.dumps({"status": "confirmed"})
+        }
+
+    def test_concurrent_promotions_hand_out_each_seat_once(self, engine):
+        engine.reserve(EVENT_ID, "booked", rsvp("booked"), event=event(1))
+        for i in range(20):
+            engine.reserve(EVENT_ID, f"user-{i}", rsvp(f"user-{i}", status="waitlist"), event=event(1))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            batches = list(pool.map(lambda _: engine.promote_next(EVENT_ID, event=event(6)), range(20)))
+
+        promoted = [user_id for batch in batches for user_id, _ in batch]
+        assert len(promoted) == len(set(promoted)) == 5
+        assert engine.availability(EVENT_ID) == (6, 6)
+
+    def test_admin_promotion_overrides_capacity(self, engine):
+        engine.reserve(EVENT_ID, "booked", rsvp("booked"), event=event(1))
+        self.waitlist(engine, "a")
+
+        assert engine.promote_next(EVENT_ID) == []
+        assert engine.promote_next(EVENT_ID, ignore_capacity=True) == [("a", "rsvp-a")]
+        assert engine.availability(EVENT_ID) == (2, 1)
+
+    def test_hold_takes_seat_until_it_lapses(self, engine, redis_client):
+        held = engine.hold(EVENT_ID, "user-1", time.time() + 60, event=event(1))
+
+        assert held == Reservation(RESERVED, "", "pending", 1)
+        assert engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(1)).outcome == FULL
+        assert engine.hold(EVENT_ID, "user-1", time.time() + 120).outcome == RESERVED  # Extended
+        assert stream(redis_client) == []  # Checkout holds are not persisted
+
+        redis_client.zadd(f"rsvp:event:{EVENT_ID}:holds", {"user-1": time.time() - 1})
+        assert engine.expire_holds(EVENT_ID) == 1
+        assert engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(1)).outcome == RESERVED
+
+    def test_payment_converts_hold_without_taking_second_seat(self, engine, redis_client):
+        engine.hold(EVENT_ID, "user-1", time.time() + 60, event=event(1))
+
+        paid = engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), mode=MODE_FORCE)
+
+        assert paid == Reservation(RESERVED, "rsvp-user-1", "confirmed", 1)
+        assert stream(redis_client)[-1]["op"] == "create"
+        assert redis_client.zcard(f"rsvp:event:{EVENT_ID}:holds") == 0
+
+    def test_unpaid_waitlist_promotion_lapses_to_declined(self, engine, redis_client):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1", status="waitlist"), event=event(1))
+
+        assert engine.promote_next(EVENT_ID, hold_until=time.time() - 1) == [("user-1", "rsvp-user-1")]
+        assert engine.expire_holds(EVENT_ID) == 1
+
+        assert engine.availability(EVENT_ID) == (0, 1)
+        entry = stream(redis_client)[-1]
+        assert entry["id"] == "rsvp-user-1"
+        assert json.loads(entry["data"])["status"] == "declined"
+
+    def test_reconcile_keeps_live_holds(self, engine, db):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+        engine.flush("worker-1")
+        engine.hold(EVENT_ID, "user-2", time.time() + 60)
+        db.query_documents.return_value = {"documents": [{"data": rsvp("user-1")}]}
+        db.get_document.return_value = {"data": {"max_attendees": 10, "current_attendees": 1}}
+
+        assert engine.reconcile(EVENT_ID) is True
+        assert engine.availability(EVENT_ID) == (2, 10)
+        assert engine.lookup(EVENT_ID, "user-2")["status"] == "pending"
+
+
+class TestPersistence:
+    """Test write-behind persistence and reconciliation"""
+
+    def test_flush_persists_and_syncs_count(self, engine, db, redis_client):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+        engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(10))
+        engine.release(EVENT_ID, "user-1", "rsvp-user-1", {"status": "canceled"})
+
+        assert engine.flush("worker-1") == 3
+
+        assert [c.args[1]["id"] for c in db.create_document.call_args_list] == ["rsvp-user-1", "rsvp-user-2"]
+        db.update_document.assert_any_call("rsvps", "rsvp-user-1", {"status": "canceled"}, merge=True)
+        db.update_document.assert_called_with("events", EVENT_ID, {"current_attendees": 1}, merge=True)
+        assert redis_client.hgetall(PENDING_KEY) == {}
+        assert stream(redis_client) == []
+        assert redis_client.hget(f"rsvp:event:{EVENT_ID}", "unflushed") == "0"
+
+    def test_failed_insert_holds_back_update(self, engine, db, redis_client):
+        db.create_document.side_effect = Exception("ZeroDB down")
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+        engine.release(EVENT_ID, "user-1", "rsvp-user-1", {"status": "canceled"})
+
+        assert engine.flush("worker-1") == 0
+
+        db.update_document.assert_not_called()
+        assert engine.get_pending("rsvp-user-1")["user_id"] == "user-1"
+
+    def test_reconcile_waits_for_persistence(self, engine, db):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+
+        assert engine.reconcile(EVENT_ID) is False
+
+        engine.flush("worker-1")
+        db.query_documents.return_value = {"documents": [{"data": rsvp("user-1")}, {"data": rsvp("user-2")}]}
+        db.get_document.return_value = {"data": {"max_attendees": 10, "current_attendees": 1}}
+
+        assert engine.reconcile(EVENT_ID) is True
+        assert engine.availability(EVENT_ID) == (2, 10)
+        db.update_document.assert_called_with("events", EVENT_ID, {"current_attendees": 2}, merge=True)
+
+    def test_reconcile_skipped_after_concurrent_booking(self, engine, db):
+        engine.reserve(EVENT_ID, "user-1", rsvp("user-1"), event=event(10))
+        engine.flush("worker-1")
+
+        def book_while_reading(*args, **kwargs):
+            engine.reserve(EVENT_ID, "user-2", rsvp("user-2"), event=event(10))
+            return {"documents": [{"data": rsvp("user-1")}]}
+
+        db.query_documents.side_effect = book_while_reading
+
+        assert engine.reconcile(EVENT_ID) is False
+        assert engine.availability(EVENT_ID) == (2, 10)
+
+
+class TestPaidRSVPWebhook:
+    """Test the paid RSVP webhook on top of the booking engine"""
+
+    @pytest.fixture
+    def webhook(self, engine, db):
+        with patch("backend.services.webhook_service.get_zerodb_client", return_value=db), \
+                patch("backend.services.webhook_service.get_email_service"), \
+                patch("backend.services.webhook_service.get_dunning_service"), \
+                patch("backend.services.webhook_service.get_analytics_aggregates_service"):
+            from backend.services.webhook_service import WebhookService
+            service = WebhookService()
+        rsvp_service = MagicMock(booking=engine)
+        rsvp_service.generate_qr_code.return_value = "qr"
+        with patch("backend.services.rsvp_service.get_rsvp_service", return_value=rsvp_service):
+            yield service
+
+    def test_redelivered_payment_recorded_once(self, webhook, db):
+        db.get_document.side_effect = lambda collection, document_id: {"data": {
+            "id": document_id, "max_attendees": 3, "email": "user@example.com"
+        }}
+        session = {"id": "cs_1", "amount_total": 2500, "metadata": {"event_id": EVENT_ID, "user_id": "user-1"}}
+
+        first = webhook._handle_event_rsvp_payment(session)
+        again = webhook._handle_event_rsvp_payment(session)  # RSVP not flushed to ZeroDB yet
+
+        assert again["message"] == "RSVP already exists"
+        assert again["rsvp_id"] == first["rsvp_id"]
+        payments = [c for c in db.create_document.call_args_list if c.args[:1] == ("payments",)]
+        assert [c.kwargs["document_id"] for c in payments] == [first["payment_id"]]
+        webhook.aggregates.record_payment.assert_called_once()
+
+
+class TestRSVPServiceBooking:
+    """Test RSVPService on top of the booking engine"""
+
+    @pytest.fixture
+    def service(self, db):
+        with patch("backend.services.rsvp_service.get_zerodb_client", return_value=db), \
+                patch("backend.services.rsvp_service.get_stripe_service"), \
+                patch("backend.services.rsvp_service.get_email_service"), \
+                patch("backend.services.rsvp_service.get_cache_service"), \
+                patch("backend.services.rsvp_service.get_rsvp_booking_engine"):
+            from backend.services.rsvp_service import RSVPService
+            service = RSVPService()
+        service.generate_qr_code = MagicMock(return_value="qr")
+        return service
+
+    def test_full_event_rejected_without_zerodb_writes(self, service, db):
+        from backend.services.rsvp_service import EventFullError
+        service.booking.reserve.return_value = Reservation(FULL, None, None, 3)
+
+        with pytest.raises(EventFullError):
+            service.create_free_event_rsvp(EVENT_ID, "user-1", "User", "user@example.com")
+
+        db.create_document.assert_not_called()
+        db.update_document.assert_not_called()
+
+    def test_falls_back_to_direct_booking(self, service, db):
+        service.booking.reserve.side_effect = RSVPBookingError("down")
+        service.booking.lookup.return_value = None
+        service.booking.availability.return_value = None
+
+        result = service.create_free_event_rsvp(EVENT_ID, "user-1", "User", "user@example.com")
+
+        assert result["status"] == "confirmed"
+        db.create_document.assert_called_once()
+        db.update_document.assert_called_once_with("events", EVENT_ID, {"current_attendees": 1}, merge=True)
+
+    def test_checkout_rejected_when_no_seat_can_be_held(self, service, db):
+        from backend.services.rsvp_service import EventFullError
+        db.get_document.return_value = {"data": {"id": EVENT_ID, "registration_fee": 25.0, "max_attendees": 3}}
+        service.booking.hold.return_value = Reservation(FULL, None, None, 3)
+
+        with patch("stripe.checkout.Session.create") as create_session, pytest.raises(EventFullError):
+            service.create_paid_event_checkout(EVENT_ID, "user-1", "user@example.com")
+
+        create_session.assert_not_called()
+
+    def test_promote_waitlist_confirms_free_event(self, service, db):
+        service.booking.promote_next.return_value = [("user-1", "rsvp-1"), ("user-2", "rsvp-2")]
+        service.booking.get_pending.return_value = None
+        db.get_document.side_effect = lambda collection, document_id: {"data": {
+            "id": document_id, "max_attendees": 3, "user_email": f"{document_id}@example.com"
+        }}
+
+        assert service.promote_waitlist(EVENT_ID) == 2
+
+        assert service.booking.promote_next.call_args.kwargs["hold_until"] is None
+        assert service.email_service.send_free_event_rsvp_confirmation.call_count == 2
+
+    def test_promote_waitlist_holds_seats_of_paid_event(self, service, db):
+        service.booking.promote_next.return_value = [("user-1", "rsvp-1")]
+        service.booking.get_pending.return_value = {"id": "rsvp-1", "user_email": "user@example.com"}
+        db.get_document.return_value = {"data": {"id": EVENT_ID, "registration_fee": 25.0, "max_attendees": 3}}
+
+        assert service.promote_waitlist(EVENT_ID, count=1) == 1
+
+        assert service.booking.promote_next.call_args.kwargs["hold_until"] > time.time()
+        service.email_service.send_waitlist_spot_available_paid.assert_called_once()
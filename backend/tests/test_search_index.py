@@ -0,0 +1,248 @@
+"""
+Unit Tests for the Search Index
+
+Tests the in-memory admin search index including:
+- Substring, prefix and exact-token matching with ranking
+- Attribute filters and pagination with exact totals
+- Replacing and removing documents, and compaction
+- Sharing between workers through the Redis snapshot and change stream
+- Rebuilding from ZeroDB, and the list routes reading the index
+"""
+
+from itertools import count
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from backend.routes.admin import members as members_routes
+from backend.services import search_index as search_index_module
+from backend.services.search_index import (
+    PEOPLE_INDEX,
+    RESOURCES_INDEX,
+    IndexEntry,
+    SearchIndex,
+    person_entry,
+    rebuild_search_indexes,
+    resource_entry,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis string and stream commands the index uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.streams = {}
+        self._ids = count(1)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+        return True
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        stream_id = f"{next(self._ids)}-0"
+        self.streams.setdefault(key, []).append((stream_id, dict(fields)))
+        return stream_id
+
+    def xrange(self, key, min="-", max="+", count=None):
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            after = int(min[1:].split("-")[0])
+            entries = [entry for entry in entries if int(entry[0].split("-")[0]) > after]
+        return entries[:count] if count else entries
+
+    def xrevrange(self, key, count=None):
+        entries = list(reversed(self.streams.get(key, [])))
+        return entries[:count] if count else entries
+
+
+def person(user_id, email, first, last, role="member", created_at="2024-01-01T00:00:00", **extra):
+    user = {"email": email, "role": role, "is_active": True, "created_at": created_at, **extra}
+    return person_entry(user_id, user, {"first_name": first, "last_name": last, "disciplines": extra.get("disciplines", [])})
+
+
+@pytest.fixture
+def index():
+    """Ready index without Redis"""
+    index = SearchIndex(PEOPLE_INDEX)
+    index.rebuild([
+        person("u1", "john.smith@example.com", "John", "Smith", created_at="2024-01-01T00:00:00"),
+        person("u2", "jane@example.com", "Jane", "Johnson", role="instructor", created_at="2024-02-01T00:00:00",
+               disciplines=["karate"]),
+        person("u3", "bob@example.com", "Bob", "Jones", created_at="2024-03-01T00:00:00"),
+    ])
+    return index
+
+
+class TestSearch:
+    """Test matching, ranking, filters and pagination"""
+
+    def test_exact_token_ranks_first(self, index):
+        result = index.search("john")
+
+        assert result.ids == ["u1", "u2"]  # "john" exact beats the "johnson" prefix
+        assert result.total == 2
+
+    def test_substring_match(self, index):
+        assert index.search("ohns").ids == ["u2"]
+
+    def test_short_query_uses_prefixes(self, index):
+        assert index.search("jo").ids == ["u3", "u2", "u1"]  # All prefix matches: newest first
+        assert index.search("bo").ids == ["u3"]
+        assert index.search("ob").ids == []  # Short terms match token starts only
+
+    def test_every_term_must_match(self, index):
+        assert index.search("jane johnson").ids == ["u2"]
+        assert index.search("jane smith").ids == []
+
+    def test_case_insensitive(self, index):
+        assert index.search("SMITH").ids == ["u1"]
+
+    def test_no_query_lists_in_sort_order(self, index):
+        result = index.search(None, offset=1, limit=1)
+
+        assert result.ids == ["u2"]  # Newest first
+        assert result.total == 3
+
+    def test_filters(self, index):
+        assert index.search(None, filters={"role": "instructor"}).ids == ["u2"]
+        assert index.search("j", filters={"role": ["member", "admin"]}).total == 2
+        assert index.search(None, filters={"disciplines": "karate"}).ids == ["u2"]
+        assert index.search(None, filters={"role": None}).total == 3
+
+    def test_pagination_total_counts_every_match(self, index):
+        first = index.search("example", offset=0, limit=2)
+        second = index.search("example", offset=2, limit=2)
+
+        assert first.total == second.total == 3
+        assert len(first.ids) == 2 and len(second.ids) == 1
+        assert set(first.ids + second.ids) == {"u1", "u2", "u3"}
+
+    def test_payloads(self, index):
+        payload = index.get("u2")
+
+        assert payload["user"]["email"] == "jane@example.com"
+        assert payload["profile"]["first_name"] == "Jane"
+        assert index.get("missing") is None
+
+
+class TestWrites:
+    """Test replacing and removing documents"""
+
+    def test_upsert_replaces_document(self, index):
+        index.upsert(person("u1", "jon@example.com", "Jonathan", "Smythe"))
+
+        assert index.search("jonathan").ids == ["u1"]
+        assert index.search("smith").ids == []
+        assert len(index) == 3
+
+    def test_remove(self, index):
+        index.remove("u3")
+
+        assert index.search("bob").ids == []
+        assert index.search(None).total == 2
+
+    def test_compaction_drops_dead_entries(self):
+        index = SearchIndex(RESOURCES_INDEX)
+        index.rebuild([])
+        for version in range(1500):
+            index.upsert(IndexEntry("r1", (f"title {version}",), {}, (0,)))
+
+        assert len(index._entries) < 1500
+        assert index.search("title").ids == ["r1"]
+
+
+class TestSharing:
+    """Test the snapshot and change stream shared by workers"""
+
+    def test_worker_loads_snapshot_and_replays_changes(self):
+        client = FakeRedis()
+        first = SearchIndex(PEOPLE_INDEX, redis_client=client)
+        first.rebuild([person("u1", "john@example.com", "John", "Smith")])
+        first.upsert(person("u2", "jane@example.com", "Jane", "Doe"))
+        first.remove("u1")
+
+        second = SearchIndex(PEOPLE_INDEX, redis_client=client)
+        second.sync()
+
+        assert second.ready
+        assert second.search(None).ids == ["u2"]
+
+    def test_workers_see_each_others_changes(self):
+        client = FakeRedis()
+        first = SearchIndex(PEOPLE_INDEX, redis_client=client)
+        first.rebuild([])
+        second = SearchIndex(PEOPLE_INDEX, redis_client=client)
+        second.sync()
+
+        second.upsert(person("u1", "john@example.com", "John", "Smith"))
+        first.sync(force=True)
+
+        assert first.search("john").ids == ["u1"]
+
+    def test_not_ready_without_snapshot(self):
+        index = SearchIndex(PEOPLE_INDEX, redis_client=FakeRedis())
+        index.sync()
+
+        assert not index.ready
+
+    def test_redis_failure_keeps_local_index(self, index):
+        client = MagicMock()
+        client.xadd.side_effect = redis.ConnectionError("down")
+        index.redis_client = client
+
+        index.upsert(person("u4", "ann@example.com", "Ann", "Lee"))
+        index.upsert(person("u5", "max@example.com", "Max", "Lee"))
+
+        assert index.search("lee").total == 2
+        assert client.xadd.call_count == 1  # Redis bypassed after the error
+
+
+class TestRebuild:
+    """Test rebuilding from ZeroDB and the routes reading the index"""
+
+    def test_rebuild_search_indexes(self):
+        db = MagicMock()
+        db.query_documents.side_effect = lambda collection, **kwargs: {
+            "profiles": {"documents": [{"id": "p1", "data": {"user_id": "u1", "first_name": "John", "last_name": "Smith"}}]},
+            "users": {"documents": [{"id": "u1", "data": {"email": "john@example.com", "role": "member"}}]},
+            "resources": {"documents": [{"id": "r1", "data": {"title": "Kata basics", "status": "published"}}]},
+        }[collection]
+        indexes = {}
+
+        def get_index(name):
+            return indexes.setdefault(name, SearchIndex(name))
+
+        with patch.object(search_index_module, "get_search_index", side_effect=get_index):
+            counts = rebuild_search_indexes(db)
+
+        assert counts == {PEOPLE_INDEX: 1, RESOURCES_INDEX: 1}
+        assert indexes[PEOPLE_INDEX].search("smith").ids == ["u1"]
+        assert indexes[RESOURCES_INDEX].search("kata", filters={"status": "published"}).ids == ["r1"]
+
+    def test_resource_entry_sorts_by_display_order(self):
+        index = SearchIndex(RESOURCES_INDEX)
+        index.rebuild([
+            resource_entry("r1", {"title": "Second", "display_order": 2}),
+            resource_entry("r2", {"title": "First", "display_order": 1}),
+        ])
+
+        assert index.search(None).ids == ["r2", "r1"]
+
+    async def test_list_members_reads_index(self, index):
+        db = MagicMock()
+        with patch.object(members_routes, "get_search_index", return_value=index), \
+             patch.object(members_routes, "get_zerodb_client", return_value=db):
+            result = await members_routes.list_members(
+                limit=1, offset=0, role=None, is_active=None, search="example", current_user={"email": "admin@test.com"}
+            )
+
+        assert result["total"] == 3
+        assert len(result["members"]) == 1
+        assert result["members"][0]["email"] == "bob@example.com"
+        assert result["members"][0]["first_name"] == "Bob"
+        db.find_many.assert_not_called()
@@ -55,6 +55,12 @@ def mock_redis():
     redis_client.delete = Mock(return_value=True)
     redis_client.keys = Mock(return_value=[])
     redis_client.expire = Mock(return_value=True)
+    # Write-behind buffer
+    redis_client.hget = Mock(return_value=None)
+    redis_client.hvals = Mock(return_value=[])
+    redis_client.smembers = Mock(return_value=set())
+    redis_client.hexists = Mock(return_value=False)
+    redis_client.xrange = Mock(return_value=[])
     return redis_client
 
 
@@ -123,6 +129,25 @@ def test_send_message_success(chat_service, mock_db, mock_redis, sample_session_
     assert message.message == "Hello, world!"
     assert message.user_name == "Test User"
     assert not message.is_private
+    # Buffered for batched persistence, not written synchronously
+    mock_redis.pipeline.return_value.xadd.assert_called()
+    mock_db.insert_one.assert_not_called()
+
+
+def test_send_message_falls_back_to_direct_write(chat_service, mock_db, mock_redis, sample_session_id, sample_user_id):
+    """Test message is written directly when it cannot be buffered"""
+    import redis as redis_lib
+    mock_db.find.return_value = []
+    mock_redis.pipeline.return_value.execute.side_effect = redis_lib.ConnectionError("down")
+
+    chat_service.send_message(
+        session_id=sample_session_id,
+        user_id=sample_user_id,
+        user_name="Test User",
+        message="Hello, world!",
+        is_instructor=False
+    )
+
     mock_db.insert_one.assert_called_once()
 
 
@@ -261,6 +286,26 @@ def test_get_messages_success(chat_service, mock_db, sample_session_id, sample_u
     assert messages[0].message == "Hello, world!"
 
 
+def test_get_messages_continues_into_recent_history(chat_service, mock_db, mock_redis, sample_session_id, sample_user_id, sample_message_data):
+    """Test recent messages come from the history stream, older ones from ZeroDB"""
+    older = dict(sample_message_data, id=str(uuid4()), message="Older", timestamp="2025-01-01T10:00:00")
+    recent = dict(sample_message_data, id=str(uuid4()), message="Recent", timestamp="2025-01-01T11:00:00")
+    mock_db.find.return_value = [older]
+    mock_redis.xrange.return_value = [("1-0", {"id": recent["id"], "data": json.dumps(recent)})]
+    mock_redis.pipeline.return_value.execute.return_value = [[None], {"👍": "2"}]
+
+    messages = chat_service.get_messages(
+        session_id=sample_session_id,
+        user_id=sample_user_id,
+        is_instructor=True
+    )
+
+    assert [m.message for m in messages] == ["Older", "Recent"]
+    assert messages[1].reactions == {"👍": 2}
+    query = mock_db.find.call_args[0][1]
+    assert query["timestamp"] == {"$lt": "2025-01-01T11:00:00"}
+
+
 def test_get_messages_filters_private_for_non_instructor(chat_service, mock_db, sample_session_id, sample_user_id):
     """Test private messages are filtered for non-instructors"""
     # Setup - call with non-instructor user
@@ -413,7 +458,38 @@ def test_add_reaction_success(chat_service, mock_db, mock_redis, sample_user_id,
 
     # Assert
     assert result is True
-    mock_db.update_one.assert_called_once()
+    mock_redis.pipeline.return_value.hincrby.assert_called_once_with(
+        f"chat:reactions:{message_id}", "👍", 1
+    )
+    mock_db.update_one.assert_not_called()
+
+
+def test_add_reaction_to_buffered_message(chat_service, mock_db, mock_redis, sample_user_id, sample_message_data):
+    """Test reacting to a message that has not been persisted yet"""
+    mock_redis.hget.return_value = json.dumps(sample_message_data)
+
+    assert chat_service.add_reaction(
+        message_id=UUID(sample_message_data["id"]),
+        user_id=sample_user_id,
+        reaction="👍"
+    ) is True
+    mock_db.find_by_id.assert_not_called()
+
+
+def test_delete_buffered_message_is_deferred(chat_service, mock_db, mock_redis, sample_user_id, sample_message_data):
+    """Test deleting a message that has not been persisted yet"""
+    mock_redis.hget.return_value = json.dumps(sample_message_data)
+
+    chat_service.delete_message(
+        message_id=UUID(sample_message_data["id"]),
+        deleted_by=sample_user_id,
+        is_instructor=True
+    )
+
+    mock_db.update_one.assert_not_called()
+    entry = mock_redis.xadd.call_args[0][1]
+    assert entry["op"] == "delete"
+    assert entry["id"] == sample_message_data["id"]
 
 
 def test_add_reaction_invalid_type(chat_service, sample_user_id):
@@ -451,7 +527,7 @@ def test_add_reaction_rate_limit(chat_service, mock_redis, sample_user_id):
 
 # Tests for raise_hand / lower_hand
 
-def test_raise_hand_success(chat_service, mock_db, sample_session_id, sample_user_id):
+def test_raise_hand_success(chat_service, mock_db, mock_redis, sample_session_id, sample_user_id):
     """Test successful hand raising"""
     # Setup
     mock_db.find.return_value = []  # No existing raised hands
@@ -467,7 +543,8 @@ def test_raise_hand_success(chat_service, mock_db, sample_session_id, sample_use
     assert isinstance(raised_hand, SessionRaisedHand)
     assert raised_hand.user_id == sample_user_id
     assert raised_hand.is_active
-    mock_db.insert_one.assert_called_once()
+    mock_redis.pipeline.return_value.xadd.assert_called_once()
+    mock_db.insert_one.assert_not_called()
 
 
 def test_raise_hand_already_raised(chat_service, mock_db, sample_session_id, sample_user_id):
@@ -704,6 +781,19 @@ def test_export_chat_txt(chat_service, mock_db, sample_session_id, sample_messag
     assert "Hello, world!" in export_data
 
 
+def test_export_chat_includes_buffered_messages(chat_service, mock_db, mock_redis, sample_session_id, sample_message_data):
+    """Test chat export includes messages not persisted yet"""
+    buffered = dict(sample_message_data, id=str(uuid4()), message="Buffered", timestamp="2999-01-01T00:00:00")
+    mock_db.find.return_value = [sample_message_data]
+    mock_redis.smembers.return_value = {buffered["id"]}
+    mock_redis.hmget.return_value = [json.dumps(buffered)]
+    mock_redis.pipeline.return_value.execute.return_value = [[None], {}]
+
+    data = json.loads(chat_service.export_chat(session_id=sample_session_id, format="json"))
+
+    assert [m["message"] for m in data] == ["Hello, world!", "Buffered"]
+
+
 def test_export_chat_invalid_format(chat_service, sample_session_id):
     """Test chat export with invalid format"""
     # Execute & Assert
@@ -0,0 +1,172 @@
+"""
+Unit Tests for the Admin Settings Snapshot
+
+Tests the process-local settings snapshot including:
+- Reads served from the snapshot without rebuilding
+- Rebuilds when the Redis version counter moves, and after a local bump
+- Builds racing a bump never stored
+- The max age used while Redis is unreachable
+- The settings routes reading the snapshot and bumping the version on writes
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+import redis
+
+from backend.models.request_schemas import OrganizationSettingsUpdate
+from backend.models.schemas import AdminSettings
+from backend.routes.admin import settings as settings_routes
+from backend.services.settings_snapshot import (
+    VERSION_KEY,
+    SettingsSnapshot,
+    SettingsSnapshotCache,
+)
+from backend.utils.encryption import encrypt_value
+
+
+class FakeRedis:
+    """In-memory stand-in for the version counter"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+
+def counting_builder():
+    builds = []
+
+    async def build():
+        builds.append(True)
+        return SettingsSnapshot(settings=AdminSettings(), decrypted={"build": len(builds)}, masked={})
+
+    return build, builds
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    return SettingsSnapshotCache(redis_client=redis_client, check_interval=0)
+
+
+class TestSettingsSnapshotCache:
+    """Test snapshot reuse and refresh"""
+
+    async def test_snapshot_reused_while_version_unchanged(self, cache):
+        build, builds = counting_builder()
+
+        first = await cache.get(build)
+        second = await cache.get(build)
+
+        assert first is second
+        assert len(builds) == 1
+
+    async def test_version_checked_once_per_interval(self, redis_client):
+        redis_client.get = MagicMock(return_value="1")
+        cache = SettingsSnapshotCache(redis_client=redis_client, check_interval=60)
+        build, builds = counting_builder()
+
+        await cache.get(build)
+        await cache.get(build)
+
+        assert redis_client.get.call_count == 1
+
+    async def test_other_workers_rebuild_after_bump(self, cache, redis_client):
+        other = SettingsSnapshotCache(redis_client=redis_client, check_interval=0)
+        build, builds = counting_builder()
+        await cache.get(build)
+
+        other.bump()
+        snapshot = await cache.get(build)
+
+        assert snapshot.decrypted == {"build": 2}
+        assert redis_client.values[VERSION_KEY] == "1"
+
+    async def test_local_bump_drops_snapshot_at_once(self, redis_client):
+        cache = SettingsSnapshotCache(redis_client=redis_client, check_interval=60)
+        build, builds = counting_builder()
+        await cache.get(build)
+
+        cache.bump()
+        await cache.get(build)
+
+        assert len(builds) == 2
+
+    async def test_build_racing_a_bump_not_stored(self, cache):
+        build, builds = counting_builder()
+
+        async def build_then_written():
+            cache.bump()  # Settings written while the build was in flight
+            return await build()
+
+        await cache.get(build_then_written)
+        await cache.get(build)
+
+        assert len(builds) == 2
+
+    async def test_max_age_without_redis(self):
+        client = MagicMock()
+        client.get.side_effect = redis.ConnectionError("down")
+        cache = SettingsSnapshotCache(redis_client=client, check_interval=0)
+        build, builds = counting_builder()
+
+        await cache.get(build)
+        await cache.get(build)
+        assert len(builds) == 1
+
+        with patch("backend.services.settings_snapshot.time.monotonic", return_value=10 ** 9):
+            await cache.get(build)
+        assert len(builds) == 2
+
+
+class TestSettingsRoutes:
+    """Test the settings routes using the snapshot"""
+
+    @pytest.fixture
+    def db(self):
+        db = MagicMock()
+        db.query_documents.return_value = [AdminSettings(
+            org_name="WWMAA",
+            stripe_secret_key_encrypted=encrypt_value("sk_test_1234567890"),
+        ).model_dump(mode='json')]
+        return db
+
+    @pytest.fixture(autouse=True)
+    def snapshot_cache(self, cache):
+        with patch.object(settings_routes, "get_settings_snapshot_cache", return_value=cache):
+            yield cache
+
+    async def test_reads_decrypt_once(self, db):
+        with patch.object(settings_routes, "decrypt_value", wraps=settings_routes.decrypt_value) as decrypt:
+            first = await settings_routes.get_admin_settings(current_user={}, db=db)
+            stripe = await settings_routes.get_stripe_settings(current_user={}, db=db)
+
+        assert first.stripe_secret_key == "sk_test_1234567890"
+        assert stripe["stripe_secret_key"] == "sk_test_••••••7890"
+        assert db.query_documents.call_count == 1
+        assert decrypt.call_count == 2  # Decrypted and masked forms, once each
+
+    async def test_patch_refreshes_snapshot(self, db, redis_client):
+        await settings_routes.get_admin_settings(current_user={}, db=db)
+
+        await settings_routes.update_organization_settings(
+            OrganizationSettingsUpdate(org_name="Renamed"),
+            current_user={"id": str(uuid4()), "email": "admin@test.com"},
+            db=db
+        )
+        db.query_documents.return_value = [db.update_document.call_args.kwargs["updates"]]
+        response = await settings_routes.get_admin_settings(current_user={}, db=db)
+
+        assert response.org_name == "Renamed"
+        assert redis_client.values[VERSION_KEY] == "1"
@@ -0,0 +1,221 @@
+"""
+Unit Tests for the Signed URL Cache
+
+Tests signed URL reuse including:
+- Reusing URLs with enough validity left, never past the requested lifetime
+- Background refresh before expiry
+- Batch lookups and minting
+- Invalidation and the shared Redis tier
+- Local Cloudflare Stream token signing through the cache
+"""
+
+import base64
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+import redis
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from backend.services.cloudflare_stream_service import CloudflareStreamService
+from backend.services.signed_url_cache import KEY_PREFIX, SignedUrl, SignedUrlCache
+
+
+@pytest.fixture
+def cache():
+    """In-process cache without Redis"""
+    return SignedUrlCache()
+
+
+def counting_minter():
+    minted = []
+
+    def mint(ttl):
+        minted.append(ttl)
+        return f"https://example.com/asset?v={len(minted)}"
+
+    return mint, minted
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestSignedUrlCache:
+    """Test signed URL reuse"""
+
+    def test_reuses_url_with_validity_left(self, cache):
+        mint, minted = counting_minter()
+
+        first = cache.get_or_mint("video-1", 3600, mint)
+        second = cache.get_or_mint("video-1", 3600, mint)
+
+        assert first == second
+        assert minted == [3600]
+        assert 3590 < first.expires_in <= 3600
+        assert cache.stats["hits"] == 1
+
+    def test_audience_and_permissions_not_shared(self, cache):
+        mint, minted = counting_minter()
+
+        cache.get_or_mint("video-1", 3600, mint, audience="members")
+        cache.get_or_mint("video-1", 3600, mint, audience="public")
+        cache.get_or_mint("video-1", 3600, mint, audience="members", permissions="download")
+
+        assert len(minted) == 3
+
+    def test_nearly_expired_url_replaced(self, cache):
+        mint, minted = counting_minter()
+        cache._put_local({("video-1", "default", "read"): SignedUrl("old", time.time() + 60)})
+
+        signed = cache.get_or_mint("video-1", 3600, mint)
+
+        assert signed.url != "old"
+        assert minted == [3600]
+
+    def test_never_outlives_requested_lifetime(self, cache):
+        mint, minted = counting_minter()
+        cache.get_or_mint("video-1", 86400, mint)
+
+        short = cache.get_or_mint("video-1", 300, mint)
+
+        assert minted == [86400, 300]
+        assert short.expires_in <= 300
+
+    def test_stale_url_returned_and_refreshed_in_background(self, cache):
+        mint, minted = counting_minter()
+        key = ("video-1", "default", "read")
+        cache._put_local({key: SignedUrl("old", time.time() + 1000)})  # Below half of 3600
+
+        signed = cache.get_or_mint("video-1", 3600, mint)
+
+        assert signed.url == "old"
+        wait_for(lambda: cache._local[key].url != "old")
+        assert minted == [3600]
+        assert cache.stats["refreshes"] == 1
+
+    def test_batch_mints_misses_in_one_call(self, cache):
+        cache.get_or_mint("a", 3600, lambda ttl: "url-a")
+        mint_many = MagicMock(side_effect=lambda assets, ttl: {asset: f"url-{asset}" for asset in assets})
+
+        result = cache.get_or_mint_many(["a", "b", "c", "b"], 3600, mint_many)
+
+        mint_many.assert_called_once_with(["b", "c"], 3600)
+        assert {asset: signed.url for asset, signed in result.items()} == {
+            "a": "url-a", "b": "url-b", "c": "url-c"
+        }
+
+    def test_invalidate_drops_all_variants(self, cache):
+        mint, minted = counting_minter()
+        cache.get_or_mint("video-1", 3600, mint)
+        cache.get_or_mint("video-1", 3600, mint, permissions="download")
+
+        cache.invalidate("video-1")
+        cache.get_or_mint("video-1", 3600, mint)
+
+        assert len(minted) == 3
+
+
+class TestSharedTier:
+    """Test the Redis tier"""
+
+    def test_reads_url_minted_by_another_worker(self):
+        client = MagicMock()
+        expires_at = time.time() + 3000
+        client.pipeline.return_value.execute.return_value = [
+            json.dumps({"url": "shared", "expires_at": expires_at})
+        ]
+        cache = SignedUrlCache(redis_client=client)
+
+        signed = cache.get_or_mint("video-1", 3600, MagicMock())
+
+        assert signed == SignedUrl("shared", expires_at)
+        client.pipeline.return_value.hget.assert_called_once_with(KEY_PREFIX + "video-1", "default|read")
+
+    def test_redis_failure_falls_back_to_local(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        cache = SignedUrlCache(redis_client=client)
+
+        first = cache.get_or_mint("video-1", 3600, lambda ttl: "minted")
+        second = cache.get_or_mint("video-1", 3600, lambda ttl: "again")
+
+        assert first.url == second.url == "minted"
+        assert client.pipeline.call_count == 1  # Redis bypassed after the error
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    """RSA key in the base64 PEM form the Stream keys API returns"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption()
+    )
+    return key, base64.b64encode(pem).decode()
+
+
+class TestStreamTokenSigning:
+    """Test local Cloudflare Stream playback tokens"""
+
+    def test_signs_locally_and_reuses_token(self, signing_key):
+        key, encoded = signing_key
+        service = CloudflareStreamService(
+            account_id="account_123456",
+            api_token="token_123456",
+            signing_key_id="key-1",
+            signing_key=encoded,
+            url_cache=SignedUrlCache()
+        )
+
+        with patch("backend.services.cloudflare_stream_service.requests.request") as mock_request:
+            url = service.generate_signed_url("video_123", expiry_hours=1)
+            again = service.generate_signed_url("video_123", expiry_hours=1)
+
+        mock_request.assert_not_called()
+        assert url == again
+        token = url.split("/")[3]
+        claims = jwt.decode(token, key.public_key(), algorithms=["RS256"])
+        assert claims["sub"] == "video_123"
+        assert claims["kid"] == "key-1"
+        assert claims["downloadable"] is False
+        assert jwt.get_unverified_header(token)["kid"] == "key-1"
+
+    def test_batch_tokens(self, signing_key):
+        _, encoded = signing_key
+        service = CloudflareStreamService(
+            account_id="account_123456",
+            api_token="token_123456",
+            signing_key_id="key-1",
+            signing_key=encoded,
+            url_cache=SignedUrlCache()
+        )
+
+        tokens = service.get_playback_tokens(["v1", "v2"], expiry_seconds=600)
+
+        assert set(tokens) == {"v1", "v2"}
+        assert all(0 < token.expires_in <= 600 for token in tokens.values())
+
+    def test_requests_token_without_signing_key(self):
+        service = CloudflareStreamService(
+            account_id="account_123456",
+            api_token="token_123456",
+            url_cache=SignedUrlCache()
+        )
+        response = MagicMock(ok=True)
+        response.json.return_value = {"success": True, "result": {"token": "api-token"}}
+
+        with patch("backend.services.cloudflare_stream_service.requests.request", return_value=response) as mock_request:
+            token = service.generate_signed_token("video_123", expiry_seconds=600)
+            service.generate_signed_token("video_123", expiry_seconds=600)
+
+        assert token == "api-token"
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["url"].endswith("/video_123/token")
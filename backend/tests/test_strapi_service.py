@@ -4,6 +4,8 @@ Unit Tests for Strapi Service
 Tests the Strapi CMS integration service including:
 - Article fetching
 - Response transformation
+- Query pushdown and per-query page caching
+- Conditional refreshes and transforming each article version once
 - Error handling
 - Caching behavior
 - Authentication
@@ -15,6 +17,7 @@ from datetime import datetime
 import requests
 
 from backend.services.strapi_service import (
+    ArticlePage,
     StrapiService,
     get_strapi_service,
     StrapiError,
@@ -33,6 +36,10 @@ def mock_cache_service():
         cache.get.return_value = None  # Default: cache miss
         cache.set.return_value = True
         cache.clear_pattern.return_value = 5
+        # Memoize through the mocked get/set so hit/miss assertions still apply
+        cache.get_or_compute.side_effect = (
+            lambda key, compute, **kwargs: cache.get(key) or compute()
+        )
         mock.return_value = cache
         yield cache
 
@@ -361,17 +368,149 @@ class TestTransformStrapiToArticle:
         assert "title" in transformed
 
 
+class TestArticlePages:
+    """Test fetch_article_page"""
+
+    @pytest.fixture
+    def page_response(self, sample_strapi_response):
+        article = sample_strapi_response["data"][0]
+        article["attributes"]["updatedAt"] = "2025-11-12T08:00:00.000Z"
+        sample_strapi_response["meta"] = {"pagination": {"start": 20, "limit": 10, "total": 21}}
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = sample_strapi_response
+        response.raise_for_status = Mock()
+        return response
+
+    def test_query_pushed_down_to_strapi(self, strapi_service, page_response):
+        with patch.object(strapi_service.session, 'get', return_value=page_response) as get:
+            page = strapi_service.fetch_article_page(offset=20, limit=10, category="Testing", tag="kata")
+
+        params = get.call_args.kwargs["params"]
+        assert params["pagination[start]"] == 20
+        assert params["pagination[limit]"] == 10
+        assert params["pagination[withCount]"] == "true"
+        assert params["filters[category][$eqi]"] == "Testing"
+        assert params["filters[tags][$containsi]"] == '"kata"'
+        assert "populate" not in params
+        assert "content" not in params.values()
+        assert params["populate[featured_image][fields][0]"] == "url"
+        assert page.total == 21
+        assert page.articles[0]["image_url"] == "http://localhost:1337/uploads/test.jpg"
+        assert "content" not in page.articles[0]
+
+    def test_page_cached_per_query_shape(self, strapi_service, mock_cache_service, page_response):
+        mock_cache_service.versioned_key.side_effect = lambda namespace, key: f"{namespace}:v1:{key}"
+
+        with patch.object(strapi_service.session, 'get', return_value=page_response):
+            strapi_service.fetch_article_page(offset=0, limit=10)
+            strapi_service.fetch_article_page(offset=0, limit=10)
+            strapi_service.fetch_article_page(offset=10, limit=10)
+            strapi_service.fetch_article_page(offset=0, limit=10, category="Testing")
+
+        keys = [call.args[0] for call in mock_cache_service.get_or_compute.call_args_list]
+        assert keys[0] == keys[1]
+        assert len(set(keys)) == 3
+        assert all(key.startswith("blog:v1:strapi:articles:page:") for key in keys)
+
+    def test_cached_page_returned(self, strapi_service, mock_cache_service):
+        mock_cache_service.get.return_value = {"articles": [{"id": "1"}], "total": 1}
+
+        with patch.object(strapi_service.session, 'get') as get:
+            page = strapi_service.fetch_article_page()
+
+        assert page == ArticlePage(articles=[{"id": "1"}], total=1)
+        get.assert_not_called()
+
+    def test_validators_stored_with_page(self, strapi_service, mock_cache_service, page_response):
+        page_response.headers = {"ETag": '"v1"', "Last-Modified": "Wed, 12 Nov 2025 08:00:00 GMT"}
+
+        with patch.object(strapi_service.session, 'get', return_value=page_response):
+            strapi_service.fetch_article_page()
+
+        key, stored = mock_cache_service.set.call_args.args
+        assert key.endswith(":validators")
+        assert stored["etag"] == '"v1"'
+        assert stored["last_modified"] == "Wed, 12 Nov 2025 08:00:00 GMT"
+        assert stored["page"]["total"] == 21
+
+    def test_not_modified_reuses_stored_page(self, strapi_service, mock_cache_service):
+        stored = {"etag": '"v1"', "page": {"articles": [{"id": "1"}], "total": 1}}
+        mock_cache_service.versioned_key.side_effect = lambda namespace, key: f"{namespace}:v1:{key}"
+        mock_cache_service.get.side_effect = lambda key: stored if key.endswith(":validators") else None
+        not_modified = Mock(status_code=304)
+
+        with patch.object(strapi_service.session, 'get', return_value=not_modified) as get, \
+             patch.object(strapi_service, 'transform_strapi_to_article') as transform:
+            page = strapi_service.fetch_article_page()
+
+        assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert page == ArticlePage(articles=[{"id": "1"}], total=1)
+        not_modified.json.assert_not_called()
+        transform.assert_not_called()
+        mock_cache_service.expire.assert_called_once()
+
+    def test_no_matches_not_cached(self, strapi_service):
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = {"data": [], "meta": {"pagination": {"total": 0}}}
+        response.raise_for_status = Mock()
+
+        with patch.object(strapi_service.session, 'get', return_value=response):
+            page = strapi_service.fetch_article_page(category="Unknown", use_cache=False)
+
+        assert page == ArticlePage(articles=[], total=0)
+
+    def test_transform_once_per_article_version(self, strapi_service, page_response):
+        transform = strapi_service.transform_strapi_to_article
+
+        with patch.object(strapi_service.session, 'get', return_value=page_response), \
+             patch.object(strapi_service, 'transform_strapi_to_article', wraps=transform) as wrapped:
+            strapi_service.fetch_article_page(use_cache=False)
+            first = strapi_service.fetch_article_page(use_cache=False)
+            assert wrapped.call_count == 1
+
+            page_response.json.return_value["data"][0]["attributes"]["updatedAt"] = "2025-11-13T08:00:00.000Z"
+            strapi_service.fetch_article_page(use_cache=False)
+            assert wrapped.call_count == 2
+
+        first.articles[0]["title"] = "Changed by caller"
+        assert strapi_service._transform_once(page_response.json()["data"][0])["title"] == "Test Article"
+
+    def test_fetch_by_slug_selects_fields(self, strapi_service, sample_strapi_response):
+        response = Mock()
+        response.json.return_value = sample_strapi_response
+        response.raise_for_status = Mock()
+
+        with patch.object(strapi_service.session, 'get', return_value=response) as get:
+            article = strapi_service.fetch_article_by_slug("test-article", use_cache=False)
+
+        params = get.call_args.kwargs["params"]
+        assert "content" in params.values()
+        assert "populate" not in params
+        assert article["content"] == "Test content"
+
+
 class TestCacheManagement:
     """Test cache management methods"""
 
-    def test_invalidate_cache_all(self, strapi_service, mock_cache_service):
-        """Test invalidating all article cache"""
-        mock_cache_service.clear_pattern.return_value = 10
+    def test_invalidate_all(self, strapi_service, mock_cache_service):
+        """Test invalidating all article cache bumps the namespace (no scan)"""
+        mock_cache_service.bump_namespace.return_value = 4
+
+        version = strapi_service.invalidate_all()
+
+        assert version == 4
+        mock_cache_service.bump_namespace.assert_called_once_with("blog")
+        mock_cache_service.clear_pattern.assert_not_called()
+
+    def test_invalidate_cache_all_deletes_no_keys(self, strapi_service, mock_cache_service):
+        """Test invalidate_cache without a pattern still returns a key count"""
+        mock_cache_service.bump_namespace.return_value = 4
 
         deleted_count = strapi_service.invalidate_cache()
 
-        assert deleted_count == 10
-        mock_cache_service.clear_pattern.assert_called_once()
+        assert deleted_count == 0
+        mock_cache_service.bump_namespace.assert_called_once_with("blog")
+        mock_cache_service.clear_pattern.assert_not_called()
 
     def test_invalidate_cache_pattern(self, strapi_service, mock_cache_service):
         """Test invalidating specific cache pattern"""
@@ -381,6 +520,15 @@ class TestCacheManagement:
 
         assert deleted_count == 3
 
+    def test_invalidate_article_by_tag(self, strapi_service, mock_cache_service):
+        """Test invalidating a single article deletes its tagged entries"""
+        mock_cache_service.invalidate_tags.return_value = 1
+
+        deleted_count = strapi_service.invalidate_article("test-article")
+
+        assert deleted_count == 1
+        mock_cache_service.invalidate_tags.assert_called_once_with("blog:article:test-article")
+
 
 class TestHealthCheck:
     """Test health check method"""
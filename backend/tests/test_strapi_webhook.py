@@ -0,0 +1,139 @@
+"""
+Tests for the Strapi Webhook and the Blog Page Routes
+
+Tests blog cache invalidation through the Strapi webhook, and the blog
+routes fetching one pushed-down page from Strapi.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routes import blog as blog_routes
+from backend.routes.webhooks import strapi as strapi_webhooks
+from backend.services import http_cache
+from backend.services.http_cache import ContentVersions
+from backend.services.strapi_service import ArticlePage
+
+
+@pytest.fixture
+def strapi():
+    strapi = MagicMock()
+    strapi.fetch_article_page.return_value = ArticlePage(articles=[{"id": "1", "title": "Kata"}], total=41)
+    return strapi
+
+
+@pytest.fixture
+def webhook_client(strapi):
+    app = FastAPI()
+    app.include_router(strapi_webhooks.router)
+    with patch.object(strapi_webhooks, "get_strapi_service", return_value=strapi), \
+         patch.object(strapi_webhooks.settings, "STRAPI_WEBHOOK_SECRET", "test_secret"):
+        yield TestClient(app)
+
+
+class TestStrapiWebhook:
+    """Test cache invalidation through the Strapi webhook"""
+
+    def test_article_event_invalidates_blog(self, webhook_client, strapi):
+        response = webhook_client.post(
+            "/api/webhooks/strapi",
+            json={"event": "entry.update", "model": "article", "entry": {"id": 1, "slug": "kata"}},
+            headers={"Authorization": "Bearer test_secret"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "invalidated"
+        strapi.invalidate_article.assert_called_once_with("kata")
+        strapi.invalidate_all.assert_called_once_with()
+
+    def test_media_event_invalidates_blog(self, webhook_client, strapi):
+        response = webhook_client.post(
+            "/api/webhooks/strapi",
+            json={"event": "media.update", "media": {"id": 3}},
+            headers={"Authorization": "Bearer test_secret"}
+        )
+
+        assert response.json()["status"] == "invalidated"
+        strapi.invalidate_article.assert_not_called()
+        strapi.invalidate_all.assert_called_once_with()
+
+    def test_other_models_ignored(self, webhook_client, strapi):
+        response = webhook_client.post(
+            "/api/webhooks/strapi",
+            json={"event": "entry.update", "model": "page", "entry": {"id": 1}},
+            headers={"Authorization": "Bearer test_secret"}
+        )
+
+        assert response.json()["status"] == "ignored"
+        strapi.invalidate_all.assert_not_called()
+
+    @pytest.mark.parametrize("authorization", [None, "Bearer wrong", "test_secret_extra"])
+    def test_invalid_secret_rejected(self, webhook_client, strapi, authorization):
+        headers = {"Authorization": authorization} if authorization else {}
+
+        response = webhook_client.post(
+            "/api/webhooks/strapi",
+            json={"event": "entry.update", "model": "article", "entry": {"slug": "kata"}},
+            headers=headers
+        )
+
+        assert response.status_code == 401
+        strapi.invalidate_all.assert_not_called()
+
+    def test_missing_event_rejected(self, webhook_client):
+        response = webhook_client.post(
+            "/api/webhooks/strapi",
+            json={"model": "article"},
+            headers={"Authorization": "Bearer test_secret"}
+        )
+
+        assert response.status_code == 400
+
+
+class TestBlogPageRoutes:
+    """Test the blog routes fetching a single page from Strapi"""
+
+    @pytest.fixture
+    def client(self, strapi):
+        with patch.object(blog_routes, "get_strapi_service", return_value=strapi), \
+             patch.object(http_cache, "get_content_versions", return_value=ContentVersions()):
+            yield TestClient(blog_routes.router)
+
+    def test_articles_offset_pushed_down(self, client, strapi):
+        response = client.get("/api/blog?limit=5&offset=40&category=Training&tag=kata")
+
+        assert response.json() == [{"id": "1", "title": "Kata"}]
+        kwargs = strapi.fetch_article_page.call_args.kwargs
+        assert (kwargs["offset"], kwargs["limit"]) == (40, 5)
+        assert (kwargs["category"], kwargs["tag"]) == ("Training", "kata")
+        strapi.fetch_articles.assert_not_called()
+
+    def test_posts_pagination_uses_strapi_total(self, client, strapi):
+        response = client.get("/api/blog/posts?page=3&limit=20&sort_by=title&sort_order=asc")
+
+        pagination = response.json()["pagination"]
+        assert pagination["total"] == 41
+        assert pagination["total_pages"] == 3
+        assert pagination["has_next"] is False
+        kwargs = strapi.fetch_article_page.call_args.kwargs
+        assert (kwargs["offset"], kwargs["limit"], kwargs["sort"]) == (40, 20, "title:asc")
+
+    def test_posts_by_category(self, client, strapi):
+        response = client.get("/api/blog/posts/by-category/Training?page=2&limit=10")
+
+        assert response.status_code == 200
+        kwargs = strapi.fetch_article_page.call_args.kwargs
+        assert (kwargs["offset"], kwargs["category"], kwargs["sort"]) == (10, "Training", "publishedAt:desc")
+
+    def test_categories_load_only_the_category(self, client, strapi):
+        strapi.fetch_article_page.return_value = ArticlePage(
+            articles=[{"category": "Training"}, {"category": "Training"}, {"category": "News"}], total=3
+        )
+
+        response = client.get("/api/blog/categories")
+
+        assert response.json()["data"][1] == {"name": "Training", "slug": "training", "count": 2}
+        assert strapi.fetch_article_page.call_args.kwargs["fields"] == ("category",)
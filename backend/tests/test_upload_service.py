@@ -0,0 +1,131 @@
+"""
+Unit Tests for the Chunked Upload Service
+
+Tests chunked uploads including:
+- Preallocation and positional chunk writes
+- Atomic chunk accounting with parallel and retried chunks
+- Chunk size validation
+- Hash tree finalization from per-chunk digests
+- Progress, missing chunks and cancellation
+
+Runs against fakeredis[lua], so the chunk accounting script is exercised as
+Redis runs it.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.upload_service import UploadService, combine_chunk_digests
+
+
+@pytest.fixture
+def redis_client(lua_redis_client):
+    return lua_redis_client
+
+
+@pytest.fixture
+def upload_service(redis_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(UploadService, "CHUNK_SIZE", 4)
+    return UploadService(redis_client=redis_client, temp_dir=str(tmp_path))
+
+
+DATA = b"0123456789abcdefghi"  # 5 chunks of 4 bytes, the last one 3 bytes
+
+
+def chunks_of(data, size=4):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestChunkedUpload:
+    """Test the chunked upload flow"""
+
+    def test_initiate_preallocates_file(self, upload_service):
+        session = upload_service.initiate_upload("video.mp4", len(DATA), "user-1", {"title": "Kata"})
+
+        progress = upload_service.get_upload_progress(session["upload_id"])
+        assert session["total_chunks"] == 5
+        assert progress["bytes_uploaded"] == 0
+        temp_file = upload_service._get_upload_session(session["upload_id"])["temp_file"]
+        with open(temp_file, "rb") as f:
+            assert len(f.read()) == len(DATA)
+
+    def test_parallel_out_of_order_upload(self, upload_service):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+        indexed = list(enumerate(chunks_of(DATA)))[::-1]
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(lambda item: upload_service.upload_chunk(upload_id, *item), indexed))
+
+        result = upload_service.finalize_upload(upload_id)
+        with open(result["temp_file"], "rb") as f:
+            assert f.read() == DATA
+        expected = combine_chunk_digests([hashlib.sha256(c).hexdigest() for c in chunks_of(DATA)])
+        assert result["file_hash"] == expected
+        assert result["hash_algorithm"] == "sha256-tree"
+
+    def test_retried_chunk_counted_once(self, upload_service):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+
+        upload_service.upload_chunk(upload_id, 0, DATA[:4])
+        progress = upload_service.upload_chunk(upload_id, 0, DATA[:4])
+
+        assert progress["chunks_uploaded"] == 1
+        assert progress["bytes_uploaded"] == 4
+        assert upload_service.get_missing_chunks(upload_id) == [1, 2, 3, 4]
+
+    def test_wrong_chunk_size_rejected(self, upload_service):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+
+        with pytest.raises(ValueError, match="Invalid size"):
+            upload_service.upload_chunk(upload_id, 4, b"toolong")
+
+    def test_finalize_incomplete_upload(self, upload_service):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+        upload_service.upload_chunk(upload_id, 0, DATA[:4])
+
+        with pytest.raises(ValueError, match="Upload incomplete"):
+            upload_service.finalize_upload(upload_id)
+
+    def test_expired_session(self, upload_service):
+        with pytest.raises(ValueError, match="not found"):
+            upload_service.upload_chunk("missing", 0, b"data")
+
+    def test_chunk_slides_session_ttl(self, upload_service, redis_client):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+        redis_client.expire(f"upload:{upload_id}", 60)  # Session nearly expired
+
+        upload_service.upload_chunk(upload_id, 0, DATA[:4])
+
+        for key in (f"upload:{upload_id}", f"upload:{upload_id}:chunks", f"upload:{upload_id}:digests"):
+            assert redis_client.ttl(key) > UploadService.UPLOAD_TTL - 5
+
+    def test_cancel_removes_state(self, upload_service, redis_client):
+        upload_id = upload_service.initiate_upload("video.mp4", len(DATA), "user-1")["upload_id"]
+        upload_service.upload_chunk(upload_id, 0, DATA[:4])
+
+        assert upload_service.cancel_upload(upload_id) is True
+        assert upload_service.get_upload_progress(upload_id) is None
+        assert redis_client.keys("upload:*") == []
+
+
+class TestHashTree:
+    """Test combining chunk digests"""
+
+    def test_single_chunk_is_plain_sha256(self):
+        digest = hashlib.sha256(b"data").hexdigest()
+
+        assert combine_chunk_digests([digest]) == digest
+
+    def test_root_of_three_chunks(self):
+        a, b, c = (hashlib.sha256(x).digest() for x in (b"a", b"b", b"c"))
+
+        root = combine_chunk_digests([a.hex(), b.hex(), c.hex()])
+
+        assert root == hashlib.sha256(hashlib.sha256(a + b).digest() + c).hexdigest()
+
+    def test_order_matters(self):
+        digests = [hashlib.sha256(x).hexdigest() for x in (b"a", b"b")]
+
+        assert combine_chunk_digests(digests) != combine_chunk_digests(digests[::-1])
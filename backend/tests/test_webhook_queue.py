@@ -0,0 +1,266 @@
+"""
+Unit Tests for the Webhook Queue
+
+Tests fast-ack webhook ingestion including:
+- Idempotent enqueueing of redelivered events
+- Per-key ordering, with different keys processed in parallel
+- Retries with backoff, dead-lettering and replay
+- Leases of crashed workers, and heartbeats renewing the leases of slow handlers
+- Routes acknowledging queued events without processing them
+
+Queue tests run against fakeredis[lua], so the enqueue, claim, retry and
+renew scripts are exercised as Redis runs them.
+"""
+
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import redis
+from fastapi.testclient import TestClient
+
+from backend.services.webhook_queue import (
+    DEAD_LETTER_KEY,
+    LEASE_OWNERS_KEY,
+    LEASED_KEY,
+    MAX_ATTEMPTS,
+    ORDER_KEY_PREFIX,
+    RETRY_BASE_DELAY,
+    STATUS_DEAD,
+    STATUS_PROCESSED,
+    STATUS_RETRYING,
+    WebhookQueue,
+    WebhookQueueError,
+)
+from backend.services.webhook_service import DuplicateEventError, WebhookService, stripe_ordering_key
+
+
+CLAIM_KEYS = ["webhooks:ready", LEASED_KEY, LEASE_OWNERS_KEY]
+
+
+@pytest.fixture
+def redis_client(lua_redis_client):
+    return lua_redis_client
+
+
+@pytest.fixture
+def queue(redis_client):
+    return WebhookQueue(redis_client)
+
+
+class Recorder:
+    """Webhook handler recording the events it was given"""
+
+    def __init__(self, fail_times=0):
+        self.events = []
+        self.fail_times = fail_times
+
+    def __call__(self, event):
+        self.events.append(event)
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("handler down")
+
+
+class TestIngestion:
+    """Test enqueueing"""
+
+    def test_redelivered_event_not_queued_again(self, queue, redis_client):
+        assert queue.enqueue("stripe", "evt_1", "invoice.paid", {"id": "evt_1"}, ordering_key="cus_1") is True
+        assert queue.enqueue("stripe", "evt_1", "invoice.paid", {"id": "evt_1"}, ordering_key="cus_1") is False
+
+        assert redis_client.lrange(ORDER_KEY_PREFIX + "stripe:cus_1", 0, -1) == ["stripe:evt_1"]
+
+    def test_redis_unavailable(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+
+        with pytest.raises(WebhookQueueError):
+            WebhookQueue(client).enqueue("stripe", "evt_1", "invoice.paid", {})
+
+
+class TestProcessing:
+    """Test workers processing queued events"""
+
+    def test_events_of_one_key_processed_in_order(self, queue):
+        for i in range(3):
+            queue.enqueue("stripe", f"evt_{i}", "invoice.paid", {"n": i}, ordering_key="cus_1")
+        handler = Recorder()
+
+        while queue.process_next({"stripe": handler}):
+            pass
+
+        assert [event.payload["n"] for event in handler.events] == [0, 1, 2]
+
+    def test_leased_key_not_handed_to_another_worker(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {}, ordering_key="cus_1")
+        queue.enqueue("stripe", "evt_2", "invoice.paid", {}, ordering_key="cus_1")
+        queue.enqueue("stripe", "evt_3", "invoice.paid", {}, ordering_key="cus_2")
+
+        first = queue._claim(keys=CLAIM_KEYS, args=[time.time(), 300, ORDER_KEY_PREFIX, "other"])
+        second = queue._claim(keys=CLAIM_KEYS, args=[time.time(), 300, ORDER_KEY_PREFIX, "other"])
+
+        assert first == ["stripe:cus_1", "stripe:evt_1"]
+        assert second == ["stripe:cus_2", "stripe:evt_3"]
+        assert queue._claim(keys=CLAIM_KEYS, args=[time.time(), 300, ORDER_KEY_PREFIX, "other"]) is None
+
+    def test_event_arriving_for_leased_key_waits(self, queue):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {"n": 1}, ordering_key="cus_1")
+        order = []
+
+        def handler(event):
+            order.append(event.payload["n"])
+            if event.payload["n"] == 1:
+                queue.enqueue("stripe", "evt_2", "invoice.paid", {"n": 2}, ordering_key="cus_1")
+                assert queue.process_next({"stripe": handler}) is None
+
+        assert queue.process_next({"stripe": handler}) == STATUS_PROCESSED
+        assert queue.process_next({"stripe": handler}) == STATUS_PROCESSED
+        assert order == [1, 2]
+
+    def test_failure_retried_with_backoff_holding_back_key(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {"n": 1}, ordering_key="cus_1")
+        queue.enqueue("stripe", "evt_2", "invoice.paid", {"n": 2}, ordering_key="cus_1")
+        handler = Recorder(fail_times=1)
+
+        assert queue.process_next({"stripe": handler}) == STATUS_RETRYING
+        assert queue.process_next({"stripe": handler}) is None
+        assert queue.process_next({"stripe": handler}, now=time.time() + RETRY_BASE_DELAY + 1) == STATUS_PROCESSED
+
+        assert [event.payload["n"] for event in handler.events] == [1, 1]
+        assert handler.events[1].attempts == 2
+        assert redis_client.hget("webhooks:event:stripe:evt_1", "status") == STATUS_PROCESSED
+
+    def test_dead_letter_after_max_attempts_then_key_moves_on(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {"n": 1}, ordering_key="cus_1")
+        queue.enqueue("stripe", "evt_2", "invoice.paid", {"n": 2}, ordering_key="cus_1")
+        handler = Recorder(fail_times=MAX_ATTEMPTS)
+        later = time.time()
+
+        statuses = []
+        for _ in range(MAX_ATTEMPTS + 1):
+            later += RETRY_BASE_DELAY * 2 ** MAX_ATTEMPTS
+            statuses.append(queue.process_next({"stripe": handler}, now=later))
+
+        assert statuses == [STATUS_RETRYING] * (MAX_ATTEMPTS - 1) + [STATUS_DEAD, STATUS_PROCESSED]
+        assert redis_client.lrange(DEAD_LETTER_KEY, 0, -1) == ["stripe:evt_1"]
+        dead = queue.dead_letters()
+        assert dead[0]["error"] == "handler down" and "payload" not in dead[0]
+
+    def test_replay_queues_dead_letter_again(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {"n": 1}, ordering_key="cus_1")
+        redis_client.hset("webhooks:event:stripe:evt_1", "status", STATUS_DEAD)
+        redis_client.delete(ORDER_KEY_PREFIX + "stripe:cus_1", "webhooks:ready")
+        redis_client.rpush(DEAD_LETTER_KEY, "stripe:evt_1")
+        handler = Recorder()
+
+        assert queue.replay("stripe:evt_1") is True
+        assert queue.replay("stripe:missing") is False
+        assert queue.process_next({"stripe": handler}) == STATUS_PROCESSED
+        assert handler.events[0].attempts == 1
+        assert redis_client.llen(DEAD_LETTER_KEY) == 0
+
+    def test_lapsed_lease_handed_out_again(self, queue):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {}, ordering_key="cus_1")
+        queue._claim(keys=CLAIM_KEYS, args=[time.time(), 300, ORDER_KEY_PREFIX, "other"])  # Worker crashes
+        handler = Recorder()
+
+        assert queue.process_next({"stripe": handler}) is None
+        assert queue.process_next({"stripe": handler}, now=time.time() + 301) == STATUS_PROCESSED
+
+    def test_lost_lease_left_to_new_owner(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {}, ordering_key="cus_1")
+        queue.enqueue("stripe", "evt_2", "invoice.paid", {}, ordering_key="cus_1")
+
+        def slow_handler(event):
+            # The lease lapses and another worker claims the key
+            queue._claim(keys=CLAIM_KEYS, args=[time.time() + 301, 300, ORDER_KEY_PREFIX, "other"])
+
+        assert queue.process_next({"stripe": slow_handler}) is None
+
+        assert redis_client.lrange(ORDER_KEY_PREFIX + "stripe:cus_1", 0, -1) == ["stripe:evt_1", "stripe:evt_2"]
+        assert redis_client.hgetall(LEASE_OWNERS_KEY) == {"stripe:cus_1": "other"}
+        assert redis_client.hget("webhooks:event:stripe:evt_1", "status") == "queued"
+
+    def test_failure_after_lost_lease_not_requeued(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {}, ordering_key="cus_1")
+
+        def failing_handler(event):
+            queue._claim(keys=CLAIM_KEYS, args=[time.time() + 301, 300, ORDER_KEY_PREFIX, "other"])
+            raise RuntimeError("handler down")
+
+        assert queue.process_next({"stripe": failing_handler}) is None
+
+        assert redis_client.zscore(LEASED_KEY, "stripe:cus_1") is not None
+        assert redis_client.zscore("webhooks:ready", "stripe:cus_1") is None
+
+    def test_heartbeat_renews_lease_while_handler_runs(self, queue, redis_client):
+        queue.enqueue("stripe", "evt_1", "invoice.paid", {}, ordering_key="cus_1")
+        renewals = []
+
+        def handler(event):
+            lease = redis_client.zscore(LEASED_KEY, "stripe:cus_1")
+            time.sleep(0.05)
+            renewals.append(redis_client.zscore(LEASED_KEY, "stripe:cus_1") > lease)
+
+        with patch("backend.services.webhook_queue.HEARTBEAT_SECONDS", 0.01):
+            assert queue.process_next({"stripe": handler}) == STATUS_PROCESSED
+
+        assert renewals == [True]
+
+    def test_async_handler(self, queue):
+        queue.enqueue("beehiiv", "evt_1", "post.updated", {"id": "post_1"})
+        seen = []
+
+        async def handler(event):
+            seen.append(event.event_type)
+
+        assert queue.process_next({"beehiiv": handler}) == STATUS_PROCESSED
+        assert seen == ["post.updated"]
+
+    def test_missing_handler_retried(self, queue):
+        queue.enqueue("unknown", "evt_1", "x", {})
+
+        assert queue.process_next({}) == STATUS_RETRYING
+
+
+class TestStripeEvents:
+    """Test Stripe event ordering and queued processing"""
+
+    @pytest.mark.parametrize("obj,expected", [
+        ({"object": "invoice", "customer": "cus_1"}, "cus_1"),
+        ({"object": "invoice", "customer": {"id": "cus_2"}}, "cus_2"),
+        ({"object": "customer", "id": "cus_3"}, "cus_3"),
+        ({"object": "charge"}, None),
+    ])
+    def test_ordering_key(self, obj, expected):
+        assert stripe_ordering_key({"data": {"object": obj}}) == expected
+
+    def test_queued_duplicate_is_done(self):
+        service = WebhookService.__new__(WebhookService)
+        service.process_webhook_event = Mock(side_effect=DuplicateEventError("seen"))
+        event = Mock(event_id="evt_1", event_type="invoice.paid", payload={})
+
+        assert service.handle_queued_event(event) == {"status": "duplicate"}
+
+    @patch("backend.routes.stripe_webhooks.get_webhook_service")
+    @patch("backend.routes.stripe_webhooks.get_webhook_queue")
+    @patch("stripe.Webhook.construct_event")
+    def test_route_acknowledges_without_processing(self, mock_construct_event, mock_queue, mock_service):
+        from backend.app import app
+
+        mock_event = Mock()
+        mock_event.id = "evt_1"
+        mock_event.type = "invoice.paid"
+        mock_event.to_dict.return_value = {"data": {"object": {"customer": "cus_1"}}}
+        mock_construct_event.return_value = mock_event
+        mock_queue.return_value.enqueue.side_effect = [True, False]
+
+        client = TestClient(app)
+        first = client.post("/api/webhooks/stripe", json={}, headers={"Stripe-Signature": "sig"})
+        second = client.post("/api/webhooks/stripe", json={}, headers={"Stripe-Signature": "sig"})
+
+        assert first.json()["status"] == "queued"
+        assert second.json()["status"] == "duplicate"
+        assert mock_queue.return_value.enqueue.call_args.kwargs["ordering_key"] == "cus_1"
+        mock_service.return_value.process_webhook_event.assert_not_called()
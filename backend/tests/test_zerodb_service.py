@@ -10,9 +10,11 @@ Comprehensive test suite for the ZeroDBClient class covering:
 - Retry logic
 """
 
+import io
 import json
 import os
 import tempfile
+from email.parser import BytesParser
 from unittest.mock import Mock, MagicMock, patch, mock_open
 import pytest
 import requests
@@ -24,10 +26,58 @@ from backend.services.zerodb_service import (
     ZeroDBAuthenticationError,
     ZeroDBNotFoundError,
     ZeroDBValidationError,
+    MultipartFormStream,
     get_zerodb_client
 )
 
 
+class TestMultipartFormStream:
+    """Test the streamed multipart/form-data body"""
+
+    def make_body(self, content=b"\x00binary\r\ncontent" * 100):
+        file_obj = io.BytesIO(b"skipped" + content)
+        file_obj.seek(len(b"skipped"))
+        return MultipartFormStream({"path": "media/a.bin", "ttl": "60"}, "a.bin", file_obj, "video/mp4"), content
+
+    def test_body_parses_as_multipart(self):
+        body, content = self.make_body()
+
+        raw = body.read()
+        message = BytesParser().parsebytes(
+            f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw
+        )
+
+        parts = {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+        assert parts["path"].get_payload() == "media/a.bin"
+        assert parts["ttl"].get_payload() == "60"
+        assert parts["file"].get_filename() == "a.bin"
+        assert parts["file"].get_content_type() == "video/mp4"
+        assert parts["file"].get_payload(decode=True) == content
+        assert len(raw) == len(body)
+
+    def test_small_reads_and_rewind(self):
+        body, _ = self.make_body()
+        whole = body.read()
+        body.seek(0)
+
+        pieces = []
+        while True:
+            piece = body.read(7)
+            if not piece:
+                break
+            pieces.append(piece)
+
+        assert b"".join(pieces) == whole
+        assert body.tell() == len(body)
+
+    def test_truncated_file_detected(self):
+        body, _ = self.make_body()
+        body._file.truncate(20)
+
+        with pytest.raises(OSError):
+            body.read()
+
+
 class TestZeroDBClientInitialization:
     """Test client initialization and configuration"""
 
@@ -433,24 +483,6 @@ class TestZeroDBClientObjectStorage:
 
             assert result == b"File content here"
 
-    def test_download_object_to_file(self, client):
-        """Test downloading object to file"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.ok = True
-        mock_response.content = b"File content"
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            save_path = os.path.join(temp_dir, "downloaded.txt")
-
-            with patch.object(client.session, 'get', return_value=mock_response):
-                result = client.download_object("test.txt", save_path=save_path)
-
-                assert result == save_path
-                assert os.path.exists(save_path)
-                with open(save_path, 'rb') as f:
-                    assert f.read() == b"File content"
-
     def test_download_object_not_found(self, client):
         """Test downloading non-existent object"""
         mock_response = Mock()
@@ -494,6 +526,107 @@ class TestZeroDBClientObjectStorage:
             assert result["total"] == 2
 
 
+class TestZeroDBClientObjectStreaming:
+    """Test streamed object uploads and downloads"""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client using legacy API key authentication"""
+        with patch.object(ZeroDBClient, "_authenticate"):
+            client = ZeroDBClient(
+                api_key="test_key",
+                base_url="https://api.test.com",
+                url_cache=MagicMock(),
+                document_cache=MagicMock()
+            )
+        # Legacy API: an empty project_id falls back to settings.ZERODB_PROJECT_ID
+        client.project_id = None
+        return client
+
+    def test_download_object_to_file(self, client):
+        """Test downloading object to file"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.iter_content.return_value = [b"File ", b"content"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = os.path.join(temp_dir, "downloaded.txt")
+
+            with patch.object(client.session, 'get', return_value=mock_response):
+                result = client.download_object("test.txt", save_path=save_path)
+
+                assert result == save_path
+                assert os.path.exists(save_path)
+                with open(save_path, 'rb') as f:
+                    assert f.read() == b"File content"
+
+    def test_download_object_interrupted_leaves_no_file(self, client):
+        """Test that a failed download does not leave a partial file"""
+        def chunks(chunk_size):
+            yield b"partial"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.iter_content.side_effect = chunks
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = os.path.join(temp_dir, "downloaded.txt")
+
+            with patch.object(client.session, 'get', return_value=mock_response):
+                with pytest.raises(ZeroDBConnectionError):
+                    client.download_object("test.txt", save_path=save_path)
+
+            assert os.listdir(temp_dir) == []
+
+    def test_stream_object(self, client):
+        """Test streaming an object chunk by chunk"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.iter_content.return_value = [b"abc", b"", b"def"]
+
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            chunks = client.stream_object("video.mp4", chunk_size=3)
+
+            assert list(chunks) == [b"abc", b"def"]
+            assert mock_get.call_args[1]["stream"] is True
+            mock_response.close.assert_called_once()
+
+    def test_stream_object_not_found_raises_before_streaming(self, client):
+        """Test that errors surface when the stream is opened"""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.ok = False
+        mock_response.json.return_value = {"detail": "Object not found"}
+
+        with patch.object(client.session, 'get', return_value=mock_response):
+            with pytest.raises(ZeroDBNotFoundError):
+                client.stream_object("missing.mp4")
+
+    def test_upload_object_streams_body(self, client):
+        """Test that uploads send a streamed multipart body"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"url": "https://storage.test.com/a.bin"}
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"payload")
+            temp_file = f.name
+
+        try:
+            with patch.object(client.session, 'post', return_value=mock_response) as mock_post:
+                client.upload_object(temp_file, object_name="a.bin")
+
+            kwargs = mock_post.call_args[1]
+            body = kwargs["data"]
+            assert isinstance(body, MultipartFormStream)
+            assert kwargs["headers"]["Content-Type"] == body.content_type
+            assert "files" not in kwargs
+        finally:
+            os.unlink(temp_file)
+
+
 class TestZeroDBClientErrorHandling:
     """Test error handling scenarios"""
 
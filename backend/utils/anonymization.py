@@ -233,58 +233,100 @@ def anonymize_document(
     if not document:
         return document
 
-    anonymized = {}
-    doc_user_id = user_id or document.get("user_id") or document.get("id")
-
-    for field, value in document.items():
-        field_lower = field.lower()
-
-        # Handle nested dictionaries
-        if isinstance(value, dict):
-            anonymized[field] = anonymize_document(value, anonymization_type, doc_user_id)
-            continue
-
-        # Handle lists
-        if isinstance(value, list):
-            anonymized[field] = [
-                anonymize_document(item, anonymization_type, doc_user_id)
-                if isinstance(item, dict)
-                else item
-                for item in value
-            ]
-            continue
-
-        # Check if field should be anonymized
-        if should_anonymize_field(field, anonymization_type):
-            # Provide appropriate anonymized value based on field type
-            if field_lower == "email":
-                anonymized[field] = anonymize_email(doc_user_id)
-            elif field_lower in {"first_name", "last_name", "full_name", "name"}:
-                anonymized[field] = "[REDACTED]"
-            elif field_lower in {"phone", "phone_number"}:
-                anonymized[field] = "[REDACTED]"
-            elif field_lower in {"address", "street_address"}:
-                anonymized[field] = "[REDACTED]"
-            elif field_lower in {"bio", "biography"}:
-                anonymized[field] = "[REDACTED]"
-            elif field_lower in {"query", "search_query", "search_term", "query_text"}:
-                anonymized[field] = "[ANONYMIZED]"
+    return _AnonymizationBatch(anonymization_type).apply(document, user_id)
+
+
+def anonymize_documents(
+    documents: List[Dict[str, Any]],
+    anonymization_type: AnonymizationType,
+    user_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Anonymize a batch of documents of the same type.
+
+    Produces the same output as calling ``anonymize_document`` on each document,
+    but classifies each distinct field name once per batch instead of once per
+    document, and hashes each user ID once. Records of one collection share
+    the same handful of field names, so this makes anonymizing thousands of
+    records a dictionary lookup per field.
+
+    Args:
+        documents: Documents to anonymize
+        anonymization_type: Type of anonymization to apply
+        user_id: Optional user ID for generating deterministic anonymized values
+
+    Returns:
+        Anonymized documents, in the same order
+    """
+    batch = _AnonymizationBatch(anonymization_type)
+    return [batch.apply(document, user_id) if document else document for document in documents]
+
+
+class _AnonymizationBatch:
+    """Field decisions and anonymized values shared by the documents of a batch"""
+
+    def __init__(self, anonymization_type: AnonymizationType):
+        self.anonymization_type = anonymization_type
+        self.anonymized_at = datetime.utcnow().isoformat()
+        self._decisions: Dict[str, bool] = {}
+        self._emails: Dict[str, str] = {}
+
+    def should_anonymize(self, field: str) -> bool:
+        decision = self._decisions.get(field)
+        if decision is None:
+            decision = self._decisions[field] = should_anonymize_field(field, self.anonymization_type)
+        return decision
+
+    def email(self, user_id: str) -> str:
+        email = self._emails.get(user_id)
+        if email is None:
+            email = self._emails[user_id] = anonymize_email(user_id)
+        return email
+
+    def apply(self, document: Dict[str, Any], user_id: Optional[str]) -> Dict[str, Any]:
+        anonymized = {}
+        doc_user_id = user_id or document.get("user_id") or document.get("id")
+
+        for field, value in document.items():
+            # Handle nested dictionaries
+            if isinstance(value, dict):
+                anonymized[field] = self.apply(value, doc_user_id) if value else value
+                continue
+
+            # Handle lists
+            if isinstance(value, list):
+                anonymized[field] = [
+                    (self.apply(item, doc_user_id) if item else item)
+                    if isinstance(item, dict)
+                    else item
+                    for item in value
+                ]
+                continue
+
+            # Check if field should be anonymized
+            if self.should_anonymize(field):
+                field_lower = field.lower()
+                # Provide appropriate anonymized value based on field type
+                if field_lower == "email":
+                    anonymized[field] = self.email(doc_user_id)
+                elif field_lower in {"query", "search_query", "search_term", "query_text"}:
+                    anonymized[field] = "[ANONYMIZED]"
+                else:
+                    # Names, phone numbers, addresses, bios and other PII
+                    anonymized[field] = "[REDACTED]"
             else:
-                # Generic redaction for other PII
-                anonymized[field] = "[REDACTED]"
-        else:
-            # Preserve non-PII fields
-            anonymized[field] = value
+                # Preserve non-PII fields
+                anonymized[field] = value
 
-    # Add anonymization metadata
-    anonymized["anonymized_at"] = datetime.utcnow().isoformat()
-    anonymized["anonymization_type"] = anonymization_type.value
+        # Add anonymization metadata
+        anonymized["anonymized_at"] = self.anonymized_at
+        anonymized["anonymization_type"] = self.anonymization_type.value
 
-    # Update status field if present
-    if "status" in anonymized:
-        anonymized["status"] = "deleted"
+        # Update status field if present
+        if "status" in anonymized:
+            anonymized["status"] = "deleted"
 
-    return anonymized
+        return anonymized
 
 
 def anonymize_user_reference(user_id: str) -> Dict[str, str]:
@@ -15,11 +15,12 @@ Security Features:
 - File size limits
 - Filename sanitization
 - Content scanning
+- Streaming validation (first chunk + running byte count) for large uploads
 """
 
 import os
 import re
-from typing import Optional, Set, Tuple
+from typing import BinaryIO, Optional, Set, Tuple
 from pathlib import Path
 from fastapi import UploadFile
 
@@ -77,6 +78,10 @@ MAX_VIDEO_SIZE = 500 * 1024 * 1024  # 500 MB (for upload; actual videos stored i
 MAX_DOCUMENT_SIZE = 20 * 1024 * 1024  # 20 MB
 MAX_AVATAR_SIZE = 2 * 1024 * 1024  # 2 MB
 
+# Streaming uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read from an upload at a time
+CONTENT_HEADER_SIZE = 1024  # Leading bytes used for magic bytes / content detection
+
 # Dangerous file patterns
 DANGEROUS_PATTERNS = [
     r'\.\./',  # Parent directory
@@ -490,6 +495,121 @@ def validate_upload(
     return (True, "")
 
 
+# ============================================================================
+# STREAMING VALIDATION
+# ============================================================================
+
+class StreamingUploadValidator:
+    """
+    Validates an upload chunk by chunk while it is being copied
+
+    Only the first CONTENT_HEADER_SIZE bytes are kept (for the magic bytes
+    check) and the size is a running byte count, so an upload of any size is
+    validated in constant memory and rejected as soon as it goes over the
+    limit, without reading the rest of it.
+
+    Usage:
+        validator = StreamingUploadValidator(MAX_VIDEO_SIZE, file.content_type)
+        for chunk in chunks:
+            is_valid, error = validator.feed(chunk)
+            ...
+        is_valid, error = validator.finish()
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        content_type: Optional[str] = None,
+        verify_content: bool = True
+    ):
+        """
+        Args:
+            max_size: Maximum allowed size in bytes
+            content_type: Declared MIME type the content must match
+            verify_content: Whether to verify magic bytes (only for types with
+                known signatures, or any type if python-magic is available)
+        """
+        self.max_size = max_size
+        self.content_type = (content_type or '').split(';')[0].strip().lower()
+        self.verify_content = verify_content and bool(self.content_type) and (
+            self.content_type in IMAGE_MAGIC_BYTES or MAGIC_AVAILABLE
+        )
+        self.bytes_received = 0
+        self._header = b''
+        self._header_checked = not self.verify_content
+
+    def feed(self, chunk: bytes) -> Tuple[bool, str]:
+        """
+        Account for the next chunk of the upload
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        self.bytes_received += len(chunk)
+        if self.bytes_received > self.max_size:
+            max_mb = self.max_size / (1024 * 1024)
+            return (False, f"File too large. Maximum: {max_mb:.1f}MB")
+
+        if not self._header_checked:
+            self._header += chunk[:CONTENT_HEADER_SIZE - len(self._header)]
+            if len(self._header) >= CONTENT_HEADER_SIZE:
+                return self._check_header()
+
+        return (True, "")
+
+    def finish(self) -> Tuple[bool, str]:
+        """
+        Complete validation once the whole upload has been fed
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if self.bytes_received == 0:
+            return (False, "File is empty")
+        if not self._header_checked:
+            return self._check_header()
+        return (True, "")
+
+    def _check_header(self) -> Tuple[bool, str]:
+        self._header_checked = True
+        if not verify_magic_bytes(self._header, self.content_type):
+            return (False, "File content does not match file extension (possible file spoofing)")
+        return (True, "")
+
+
+async def copy_upload_to_file(
+    file: UploadFile,
+    destination: BinaryIO,
+    validator: StreamingUploadValidator,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Tuple[bool, str]:
+    """
+    Copy an upload to a file in chunks, validating it on the way
+
+    Copying stops at the first chunk that fails validation, so an oversized
+    upload is never written (or held in memory) in full.
+
+    Args:
+        file: UploadFile object
+        destination: Writable binary file
+        validator: Validator for the upload
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            return validator.finish()
+
+        is_valid, error_message = validator.feed(chunk)
+        if not is_valid:
+            return (False, error_message)
+
+        destination.write(chunk)
+
+
 # ============================================================================
 # CONTENT SCANNING
 # ============================================================================
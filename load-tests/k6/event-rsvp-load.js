@@ -13,10 +13,24 @@
  * - No failed registrations
  * - No duplicate bookings
  * - Proper capacity enforcement
+ *
+ * Capacity Contention Scenario (capacity_contention):
+ *   Thousands of distinct members RSVP to one free event at the same
+ *   moment (plus immediate double-submits), to verify seats are reserved
+ *   atomically: confirmed RSVPs never exceed EVENT_CAPACITY, no member is
+ *   booked twice, and the event never reports negative available spots.
+ *   Requires CONTENTION_EVENT_ID (a free event with max_attendees set to
+ *   EVENT_CAPACITY and no RSVPs yet) and TOKENS_FILE, a JSON array of
+ *   pre-minted JWTs for distinct members (one iteration per token).
+ *
+ * Run a single scenario with SCENARIO=flash_crowd or
+ * SCENARIO=capacity_contention.
  */
 
 import http from 'k6/http';
+import exec from 'k6/execution';
 import { check, sleep, group } from 'k6';
+import { SharedArray } from 'k6/data';
 import { Counter, Rate, Trend } from 'k6/metrics';
 
 // Custom metrics
@@ -26,27 +40,51 @@ const duplicateBookings = new Counter('duplicate_bookings');
 const capacityEnforced = new Rate('capacity_enforced');
 const paymentProcessingSuccess = new Rate('payment_processing_success');
 const eventViewLatency = new Trend('event_view_latency', true);
+const rsvpConfirmed = new Counter('rsvp_confirmed');
+const rsvpRejectedFull = new Counter('rsvp_rejected_full');
+const contentionErrors = new Rate('contention_errors');
+const overbookedRsvps = new Counter('overbooked_rsvps');
 
 // Configuration
 const BASE_URL = __ENV.API_URL || 'https://staging.wwmaa.com/api';
 const TEST_EVENT_ID = __ENV.TEST_EVENT_ID || 'evt_load_test_001';
+const CONTENTION_EVENT_ID = __ENV.CONTENTION_EVENT_ID || 'evt_load_test_contention';
+const EVENT_CAPACITY = parseInt(__ENV.EVENT_CAPACITY || '100', 10);
+const CONTENTION_VUS = parseInt(__ENV.CONTENTION_VUS || '1000', 10);
+const DOUBLE_SUBMIT_RATIO = parseFloat(__ENV.DOUBLE_SUBMIT_RATIO || '0.1');
+
+const TOKENS = new SharedArray('tokens', function () {
+  return __ENV.TOKENS_FILE ? JSON.parse(open(__ENV.TOKENS_FILE)) : [];
+});
+
+const SCENARIOS = {
+  // Flash crowd: 50% in first 2 minutes
+  flash_crowd: {
+    executor: 'ramping-arrival-rate',
+    startRate: 0,
+    timeUnit: '1m',
+    preAllocatedVUs: 50,
+    maxVUs: 300,
+    stages: [
+      { duration: '2m', target: 125 }, // 250 registrations in 2 minutes (flash)
+      { duration: '8m', target: 31 },  // 250 registrations in 8 minutes (steady)
+    ],
+  },
+  // Capacity contention: every member RSVPs to one event at once
+  capacity_contention: {
+    executor: 'shared-iterations',
+    exec: 'capacityContention',
+    vus: Math.max(1, Math.min(CONTENTION_VUS, TOKENS.length)),
+    iterations: Math.max(1, TOKENS.length),
+    maxDuration: '5m',
+  },
+};
 
 // Test configuration
 export const options = {
-  scenarios: {
-    // Flash crowd: 50% in first 2 minutes
-    flash_crowd: {
-      executor: 'ramping-arrival-rate',
-      startRate: 0,
-      timeUnit: '1m',
-      preAllocatedVUs: 50,
-      maxVUs: 300,
-      stages: [
-        { duration: '2m', target: 125 }, // 250 registrations in 2 minutes (flash)
-        { duration: '8m', target: 31 },  // 250 registrations in 8 minutes (steady)
-      ],
-    },
-  },
+  scenarios: __ENV.SCENARIO
+    ? { [__ENV.SCENARIO]: SCENARIOS[__ENV.SCENARIO] }
+    : SCENARIOS,
   thresholds: {
     // Primary targets
     'rsvp_latency': ['p(95)<800', 'p(99)<1500'],
@@ -64,6 +102,12 @@ export const options = {
     'http_req_duration{endpoint:event_view}': ['p(95)<500'],
     'http_req_duration{endpoint:rsvp}': ['p(95)<800', 'p(99)<1500'],
     'http_req_failed': ['rate<0.05'], // Some failures expected when at capacity
+
+    // Capacity contention: zero overbooking
+    'rsvp_confirmed': [`count<=${EVENT_CAPACITY}`],
+    'overbooked_rsvps': ['count==0'],
+    'contention_errors': ['rate<0.01'],
+    'http_req_duration{endpoint:rsvp_contention}': ['p(95)<800'],
   },
 };
 
@@ -287,6 +331,94 @@ export default function () {
   sleep(1);
 }
 
+function postRsvp(token, index) {
+  return http.post(
+    `${BASE_URL}/events/${CONTENTION_EVENT_ID}/rsvp`,
+    JSON.stringify({
+      user_name: `Load Test ${index}`,
+      user_email: `loadtest+contention${index}@wwmaa.com`,
+    }),
+    {
+      headers: {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Authorization': `Bearer ${token}`,
+      },
+      tags: { endpoint: 'rsvp_contention' },
+      responseCallback: http.expectedStatuses(201, 400),
+    }
+  );
+}
+
+// Capacity contention: one distinct member per iteration
+export function capacityContention() {
+  if (TOKENS.length === 0) {
+    exec.test.abort('capacity_contention requires TOKENS_FILE');
+  }
+
+  const index = exec.scenario.iterationInTest;
+  const token = TOKENS[index % TOKENS.length];
+
+  const response = postRsvp(token, index);
+  const confirmed = response.status === 201;
+  const full = response.status === 400 && /capacity|full/i.test(response.body);
+
+  check(response, {
+    'rsvp confirmed or rejected as full': () => confirmed || full,
+  });
+  contentionErrors.add(!(confirmed || full));
+
+  if (confirmed) {
+    rsvpConfirmed.add(1);
+  } else if (full) {
+    rsvpRejectedFull.add(1);
+  } else {
+    console.error(`Unexpected RSVP response: ${response.status} - ${response.body}`);
+  }
+
+  // Impatient double-submit: must never book the member a second seat
+  if (Math.random() < DOUBLE_SUBMIT_RATIO) {
+    const again = postRsvp(token, index);
+    if (again.status === 201) {
+      if (confirmed) {
+        duplicateBookings.add(1);
+        console.error(`Member ${index} was booked twice`);
+      } else {
+        rsvpConfirmed.add(1); // Seat freed in between; still counts toward capacity
+      }
+    }
+  }
+}
+
+// After the contention scenario, the event must not report more attendees
+// than seats (available_spots comes from the atomic seat counter)
+export function teardown() {
+  if (TOKENS.length === 0) {
+    return;
+  }
+
+  const response = http.get(
+    `${BASE_URL}/events/${CONTENTION_EVENT_ID}/rsvp/status`,
+    {
+      headers: {
+        'Accept': 'application/json',
+        'Authorization': `Bearer ${TOKENS[0]}`,
+      },
+      tags: { endpoint: 'rsvp_status' },
+    }
+  );
+  if (response.status !== 200) {
+    console.error(`Could not read RSVP status after contention: ${response.status}`);
+    return;
+  }
+
+  const status = JSON.parse(response.body);
+  if (status.available_spots !== null && status.available_spots < 0) {
+    overbookedRsvps.add(-status.available_spots);
+    console.error(`Event ${CONTENTION_EVENT_ID} overbooked by ${-status.available_spots}`);
+  }
+}
+
 export function handleSummary(data) {
   return {
     'stdout': textSummary(data, { indent: ' ', enableColors: true }),
@@ -342,6 +474,22 @@ function textSummary(data, options) {
     summary += capacityMetric.values.rate > 0.99 ? '✓\n' : '✗ (target: >99%)\n';
   }
 
+  // Capacity contention
+  const confirmedMetric = data.metrics.rsvp_confirmed;
+  if (confirmedMetric) {
+    summary += `${indent}Confirmed RSVPs............: ${confirmedMetric.values.count} / ${EVENT_CAPACITY} seats `;
+    summary += confirmedMetric.values.count <= EVENT_CAPACITY ? '✓\n' : '✗ (overbooked)\n';
+  }
+  const rejectedMetric = data.metrics.rsvp_rejected_full;
+  if (rejectedMetric) {
+    summary += `${indent}Rejected As Full...........: ${rejectedMetric.values.count}\n`;
+  }
+  const overbookedMetric = data.metrics.overbooked_rsvps;
+  if (overbookedMetric) {
+    summary += `${indent}Overbooked (reported)......: ${overbookedMetric.values.count} `;
+    summary += overbookedMetric.values.count === 0 ? '✓\n' : '✗ (target: 0)\n';
+  }
+
   // Payment processing
   const paymentMetric = data.metrics.payment_processing_success;
   if (paymentMetric && paymentMetric.values.count > 0) {
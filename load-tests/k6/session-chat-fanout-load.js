@@ -0,0 +1,157 @@
+/**
+ * WWMAA Session Chat Fan-out Load Test
+ *
+ * Drives thousands of simulated chat clients across many concurrent
+ * training sessions, spread over several backend nodes, to validate the
+ * Redis pub/sub fan-out layer.
+ *
+ * Load Profile:
+ * - 3,000 concurrent WebSocket clients (configurable via MAX_CLIENTS)
+ * - 30 concurrent sessions (~100 participants each, via SESSIONS)
+ * - Clients of one session are spread over every URL in WS_URLS, so most
+ *   deliveries cross nodes
+ * - 10% of clients chat (1 message every 6s); everyone else only listens
+ *
+ * Performance Targets:
+ * - WebSocket connection success rate > 99%
+ * - Cross-node delivery: every client sees its own messages echoed back
+ * - Chat fan-out latency p95 < 500ms, p99 < 1s
+ * - Slow-consumer evictions (close code 1013) < 1% of connections
+ *
+ * Tokens:
+ *   The chat endpoint authenticates with a JWT for an existing user.
+ *   Provide pre-minted tokens as a JSON array in TOKENS_FILE; clients
+ *   reuse them round-robin.
+ */
+
+import ws from 'k6/ws';
+import { check } from 'k6';
+import { SharedArray } from 'k6/data';
+import { Counter, Rate, Trend } from 'k6/metrics';
+
+// Custom metrics
+const wsConnectionSuccess = new Rate('ws_connection_success');
+const wsEvictions = new Rate('ws_evictions');
+const fanoutLatency = new Trend('chat_fanout_latency', true);
+const ownEchoReceived = new Rate('chat_own_echo_received');
+const framesReceived = new Counter('chat_frames_received');
+
+// Configuration
+const WS_URLS = (__ENV.WS_URLS || 'wss://staging.wwmaa.com').split(',');
+const SESSIONS = parseInt(__ENV.SESSIONS || '30', 10);
+const SESSION_PREFIX = __ENV.SESSION_PREFIX || 'load_session_';
+const MAX_CLIENTS = parseInt(__ENV.MAX_CLIENTS || '3000', 10);
+const CHATTER_RATIO = parseFloat(__ENV.CHATTER_RATIO || '0.1');
+const CONNECTION_SECONDS = parseInt(__ENV.CONNECTION_SECONDS || '300', 10);
+const MESSAGE_INTERVAL_MS = 6000;
+
+const TOKENS = new SharedArray('tokens', function () {
+  return JSON.parse(open(__ENV.TOKENS_FILE || './chat-tokens.json'));
+});
+
+export const options = {
+  scenarios: {
+    chat_fanout: {
+      executor: 'ramping-vus',
+      startVUs: 0,
+      stages: [
+        { duration: '3m', target: MAX_CLIENTS },  // Ramp up: clients join
+        { duration: '5m', target: MAX_CLIENTS },  // Sustain: full sessions
+        { duration: '1m', target: 0 },            // Ramp down: clients leave
+      ],
+      gracefulRampDown: '30s',
+    },
+  },
+  thresholds: {
+    'ws_connection_success': ['rate>0.99'],
+    'ws_evictions': ['rate<0.01'],
+    'chat_own_echo_received': ['rate>0.99'],
+    'chat_fanout_latency': ['p(95)<500', 'p(99)<1000'],
+  },
+};
+
+// Marker embedded in chat text so receivers can measure latency
+const MARKER = 'lt:';
+
+function sessionFor(vu) {
+  return `${SESSION_PREFIX}${vu % SESSIONS}`;
+}
+
+function nodeFor(vu) {
+  // Neighbouring VUs share a session but land on different nodes
+  return WS_URLS[Math.floor(vu / SESSIONS) % WS_URLS.length];
+}
+
+export default function () {
+  const sessionId = sessionFor(__VU);
+  const token = TOKENS[(__VU - 1) % TOKENS.length];
+  const url = `${nodeFor(__VU)}/ws/training/${sessionId}/chat?token=${token}`;
+  const isChatter = Math.random() < CHATTER_RATIO;
+  const pending = {};
+
+  const response = ws.connect(url, {}, function (socket) {
+    wsConnectionSuccess.add(1);
+
+    socket.on('message', function (data) {
+      framesReceived.add(1);
+
+      let message;
+      try {
+        message = JSON.parse(data);
+      } catch (e) {
+        return;
+      }
+      if (message.type !== 'chat_message' || !message.message) {
+        return;
+      }
+
+      const index = message.message.indexOf(MARKER);
+      if (index === -1) {
+        return;
+      }
+      const [sentAt, sender] = message.message.substring(index + MARKER.length).split(':');
+      fanoutLatency.add(Date.now() - parseInt(sentAt, 10));
+
+      // Our own message came back through the fan-out
+      if (sender === String(__VU) && pending[sentAt]) {
+        delete pending[sentAt];
+        ownEchoReceived.add(1);
+      }
+    });
+
+    socket.on('close', function (code) {
+      wsEvictions.add(code === 1013 ? 1 : 0);
+    });
+
+    socket.on('error', function (e) {
+      console.error(`WebSocket error for VU ${__VU}: ${e.error()}`);
+    });
+
+    if (isChatter) {
+      socket.setInterval(function () {
+        const sentAt = String(Date.now());
+        pending[sentAt] = true;
+        socket.send(JSON.stringify({
+          type: 'chat_message',
+          message: `Load test ${MARKER}${sentAt}:${__VU}`,
+        }));
+      }, MESSAGE_INTERVAL_MS);
+    }
+
+    socket.setTimeout(function () {
+      // Anything still pending after the run was never delivered
+      Object.keys(pending).forEach(function () {
+        ownEchoReceived.add(0);
+      });
+      socket.close();
+    }, CONNECTION_SECONDS * 1000);
+  });
+
+  if (!response || response.status !== 101) {
+    wsConnectionSuccess.add(0);
+  }
+
+  check(response, {
+    'websocket upgraded': (r) => r && r.status === 101,
+  });
+}